@@ -0,0 +1,348 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Compare the throughput, memory and threads of one timeline sync round
+with the thread pool network controller and with the asyncio network
+controller, against local stub peers that add a fixed latency to each
+request.
+
+Each stub peer listens on its own port of a stub server that runs in a
+separate process. Each sync runs in a fresh process, so that the peak
+memory of one run does not hide the peak memory of the next.
+
+Usage:
+    python -m benchmarks.peer_networking_benchmark --peers 10 100 500
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+
+from aiohttp import web
+from squeak.core import CSqueak
+from squeak.core.keys import SqueakPrivateKey
+
+from squeaknode.bitcoin.block_info import BlockInfo
+from squeaknode.client.async_network_controller import AsyncNetworkControllerFacade
+from squeaknode.client.network_controller import NetworkController
+from squeaknode.core.length_prefixed import encode_record
+from squeaknode.core.peer_address import Network
+from squeaknode.core.peer_address import PeerAddress
+from squeaknode.core.squeak_peer import SqueakPeer
+from squeaknode.core.squeaks import get_hash
+from squeaknode.core.squeaks import make_squeak_with_block
+
+
+BLOCK_HEIGHT = 1000
+BLOCK_HASH = b'\x11' * 32
+INTEREST_BLOCK_INTERVAL = 100
+DOWNLOAD_TIMEOUT_S = 600
+SAMPLE_INTERVAL_S = 0.01
+MODES = ['threads', 'asyncio']
+
+
+def make_stub_app(squeaks, secret_keys, latency_s):
+    """Serve the lookup and the batch endpoints for one stub peer."""
+    squeaks_by_hash = {get_hash(squeak).hex(): squeak for squeak in squeaks}
+
+    async def lookup(request):
+        await asyncio.sleep(latency_s)
+        return web.json_response(list(squeaks_by_hash))
+
+    async def lookup_missing(request):
+        # Filtered lookups are not supported by the stub.
+        return web.Response(status=404)
+
+    async def get_squeaks(request):
+        await asyncio.sleep(latency_s)
+        squeak_hash_strs = await request.json()
+        return web.Response(body=b''.join(
+            encode_record(squeaks_by_hash[h].serialize())
+            for h in squeak_hash_strs
+            if h in squeaks_by_hash
+        ))
+
+    async def get_secret_keys(request):
+        await asyncio.sleep(latency_s)
+        squeak_hash_strs = await request.json()
+        return web.Response(body=b''.join(
+            encode_record(bytes.fromhex(h) + secret_keys[h])
+            for h in squeak_hash_strs
+            if h in secret_keys
+        ))
+
+    app = web.Application()
+    app.router.add_get('/lookup', lookup)
+    app.router.add_post('/lookup', lookup_missing)
+    app.router.add_post('/squeaks', get_squeaks)
+    app.router.add_post('/secretkeys', get_secret_keys)
+    return app
+
+
+def run_stub_server(peer_squeaks, latency_s, ports_queue):
+    """Start one stub peer on its own port for each list of squeaks, and
+    put the list of ports in the queue.
+    """
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    async def start():
+        ports = []
+        for squeaks_and_keys in peer_squeaks:
+            squeaks = [CSqueak.deserialize(s) for s, _ in squeaks_and_keys]
+            secret_keys = {
+                get_hash(squeak).hex(): secret_key
+                for squeak, (_, secret_key) in zip(squeaks, squeaks_and_keys)
+            }
+            runner = web.AppRunner(
+                make_stub_app(squeaks, secret_keys, latency_s),
+                access_log=None,
+            )
+            await runner.setup()
+            site = web.TCPSite(runner, 'localhost', 0, backlog=1024)
+            await site.start()
+            ports.append(site._server.sockets[0].getsockname()[1])
+        ports_queue.put(ports)
+
+    loop.run_until_complete(start())
+    loop.run_forever()
+
+
+class BenchmarkSqueakStore:
+    """Keeps the downloaded squeaks in memory, so that only the network
+    controller is measured.
+    """
+
+    def __init__(self, peers, public_key):
+        self.peers = peers
+        self.public_key = public_key
+        self.squeaks = {}
+        self.secret_keys = {}
+        self.lock = threading.Lock()
+
+    def get_autoconnect_peers(self):
+        return self.peers
+
+    def get_latest_block_info(self):
+        return BlockInfo(
+            block_height=BLOCK_HEIGHT,
+            block_hash=BLOCK_HASH,
+            block_header=None,
+        )
+
+    def get_block_hash(self, block_height):
+        return BLOCK_HASH
+
+    def get_followed_public_keys(self):
+        return [self.public_key]
+
+    def get_sync_watermark(self, peer_address):
+        return None
+
+    def set_sync_watermark(self, sync_watermark):
+        pass
+
+    def lookup_secret_keys(self, public_keys, min_block, max_block, reply_to_hash):
+        return []
+
+    def get_existing_squeak_hashes(self, squeak_hashes):
+        with self.lock:
+            return [h for h in squeak_hashes if h in self.squeaks]
+
+    def save_squeaks(self, squeaks):
+        with self.lock:
+            for squeak in squeaks:
+                self.squeaks[get_hash(squeak)] = squeak
+        return [get_hash(squeak) for squeak in squeaks]
+
+    def get_squeaks(self, squeak_hashes):
+        with self.lock:
+            return {h: self.squeaks[h] for h in squeak_hashes if h in self.squeaks}
+
+    def get_squeak_secret_keys(self, squeak_hashes):
+        with self.lock:
+            return {h: self.secret_keys[h] for h in squeak_hashes if h in self.secret_keys}
+
+    def save_secret_key(self, squeak_hash, secret_key):
+        with self.lock:
+            self.secret_keys[squeak_hash] = secret_key
+
+
+def get_rss_kb():
+    """Get the current resident memory of the process (Linux only)."""
+    with open('/proc/self/statm') as f:
+        resident_pages = int(f.read().split()[1])
+    return resident_pages * os.sysconf('SC_PAGE_SIZE') // 1024
+
+
+def make_network_controller(mode, squeak_store):
+    if mode == 'threads':
+        return NetworkController(
+            squeak_store,
+            None,
+            None,
+            download_timeout_s=DOWNLOAD_TIMEOUT_S,
+        )
+    return AsyncNetworkControllerFacade(
+        squeak_store,
+        None,
+        None,
+        download_timeout_s=DOWNLOAD_TIMEOUT_S,
+    )
+
+
+def run_sync(mode, ports, public_key_bytes, results_queue):
+    """Run one timeline sync round and put the measurements in the queue."""
+    peers = [
+        SqueakPeer(
+            peer_id=i,
+            peer_name="peer_{}".format(i),
+            address=PeerAddress(
+                network=Network.IPV4,
+                host='localhost',
+                port=port,
+            ),
+            autoconnect=True,
+            share_for_free=True,
+        )
+        for i, port in enumerate(ports)
+    ]
+    squeak_store = BenchmarkSqueakStore(
+        peers,
+        SqueakPrivateKey.from_bytes(public_key_bytes).get_public_key(),
+    )
+    network_controller = make_network_controller(mode, squeak_store)
+    base_rss_kb = get_rss_kb()
+    base_threads = threading.active_count()
+    max_rss_kb = base_rss_kb
+    max_threads = base_threads
+    stopped = threading.Event()
+
+    def sample():
+        nonlocal max_rss_kb, max_threads
+        while not stopped.wait(SAMPLE_INTERVAL_S):
+            max_rss_kb = max(max_rss_kb, get_rss_kb())
+            max_threads = max(max_threads, threading.active_count())
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    start_time = time.perf_counter()
+    download_result = network_controller.download_timeline(
+        INTEREST_BLOCK_INTERVAL,
+    )
+    elapsed_s = time.perf_counter() - start_time
+    stopped.set()
+    sampler.join()
+    network_controller.close()
+    results_queue.put(dict(
+        elapsed_s=elapsed_s,
+        num_downloaded=download_result.number_downloaded,
+        # The sampler thread is not counted.
+        extra_threads=max_threads - base_threads - 1,
+        rss_growth_kb=max_rss_kb - base_rss_kb,
+    ))
+
+
+def make_peer_squeaks(private_key, num_peers, squeaks_per_peer):
+    peer_squeaks = []
+    for i in range(num_peers):
+        squeaks_and_keys = []
+        for j in range(squeaks_per_peer):
+            squeak, secret_key = make_squeak_with_block(
+                private_key,
+                "squeak {} from peer {}".format(j, i),
+                BLOCK_HEIGHT,
+                BLOCK_HASH,
+            )
+            squeaks_and_keys.append((squeak.serialize(), secret_key))
+        peer_squeaks.append(squeaks_and_keys)
+    return peer_squeaks
+
+
+def run(ctx, private_key, num_peers, squeaks_per_peer, latency_s):
+    peer_squeaks = make_peer_squeaks(private_key, num_peers, squeaks_per_peer)
+    ports_queue = ctx.Queue()
+    server = ctx.Process(
+        target=run_stub_server,
+        args=(peer_squeaks, latency_s, ports_queue),
+        daemon=True,
+    )
+    server.start()
+    ports = ports_queue.get()
+    try:
+        for mode in MODES:
+            results_queue = ctx.Queue()
+            client = ctx.Process(
+                target=run_sync,
+                args=(mode, ports, private_key.to_bytes(), results_queue),
+            )
+            client.start()
+            results = results_queue.get()
+            client.join()
+            print("{:>4} peers  {:>8}: {:8.2f} s  {:8.1f} items/s  downloaded: {:>5}  threads: {:>4}  rss growth: {:>8} KB".format(
+                num_peers,
+                mode,
+                results['elapsed_s'],
+                results['num_downloaded'] / results['elapsed_s'],
+                results['num_downloaded'],
+                results['extra_threads'],
+                results['rss_growth_kb'],
+            ))
+    finally:
+        server.terminate()
+        server.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--peers',
+        type=int,
+        nargs='+',
+        default=[10, 100, 500],
+    )
+    parser.add_argument(
+        '--squeaks-per-peer',
+        type=int,
+        default=1,
+    )
+    parser.add_argument(
+        '--latency-ms',
+        type=int,
+        default=50,
+    )
+    args = parser.parse_args()
+    ctx = multiprocessing.get_context('spawn')
+    private_key = SqueakPrivateKey.generate()
+    for num_peers in args.peers:
+        run(
+            ctx,
+            private_key,
+            num_peers,
+            args.squeaks_per_peer,
+            args.latency_ms / 1000,
+        )
+
+
+if __name__ == '__main__':
+    main()
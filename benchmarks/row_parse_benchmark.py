@@ -0,0 +1,135 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Compare the latency of the row parsing hot paths with and without the
+parsed public key and squeak caches, and of serving squeaks to peers
+from the stored bytes instead of parsing and serializing them again.
+
+Usage:
+    python -m benchmarks.row_parse_benchmark --num-squeaks 2000
+"""
+import argparse
+import os
+import random
+import time
+
+from bitcoin.core import CBlockHeader
+from sqlalchemy import create_engine
+from squeak.core import CSqueak
+from squeak.core.keys import SqueakPrivateKey
+from squeak.core.keys import SqueakPublicKey
+
+from squeaknode.core.profiles import create_contact_profile
+from squeaknode.core.squeaks import make_squeak_with_block
+from squeaknode.db.parse_cache import ParseCache
+from squeaknode.db.squeak_db import SqueakDb
+
+
+NUM_AUTHORS = 20
+PAGE_LIMIT = 50
+BATCH_SIZE = 100
+NUM_RUNS = 20
+
+
+def populate(squeak_db, num_squeaks):
+    private_keys = [SqueakPrivateKey.generate() for _ in range(NUM_AUTHORS)]
+    for i, private_key in enumerate(private_keys):
+        squeak_db.insert_profile(
+            create_contact_profile(
+                "author{}".format(i),
+                private_key.get_public_key(),
+            )._replace(following=True),
+        )
+    squeaks_with_headers = []
+    for i in range(num_squeaks):
+        squeak, _ = make_squeak_with_block(
+            random.choice(private_keys),
+            "hello world {}".format(i),
+            i // 100,
+            os.urandom(32),
+        )
+        squeaks_with_headers.append((squeak, CBlockHeader(nTime=i)))
+    return squeak_db.insert_squeaks(squeaks_with_headers)
+
+
+def disable_caches(squeak_db):
+    squeak_db.public_key_cache = ParseCache(SqueakPublicKey.from_bytes, 0)
+    squeak_db.squeak_cache = ParseCache(CSqueak.deserialize, 0)
+
+
+def timeline_page(squeak_db, squeak_hashes):
+    squeak_db.get_timeline_squeak_entries(PAGE_LIMIT, None)
+
+
+def squeak_batch(squeak_db, squeak_hashes):
+    squeak_db.get_squeaks(squeak_hashes[:BATCH_SIZE])
+
+
+def serve_batch_parsed(squeak_db, squeak_hashes):
+    squeaks = squeak_db.get_squeaks(squeak_hashes[:BATCH_SIZE])
+    [squeak.serialize() for squeak in squeaks.values()]
+
+
+def serve_batch_bytes(squeak_db, squeak_hashes):
+    squeak_db.get_squeaks_bytes(squeak_hashes[:BATCH_SIZE])
+
+
+def time_fn(fn, squeak_db, squeak_hashes):
+    best_s = None
+    for _ in range(NUM_RUNS):
+        start = time.perf_counter()
+        fn(squeak_db, squeak_hashes)
+        elapsed_s = time.perf_counter() - start
+        best_s = elapsed_s if best_s is None else min(best_s, elapsed_s)
+    return best_s
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--num-squeaks', type=int, default=2000)
+    args = parser.parse_args()
+    random.seed(0)
+
+    cached_db = SqueakDb(create_engine('sqlite://'))
+    cached_db.init()
+    squeak_hashes = populate(cached_db, args.num_squeaks)
+    uncached_db = SqueakDb(cached_db.engine)
+    uncached_db.init()
+    disable_caches(uncached_db)
+
+    for name, fn in [
+            ("timeline page", timeline_page),
+            ("squeak batch", squeak_batch),
+            ("serve batch", serve_batch_parsed),
+    ]:
+        uncached_s = time_fn(fn, uncached_db, squeak_hashes)
+        cached_s = time_fn(fn, cached_db, squeak_hashes)
+        print("{:<14} uncached: {:8.2f} ms  cached: {:8.2f} ms".format(
+            name,
+            uncached_s * 1000,
+            cached_s * 1000,
+        ))
+    bytes_s = time_fn(serve_batch_bytes, cached_db, squeak_hashes)
+    print("{:<14} raw bytes: {:7.2f} ms".format("serve batch", bytes_s * 1000))
+
+
+if __name__ == '__main__':
+    main()
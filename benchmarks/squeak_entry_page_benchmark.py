@@ -0,0 +1,216 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Compare the bytes read from the database and the latency of one
+timeline page, between selecting the whole squeak and profile rows with
+the profile images and selecting only the squeak entry columns.
+
+Usage:
+    python -m benchmarks.squeak_entry_page_benchmark --image-sizes 20000 200000
+"""
+import argparse
+import os
+import random
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.sql import select
+from squeak.core.keys import SqueakPrivateKey
+
+from squeaknode.core.profiles import create_contact_profile
+from squeaknode.db.squeak_db import SqueakDb
+
+
+NUM_SQUEAKS = 10000
+NUM_AUTHORS = 20
+SQUEAK_SIZE = 1200
+PAGE_LIMIT = 50
+NUM_QUERY_RUNS = 20
+
+
+def populate(squeak_db, image_size):
+    authors = []
+    for i in range(NUM_AUTHORS):
+        public_key = SqueakPrivateKey.generate().get_public_key()
+        profile_id = squeak_db.insert_profile(
+            create_contact_profile("author{}".format(i), public_key),
+        )
+        squeak_db.set_profile_image(profile_id, os.urandom(image_size))
+        authors.append(public_key.to_bytes())
+    squeak_rows = [
+        dict(
+            hash=os.urandom(32),
+            created_time_ms=0,
+            squeak=os.urandom(SQUEAK_SIZE),
+            reply_hash=None,
+            block_hash=os.urandom(32),
+            block_height=i // 100,
+            time_s=i,
+            author_public_key=random.choice(authors),
+            recipient_public_key=None,
+            secret_key=os.urandom(32),
+            block_time_s=i,
+            liked_time_ms=None,
+            content="hello world {}".format(i),
+        )
+        for i in range(NUM_SQUEAKS)
+    ]
+    with squeak_db.get_transaction() as connection:
+        connection.execute(squeak_db.squeaks.insert(), squeak_rows)
+
+
+def full_row_page(squeak_db):
+    """The timeline query with whole rows, and the profile images stored
+    with the profiles.
+    """
+    author_images = squeak_db.profile_images.alias()
+    recipient_images = squeak_db.profile_images.alias()
+    s = (
+        select([
+            squeak_db.squeaks,
+            squeak_db.author_profiles,
+            squeak_db.recipient_profiles,
+            author_images.c.image,
+            recipient_images.c.image,
+        ])
+        .select_from(
+            squeak_db.squeaks
+            .outerjoin(
+                squeak_db.author_profiles,
+                squeak_db.author_profiles.c.public_key == squeak_db.squeaks.c.author_public_key,
+            )
+            .outerjoin(
+                squeak_db.recipient_profiles,
+                squeak_db.recipient_profiles.c.public_key == squeak_db.squeaks.c.recipient_public_key,
+            )
+            .outerjoin(
+                author_images,
+                author_images.c.image_hash == squeak_db.author_profiles.c.profile_image_hash,
+            )
+            .outerjoin(
+                recipient_images,
+                recipient_images.c.image_hash == squeak_db.recipient_profiles.c.profile_image_hash,
+            )
+        )
+        .where(squeak_db.profile_is_following(squeak_db.author_profiles))
+        .order_by(
+            squeak_db.squeaks.c.block_height.desc(),
+            squeak_db.squeaks.c.time_s.desc(),
+            squeak_db.squeaks.c.hash.desc(),
+        )
+        .limit(PAGE_LIMIT)
+    )
+    with squeak_db.get_connection() as connection:
+        rows = connection.execute(s).fetchall()
+        [squeak_db._parse_squeak_entry(row) for row in rows]
+        return rows
+
+
+def slim_page(squeak_db):
+    s = (
+        squeak_db._squeak_entry_select()
+        .where(squeak_db.profile_is_following(squeak_db.author_profiles))
+        .order_by(
+            squeak_db.squeaks.c.block_height.desc(),
+            squeak_db.squeaks.c.time_s.desc(),
+            squeak_db.squeaks.c.hash.desc(),
+        )
+        .limit(PAGE_LIMIT)
+    )
+    with squeak_db.get_connection() as connection:
+        rows = connection.execute(s).fetchall()
+        [squeak_db._parse_squeak_entry(row) for row in rows]
+        return rows
+
+
+def slim_page_with_images(squeak_db):
+    """The slim page, and each distinct profile image of the page loaded
+    once, as when the image cache is cold.
+    """
+    rows = slim_page(squeak_db)
+    image_hashes = {
+        row[squeak_db.author_profiles.c.profile_image_hash]
+        for row in rows
+    }
+    images = [
+        squeak_db.get_profile_image(image_hash)
+        for image_hash in image_hashes
+        if image_hash is not None
+    ]
+    return list(rows) + [(image,) for image in images]
+
+
+def get_num_bytes(rows):
+    num_bytes = 0
+    for row in rows:
+        for value in row:
+            if isinstance(value, (bytes, str)):
+                num_bytes += len(value)
+            elif value is not None:
+                num_bytes += 8
+    return num_bytes
+
+
+def time_page(fn, squeak_db):
+    best_s = None
+    for _ in range(NUM_QUERY_RUNS):
+        start = time.perf_counter()
+        fn(squeak_db)
+        elapsed_s = time.perf_counter() - start
+        best_s = elapsed_s if best_s is None else min(best_s, elapsed_s)
+    return best_s
+
+
+def run(image_size):
+    squeak_db = SqueakDb(create_engine('sqlite://'))
+    squeak_db.init()
+    populate(squeak_db, image_size)
+    for name, fn in [
+            ("full rows", full_row_page),
+            ("slim", slim_page),
+            ("slim + images", slim_page_with_images),
+    ]:
+        num_bytes = get_num_bytes(fn(squeak_db))
+        elapsed_s = time_page(fn, squeak_db)
+        print("image size: {:>7}  {:<14} bytes per page: {:>10}  latency: {:8.2f} ms".format(
+            image_size,
+            name,
+            num_bytes,
+            elapsed_s * 1000,
+        ))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--image-sizes',
+        type=int,
+        nargs='+',
+        default=[20000, 200000],
+    )
+    args = parser.parse_args()
+    random.seed(0)
+    for image_size in args.image_sizes:
+        run(image_size)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,273 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Compare the bytes transferred in one timeline sync round by the paged
+lookup and by the filtered lookup, as the overlap between the squeaks
+owned by the client and the squeaks on the peer grows.
+
+Then compare the bytes transferred over many rounds of a client that
+is already synced, while new squeaks are made on each block, by:
+- a paged lookup of the whole range in each round
+- a paged lookup starting from the sync watermark
+- a filtered lookup starting from the sync watermark, with a periodic
+  full lookup that verifies the blocks synced by the filtered lookups
+
+Usage:
+    python -m benchmarks.sync_bytes_benchmark --sizes 10000 100000
+"""
+import argparse
+import json
+import os
+import random
+
+from sqlalchemy import create_engine
+from squeak.core.keys import SqueakPrivateKey
+
+from squeaknode.client.peer_client import LOOKUP_PAGE_SIZE
+from squeaknode.client.peer_filter_tracker import PeerFilterTracker
+from squeaknode.core.bloom_filter import BloomFilter
+from squeaknode.db.squeak_db import SqueakDb
+from squeaknode.server.app import create_app
+from squeaknode.server.squeak_peer_server_handler import SqueakPeerServerHandler
+
+
+INSERT_BATCH_SIZE = 10000
+SQUEAKS_PER_BLOCK = 100
+OVERLAPS = [0.0, 0.5, 0.9, 0.99]
+NUM_ROUNDS = 50
+SQUEAKS_PER_ROUND = 10
+PEER_ADDRESS = 'peer'
+
+
+class DbLookupController:
+    """Serves the peer server lookups directly from the database."""
+
+    def __init__(self, squeak_db):
+        self.squeak_db = squeak_db
+
+    def lookup_squeak_cursors(self, public_keys, min_block, max_block, reply_to_hash, limit, last_cursor):
+        return self.squeak_db.lookup_squeak_cursors(
+            public_keys,
+            min_block,
+            max_block,
+            reply_to_hash,
+            include_locked=True,
+            limit=limit,
+            last_cursor=last_cursor,
+        )
+
+
+def populate(squeak_db, author, num_rows, first_block=0, squeaks_per_block=SQUEAKS_PER_BLOCK):
+    squeak_hashes = []
+    squeak_rows = []
+    with squeak_db.get_transaction() as connection:
+        for i in range(num_rows):
+            squeak_hash = os.urandom(32)
+            squeak_hashes.append(squeak_hash)
+            squeak_rows.append(dict(
+                hash=squeak_hash,
+                created_time_ms=0,
+                squeak=b'',
+                reply_hash=None,
+                block_hash=os.urandom(32),
+                block_height=first_block + i // squeaks_per_block,
+                time_s=i,
+                author_public_key=author,
+                recipient_public_key=None,
+                secret_key=os.urandom(32),
+                block_time_s=i,
+                liked_time_ms=None,
+                content=None,
+            ))
+            if len(squeak_rows) >= INSERT_BATCH_SIZE:
+                connection.execute(squeak_db.squeaks.insert(), squeak_rows)
+                squeak_rows = []
+        if squeak_rows:
+            connection.execute(squeak_db.squeaks.insert(), squeak_rows)
+    return squeak_hashes
+
+
+def paged_lookup(client, params):
+    """Return the bytes sent and received, and the returned hashes."""
+    num_bytes = 0
+    squeak_hashes = []
+    cursor = None
+    while True:
+        page_params = dict(params, limit=LOOKUP_PAGE_SIZE)
+        if cursor:
+            page_params['cursor'] = cursor
+        r = client.get('/lookup', query_string=page_params)
+        num_bytes += len(r.request.query_string) + len(r.data)
+        page = json.loads(r.data)
+        squeak_hashes.extend(page['hashes'])
+        cursor = page['next']
+        if not cursor:
+            return num_bytes, squeak_hashes
+
+
+def filtered_lookup(client, params, known_hashes):
+    """Return the bytes sent and received, and the returned hashes."""
+    if not known_hashes:
+        return paged_lookup(client, params)
+    data = BloomFilter.for_items(known_hashes).serialize()
+    r = client.post('/lookup', query_string=params, data=data)
+    num_bytes = len(r.request.query_string) + len(data) + len(r.data)
+    return num_bytes, json.loads(r.data)
+
+
+def run(num_rows):
+    author = SqueakPrivateKey.generate().get_public_key().to_bytes()
+    squeak_db = SqueakDb(create_engine('sqlite://'))
+    squeak_db.init()
+    squeak_hashes = populate(squeak_db, author, num_rows)
+    handler = SqueakPeerServerHandler(
+        DbLookupController(squeak_db), None, None)
+    client = create_app(handler).test_client()
+    params = {
+        'minblock': 0,
+        'maxblock': num_rows // SQUEAKS_PER_BLOCK,
+        'pubkeys': author.hex(),
+    }
+    for overlap in OVERLAPS:
+        known_hashes = random.sample(squeak_hashes, int(num_rows * overlap))
+        paged_bytes, _ = paged_lookup(client, params)
+        filtered_bytes, returned_hashes = filtered_lookup(
+            client, params, known_hashes)
+        num_missing = num_rows - len(known_hashes)
+        num_missed = num_missing - len(
+            set(returned_hashes) - set(h.hex() for h in known_hashes)
+        )
+        print("{:>8} rows  overlap: {:5.1f}%  paged: {:>10} bytes  filtered: {:>10} bytes  reduction: {:6.1f}x  missed: {}".format(
+            num_rows,
+            overlap * 100,
+            paged_bytes,
+            filtered_bytes,
+            paged_bytes / filtered_bytes,
+            num_missed,
+        ))
+
+
+def sync_rounds(client, author, tip_block, squeak_blocks, known_hashes, use_watermark, filter_tracker):
+    """Sync the timeline from the peer once for each new block.
+
+    Returns the bytes sent and received, and the hashes owned after the
+    last round.
+    """
+    known_hashes = set(known_hashes)
+    watermark = tip_block
+    num_bytes = 0
+    for block_height in range(tip_block + 1, tip_block + NUM_ROUNDS + 1):
+        min_block = watermark if use_watermark else 0
+        allow_filter = False
+        if filter_tracker:
+            timeline_lookup = filter_tracker.start_timeline_lookup(
+                PEER_ADDRESS, min_block, 0)
+            min_block, allow_filter = timeline_lookup
+        params = {
+            'minblock': min_block,
+            'maxblock': block_height,
+            'pubkeys': author.hex(),
+        }
+        if allow_filter:
+            lookup_bytes, returned_hashes = filtered_lookup(
+                client, params, [
+                    squeak_hash for squeak_hash in known_hashes
+                    if squeak_blocks[squeak_hash] >= min_block
+                ])
+        else:
+            lookup_bytes, returned_hashes = paged_lookup(client, params)
+        num_bytes += lookup_bytes
+        known_hashes.update(
+            bytes.fromhex(squeak_hash) for squeak_hash in returned_hashes
+        )
+        if filter_tracker:
+            filter_tracker.record_timeline_synced(
+                PEER_ADDRESS, timeline_lookup, allow_filter)
+        watermark = block_height
+    return num_bytes, known_hashes
+
+
+def run_steady_state(num_rows):
+    author = SqueakPrivateKey.generate().get_public_key().to_bytes()
+    squeak_db = SqueakDb(create_engine('sqlite://'))
+    squeak_db.init()
+    tip_block = num_rows // SQUEAKS_PER_BLOCK
+    squeak_hashes = populate(squeak_db, author, num_rows)
+    new_hashes = populate(
+        squeak_db,
+        author,
+        NUM_ROUNDS * SQUEAKS_PER_ROUND,
+        first_block=tip_block + 1,
+        squeaks_per_block=SQUEAKS_PER_ROUND,
+    )
+    squeak_blocks = {
+        squeak_hash: i // SQUEAKS_PER_BLOCK
+        for i, squeak_hash in enumerate(squeak_hashes)
+    }
+    squeak_blocks.update({
+        squeak_hash: tip_block + 1 + i // SQUEAKS_PER_ROUND
+        for i, squeak_hash in enumerate(new_hashes)
+    })
+    handler = SqueakPeerServerHandler(
+        DbLookupController(squeak_db), None, None)
+    client = create_app(handler).test_client()
+    for name, use_watermark, filter_tracker in [
+            ('full', False, None),
+            ('watermark', True, None),
+            ('watermark+filter', True, PeerFilterTracker()),
+    ]:
+        num_bytes, synced_hashes = sync_rounds(
+            client,
+            author,
+            tip_block,
+            squeak_blocks,
+            squeak_hashes,
+            use_watermark,
+            filter_tracker,
+        )
+        print("{:>8} rows  {} rounds  {:>16}: {:>12} bytes  {:>10.0f} bytes/round  missed: {}".format(
+            num_rows,
+            NUM_ROUNDS,
+            name,
+            num_bytes,
+            num_bytes / NUM_ROUNDS,
+            len(set(new_hashes) - synced_hashes),
+        ))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--sizes',
+        type=int,
+        nargs='+',
+        default=[10000, 100000],
+    )
+    args = parser.parse_args()
+    random.seed(0)
+    for num_rows in args.sizes:
+        run(num_rows)
+    for num_rows in args.sizes:
+        run_steady_state(num_rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,195 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Compare full text search with the ILIKE scan at different table sizes.
+
+Usage:
+    python -m benchmarks.text_search_benchmark --sizes 10000 100000 1000000
+"""
+import argparse
+import os
+import random
+import time
+from typing import List
+
+from sqlalchemy import create_engine
+from sqlalchemy.sql import select
+from sqlalchemy.sql import tuple_
+from squeak.core.keys import SqueakPrivateKey
+
+from squeaknode.db.squeak_db import MAX_HASH
+from squeaknode.db.squeak_db import MAX_INT
+from squeaknode.db.squeak_db import SqueakDb
+from squeaknode.db.text_search import get_search_rowid
+
+
+VOCABULARY_SIZE = 20000
+WORDS_PER_SQUEAK = 12
+NUM_AUTHORS = 20
+INSERT_BATCH_SIZE = 10000
+PAGE_LIMIT = 50
+NUM_QUERY_RUNS = 5
+
+
+def gen_word(i):
+    return "word{}".format(i)
+
+
+# Word frequencies follow Zipf's law, like natural language text.
+WORDS = [gen_word(i) for i in range(VOCABULARY_SIZE)]
+WORD_CUM_WEIGHTS: List[float] = []
+for i in range(VOCABULARY_SIZE):
+    WORD_CUM_WEIGHTS.append(
+        (WORD_CUM_WEIGHTS[-1] if WORD_CUM_WEIGHTS else 0) + 1 / (i + 1)
+    )
+
+
+def populate(squeak_db, num_rows):
+    authors = [
+        SqueakPrivateKey.generate().get_public_key().to_bytes()
+        for _ in range(NUM_AUTHORS)
+    ]
+    squeak_rows = []
+    search_rows = []
+    with squeak_db.get_transaction() as connection:
+        for i in range(num_rows):
+            squeak_hash = os.urandom(32)
+            content = " ".join(random.choices(
+                WORDS,
+                cum_weights=WORD_CUM_WEIGHTS,
+                k=WORDS_PER_SQUEAK,
+            ))
+            squeak_rows.append(dict(
+                hash=squeak_hash,
+                created_time_ms=0,
+                squeak=b'',
+                reply_hash=None,
+                block_hash=os.urandom(32),
+                block_height=i // 100,
+                time_s=i,
+                author_public_key=random.choice(authors),
+                recipient_public_key=None,
+                secret_key=os.urandom(32),
+                block_time_s=i,
+                liked_time_ms=None,
+                content=content,
+            ))
+            search_rows.append(dict(
+                rowid=get_search_rowid(squeak_hash),
+                content=content,
+                hash=squeak_hash,
+            ))
+            if len(squeak_rows) >= INSERT_BATCH_SIZE:
+                connection.execute(squeak_db.squeaks.insert(), squeak_rows)
+                connection.execute(squeak_db.squeak_fts.insert(), search_rows)
+                squeak_rows = []
+                search_rows = []
+        if squeak_rows:
+            connection.execute(squeak_db.squeaks.insert(), squeak_rows)
+            connection.execute(squeak_db.squeak_fts.insert(), search_rows)
+
+
+def ilike_search(squeak_db, search_text):
+    """The text search query that was used before full text search."""
+    s = (
+        select([squeak_db.squeaks, squeak_db.author_profiles, squeak_db.recipient_profiles])
+        .select_from(
+            squeak_db.squeaks
+            .outerjoin(
+                squeak_db.author_profiles,
+                squeak_db.author_profiles.c.public_key == squeak_db.squeaks.c.author_public_key,
+            )
+            .outerjoin(
+                squeak_db.recipient_profiles,
+                squeak_db.recipient_profiles.c.public_key == squeak_db.squeaks.c.recipient_public_key,
+            )
+        )
+        .where(squeak_db.squeaks.c.content.ilike(f'%{search_text}%'))
+        .where(
+            tuple_(
+                squeak_db.squeaks.c.block_height,
+                squeak_db.squeaks.c.time_s,
+                squeak_db.squeaks.c.hash,
+            ) < tuple_(MAX_INT, MAX_INT, MAX_HASH)
+        )
+        .order_by(
+            squeak_db.squeaks.c.block_height.desc(),
+            squeak_db.squeaks.c.time_s.desc(),
+            squeak_db.squeaks.c.hash.desc(),
+        )
+        .limit(PAGE_LIMIT)
+    )
+    with squeak_db.get_connection() as connection:
+        rows = connection.execute(s).fetchall()
+        return [squeak_db._parse_squeak_entry(row) for row in rows]
+
+
+def fts_search(squeak_db, search_text):
+    return squeak_db.get_squeak_entries_for_text_search(
+        search_text,
+        PAGE_LIMIT,
+        None,
+    )
+
+
+def time_query(fn, squeak_db, search_text):
+    best_s = None
+    for _ in range(NUM_QUERY_RUNS):
+        start = time.perf_counter()
+        fn(squeak_db, search_text)
+        elapsed_s = time.perf_counter() - start
+        best_s = elapsed_s if best_s is None else min(best_s, elapsed_s)
+    return best_s
+
+
+def run(num_rows):
+    squeak_db = SqueakDb(create_engine('sqlite://'))
+    squeak_db.init()
+    populate(squeak_db, num_rows)
+    # A rare word, a moderately common word, and a word prefix.
+    for search_text in [gen_word(VOCABULARY_SIZE // 2), gen_word(100), "word123"]:
+        ilike_s = time_query(ilike_search, squeak_db, search_text)
+        fts_s = time_query(fts_search, squeak_db, search_text)
+        print("{:>9} rows  {:<10} ilike: {:8.2f} ms  fts: {:8.2f} ms  speedup: {:6.1f}x".format(
+            num_rows,
+            repr(search_text),
+            ilike_s * 1000,
+            fts_s * 1000,
+            ilike_s / fts_s,
+        ))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--sizes',
+        type=int,
+        nargs='+',
+        default=[10000, 100000, 1000000],
+    )
+    args = parser.parse_args()
+    random.seed(0)
+    for num_rows in args.sizes:
+        run(num_rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,14 @@
+import { web_host_port } from '../squeakclient/requests';
+
 function getImageSrcString(imageBase64) {
   return `data:image/jpeg;base64,${imageBase64}`;
 }
 
 export function getProfileImageSrcString(squeakProfile) {
   const profileImage = squeakProfile.getProfileImage();
-  return getImageSrcString(profileImage);
+  if (profileImage) {
+    return getImageSrcString(profileImage);
+  }
+  // Squeak displays only have the image hash if images are not inlined.
+  return `${web_host_port}/profileimage/${squeakProfile.getProfileImageHash()}`;
 }
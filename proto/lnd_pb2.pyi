@@ -0,0 +1,8318 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+"""
+
+from collections import abc as _abc
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+import builtins as _builtins
+import sys
+import typing as _typing
+
+if sys.version_info >= (3, 11):
+    from typing import TypeAlias as _TypeAlias, Never as _Never
+else:
+    from typing_extensions import TypeAlias as _TypeAlias, Never as _Never
+
+if sys.version_info >= (3, 13):
+    from warnings import deprecated as _deprecated
+else:
+    from typing_extensions import deprecated as _deprecated
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class _AddressType:
+    ValueType = _typing.NewType("ValueType", _builtins.int)
+    V: _TypeAlias = ValueType  # noqa: Y015
+
+class _AddressTypeEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[_AddressType.ValueType], _builtins.type):
+    DESCRIPTOR: _descriptor.EnumDescriptor
+    WITNESS_PUBKEY_HASH: _AddressType.ValueType  # 0
+    NESTED_PUBKEY_HASH: _AddressType.ValueType  # 1
+    UNUSED_WITNESS_PUBKEY_HASH: _AddressType.ValueType  # 2
+    UNUSED_NESTED_PUBKEY_HASH: _AddressType.ValueType  # 3
+
+class AddressType(_AddressType, metaclass=_AddressTypeEnumTypeWrapper):
+    """
+    `AddressType` has to be one of:
+
+    - `p2wkh`: Pay to witness key hash (`WITNESS_PUBKEY_HASH` = 0)
+    - `np2wkh`: Pay to nested witness key hash (`NESTED_PUBKEY_HASH` = 1)
+    """
+
+WITNESS_PUBKEY_HASH: AddressType.ValueType  # 0
+NESTED_PUBKEY_HASH: AddressType.ValueType  # 1
+UNUSED_WITNESS_PUBKEY_HASH: AddressType.ValueType  # 2
+UNUSED_NESTED_PUBKEY_HASH: AddressType.ValueType  # 3
+Global___AddressType: _TypeAlias = AddressType  # noqa: Y015
+
+class _CommitmentType:
+    ValueType = _typing.NewType("ValueType", _builtins.int)
+    V: _TypeAlias = ValueType  # noqa: Y015
+
+class _CommitmentTypeEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[_CommitmentType.ValueType], _builtins.type):
+    DESCRIPTOR: _descriptor.EnumDescriptor
+    UNKNOWN_COMMITMENT_TYPE: _CommitmentType.ValueType  # 0
+    """
+    Returned when the commitment type isn't known or unavailable.
+    """
+    LEGACY: _CommitmentType.ValueType  # 1
+    """
+    A channel using the legacy commitment format having tweaked to_remote
+    keys.
+    """
+    STATIC_REMOTE_KEY: _CommitmentType.ValueType  # 2
+    """
+    A channel that uses the modern commitment format where the key in the
+    output of the remote party does not change each state. This makes back
+    up and recovery easier as when the channel is closed, the funds go
+    directly to that key.
+    """
+    ANCHORS: _CommitmentType.ValueType  # 3
+    """
+    A channel that uses a commitment format that has anchor outputs on the
+    commitments, allowing fee bumping after a force close transaction has
+    been broadcast.
+    """
+
+class CommitmentType(_CommitmentType, metaclass=_CommitmentTypeEnumTypeWrapper): ...
+
+UNKNOWN_COMMITMENT_TYPE: CommitmentType.ValueType  # 0
+"""
+Returned when the commitment type isn't known or unavailable.
+"""
+LEGACY: CommitmentType.ValueType  # 1
+"""
+A channel using the legacy commitment format having tweaked to_remote
+keys.
+"""
+STATIC_REMOTE_KEY: CommitmentType.ValueType  # 2
+"""
+A channel that uses the modern commitment format where the key in the
+output of the remote party does not change each state. This makes back
+up and recovery easier as when the channel is closed, the funds go
+directly to that key.
+"""
+ANCHORS: CommitmentType.ValueType  # 3
+"""
+A channel that uses a commitment format that has anchor outputs on the
+commitments, allowing fee bumping after a force close transaction has
+been broadcast.
+"""
+Global___CommitmentType: _TypeAlias = CommitmentType  # noqa: Y015
+
+class _Initiator:
+    ValueType = _typing.NewType("ValueType", _builtins.int)
+    V: _TypeAlias = ValueType  # noqa: Y015
+
+class _InitiatorEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[_Initiator.ValueType], _builtins.type):
+    DESCRIPTOR: _descriptor.EnumDescriptor
+    INITIATOR_UNKNOWN: _Initiator.ValueType  # 0
+    INITIATOR_LOCAL: _Initiator.ValueType  # 1
+    INITIATOR_REMOTE: _Initiator.ValueType  # 2
+    INITIATOR_BOTH: _Initiator.ValueType  # 3
+
+class Initiator(_Initiator, metaclass=_InitiatorEnumTypeWrapper): ...
+
+INITIATOR_UNKNOWN: Initiator.ValueType  # 0
+INITIATOR_LOCAL: Initiator.ValueType  # 1
+INITIATOR_REMOTE: Initiator.ValueType  # 2
+INITIATOR_BOTH: Initiator.ValueType  # 3
+Global___Initiator: _TypeAlias = Initiator  # noqa: Y015
+
+class _ResolutionType:
+    ValueType = _typing.NewType("ValueType", _builtins.int)
+    V: _TypeAlias = ValueType  # noqa: Y015
+
+class _ResolutionTypeEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[_ResolutionType.ValueType], _builtins.type):
+    DESCRIPTOR: _descriptor.EnumDescriptor
+    TYPE_UNKNOWN: _ResolutionType.ValueType  # 0
+    ANCHOR: _ResolutionType.ValueType  # 1
+    """We resolved an anchor output."""
+    INCOMING_HTLC: _ResolutionType.ValueType  # 2
+    """
+    We are resolving an incoming htlc on chain. This if this htlc is
+    claimed, we swept the incoming htlc with the preimage. If it is timed
+    out, our peer swept the timeout path.
+    """
+    OUTGOING_HTLC: _ResolutionType.ValueType  # 3
+    """
+    We are resolving an outgoing htlc on chain. If this htlc is claimed,
+    the remote party swept the htlc with the preimage. If it is timed out,
+    we swept it with the timeout path.
+    """
+    COMMIT: _ResolutionType.ValueType  # 4
+    """We force closed and need to sweep our time locked commitment output."""
+
+class ResolutionType(_ResolutionType, metaclass=_ResolutionTypeEnumTypeWrapper): ...
+
+TYPE_UNKNOWN: ResolutionType.ValueType  # 0
+ANCHOR: ResolutionType.ValueType  # 1
+"""We resolved an anchor output."""
+INCOMING_HTLC: ResolutionType.ValueType  # 2
+"""
+We are resolving an incoming htlc on chain. This if this htlc is
+claimed, we swept the incoming htlc with the preimage. If it is timed
+out, our peer swept the timeout path.
+"""
+OUTGOING_HTLC: ResolutionType.ValueType  # 3
+"""
+We are resolving an outgoing htlc on chain. If this htlc is claimed,
+the remote party swept the htlc with the preimage. If it is timed out,
+we swept it with the timeout path.
+"""
+COMMIT: ResolutionType.ValueType  # 4
+"""We force closed and need to sweep our time locked commitment output."""
+Global___ResolutionType: _TypeAlias = ResolutionType  # noqa: Y015
+
+class _ResolutionOutcome:
+    ValueType = _typing.NewType("ValueType", _builtins.int)
+    V: _TypeAlias = ValueType  # noqa: Y015
+
+class _ResolutionOutcomeEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[_ResolutionOutcome.ValueType], _builtins.type):
+    DESCRIPTOR: _descriptor.EnumDescriptor
+    OUTCOME_UNKNOWN: _ResolutionOutcome.ValueType  # 0
+    """Outcome unknown."""
+    CLAIMED: _ResolutionOutcome.ValueType  # 1
+    """An output was claimed on chain."""
+    UNCLAIMED: _ResolutionOutcome.ValueType  # 2
+    """An output was left unclaimed on chain."""
+    ABANDONED: _ResolutionOutcome.ValueType  # 3
+    """
+    ResolverOutcomeAbandoned indicates that an output that we did not
+    claim on chain, for example an anchor that we did not sweep and a
+    third party claimed on chain, or a htlc that we could not decode
+    so left unclaimed.
+    """
+    FIRST_STAGE: _ResolutionOutcome.ValueType  # 4
+    """
+    If we force closed our channel, our htlcs need to be claimed in two
+    stages. This outcome represents the broadcast of a timeout or success
+    transaction for this two stage htlc claim.
+    """
+    TIMEOUT: _ResolutionOutcome.ValueType  # 5
+    """A htlc was timed out on chain."""
+
+class ResolutionOutcome(_ResolutionOutcome, metaclass=_ResolutionOutcomeEnumTypeWrapper): ...
+
+OUTCOME_UNKNOWN: ResolutionOutcome.ValueType  # 0
+"""Outcome unknown."""
+CLAIMED: ResolutionOutcome.ValueType  # 1
+"""An output was claimed on chain."""
+UNCLAIMED: ResolutionOutcome.ValueType  # 2
+"""An output was left unclaimed on chain."""
+ABANDONED: ResolutionOutcome.ValueType  # 3
+"""
+ResolverOutcomeAbandoned indicates that an output that we did not
+claim on chain, for example an anchor that we did not sweep and a
+third party claimed on chain, or a htlc that we could not decode
+so left unclaimed.
+"""
+FIRST_STAGE: ResolutionOutcome.ValueType  # 4
+"""
+If we force closed our channel, our htlcs need to be claimed in two
+stages. This outcome represents the broadcast of a timeout or success
+transaction for this two stage htlc claim.
+"""
+TIMEOUT: ResolutionOutcome.ValueType  # 5
+"""A htlc was timed out on chain."""
+Global___ResolutionOutcome: _TypeAlias = ResolutionOutcome  # noqa: Y015
+
+class _NodeMetricType:
+    ValueType = _typing.NewType("ValueType", _builtins.int)
+    V: _TypeAlias = ValueType  # noqa: Y015
+
+class _NodeMetricTypeEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[_NodeMetricType.ValueType], _builtins.type):
+    DESCRIPTOR: _descriptor.EnumDescriptor
+    UNKNOWN: _NodeMetricType.ValueType  # 0
+    BETWEENNESS_CENTRALITY: _NodeMetricType.ValueType  # 1
+
+class NodeMetricType(_NodeMetricType, metaclass=_NodeMetricTypeEnumTypeWrapper): ...
+
+UNKNOWN: NodeMetricType.ValueType  # 0
+BETWEENNESS_CENTRALITY: NodeMetricType.ValueType  # 1
+Global___NodeMetricType: _TypeAlias = NodeMetricType  # noqa: Y015
+
+class _InvoiceHTLCState:
+    ValueType = _typing.NewType("ValueType", _builtins.int)
+    V: _TypeAlias = ValueType  # noqa: Y015
+
+class _InvoiceHTLCStateEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[_InvoiceHTLCState.ValueType], _builtins.type):
+    DESCRIPTOR: _descriptor.EnumDescriptor
+    ACCEPTED: _InvoiceHTLCState.ValueType  # 0
+    SETTLED: _InvoiceHTLCState.ValueType  # 1
+    CANCELED: _InvoiceHTLCState.ValueType  # 2
+
+class InvoiceHTLCState(_InvoiceHTLCState, metaclass=_InvoiceHTLCStateEnumTypeWrapper): ...
+
+ACCEPTED: InvoiceHTLCState.ValueType  # 0
+SETTLED: InvoiceHTLCState.ValueType  # 1
+CANCELED: InvoiceHTLCState.ValueType  # 2
+Global___InvoiceHTLCState: _TypeAlias = InvoiceHTLCState  # noqa: Y015
+
+class _PaymentFailureReason:
+    ValueType = _typing.NewType("ValueType", _builtins.int)
+    V: _TypeAlias = ValueType  # noqa: Y015
+
+class _PaymentFailureReasonEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[_PaymentFailureReason.ValueType], _builtins.type):
+    DESCRIPTOR: _descriptor.EnumDescriptor
+    FAILURE_REASON_NONE: _PaymentFailureReason.ValueType  # 0
+    """
+    Payment isn't failed (yet).
+    """
+    FAILURE_REASON_TIMEOUT: _PaymentFailureReason.ValueType  # 1
+    """
+    There are more routes to try, but the payment timeout was exceeded.
+    """
+    FAILURE_REASON_NO_ROUTE: _PaymentFailureReason.ValueType  # 2
+    """
+    All possible routes were tried and failed permanently. Or were no
+    routes to the destination at all.
+    """
+    FAILURE_REASON_ERROR: _PaymentFailureReason.ValueType  # 3
+    """
+    A non-recoverable error has occured.
+    """
+    FAILURE_REASON_INCORRECT_PAYMENT_DETAILS: _PaymentFailureReason.ValueType  # 4
+    """
+    Payment details incorrect (unknown hash, invalid amt or
+    invalid final cltv delta)
+    """
+    FAILURE_REASON_INSUFFICIENT_BALANCE: _PaymentFailureReason.ValueType  # 5
+    """
+    Insufficient local balance.
+    """
+
+class PaymentFailureReason(_PaymentFailureReason, metaclass=_PaymentFailureReasonEnumTypeWrapper): ...
+
+FAILURE_REASON_NONE: PaymentFailureReason.ValueType  # 0
+"""
+Payment isn't failed (yet).
+"""
+FAILURE_REASON_TIMEOUT: PaymentFailureReason.ValueType  # 1
+"""
+There are more routes to try, but the payment timeout was exceeded.
+"""
+FAILURE_REASON_NO_ROUTE: PaymentFailureReason.ValueType  # 2
+"""
+All possible routes were tried and failed permanently. Or were no
+routes to the destination at all.
+"""
+FAILURE_REASON_ERROR: PaymentFailureReason.ValueType  # 3
+"""
+A non-recoverable error has occured.
+"""
+FAILURE_REASON_INCORRECT_PAYMENT_DETAILS: PaymentFailureReason.ValueType  # 4
+"""
+Payment details incorrect (unknown hash, invalid amt or
+invalid final cltv delta)
+"""
+FAILURE_REASON_INSUFFICIENT_BALANCE: PaymentFailureReason.ValueType  # 5
+"""
+Insufficient local balance.
+"""
+Global___PaymentFailureReason: _TypeAlias = PaymentFailureReason  # noqa: Y015
+
+class _FeatureBit:
+    ValueType = _typing.NewType("ValueType", _builtins.int)
+    V: _TypeAlias = ValueType  # noqa: Y015
+
+class _FeatureBitEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[_FeatureBit.ValueType], _builtins.type):
+    DESCRIPTOR: _descriptor.EnumDescriptor
+    DATALOSS_PROTECT_REQ: _FeatureBit.ValueType  # 0
+    DATALOSS_PROTECT_OPT: _FeatureBit.ValueType  # 1
+    INITIAL_ROUING_SYNC: _FeatureBit.ValueType  # 3
+    UPFRONT_SHUTDOWN_SCRIPT_REQ: _FeatureBit.ValueType  # 4
+    UPFRONT_SHUTDOWN_SCRIPT_OPT: _FeatureBit.ValueType  # 5
+    GOSSIP_QUERIES_REQ: _FeatureBit.ValueType  # 6
+    GOSSIP_QUERIES_OPT: _FeatureBit.ValueType  # 7
+    TLV_ONION_REQ: _FeatureBit.ValueType  # 8
+    TLV_ONION_OPT: _FeatureBit.ValueType  # 9
+    EXT_GOSSIP_QUERIES_REQ: _FeatureBit.ValueType  # 10
+    EXT_GOSSIP_QUERIES_OPT: _FeatureBit.ValueType  # 11
+    STATIC_REMOTE_KEY_REQ: _FeatureBit.ValueType  # 12
+    STATIC_REMOTE_KEY_OPT: _FeatureBit.ValueType  # 13
+    PAYMENT_ADDR_REQ: _FeatureBit.ValueType  # 14
+    PAYMENT_ADDR_OPT: _FeatureBit.ValueType  # 15
+    MPP_REQ: _FeatureBit.ValueType  # 16
+    MPP_OPT: _FeatureBit.ValueType  # 17
+    WUMBO_CHANNELS_REQ: _FeatureBit.ValueType  # 18
+    WUMBO_CHANNELS_OPT: _FeatureBit.ValueType  # 19
+    ANCHORS_REQ: _FeatureBit.ValueType  # 20
+    ANCHORS_OPT: _FeatureBit.ValueType  # 21
+    ANCHORS_ZERO_FEE_HTLC_REQ: _FeatureBit.ValueType  # 22
+    ANCHORS_ZERO_FEE_HTLC_OPT: _FeatureBit.ValueType  # 23
+    AMP_REQ: _FeatureBit.ValueType  # 30
+    AMP_OPT: _FeatureBit.ValueType  # 31
+
+class FeatureBit(_FeatureBit, metaclass=_FeatureBitEnumTypeWrapper): ...
+
+DATALOSS_PROTECT_REQ: FeatureBit.ValueType  # 0
+DATALOSS_PROTECT_OPT: FeatureBit.ValueType  # 1
+INITIAL_ROUING_SYNC: FeatureBit.ValueType  # 3
+UPFRONT_SHUTDOWN_SCRIPT_REQ: FeatureBit.ValueType  # 4
+UPFRONT_SHUTDOWN_SCRIPT_OPT: FeatureBit.ValueType  # 5
+GOSSIP_QUERIES_REQ: FeatureBit.ValueType  # 6
+GOSSIP_QUERIES_OPT: FeatureBit.ValueType  # 7
+TLV_ONION_REQ: FeatureBit.ValueType  # 8
+TLV_ONION_OPT: FeatureBit.ValueType  # 9
+EXT_GOSSIP_QUERIES_REQ: FeatureBit.ValueType  # 10
+EXT_GOSSIP_QUERIES_OPT: FeatureBit.ValueType  # 11
+STATIC_REMOTE_KEY_REQ: FeatureBit.ValueType  # 12
+STATIC_REMOTE_KEY_OPT: FeatureBit.ValueType  # 13
+PAYMENT_ADDR_REQ: FeatureBit.ValueType  # 14
+PAYMENT_ADDR_OPT: FeatureBit.ValueType  # 15
+MPP_REQ: FeatureBit.ValueType  # 16
+MPP_OPT: FeatureBit.ValueType  # 17
+WUMBO_CHANNELS_REQ: FeatureBit.ValueType  # 18
+WUMBO_CHANNELS_OPT: FeatureBit.ValueType  # 19
+ANCHORS_REQ: FeatureBit.ValueType  # 20
+ANCHORS_OPT: FeatureBit.ValueType  # 21
+ANCHORS_ZERO_FEE_HTLC_REQ: FeatureBit.ValueType  # 22
+ANCHORS_ZERO_FEE_HTLC_OPT: FeatureBit.ValueType  # 23
+AMP_REQ: FeatureBit.ValueType  # 30
+AMP_OPT: FeatureBit.ValueType  # 31
+Global___FeatureBit: _TypeAlias = FeatureBit  # noqa: Y015
+
+class _UpdateFailure:
+    ValueType = _typing.NewType("ValueType", _builtins.int)
+    V: _TypeAlias = ValueType  # noqa: Y015
+
+class _UpdateFailureEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[_UpdateFailure.ValueType], _builtins.type):
+    DESCRIPTOR: _descriptor.EnumDescriptor
+    UPDATE_FAILURE_UNKNOWN: _UpdateFailure.ValueType  # 0
+    UPDATE_FAILURE_PENDING: _UpdateFailure.ValueType  # 1
+    UPDATE_FAILURE_NOT_FOUND: _UpdateFailure.ValueType  # 2
+    UPDATE_FAILURE_INTERNAL_ERR: _UpdateFailure.ValueType  # 3
+    UPDATE_FAILURE_INVALID_PARAMETER: _UpdateFailure.ValueType  # 4
+
+class UpdateFailure(_UpdateFailure, metaclass=_UpdateFailureEnumTypeWrapper): ...
+
+UPDATE_FAILURE_UNKNOWN: UpdateFailure.ValueType  # 0
+UPDATE_FAILURE_PENDING: UpdateFailure.ValueType  # 1
+UPDATE_FAILURE_NOT_FOUND: UpdateFailure.ValueType  # 2
+UPDATE_FAILURE_INTERNAL_ERR: UpdateFailure.ValueType  # 3
+UPDATE_FAILURE_INVALID_PARAMETER: UpdateFailure.ValueType  # 4
+Global___UpdateFailure: _TypeAlias = UpdateFailure  # noqa: Y015
+
+@_typing.final
+class Utxo(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ADDRESS_TYPE_FIELD_NUMBER: _builtins.int
+    ADDRESS_FIELD_NUMBER: _builtins.int
+    AMOUNT_SAT_FIELD_NUMBER: _builtins.int
+    PK_SCRIPT_FIELD_NUMBER: _builtins.int
+    OUTPOINT_FIELD_NUMBER: _builtins.int
+    CONFIRMATIONS_FIELD_NUMBER: _builtins.int
+    address_type: Global___AddressType.ValueType
+    """The type of address"""
+    address: _builtins.str
+    """The address"""
+    amount_sat: _builtins.int
+    """The value of the unspent coin in satoshis"""
+    pk_script: _builtins.str
+    """The pkscript in hex"""
+    confirmations: _builtins.int
+    """The number of confirmations for the Utxo"""
+    @_builtins.property
+    def outpoint(self) -> Global___OutPoint:
+        """The outpoint in format txid:n"""
+
+    def __init__(
+        self,
+        *,
+        address_type: Global___AddressType.ValueType = ...,
+        address: _builtins.str = ...,
+        amount_sat: _builtins.int = ...,
+        pk_script: _builtins.str = ...,
+        outpoint: Global___OutPoint | None = ...,
+        confirmations: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["outpoint", b"outpoint"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["address", b"address", "address_type", b"address_type", "amount_sat", b"amount_sat", "confirmations", b"confirmations", "outpoint", b"outpoint", "pk_script", b"pk_script"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___Utxo: _TypeAlias = Utxo  # noqa: Y015
+
+@_typing.final
+class Transaction(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    TX_HASH_FIELD_NUMBER: _builtins.int
+    AMOUNT_FIELD_NUMBER: _builtins.int
+    NUM_CONFIRMATIONS_FIELD_NUMBER: _builtins.int
+    BLOCK_HASH_FIELD_NUMBER: _builtins.int
+    BLOCK_HEIGHT_FIELD_NUMBER: _builtins.int
+    TIME_STAMP_FIELD_NUMBER: _builtins.int
+    TOTAL_FEES_FIELD_NUMBER: _builtins.int
+    DEST_ADDRESSES_FIELD_NUMBER: _builtins.int
+    RAW_TX_HEX_FIELD_NUMBER: _builtins.int
+    LABEL_FIELD_NUMBER: _builtins.int
+    tx_hash: _builtins.str
+    """The transaction hash"""
+    amount: _builtins.int
+    """The transaction amount, denominated in satoshis"""
+    num_confirmations: _builtins.int
+    """The number of confirmations"""
+    block_hash: _builtins.str
+    """The hash of the block this transaction was included in"""
+    block_height: _builtins.int
+    """The height of the block this transaction was included in"""
+    time_stamp: _builtins.int
+    """Timestamp of this transaction"""
+    total_fees: _builtins.int
+    """Fees paid for this transaction"""
+    raw_tx_hex: _builtins.str
+    """The raw transaction hex."""
+    label: _builtins.str
+    """A label that was optionally set on transaction broadcast."""
+    @_builtins.property
+    def dest_addresses(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]:
+        """Addresses that received funds for this transaction"""
+
+    def __init__(
+        self,
+        *,
+        tx_hash: _builtins.str = ...,
+        amount: _builtins.int = ...,
+        num_confirmations: _builtins.int = ...,
+        block_hash: _builtins.str = ...,
+        block_height: _builtins.int = ...,
+        time_stamp: _builtins.int = ...,
+        total_fees: _builtins.int = ...,
+        dest_addresses: _abc.Iterable[_builtins.str] | None = ...,
+        raw_tx_hex: _builtins.str = ...,
+        label: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["amount", b"amount", "block_hash", b"block_hash", "block_height", b"block_height", "dest_addresses", b"dest_addresses", "label", b"label", "num_confirmations", b"num_confirmations", "raw_tx_hex", b"raw_tx_hex", "time_stamp", b"time_stamp", "total_fees", b"total_fees", "tx_hash", b"tx_hash"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___Transaction: _TypeAlias = Transaction  # noqa: Y015
+
+@_typing.final
+class GetTransactionsRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    START_HEIGHT_FIELD_NUMBER: _builtins.int
+    END_HEIGHT_FIELD_NUMBER: _builtins.int
+    ACCOUNT_FIELD_NUMBER: _builtins.int
+    start_height: _builtins.int
+    """
+    The height from which to list transactions, inclusive. If this value is
+    greater than end_height, transactions will be read in reverse.
+    """
+    end_height: _builtins.int
+    """
+    The height until which to list transactions, inclusive. To include
+    unconfirmed transactions, this value should be set to -1, which will
+    return transactions from start_height until the current chain tip and
+    unconfirmed transactions. If no end_height is provided, the call will
+    default to this option.
+    """
+    account: _builtins.str
+    """An optional filter to only include transactions relevant to an account."""
+    def __init__(
+        self,
+        *,
+        start_height: _builtins.int = ...,
+        end_height: _builtins.int = ...,
+        account: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["account", b"account", "end_height", b"end_height", "start_height", b"start_height"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetTransactionsRequest: _TypeAlias = GetTransactionsRequest  # noqa: Y015
+
+@_typing.final
+class TransactionDetails(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    TRANSACTIONS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def transactions(self) -> _containers.RepeatedCompositeFieldContainer[Global___Transaction]:
+        """The list of transactions relevant to the wallet."""
+
+    def __init__(
+        self,
+        *,
+        transactions: _abc.Iterable[Global___Transaction] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["transactions", b"transactions"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___TransactionDetails: _TypeAlias = TransactionDetails  # noqa: Y015
+
+@_typing.final
+class FeeLimit(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    FIXED_FIELD_NUMBER: _builtins.int
+    FIXED_MSAT_FIELD_NUMBER: _builtins.int
+    PERCENT_FIELD_NUMBER: _builtins.int
+    fixed: _builtins.int
+    """
+    The fee limit expressed as a fixed amount of satoshis.
+
+    The fields fixed and fixed_msat are mutually exclusive.
+    """
+    fixed_msat: _builtins.int
+    """
+    The fee limit expressed as a fixed amount of millisatoshis.
+
+    The fields fixed and fixed_msat are mutually exclusive.
+    """
+    percent: _builtins.int
+    """The fee limit expressed as a percentage of the payment amount."""
+    def __init__(
+        self,
+        *,
+        fixed: _builtins.int = ...,
+        fixed_msat: _builtins.int = ...,
+        percent: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["fixed", b"fixed", "fixed_msat", b"fixed_msat", "limit", b"limit", "percent", b"percent"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["fixed", b"fixed", "fixed_msat", b"fixed_msat", "limit", b"limit", "percent", b"percent"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    _WhichOneofReturnType_limit: _TypeAlias = _typing.Literal["fixed", "fixed_msat", "percent"]  # noqa: Y015
+    _WhichOneofArgType_limit: _TypeAlias = _typing.Literal["limit", b"limit"]  # noqa: Y015
+    def WhichOneof(self, oneof_group: _WhichOneofArgType_limit) -> _WhichOneofReturnType_limit | None: ...
+
+Global___FeeLimit: _TypeAlias = FeeLimit  # noqa: Y015
+
+@_typing.final
+class SendRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class DestCustomRecordsEntry(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: _builtins.int
+        VALUE_FIELD_NUMBER: _builtins.int
+        key: _builtins.int
+        value: _builtins.bytes
+        def __init__(
+            self,
+            *,
+            key: _builtins.int = ...,
+            value: _builtins.bytes = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["key", b"key", "value", b"value"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    DEST_FIELD_NUMBER: _builtins.int
+    DEST_STRING_FIELD_NUMBER: _builtins.int
+    AMT_FIELD_NUMBER: _builtins.int
+    AMT_MSAT_FIELD_NUMBER: _builtins.int
+    PAYMENT_HASH_FIELD_NUMBER: _builtins.int
+    PAYMENT_HASH_STRING_FIELD_NUMBER: _builtins.int
+    PAYMENT_REQUEST_FIELD_NUMBER: _builtins.int
+    FINAL_CLTV_DELTA_FIELD_NUMBER: _builtins.int
+    FEE_LIMIT_FIELD_NUMBER: _builtins.int
+    OUTGOING_CHAN_ID_FIELD_NUMBER: _builtins.int
+    LAST_HOP_PUBKEY_FIELD_NUMBER: _builtins.int
+    CLTV_LIMIT_FIELD_NUMBER: _builtins.int
+    DEST_CUSTOM_RECORDS_FIELD_NUMBER: _builtins.int
+    ALLOW_SELF_PAYMENT_FIELD_NUMBER: _builtins.int
+    DEST_FEATURES_FIELD_NUMBER: _builtins.int
+    PAYMENT_ADDR_FIELD_NUMBER: _builtins.int
+    dest: _builtins.bytes
+    """
+    The identity pubkey of the payment recipient. When using REST, this field
+    must be encoded as base64.
+    """
+    @_builtins.property
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def dest_string(self) -> _builtins.str:
+        """
+        The hex-encoded identity pubkey of the payment recipient. Deprecated now
+        that the REST gateway supports base64 encoding of bytes fields.
+        """
+
+    @dest_string.setter
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def dest_string(self, value: _builtins.str) -> None:
+        """
+        The hex-encoded identity pubkey of the payment recipient. Deprecated now
+        that the REST gateway supports base64 encoding of bytes fields.
+        """
+
+    amt: _builtins.int
+    """
+    The amount to send expressed in satoshis.
+
+    The fields amt and amt_msat are mutually exclusive.
+    """
+    amt_msat: _builtins.int
+    """
+    The amount to send expressed in millisatoshis.
+
+    The fields amt and amt_msat are mutually exclusive.
+    """
+    payment_hash: _builtins.bytes
+    """
+    The hash to use within the payment's HTLC. When using REST, this field
+    must be encoded as base64.
+    """
+    @_builtins.property
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def payment_hash_string(self) -> _builtins.str:
+        """
+        The hex-encoded hash to use within the payment's HTLC. Deprecated now
+        that the REST gateway supports base64 encoding of bytes fields.
+        """
+
+    @payment_hash_string.setter
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def payment_hash_string(self, value: _builtins.str) -> None:
+        """
+        The hex-encoded hash to use within the payment's HTLC. Deprecated now
+        that the REST gateway supports base64 encoding of bytes fields.
+        """
+
+    payment_request: _builtins.str
+    """
+    A bare-bones invoice for a payment within the Lightning Network. With the
+    details of the invoice, the sender has all the data necessary to send a
+    payment to the recipient.
+    """
+    final_cltv_delta: _builtins.int
+    """
+    The CLTV delta from the current height that should be used to set the
+    timelock for the final hop.
+    """
+    outgoing_chan_id: _builtins.int
+    """
+    The channel id of the channel that must be taken to the first hop. If zero,
+    any channel may be used.
+    """
+    last_hop_pubkey: _builtins.bytes
+    """
+    The pubkey of the last hop of the route. If empty, any hop may be used.
+    """
+    cltv_limit: _builtins.int
+    """
+    An optional maximum total time lock for the route. This should not exceed
+    lnd's `--max-cltv-expiry` setting. If zero, then the value of
+    `--max-cltv-expiry` is enforced.
+    """
+    allow_self_payment: _builtins.bool
+    """If set, circular payments to self are permitted."""
+    payment_addr: _builtins.bytes
+    """
+    The payment address of the generated invoice.
+    """
+    @_builtins.property
+    def fee_limit(self) -> Global___FeeLimit:
+        """
+        The maximum number of satoshis that will be paid as a fee of the payment.
+        This value can be represented either as a percentage of the amount being
+        sent, or as a fixed amount of the maximum fee the user is willing the pay to
+        send the payment.
+        """
+
+    @_builtins.property
+    def dest_custom_records(self) -> _containers.ScalarMap[_builtins.int, _builtins.bytes]:
+        """
+        An optional field that can be used to pass an arbitrary set of TLV records
+        to a peer which understands the new records. This can be used to pass
+        application specific data during the payment attempt. Record types are
+        required to be in the custom range >= 65536. When using REST, the values
+        must be encoded as base64.
+        """
+
+    @_builtins.property
+    def dest_features(self) -> _containers.RepeatedScalarFieldContainer[Global___FeatureBit.ValueType]:
+        """
+        Features assumed to be supported by the final node. All transitive feature
+        dependencies must also be set properly. For a given feature bit pair, either
+        optional or remote may be set, but not both. If this field is nil or empty,
+        the router will try to load destination features from the graph as a
+        fallback.
+        """
+
+    def __init__(
+        self,
+        *,
+        dest: _builtins.bytes = ...,
+        dest_string: _builtins.str = ...,
+        amt: _builtins.int = ...,
+        amt_msat: _builtins.int = ...,
+        payment_hash: _builtins.bytes = ...,
+        payment_hash_string: _builtins.str = ...,
+        payment_request: _builtins.str = ...,
+        final_cltv_delta: _builtins.int = ...,
+        fee_limit: Global___FeeLimit | None = ...,
+        outgoing_chan_id: _builtins.int = ...,
+        last_hop_pubkey: _builtins.bytes = ...,
+        cltv_limit: _builtins.int = ...,
+        dest_custom_records: _abc.Mapping[_builtins.int, _builtins.bytes] | None = ...,
+        allow_self_payment: _builtins.bool = ...,
+        dest_features: _abc.Iterable[Global___FeatureBit.ValueType] | None = ...,
+        payment_addr: _builtins.bytes = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["fee_limit", b"fee_limit"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["allow_self_payment", b"allow_self_payment", "amt", b"amt", "amt_msat", b"amt_msat", "cltv_limit", b"cltv_limit", "dest", b"dest", "dest_custom_records", b"dest_custom_records", "dest_features", b"dest_features", "dest_string", b"dest_string", "fee_limit", b"fee_limit", "final_cltv_delta", b"final_cltv_delta", "last_hop_pubkey", b"last_hop_pubkey", "outgoing_chan_id", b"outgoing_chan_id", "payment_addr", b"payment_addr", "payment_hash", b"payment_hash", "payment_hash_string", b"payment_hash_string", "payment_request", b"payment_request"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SendRequest: _TypeAlias = SendRequest  # noqa: Y015
+
+@_typing.final
+class SendResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PAYMENT_ERROR_FIELD_NUMBER: _builtins.int
+    PAYMENT_PREIMAGE_FIELD_NUMBER: _builtins.int
+    PAYMENT_ROUTE_FIELD_NUMBER: _builtins.int
+    PAYMENT_HASH_FIELD_NUMBER: _builtins.int
+    payment_error: _builtins.str
+    payment_preimage: _builtins.bytes
+    payment_hash: _builtins.bytes
+    @_builtins.property
+    def payment_route(self) -> Global___Route: ...
+    def __init__(
+        self,
+        *,
+        payment_error: _builtins.str = ...,
+        payment_preimage: _builtins.bytes = ...,
+        payment_route: Global___Route | None = ...,
+        payment_hash: _builtins.bytes = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["payment_route", b"payment_route"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["payment_error", b"payment_error", "payment_hash", b"payment_hash", "payment_preimage", b"payment_preimage", "payment_route", b"payment_route"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SendResponse: _TypeAlias = SendResponse  # noqa: Y015
+
+@_typing.final
+class SendToRouteRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PAYMENT_HASH_FIELD_NUMBER: _builtins.int
+    PAYMENT_HASH_STRING_FIELD_NUMBER: _builtins.int
+    ROUTE_FIELD_NUMBER: _builtins.int
+    payment_hash: _builtins.bytes
+    """
+    The payment hash to use for the HTLC. When using REST, this field must be
+    encoded as base64.
+    """
+    @_builtins.property
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def payment_hash_string(self) -> _builtins.str:
+        """
+        An optional hex-encoded payment hash to be used for the HTLC. Deprecated now
+        that the REST gateway supports base64 encoding of bytes fields.
+        """
+
+    @payment_hash_string.setter
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def payment_hash_string(self, value: _builtins.str) -> None:
+        """
+        An optional hex-encoded payment hash to be used for the HTLC. Deprecated now
+        that the REST gateway supports base64 encoding of bytes fields.
+        """
+
+    @_builtins.property
+    def route(self) -> Global___Route:
+        """Route that should be used to attempt to complete the payment."""
+
+    def __init__(
+        self,
+        *,
+        payment_hash: _builtins.bytes = ...,
+        payment_hash_string: _builtins.str = ...,
+        route: Global___Route | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["route", b"route"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["payment_hash", b"payment_hash", "payment_hash_string", b"payment_hash_string", "route", b"route"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SendToRouteRequest: _TypeAlias = SendToRouteRequest  # noqa: Y015
+
+@_typing.final
+class ChannelAcceptRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    NODE_PUBKEY_FIELD_NUMBER: _builtins.int
+    CHAIN_HASH_FIELD_NUMBER: _builtins.int
+    PENDING_CHAN_ID_FIELD_NUMBER: _builtins.int
+    FUNDING_AMT_FIELD_NUMBER: _builtins.int
+    PUSH_AMT_FIELD_NUMBER: _builtins.int
+    DUST_LIMIT_FIELD_NUMBER: _builtins.int
+    MAX_VALUE_IN_FLIGHT_FIELD_NUMBER: _builtins.int
+    CHANNEL_RESERVE_FIELD_NUMBER: _builtins.int
+    MIN_HTLC_FIELD_NUMBER: _builtins.int
+    FEE_PER_KW_FIELD_NUMBER: _builtins.int
+    CSV_DELAY_FIELD_NUMBER: _builtins.int
+    MAX_ACCEPTED_HTLCS_FIELD_NUMBER: _builtins.int
+    CHANNEL_FLAGS_FIELD_NUMBER: _builtins.int
+    node_pubkey: _builtins.bytes
+    """The pubkey of the node that wishes to open an inbound channel."""
+    chain_hash: _builtins.bytes
+    """The hash of the genesis block that the proposed channel resides in."""
+    pending_chan_id: _builtins.bytes
+    """The pending channel id."""
+    funding_amt: _builtins.int
+    """The funding amount in satoshis that initiator wishes to use in the
+    channel.
+    """
+    push_amt: _builtins.int
+    """The push amount of the proposed channel in millisatoshis."""
+    dust_limit: _builtins.int
+    """The dust limit of the initiator's commitment tx."""
+    max_value_in_flight: _builtins.int
+    """The maximum amount of coins in millisatoshis that can be pending in this
+    channel.
+    """
+    channel_reserve: _builtins.int
+    """The minimum amount of satoshis the initiator requires us to have at all
+    times.
+    """
+    min_htlc: _builtins.int
+    """The smallest HTLC in millisatoshis that the initiator will accept."""
+    fee_per_kw: _builtins.int
+    """The initial fee rate that the initiator suggests for both commitment
+    transactions.
+    """
+    csv_delay: _builtins.int
+    """
+    The number of blocks to use for the relative time lock in the pay-to-self
+    output of both commitment transactions.
+    """
+    max_accepted_htlcs: _builtins.int
+    """The total number of incoming HTLC's that the initiator will accept."""
+    channel_flags: _builtins.int
+    """A bit-field which the initiator uses to specify proposed channel
+    behavior.
+    """
+    def __init__(
+        self,
+        *,
+        node_pubkey: _builtins.bytes = ...,
+        chain_hash: _builtins.bytes = ...,
+        pending_chan_id: _builtins.bytes = ...,
+        funding_amt: _builtins.int = ...,
+        push_amt: _builtins.int = ...,
+        dust_limit: _builtins.int = ...,
+        max_value_in_flight: _builtins.int = ...,
+        channel_reserve: _builtins.int = ...,
+        min_htlc: _builtins.int = ...,
+        fee_per_kw: _builtins.int = ...,
+        csv_delay: _builtins.int = ...,
+        max_accepted_htlcs: _builtins.int = ...,
+        channel_flags: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["chain_hash", b"chain_hash", "channel_flags", b"channel_flags", "channel_reserve", b"channel_reserve", "csv_delay", b"csv_delay", "dust_limit", b"dust_limit", "fee_per_kw", b"fee_per_kw", "funding_amt", b"funding_amt", "max_accepted_htlcs", b"max_accepted_htlcs", "max_value_in_flight", b"max_value_in_flight", "min_htlc", b"min_htlc", "node_pubkey", b"node_pubkey", "pending_chan_id", b"pending_chan_id", "push_amt", b"push_amt"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ChannelAcceptRequest: _TypeAlias = ChannelAcceptRequest  # noqa: Y015
+
+@_typing.final
+class ChannelAcceptResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ACCEPT_FIELD_NUMBER: _builtins.int
+    PENDING_CHAN_ID_FIELD_NUMBER: _builtins.int
+    ERROR_FIELD_NUMBER: _builtins.int
+    UPFRONT_SHUTDOWN_FIELD_NUMBER: _builtins.int
+    CSV_DELAY_FIELD_NUMBER: _builtins.int
+    RESERVE_SAT_FIELD_NUMBER: _builtins.int
+    IN_FLIGHT_MAX_MSAT_FIELD_NUMBER: _builtins.int
+    MAX_HTLC_COUNT_FIELD_NUMBER: _builtins.int
+    MIN_HTLC_IN_FIELD_NUMBER: _builtins.int
+    MIN_ACCEPT_DEPTH_FIELD_NUMBER: _builtins.int
+    accept: _builtins.bool
+    """Whether or not the client accepts the channel."""
+    pending_chan_id: _builtins.bytes
+    """The pending channel id to which this response applies."""
+    error: _builtins.str
+    """
+    An optional error to send the initiating party to indicate why the channel
+    was rejected. This field *should not* contain sensitive information, it will
+    be sent to the initiating party. This field should only be set if accept is
+    false, the channel will be rejected if an error is set with accept=true
+    because the meaning of this response is ambiguous. Limited to 500
+    characters.
+    """
+    upfront_shutdown: _builtins.str
+    """
+    The upfront shutdown address to use if the initiating peer supports option
+    upfront shutdown script (see ListPeers for the features supported). Note
+    that the channel open will fail if this value is set for a peer that does
+    not support this feature bit.
+    """
+    csv_delay: _builtins.int
+    """
+    The csv delay (in blocks) that we require for the remote party.
+    """
+    reserve_sat: _builtins.int
+    """
+    The reserve amount in satoshis that we require the remote peer to adhere to.
+    We require that the remote peer always have some reserve amount allocated to
+    them so that there is always a disincentive to broadcast old state (if they
+    hold 0 sats on their side of the channel, there is nothing to lose).
+    """
+    in_flight_max_msat: _builtins.int
+    """
+    The maximum amount of funds in millisatoshis that we allow the remote peer
+    to have in outstanding htlcs.
+    """
+    max_htlc_count: _builtins.int
+    """
+    The maximum number of htlcs that the remote peer can offer us.
+    """
+    min_htlc_in: _builtins.int
+    """
+    The minimum value in millisatoshis for incoming htlcs on the channel.
+    """
+    min_accept_depth: _builtins.int
+    """
+    The number of confirmations we require before we consider the channel open.
+    """
+    def __init__(
+        self,
+        *,
+        accept: _builtins.bool = ...,
+        pending_chan_id: _builtins.bytes = ...,
+        error: _builtins.str = ...,
+        upfront_shutdown: _builtins.str = ...,
+        csv_delay: _builtins.int = ...,
+        reserve_sat: _builtins.int = ...,
+        in_flight_max_msat: _builtins.int = ...,
+        max_htlc_count: _builtins.int = ...,
+        min_htlc_in: _builtins.int = ...,
+        min_accept_depth: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["accept", b"accept", "csv_delay", b"csv_delay", "error", b"error", "in_flight_max_msat", b"in_flight_max_msat", "max_htlc_count", b"max_htlc_count", "min_accept_depth", b"min_accept_depth", "min_htlc_in", b"min_htlc_in", "pending_chan_id", b"pending_chan_id", "reserve_sat", b"reserve_sat", "upfront_shutdown", b"upfront_shutdown"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ChannelAcceptResponse: _TypeAlias = ChannelAcceptResponse  # noqa: Y015
+
+@_typing.final
+class ChannelPoint(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    FUNDING_TXID_BYTES_FIELD_NUMBER: _builtins.int
+    FUNDING_TXID_STR_FIELD_NUMBER: _builtins.int
+    OUTPUT_INDEX_FIELD_NUMBER: _builtins.int
+    funding_txid_bytes: _builtins.bytes
+    """
+    Txid of the funding transaction. When using REST, this field must be
+    encoded as base64.
+    """
+    funding_txid_str: _builtins.str
+    """
+    Hex-encoded string representing the byte-reversed hash of the funding
+    transaction.
+    """
+    output_index: _builtins.int
+    """The index of the output of the funding transaction"""
+    def __init__(
+        self,
+        *,
+        funding_txid_bytes: _builtins.bytes = ...,
+        funding_txid_str: _builtins.str = ...,
+        output_index: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["funding_txid", b"funding_txid", "funding_txid_bytes", b"funding_txid_bytes", "funding_txid_str", b"funding_txid_str"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["funding_txid", b"funding_txid", "funding_txid_bytes", b"funding_txid_bytes", "funding_txid_str", b"funding_txid_str", "output_index", b"output_index"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    _WhichOneofReturnType_funding_txid: _TypeAlias = _typing.Literal["funding_txid_bytes", "funding_txid_str"]  # noqa: Y015
+    _WhichOneofArgType_funding_txid: _TypeAlias = _typing.Literal["funding_txid", b"funding_txid"]  # noqa: Y015
+    def WhichOneof(self, oneof_group: _WhichOneofArgType_funding_txid) -> _WhichOneofReturnType_funding_txid | None: ...
+
+Global___ChannelPoint: _TypeAlias = ChannelPoint  # noqa: Y015
+
+@_typing.final
+class OutPoint(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    TXID_BYTES_FIELD_NUMBER: _builtins.int
+    TXID_STR_FIELD_NUMBER: _builtins.int
+    OUTPUT_INDEX_FIELD_NUMBER: _builtins.int
+    txid_bytes: _builtins.bytes
+    """Raw bytes representing the transaction id."""
+    txid_str: _builtins.str
+    """Reversed, hex-encoded string representing the transaction id."""
+    output_index: _builtins.int
+    """The index of the output on the transaction."""
+    def __init__(
+        self,
+        *,
+        txid_bytes: _builtins.bytes = ...,
+        txid_str: _builtins.str = ...,
+        output_index: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["output_index", b"output_index", "txid_bytes", b"txid_bytes", "txid_str", b"txid_str"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___OutPoint: _TypeAlias = OutPoint  # noqa: Y015
+
+@_typing.final
+class LightningAddress(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PUBKEY_FIELD_NUMBER: _builtins.int
+    HOST_FIELD_NUMBER: _builtins.int
+    pubkey: _builtins.str
+    """The identity pubkey of the Lightning node"""
+    host: _builtins.str
+    """The network location of the lightning node, e.g. `69.69.69.69:1337` or
+    `localhost:10011`
+    """
+    def __init__(
+        self,
+        *,
+        pubkey: _builtins.str = ...,
+        host: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["host", b"host", "pubkey", b"pubkey"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___LightningAddress: _TypeAlias = LightningAddress  # noqa: Y015
+
+@_typing.final
+class EstimateFeeRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class AddrToAmountEntry(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: _builtins.int
+        VALUE_FIELD_NUMBER: _builtins.int
+        key: _builtins.str
+        value: _builtins.int
+        def __init__(
+            self,
+            *,
+            key: _builtins.str = ...,
+            value: _builtins.int = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["key", b"key", "value", b"value"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    ADDRTOAMOUNT_FIELD_NUMBER: _builtins.int
+    TARGET_CONF_FIELD_NUMBER: _builtins.int
+    MIN_CONFS_FIELD_NUMBER: _builtins.int
+    SPEND_UNCONFIRMED_FIELD_NUMBER: _builtins.int
+    target_conf: _builtins.int
+    """The target number of blocks that this transaction should be confirmed
+    by.
+    """
+    min_confs: _builtins.int
+    """The minimum number of confirmations each one of your outputs used for
+    the transaction must satisfy.
+    """
+    spend_unconfirmed: _builtins.bool
+    """Whether unconfirmed outputs should be used as inputs for the transaction."""
+    @_builtins.property
+    def AddrToAmount(self) -> _containers.ScalarMap[_builtins.str, _builtins.int]:
+        """The map from addresses to amounts for the transaction."""
+
+    def __init__(
+        self,
+        *,
+        AddrToAmount: _abc.Mapping[_builtins.str, _builtins.int] | None = ...,
+        target_conf: _builtins.int = ...,
+        min_confs: _builtins.int = ...,
+        spend_unconfirmed: _builtins.bool = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["AddrToAmount", b"AddrToAmount", "min_confs", b"min_confs", "spend_unconfirmed", b"spend_unconfirmed", "target_conf", b"target_conf"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___EstimateFeeRequest: _TypeAlias = EstimateFeeRequest  # noqa: Y015
+
+@_typing.final
+class EstimateFeeResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    FEE_SAT_FIELD_NUMBER: _builtins.int
+    FEERATE_SAT_PER_BYTE_FIELD_NUMBER: _builtins.int
+    SAT_PER_VBYTE_FIELD_NUMBER: _builtins.int
+    fee_sat: _builtins.int
+    """The total fee in satoshis."""
+    @_builtins.property
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def feerate_sat_per_byte(self) -> _builtins.int:
+        """Deprecated, use sat_per_vbyte.
+        The fee rate in satoshi/vbyte.
+        """
+
+    @feerate_sat_per_byte.setter
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def feerate_sat_per_byte(self, value: _builtins.int) -> None:
+        """Deprecated, use sat_per_vbyte.
+        The fee rate in satoshi/vbyte.
+        """
+
+    sat_per_vbyte: _builtins.int
+    """The fee rate in satoshi/vbyte."""
+    def __init__(
+        self,
+        *,
+        fee_sat: _builtins.int = ...,
+        feerate_sat_per_byte: _builtins.int = ...,
+        sat_per_vbyte: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["fee_sat", b"fee_sat", "feerate_sat_per_byte", b"feerate_sat_per_byte", "sat_per_vbyte", b"sat_per_vbyte"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___EstimateFeeResponse: _TypeAlias = EstimateFeeResponse  # noqa: Y015
+
+@_typing.final
+class SendManyRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class AddrToAmountEntry(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: _builtins.int
+        VALUE_FIELD_NUMBER: _builtins.int
+        key: _builtins.str
+        value: _builtins.int
+        def __init__(
+            self,
+            *,
+            key: _builtins.str = ...,
+            value: _builtins.int = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["key", b"key", "value", b"value"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    ADDRTOAMOUNT_FIELD_NUMBER: _builtins.int
+    TARGET_CONF_FIELD_NUMBER: _builtins.int
+    SAT_PER_VBYTE_FIELD_NUMBER: _builtins.int
+    SAT_PER_BYTE_FIELD_NUMBER: _builtins.int
+    LABEL_FIELD_NUMBER: _builtins.int
+    MIN_CONFS_FIELD_NUMBER: _builtins.int
+    SPEND_UNCONFIRMED_FIELD_NUMBER: _builtins.int
+    target_conf: _builtins.int
+    """The target number of blocks that this transaction should be confirmed
+    by.
+    """
+    sat_per_vbyte: _builtins.int
+    """A manual fee rate set in sat/vbyte that should be used when crafting the
+    transaction.
+    """
+    @_builtins.property
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def sat_per_byte(self) -> _builtins.int:
+        """Deprecated, use sat_per_vbyte.
+        A manual fee rate set in sat/vbyte that should be used when crafting the
+        transaction.
+        """
+
+    @sat_per_byte.setter
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def sat_per_byte(self, value: _builtins.int) -> None:
+        """Deprecated, use sat_per_vbyte.
+        A manual fee rate set in sat/vbyte that should be used when crafting the
+        transaction.
+        """
+
+    label: _builtins.str
+    """An optional label for the transaction, limited to 500 characters."""
+    min_confs: _builtins.int
+    """The minimum number of confirmations each one of your outputs used for
+    the transaction must satisfy.
+    """
+    spend_unconfirmed: _builtins.bool
+    """Whether unconfirmed outputs should be used as inputs for the transaction."""
+    @_builtins.property
+    def AddrToAmount(self) -> _containers.ScalarMap[_builtins.str, _builtins.int]:
+        """The map from addresses to amounts"""
+
+    def __init__(
+        self,
+        *,
+        AddrToAmount: _abc.Mapping[_builtins.str, _builtins.int] | None = ...,
+        target_conf: _builtins.int = ...,
+        sat_per_vbyte: _builtins.int = ...,
+        sat_per_byte: _builtins.int = ...,
+        label: _builtins.str = ...,
+        min_confs: _builtins.int = ...,
+        spend_unconfirmed: _builtins.bool = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["AddrToAmount", b"AddrToAmount", "label", b"label", "min_confs", b"min_confs", "sat_per_byte", b"sat_per_byte", "sat_per_vbyte", b"sat_per_vbyte", "spend_unconfirmed", b"spend_unconfirmed", "target_conf", b"target_conf"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SendManyRequest: _TypeAlias = SendManyRequest  # noqa: Y015
+
+@_typing.final
+class SendManyResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    TXID_FIELD_NUMBER: _builtins.int
+    txid: _builtins.str
+    """The id of the transaction"""
+    def __init__(
+        self,
+        *,
+        txid: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["txid", b"txid"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SendManyResponse: _TypeAlias = SendManyResponse  # noqa: Y015
+
+@_typing.final
+class SendCoinsRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ADDR_FIELD_NUMBER: _builtins.int
+    AMOUNT_FIELD_NUMBER: _builtins.int
+    TARGET_CONF_FIELD_NUMBER: _builtins.int
+    SAT_PER_VBYTE_FIELD_NUMBER: _builtins.int
+    SAT_PER_BYTE_FIELD_NUMBER: _builtins.int
+    SEND_ALL_FIELD_NUMBER: _builtins.int
+    LABEL_FIELD_NUMBER: _builtins.int
+    MIN_CONFS_FIELD_NUMBER: _builtins.int
+    SPEND_UNCONFIRMED_FIELD_NUMBER: _builtins.int
+    addr: _builtins.str
+    """The address to send coins to"""
+    amount: _builtins.int
+    """The amount in satoshis to send"""
+    target_conf: _builtins.int
+    """The target number of blocks that this transaction should be confirmed
+    by.
+    """
+    sat_per_vbyte: _builtins.int
+    """A manual fee rate set in sat/vbyte that should be used when crafting the
+    transaction.
+    """
+    @_builtins.property
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def sat_per_byte(self) -> _builtins.int:
+        """Deprecated, use sat_per_vbyte.
+        A manual fee rate set in sat/vbyte that should be used when crafting the
+        transaction.
+        """
+
+    @sat_per_byte.setter
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def sat_per_byte(self, value: _builtins.int) -> None:
+        """Deprecated, use sat_per_vbyte.
+        A manual fee rate set in sat/vbyte that should be used when crafting the
+        transaction.
+        """
+
+    send_all: _builtins.bool
+    """
+    If set, then the amount field will be ignored, and lnd will attempt to
+    send all the coins under control of the internal wallet to the specified
+    address.
+    """
+    label: _builtins.str
+    """An optional label for the transaction, limited to 500 characters."""
+    min_confs: _builtins.int
+    """The minimum number of confirmations each one of your outputs used for
+    the transaction must satisfy.
+    """
+    spend_unconfirmed: _builtins.bool
+    """Whether unconfirmed outputs should be used as inputs for the transaction."""
+    def __init__(
+        self,
+        *,
+        addr: _builtins.str = ...,
+        amount: _builtins.int = ...,
+        target_conf: _builtins.int = ...,
+        sat_per_vbyte: _builtins.int = ...,
+        sat_per_byte: _builtins.int = ...,
+        send_all: _builtins.bool = ...,
+        label: _builtins.str = ...,
+        min_confs: _builtins.int = ...,
+        spend_unconfirmed: _builtins.bool = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["addr", b"addr", "amount", b"amount", "label", b"label", "min_confs", b"min_confs", "sat_per_byte", b"sat_per_byte", "sat_per_vbyte", b"sat_per_vbyte", "send_all", b"send_all", "spend_unconfirmed", b"spend_unconfirmed", "target_conf", b"target_conf"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SendCoinsRequest: _TypeAlias = SendCoinsRequest  # noqa: Y015
+
+@_typing.final
+class SendCoinsResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    TXID_FIELD_NUMBER: _builtins.int
+    txid: _builtins.str
+    """The transaction ID of the transaction"""
+    def __init__(
+        self,
+        *,
+        txid: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["txid", b"txid"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SendCoinsResponse: _TypeAlias = SendCoinsResponse  # noqa: Y015
+
+@_typing.final
+class ListUnspentRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    MIN_CONFS_FIELD_NUMBER: _builtins.int
+    MAX_CONFS_FIELD_NUMBER: _builtins.int
+    ACCOUNT_FIELD_NUMBER: _builtins.int
+    min_confs: _builtins.int
+    """The minimum number of confirmations to be included."""
+    max_confs: _builtins.int
+    """The maximum number of confirmations to be included."""
+    account: _builtins.str
+    """An optional filter to only include outputs belonging to an account."""
+    def __init__(
+        self,
+        *,
+        min_confs: _builtins.int = ...,
+        max_confs: _builtins.int = ...,
+        account: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["account", b"account", "max_confs", b"max_confs", "min_confs", b"min_confs"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ListUnspentRequest: _TypeAlias = ListUnspentRequest  # noqa: Y015
+
+@_typing.final
+class ListUnspentResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    UTXOS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def utxos(self) -> _containers.RepeatedCompositeFieldContainer[Global___Utxo]:
+        """A list of utxos"""
+
+    def __init__(
+        self,
+        *,
+        utxos: _abc.Iterable[Global___Utxo] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["utxos", b"utxos"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ListUnspentResponse: _TypeAlias = ListUnspentResponse  # noqa: Y015
+
+@_typing.final
+class NewAddressRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    TYPE_FIELD_NUMBER: _builtins.int
+    ACCOUNT_FIELD_NUMBER: _builtins.int
+    type: Global___AddressType.ValueType
+    """The type of address to generate."""
+    account: _builtins.str
+    """
+    The name of the account to generate a new address for. If empty, the
+    default wallet account is used.
+    """
+    def __init__(
+        self,
+        *,
+        type: Global___AddressType.ValueType = ...,
+        account: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["account", b"account", "type", b"type"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___NewAddressRequest: _TypeAlias = NewAddressRequest  # noqa: Y015
+
+@_typing.final
+class NewAddressResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ADDRESS_FIELD_NUMBER: _builtins.int
+    address: _builtins.str
+    """The newly generated wallet address"""
+    def __init__(
+        self,
+        *,
+        address: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["address", b"address"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___NewAddressResponse: _TypeAlias = NewAddressResponse  # noqa: Y015
+
+@_typing.final
+class SignMessageRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    MSG_FIELD_NUMBER: _builtins.int
+    SINGLE_HASH_FIELD_NUMBER: _builtins.int
+    msg: _builtins.bytes
+    """
+    The message to be signed. When using REST, this field must be encoded as
+    base64.
+    """
+    single_hash: _builtins.bool
+    """
+    Instead of the default double-SHA256 hashing of the message before signing,
+    only use one round of hashing instead.
+    """
+    def __init__(
+        self,
+        *,
+        msg: _builtins.bytes = ...,
+        single_hash: _builtins.bool = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["msg", b"msg", "single_hash", b"single_hash"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SignMessageRequest: _TypeAlias = SignMessageRequest  # noqa: Y015
+
+@_typing.final
+class SignMessageResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SIGNATURE_FIELD_NUMBER: _builtins.int
+    signature: _builtins.str
+    """The signature for the given message"""
+    def __init__(
+        self,
+        *,
+        signature: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["signature", b"signature"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SignMessageResponse: _TypeAlias = SignMessageResponse  # noqa: Y015
+
+@_typing.final
+class VerifyMessageRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    MSG_FIELD_NUMBER: _builtins.int
+    SIGNATURE_FIELD_NUMBER: _builtins.int
+    msg: _builtins.bytes
+    """
+    The message over which the signature is to be verified. When using REST,
+    this field must be encoded as base64.
+    """
+    signature: _builtins.str
+    """The signature to be verified over the given message"""
+    def __init__(
+        self,
+        *,
+        msg: _builtins.bytes = ...,
+        signature: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["msg", b"msg", "signature", b"signature"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___VerifyMessageRequest: _TypeAlias = VerifyMessageRequest  # noqa: Y015
+
+@_typing.final
+class VerifyMessageResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    VALID_FIELD_NUMBER: _builtins.int
+    PUBKEY_FIELD_NUMBER: _builtins.int
+    valid: _builtins.bool
+    """Whether the signature was valid over the given message"""
+    pubkey: _builtins.str
+    """The pubkey recovered from the signature"""
+    def __init__(
+        self,
+        *,
+        valid: _builtins.bool = ...,
+        pubkey: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["pubkey", b"pubkey", "valid", b"valid"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___VerifyMessageResponse: _TypeAlias = VerifyMessageResponse  # noqa: Y015
+
+@_typing.final
+class ConnectPeerRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ADDR_FIELD_NUMBER: _builtins.int
+    PERM_FIELD_NUMBER: _builtins.int
+    TIMEOUT_FIELD_NUMBER: _builtins.int
+    perm: _builtins.bool
+    """If set, the daemon will attempt to persistently connect to the target
+    peer. Otherwise, the call will be synchronous.
+    """
+    timeout: _builtins.int
+    """
+    The connection timeout value (in seconds) for this request. It won't affect
+    other requests.
+    """
+    @_builtins.property
+    def addr(self) -> Global___LightningAddress:
+        """Lightning address of the peer, in the format `<pubkey>@host`"""
+
+    def __init__(
+        self,
+        *,
+        addr: Global___LightningAddress | None = ...,
+        perm: _builtins.bool = ...,
+        timeout: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["addr", b"addr"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["addr", b"addr", "perm", b"perm", "timeout", b"timeout"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ConnectPeerRequest: _TypeAlias = ConnectPeerRequest  # noqa: Y015
+
+@_typing.final
+class ConnectPeerResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ConnectPeerResponse: _TypeAlias = ConnectPeerResponse  # noqa: Y015
+
+@_typing.final
+class DisconnectPeerRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PUB_KEY_FIELD_NUMBER: _builtins.int
+    pub_key: _builtins.str
+    """The pubkey of the node to disconnect from"""
+    def __init__(
+        self,
+        *,
+        pub_key: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["pub_key", b"pub_key"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DisconnectPeerRequest: _TypeAlias = DisconnectPeerRequest  # noqa: Y015
+
+@_typing.final
+class DisconnectPeerResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DisconnectPeerResponse: _TypeAlias = DisconnectPeerResponse  # noqa: Y015
+
+@_typing.final
+class HTLC(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    INCOMING_FIELD_NUMBER: _builtins.int
+    AMOUNT_FIELD_NUMBER: _builtins.int
+    HASH_LOCK_FIELD_NUMBER: _builtins.int
+    EXPIRATION_HEIGHT_FIELD_NUMBER: _builtins.int
+    HTLC_INDEX_FIELD_NUMBER: _builtins.int
+    FORWARDING_CHANNEL_FIELD_NUMBER: _builtins.int
+    FORWARDING_HTLC_INDEX_FIELD_NUMBER: _builtins.int
+    incoming: _builtins.bool
+    amount: _builtins.int
+    hash_lock: _builtins.bytes
+    expiration_height: _builtins.int
+    htlc_index: _builtins.int
+    """Index identifying the htlc on the channel."""
+    forwarding_channel: _builtins.int
+    """If this HTLC is involved in a forwarding operation, this field indicates
+    the forwarding channel. For an outgoing htlc, it is the incoming channel.
+    For an incoming htlc, it is the outgoing channel. When the htlc
+    originates from this node or this node is the final destination,
+    forwarding_channel will be zero. The forwarding channel will also be zero
+    for htlcs that need to be forwarded but don't have a forwarding decision
+    persisted yet.
+    """
+    forwarding_htlc_index: _builtins.int
+    """Index identifying the htlc on the forwarding channel."""
+    def __init__(
+        self,
+        *,
+        incoming: _builtins.bool = ...,
+        amount: _builtins.int = ...,
+        hash_lock: _builtins.bytes = ...,
+        expiration_height: _builtins.int = ...,
+        htlc_index: _builtins.int = ...,
+        forwarding_channel: _builtins.int = ...,
+        forwarding_htlc_index: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["amount", b"amount", "expiration_height", b"expiration_height", "forwarding_channel", b"forwarding_channel", "forwarding_htlc_index", b"forwarding_htlc_index", "hash_lock", b"hash_lock", "htlc_index", b"htlc_index", "incoming", b"incoming"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___HTLC: _TypeAlias = HTLC  # noqa: Y015
+
+@_typing.final
+class ChannelConstraints(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    CSV_DELAY_FIELD_NUMBER: _builtins.int
+    CHAN_RESERVE_SAT_FIELD_NUMBER: _builtins.int
+    DUST_LIMIT_SAT_FIELD_NUMBER: _builtins.int
+    MAX_PENDING_AMT_MSAT_FIELD_NUMBER: _builtins.int
+    MIN_HTLC_MSAT_FIELD_NUMBER: _builtins.int
+    MAX_ACCEPTED_HTLCS_FIELD_NUMBER: _builtins.int
+    csv_delay: _builtins.int
+    """
+    The CSV delay expressed in relative blocks. If the channel is force closed,
+    we will need to wait for this many blocks before we can regain our funds.
+    """
+    chan_reserve_sat: _builtins.int
+    """The minimum satoshis this node is required to reserve in its balance."""
+    dust_limit_sat: _builtins.int
+    """The dust limit (in satoshis) of the initiator's commitment tx."""
+    max_pending_amt_msat: _builtins.int
+    """The maximum amount of coins in millisatoshis that can be pending in this
+    channel.
+    """
+    min_htlc_msat: _builtins.int
+    """The smallest HTLC in millisatoshis that the initiator will accept."""
+    max_accepted_htlcs: _builtins.int
+    """The total number of incoming HTLC's that the initiator will accept."""
+    def __init__(
+        self,
+        *,
+        csv_delay: _builtins.int = ...,
+        chan_reserve_sat: _builtins.int = ...,
+        dust_limit_sat: _builtins.int = ...,
+        max_pending_amt_msat: _builtins.int = ...,
+        min_htlc_msat: _builtins.int = ...,
+        max_accepted_htlcs: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["chan_reserve_sat", b"chan_reserve_sat", "csv_delay", b"csv_delay", "dust_limit_sat", b"dust_limit_sat", "max_accepted_htlcs", b"max_accepted_htlcs", "max_pending_amt_msat", b"max_pending_amt_msat", "min_htlc_msat", b"min_htlc_msat"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ChannelConstraints: _TypeAlias = ChannelConstraints  # noqa: Y015
+
+@_typing.final
+class Channel(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ACTIVE_FIELD_NUMBER: _builtins.int
+    REMOTE_PUBKEY_FIELD_NUMBER: _builtins.int
+    CHANNEL_POINT_FIELD_NUMBER: _builtins.int
+    CHAN_ID_FIELD_NUMBER: _builtins.int
+    CAPACITY_FIELD_NUMBER: _builtins.int
+    LOCAL_BALANCE_FIELD_NUMBER: _builtins.int
+    REMOTE_BALANCE_FIELD_NUMBER: _builtins.int
+    COMMIT_FEE_FIELD_NUMBER: _builtins.int
+    COMMIT_WEIGHT_FIELD_NUMBER: _builtins.int
+    FEE_PER_KW_FIELD_NUMBER: _builtins.int
+    UNSETTLED_BALANCE_FIELD_NUMBER: _builtins.int
+    TOTAL_SATOSHIS_SENT_FIELD_NUMBER: _builtins.int
+    TOTAL_SATOSHIS_RECEIVED_FIELD_NUMBER: _builtins.int
+    NUM_UPDATES_FIELD_NUMBER: _builtins.int
+    PENDING_HTLCS_FIELD_NUMBER: _builtins.int
+    CSV_DELAY_FIELD_NUMBER: _builtins.int
+    PRIVATE_FIELD_NUMBER: _builtins.int
+    INITIATOR_FIELD_NUMBER: _builtins.int
+    CHAN_STATUS_FLAGS_FIELD_NUMBER: _builtins.int
+    LOCAL_CHAN_RESERVE_SAT_FIELD_NUMBER: _builtins.int
+    REMOTE_CHAN_RESERVE_SAT_FIELD_NUMBER: _builtins.int
+    STATIC_REMOTE_KEY_FIELD_NUMBER: _builtins.int
+    COMMITMENT_TYPE_FIELD_NUMBER: _builtins.int
+    LIFETIME_FIELD_NUMBER: _builtins.int
+    UPTIME_FIELD_NUMBER: _builtins.int
+    CLOSE_ADDRESS_FIELD_NUMBER: _builtins.int
+    PUSH_AMOUNT_SAT_FIELD_NUMBER: _builtins.int
+    THAW_HEIGHT_FIELD_NUMBER: _builtins.int
+    LOCAL_CONSTRAINTS_FIELD_NUMBER: _builtins.int
+    REMOTE_CONSTRAINTS_FIELD_NUMBER: _builtins.int
+    active: _builtins.bool
+    """Whether this channel is active or not"""
+    remote_pubkey: _builtins.str
+    """The identity pubkey of the remote node"""
+    channel_point: _builtins.str
+    """
+    The outpoint (txid:index) of the funding transaction. With this value, Bob
+    will be able to generate a signature for Alice's version of the commitment
+    transaction.
+    """
+    chan_id: _builtins.int
+    """
+    The unique channel ID for the channel. The first 3 bytes are the block
+    height, the next 3 the index within the block, and the last 2 bytes are the
+    output index for the channel.
+    """
+    capacity: _builtins.int
+    """The total amount of funds held in this channel"""
+    local_balance: _builtins.int
+    """This node's current balance in this channel"""
+    remote_balance: _builtins.int
+    """The counterparty's current balance in this channel"""
+    commit_fee: _builtins.int
+    """
+    The amount calculated to be paid in fees for the current set of commitment
+    transactions. The fee amount is persisted with the channel in order to
+    allow the fee amount to be removed and recalculated with each channel state
+    update, including updates that happen after a system restart.
+    """
+    commit_weight: _builtins.int
+    """The weight of the commitment transaction"""
+    fee_per_kw: _builtins.int
+    """
+    The required number of satoshis per kilo-weight that the requester will pay
+    at all times, for both the funding transaction and commitment transaction.
+    This value can later be updated once the channel is open.
+    """
+    unsettled_balance: _builtins.int
+    """The unsettled balance in this channel"""
+    total_satoshis_sent: _builtins.int
+    """
+    The total number of satoshis we've sent within this channel.
+    """
+    total_satoshis_received: _builtins.int
+    """
+    The total number of satoshis we've received within this channel.
+    """
+    num_updates: _builtins.int
+    """
+    The total number of updates conducted within this channel.
+    """
+    @_builtins.property
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def csv_delay(self) -> _builtins.int:
+        """
+        Deprecated. The CSV delay expressed in relative blocks. If the channel is
+        force closed, we will need to wait for this many blocks before we can regain
+        our funds.
+        """
+
+    @csv_delay.setter
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def csv_delay(self, value: _builtins.int) -> None:
+        """
+        Deprecated. The CSV delay expressed in relative blocks. If the channel is
+        force closed, we will need to wait for this many blocks before we can regain
+        our funds.
+        """
+
+    private: _builtins.bool
+    """Whether this channel is advertised to the network or not."""
+    initiator: _builtins.bool
+    """True if we were the ones that created the channel."""
+    chan_status_flags: _builtins.str
+    """A set of flags showing the current state of the channel."""
+    @_builtins.property
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def local_chan_reserve_sat(self) -> _builtins.int:
+        """Deprecated. The minimum satoshis this node is required to reserve in its
+        balance.
+        """
+
+    @local_chan_reserve_sat.setter
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def local_chan_reserve_sat(self, value: _builtins.int) -> None:
+        """Deprecated. The minimum satoshis this node is required to reserve in its
+        balance.
+        """
+
+    @_builtins.property
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def remote_chan_reserve_sat(self) -> _builtins.int:
+        """
+        Deprecated. The minimum satoshis the other node is required to reserve in
+        its balance.
+        """
+
+    @remote_chan_reserve_sat.setter
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def remote_chan_reserve_sat(self, value: _builtins.int) -> None:
+        """
+        Deprecated. The minimum satoshis the other node is required to reserve in
+        its balance.
+        """
+
+    @_builtins.property
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def static_remote_key(self) -> _builtins.bool:
+        """Deprecated. Use commitment_type."""
+
+    @static_remote_key.setter
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def static_remote_key(self, value: _builtins.bool) -> None:
+        """Deprecated. Use commitment_type."""
+
+    commitment_type: Global___CommitmentType.ValueType
+    """The commitment type used by this channel."""
+    lifetime: _builtins.int
+    """
+    The number of seconds that the channel has been monitored by the channel
+    scoring system. Scores are currently not persisted, so this value may be
+    less than the lifetime of the channel [EXPERIMENTAL].
+    """
+    uptime: _builtins.int
+    """
+    The number of seconds that the remote peer has been observed as being online
+    by the channel scoring system over the lifetime of the channel
+    [EXPERIMENTAL].
+    """
+    close_address: _builtins.str
+    """
+    Close address is the address that we will enforce payout to on cooperative
+    close if the channel was opened utilizing option upfront shutdown. This
+    value can be set on channel open by setting close_address in an open channel
+    request. If this value is not set, you can still choose a payout address by
+    cooperatively closing with the delivery_address field set.
+    """
+    push_amount_sat: _builtins.int
+    """
+    The amount that the initiator of the channel optionally pushed to the remote
+    party on channel open. This amount will be zero if the channel initiator did
+    not push any funds to the remote peer. If the initiator field is true, we
+    pushed this amount to our peer, if it is false, the remote peer pushed this
+    amount to us.
+    """
+    thaw_height: _builtins.int
+    """
+    This uint32 indicates if this channel is to be considered 'frozen'. A
+    frozen channel doest not allow a cooperative channel close by the
+    initiator. The thaw_height is the height that this restriction stops
+    applying to the channel. This field is optional, not setting it or using a
+    value of zero will mean the channel has no additional restrictions. The
+    height can be interpreted in two ways: as a relative height if the value is
+    less than 500,000, or as an absolute height otherwise.
+    """
+    @_builtins.property
+    def pending_htlcs(self) -> _containers.RepeatedCompositeFieldContainer[Global___HTLC]:
+        """
+        The list of active, uncleared HTLCs currently pending within the channel.
+        """
+
+    @_builtins.property
+    def local_constraints(self) -> Global___ChannelConstraints:
+        """List constraints for the local node."""
+
+    @_builtins.property
+    def remote_constraints(self) -> Global___ChannelConstraints:
+        """List constraints for the remote node."""
+
+    def __init__(
+        self,
+        *,
+        active: _builtins.bool = ...,
+        remote_pubkey: _builtins.str = ...,
+        channel_point: _builtins.str = ...,
+        chan_id: _builtins.int = ...,
+        capacity: _builtins.int = ...,
+        local_balance: _builtins.int = ...,
+        remote_balance: _builtins.int = ...,
+        commit_fee: _builtins.int = ...,
+        commit_weight: _builtins.int = ...,
+        fee_per_kw: _builtins.int = ...,
+        unsettled_balance: _builtins.int = ...,
+        total_satoshis_sent: _builtins.int = ...,
+        total_satoshis_received: _builtins.int = ...,
+        num_updates: _builtins.int = ...,
+        pending_htlcs: _abc.Iterable[Global___HTLC] | None = ...,
+        csv_delay: _builtins.int = ...,
+        private: _builtins.bool = ...,
+        initiator: _builtins.bool = ...,
+        chan_status_flags: _builtins.str = ...,
+        local_chan_reserve_sat: _builtins.int = ...,
+        remote_chan_reserve_sat: _builtins.int = ...,
+        static_remote_key: _builtins.bool = ...,
+        commitment_type: Global___CommitmentType.ValueType = ...,
+        lifetime: _builtins.int = ...,
+        uptime: _builtins.int = ...,
+        close_address: _builtins.str = ...,
+        push_amount_sat: _builtins.int = ...,
+        thaw_height: _builtins.int = ...,
+        local_constraints: Global___ChannelConstraints | None = ...,
+        remote_constraints: Global___ChannelConstraints | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["local_constraints", b"local_constraints", "remote_constraints", b"remote_constraints"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["active", b"active", "capacity", b"capacity", "chan_id", b"chan_id", "chan_status_flags", b"chan_status_flags", "channel_point", b"channel_point", "close_address", b"close_address", "commit_fee", b"commit_fee", "commit_weight", b"commit_weight", "commitment_type", b"commitment_type", "csv_delay", b"csv_delay", "fee_per_kw", b"fee_per_kw", "initiator", b"initiator", "lifetime", b"lifetime", "local_balance", b"local_balance", "local_chan_reserve_sat", b"local_chan_reserve_sat", "local_constraints", b"local_constraints", "num_updates", b"num_updates", "pending_htlcs", b"pending_htlcs", "private", b"private", "push_amount_sat", b"push_amount_sat", "remote_balance", b"remote_balance", "remote_chan_reserve_sat", b"remote_chan_reserve_sat", "remote_constraints", b"remote_constraints", "remote_pubkey", b"remote_pubkey", "static_remote_key", b"static_remote_key", "thaw_height", b"thaw_height", "total_satoshis_received", b"total_satoshis_received", "total_satoshis_sent", b"total_satoshis_sent", "unsettled_balance", b"unsettled_balance", "uptime", b"uptime"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___Channel: _TypeAlias = Channel  # noqa: Y015
+
+@_typing.final
+class ListChannelsRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ACTIVE_ONLY_FIELD_NUMBER: _builtins.int
+    INACTIVE_ONLY_FIELD_NUMBER: _builtins.int
+    PUBLIC_ONLY_FIELD_NUMBER: _builtins.int
+    PRIVATE_ONLY_FIELD_NUMBER: _builtins.int
+    PEER_FIELD_NUMBER: _builtins.int
+    active_only: _builtins.bool
+    inactive_only: _builtins.bool
+    public_only: _builtins.bool
+    private_only: _builtins.bool
+    peer: _builtins.bytes
+    """
+    Filters the response for channels with a target peer's pubkey. If peer is
+    empty, all channels will be returned.
+    """
+    def __init__(
+        self,
+        *,
+        active_only: _builtins.bool = ...,
+        inactive_only: _builtins.bool = ...,
+        public_only: _builtins.bool = ...,
+        private_only: _builtins.bool = ...,
+        peer: _builtins.bytes = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["active_only", b"active_only", "inactive_only", b"inactive_only", "peer", b"peer", "private_only", b"private_only", "public_only", b"public_only"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ListChannelsRequest: _TypeAlias = ListChannelsRequest  # noqa: Y015
+
+@_typing.final
+class ListChannelsResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    CHANNELS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def channels(self) -> _containers.RepeatedCompositeFieldContainer[Global___Channel]:
+        """The list of active channels"""
+
+    def __init__(
+        self,
+        *,
+        channels: _abc.Iterable[Global___Channel] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["channels", b"channels"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ListChannelsResponse: _TypeAlias = ListChannelsResponse  # noqa: Y015
+
+@_typing.final
+class ChannelCloseSummary(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    class _ClosureType:
+        ValueType = _typing.NewType("ValueType", _builtins.int)
+        V: _TypeAlias = ValueType  # noqa: Y015
+
+    class _ClosureTypeEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[ChannelCloseSummary._ClosureType.ValueType], _builtins.type):
+        DESCRIPTOR: _descriptor.EnumDescriptor
+        COOPERATIVE_CLOSE: ChannelCloseSummary._ClosureType.ValueType  # 0
+        LOCAL_FORCE_CLOSE: ChannelCloseSummary._ClosureType.ValueType  # 1
+        REMOTE_FORCE_CLOSE: ChannelCloseSummary._ClosureType.ValueType  # 2
+        BREACH_CLOSE: ChannelCloseSummary._ClosureType.ValueType  # 3
+        FUNDING_CANCELED: ChannelCloseSummary._ClosureType.ValueType  # 4
+        ABANDONED: ChannelCloseSummary._ClosureType.ValueType  # 5
+
+    class ClosureType(_ClosureType, metaclass=_ClosureTypeEnumTypeWrapper): ...
+    COOPERATIVE_CLOSE: ChannelCloseSummary.ClosureType.ValueType  # 0
+    LOCAL_FORCE_CLOSE: ChannelCloseSummary.ClosureType.ValueType  # 1
+    REMOTE_FORCE_CLOSE: ChannelCloseSummary.ClosureType.ValueType  # 2
+    BREACH_CLOSE: ChannelCloseSummary.ClosureType.ValueType  # 3
+    FUNDING_CANCELED: ChannelCloseSummary.ClosureType.ValueType  # 4
+    ABANDONED: ChannelCloseSummary.ClosureType.ValueType  # 5
+
+    CHANNEL_POINT_FIELD_NUMBER: _builtins.int
+    CHAN_ID_FIELD_NUMBER: _builtins.int
+    CHAIN_HASH_FIELD_NUMBER: _builtins.int
+    CLOSING_TX_HASH_FIELD_NUMBER: _builtins.int
+    REMOTE_PUBKEY_FIELD_NUMBER: _builtins.int
+    CAPACITY_FIELD_NUMBER: _builtins.int
+    CLOSE_HEIGHT_FIELD_NUMBER: _builtins.int
+    SETTLED_BALANCE_FIELD_NUMBER: _builtins.int
+    TIME_LOCKED_BALANCE_FIELD_NUMBER: _builtins.int
+    CLOSE_TYPE_FIELD_NUMBER: _builtins.int
+    OPEN_INITIATOR_FIELD_NUMBER: _builtins.int
+    CLOSE_INITIATOR_FIELD_NUMBER: _builtins.int
+    RESOLUTIONS_FIELD_NUMBER: _builtins.int
+    channel_point: _builtins.str
+    """The outpoint (txid:index) of the funding transaction."""
+    chan_id: _builtins.int
+    """ The unique channel ID for the channel."""
+    chain_hash: _builtins.str
+    """The hash of the genesis block that this channel resides within."""
+    closing_tx_hash: _builtins.str
+    """The txid of the transaction which ultimately closed this channel."""
+    remote_pubkey: _builtins.str
+    """Public key of the remote peer that we formerly had a channel with."""
+    capacity: _builtins.int
+    """Total capacity of the channel."""
+    close_height: _builtins.int
+    """Height at which the funding transaction was spent."""
+    settled_balance: _builtins.int
+    """Settled balance at the time of channel closure"""
+    time_locked_balance: _builtins.int
+    """The sum of all the time-locked outputs at the time of channel closure"""
+    close_type: Global___ChannelCloseSummary.ClosureType.ValueType
+    """Details on how the channel was closed."""
+    open_initiator: Global___Initiator.ValueType
+    """
+    Open initiator is the party that initiated opening the channel. Note that
+    this value may be unknown if the channel was closed before we migrated to
+    store open channel information after close.
+    """
+    close_initiator: Global___Initiator.ValueType
+    """
+    Close initiator indicates which party initiated the close. This value will
+    be unknown for channels that were cooperatively closed before we started
+    tracking cooperative close initiators. Note that this indicates which party
+    initiated a close, and it is possible for both to initiate cooperative or
+    force closes, although only one party's close will be confirmed on chain.
+    """
+    @_builtins.property
+    def resolutions(self) -> _containers.RepeatedCompositeFieldContainer[Global___Resolution]: ...
+    def __init__(
+        self,
+        *,
+        channel_point: _builtins.str = ...,
+        chan_id: _builtins.int = ...,
+        chain_hash: _builtins.str = ...,
+        closing_tx_hash: _builtins.str = ...,
+        remote_pubkey: _builtins.str = ...,
+        capacity: _builtins.int = ...,
+        close_height: _builtins.int = ...,
+        settled_balance: _builtins.int = ...,
+        time_locked_balance: _builtins.int = ...,
+        close_type: Global___ChannelCloseSummary.ClosureType.ValueType = ...,
+        open_initiator: Global___Initiator.ValueType = ...,
+        close_initiator: Global___Initiator.ValueType = ...,
+        resolutions: _abc.Iterable[Global___Resolution] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["capacity", b"capacity", "chain_hash", b"chain_hash", "chan_id", b"chan_id", "channel_point", b"channel_point", "close_height", b"close_height", "close_initiator", b"close_initiator", "close_type", b"close_type", "closing_tx_hash", b"closing_tx_hash", "open_initiator", b"open_initiator", "remote_pubkey", b"remote_pubkey", "resolutions", b"resolutions", "settled_balance", b"settled_balance", "time_locked_balance", b"time_locked_balance"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ChannelCloseSummary: _TypeAlias = ChannelCloseSummary  # noqa: Y015
+
+@_typing.final
+class Resolution(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    RESOLUTION_TYPE_FIELD_NUMBER: _builtins.int
+    OUTCOME_FIELD_NUMBER: _builtins.int
+    OUTPOINT_FIELD_NUMBER: _builtins.int
+    AMOUNT_SAT_FIELD_NUMBER: _builtins.int
+    SWEEP_TXID_FIELD_NUMBER: _builtins.int
+    resolution_type: Global___ResolutionType.ValueType
+    """The type of output we are resolving."""
+    outcome: Global___ResolutionOutcome.ValueType
+    """The outcome of our on chain action that resolved the outpoint."""
+    amount_sat: _builtins.int
+    """The amount that was claimed by the resolution."""
+    sweep_txid: _builtins.str
+    """The hex-encoded transaction ID of the sweep transaction that spent the
+    output.
+    """
+    @_builtins.property
+    def outpoint(self) -> Global___OutPoint:
+        """The outpoint that was spent by the resolution."""
+
+    def __init__(
+        self,
+        *,
+        resolution_type: Global___ResolutionType.ValueType = ...,
+        outcome: Global___ResolutionOutcome.ValueType = ...,
+        outpoint: Global___OutPoint | None = ...,
+        amount_sat: _builtins.int = ...,
+        sweep_txid: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["outpoint", b"outpoint"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["amount_sat", b"amount_sat", "outcome", b"outcome", "outpoint", b"outpoint", "resolution_type", b"resolution_type", "sweep_txid", b"sweep_txid"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___Resolution: _TypeAlias = Resolution  # noqa: Y015
+
+@_typing.final
+class ClosedChannelsRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    COOPERATIVE_FIELD_NUMBER: _builtins.int
+    LOCAL_FORCE_FIELD_NUMBER: _builtins.int
+    REMOTE_FORCE_FIELD_NUMBER: _builtins.int
+    BREACH_FIELD_NUMBER: _builtins.int
+    FUNDING_CANCELED_FIELD_NUMBER: _builtins.int
+    ABANDONED_FIELD_NUMBER: _builtins.int
+    cooperative: _builtins.bool
+    local_force: _builtins.bool
+    remote_force: _builtins.bool
+    breach: _builtins.bool
+    funding_canceled: _builtins.bool
+    abandoned: _builtins.bool
+    def __init__(
+        self,
+        *,
+        cooperative: _builtins.bool = ...,
+        local_force: _builtins.bool = ...,
+        remote_force: _builtins.bool = ...,
+        breach: _builtins.bool = ...,
+        funding_canceled: _builtins.bool = ...,
+        abandoned: _builtins.bool = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["abandoned", b"abandoned", "breach", b"breach", "cooperative", b"cooperative", "funding_canceled", b"funding_canceled", "local_force", b"local_force", "remote_force", b"remote_force"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ClosedChannelsRequest: _TypeAlias = ClosedChannelsRequest  # noqa: Y015
+
+@_typing.final
+class ClosedChannelsResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    CHANNELS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def channels(self) -> _containers.RepeatedCompositeFieldContainer[Global___ChannelCloseSummary]: ...
+    def __init__(
+        self,
+        *,
+        channels: _abc.Iterable[Global___ChannelCloseSummary] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["channels", b"channels"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ClosedChannelsResponse: _TypeAlias = ClosedChannelsResponse  # noqa: Y015
+
+@_typing.final
+class Peer(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    class _SyncType:
+        ValueType = _typing.NewType("ValueType", _builtins.int)
+        V: _TypeAlias = ValueType  # noqa: Y015
+
+    class _SyncTypeEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[Peer._SyncType.ValueType], _builtins.type):
+        DESCRIPTOR: _descriptor.EnumDescriptor
+        UNKNOWN_SYNC: Peer._SyncType.ValueType  # 0
+        """
+        Denotes that we cannot determine the peer's current sync type.
+        """
+        ACTIVE_SYNC: Peer._SyncType.ValueType  # 1
+        """
+        Denotes that we are actively receiving new graph updates from the peer.
+        """
+        PASSIVE_SYNC: Peer._SyncType.ValueType  # 2
+        """
+        Denotes that we are not receiving new graph updates from the peer.
+        """
+        PINNED_SYNC: Peer._SyncType.ValueType  # 3
+        """
+        Denotes that this peer is pinned into an active sync.
+        """
+
+    class SyncType(_SyncType, metaclass=_SyncTypeEnumTypeWrapper): ...
+    UNKNOWN_SYNC: Peer.SyncType.ValueType  # 0
+    """
+    Denotes that we cannot determine the peer's current sync type.
+    """
+    ACTIVE_SYNC: Peer.SyncType.ValueType  # 1
+    """
+    Denotes that we are actively receiving new graph updates from the peer.
+    """
+    PASSIVE_SYNC: Peer.SyncType.ValueType  # 2
+    """
+    Denotes that we are not receiving new graph updates from the peer.
+    """
+    PINNED_SYNC: Peer.SyncType.ValueType  # 3
+    """
+    Denotes that this peer is pinned into an active sync.
+    """
+
+    @_typing.final
+    class FeaturesEntry(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: _builtins.int
+        VALUE_FIELD_NUMBER: _builtins.int
+        key: _builtins.int
+        @_builtins.property
+        def value(self) -> Global___Feature: ...
+        def __init__(
+            self,
+            *,
+            key: _builtins.int = ...,
+            value: Global___Feature | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _typing.Literal["value", b"value"]  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["key", b"key", "value", b"value"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    PUB_KEY_FIELD_NUMBER: _builtins.int
+    ADDRESS_FIELD_NUMBER: _builtins.int
+    BYTES_SENT_FIELD_NUMBER: _builtins.int
+    BYTES_RECV_FIELD_NUMBER: _builtins.int
+    SAT_SENT_FIELD_NUMBER: _builtins.int
+    SAT_RECV_FIELD_NUMBER: _builtins.int
+    INBOUND_FIELD_NUMBER: _builtins.int
+    PING_TIME_FIELD_NUMBER: _builtins.int
+    SYNC_TYPE_FIELD_NUMBER: _builtins.int
+    FEATURES_FIELD_NUMBER: _builtins.int
+    ERRORS_FIELD_NUMBER: _builtins.int
+    FLAP_COUNT_FIELD_NUMBER: _builtins.int
+    LAST_FLAP_NS_FIELD_NUMBER: _builtins.int
+    LAST_PING_PAYLOAD_FIELD_NUMBER: _builtins.int
+    pub_key: _builtins.str
+    """The identity pubkey of the peer"""
+    address: _builtins.str
+    """Network address of the peer; eg `127.0.0.1:10011`"""
+    bytes_sent: _builtins.int
+    """Bytes of data transmitted to this peer"""
+    bytes_recv: _builtins.int
+    """Bytes of data transmitted from this peer"""
+    sat_sent: _builtins.int
+    """Satoshis sent to this peer"""
+    sat_recv: _builtins.int
+    """Satoshis received from this peer"""
+    inbound: _builtins.bool
+    """A channel is inbound if the counterparty initiated the channel"""
+    ping_time: _builtins.int
+    """Ping time to this peer"""
+    sync_type: Global___Peer.SyncType.ValueType
+    """The type of sync we are currently performing with this peer."""
+    flap_count: _builtins.int
+    """
+    The number of times we have recorded this peer going offline or coming
+    online, recorded across restarts. Note that this value is decreased over
+    time if the peer has not recently flapped, so that we can forgive peers
+    with historically high flap counts.
+    """
+    last_flap_ns: _builtins.int
+    """
+    The timestamp of the last flap we observed for this peer. If this value is
+    zero, we have not observed any flaps for this peer.
+    """
+    last_ping_payload: _builtins.bytes
+    """
+    The last ping payload the peer has sent to us.
+    """
+    @_builtins.property
+    def features(self) -> _containers.MessageMap[_builtins.int, Global___Feature]:
+        """Features advertised by the remote peer in their init message."""
+
+    @_builtins.property
+    def errors(self) -> _containers.RepeatedCompositeFieldContainer[Global___TimestampedError]:
+        """
+        The latest errors received from our peer with timestamps, limited to the 10
+        most recent errors. These errors are tracked across peer connections, but
+        are not persisted across lnd restarts. Note that these errors are only
+        stored for peers that we have channels open with, to prevent peers from
+        spamming us with errors at no cost.
+        """
+
+    def __init__(
+        self,
+        *,
+        pub_key: _builtins.str = ...,
+        address: _builtins.str = ...,
+        bytes_sent: _builtins.int = ...,
+        bytes_recv: _builtins.int = ...,
+        sat_sent: _builtins.int = ...,
+        sat_recv: _builtins.int = ...,
+        inbound: _builtins.bool = ...,
+        ping_time: _builtins.int = ...,
+        sync_type: Global___Peer.SyncType.ValueType = ...,
+        features: _abc.Mapping[_builtins.int, Global___Feature] | None = ...,
+        errors: _abc.Iterable[Global___TimestampedError] | None = ...,
+        flap_count: _builtins.int = ...,
+        last_flap_ns: _builtins.int = ...,
+        last_ping_payload: _builtins.bytes = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["address", b"address", "bytes_recv", b"bytes_recv", "bytes_sent", b"bytes_sent", "errors", b"errors", "features", b"features", "flap_count", b"flap_count", "inbound", b"inbound", "last_flap_ns", b"last_flap_ns", "last_ping_payload", b"last_ping_payload", "ping_time", b"ping_time", "pub_key", b"pub_key", "sat_recv", b"sat_recv", "sat_sent", b"sat_sent", "sync_type", b"sync_type"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___Peer: _TypeAlias = Peer  # noqa: Y015
+
+@_typing.final
+class TimestampedError(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    TIMESTAMP_FIELD_NUMBER: _builtins.int
+    ERROR_FIELD_NUMBER: _builtins.int
+    timestamp: _builtins.int
+    """The unix timestamp in seconds when the error occurred."""
+    error: _builtins.str
+    """The string representation of the error sent by our peer."""
+    def __init__(
+        self,
+        *,
+        timestamp: _builtins.int = ...,
+        error: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["error", b"error", "timestamp", b"timestamp"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___TimestampedError: _TypeAlias = TimestampedError  # noqa: Y015
+
+@_typing.final
+class ListPeersRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    LATEST_ERROR_FIELD_NUMBER: _builtins.int
+    latest_error: _builtins.bool
+    """
+    If true, only the last error that our peer sent us will be returned with
+    the peer's information, rather than the full set of historic errors we have
+    stored.
+    """
+    def __init__(
+        self,
+        *,
+        latest_error: _builtins.bool = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["latest_error", b"latest_error"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ListPeersRequest: _TypeAlias = ListPeersRequest  # noqa: Y015
+
+@_typing.final
+class ListPeersResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PEERS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def peers(self) -> _containers.RepeatedCompositeFieldContainer[Global___Peer]:
+        """The list of currently connected peers"""
+
+    def __init__(
+        self,
+        *,
+        peers: _abc.Iterable[Global___Peer] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["peers", b"peers"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ListPeersResponse: _TypeAlias = ListPeersResponse  # noqa: Y015
+
+@_typing.final
+class PeerEventSubscription(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___PeerEventSubscription: _TypeAlias = PeerEventSubscription  # noqa: Y015
+
+@_typing.final
+class PeerEvent(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    class _EventType:
+        ValueType = _typing.NewType("ValueType", _builtins.int)
+        V: _TypeAlias = ValueType  # noqa: Y015
+
+    class _EventTypeEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[PeerEvent._EventType.ValueType], _builtins.type):
+        DESCRIPTOR: _descriptor.EnumDescriptor
+        PEER_ONLINE: PeerEvent._EventType.ValueType  # 0
+        PEER_OFFLINE: PeerEvent._EventType.ValueType  # 1
+
+    class EventType(_EventType, metaclass=_EventTypeEnumTypeWrapper): ...
+    PEER_ONLINE: PeerEvent.EventType.ValueType  # 0
+    PEER_OFFLINE: PeerEvent.EventType.ValueType  # 1
+
+    PUB_KEY_FIELD_NUMBER: _builtins.int
+    TYPE_FIELD_NUMBER: _builtins.int
+    pub_key: _builtins.str
+    """The identity pubkey of the peer."""
+    type: Global___PeerEvent.EventType.ValueType
+    def __init__(
+        self,
+        *,
+        pub_key: _builtins.str = ...,
+        type: Global___PeerEvent.EventType.ValueType = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["pub_key", b"pub_key", "type", b"type"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___PeerEvent: _TypeAlias = PeerEvent  # noqa: Y015
+
+@_typing.final
+class GetInfoRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetInfoRequest: _TypeAlias = GetInfoRequest  # noqa: Y015
+
+@_typing.final
+class GetInfoResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class FeaturesEntry(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: _builtins.int
+        VALUE_FIELD_NUMBER: _builtins.int
+        key: _builtins.int
+        @_builtins.property
+        def value(self) -> Global___Feature: ...
+        def __init__(
+            self,
+            *,
+            key: _builtins.int = ...,
+            value: Global___Feature | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _typing.Literal["value", b"value"]  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["key", b"key", "value", b"value"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    VERSION_FIELD_NUMBER: _builtins.int
+    COMMIT_HASH_FIELD_NUMBER: _builtins.int
+    IDENTITY_PUBKEY_FIELD_NUMBER: _builtins.int
+    ALIAS_FIELD_NUMBER: _builtins.int
+    COLOR_FIELD_NUMBER: _builtins.int
+    NUM_PENDING_CHANNELS_FIELD_NUMBER: _builtins.int
+    NUM_ACTIVE_CHANNELS_FIELD_NUMBER: _builtins.int
+    NUM_INACTIVE_CHANNELS_FIELD_NUMBER: _builtins.int
+    NUM_PEERS_FIELD_NUMBER: _builtins.int
+    BLOCK_HEIGHT_FIELD_NUMBER: _builtins.int
+    BLOCK_HASH_FIELD_NUMBER: _builtins.int
+    BEST_HEADER_TIMESTAMP_FIELD_NUMBER: _builtins.int
+    SYNCED_TO_CHAIN_FIELD_NUMBER: _builtins.int
+    SYNCED_TO_GRAPH_FIELD_NUMBER: _builtins.int
+    TESTNET_FIELD_NUMBER: _builtins.int
+    CHAINS_FIELD_NUMBER: _builtins.int
+    URIS_FIELD_NUMBER: _builtins.int
+    FEATURES_FIELD_NUMBER: _builtins.int
+    version: _builtins.str
+    """The version of the LND software that the node is running."""
+    commit_hash: _builtins.str
+    """The SHA1 commit hash that the daemon is compiled with."""
+    identity_pubkey: _builtins.str
+    """The identity pubkey of the current node."""
+    alias: _builtins.str
+    """If applicable, the alias of the current node, e.g. "bob" """
+    color: _builtins.str
+    """The color of the current node in hex code format"""
+    num_pending_channels: _builtins.int
+    """Number of pending channels"""
+    num_active_channels: _builtins.int
+    """Number of active channels"""
+    num_inactive_channels: _builtins.int
+    """Number of inactive channels"""
+    num_peers: _builtins.int
+    """Number of peers"""
+    block_height: _builtins.int
+    """The node's current view of the height of the best block"""
+    block_hash: _builtins.str
+    """The node's current view of the hash of the best block"""
+    best_header_timestamp: _builtins.int
+    """Timestamp of the block best known to the wallet"""
+    synced_to_chain: _builtins.bool
+    """Whether the wallet's view is synced to the main chain"""
+    synced_to_graph: _builtins.bool
+    """Whether we consider ourselves synced with the public channel graph."""
+    @_builtins.property
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def testnet(self) -> _builtins.bool:
+        """
+        Whether the current node is connected to testnet. This field is
+        deprecated and the network field should be used instead
+        """
+
+    @testnet.setter
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def testnet(self, value: _builtins.bool) -> None:
+        """
+        Whether the current node is connected to testnet. This field is
+        deprecated and the network field should be used instead
+        """
+
+    @_builtins.property
+    def chains(self) -> _containers.RepeatedCompositeFieldContainer[Global___Chain]:
+        """A list of active chains the node is connected to"""
+
+    @_builtins.property
+    def uris(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]:
+        """The URIs of the current node."""
+
+    @_builtins.property
+    def features(self) -> _containers.MessageMap[_builtins.int, Global___Feature]:
+        """
+        Features that our node has advertised in our init message, node
+        announcements and invoices.
+        """
+
+    def __init__(
+        self,
+        *,
+        version: _builtins.str = ...,
+        commit_hash: _builtins.str = ...,
+        identity_pubkey: _builtins.str = ...,
+        alias: _builtins.str = ...,
+        color: _builtins.str = ...,
+        num_pending_channels: _builtins.int = ...,
+        num_active_channels: _builtins.int = ...,
+        num_inactive_channels: _builtins.int = ...,
+        num_peers: _builtins.int = ...,
+        block_height: _builtins.int = ...,
+        block_hash: _builtins.str = ...,
+        best_header_timestamp: _builtins.int = ...,
+        synced_to_chain: _builtins.bool = ...,
+        synced_to_graph: _builtins.bool = ...,
+        testnet: _builtins.bool = ...,
+        chains: _abc.Iterable[Global___Chain] | None = ...,
+        uris: _abc.Iterable[_builtins.str] | None = ...,
+        features: _abc.Mapping[_builtins.int, Global___Feature] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["alias", b"alias", "best_header_timestamp", b"best_header_timestamp", "block_hash", b"block_hash", "block_height", b"block_height", "chains", b"chains", "color", b"color", "commit_hash", b"commit_hash", "features", b"features", "identity_pubkey", b"identity_pubkey", "num_active_channels", b"num_active_channels", "num_inactive_channels", b"num_inactive_channels", "num_peers", b"num_peers", "num_pending_channels", b"num_pending_channels", "synced_to_chain", b"synced_to_chain", "synced_to_graph", b"synced_to_graph", "testnet", b"testnet", "uris", b"uris", "version", b"version"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetInfoResponse: _TypeAlias = GetInfoResponse  # noqa: Y015
+
+@_typing.final
+class GetRecoveryInfoRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetRecoveryInfoRequest: _TypeAlias = GetRecoveryInfoRequest  # noqa: Y015
+
+@_typing.final
+class GetRecoveryInfoResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    RECOVERY_MODE_FIELD_NUMBER: _builtins.int
+    RECOVERY_FINISHED_FIELD_NUMBER: _builtins.int
+    PROGRESS_FIELD_NUMBER: _builtins.int
+    recovery_mode: _builtins.bool
+    """Whether the wallet is in recovery mode"""
+    recovery_finished: _builtins.bool
+    """Whether the wallet recovery progress is finished"""
+    progress: _builtins.float
+    """The recovery progress, ranging from 0 to 1."""
+    def __init__(
+        self,
+        *,
+        recovery_mode: _builtins.bool = ...,
+        recovery_finished: _builtins.bool = ...,
+        progress: _builtins.float = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["progress", b"progress", "recovery_finished", b"recovery_finished", "recovery_mode", b"recovery_mode"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetRecoveryInfoResponse: _TypeAlias = GetRecoveryInfoResponse  # noqa: Y015
+
+@_typing.final
+class Chain(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    CHAIN_FIELD_NUMBER: _builtins.int
+    NETWORK_FIELD_NUMBER: _builtins.int
+    chain: _builtins.str
+    """The blockchain the node is on (eg bitcoin, litecoin)"""
+    network: _builtins.str
+    """The network the node is on (eg regtest, testnet, mainnet)"""
+    def __init__(
+        self,
+        *,
+        chain: _builtins.str = ...,
+        network: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["chain", b"chain", "network", b"network"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___Chain: _TypeAlias = Chain  # noqa: Y015
+
+@_typing.final
+class ConfirmationUpdate(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    BLOCK_SHA_FIELD_NUMBER: _builtins.int
+    BLOCK_HEIGHT_FIELD_NUMBER: _builtins.int
+    NUM_CONFS_LEFT_FIELD_NUMBER: _builtins.int
+    block_sha: _builtins.bytes
+    block_height: _builtins.int
+    num_confs_left: _builtins.int
+    def __init__(
+        self,
+        *,
+        block_sha: _builtins.bytes = ...,
+        block_height: _builtins.int = ...,
+        num_confs_left: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["block_height", b"block_height", "block_sha", b"block_sha", "num_confs_left", b"num_confs_left"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ConfirmationUpdate: _TypeAlias = ConfirmationUpdate  # noqa: Y015
+
+@_typing.final
+class ChannelOpenUpdate(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    CHANNEL_POINT_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def channel_point(self) -> Global___ChannelPoint: ...
+    def __init__(
+        self,
+        *,
+        channel_point: Global___ChannelPoint | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["channel_point", b"channel_point"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["channel_point", b"channel_point"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ChannelOpenUpdate: _TypeAlias = ChannelOpenUpdate  # noqa: Y015
+
+@_typing.final
+class ChannelCloseUpdate(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    CLOSING_TXID_FIELD_NUMBER: _builtins.int
+    SUCCESS_FIELD_NUMBER: _builtins.int
+    closing_txid: _builtins.bytes
+    success: _builtins.bool
+    def __init__(
+        self,
+        *,
+        closing_txid: _builtins.bytes = ...,
+        success: _builtins.bool = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["closing_txid", b"closing_txid", "success", b"success"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ChannelCloseUpdate: _TypeAlias = ChannelCloseUpdate  # noqa: Y015
+
+@_typing.final
+class CloseChannelRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    CHANNEL_POINT_FIELD_NUMBER: _builtins.int
+    FORCE_FIELD_NUMBER: _builtins.int
+    TARGET_CONF_FIELD_NUMBER: _builtins.int
+    SAT_PER_BYTE_FIELD_NUMBER: _builtins.int
+    DELIVERY_ADDRESS_FIELD_NUMBER: _builtins.int
+    SAT_PER_VBYTE_FIELD_NUMBER: _builtins.int
+    force: _builtins.bool
+    """If true, then the channel will be closed forcibly. This means the
+    current commitment transaction will be signed and broadcast.
+    """
+    target_conf: _builtins.int
+    """The target number of blocks that the closure transaction should be
+    confirmed by.
+    """
+    @_builtins.property
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def sat_per_byte(self) -> _builtins.int:
+        """Deprecated, use sat_per_vbyte.
+        A manual fee rate set in sat/vbyte that should be used when crafting the
+        closure transaction.
+        """
+
+    @sat_per_byte.setter
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def sat_per_byte(self, value: _builtins.int) -> None:
+        """Deprecated, use sat_per_vbyte.
+        A manual fee rate set in sat/vbyte that should be used when crafting the
+        closure transaction.
+        """
+
+    delivery_address: _builtins.str
+    """
+    An optional address to send funds to in the case of a cooperative close.
+    If the channel was opened with an upfront shutdown script and this field
+    is set, the request to close will fail because the channel must pay out
+    to the upfront shutdown addresss.
+    """
+    sat_per_vbyte: _builtins.int
+    """A manual fee rate set in sat/vbyte that should be used when crafting the
+    closure transaction.
+    """
+    @_builtins.property
+    def channel_point(self) -> Global___ChannelPoint:
+        """
+        The outpoint (txid:index) of the funding transaction. With this value, Bob
+        will be able to generate a signature for Alice's version of the commitment
+        transaction.
+        """
+
+    def __init__(
+        self,
+        *,
+        channel_point: Global___ChannelPoint | None = ...,
+        force: _builtins.bool = ...,
+        target_conf: _builtins.int = ...,
+        sat_per_byte: _builtins.int = ...,
+        delivery_address: _builtins.str = ...,
+        sat_per_vbyte: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["channel_point", b"channel_point"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["channel_point", b"channel_point", "delivery_address", b"delivery_address", "force", b"force", "sat_per_byte", b"sat_per_byte", "sat_per_vbyte", b"sat_per_vbyte", "target_conf", b"target_conf"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___CloseChannelRequest: _TypeAlias = CloseChannelRequest  # noqa: Y015
+
+@_typing.final
+class CloseStatusUpdate(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    CLOSE_PENDING_FIELD_NUMBER: _builtins.int
+    CHAN_CLOSE_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def close_pending(self) -> Global___PendingUpdate: ...
+    @_builtins.property
+    def chan_close(self) -> Global___ChannelCloseUpdate: ...
+    def __init__(
+        self,
+        *,
+        close_pending: Global___PendingUpdate | None = ...,
+        chan_close: Global___ChannelCloseUpdate | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["chan_close", b"chan_close", "close_pending", b"close_pending", "update", b"update"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["chan_close", b"chan_close", "close_pending", b"close_pending", "update", b"update"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    _WhichOneofReturnType_update: _TypeAlias = _typing.Literal["close_pending", "chan_close"]  # noqa: Y015
+    _WhichOneofArgType_update: _TypeAlias = _typing.Literal["update", b"update"]  # noqa: Y015
+    def WhichOneof(self, oneof_group: _WhichOneofArgType_update) -> _WhichOneofReturnType_update | None: ...
+
+Global___CloseStatusUpdate: _TypeAlias = CloseStatusUpdate  # noqa: Y015
+
+@_typing.final
+class PendingUpdate(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    TXID_FIELD_NUMBER: _builtins.int
+    OUTPUT_INDEX_FIELD_NUMBER: _builtins.int
+    txid: _builtins.bytes
+    output_index: _builtins.int
+    def __init__(
+        self,
+        *,
+        txid: _builtins.bytes = ...,
+        output_index: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["output_index", b"output_index", "txid", b"txid"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___PendingUpdate: _TypeAlias = PendingUpdate  # noqa: Y015
+
+@_typing.final
+class ReadyForPsbtFunding(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    FUNDING_ADDRESS_FIELD_NUMBER: _builtins.int
+    FUNDING_AMOUNT_FIELD_NUMBER: _builtins.int
+    PSBT_FIELD_NUMBER: _builtins.int
+    funding_address: _builtins.str
+    """
+    The P2WSH address of the channel funding multisig address that the below
+    specified amount in satoshis needs to be sent to.
+    """
+    funding_amount: _builtins.int
+    """
+    The exact amount in satoshis that needs to be sent to the above address to
+    fund the pending channel.
+    """
+    psbt: _builtins.bytes
+    """
+    A raw PSBT that contains the pending channel output. If a base PSBT was
+    provided in the PsbtShim, this is the base PSBT with one additional output.
+    If no base PSBT was specified, this is an otherwise empty PSBT with exactly
+    one output.
+    """
+    def __init__(
+        self,
+        *,
+        funding_address: _builtins.str = ...,
+        funding_amount: _builtins.int = ...,
+        psbt: _builtins.bytes = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["funding_address", b"funding_address", "funding_amount", b"funding_amount", "psbt", b"psbt"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ReadyForPsbtFunding: _TypeAlias = ReadyForPsbtFunding  # noqa: Y015
+
+@_typing.final
+class BatchOpenChannelRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    CHANNELS_FIELD_NUMBER: _builtins.int
+    TARGET_CONF_FIELD_NUMBER: _builtins.int
+    SAT_PER_VBYTE_FIELD_NUMBER: _builtins.int
+    MIN_CONFS_FIELD_NUMBER: _builtins.int
+    SPEND_UNCONFIRMED_FIELD_NUMBER: _builtins.int
+    LABEL_FIELD_NUMBER: _builtins.int
+    target_conf: _builtins.int
+    """The target number of blocks that the funding transaction should be
+    confirmed by.
+    """
+    sat_per_vbyte: _builtins.int
+    """A manual fee rate set in sat/vByte that should be used when crafting the
+    funding transaction.
+    """
+    min_confs: _builtins.int
+    """The minimum number of confirmations each one of your outputs used for
+    the funding transaction must satisfy.
+    """
+    spend_unconfirmed: _builtins.bool
+    """Whether unconfirmed outputs should be used as inputs for the funding
+    transaction.
+    """
+    label: _builtins.str
+    """An optional label for the batch transaction, limited to 500 characters."""
+    @_builtins.property
+    def channels(self) -> _containers.RepeatedCompositeFieldContainer[Global___BatchOpenChannel]:
+        """The list of channels to open."""
+
+    def __init__(
+        self,
+        *,
+        channels: _abc.Iterable[Global___BatchOpenChannel] | None = ...,
+        target_conf: _builtins.int = ...,
+        sat_per_vbyte: _builtins.int = ...,
+        min_confs: _builtins.int = ...,
+        spend_unconfirmed: _builtins.bool = ...,
+        label: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["channels", b"channels", "label", b"label", "min_confs", b"min_confs", "sat_per_vbyte", b"sat_per_vbyte", "spend_unconfirmed", b"spend_unconfirmed", "target_conf", b"target_conf"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___BatchOpenChannelRequest: _TypeAlias = BatchOpenChannelRequest  # noqa: Y015
+
+@_typing.final
+class BatchOpenChannel(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    NODE_PUBKEY_FIELD_NUMBER: _builtins.int
+    LOCAL_FUNDING_AMOUNT_FIELD_NUMBER: _builtins.int
+    PUSH_SAT_FIELD_NUMBER: _builtins.int
+    PRIVATE_FIELD_NUMBER: _builtins.int
+    MIN_HTLC_MSAT_FIELD_NUMBER: _builtins.int
+    REMOTE_CSV_DELAY_FIELD_NUMBER: _builtins.int
+    CLOSE_ADDRESS_FIELD_NUMBER: _builtins.int
+    PENDING_CHAN_ID_FIELD_NUMBER: _builtins.int
+    COMMITMENT_TYPE_FIELD_NUMBER: _builtins.int
+    node_pubkey: _builtins.bytes
+    """The pubkey of the node to open a channel with. When using REST, this
+    field must be encoded as base64.
+    """
+    local_funding_amount: _builtins.int
+    """The number of satoshis the wallet should commit to the channel."""
+    push_sat: _builtins.int
+    """The number of satoshis to push to the remote side as part of the initial
+    commitment state.
+    """
+    private: _builtins.bool
+    """Whether this channel should be private, not announced to the greater
+    network.
+    """
+    min_htlc_msat: _builtins.int
+    """The minimum value in millisatoshi we will require for incoming HTLCs on
+    the channel.
+    """
+    remote_csv_delay: _builtins.int
+    """The delay we require on the remote's commitment transaction. If this is
+    not set, it will be scaled automatically with the channel size.
+    """
+    close_address: _builtins.str
+    """
+    Close address is an optional address which specifies the address to which
+    funds should be paid out to upon cooperative close. This field may only be
+    set if the peer supports the option upfront feature bit (call listpeers
+    to check). The remote peer will only accept cooperative closes to this
+    address if it is set.
+
+    Note: If this value is set on channel creation, you will *not* be able to
+    cooperatively close out to a different address.
+    """
+    pending_chan_id: _builtins.bytes
+    """
+    An optional, unique identifier of 32 random bytes that will be used as the
+    pending channel ID to identify the channel while it is in the pre-pending
+    state.
+    """
+    commitment_type: Global___CommitmentType.ValueType
+    """
+    The explicit commitment type to use. Note this field will only be used if
+    the remote peer supports explicit channel negotiation.
+    """
+    def __init__(
+        self,
+        *,
+        node_pubkey: _builtins.bytes = ...,
+        local_funding_amount: _builtins.int = ...,
+        push_sat: _builtins.int = ...,
+        private: _builtins.bool = ...,
+        min_htlc_msat: _builtins.int = ...,
+        remote_csv_delay: _builtins.int = ...,
+        close_address: _builtins.str = ...,
+        pending_chan_id: _builtins.bytes = ...,
+        commitment_type: Global___CommitmentType.ValueType = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["close_address", b"close_address", "commitment_type", b"commitment_type", "local_funding_amount", b"local_funding_amount", "min_htlc_msat", b"min_htlc_msat", "node_pubkey", b"node_pubkey", "pending_chan_id", b"pending_chan_id", "private", b"private", "push_sat", b"push_sat", "remote_csv_delay", b"remote_csv_delay"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___BatchOpenChannel: _TypeAlias = BatchOpenChannel  # noqa: Y015
+
+@_typing.final
+class BatchOpenChannelResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PENDING_CHANNELS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def pending_channels(self) -> _containers.RepeatedCompositeFieldContainer[Global___PendingUpdate]: ...
+    def __init__(
+        self,
+        *,
+        pending_channels: _abc.Iterable[Global___PendingUpdate] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["pending_channels", b"pending_channels"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___BatchOpenChannelResponse: _TypeAlias = BatchOpenChannelResponse  # noqa: Y015
+
+@_typing.final
+class OpenChannelRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SAT_PER_VBYTE_FIELD_NUMBER: _builtins.int
+    NODE_PUBKEY_FIELD_NUMBER: _builtins.int
+    NODE_PUBKEY_STRING_FIELD_NUMBER: _builtins.int
+    LOCAL_FUNDING_AMOUNT_FIELD_NUMBER: _builtins.int
+    PUSH_SAT_FIELD_NUMBER: _builtins.int
+    TARGET_CONF_FIELD_NUMBER: _builtins.int
+    SAT_PER_BYTE_FIELD_NUMBER: _builtins.int
+    PRIVATE_FIELD_NUMBER: _builtins.int
+    MIN_HTLC_MSAT_FIELD_NUMBER: _builtins.int
+    REMOTE_CSV_DELAY_FIELD_NUMBER: _builtins.int
+    MIN_CONFS_FIELD_NUMBER: _builtins.int
+    SPEND_UNCONFIRMED_FIELD_NUMBER: _builtins.int
+    CLOSE_ADDRESS_FIELD_NUMBER: _builtins.int
+    FUNDING_SHIM_FIELD_NUMBER: _builtins.int
+    REMOTE_MAX_VALUE_IN_FLIGHT_MSAT_FIELD_NUMBER: _builtins.int
+    REMOTE_MAX_HTLCS_FIELD_NUMBER: _builtins.int
+    MAX_LOCAL_CSV_FIELD_NUMBER: _builtins.int
+    COMMITMENT_TYPE_FIELD_NUMBER: _builtins.int
+    sat_per_vbyte: _builtins.int
+    """A manual fee rate set in sat/vbyte that should be used when crafting the
+    funding transaction.
+    """
+    node_pubkey: _builtins.bytes
+    """
+    The pubkey of the node to open a channel with. When using REST, this field
+    must be encoded as base64.
+    """
+    @_builtins.property
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def node_pubkey_string(self) -> _builtins.str:
+        """
+        The hex encoded pubkey of the node to open a channel with. Deprecated now
+        that the REST gateway supports base64 encoding of bytes fields.
+        """
+
+    @node_pubkey_string.setter
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def node_pubkey_string(self, value: _builtins.str) -> None:
+        """
+        The hex encoded pubkey of the node to open a channel with. Deprecated now
+        that the REST gateway supports base64 encoding of bytes fields.
+        """
+
+    local_funding_amount: _builtins.int
+    """The number of satoshis the wallet should commit to the channel"""
+    push_sat: _builtins.int
+    """The number of satoshis to push to the remote side as part of the initial
+    commitment state
+    """
+    target_conf: _builtins.int
+    """The target number of blocks that the funding transaction should be
+    confirmed by.
+    """
+    @_builtins.property
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def sat_per_byte(self) -> _builtins.int:
+        """Deprecated, use sat_per_vbyte.
+        A manual fee rate set in sat/vbyte that should be used when crafting the
+        funding transaction.
+        """
+
+    @sat_per_byte.setter
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def sat_per_byte(self, value: _builtins.int) -> None:
+        """Deprecated, use sat_per_vbyte.
+        A manual fee rate set in sat/vbyte that should be used when crafting the
+        funding transaction.
+        """
+
+    private: _builtins.bool
+    """Whether this channel should be private, not announced to the greater
+    network.
+    """
+    min_htlc_msat: _builtins.int
+    """The minimum value in millisatoshi we will require for incoming HTLCs on
+    the channel.
+    """
+    remote_csv_delay: _builtins.int
+    """The delay we require on the remote's commitment transaction. If this is
+    not set, it will be scaled automatically with the channel size.
+    """
+    min_confs: _builtins.int
+    """The minimum number of confirmations each one of your outputs used for
+    the funding transaction must satisfy.
+    """
+    spend_unconfirmed: _builtins.bool
+    """Whether unconfirmed outputs should be used as inputs for the funding
+    transaction.
+    """
+    close_address: _builtins.str
+    """
+    Close address is an optional address which specifies the address to which
+    funds should be paid out to upon cooperative close. This field may only be
+    set if the peer supports the option upfront feature bit (call listpeers
+    to check). The remote peer will only accept cooperative closes to this
+    address if it is set.
+
+    Note: If this value is set on channel creation, you will *not* be able to
+    cooperatively close out to a different address.
+    """
+    remote_max_value_in_flight_msat: _builtins.int
+    """
+    The maximum amount of coins in millisatoshi that can be pending within
+    the channel. It only applies to the remote party.
+    """
+    remote_max_htlcs: _builtins.int
+    """
+    The maximum number of concurrent HTLCs we will allow the remote party to add
+    to the commitment transaction.
+    """
+    max_local_csv: _builtins.int
+    """
+    Max local csv is the maximum csv delay we will allow for our own commitment
+    transaction.
+    """
+    commitment_type: Global___CommitmentType.ValueType
+    """
+    The explicit commitment type to use. Note this field will only be used if
+    the remote peer supports explicit channel negotiation.
+    """
+    @_builtins.property
+    def funding_shim(self) -> Global___FundingShim:
+        """
+        Funding shims are an optional argument that allow the caller to intercept
+        certain funding functionality. For example, a shim can be provided to use a
+        particular key for the commitment key (ideally cold) rather than use one
+        that is generated by the wallet as normal, or signal that signing will be
+        carried out in an interactive manner (PSBT based).
+        """
+
+    def __init__(
+        self,
+        *,
+        sat_per_vbyte: _builtins.int = ...,
+        node_pubkey: _builtins.bytes = ...,
+        node_pubkey_string: _builtins.str = ...,
+        local_funding_amount: _builtins.int = ...,
+        push_sat: _builtins.int = ...,
+        target_conf: _builtins.int = ...,
+        sat_per_byte: _builtins.int = ...,
+        private: _builtins.bool = ...,
+        min_htlc_msat: _builtins.int = ...,
+        remote_csv_delay: _builtins.int = ...,
+        min_confs: _builtins.int = ...,
+        spend_unconfirmed: _builtins.bool = ...,
+        close_address: _builtins.str = ...,
+        funding_shim: Global___FundingShim | None = ...,
+        remote_max_value_in_flight_msat: _builtins.int = ...,
+        remote_max_htlcs: _builtins.int = ...,
+        max_local_csv: _builtins.int = ...,
+        commitment_type: Global___CommitmentType.ValueType = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["funding_shim", b"funding_shim"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["close_address", b"close_address", "commitment_type", b"commitment_type", "funding_shim", b"funding_shim", "local_funding_amount", b"local_funding_amount", "max_local_csv", b"max_local_csv", "min_confs", b"min_confs", "min_htlc_msat", b"min_htlc_msat", "node_pubkey", b"node_pubkey", "node_pubkey_string", b"node_pubkey_string", "private", b"private", "push_sat", b"push_sat", "remote_csv_delay", b"remote_csv_delay", "remote_max_htlcs", b"remote_max_htlcs", "remote_max_value_in_flight_msat", b"remote_max_value_in_flight_msat", "sat_per_byte", b"sat_per_byte", "sat_per_vbyte", b"sat_per_vbyte", "spend_unconfirmed", b"spend_unconfirmed", "target_conf", b"target_conf"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___OpenChannelRequest: _TypeAlias = OpenChannelRequest  # noqa: Y015
+
+@_typing.final
+class OpenStatusUpdate(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    CHAN_PENDING_FIELD_NUMBER: _builtins.int
+    CHAN_OPEN_FIELD_NUMBER: _builtins.int
+    PSBT_FUND_FIELD_NUMBER: _builtins.int
+    PENDING_CHAN_ID_FIELD_NUMBER: _builtins.int
+    pending_chan_id: _builtins.bytes
+    """
+    The pending channel ID of the created channel. This value may be used to
+    further the funding flow manually via the FundingStateStep method.
+    """
+    @_builtins.property
+    def chan_pending(self) -> Global___PendingUpdate:
+        """
+        Signals that the channel is now fully negotiated and the funding
+        transaction published.
+        """
+
+    @_builtins.property
+    def chan_open(self) -> Global___ChannelOpenUpdate:
+        """
+        Signals that the channel's funding transaction has now reached the
+        required number of confirmations on chain and can be used.
+        """
+
+    @_builtins.property
+    def psbt_fund(self) -> Global___ReadyForPsbtFunding:
+        """
+        Signals that the funding process has been suspended and the construction
+        of a PSBT that funds the channel PK script is now required.
+        """
+
+    def __init__(
+        self,
+        *,
+        chan_pending: Global___PendingUpdate | None = ...,
+        chan_open: Global___ChannelOpenUpdate | None = ...,
+        psbt_fund: Global___ReadyForPsbtFunding | None = ...,
+        pending_chan_id: _builtins.bytes = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["chan_open", b"chan_open", "chan_pending", b"chan_pending", "psbt_fund", b"psbt_fund", "update", b"update"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["chan_open", b"chan_open", "chan_pending", b"chan_pending", "pending_chan_id", b"pending_chan_id", "psbt_fund", b"psbt_fund", "update", b"update"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    _WhichOneofReturnType_update: _TypeAlias = _typing.Literal["chan_pending", "chan_open", "psbt_fund"]  # noqa: Y015
+    _WhichOneofArgType_update: _TypeAlias = _typing.Literal["update", b"update"]  # noqa: Y015
+    def WhichOneof(self, oneof_group: _WhichOneofArgType_update) -> _WhichOneofReturnType_update | None: ...
+
+Global___OpenStatusUpdate: _TypeAlias = OpenStatusUpdate  # noqa: Y015
+
+@_typing.final
+class KeyLocator(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    KEY_FAMILY_FIELD_NUMBER: _builtins.int
+    KEY_INDEX_FIELD_NUMBER: _builtins.int
+    key_family: _builtins.int
+    """The family of key being identified."""
+    key_index: _builtins.int
+    """The precise index of the key being identified."""
+    def __init__(
+        self,
+        *,
+        key_family: _builtins.int = ...,
+        key_index: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["key_family", b"key_family", "key_index", b"key_index"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___KeyLocator: _TypeAlias = KeyLocator  # noqa: Y015
+
+@_typing.final
+class KeyDescriptor(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    RAW_KEY_BYTES_FIELD_NUMBER: _builtins.int
+    KEY_LOC_FIELD_NUMBER: _builtins.int
+    raw_key_bytes: _builtins.bytes
+    """
+    The raw bytes of the key being identified.
+    """
+    @_builtins.property
+    def key_loc(self) -> Global___KeyLocator:
+        """
+        The key locator that identifies which key to use for signing.
+        """
+
+    def __init__(
+        self,
+        *,
+        raw_key_bytes: _builtins.bytes = ...,
+        key_loc: Global___KeyLocator | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["key_loc", b"key_loc"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["key_loc", b"key_loc", "raw_key_bytes", b"raw_key_bytes"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___KeyDescriptor: _TypeAlias = KeyDescriptor  # noqa: Y015
+
+@_typing.final
+class ChanPointShim(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    AMT_FIELD_NUMBER: _builtins.int
+    CHAN_POINT_FIELD_NUMBER: _builtins.int
+    LOCAL_KEY_FIELD_NUMBER: _builtins.int
+    REMOTE_KEY_FIELD_NUMBER: _builtins.int
+    PENDING_CHAN_ID_FIELD_NUMBER: _builtins.int
+    THAW_HEIGHT_FIELD_NUMBER: _builtins.int
+    amt: _builtins.int
+    """
+    The size of the pre-crafted output to be used as the channel point for this
+    channel funding.
+    """
+    remote_key: _builtins.bytes
+    """The key of the remote party to use when creating the multi-sig output."""
+    pending_chan_id: _builtins.bytes
+    """
+    If non-zero, then this will be used as the pending channel ID on the wire
+    protocol to initate the funding request. This is an optional field, and
+    should only be set if the responder is already expecting a specific pending
+    channel ID.
+    """
+    thaw_height: _builtins.int
+    """
+    This uint32 indicates if this channel is to be considered 'frozen'. A frozen
+    channel does not allow a cooperative channel close by the initiator. The
+    thaw_height is the height that this restriction stops applying to the
+    channel. The height can be interpreted in two ways: as a relative height if
+    the value is less than 500,000, or as an absolute height otherwise.
+    """
+    @_builtins.property
+    def chan_point(self) -> Global___ChannelPoint:
+        """The target channel point to refrence in created commitment transactions."""
+
+    @_builtins.property
+    def local_key(self) -> Global___KeyDescriptor:
+        """Our local key to use when creating the multi-sig output."""
+
+    def __init__(
+        self,
+        *,
+        amt: _builtins.int = ...,
+        chan_point: Global___ChannelPoint | None = ...,
+        local_key: Global___KeyDescriptor | None = ...,
+        remote_key: _builtins.bytes = ...,
+        pending_chan_id: _builtins.bytes = ...,
+        thaw_height: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["chan_point", b"chan_point", "local_key", b"local_key"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["amt", b"amt", "chan_point", b"chan_point", "local_key", b"local_key", "pending_chan_id", b"pending_chan_id", "remote_key", b"remote_key", "thaw_height", b"thaw_height"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ChanPointShim: _TypeAlias = ChanPointShim  # noqa: Y015
+
+@_typing.final
+class PsbtShim(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PENDING_CHAN_ID_FIELD_NUMBER: _builtins.int
+    BASE_PSBT_FIELD_NUMBER: _builtins.int
+    NO_PUBLISH_FIELD_NUMBER: _builtins.int
+    pending_chan_id: _builtins.bytes
+    """
+    A unique identifier of 32 random bytes that will be used as the pending
+    channel ID to identify the PSBT state machine when interacting with it and
+    on the wire protocol to initiate the funding request.
+    """
+    base_psbt: _builtins.bytes
+    """
+    An optional base PSBT the new channel output will be added to. If this is
+    non-empty, it must be a binary serialized PSBT.
+    """
+    no_publish: _builtins.bool
+    """
+    If a channel should be part of a batch (multiple channel openings in one
+    transaction), it can be dangerous if the whole batch transaction is
+    published too early before all channel opening negotiations are completed.
+    This flag prevents this particular channel from broadcasting the transaction
+    after the negotiation with the remote peer. In a batch of channel openings
+    this flag should be set to true for every channel but the very last.
+    """
+    def __init__(
+        self,
+        *,
+        pending_chan_id: _builtins.bytes = ...,
+        base_psbt: _builtins.bytes = ...,
+        no_publish: _builtins.bool = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["base_psbt", b"base_psbt", "no_publish", b"no_publish", "pending_chan_id", b"pending_chan_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___PsbtShim: _TypeAlias = PsbtShim  # noqa: Y015
+
+@_typing.final
+class FundingShim(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    CHAN_POINT_SHIM_FIELD_NUMBER: _builtins.int
+    PSBT_SHIM_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def chan_point_shim(self) -> Global___ChanPointShim:
+        """
+        A channel shim where the channel point was fully constructed outside
+        of lnd's wallet and the transaction might already be published.
+        """
+
+    @_builtins.property
+    def psbt_shim(self) -> Global___PsbtShim:
+        """
+        A channel shim that uses a PSBT to fund and sign the channel funding
+        transaction.
+        """
+
+    def __init__(
+        self,
+        *,
+        chan_point_shim: Global___ChanPointShim | None = ...,
+        psbt_shim: Global___PsbtShim | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["chan_point_shim", b"chan_point_shim", "psbt_shim", b"psbt_shim", "shim", b"shim"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["chan_point_shim", b"chan_point_shim", "psbt_shim", b"psbt_shim", "shim", b"shim"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    _WhichOneofReturnType_shim: _TypeAlias = _typing.Literal["chan_point_shim", "psbt_shim"]  # noqa: Y015
+    _WhichOneofArgType_shim: _TypeAlias = _typing.Literal["shim", b"shim"]  # noqa: Y015
+    def WhichOneof(self, oneof_group: _WhichOneofArgType_shim) -> _WhichOneofReturnType_shim | None: ...
+
+Global___FundingShim: _TypeAlias = FundingShim  # noqa: Y015
+
+@_typing.final
+class FundingShimCancel(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PENDING_CHAN_ID_FIELD_NUMBER: _builtins.int
+    pending_chan_id: _builtins.bytes
+    """The pending channel ID of the channel to cancel the funding shim for."""
+    def __init__(
+        self,
+        *,
+        pending_chan_id: _builtins.bytes = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["pending_chan_id", b"pending_chan_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___FundingShimCancel: _TypeAlias = FundingShimCancel  # noqa: Y015
+
+@_typing.final
+class FundingPsbtVerify(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    FUNDED_PSBT_FIELD_NUMBER: _builtins.int
+    PENDING_CHAN_ID_FIELD_NUMBER: _builtins.int
+    SKIP_FINALIZE_FIELD_NUMBER: _builtins.int
+    funded_psbt: _builtins.bytes
+    """
+    The funded but not yet signed PSBT that sends the exact channel capacity
+    amount to the PK script returned in the open channel message in a previous
+    step.
+    """
+    pending_chan_id: _builtins.bytes
+    """The pending channel ID of the channel to get the PSBT for."""
+    skip_finalize: _builtins.bool
+    """
+    Can only be used if the no_publish flag was set to true in the OpenChannel
+    call meaning that the caller is solely responsible for publishing the final
+    funding transaction. If skip_finalize is set to true then lnd will not wait
+    for a FundingPsbtFinalize state step and instead assumes that a transaction
+    with the same TXID as the passed in PSBT will eventually confirm.
+    IT IS ABSOLUTELY IMPERATIVE that the TXID of the transaction that is
+    eventually published does have the _same TXID_ as the verified PSBT. That
+    means no inputs or outputs can change, only signatures can be added. If the
+    TXID changes between this call and the publish step then the channel will
+    never be created and the funds will be in limbo.
+    """
+    def __init__(
+        self,
+        *,
+        funded_psbt: _builtins.bytes = ...,
+        pending_chan_id: _builtins.bytes = ...,
+        skip_finalize: _builtins.bool = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["funded_psbt", b"funded_psbt", "pending_chan_id", b"pending_chan_id", "skip_finalize", b"skip_finalize"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___FundingPsbtVerify: _TypeAlias = FundingPsbtVerify  # noqa: Y015
+
+@_typing.final
+class FundingPsbtFinalize(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SIGNED_PSBT_FIELD_NUMBER: _builtins.int
+    PENDING_CHAN_ID_FIELD_NUMBER: _builtins.int
+    FINAL_RAW_TX_FIELD_NUMBER: _builtins.int
+    signed_psbt: _builtins.bytes
+    """
+    The funded PSBT that contains all witness data to send the exact channel
+    capacity amount to the PK script returned in the open channel message in a
+    previous step. Cannot be set at the same time as final_raw_tx.
+    """
+    pending_chan_id: _builtins.bytes
+    """The pending channel ID of the channel to get the PSBT for."""
+    final_raw_tx: _builtins.bytes
+    """
+    As an alternative to the signed PSBT with all witness data, the final raw
+    wire format transaction can also be specified directly. Cannot be set at the
+    same time as signed_psbt.
+    """
+    def __init__(
+        self,
+        *,
+        signed_psbt: _builtins.bytes = ...,
+        pending_chan_id: _builtins.bytes = ...,
+        final_raw_tx: _builtins.bytes = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["final_raw_tx", b"final_raw_tx", "pending_chan_id", b"pending_chan_id", "signed_psbt", b"signed_psbt"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___FundingPsbtFinalize: _TypeAlias = FundingPsbtFinalize  # noqa: Y015
+
+@_typing.final
+class FundingTransitionMsg(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SHIM_REGISTER_FIELD_NUMBER: _builtins.int
+    SHIM_CANCEL_FIELD_NUMBER: _builtins.int
+    PSBT_VERIFY_FIELD_NUMBER: _builtins.int
+    PSBT_FINALIZE_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def shim_register(self) -> Global___FundingShim:
+        """
+        The funding shim to register. This should be used before any
+        channel funding has began by the remote party, as it is intended as a
+        preparatory step for the full channel funding.
+        """
+
+    @_builtins.property
+    def shim_cancel(self) -> Global___FundingShimCancel:
+        """Used to cancel an existing registered funding shim."""
+
+    @_builtins.property
+    def psbt_verify(self) -> Global___FundingPsbtVerify:
+        """
+        Used to continue a funding flow that was initiated to be executed
+        through a PSBT. This step verifies that the PSBT contains the correct
+        outputs to fund the channel.
+        """
+
+    @_builtins.property
+    def psbt_finalize(self) -> Global___FundingPsbtFinalize:
+        """
+        Used to continue a funding flow that was initiated to be executed
+        through a PSBT. This step finalizes the funded and signed PSBT, finishes
+        negotiation with the peer and finally publishes the resulting funding
+        transaction.
+        """
+
+    def __init__(
+        self,
+        *,
+        shim_register: Global___FundingShim | None = ...,
+        shim_cancel: Global___FundingShimCancel | None = ...,
+        psbt_verify: Global___FundingPsbtVerify | None = ...,
+        psbt_finalize: Global___FundingPsbtFinalize | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["psbt_finalize", b"psbt_finalize", "psbt_verify", b"psbt_verify", "shim_cancel", b"shim_cancel", "shim_register", b"shim_register", "trigger", b"trigger"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["psbt_finalize", b"psbt_finalize", "psbt_verify", b"psbt_verify", "shim_cancel", b"shim_cancel", "shim_register", b"shim_register", "trigger", b"trigger"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    _WhichOneofReturnType_trigger: _TypeAlias = _typing.Literal["shim_register", "shim_cancel", "psbt_verify", "psbt_finalize"]  # noqa: Y015
+    _WhichOneofArgType_trigger: _TypeAlias = _typing.Literal["trigger", b"trigger"]  # noqa: Y015
+    def WhichOneof(self, oneof_group: _WhichOneofArgType_trigger) -> _WhichOneofReturnType_trigger | None: ...
+
+Global___FundingTransitionMsg: _TypeAlias = FundingTransitionMsg  # noqa: Y015
+
+@_typing.final
+class FundingStateStepResp(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___FundingStateStepResp: _TypeAlias = FundingStateStepResp  # noqa: Y015
+
+@_typing.final
+class PendingHTLC(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    INCOMING_FIELD_NUMBER: _builtins.int
+    AMOUNT_FIELD_NUMBER: _builtins.int
+    OUTPOINT_FIELD_NUMBER: _builtins.int
+    MATURITY_HEIGHT_FIELD_NUMBER: _builtins.int
+    BLOCKS_TIL_MATURITY_FIELD_NUMBER: _builtins.int
+    STAGE_FIELD_NUMBER: _builtins.int
+    incoming: _builtins.bool
+    """The direction within the channel that the htlc was sent"""
+    amount: _builtins.int
+    """The total value of the htlc"""
+    outpoint: _builtins.str
+    """The final output to be swept back to the user's wallet"""
+    maturity_height: _builtins.int
+    """The next block height at which we can spend the current stage"""
+    blocks_til_maturity: _builtins.int
+    """
+    The number of blocks remaining until the current stage can be swept.
+    Negative values indicate how many blocks have passed since becoming
+    mature.
+    """
+    stage: _builtins.int
+    """Indicates whether the htlc is in its first or second stage of recovery"""
+    def __init__(
+        self,
+        *,
+        incoming: _builtins.bool = ...,
+        amount: _builtins.int = ...,
+        outpoint: _builtins.str = ...,
+        maturity_height: _builtins.int = ...,
+        blocks_til_maturity: _builtins.int = ...,
+        stage: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["amount", b"amount", "blocks_til_maturity", b"blocks_til_maturity", "incoming", b"incoming", "maturity_height", b"maturity_height", "outpoint", b"outpoint", "stage", b"stage"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___PendingHTLC: _TypeAlias = PendingHTLC  # noqa: Y015
+
+@_typing.final
+class PendingChannelsRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___PendingChannelsRequest: _TypeAlias = PendingChannelsRequest  # noqa: Y015
+
+@_typing.final
+class PendingChannelsResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class PendingChannel(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        REMOTE_NODE_PUB_FIELD_NUMBER: _builtins.int
+        CHANNEL_POINT_FIELD_NUMBER: _builtins.int
+        CAPACITY_FIELD_NUMBER: _builtins.int
+        LOCAL_BALANCE_FIELD_NUMBER: _builtins.int
+        REMOTE_BALANCE_FIELD_NUMBER: _builtins.int
+        LOCAL_CHAN_RESERVE_SAT_FIELD_NUMBER: _builtins.int
+        REMOTE_CHAN_RESERVE_SAT_FIELD_NUMBER: _builtins.int
+        INITIATOR_FIELD_NUMBER: _builtins.int
+        COMMITMENT_TYPE_FIELD_NUMBER: _builtins.int
+        NUM_FORWARDING_PACKAGES_FIELD_NUMBER: _builtins.int
+        remote_node_pub: _builtins.str
+        channel_point: _builtins.str
+        capacity: _builtins.int
+        local_balance: _builtins.int
+        remote_balance: _builtins.int
+        local_chan_reserve_sat: _builtins.int
+        """The minimum satoshis this node is required to reserve in its
+        balance.
+        """
+        remote_chan_reserve_sat: _builtins.int
+        """
+        The minimum satoshis the other node is required to reserve in its
+        balance.
+        """
+        initiator: Global___Initiator.ValueType
+        """The party that initiated opening the channel."""
+        commitment_type: Global___CommitmentType.ValueType
+        """The commitment type used by this channel."""
+        num_forwarding_packages: _builtins.int
+        """Total number of forwarding packages created in this channel."""
+        def __init__(
+            self,
+            *,
+            remote_node_pub: _builtins.str = ...,
+            channel_point: _builtins.str = ...,
+            capacity: _builtins.int = ...,
+            local_balance: _builtins.int = ...,
+            remote_balance: _builtins.int = ...,
+            local_chan_reserve_sat: _builtins.int = ...,
+            remote_chan_reserve_sat: _builtins.int = ...,
+            initiator: Global___Initiator.ValueType = ...,
+            commitment_type: Global___CommitmentType.ValueType = ...,
+            num_forwarding_packages: _builtins.int = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["capacity", b"capacity", "channel_point", b"channel_point", "commitment_type", b"commitment_type", "initiator", b"initiator", "local_balance", b"local_balance", "local_chan_reserve_sat", b"local_chan_reserve_sat", "num_forwarding_packages", b"num_forwarding_packages", "remote_balance", b"remote_balance", "remote_chan_reserve_sat", b"remote_chan_reserve_sat", "remote_node_pub", b"remote_node_pub"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class PendingOpenChannel(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        CHANNEL_FIELD_NUMBER: _builtins.int
+        CONFIRMATION_HEIGHT_FIELD_NUMBER: _builtins.int
+        COMMIT_FEE_FIELD_NUMBER: _builtins.int
+        COMMIT_WEIGHT_FIELD_NUMBER: _builtins.int
+        FEE_PER_KW_FIELD_NUMBER: _builtins.int
+        confirmation_height: _builtins.int
+        """The height at which this channel will be confirmed"""
+        commit_fee: _builtins.int
+        """
+        The amount calculated to be paid in fees for the current set of
+        commitment transactions. The fee amount is persisted with the channel
+        in order to allow the fee amount to be removed and recalculated with
+        each channel state update, including updates that happen after a system
+        restart.
+        """
+        commit_weight: _builtins.int
+        """The weight of the commitment transaction"""
+        fee_per_kw: _builtins.int
+        """
+        The required number of satoshis per kilo-weight that the requester will
+        pay at all times, for both the funding transaction and commitment
+        transaction. This value can later be updated once the channel is open.
+        """
+        @_builtins.property
+        def channel(self) -> Global___PendingChannelsResponse.PendingChannel:
+            """The pending channel"""
+
+        def __init__(
+            self,
+            *,
+            channel: Global___PendingChannelsResponse.PendingChannel | None = ...,
+            confirmation_height: _builtins.int = ...,
+            commit_fee: _builtins.int = ...,
+            commit_weight: _builtins.int = ...,
+            fee_per_kw: _builtins.int = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _typing.Literal["channel", b"channel"]  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["channel", b"channel", "commit_fee", b"commit_fee", "commit_weight", b"commit_weight", "confirmation_height", b"confirmation_height", "fee_per_kw", b"fee_per_kw"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class WaitingCloseChannel(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        CHANNEL_FIELD_NUMBER: _builtins.int
+        LIMBO_BALANCE_FIELD_NUMBER: _builtins.int
+        COMMITMENTS_FIELD_NUMBER: _builtins.int
+        limbo_balance: _builtins.int
+        """The balance in satoshis encumbered in this channel"""
+        @_builtins.property
+        def channel(self) -> Global___PendingChannelsResponse.PendingChannel:
+            """The pending channel waiting for closing tx to confirm"""
+
+        @_builtins.property
+        def commitments(self) -> Global___PendingChannelsResponse.Commitments:
+            """
+            A list of valid commitment transactions. Any of these can confirm at
+            this point.
+            """
+
+        def __init__(
+            self,
+            *,
+            channel: Global___PendingChannelsResponse.PendingChannel | None = ...,
+            limbo_balance: _builtins.int = ...,
+            commitments: Global___PendingChannelsResponse.Commitments | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _typing.Literal["channel", b"channel", "commitments", b"commitments"]  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["channel", b"channel", "commitments", b"commitments", "limbo_balance", b"limbo_balance"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class Commitments(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        LOCAL_TXID_FIELD_NUMBER: _builtins.int
+        REMOTE_TXID_FIELD_NUMBER: _builtins.int
+        REMOTE_PENDING_TXID_FIELD_NUMBER: _builtins.int
+        LOCAL_COMMIT_FEE_SAT_FIELD_NUMBER: _builtins.int
+        REMOTE_COMMIT_FEE_SAT_FIELD_NUMBER: _builtins.int
+        REMOTE_PENDING_COMMIT_FEE_SAT_FIELD_NUMBER: _builtins.int
+        local_txid: _builtins.str
+        """Hash of the local version of the commitment tx."""
+        remote_txid: _builtins.str
+        """Hash of the remote version of the commitment tx."""
+        remote_pending_txid: _builtins.str
+        """Hash of the remote pending version of the commitment tx."""
+        local_commit_fee_sat: _builtins.int
+        """
+        The amount in satoshis calculated to be paid in fees for the local
+        commitment.
+        """
+        remote_commit_fee_sat: _builtins.int
+        """
+        The amount in satoshis calculated to be paid in fees for the remote
+        commitment.
+        """
+        remote_pending_commit_fee_sat: _builtins.int
+        """
+        The amount in satoshis calculated to be paid in fees for the remote
+        pending commitment.
+        """
+        def __init__(
+            self,
+            *,
+            local_txid: _builtins.str = ...,
+            remote_txid: _builtins.str = ...,
+            remote_pending_txid: _builtins.str = ...,
+            local_commit_fee_sat: _builtins.int = ...,
+            remote_commit_fee_sat: _builtins.int = ...,
+            remote_pending_commit_fee_sat: _builtins.int = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["local_commit_fee_sat", b"local_commit_fee_sat", "local_txid", b"local_txid", "remote_commit_fee_sat", b"remote_commit_fee_sat", "remote_pending_commit_fee_sat", b"remote_pending_commit_fee_sat", "remote_pending_txid", b"remote_pending_txid", "remote_txid", b"remote_txid"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class ClosedChannel(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        CHANNEL_FIELD_NUMBER: _builtins.int
+        CLOSING_TXID_FIELD_NUMBER: _builtins.int
+        closing_txid: _builtins.str
+        """The transaction id of the closing transaction"""
+        @_builtins.property
+        def channel(self) -> Global___PendingChannelsResponse.PendingChannel:
+            """The pending channel to be closed"""
+
+        def __init__(
+            self,
+            *,
+            channel: Global___PendingChannelsResponse.PendingChannel | None = ...,
+            closing_txid: _builtins.str = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _typing.Literal["channel", b"channel"]  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["channel", b"channel", "closing_txid", b"closing_txid"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class ForceClosedChannel(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        class _AnchorState:
+            ValueType = _typing.NewType("ValueType", _builtins.int)
+            V: _TypeAlias = ValueType  # noqa: Y015
+
+        class _AnchorStateEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[PendingChannelsResponse.ForceClosedChannel._AnchorState.ValueType], _builtins.type):
+            DESCRIPTOR: _descriptor.EnumDescriptor
+            LIMBO: PendingChannelsResponse.ForceClosedChannel._AnchorState.ValueType  # 0
+            RECOVERED: PendingChannelsResponse.ForceClosedChannel._AnchorState.ValueType  # 1
+            LOST: PendingChannelsResponse.ForceClosedChannel._AnchorState.ValueType  # 2
+
+        class AnchorState(_AnchorState, metaclass=_AnchorStateEnumTypeWrapper): ...
+        LIMBO: PendingChannelsResponse.ForceClosedChannel.AnchorState.ValueType  # 0
+        RECOVERED: PendingChannelsResponse.ForceClosedChannel.AnchorState.ValueType  # 1
+        LOST: PendingChannelsResponse.ForceClosedChannel.AnchorState.ValueType  # 2
+
+        CHANNEL_FIELD_NUMBER: _builtins.int
+        CLOSING_TXID_FIELD_NUMBER: _builtins.int
+        LIMBO_BALANCE_FIELD_NUMBER: _builtins.int
+        MATURITY_HEIGHT_FIELD_NUMBER: _builtins.int
+        BLOCKS_TIL_MATURITY_FIELD_NUMBER: _builtins.int
+        RECOVERED_BALANCE_FIELD_NUMBER: _builtins.int
+        PENDING_HTLCS_FIELD_NUMBER: _builtins.int
+        ANCHOR_FIELD_NUMBER: _builtins.int
+        closing_txid: _builtins.str
+        """The transaction id of the closing transaction"""
+        limbo_balance: _builtins.int
+        """The balance in satoshis encumbered in this pending channel"""
+        maturity_height: _builtins.int
+        """The height at which funds can be swept into the wallet"""
+        blocks_til_maturity: _builtins.int
+        """
+        Remaining # of blocks until the commitment output can be swept.
+        Negative values indicate how many blocks have passed since becoming
+        mature.
+        """
+        recovered_balance: _builtins.int
+        """The total value of funds successfully recovered from this channel"""
+        anchor: Global___PendingChannelsResponse.ForceClosedChannel.AnchorState.ValueType
+        @_builtins.property
+        def channel(self) -> Global___PendingChannelsResponse.PendingChannel:
+            """The pending channel to be force closed"""
+
+        @_builtins.property
+        def pending_htlcs(self) -> _containers.RepeatedCompositeFieldContainer[Global___PendingHTLC]: ...
+        def __init__(
+            self,
+            *,
+            channel: Global___PendingChannelsResponse.PendingChannel | None = ...,
+            closing_txid: _builtins.str = ...,
+            limbo_balance: _builtins.int = ...,
+            maturity_height: _builtins.int = ...,
+            blocks_til_maturity: _builtins.int = ...,
+            recovered_balance: _builtins.int = ...,
+            pending_htlcs: _abc.Iterable[Global___PendingHTLC] | None = ...,
+            anchor: Global___PendingChannelsResponse.ForceClosedChannel.AnchorState.ValueType = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _typing.Literal["channel", b"channel"]  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["anchor", b"anchor", "blocks_til_maturity", b"blocks_til_maturity", "channel", b"channel", "closing_txid", b"closing_txid", "limbo_balance", b"limbo_balance", "maturity_height", b"maturity_height", "pending_htlcs", b"pending_htlcs", "recovered_balance", b"recovered_balance"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    TOTAL_LIMBO_BALANCE_FIELD_NUMBER: _builtins.int
+    PENDING_OPEN_CHANNELS_FIELD_NUMBER: _builtins.int
+    PENDING_CLOSING_CHANNELS_FIELD_NUMBER: _builtins.int
+    PENDING_FORCE_CLOSING_CHANNELS_FIELD_NUMBER: _builtins.int
+    WAITING_CLOSE_CHANNELS_FIELD_NUMBER: _builtins.int
+    total_limbo_balance: _builtins.int
+    """The balance in satoshis encumbered in pending channels"""
+    @_builtins.property
+    def pending_open_channels(self) -> _containers.RepeatedCompositeFieldContainer[Global___PendingChannelsResponse.PendingOpenChannel]:
+        """Channels pending opening"""
+
+    @_builtins.property
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def pending_closing_channels(self) -> _containers.RepeatedCompositeFieldContainer[Global___PendingChannelsResponse.ClosedChannel]:
+        """
+        Deprecated: Channels pending closing previously contained cooperatively
+        closed channels with a single confirmation. These channels are now
+        considered closed from the time we see them on chain.
+        """
+
+    @_builtins.property
+    def pending_force_closing_channels(self) -> _containers.RepeatedCompositeFieldContainer[Global___PendingChannelsResponse.ForceClosedChannel]:
+        """Channels pending force closing"""
+
+    @_builtins.property
+    def waiting_close_channels(self) -> _containers.RepeatedCompositeFieldContainer[Global___PendingChannelsResponse.WaitingCloseChannel]:
+        """Channels waiting for closing tx to confirm"""
+
+    def __init__(
+        self,
+        *,
+        total_limbo_balance: _builtins.int = ...,
+        pending_open_channels: _abc.Iterable[Global___PendingChannelsResponse.PendingOpenChannel] | None = ...,
+        pending_closing_channels: _abc.Iterable[Global___PendingChannelsResponse.ClosedChannel] | None = ...,
+        pending_force_closing_channels: _abc.Iterable[Global___PendingChannelsResponse.ForceClosedChannel] | None = ...,
+        waiting_close_channels: _abc.Iterable[Global___PendingChannelsResponse.WaitingCloseChannel] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["pending_closing_channels", b"pending_closing_channels", "pending_force_closing_channels", b"pending_force_closing_channels", "pending_open_channels", b"pending_open_channels", "total_limbo_balance", b"total_limbo_balance", "waiting_close_channels", b"waiting_close_channels"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___PendingChannelsResponse: _TypeAlias = PendingChannelsResponse  # noqa: Y015
+
+@_typing.final
+class ChannelEventSubscription(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ChannelEventSubscription: _TypeAlias = ChannelEventSubscription  # noqa: Y015
+
+@_typing.final
+class ChannelEventUpdate(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    class _UpdateType:
+        ValueType = _typing.NewType("ValueType", _builtins.int)
+        V: _TypeAlias = ValueType  # noqa: Y015
+
+    class _UpdateTypeEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[ChannelEventUpdate._UpdateType.ValueType], _builtins.type):
+        DESCRIPTOR: _descriptor.EnumDescriptor
+        OPEN_CHANNEL: ChannelEventUpdate._UpdateType.ValueType  # 0
+        CLOSED_CHANNEL: ChannelEventUpdate._UpdateType.ValueType  # 1
+        ACTIVE_CHANNEL: ChannelEventUpdate._UpdateType.ValueType  # 2
+        INACTIVE_CHANNEL: ChannelEventUpdate._UpdateType.ValueType  # 3
+        PENDING_OPEN_CHANNEL: ChannelEventUpdate._UpdateType.ValueType  # 4
+        FULLY_RESOLVED_CHANNEL: ChannelEventUpdate._UpdateType.ValueType  # 5
+
+    class UpdateType(_UpdateType, metaclass=_UpdateTypeEnumTypeWrapper): ...
+    OPEN_CHANNEL: ChannelEventUpdate.UpdateType.ValueType  # 0
+    CLOSED_CHANNEL: ChannelEventUpdate.UpdateType.ValueType  # 1
+    ACTIVE_CHANNEL: ChannelEventUpdate.UpdateType.ValueType  # 2
+    INACTIVE_CHANNEL: ChannelEventUpdate.UpdateType.ValueType  # 3
+    PENDING_OPEN_CHANNEL: ChannelEventUpdate.UpdateType.ValueType  # 4
+    FULLY_RESOLVED_CHANNEL: ChannelEventUpdate.UpdateType.ValueType  # 5
+
+    OPEN_CHANNEL_FIELD_NUMBER: _builtins.int
+    CLOSED_CHANNEL_FIELD_NUMBER: _builtins.int
+    ACTIVE_CHANNEL_FIELD_NUMBER: _builtins.int
+    INACTIVE_CHANNEL_FIELD_NUMBER: _builtins.int
+    PENDING_OPEN_CHANNEL_FIELD_NUMBER: _builtins.int
+    FULLY_RESOLVED_CHANNEL_FIELD_NUMBER: _builtins.int
+    TYPE_FIELD_NUMBER: _builtins.int
+    type: Global___ChannelEventUpdate.UpdateType.ValueType
+    @_builtins.property
+    def open_channel(self) -> Global___Channel: ...
+    @_builtins.property
+    def closed_channel(self) -> Global___ChannelCloseSummary: ...
+    @_builtins.property
+    def active_channel(self) -> Global___ChannelPoint: ...
+    @_builtins.property
+    def inactive_channel(self) -> Global___ChannelPoint: ...
+    @_builtins.property
+    def pending_open_channel(self) -> Global___PendingUpdate: ...
+    @_builtins.property
+    def fully_resolved_channel(self) -> Global___ChannelPoint: ...
+    def __init__(
+        self,
+        *,
+        open_channel: Global___Channel | None = ...,
+        closed_channel: Global___ChannelCloseSummary | None = ...,
+        active_channel: Global___ChannelPoint | None = ...,
+        inactive_channel: Global___ChannelPoint | None = ...,
+        pending_open_channel: Global___PendingUpdate | None = ...,
+        fully_resolved_channel: Global___ChannelPoint | None = ...,
+        type: Global___ChannelEventUpdate.UpdateType.ValueType = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["active_channel", b"active_channel", "channel", b"channel", "closed_channel", b"closed_channel", "fully_resolved_channel", b"fully_resolved_channel", "inactive_channel", b"inactive_channel", "open_channel", b"open_channel", "pending_open_channel", b"pending_open_channel"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["active_channel", b"active_channel", "channel", b"channel", "closed_channel", b"closed_channel", "fully_resolved_channel", b"fully_resolved_channel", "inactive_channel", b"inactive_channel", "open_channel", b"open_channel", "pending_open_channel", b"pending_open_channel", "type", b"type"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    _WhichOneofReturnType_channel: _TypeAlias = _typing.Literal["open_channel", "closed_channel", "active_channel", "inactive_channel", "pending_open_channel", "fully_resolved_channel"]  # noqa: Y015
+    _WhichOneofArgType_channel: _TypeAlias = _typing.Literal["channel", b"channel"]  # noqa: Y015
+    def WhichOneof(self, oneof_group: _WhichOneofArgType_channel) -> _WhichOneofReturnType_channel | None: ...
+
+Global___ChannelEventUpdate: _TypeAlias = ChannelEventUpdate  # noqa: Y015
+
+@_typing.final
+class WalletAccountBalance(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    CONFIRMED_BALANCE_FIELD_NUMBER: _builtins.int
+    UNCONFIRMED_BALANCE_FIELD_NUMBER: _builtins.int
+    confirmed_balance: _builtins.int
+    """The confirmed balance of the account (with >= 1 confirmations)."""
+    unconfirmed_balance: _builtins.int
+    """The unconfirmed balance of the account (with 0 confirmations)."""
+    def __init__(
+        self,
+        *,
+        confirmed_balance: _builtins.int = ...,
+        unconfirmed_balance: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["confirmed_balance", b"confirmed_balance", "unconfirmed_balance", b"unconfirmed_balance"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___WalletAccountBalance: _TypeAlias = WalletAccountBalance  # noqa: Y015
+
+@_typing.final
+class WalletBalanceRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___WalletBalanceRequest: _TypeAlias = WalletBalanceRequest  # noqa: Y015
+
+@_typing.final
+class WalletBalanceResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class AccountBalanceEntry(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: _builtins.int
+        VALUE_FIELD_NUMBER: _builtins.int
+        key: _builtins.str
+        @_builtins.property
+        def value(self) -> Global___WalletAccountBalance: ...
+        def __init__(
+            self,
+            *,
+            key: _builtins.str = ...,
+            value: Global___WalletAccountBalance | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _typing.Literal["value", b"value"]  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["key", b"key", "value", b"value"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    TOTAL_BALANCE_FIELD_NUMBER: _builtins.int
+    CONFIRMED_BALANCE_FIELD_NUMBER: _builtins.int
+    UNCONFIRMED_BALANCE_FIELD_NUMBER: _builtins.int
+    ACCOUNT_BALANCE_FIELD_NUMBER: _builtins.int
+    total_balance: _builtins.int
+    """The balance of the wallet"""
+    confirmed_balance: _builtins.int
+    """The confirmed balance of a wallet(with >= 1 confirmations)"""
+    unconfirmed_balance: _builtins.int
+    """The unconfirmed balance of a wallet(with 0 confirmations)"""
+    @_builtins.property
+    def account_balance(self) -> _containers.MessageMap[_builtins.str, Global___WalletAccountBalance]:
+        """A mapping of each wallet account's name to its balance."""
+
+    def __init__(
+        self,
+        *,
+        total_balance: _builtins.int = ...,
+        confirmed_balance: _builtins.int = ...,
+        unconfirmed_balance: _builtins.int = ...,
+        account_balance: _abc.Mapping[_builtins.str, Global___WalletAccountBalance] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["account_balance", b"account_balance", "confirmed_balance", b"confirmed_balance", "total_balance", b"total_balance", "unconfirmed_balance", b"unconfirmed_balance"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___WalletBalanceResponse: _TypeAlias = WalletBalanceResponse  # noqa: Y015
+
+@_typing.final
+class Amount(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SAT_FIELD_NUMBER: _builtins.int
+    MSAT_FIELD_NUMBER: _builtins.int
+    sat: _builtins.int
+    """Value denominated in satoshis."""
+    msat: _builtins.int
+    """Value denominated in milli-satoshis."""
+    def __init__(
+        self,
+        *,
+        sat: _builtins.int = ...,
+        msat: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["msat", b"msat", "sat", b"sat"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___Amount: _TypeAlias = Amount  # noqa: Y015
+
+@_typing.final
+class ChannelBalanceRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ChannelBalanceRequest: _TypeAlias = ChannelBalanceRequest  # noqa: Y015
+
+@_typing.final
+class ChannelBalanceResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    BALANCE_FIELD_NUMBER: _builtins.int
+    PENDING_OPEN_BALANCE_FIELD_NUMBER: _builtins.int
+    LOCAL_BALANCE_FIELD_NUMBER: _builtins.int
+    REMOTE_BALANCE_FIELD_NUMBER: _builtins.int
+    UNSETTLED_LOCAL_BALANCE_FIELD_NUMBER: _builtins.int
+    UNSETTLED_REMOTE_BALANCE_FIELD_NUMBER: _builtins.int
+    PENDING_OPEN_LOCAL_BALANCE_FIELD_NUMBER: _builtins.int
+    PENDING_OPEN_REMOTE_BALANCE_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def balance(self) -> _builtins.int:
+        """Deprecated. Sum of channels balances denominated in satoshis"""
+
+    @balance.setter
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def balance(self, value: _builtins.int) -> None:
+        """Deprecated. Sum of channels balances denominated in satoshis"""
+
+    @_builtins.property
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def pending_open_balance(self) -> _builtins.int:
+        """Deprecated. Sum of channels pending balances denominated in satoshis"""
+
+    @pending_open_balance.setter
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def pending_open_balance(self, value: _builtins.int) -> None:
+        """Deprecated. Sum of channels pending balances denominated in satoshis"""
+
+    @_builtins.property
+    def local_balance(self) -> Global___Amount:
+        """Sum of channels local balances."""
+
+    @_builtins.property
+    def remote_balance(self) -> Global___Amount:
+        """Sum of channels remote balances."""
+
+    @_builtins.property
+    def unsettled_local_balance(self) -> Global___Amount:
+        """Sum of channels local unsettled balances."""
+
+    @_builtins.property
+    def unsettled_remote_balance(self) -> Global___Amount:
+        """Sum of channels remote unsettled balances."""
+
+    @_builtins.property
+    def pending_open_local_balance(self) -> Global___Amount:
+        """Sum of channels pending local balances."""
+
+    @_builtins.property
+    def pending_open_remote_balance(self) -> Global___Amount:
+        """Sum of channels pending remote balances."""
+
+    def __init__(
+        self,
+        *,
+        balance: _builtins.int = ...,
+        pending_open_balance: _builtins.int = ...,
+        local_balance: Global___Amount | None = ...,
+        remote_balance: Global___Amount | None = ...,
+        unsettled_local_balance: Global___Amount | None = ...,
+        unsettled_remote_balance: Global___Amount | None = ...,
+        pending_open_local_balance: Global___Amount | None = ...,
+        pending_open_remote_balance: Global___Amount | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["local_balance", b"local_balance", "pending_open_local_balance", b"pending_open_local_balance", "pending_open_remote_balance", b"pending_open_remote_balance", "remote_balance", b"remote_balance", "unsettled_local_balance", b"unsettled_local_balance", "unsettled_remote_balance", b"unsettled_remote_balance"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["balance", b"balance", "local_balance", b"local_balance", "pending_open_balance", b"pending_open_balance", "pending_open_local_balance", b"pending_open_local_balance", "pending_open_remote_balance", b"pending_open_remote_balance", "remote_balance", b"remote_balance", "unsettled_local_balance", b"unsettled_local_balance", "unsettled_remote_balance", b"unsettled_remote_balance"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ChannelBalanceResponse: _TypeAlias = ChannelBalanceResponse  # noqa: Y015
+
+@_typing.final
+class QueryRoutesRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class DestCustomRecordsEntry(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: _builtins.int
+        VALUE_FIELD_NUMBER: _builtins.int
+        key: _builtins.int
+        value: _builtins.bytes
+        def __init__(
+            self,
+            *,
+            key: _builtins.int = ...,
+            value: _builtins.bytes = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["key", b"key", "value", b"value"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    PUB_KEY_FIELD_NUMBER: _builtins.int
+    AMT_FIELD_NUMBER: _builtins.int
+    AMT_MSAT_FIELD_NUMBER: _builtins.int
+    FINAL_CLTV_DELTA_FIELD_NUMBER: _builtins.int
+    FEE_LIMIT_FIELD_NUMBER: _builtins.int
+    IGNORED_NODES_FIELD_NUMBER: _builtins.int
+    IGNORED_EDGES_FIELD_NUMBER: _builtins.int
+    SOURCE_PUB_KEY_FIELD_NUMBER: _builtins.int
+    USE_MISSION_CONTROL_FIELD_NUMBER: _builtins.int
+    IGNORED_PAIRS_FIELD_NUMBER: _builtins.int
+    CLTV_LIMIT_FIELD_NUMBER: _builtins.int
+    DEST_CUSTOM_RECORDS_FIELD_NUMBER: _builtins.int
+    OUTGOING_CHAN_ID_FIELD_NUMBER: _builtins.int
+    LAST_HOP_PUBKEY_FIELD_NUMBER: _builtins.int
+    ROUTE_HINTS_FIELD_NUMBER: _builtins.int
+    DEST_FEATURES_FIELD_NUMBER: _builtins.int
+    pub_key: _builtins.str
+    """The 33-byte hex-encoded public key for the payment destination"""
+    amt: _builtins.int
+    """
+    The amount to send expressed in satoshis.
+
+    The fields amt and amt_msat are mutually exclusive.
+    """
+    amt_msat: _builtins.int
+    """
+    The amount to send expressed in millisatoshis.
+
+    The fields amt and amt_msat are mutually exclusive.
+    """
+    final_cltv_delta: _builtins.int
+    """
+    An optional CLTV delta from the current height that should be used for the
+    timelock of the final hop. Note that unlike SendPayment, QueryRoutes does
+    not add any additional block padding on top of final_ctlv_delta. This
+    padding of a few blocks needs to be added manually or otherwise failures may
+    happen when a block comes in while the payment is in flight.
+    """
+    source_pub_key: _builtins.str
+    """
+    The source node where the request route should originated from. If empty,
+    self is assumed.
+    """
+    use_mission_control: _builtins.bool
+    """
+    If set to true, edge probabilities from mission control will be used to get
+    the optimal route.
+    """
+    cltv_limit: _builtins.int
+    """
+    An optional maximum total time lock for the route. If the source is empty or
+    ourselves, this should not exceed lnd's `--max-cltv-expiry` setting. If
+    zero, then the value of `--max-cltv-expiry` is used as the limit.
+    """
+    outgoing_chan_id: _builtins.int
+    """
+    The channel id of the channel that must be taken to the first hop. If zero,
+    any channel may be used.
+    """
+    last_hop_pubkey: _builtins.bytes
+    """
+    The pubkey of the last hop of the route. If empty, any hop may be used.
+    """
+    @_builtins.property
+    def fee_limit(self) -> Global___FeeLimit:
+        """
+        The maximum number of satoshis that will be paid as a fee of the payment.
+        This value can be represented either as a percentage of the amount being
+        sent, or as a fixed amount of the maximum fee the user is willing the pay to
+        send the payment.
+        """
+
+    @_builtins.property
+    def ignored_nodes(self) -> _containers.RepeatedScalarFieldContainer[_builtins.bytes]:
+        """
+        A list of nodes to ignore during path finding. When using REST, these fields
+        must be encoded as base64.
+        """
+
+    @_builtins.property
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def ignored_edges(self) -> _containers.RepeatedCompositeFieldContainer[Global___EdgeLocator]:
+        """
+        Deprecated. A list of edges to ignore during path finding.
+        """
+
+    @_builtins.property
+    def ignored_pairs(self) -> _containers.RepeatedCompositeFieldContainer[Global___NodePair]:
+        """
+        A list of directed node pairs that will be ignored during path finding.
+        """
+
+    @_builtins.property
+    def dest_custom_records(self) -> _containers.ScalarMap[_builtins.int, _builtins.bytes]:
+        """
+        An optional field that can be used to pass an arbitrary set of TLV records
+        to a peer which understands the new records. This can be used to pass
+        application specific data during the payment attempt. If the destination
+        does not support the specified records, an error will be returned.
+        Record types are required to be in the custom range >= 65536. When using
+        REST, the values must be encoded as base64.
+        """
+
+    @_builtins.property
+    def route_hints(self) -> _containers.RepeatedCompositeFieldContainer[Global___RouteHint]:
+        """
+        Optional route hints to reach the destination through private channels.
+        """
+
+    @_builtins.property
+    def dest_features(self) -> _containers.RepeatedScalarFieldContainer[Global___FeatureBit.ValueType]:
+        """
+        Features assumed to be supported by the final node. All transitive feature
+        dependencies must also be set properly. For a given feature bit pair, either
+        optional or remote may be set, but not both. If this field is nil or empty,
+        the router will try to load destination features from the graph as a
+        fallback.
+        """
+
+    def __init__(
+        self,
+        *,
+        pub_key: _builtins.str = ...,
+        amt: _builtins.int = ...,
+        amt_msat: _builtins.int = ...,
+        final_cltv_delta: _builtins.int = ...,
+        fee_limit: Global___FeeLimit | None = ...,
+        ignored_nodes: _abc.Iterable[_builtins.bytes] | None = ...,
+        ignored_edges: _abc.Iterable[Global___EdgeLocator] | None = ...,
+        source_pub_key: _builtins.str = ...,
+        use_mission_control: _builtins.bool = ...,
+        ignored_pairs: _abc.Iterable[Global___NodePair] | None = ...,
+        cltv_limit: _builtins.int = ...,
+        dest_custom_records: _abc.Mapping[_builtins.int, _builtins.bytes] | None = ...,
+        outgoing_chan_id: _builtins.int = ...,
+        last_hop_pubkey: _builtins.bytes = ...,
+        route_hints: _abc.Iterable[Global___RouteHint] | None = ...,
+        dest_features: _abc.Iterable[Global___FeatureBit.ValueType] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["fee_limit", b"fee_limit"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["amt", b"amt", "amt_msat", b"amt_msat", "cltv_limit", b"cltv_limit", "dest_custom_records", b"dest_custom_records", "dest_features", b"dest_features", "fee_limit", b"fee_limit", "final_cltv_delta", b"final_cltv_delta", "ignored_edges", b"ignored_edges", "ignored_nodes", b"ignored_nodes", "ignored_pairs", b"ignored_pairs", "last_hop_pubkey", b"last_hop_pubkey", "outgoing_chan_id", b"outgoing_chan_id", "pub_key", b"pub_key", "route_hints", b"route_hints", "source_pub_key", b"source_pub_key", "use_mission_control", b"use_mission_control"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___QueryRoutesRequest: _TypeAlias = QueryRoutesRequest  # noqa: Y015
+
+@_typing.final
+class NodePair(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    FROM_FIELD_NUMBER: _builtins.int
+    TO_FIELD_NUMBER: _builtins.int
+    to: _builtins.bytes
+    """
+    The receiving node of the pair. When using REST, this field must be encoded
+    as base64.
+    """
+    def __init__(
+        self,
+        *,
+        to: _builtins.bytes = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["from", b"from", "to", b"to"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___NodePair: _TypeAlias = NodePair  # noqa: Y015
+
+@_typing.final
+class EdgeLocator(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    CHANNEL_ID_FIELD_NUMBER: _builtins.int
+    DIRECTION_REVERSE_FIELD_NUMBER: _builtins.int
+    channel_id: _builtins.int
+    """The short channel id of this edge."""
+    direction_reverse: _builtins.bool
+    """
+    The direction of this edge. If direction_reverse is false, the direction
+    of this edge is from the channel endpoint with the lexicographically smaller
+    pub key to the endpoint with the larger pub key. If direction_reverse is
+    is true, the edge goes the other way.
+    """
+    def __init__(
+        self,
+        *,
+        channel_id: _builtins.int = ...,
+        direction_reverse: _builtins.bool = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["channel_id", b"channel_id", "direction_reverse", b"direction_reverse"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___EdgeLocator: _TypeAlias = EdgeLocator  # noqa: Y015
+
+@_typing.final
+class QueryRoutesResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ROUTES_FIELD_NUMBER: _builtins.int
+    SUCCESS_PROB_FIELD_NUMBER: _builtins.int
+    success_prob: _builtins.float
+    """
+    The success probability of the returned route based on the current mission
+    control state. [EXPERIMENTAL]
+    """
+    @_builtins.property
+    def routes(self) -> _containers.RepeatedCompositeFieldContainer[Global___Route]:
+        """
+        The route that results from the path finding operation. This is still a
+        repeated field to retain backwards compatibility.
+        """
+
+    def __init__(
+        self,
+        *,
+        routes: _abc.Iterable[Global___Route] | None = ...,
+        success_prob: _builtins.float = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["routes", b"routes", "success_prob", b"success_prob"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___QueryRoutesResponse: _TypeAlias = QueryRoutesResponse  # noqa: Y015
+
+@_typing.final
+class Hop(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class CustomRecordsEntry(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: _builtins.int
+        VALUE_FIELD_NUMBER: _builtins.int
+        key: _builtins.int
+        value: _builtins.bytes
+        def __init__(
+            self,
+            *,
+            key: _builtins.int = ...,
+            value: _builtins.bytes = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["key", b"key", "value", b"value"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    CHAN_ID_FIELD_NUMBER: _builtins.int
+    CHAN_CAPACITY_FIELD_NUMBER: _builtins.int
+    AMT_TO_FORWARD_FIELD_NUMBER: _builtins.int
+    FEE_FIELD_NUMBER: _builtins.int
+    EXPIRY_FIELD_NUMBER: _builtins.int
+    AMT_TO_FORWARD_MSAT_FIELD_NUMBER: _builtins.int
+    FEE_MSAT_FIELD_NUMBER: _builtins.int
+    PUB_KEY_FIELD_NUMBER: _builtins.int
+    TLV_PAYLOAD_FIELD_NUMBER: _builtins.int
+    MPP_RECORD_FIELD_NUMBER: _builtins.int
+    AMP_RECORD_FIELD_NUMBER: _builtins.int
+    CUSTOM_RECORDS_FIELD_NUMBER: _builtins.int
+    chan_id: _builtins.int
+    """
+    The unique channel ID for the channel. The first 3 bytes are the block
+    height, the next 3 the index within the block, and the last 2 bytes are the
+    output index for the channel.
+    """
+    @_builtins.property
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def chan_capacity(self) -> _builtins.int: ...
+    @chan_capacity.setter
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def chan_capacity(self, value: _builtins.int) -> None: ...
+    @_builtins.property
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def amt_to_forward(self) -> _builtins.int: ...
+    @amt_to_forward.setter
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def amt_to_forward(self, value: _builtins.int) -> None: ...
+    @_builtins.property
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def fee(self) -> _builtins.int: ...
+    @fee.setter
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def fee(self, value: _builtins.int) -> None: ...
+    expiry: _builtins.int
+    amt_to_forward_msat: _builtins.int
+    fee_msat: _builtins.int
+    pub_key: _builtins.str
+    """
+    An optional public key of the hop. If the public key is given, the payment
+    can be executed without relying on a copy of the channel graph.
+    """
+    tlv_payload: _builtins.bool
+    """
+    If set to true, then this hop will be encoded using the new variable length
+    TLV format. Note that if any custom tlv_records below are specified, then
+    this field MUST be set to true for them to be encoded properly.
+    """
+    @_builtins.property
+    def mpp_record(self) -> Global___MPPRecord:
+        """
+        An optional TLV record that signals the use of an MPP payment. If present,
+        the receiver will enforce that the same mpp_record is included in the final
+        hop payload of all non-zero payments in the HTLC set. If empty, a regular
+        single-shot payment is or was attempted.
+        """
+
+    @_builtins.property
+    def amp_record(self) -> Global___AMPRecord:
+        """
+        An optional TLV record that signals the use of an AMP payment. If present,
+        the receiver will treat all received payments including the same
+        (payment_addr, set_id) pair  as being part of one logical payment. The
+        payment will be settled by XORing the root_share's together and deriving the
+        child hashes and preimages according to BOLT XX. Must be used in conjunction
+        with mpp_record.
+        """
+
+    @_builtins.property
+    def custom_records(self) -> _containers.ScalarMap[_builtins.int, _builtins.bytes]:
+        """
+        An optional set of key-value TLV records. This is useful within the context
+        of the SendToRoute call as it allows callers to specify arbitrary K-V pairs
+        to drop off at each hop within the onion.
+        """
+
+    def __init__(
+        self,
+        *,
+        chan_id: _builtins.int = ...,
+        chan_capacity: _builtins.int = ...,
+        amt_to_forward: _builtins.int = ...,
+        fee: _builtins.int = ...,
+        expiry: _builtins.int = ...,
+        amt_to_forward_msat: _builtins.int = ...,
+        fee_msat: _builtins.int = ...,
+        pub_key: _builtins.str = ...,
+        tlv_payload: _builtins.bool = ...,
+        mpp_record: Global___MPPRecord | None = ...,
+        amp_record: Global___AMPRecord | None = ...,
+        custom_records: _abc.Mapping[_builtins.int, _builtins.bytes] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["amp_record", b"amp_record", "mpp_record", b"mpp_record"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["amp_record", b"amp_record", "amt_to_forward", b"amt_to_forward", "amt_to_forward_msat", b"amt_to_forward_msat", "chan_capacity", b"chan_capacity", "chan_id", b"chan_id", "custom_records", b"custom_records", "expiry", b"expiry", "fee", b"fee", "fee_msat", b"fee_msat", "mpp_record", b"mpp_record", "pub_key", b"pub_key", "tlv_payload", b"tlv_payload"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___Hop: _TypeAlias = Hop  # noqa: Y015
+
+@_typing.final
+class MPPRecord(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PAYMENT_ADDR_FIELD_NUMBER: _builtins.int
+    TOTAL_AMT_MSAT_FIELD_NUMBER: _builtins.int
+    payment_addr: _builtins.bytes
+    """
+    A unique, random identifier used to authenticate the sender as the intended
+    payer of a multi-path payment. The payment_addr must be the same for all
+    subpayments, and match the payment_addr provided in the receiver's invoice.
+    The same payment_addr must be used on all subpayments.
+    """
+    total_amt_msat: _builtins.int
+    """
+    The total amount in milli-satoshis being sent as part of a larger multi-path
+    payment. The caller is responsible for ensuring subpayments to the same node
+    and payment_hash sum exactly to total_amt_msat. The same
+    total_amt_msat must be used on all subpayments.
+    """
+    def __init__(
+        self,
+        *,
+        payment_addr: _builtins.bytes = ...,
+        total_amt_msat: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["payment_addr", b"payment_addr", "total_amt_msat", b"total_amt_msat"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___MPPRecord: _TypeAlias = MPPRecord  # noqa: Y015
+
+@_typing.final
+class AMPRecord(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ROOT_SHARE_FIELD_NUMBER: _builtins.int
+    SET_ID_FIELD_NUMBER: _builtins.int
+    CHILD_INDEX_FIELD_NUMBER: _builtins.int
+    root_share: _builtins.bytes
+    set_id: _builtins.bytes
+    child_index: _builtins.int
+    def __init__(
+        self,
+        *,
+        root_share: _builtins.bytes = ...,
+        set_id: _builtins.bytes = ...,
+        child_index: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["child_index", b"child_index", "root_share", b"root_share", "set_id", b"set_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___AMPRecord: _TypeAlias = AMPRecord  # noqa: Y015
+
+@_typing.final
+class Route(_message.Message):
+    """
+    A path through the channel graph which runs over one or more channels in
+    succession. This struct carries all the information required to craft the
+    Sphinx onion packet, and send the payment along the first hop in the path. A
+    route is only selected as valid if all the channels have sufficient capacity to
+    carry the initial payment amount after fees are accounted for.
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    TOTAL_TIME_LOCK_FIELD_NUMBER: _builtins.int
+    TOTAL_FEES_FIELD_NUMBER: _builtins.int
+    TOTAL_AMT_FIELD_NUMBER: _builtins.int
+    HOPS_FIELD_NUMBER: _builtins.int
+    TOTAL_FEES_MSAT_FIELD_NUMBER: _builtins.int
+    TOTAL_AMT_MSAT_FIELD_NUMBER: _builtins.int
+    total_time_lock: _builtins.int
+    """
+    The cumulative (final) time lock across the entire route. This is the CLTV
+    value that should be extended to the first hop in the route. All other hops
+    will decrement the time-lock as advertised, leaving enough time for all
+    hops to wait for or present the payment preimage to complete the payment.
+    """
+    @_builtins.property
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def total_fees(self) -> _builtins.int:
+        """
+        The sum of the fees paid at each hop within the final route. In the case
+        of a one-hop payment, this value will be zero as we don't need to pay a fee
+        to ourselves.
+        """
+
+    @total_fees.setter
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def total_fees(self, value: _builtins.int) -> None:
+        """
+        The sum of the fees paid at each hop within the final route. In the case
+        of a one-hop payment, this value will be zero as we don't need to pay a fee
+        to ourselves.
+        """
+
+    @_builtins.property
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def total_amt(self) -> _builtins.int:
+        """
+        The total amount of funds required to complete a payment over this route.
+        This value includes the cumulative fees at each hop. As a result, the HTLC
+        extended to the first-hop in the route will need to have at least this many
+        satoshis, otherwise the route will fail at an intermediate node due to an
+        insufficient amount of fees.
+        """
+
+    @total_amt.setter
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def total_amt(self, value: _builtins.int) -> None:
+        """
+        The total amount of funds required to complete a payment over this route.
+        This value includes the cumulative fees at each hop. As a result, the HTLC
+        extended to the first-hop in the route will need to have at least this many
+        satoshis, otherwise the route will fail at an intermediate node due to an
+        insufficient amount of fees.
+        """
+
+    total_fees_msat: _builtins.int
+    """
+    The total fees in millisatoshis.
+    """
+    total_amt_msat: _builtins.int
+    """
+    The total amount in millisatoshis.
+    """
+    @_builtins.property
+    def hops(self) -> _containers.RepeatedCompositeFieldContainer[Global___Hop]:
+        """
+        Contains details concerning the specific forwarding details at each hop.
+        """
+
+    def __init__(
+        self,
+        *,
+        total_time_lock: _builtins.int = ...,
+        total_fees: _builtins.int = ...,
+        total_amt: _builtins.int = ...,
+        hops: _abc.Iterable[Global___Hop] | None = ...,
+        total_fees_msat: _builtins.int = ...,
+        total_amt_msat: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["hops", b"hops", "total_amt", b"total_amt", "total_amt_msat", b"total_amt_msat", "total_fees", b"total_fees", "total_fees_msat", b"total_fees_msat", "total_time_lock", b"total_time_lock"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___Route: _TypeAlias = Route  # noqa: Y015
+
+@_typing.final
+class NodeInfoRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PUB_KEY_FIELD_NUMBER: _builtins.int
+    INCLUDE_CHANNELS_FIELD_NUMBER: _builtins.int
+    pub_key: _builtins.str
+    """The 33-byte hex-encoded compressed public of the target node"""
+    include_channels: _builtins.bool
+    """If true, will include all known channels associated with the node."""
+    def __init__(
+        self,
+        *,
+        pub_key: _builtins.str = ...,
+        include_channels: _builtins.bool = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["include_channels", b"include_channels", "pub_key", b"pub_key"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___NodeInfoRequest: _TypeAlias = NodeInfoRequest  # noqa: Y015
+
+@_typing.final
+class NodeInfo(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    NODE_FIELD_NUMBER: _builtins.int
+    NUM_CHANNELS_FIELD_NUMBER: _builtins.int
+    TOTAL_CAPACITY_FIELD_NUMBER: _builtins.int
+    CHANNELS_FIELD_NUMBER: _builtins.int
+    num_channels: _builtins.int
+    """The total number of channels for the node."""
+    total_capacity: _builtins.int
+    """The sum of all channels capacity for the node, denominated in satoshis."""
+    @_builtins.property
+    def node(self) -> Global___LightningNode:
+        """
+        An individual vertex/node within the channel graph. A node is
+        connected to other nodes by one or more channel edges emanating from it. As
+        the graph is directed, a node will also have an incoming edge attached to
+        it for each outgoing edge.
+        """
+
+    @_builtins.property
+    def channels(self) -> _containers.RepeatedCompositeFieldContainer[Global___ChannelEdge]:
+        """A list of all public channels for the node."""
+
+    def __init__(
+        self,
+        *,
+        node: Global___LightningNode | None = ...,
+        num_channels: _builtins.int = ...,
+        total_capacity: _builtins.int = ...,
+        channels: _abc.Iterable[Global___ChannelEdge] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["node", b"node"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["channels", b"channels", "node", b"node", "num_channels", b"num_channels", "total_capacity", b"total_capacity"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___NodeInfo: _TypeAlias = NodeInfo  # noqa: Y015
+
+@_typing.final
+class LightningNode(_message.Message):
+    """
+    An individual vertex/node within the channel graph. A node is
+    connected to other nodes by one or more channel edges emanating from it. As the
+    graph is directed, a node will also have an incoming edge attached to it for
+    each outgoing edge.
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class FeaturesEntry(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: _builtins.int
+        VALUE_FIELD_NUMBER: _builtins.int
+        key: _builtins.int
+        @_builtins.property
+        def value(self) -> Global___Feature: ...
+        def __init__(
+            self,
+            *,
+            key: _builtins.int = ...,
+            value: Global___Feature | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _typing.Literal["value", b"value"]  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["key", b"key", "value", b"value"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    LAST_UPDATE_FIELD_NUMBER: _builtins.int
+    PUB_KEY_FIELD_NUMBER: _builtins.int
+    ALIAS_FIELD_NUMBER: _builtins.int
+    ADDRESSES_FIELD_NUMBER: _builtins.int
+    COLOR_FIELD_NUMBER: _builtins.int
+    FEATURES_FIELD_NUMBER: _builtins.int
+    last_update: _builtins.int
+    pub_key: _builtins.str
+    alias: _builtins.str
+    color: _builtins.str
+    @_builtins.property
+    def addresses(self) -> _containers.RepeatedCompositeFieldContainer[Global___NodeAddress]: ...
+    @_builtins.property
+    def features(self) -> _containers.MessageMap[_builtins.int, Global___Feature]: ...
+    def __init__(
+        self,
+        *,
+        last_update: _builtins.int = ...,
+        pub_key: _builtins.str = ...,
+        alias: _builtins.str = ...,
+        addresses: _abc.Iterable[Global___NodeAddress] | None = ...,
+        color: _builtins.str = ...,
+        features: _abc.Mapping[_builtins.int, Global___Feature] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["addresses", b"addresses", "alias", b"alias", "color", b"color", "features", b"features", "last_update", b"last_update", "pub_key", b"pub_key"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___LightningNode: _TypeAlias = LightningNode  # noqa: Y015
+
+@_typing.final
+class NodeAddress(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    NETWORK_FIELD_NUMBER: _builtins.int
+    ADDR_FIELD_NUMBER: _builtins.int
+    network: _builtins.str
+    addr: _builtins.str
+    def __init__(
+        self,
+        *,
+        network: _builtins.str = ...,
+        addr: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["addr", b"addr", "network", b"network"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___NodeAddress: _TypeAlias = NodeAddress  # noqa: Y015
+
+@_typing.final
+class RoutingPolicy(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    TIME_LOCK_DELTA_FIELD_NUMBER: _builtins.int
+    MIN_HTLC_FIELD_NUMBER: _builtins.int
+    FEE_BASE_MSAT_FIELD_NUMBER: _builtins.int
+    FEE_RATE_MILLI_MSAT_FIELD_NUMBER: _builtins.int
+    DISABLED_FIELD_NUMBER: _builtins.int
+    MAX_HTLC_MSAT_FIELD_NUMBER: _builtins.int
+    LAST_UPDATE_FIELD_NUMBER: _builtins.int
+    time_lock_delta: _builtins.int
+    min_htlc: _builtins.int
+    fee_base_msat: _builtins.int
+    fee_rate_milli_msat: _builtins.int
+    disabled: _builtins.bool
+    max_htlc_msat: _builtins.int
+    last_update: _builtins.int
+    def __init__(
+        self,
+        *,
+        time_lock_delta: _builtins.int = ...,
+        min_htlc: _builtins.int = ...,
+        fee_base_msat: _builtins.int = ...,
+        fee_rate_milli_msat: _builtins.int = ...,
+        disabled: _builtins.bool = ...,
+        max_htlc_msat: _builtins.int = ...,
+        last_update: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["disabled", b"disabled", "fee_base_msat", b"fee_base_msat", "fee_rate_milli_msat", b"fee_rate_milli_msat", "last_update", b"last_update", "max_htlc_msat", b"max_htlc_msat", "min_htlc", b"min_htlc", "time_lock_delta", b"time_lock_delta"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___RoutingPolicy: _TypeAlias = RoutingPolicy  # noqa: Y015
+
+@_typing.final
+class ChannelEdge(_message.Message):
+    """
+    A fully authenticated channel along with all its unique attributes.
+    Once an authenticated channel announcement has been processed on the network,
+    then an instance of ChannelEdgeInfo encapsulating the channels attributes is
+    stored. The other portions relevant to routing policy of a channel are stored
+    within a ChannelEdgePolicy for each direction of the channel.
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    CHANNEL_ID_FIELD_NUMBER: _builtins.int
+    CHAN_POINT_FIELD_NUMBER: _builtins.int
+    LAST_UPDATE_FIELD_NUMBER: _builtins.int
+    NODE1_PUB_FIELD_NUMBER: _builtins.int
+    NODE2_PUB_FIELD_NUMBER: _builtins.int
+    CAPACITY_FIELD_NUMBER: _builtins.int
+    NODE1_POLICY_FIELD_NUMBER: _builtins.int
+    NODE2_POLICY_FIELD_NUMBER: _builtins.int
+    channel_id: _builtins.int
+    """
+    The unique channel ID for the channel. The first 3 bytes are the block
+    height, the next 3 the index within the block, and the last 2 bytes are the
+    output index for the channel.
+    """
+    chan_point: _builtins.str
+    @_builtins.property
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def last_update(self) -> _builtins.int: ...
+    @last_update.setter
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def last_update(self, value: _builtins.int) -> None: ...
+    node1_pub: _builtins.str
+    node2_pub: _builtins.str
+    capacity: _builtins.int
+    @_builtins.property
+    def node1_policy(self) -> Global___RoutingPolicy: ...
+    @_builtins.property
+    def node2_policy(self) -> Global___RoutingPolicy: ...
+    def __init__(
+        self,
+        *,
+        channel_id: _builtins.int = ...,
+        chan_point: _builtins.str = ...,
+        last_update: _builtins.int = ...,
+        node1_pub: _builtins.str = ...,
+        node2_pub: _builtins.str = ...,
+        capacity: _builtins.int = ...,
+        node1_policy: Global___RoutingPolicy | None = ...,
+        node2_policy: Global___RoutingPolicy | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["node1_policy", b"node1_policy", "node2_policy", b"node2_policy"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["capacity", b"capacity", "chan_point", b"chan_point", "channel_id", b"channel_id", "last_update", b"last_update", "node1_policy", b"node1_policy", "node1_pub", b"node1_pub", "node2_policy", b"node2_policy", "node2_pub", b"node2_pub"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ChannelEdge: _TypeAlias = ChannelEdge  # noqa: Y015
+
+@_typing.final
+class ChannelGraphRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    INCLUDE_UNANNOUNCED_FIELD_NUMBER: _builtins.int
+    include_unannounced: _builtins.bool
+    """
+    Whether unannounced channels are included in the response or not. If set,
+    unannounced channels are included. Unannounced channels are both private
+    channels, and public channels that are not yet announced to the network.
+    """
+    def __init__(
+        self,
+        *,
+        include_unannounced: _builtins.bool = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["include_unannounced", b"include_unannounced"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ChannelGraphRequest: _TypeAlias = ChannelGraphRequest  # noqa: Y015
+
+@_typing.final
+class ChannelGraph(_message.Message):
+    """Returns a new instance of the directed channel graph."""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    NODES_FIELD_NUMBER: _builtins.int
+    EDGES_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def nodes(self) -> _containers.RepeatedCompositeFieldContainer[Global___LightningNode]:
+        """The list of `LightningNode`s in this channel graph"""
+
+    @_builtins.property
+    def edges(self) -> _containers.RepeatedCompositeFieldContainer[Global___ChannelEdge]:
+        """The list of `ChannelEdge`s in this channel graph"""
+
+    def __init__(
+        self,
+        *,
+        nodes: _abc.Iterable[Global___LightningNode] | None = ...,
+        edges: _abc.Iterable[Global___ChannelEdge] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["edges", b"edges", "nodes", b"nodes"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ChannelGraph: _TypeAlias = ChannelGraph  # noqa: Y015
+
+@_typing.final
+class NodeMetricsRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    TYPES_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def types(self) -> _containers.RepeatedScalarFieldContainer[Global___NodeMetricType.ValueType]:
+        """The requested node metrics."""
+
+    def __init__(
+        self,
+        *,
+        types: _abc.Iterable[Global___NodeMetricType.ValueType] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["types", b"types"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___NodeMetricsRequest: _TypeAlias = NodeMetricsRequest  # noqa: Y015
+
+@_typing.final
+class NodeMetricsResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class BetweennessCentralityEntry(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: _builtins.int
+        VALUE_FIELD_NUMBER: _builtins.int
+        key: _builtins.str
+        @_builtins.property
+        def value(self) -> Global___FloatMetric: ...
+        def __init__(
+            self,
+            *,
+            key: _builtins.str = ...,
+            value: Global___FloatMetric | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _typing.Literal["value", b"value"]  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["key", b"key", "value", b"value"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    BETWEENNESS_CENTRALITY_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def betweenness_centrality(self) -> _containers.MessageMap[_builtins.str, Global___FloatMetric]:
+        """
+        Betweenness centrality is the sum of the ratio of shortest paths that pass
+        through the node for each pair of nodes in the graph (not counting paths
+        starting or ending at this node).
+        Map of node pubkey to betweenness centrality of the node. Normalized
+        values are in the [0,1] closed interval.
+        """
+
+    def __init__(
+        self,
+        *,
+        betweenness_centrality: _abc.Mapping[_builtins.str, Global___FloatMetric] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["betweenness_centrality", b"betweenness_centrality"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___NodeMetricsResponse: _TypeAlias = NodeMetricsResponse  # noqa: Y015
+
+@_typing.final
+class FloatMetric(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    VALUE_FIELD_NUMBER: _builtins.int
+    NORMALIZED_VALUE_FIELD_NUMBER: _builtins.int
+    value: _builtins.float
+    """Arbitrary float value."""
+    normalized_value: _builtins.float
+    """The value normalized to [0,1] or [-1,1]."""
+    def __init__(
+        self,
+        *,
+        value: _builtins.float = ...,
+        normalized_value: _builtins.float = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["normalized_value", b"normalized_value", "value", b"value"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___FloatMetric: _TypeAlias = FloatMetric  # noqa: Y015
+
+@_typing.final
+class ChanInfoRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    CHAN_ID_FIELD_NUMBER: _builtins.int
+    chan_id: _builtins.int
+    """
+    The unique channel ID for the channel. The first 3 bytes are the block
+    height, the next 3 the index within the block, and the last 2 bytes are the
+    output index for the channel.
+    """
+    def __init__(
+        self,
+        *,
+        chan_id: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["chan_id", b"chan_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ChanInfoRequest: _TypeAlias = ChanInfoRequest  # noqa: Y015
+
+@_typing.final
+class NetworkInfoRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___NetworkInfoRequest: _TypeAlias = NetworkInfoRequest  # noqa: Y015
+
+@_typing.final
+class NetworkInfo(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    GRAPH_DIAMETER_FIELD_NUMBER: _builtins.int
+    AVG_OUT_DEGREE_FIELD_NUMBER: _builtins.int
+    MAX_OUT_DEGREE_FIELD_NUMBER: _builtins.int
+    NUM_NODES_FIELD_NUMBER: _builtins.int
+    NUM_CHANNELS_FIELD_NUMBER: _builtins.int
+    TOTAL_NETWORK_CAPACITY_FIELD_NUMBER: _builtins.int
+    AVG_CHANNEL_SIZE_FIELD_NUMBER: _builtins.int
+    MIN_CHANNEL_SIZE_FIELD_NUMBER: _builtins.int
+    MAX_CHANNEL_SIZE_FIELD_NUMBER: _builtins.int
+    MEDIAN_CHANNEL_SIZE_SAT_FIELD_NUMBER: _builtins.int
+    NUM_ZOMBIE_CHANS_FIELD_NUMBER: _builtins.int
+    graph_diameter: _builtins.int
+    avg_out_degree: _builtins.float
+    max_out_degree: _builtins.int
+    num_nodes: _builtins.int
+    num_channels: _builtins.int
+    total_network_capacity: _builtins.int
+    avg_channel_size: _builtins.float
+    min_channel_size: _builtins.int
+    max_channel_size: _builtins.int
+    median_channel_size_sat: _builtins.int
+    num_zombie_chans: _builtins.int
+    """The number of edges marked as zombies."""
+    def __init__(
+        self,
+        *,
+        graph_diameter: _builtins.int = ...,
+        avg_out_degree: _builtins.float = ...,
+        max_out_degree: _builtins.int = ...,
+        num_nodes: _builtins.int = ...,
+        num_channels: _builtins.int = ...,
+        total_network_capacity: _builtins.int = ...,
+        avg_channel_size: _builtins.float = ...,
+        min_channel_size: _builtins.int = ...,
+        max_channel_size: _builtins.int = ...,
+        median_channel_size_sat: _builtins.int = ...,
+        num_zombie_chans: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["avg_channel_size", b"avg_channel_size", "avg_out_degree", b"avg_out_degree", "graph_diameter", b"graph_diameter", "max_channel_size", b"max_channel_size", "max_out_degree", b"max_out_degree", "median_channel_size_sat", b"median_channel_size_sat", "min_channel_size", b"min_channel_size", "num_channels", b"num_channels", "num_nodes", b"num_nodes", "num_zombie_chans", b"num_zombie_chans", "total_network_capacity", b"total_network_capacity"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___NetworkInfo: _TypeAlias = NetworkInfo  # noqa: Y015
+
+@_typing.final
+class StopRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___StopRequest: _TypeAlias = StopRequest  # noqa: Y015
+
+@_typing.final
+class StopResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___StopResponse: _TypeAlias = StopResponse  # noqa: Y015
+
+@_typing.final
+class GraphTopologySubscription(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GraphTopologySubscription: _TypeAlias = GraphTopologySubscription  # noqa: Y015
+
+@_typing.final
+class GraphTopologyUpdate(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    NODE_UPDATES_FIELD_NUMBER: _builtins.int
+    CHANNEL_UPDATES_FIELD_NUMBER: _builtins.int
+    CLOSED_CHANS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def node_updates(self) -> _containers.RepeatedCompositeFieldContainer[Global___NodeUpdate]: ...
+    @_builtins.property
+    def channel_updates(self) -> _containers.RepeatedCompositeFieldContainer[Global___ChannelEdgeUpdate]: ...
+    @_builtins.property
+    def closed_chans(self) -> _containers.RepeatedCompositeFieldContainer[Global___ClosedChannelUpdate]: ...
+    def __init__(
+        self,
+        *,
+        node_updates: _abc.Iterable[Global___NodeUpdate] | None = ...,
+        channel_updates: _abc.Iterable[Global___ChannelEdgeUpdate] | None = ...,
+        closed_chans: _abc.Iterable[Global___ClosedChannelUpdate] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["channel_updates", b"channel_updates", "closed_chans", b"closed_chans", "node_updates", b"node_updates"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GraphTopologyUpdate: _TypeAlias = GraphTopologyUpdate  # noqa: Y015
+
+@_typing.final
+class NodeUpdate(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class FeaturesEntry(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: _builtins.int
+        VALUE_FIELD_NUMBER: _builtins.int
+        key: _builtins.int
+        @_builtins.property
+        def value(self) -> Global___Feature: ...
+        def __init__(
+            self,
+            *,
+            key: _builtins.int = ...,
+            value: Global___Feature | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _typing.Literal["value", b"value"]  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["key", b"key", "value", b"value"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    ADDRESSES_FIELD_NUMBER: _builtins.int
+    IDENTITY_KEY_FIELD_NUMBER: _builtins.int
+    GLOBAL_FEATURES_FIELD_NUMBER: _builtins.int
+    ALIAS_FIELD_NUMBER: _builtins.int
+    COLOR_FIELD_NUMBER: _builtins.int
+    NODE_ADDRESSES_FIELD_NUMBER: _builtins.int
+    FEATURES_FIELD_NUMBER: _builtins.int
+    identity_key: _builtins.str
+    @_builtins.property
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def global_features(self) -> _builtins.bytes:
+        """
+        Deprecated, use features.
+        """
+
+    @global_features.setter
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def global_features(self, value: _builtins.bytes) -> None:
+        """
+        Deprecated, use features.
+        """
+
+    alias: _builtins.str
+    color: _builtins.str
+    @_builtins.property
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def addresses(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]:
+        """
+        Deprecated, use node_addresses.
+        """
+
+    @_builtins.property
+    def node_addresses(self) -> _containers.RepeatedCompositeFieldContainer[Global___NodeAddress]: ...
+    @_builtins.property
+    def features(self) -> _containers.MessageMap[_builtins.int, Global___Feature]:
+        """
+        Features that the node has advertised in the init message, node
+        announcements and invoices.
+        """
+
+    def __init__(
+        self,
+        *,
+        addresses: _abc.Iterable[_builtins.str] | None = ...,
+        identity_key: _builtins.str = ...,
+        global_features: _builtins.bytes = ...,
+        alias: _builtins.str = ...,
+        color: _builtins.str = ...,
+        node_addresses: _abc.Iterable[Global___NodeAddress] | None = ...,
+        features: _abc.Mapping[_builtins.int, Global___Feature] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["addresses", b"addresses", "alias", b"alias", "color", b"color", "features", b"features", "global_features", b"global_features", "identity_key", b"identity_key", "node_addresses", b"node_addresses"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___NodeUpdate: _TypeAlias = NodeUpdate  # noqa: Y015
+
+@_typing.final
+class ChannelEdgeUpdate(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    CHAN_ID_FIELD_NUMBER: _builtins.int
+    CHAN_POINT_FIELD_NUMBER: _builtins.int
+    CAPACITY_FIELD_NUMBER: _builtins.int
+    ROUTING_POLICY_FIELD_NUMBER: _builtins.int
+    ADVERTISING_NODE_FIELD_NUMBER: _builtins.int
+    CONNECTING_NODE_FIELD_NUMBER: _builtins.int
+    chan_id: _builtins.int
+    """
+    The unique channel ID for the channel. The first 3 bytes are the block
+    height, the next 3 the index within the block, and the last 2 bytes are the
+    output index for the channel.
+    """
+    capacity: _builtins.int
+    advertising_node: _builtins.str
+    connecting_node: _builtins.str
+    @_builtins.property
+    def chan_point(self) -> Global___ChannelPoint: ...
+    @_builtins.property
+    def routing_policy(self) -> Global___RoutingPolicy: ...
+    def __init__(
+        self,
+        *,
+        chan_id: _builtins.int = ...,
+        chan_point: Global___ChannelPoint | None = ...,
+        capacity: _builtins.int = ...,
+        routing_policy: Global___RoutingPolicy | None = ...,
+        advertising_node: _builtins.str = ...,
+        connecting_node: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["chan_point", b"chan_point", "routing_policy", b"routing_policy"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["advertising_node", b"advertising_node", "capacity", b"capacity", "chan_id", b"chan_id", "chan_point", b"chan_point", "connecting_node", b"connecting_node", "routing_policy", b"routing_policy"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ChannelEdgeUpdate: _TypeAlias = ChannelEdgeUpdate  # noqa: Y015
+
+@_typing.final
+class ClosedChannelUpdate(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    CHAN_ID_FIELD_NUMBER: _builtins.int
+    CAPACITY_FIELD_NUMBER: _builtins.int
+    CLOSED_HEIGHT_FIELD_NUMBER: _builtins.int
+    CHAN_POINT_FIELD_NUMBER: _builtins.int
+    chan_id: _builtins.int
+    """
+    The unique channel ID for the channel. The first 3 bytes are the block
+    height, the next 3 the index within the block, and the last 2 bytes are the
+    output index for the channel.
+    """
+    capacity: _builtins.int
+    closed_height: _builtins.int
+    @_builtins.property
+    def chan_point(self) -> Global___ChannelPoint: ...
+    def __init__(
+        self,
+        *,
+        chan_id: _builtins.int = ...,
+        capacity: _builtins.int = ...,
+        closed_height: _builtins.int = ...,
+        chan_point: Global___ChannelPoint | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["chan_point", b"chan_point"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["capacity", b"capacity", "chan_id", b"chan_id", "chan_point", b"chan_point", "closed_height", b"closed_height"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ClosedChannelUpdate: _TypeAlias = ClosedChannelUpdate  # noqa: Y015
+
+@_typing.final
+class HopHint(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    NODE_ID_FIELD_NUMBER: _builtins.int
+    CHAN_ID_FIELD_NUMBER: _builtins.int
+    FEE_BASE_MSAT_FIELD_NUMBER: _builtins.int
+    FEE_PROPORTIONAL_MILLIONTHS_FIELD_NUMBER: _builtins.int
+    CLTV_EXPIRY_DELTA_FIELD_NUMBER: _builtins.int
+    node_id: _builtins.str
+    """The public key of the node at the start of the channel."""
+    chan_id: _builtins.int
+    """The unique identifier of the channel."""
+    fee_base_msat: _builtins.int
+    """The base fee of the channel denominated in millisatoshis."""
+    fee_proportional_millionths: _builtins.int
+    """
+    The fee rate of the channel for sending one satoshi across it denominated in
+    millionths of a satoshi.
+    """
+    cltv_expiry_delta: _builtins.int
+    """The time-lock delta of the channel."""
+    def __init__(
+        self,
+        *,
+        node_id: _builtins.str = ...,
+        chan_id: _builtins.int = ...,
+        fee_base_msat: _builtins.int = ...,
+        fee_proportional_millionths: _builtins.int = ...,
+        cltv_expiry_delta: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["chan_id", b"chan_id", "cltv_expiry_delta", b"cltv_expiry_delta", "fee_base_msat", b"fee_base_msat", "fee_proportional_millionths", b"fee_proportional_millionths", "node_id", b"node_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___HopHint: _TypeAlias = HopHint  # noqa: Y015
+
+@_typing.final
+class RouteHint(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    HOP_HINTS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def hop_hints(self) -> _containers.RepeatedCompositeFieldContainer[Global___HopHint]:
+        """
+        A list of hop hints that when chained together can assist in reaching a
+        specific destination.
+        """
+
+    def __init__(
+        self,
+        *,
+        hop_hints: _abc.Iterable[Global___HopHint] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["hop_hints", b"hop_hints"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___RouteHint: _TypeAlias = RouteHint  # noqa: Y015
+
+@_typing.final
+class Invoice(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    class _InvoiceState:
+        ValueType = _typing.NewType("ValueType", _builtins.int)
+        V: _TypeAlias = ValueType  # noqa: Y015
+
+    class _InvoiceStateEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[Invoice._InvoiceState.ValueType], _builtins.type):
+        DESCRIPTOR: _descriptor.EnumDescriptor
+        OPEN: Invoice._InvoiceState.ValueType  # 0
+        SETTLED: Invoice._InvoiceState.ValueType  # 1
+        CANCELED: Invoice._InvoiceState.ValueType  # 2
+        ACCEPTED: Invoice._InvoiceState.ValueType  # 3
+
+    class InvoiceState(_InvoiceState, metaclass=_InvoiceStateEnumTypeWrapper): ...
+    OPEN: Invoice.InvoiceState.ValueType  # 0
+    SETTLED: Invoice.InvoiceState.ValueType  # 1
+    CANCELED: Invoice.InvoiceState.ValueType  # 2
+    ACCEPTED: Invoice.InvoiceState.ValueType  # 3
+
+    @_typing.final
+    class FeaturesEntry(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: _builtins.int
+        VALUE_FIELD_NUMBER: _builtins.int
+        key: _builtins.int
+        @_builtins.property
+        def value(self) -> Global___Feature: ...
+        def __init__(
+            self,
+            *,
+            key: _builtins.int = ...,
+            value: Global___Feature | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _typing.Literal["value", b"value"]  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["key", b"key", "value", b"value"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    MEMO_FIELD_NUMBER: _builtins.int
+    R_PREIMAGE_FIELD_NUMBER: _builtins.int
+    R_HASH_FIELD_NUMBER: _builtins.int
+    VALUE_FIELD_NUMBER: _builtins.int
+    VALUE_MSAT_FIELD_NUMBER: _builtins.int
+    SETTLED_FIELD_NUMBER: _builtins.int
+    CREATION_DATE_FIELD_NUMBER: _builtins.int
+    SETTLE_DATE_FIELD_NUMBER: _builtins.int
+    PAYMENT_REQUEST_FIELD_NUMBER: _builtins.int
+    DESCRIPTION_HASH_FIELD_NUMBER: _builtins.int
+    EXPIRY_FIELD_NUMBER: _builtins.int
+    FALLBACK_ADDR_FIELD_NUMBER: _builtins.int
+    CLTV_EXPIRY_FIELD_NUMBER: _builtins.int
+    ROUTE_HINTS_FIELD_NUMBER: _builtins.int
+    PRIVATE_FIELD_NUMBER: _builtins.int
+    ADD_INDEX_FIELD_NUMBER: _builtins.int
+    SETTLE_INDEX_FIELD_NUMBER: _builtins.int
+    AMT_PAID_FIELD_NUMBER: _builtins.int
+    AMT_PAID_SAT_FIELD_NUMBER: _builtins.int
+    AMT_PAID_MSAT_FIELD_NUMBER: _builtins.int
+    STATE_FIELD_NUMBER: _builtins.int
+    HTLCS_FIELD_NUMBER: _builtins.int
+    FEATURES_FIELD_NUMBER: _builtins.int
+    IS_KEYSEND_FIELD_NUMBER: _builtins.int
+    PAYMENT_ADDR_FIELD_NUMBER: _builtins.int
+    IS_AMP_FIELD_NUMBER: _builtins.int
+    memo: _builtins.str
+    """
+    An optional memo to attach along with the invoice. Used for record keeping
+    purposes for the invoice's creator, and will also be set in the description
+    field of the encoded payment request if the description_hash field is not
+    being used.
+    """
+    r_preimage: _builtins.bytes
+    """
+    The hex-encoded preimage (32 byte) which will allow settling an incoming
+    HTLC payable to this preimage. When using REST, this field must be encoded
+    as base64.
+    """
+    r_hash: _builtins.bytes
+    """
+    The hash of the preimage. When using REST, this field must be encoded as
+    base64.
+    """
+    value: _builtins.int
+    """
+    The value of this invoice in satoshis
+
+    The fields value and value_msat are mutually exclusive.
+    """
+    value_msat: _builtins.int
+    """
+    The value of this invoice in millisatoshis
+
+    The fields value and value_msat are mutually exclusive.
+    """
+    @_builtins.property
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def settled(self) -> _builtins.bool:
+        """Whether this invoice has been fulfilled"""
+
+    @settled.setter
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def settled(self, value: _builtins.bool) -> None:
+        """Whether this invoice has been fulfilled"""
+
+    creation_date: _builtins.int
+    """When this invoice was created"""
+    settle_date: _builtins.int
+    """When this invoice was settled"""
+    payment_request: _builtins.str
+    """
+    A bare-bones invoice for a payment within the Lightning Network. With the
+    details of the invoice, the sender has all the data necessary to send a
+    payment to the recipient.
+    """
+    description_hash: _builtins.bytes
+    """
+    Hash (SHA-256) of a description of the payment. Used if the description of
+    payment (memo) is too long to naturally fit within the description field
+    of an encoded payment request. When using REST, this field must be encoded
+    as base64.
+    """
+    expiry: _builtins.int
+    """Payment request expiry time in seconds. Default is 3600 (1 hour)."""
+    fallback_addr: _builtins.str
+    """Fallback on-chain address."""
+    cltv_expiry: _builtins.int
+    """Delta to use for the time-lock of the CLTV extended to the final hop."""
+    private: _builtins.bool
+    """Whether this invoice should include routing hints for private channels."""
+    add_index: _builtins.int
+    """
+    The "add" index of this invoice. Each newly created invoice will increment
+    this index making it monotonically increasing. Callers to the
+    SubscribeInvoices call can use this to instantly get notified of all added
+    invoices with an add_index greater than this one.
+    """
+    settle_index: _builtins.int
+    """
+    The "settle" index of this invoice. Each newly settled invoice will
+    increment this index making it monotonically increasing. Callers to the
+    SubscribeInvoices call can use this to instantly get notified of all
+    settled invoices with an settle_index greater than this one.
+    """
+    @_builtins.property
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def amt_paid(self) -> _builtins.int:
+        """Deprecated, use amt_paid_sat or amt_paid_msat."""
+
+    @amt_paid.setter
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def amt_paid(self, value: _builtins.int) -> None:
+        """Deprecated, use amt_paid_sat or amt_paid_msat."""
+
+    amt_paid_sat: _builtins.int
+    """
+    The amount that was accepted for this invoice, in satoshis. This will ONLY
+    be set if this invoice has been settled. We provide this field as if the
+    invoice was created with a zero value, then we need to record what amount
+    was ultimately accepted. Additionally, it's possible that the sender paid
+    MORE that was specified in the original invoice. So we'll record that here
+    as well.
+    """
+    amt_paid_msat: _builtins.int
+    """
+    The amount that was accepted for this invoice, in millisatoshis. This will
+    ONLY be set if this invoice has been settled. We provide this field as if
+    the invoice was created with a zero value, then we need to record what
+    amount was ultimately accepted. Additionally, it's possible that the sender
+    paid MORE that was specified in the original invoice. So we'll record that
+    here as well.
+    """
+    state: Global___Invoice.InvoiceState.ValueType
+    """
+    The state the invoice is in.
+    """
+    is_keysend: _builtins.bool
+    """
+    Indicates if this invoice was a spontaneous payment that arrived via keysend
+    [EXPERIMENTAL].
+    """
+    payment_addr: _builtins.bytes
+    """
+    The payment address of this invoice. This value will be used in MPP
+    payments, and also for newer invoies that always require the MPP paylaod
+    for added end-to-end security.
+    """
+    is_amp: _builtins.bool
+    """
+    Signals whether or not this is an AMP invoice.
+    """
+    @_builtins.property
+    def route_hints(self) -> _containers.RepeatedCompositeFieldContainer[Global___RouteHint]:
+        """
+        Route hints that can each be individually used to assist in reaching the
+        invoice's destination.
+        """
+
+    @_builtins.property
+    def htlcs(self) -> _containers.RepeatedCompositeFieldContainer[Global___InvoiceHTLC]:
+        """List of HTLCs paying to this invoice [EXPERIMENTAL]."""
+
+    @_builtins.property
+    def features(self) -> _containers.MessageMap[_builtins.int, Global___Feature]:
+        """List of features advertised on the invoice."""
+
+    def __init__(
+        self,
+        *,
+        memo: _builtins.str = ...,
+        r_preimage: _builtins.bytes = ...,
+        r_hash: _builtins.bytes = ...,
+        value: _builtins.int = ...,
+        value_msat: _builtins.int = ...,
+        settled: _builtins.bool = ...,
+        creation_date: _builtins.int = ...,
+        settle_date: _builtins.int = ...,
+        payment_request: _builtins.str = ...,
+        description_hash: _builtins.bytes = ...,
+        expiry: _builtins.int = ...,
+        fallback_addr: _builtins.str = ...,
+        cltv_expiry: _builtins.int = ...,
+        route_hints: _abc.Iterable[Global___RouteHint] | None = ...,
+        private: _builtins.bool = ...,
+        add_index: _builtins.int = ...,
+        settle_index: _builtins.int = ...,
+        amt_paid: _builtins.int = ...,
+        amt_paid_sat: _builtins.int = ...,
+        amt_paid_msat: _builtins.int = ...,
+        state: Global___Invoice.InvoiceState.ValueType = ...,
+        htlcs: _abc.Iterable[Global___InvoiceHTLC] | None = ...,
+        features: _abc.Mapping[_builtins.int, Global___Feature] | None = ...,
+        is_keysend: _builtins.bool = ...,
+        payment_addr: _builtins.bytes = ...,
+        is_amp: _builtins.bool = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["add_index", b"add_index", "amt_paid", b"amt_paid", "amt_paid_msat", b"amt_paid_msat", "amt_paid_sat", b"amt_paid_sat", "cltv_expiry", b"cltv_expiry", "creation_date", b"creation_date", "description_hash", b"description_hash", "expiry", b"expiry", "fallback_addr", b"fallback_addr", "features", b"features", "htlcs", b"htlcs", "is_amp", b"is_amp", "is_keysend", b"is_keysend", "memo", b"memo", "payment_addr", b"payment_addr", "payment_request", b"payment_request", "private", b"private", "r_hash", b"r_hash", "r_preimage", b"r_preimage", "route_hints", b"route_hints", "settle_date", b"settle_date", "settle_index", b"settle_index", "settled", b"settled", "state", b"state", "value", b"value", "value_msat", b"value_msat"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___Invoice: _TypeAlias = Invoice  # noqa: Y015
+
+@_typing.final
+class InvoiceHTLC(_message.Message):
+    """Details of an HTLC that paid to an invoice"""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class CustomRecordsEntry(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: _builtins.int
+        VALUE_FIELD_NUMBER: _builtins.int
+        key: _builtins.int
+        value: _builtins.bytes
+        def __init__(
+            self,
+            *,
+            key: _builtins.int = ...,
+            value: _builtins.bytes = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["key", b"key", "value", b"value"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    CHAN_ID_FIELD_NUMBER: _builtins.int
+    HTLC_INDEX_FIELD_NUMBER: _builtins.int
+    AMT_MSAT_FIELD_NUMBER: _builtins.int
+    ACCEPT_HEIGHT_FIELD_NUMBER: _builtins.int
+    ACCEPT_TIME_FIELD_NUMBER: _builtins.int
+    RESOLVE_TIME_FIELD_NUMBER: _builtins.int
+    EXPIRY_HEIGHT_FIELD_NUMBER: _builtins.int
+    STATE_FIELD_NUMBER: _builtins.int
+    CUSTOM_RECORDS_FIELD_NUMBER: _builtins.int
+    MPP_TOTAL_AMT_MSAT_FIELD_NUMBER: _builtins.int
+    AMP_FIELD_NUMBER: _builtins.int
+    chan_id: _builtins.int
+    """Short channel id over which the htlc was received."""
+    htlc_index: _builtins.int
+    """Index identifying the htlc on the channel."""
+    amt_msat: _builtins.int
+    """The amount of the htlc in msat."""
+    accept_height: _builtins.int
+    """Block height at which this htlc was accepted."""
+    accept_time: _builtins.int
+    """Time at which this htlc was accepted."""
+    resolve_time: _builtins.int
+    """Time at which this htlc was settled or canceled."""
+    expiry_height: _builtins.int
+    """Block height at which this htlc expires."""
+    state: Global___InvoiceHTLCState.ValueType
+    """Current state the htlc is in."""
+    mpp_total_amt_msat: _builtins.int
+    """The total amount of the mpp payment in msat."""
+    @_builtins.property
+    def custom_records(self) -> _containers.ScalarMap[_builtins.int, _builtins.bytes]:
+        """Custom tlv records."""
+
+    @_builtins.property
+    def amp(self) -> Global___AMP:
+        """Details relevant to AMP HTLCs, only populated if this is an AMP HTLC."""
+
+    def __init__(
+        self,
+        *,
+        chan_id: _builtins.int = ...,
+        htlc_index: _builtins.int = ...,
+        amt_msat: _builtins.int = ...,
+        accept_height: _builtins.int = ...,
+        accept_time: _builtins.int = ...,
+        resolve_time: _builtins.int = ...,
+        expiry_height: _builtins.int = ...,
+        state: Global___InvoiceHTLCState.ValueType = ...,
+        custom_records: _abc.Mapping[_builtins.int, _builtins.bytes] | None = ...,
+        mpp_total_amt_msat: _builtins.int = ...,
+        amp: Global___AMP | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["amp", b"amp"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["accept_height", b"accept_height", "accept_time", b"accept_time", "amp", b"amp", "amt_msat", b"amt_msat", "chan_id", b"chan_id", "custom_records", b"custom_records", "expiry_height", b"expiry_height", "htlc_index", b"htlc_index", "mpp_total_amt_msat", b"mpp_total_amt_msat", "resolve_time", b"resolve_time", "state", b"state"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___InvoiceHTLC: _TypeAlias = InvoiceHTLC  # noqa: Y015
+
+@_typing.final
+class AMP(_message.Message):
+    """Details specific to AMP HTLCs."""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ROOT_SHARE_FIELD_NUMBER: _builtins.int
+    SET_ID_FIELD_NUMBER: _builtins.int
+    CHILD_INDEX_FIELD_NUMBER: _builtins.int
+    HASH_FIELD_NUMBER: _builtins.int
+    PREIMAGE_FIELD_NUMBER: _builtins.int
+    root_share: _builtins.bytes
+    """An n-of-n secret share of the root seed from which child payment hashes
+    and preimages are derived.
+    """
+    set_id: _builtins.bytes
+    """An identifier for the HTLC set that this HTLC belongs to."""
+    child_index: _builtins.int
+    """A nonce used to randomize the child preimage and child hash from a given
+    root_share.
+    """
+    hash: _builtins.bytes
+    """The payment hash of the AMP HTLC."""
+    preimage: _builtins.bytes
+    """The preimage used to settle this AMP htlc. This field will only be
+    populated if the invoice is in InvoiceState_ACCEPTED or
+    InvoiceState_SETTLED.
+    """
+    def __init__(
+        self,
+        *,
+        root_share: _builtins.bytes = ...,
+        set_id: _builtins.bytes = ...,
+        child_index: _builtins.int = ...,
+        hash: _builtins.bytes = ...,
+        preimage: _builtins.bytes = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["child_index", b"child_index", "hash", b"hash", "preimage", b"preimage", "root_share", b"root_share", "set_id", b"set_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___AMP: _TypeAlias = AMP  # noqa: Y015
+
+@_typing.final
+class AddInvoiceResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    R_HASH_FIELD_NUMBER: _builtins.int
+    PAYMENT_REQUEST_FIELD_NUMBER: _builtins.int
+    ADD_INDEX_FIELD_NUMBER: _builtins.int
+    PAYMENT_ADDR_FIELD_NUMBER: _builtins.int
+    r_hash: _builtins.bytes
+    payment_request: _builtins.str
+    """
+    A bare-bones invoice for a payment within the Lightning Network. With the
+    details of the invoice, the sender has all the data necessary to send a
+    payment to the recipient.
+    """
+    add_index: _builtins.int
+    """
+    The "add" index of this invoice. Each newly created invoice will increment
+    this index making it monotonically increasing. Callers to the
+    SubscribeInvoices call can use this to instantly get notified of all added
+    invoices with an add_index greater than this one.
+    """
+    payment_addr: _builtins.bytes
+    """
+    The payment address of the generated invoice. This value should be used
+    in all payments for this invoice as we require it for end to end
+    security.
+    """
+    def __init__(
+        self,
+        *,
+        r_hash: _builtins.bytes = ...,
+        payment_request: _builtins.str = ...,
+        add_index: _builtins.int = ...,
+        payment_addr: _builtins.bytes = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["add_index", b"add_index", "payment_addr", b"payment_addr", "payment_request", b"payment_request", "r_hash", b"r_hash"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___AddInvoiceResponse: _TypeAlias = AddInvoiceResponse  # noqa: Y015
+
+@_typing.final
+class PaymentHash(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    R_HASH_STR_FIELD_NUMBER: _builtins.int
+    R_HASH_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def r_hash_str(self) -> _builtins.str:
+        """
+        The hex-encoded payment hash of the invoice to be looked up. The passed
+        payment hash must be exactly 32 bytes, otherwise an error is returned.
+        Deprecated now that the REST gateway supports base64 encoding of bytes
+        fields.
+        """
+
+    @r_hash_str.setter
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def r_hash_str(self, value: _builtins.str) -> None:
+        """
+        The hex-encoded payment hash of the invoice to be looked up. The passed
+        payment hash must be exactly 32 bytes, otherwise an error is returned.
+        Deprecated now that the REST gateway supports base64 encoding of bytes
+        fields.
+        """
+
+    r_hash: _builtins.bytes
+    """
+    The payment hash of the invoice to be looked up. When using REST, this field
+    must be encoded as base64.
+    """
+    def __init__(
+        self,
+        *,
+        r_hash_str: _builtins.str = ...,
+        r_hash: _builtins.bytes = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["r_hash", b"r_hash", "r_hash_str", b"r_hash_str"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___PaymentHash: _TypeAlias = PaymentHash  # noqa: Y015
+
+@_typing.final
+class ListInvoiceRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PENDING_ONLY_FIELD_NUMBER: _builtins.int
+    INDEX_OFFSET_FIELD_NUMBER: _builtins.int
+    NUM_MAX_INVOICES_FIELD_NUMBER: _builtins.int
+    REVERSED_FIELD_NUMBER: _builtins.int
+    pending_only: _builtins.bool
+    """
+    If set, only invoices that are not settled and not canceled will be returned
+    in the response.
+    """
+    index_offset: _builtins.int
+    """
+    The index of an invoice that will be used as either the start or end of a
+    query to determine which invoices should be returned in the response.
+    """
+    num_max_invoices: _builtins.int
+    """The max number of invoices to return in the response to this query."""
+    reversed: _builtins.bool
+    """
+    If set, the invoices returned will result from seeking backwards from the
+    specified index offset. This can be used to paginate backwards.
+    """
+    def __init__(
+        self,
+        *,
+        pending_only: _builtins.bool = ...,
+        index_offset: _builtins.int = ...,
+        num_max_invoices: _builtins.int = ...,
+        reversed: _builtins.bool = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["index_offset", b"index_offset", "num_max_invoices", b"num_max_invoices", "pending_only", b"pending_only", "reversed", b"reversed"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ListInvoiceRequest: _TypeAlias = ListInvoiceRequest  # noqa: Y015
+
+@_typing.final
+class ListInvoiceResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    INVOICES_FIELD_NUMBER: _builtins.int
+    LAST_INDEX_OFFSET_FIELD_NUMBER: _builtins.int
+    FIRST_INDEX_OFFSET_FIELD_NUMBER: _builtins.int
+    last_index_offset: _builtins.int
+    """
+    The index of the last item in the set of returned invoices. This can be used
+    to seek further, pagination style.
+    """
+    first_index_offset: _builtins.int
+    """
+    The index of the last item in the set of returned invoices. This can be used
+    to seek backwards, pagination style.
+    """
+    @_builtins.property
+    def invoices(self) -> _containers.RepeatedCompositeFieldContainer[Global___Invoice]:
+        """
+        A list of invoices from the time slice of the time series specified in the
+        request.
+        """
+
+    def __init__(
+        self,
+        *,
+        invoices: _abc.Iterable[Global___Invoice] | None = ...,
+        last_index_offset: _builtins.int = ...,
+        first_index_offset: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["first_index_offset", b"first_index_offset", "invoices", b"invoices", "last_index_offset", b"last_index_offset"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ListInvoiceResponse: _TypeAlias = ListInvoiceResponse  # noqa: Y015
+
+@_typing.final
+class InvoiceSubscription(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ADD_INDEX_FIELD_NUMBER: _builtins.int
+    SETTLE_INDEX_FIELD_NUMBER: _builtins.int
+    add_index: _builtins.int
+    """
+    If specified (non-zero), then we'll first start by sending out
+    notifications for all added indexes with an add_index greater than this
+    value. This allows callers to catch up on any events they missed while they
+    weren't connected to the streaming RPC.
+    """
+    settle_index: _builtins.int
+    """
+    If specified (non-zero), then we'll first start by sending out
+    notifications for all settled indexes with an settle_index greater than
+    this value. This allows callers to catch up on any events they missed while
+    they weren't connected to the streaming RPC.
+    """
+    def __init__(
+        self,
+        *,
+        add_index: _builtins.int = ...,
+        settle_index: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["add_index", b"add_index", "settle_index", b"settle_index"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___InvoiceSubscription: _TypeAlias = InvoiceSubscription  # noqa: Y015
+
+@_typing.final
+class Payment(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    class _PaymentStatus:
+        ValueType = _typing.NewType("ValueType", _builtins.int)
+        V: _TypeAlias = ValueType  # noqa: Y015
+
+    class _PaymentStatusEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[Payment._PaymentStatus.ValueType], _builtins.type):
+        DESCRIPTOR: _descriptor.EnumDescriptor
+        UNKNOWN: Payment._PaymentStatus.ValueType  # 0
+        IN_FLIGHT: Payment._PaymentStatus.ValueType  # 1
+        SUCCEEDED: Payment._PaymentStatus.ValueType  # 2
+        FAILED: Payment._PaymentStatus.ValueType  # 3
+
+    class PaymentStatus(_PaymentStatus, metaclass=_PaymentStatusEnumTypeWrapper): ...
+    UNKNOWN: Payment.PaymentStatus.ValueType  # 0
+    IN_FLIGHT: Payment.PaymentStatus.ValueType  # 1
+    SUCCEEDED: Payment.PaymentStatus.ValueType  # 2
+    FAILED: Payment.PaymentStatus.ValueType  # 3
+
+    PAYMENT_HASH_FIELD_NUMBER: _builtins.int
+    VALUE_FIELD_NUMBER: _builtins.int
+    CREATION_DATE_FIELD_NUMBER: _builtins.int
+    FEE_FIELD_NUMBER: _builtins.int
+    PAYMENT_PREIMAGE_FIELD_NUMBER: _builtins.int
+    VALUE_SAT_FIELD_NUMBER: _builtins.int
+    VALUE_MSAT_FIELD_NUMBER: _builtins.int
+    PAYMENT_REQUEST_FIELD_NUMBER: _builtins.int
+    STATUS_FIELD_NUMBER: _builtins.int
+    FEE_SAT_FIELD_NUMBER: _builtins.int
+    FEE_MSAT_FIELD_NUMBER: _builtins.int
+    CREATION_TIME_NS_FIELD_NUMBER: _builtins.int
+    HTLCS_FIELD_NUMBER: _builtins.int
+    PAYMENT_INDEX_FIELD_NUMBER: _builtins.int
+    FAILURE_REASON_FIELD_NUMBER: _builtins.int
+    payment_hash: _builtins.str
+    """The payment hash"""
+    @_builtins.property
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def value(self) -> _builtins.int:
+        """Deprecated, use value_sat or value_msat."""
+
+    @value.setter
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def value(self, value: _builtins.int) -> None:
+        """Deprecated, use value_sat or value_msat."""
+
+    @_builtins.property
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def creation_date(self) -> _builtins.int:
+        """Deprecated, use creation_time_ns"""
+
+    @creation_date.setter
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def creation_date(self, value: _builtins.int) -> None:
+        """Deprecated, use creation_time_ns"""
+
+    @_builtins.property
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def fee(self) -> _builtins.int:
+        """Deprecated, use fee_sat or fee_msat."""
+
+    @fee.setter
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def fee(self, value: _builtins.int) -> None:
+        """Deprecated, use fee_sat or fee_msat."""
+
+    payment_preimage: _builtins.str
+    """The payment preimage"""
+    value_sat: _builtins.int
+    """The value of the payment in satoshis"""
+    value_msat: _builtins.int
+    """The value of the payment in milli-satoshis"""
+    payment_request: _builtins.str
+    """The optional payment request being fulfilled."""
+    status: Global___Payment.PaymentStatus.ValueType
+    """The status of the payment."""
+    fee_sat: _builtins.int
+    """ The fee paid for this payment in satoshis"""
+    fee_msat: _builtins.int
+    """ The fee paid for this payment in milli-satoshis"""
+    creation_time_ns: _builtins.int
+    """The time in UNIX nanoseconds at which the payment was created."""
+    payment_index: _builtins.int
+    """
+    The creation index of this payment. Each payment can be uniquely identified
+    by this index, which may not strictly increment by 1 for payments made in
+    older versions of lnd.
+    """
+    failure_reason: Global___PaymentFailureReason.ValueType
+    @_builtins.property
+    def htlcs(self) -> _containers.RepeatedCompositeFieldContainer[Global___HTLCAttempt]:
+        """The HTLCs made in attempt to settle the payment."""
+
+    def __init__(
+        self,
+        *,
+        payment_hash: _builtins.str = ...,
+        value: _builtins.int = ...,
+        creation_date: _builtins.int = ...,
+        fee: _builtins.int = ...,
+        payment_preimage: _builtins.str = ...,
+        value_sat: _builtins.int = ...,
+        value_msat: _builtins.int = ...,
+        payment_request: _builtins.str = ...,
+        status: Global___Payment.PaymentStatus.ValueType = ...,
+        fee_sat: _builtins.int = ...,
+        fee_msat: _builtins.int = ...,
+        creation_time_ns: _builtins.int = ...,
+        htlcs: _abc.Iterable[Global___HTLCAttempt] | None = ...,
+        payment_index: _builtins.int = ...,
+        failure_reason: Global___PaymentFailureReason.ValueType = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["creation_date", b"creation_date", "creation_time_ns", b"creation_time_ns", "failure_reason", b"failure_reason", "fee", b"fee", "fee_msat", b"fee_msat", "fee_sat", b"fee_sat", "htlcs", b"htlcs", "payment_hash", b"payment_hash", "payment_index", b"payment_index", "payment_preimage", b"payment_preimage", "payment_request", b"payment_request", "status", b"status", "value", b"value", "value_msat", b"value_msat", "value_sat", b"value_sat"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___Payment: _TypeAlias = Payment  # noqa: Y015
+
+@_typing.final
+class HTLCAttempt(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    class _HTLCStatus:
+        ValueType = _typing.NewType("ValueType", _builtins.int)
+        V: _TypeAlias = ValueType  # noqa: Y015
+
+    class _HTLCStatusEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[HTLCAttempt._HTLCStatus.ValueType], _builtins.type):
+        DESCRIPTOR: _descriptor.EnumDescriptor
+        IN_FLIGHT: HTLCAttempt._HTLCStatus.ValueType  # 0
+        SUCCEEDED: HTLCAttempt._HTLCStatus.ValueType  # 1
+        FAILED: HTLCAttempt._HTLCStatus.ValueType  # 2
+
+    class HTLCStatus(_HTLCStatus, metaclass=_HTLCStatusEnumTypeWrapper): ...
+    IN_FLIGHT: HTLCAttempt.HTLCStatus.ValueType  # 0
+    SUCCEEDED: HTLCAttempt.HTLCStatus.ValueType  # 1
+    FAILED: HTLCAttempt.HTLCStatus.ValueType  # 2
+
+    ATTEMPT_ID_FIELD_NUMBER: _builtins.int
+    STATUS_FIELD_NUMBER: _builtins.int
+    ROUTE_FIELD_NUMBER: _builtins.int
+    ATTEMPT_TIME_NS_FIELD_NUMBER: _builtins.int
+    RESOLVE_TIME_NS_FIELD_NUMBER: _builtins.int
+    FAILURE_FIELD_NUMBER: _builtins.int
+    PREIMAGE_FIELD_NUMBER: _builtins.int
+    attempt_id: _builtins.int
+    """The unique ID that is used for this attempt."""
+    status: Global___HTLCAttempt.HTLCStatus.ValueType
+    """The status of the HTLC."""
+    attempt_time_ns: _builtins.int
+    """The time in UNIX nanoseconds at which this HTLC was sent."""
+    resolve_time_ns: _builtins.int
+    """
+    The time in UNIX nanoseconds at which this HTLC was settled or failed.
+    This value will not be set if the HTLC is still IN_FLIGHT.
+    """
+    preimage: _builtins.bytes
+    """The preimage that was used to settle the HTLC."""
+    @_builtins.property
+    def route(self) -> Global___Route:
+        """The route taken by this HTLC."""
+
+    @_builtins.property
+    def failure(self) -> Global___Failure:
+        """Detailed htlc failure info."""
+
+    def __init__(
+        self,
+        *,
+        attempt_id: _builtins.int = ...,
+        status: Global___HTLCAttempt.HTLCStatus.ValueType = ...,
+        route: Global___Route | None = ...,
+        attempt_time_ns: _builtins.int = ...,
+        resolve_time_ns: _builtins.int = ...,
+        failure: Global___Failure | None = ...,
+        preimage: _builtins.bytes = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["failure", b"failure", "route", b"route"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["attempt_id", b"attempt_id", "attempt_time_ns", b"attempt_time_ns", "failure", b"failure", "preimage", b"preimage", "resolve_time_ns", b"resolve_time_ns", "route", b"route", "status", b"status"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___HTLCAttempt: _TypeAlias = HTLCAttempt  # noqa: Y015
+
+@_typing.final
+class ListPaymentsRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    INCLUDE_INCOMPLETE_FIELD_NUMBER: _builtins.int
+    INDEX_OFFSET_FIELD_NUMBER: _builtins.int
+    MAX_PAYMENTS_FIELD_NUMBER: _builtins.int
+    REVERSED_FIELD_NUMBER: _builtins.int
+    include_incomplete: _builtins.bool
+    """
+    If true, then return payments that have not yet fully completed. This means
+    that pending payments, as well as failed payments will show up if this
+    field is set to true. This flag doesn't change the meaning of the indices,
+    which are tied to individual payments.
+    """
+    index_offset: _builtins.int
+    """
+    The index of a payment that will be used as either the start or end of a
+    query to determine which payments should be returned in the response. The
+    index_offset is exclusive. In the case of a zero index_offset, the query
+    will start with the oldest payment when paginating forwards, or will end
+    with the most recent payment when paginating backwards.
+    """
+    max_payments: _builtins.int
+    """The maximal number of payments returned in the response to this query."""
+    reversed: _builtins.bool
+    """
+    If set, the payments returned will result from seeking backwards from the
+    specified index offset. This can be used to paginate backwards. The order
+    of the returned payments is always oldest first (ascending index order).
+    """
+    def __init__(
+        self,
+        *,
+        include_incomplete: _builtins.bool = ...,
+        index_offset: _builtins.int = ...,
+        max_payments: _builtins.int = ...,
+        reversed: _builtins.bool = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["include_incomplete", b"include_incomplete", "index_offset", b"index_offset", "max_payments", b"max_payments", "reversed", b"reversed"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ListPaymentsRequest: _TypeAlias = ListPaymentsRequest  # noqa: Y015
+
+@_typing.final
+class ListPaymentsResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PAYMENTS_FIELD_NUMBER: _builtins.int
+    FIRST_INDEX_OFFSET_FIELD_NUMBER: _builtins.int
+    LAST_INDEX_OFFSET_FIELD_NUMBER: _builtins.int
+    first_index_offset: _builtins.int
+    """
+    The index of the first item in the set of returned payments. This can be
+    used as the index_offset to continue seeking backwards in the next request.
+    """
+    last_index_offset: _builtins.int
+    """
+    The index of the last item in the set of returned payments. This can be used
+    as the index_offset to continue seeking forwards in the next request.
+    """
+    @_builtins.property
+    def payments(self) -> _containers.RepeatedCompositeFieldContainer[Global___Payment]:
+        """The list of payments"""
+
+    def __init__(
+        self,
+        *,
+        payments: _abc.Iterable[Global___Payment] | None = ...,
+        first_index_offset: _builtins.int = ...,
+        last_index_offset: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["first_index_offset", b"first_index_offset", "last_index_offset", b"last_index_offset", "payments", b"payments"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ListPaymentsResponse: _TypeAlias = ListPaymentsResponse  # noqa: Y015
+
+@_typing.final
+class DeletePaymentRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PAYMENT_HASH_FIELD_NUMBER: _builtins.int
+    FAILED_HTLCS_ONLY_FIELD_NUMBER: _builtins.int
+    payment_hash: _builtins.bytes
+    """Payment hash to delete."""
+    failed_htlcs_only: _builtins.bool
+    """
+    Only delete failed HTLCs from the payment, not the payment itself.
+    """
+    def __init__(
+        self,
+        *,
+        payment_hash: _builtins.bytes = ...,
+        failed_htlcs_only: _builtins.bool = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["failed_htlcs_only", b"failed_htlcs_only", "payment_hash", b"payment_hash"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DeletePaymentRequest: _TypeAlias = DeletePaymentRequest  # noqa: Y015
+
+@_typing.final
+class DeleteAllPaymentsRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    FAILED_PAYMENTS_ONLY_FIELD_NUMBER: _builtins.int
+    FAILED_HTLCS_ONLY_FIELD_NUMBER: _builtins.int
+    failed_payments_only: _builtins.bool
+    """Only delete failed payments."""
+    failed_htlcs_only: _builtins.bool
+    """
+    Only delete failed HTLCs from payments, not the payment itself.
+    """
+    def __init__(
+        self,
+        *,
+        failed_payments_only: _builtins.bool = ...,
+        failed_htlcs_only: _builtins.bool = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["failed_htlcs_only", b"failed_htlcs_only", "failed_payments_only", b"failed_payments_only"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DeleteAllPaymentsRequest: _TypeAlias = DeleteAllPaymentsRequest  # noqa: Y015
+
+@_typing.final
+class DeletePaymentResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DeletePaymentResponse: _TypeAlias = DeletePaymentResponse  # noqa: Y015
+
+@_typing.final
+class DeleteAllPaymentsResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DeleteAllPaymentsResponse: _TypeAlias = DeleteAllPaymentsResponse  # noqa: Y015
+
+@_typing.final
+class AbandonChannelRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    CHANNEL_POINT_FIELD_NUMBER: _builtins.int
+    PENDING_FUNDING_SHIM_ONLY_FIELD_NUMBER: _builtins.int
+    I_KNOW_WHAT_I_AM_DOING_FIELD_NUMBER: _builtins.int
+    pending_funding_shim_only: _builtins.bool
+    i_know_what_i_am_doing: _builtins.bool
+    """
+    Override the requirement for being in dev mode by setting this to true and
+    confirming the user knows what they are doing and this is a potential foot
+    gun to lose funds if used on active channels.
+    """
+    @_builtins.property
+    def channel_point(self) -> Global___ChannelPoint: ...
+    def __init__(
+        self,
+        *,
+        channel_point: Global___ChannelPoint | None = ...,
+        pending_funding_shim_only: _builtins.bool = ...,
+        i_know_what_i_am_doing: _builtins.bool = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["channel_point", b"channel_point"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["channel_point", b"channel_point", "i_know_what_i_am_doing", b"i_know_what_i_am_doing", "pending_funding_shim_only", b"pending_funding_shim_only"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___AbandonChannelRequest: _TypeAlias = AbandonChannelRequest  # noqa: Y015
+
+@_typing.final
+class AbandonChannelResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___AbandonChannelResponse: _TypeAlias = AbandonChannelResponse  # noqa: Y015
+
+@_typing.final
+class DebugLevelRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SHOW_FIELD_NUMBER: _builtins.int
+    LEVEL_SPEC_FIELD_NUMBER: _builtins.int
+    show: _builtins.bool
+    level_spec: _builtins.str
+    def __init__(
+        self,
+        *,
+        show: _builtins.bool = ...,
+        level_spec: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["level_spec", b"level_spec", "show", b"show"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DebugLevelRequest: _TypeAlias = DebugLevelRequest  # noqa: Y015
+
+@_typing.final
+class DebugLevelResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SUB_SYSTEMS_FIELD_NUMBER: _builtins.int
+    sub_systems: _builtins.str
+    def __init__(
+        self,
+        *,
+        sub_systems: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["sub_systems", b"sub_systems"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DebugLevelResponse: _TypeAlias = DebugLevelResponse  # noqa: Y015
+
+@_typing.final
+class PayReqString(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PAY_REQ_FIELD_NUMBER: _builtins.int
+    pay_req: _builtins.str
+    """The payment request string to be decoded"""
+    def __init__(
+        self,
+        *,
+        pay_req: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["pay_req", b"pay_req"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___PayReqString: _TypeAlias = PayReqString  # noqa: Y015
+
+@_typing.final
+class PayReq(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class FeaturesEntry(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: _builtins.int
+        VALUE_FIELD_NUMBER: _builtins.int
+        key: _builtins.int
+        @_builtins.property
+        def value(self) -> Global___Feature: ...
+        def __init__(
+            self,
+            *,
+            key: _builtins.int = ...,
+            value: Global___Feature | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _typing.Literal["value", b"value"]  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["key", b"key", "value", b"value"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    DESTINATION_FIELD_NUMBER: _builtins.int
+    PAYMENT_HASH_FIELD_NUMBER: _builtins.int
+    NUM_SATOSHIS_FIELD_NUMBER: _builtins.int
+    TIMESTAMP_FIELD_NUMBER: _builtins.int
+    EXPIRY_FIELD_NUMBER: _builtins.int
+    DESCRIPTION_FIELD_NUMBER: _builtins.int
+    DESCRIPTION_HASH_FIELD_NUMBER: _builtins.int
+    FALLBACK_ADDR_FIELD_NUMBER: _builtins.int
+    CLTV_EXPIRY_FIELD_NUMBER: _builtins.int
+    ROUTE_HINTS_FIELD_NUMBER: _builtins.int
+    PAYMENT_ADDR_FIELD_NUMBER: _builtins.int
+    NUM_MSAT_FIELD_NUMBER: _builtins.int
+    FEATURES_FIELD_NUMBER: _builtins.int
+    destination: _builtins.str
+    payment_hash: _builtins.str
+    num_satoshis: _builtins.int
+    timestamp: _builtins.int
+    expiry: _builtins.int
+    description: _builtins.str
+    description_hash: _builtins.str
+    fallback_addr: _builtins.str
+    cltv_expiry: _builtins.int
+    payment_addr: _builtins.bytes
+    num_msat: _builtins.int
+    @_builtins.property
+    def route_hints(self) -> _containers.RepeatedCompositeFieldContainer[Global___RouteHint]: ...
+    @_builtins.property
+    def features(self) -> _containers.MessageMap[_builtins.int, Global___Feature]: ...
+    def __init__(
+        self,
+        *,
+        destination: _builtins.str = ...,
+        payment_hash: _builtins.str = ...,
+        num_satoshis: _builtins.int = ...,
+        timestamp: _builtins.int = ...,
+        expiry: _builtins.int = ...,
+        description: _builtins.str = ...,
+        description_hash: _builtins.str = ...,
+        fallback_addr: _builtins.str = ...,
+        cltv_expiry: _builtins.int = ...,
+        route_hints: _abc.Iterable[Global___RouteHint] | None = ...,
+        payment_addr: _builtins.bytes = ...,
+        num_msat: _builtins.int = ...,
+        features: _abc.Mapping[_builtins.int, Global___Feature] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["cltv_expiry", b"cltv_expiry", "description", b"description", "description_hash", b"description_hash", "destination", b"destination", "expiry", b"expiry", "fallback_addr", b"fallback_addr", "features", b"features", "num_msat", b"num_msat", "num_satoshis", b"num_satoshis", "payment_addr", b"payment_addr", "payment_hash", b"payment_hash", "route_hints", b"route_hints", "timestamp", b"timestamp"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___PayReq: _TypeAlias = PayReq  # noqa: Y015
+
+@_typing.final
+class Feature(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    NAME_FIELD_NUMBER: _builtins.int
+    IS_REQUIRED_FIELD_NUMBER: _builtins.int
+    IS_KNOWN_FIELD_NUMBER: _builtins.int
+    name: _builtins.str
+    is_required: _builtins.bool
+    is_known: _builtins.bool
+    def __init__(
+        self,
+        *,
+        name: _builtins.str = ...,
+        is_required: _builtins.bool = ...,
+        is_known: _builtins.bool = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["is_known", b"is_known", "is_required", b"is_required", "name", b"name"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___Feature: _TypeAlias = Feature  # noqa: Y015
+
+@_typing.final
+class FeeReportRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___FeeReportRequest: _TypeAlias = FeeReportRequest  # noqa: Y015
+
+@_typing.final
+class ChannelFeeReport(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    CHAN_ID_FIELD_NUMBER: _builtins.int
+    CHANNEL_POINT_FIELD_NUMBER: _builtins.int
+    BASE_FEE_MSAT_FIELD_NUMBER: _builtins.int
+    FEE_PER_MIL_FIELD_NUMBER: _builtins.int
+    FEE_RATE_FIELD_NUMBER: _builtins.int
+    chan_id: _builtins.int
+    """The short channel id that this fee report belongs to."""
+    channel_point: _builtins.str
+    """The channel that this fee report belongs to."""
+    base_fee_msat: _builtins.int
+    """The base fee charged regardless of the number of milli-satoshis sent."""
+    fee_per_mil: _builtins.int
+    """The amount charged per milli-satoshis transferred expressed in
+    millionths of a satoshi.
+    """
+    fee_rate: _builtins.float
+    """The effective fee rate in milli-satoshis. Computed by dividing the
+    fee_per_mil value by 1 million.
+    """
+    def __init__(
+        self,
+        *,
+        chan_id: _builtins.int = ...,
+        channel_point: _builtins.str = ...,
+        base_fee_msat: _builtins.int = ...,
+        fee_per_mil: _builtins.int = ...,
+        fee_rate: _builtins.float = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["base_fee_msat", b"base_fee_msat", "chan_id", b"chan_id", "channel_point", b"channel_point", "fee_per_mil", b"fee_per_mil", "fee_rate", b"fee_rate"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ChannelFeeReport: _TypeAlias = ChannelFeeReport  # noqa: Y015
+
+@_typing.final
+class FeeReportResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    CHANNEL_FEES_FIELD_NUMBER: _builtins.int
+    DAY_FEE_SUM_FIELD_NUMBER: _builtins.int
+    WEEK_FEE_SUM_FIELD_NUMBER: _builtins.int
+    MONTH_FEE_SUM_FIELD_NUMBER: _builtins.int
+    day_fee_sum: _builtins.int
+    """The total amount of fee revenue (in satoshis) the switch has collected
+    over the past 24 hrs.
+    """
+    week_fee_sum: _builtins.int
+    """The total amount of fee revenue (in satoshis) the switch has collected
+    over the past 1 week.
+    """
+    month_fee_sum: _builtins.int
+    """The total amount of fee revenue (in satoshis) the switch has collected
+    over the past 1 month.
+    """
+    @_builtins.property
+    def channel_fees(self) -> _containers.RepeatedCompositeFieldContainer[Global___ChannelFeeReport]:
+        """An array of channel fee reports which describes the current fee schedule
+        for each channel.
+        """
+
+    def __init__(
+        self,
+        *,
+        channel_fees: _abc.Iterable[Global___ChannelFeeReport] | None = ...,
+        day_fee_sum: _builtins.int = ...,
+        week_fee_sum: _builtins.int = ...,
+        month_fee_sum: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["channel_fees", b"channel_fees", "day_fee_sum", b"day_fee_sum", "month_fee_sum", b"month_fee_sum", "week_fee_sum", b"week_fee_sum"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___FeeReportResponse: _TypeAlias = FeeReportResponse  # noqa: Y015
+
+@_typing.final
+class PolicyUpdateRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    GLOBAL_FIELD_NUMBER: _builtins.int
+    CHAN_POINT_FIELD_NUMBER: _builtins.int
+    BASE_FEE_MSAT_FIELD_NUMBER: _builtins.int
+    FEE_RATE_FIELD_NUMBER: _builtins.int
+    TIME_LOCK_DELTA_FIELD_NUMBER: _builtins.int
+    MAX_HTLC_MSAT_FIELD_NUMBER: _builtins.int
+    MIN_HTLC_MSAT_FIELD_NUMBER: _builtins.int
+    MIN_HTLC_MSAT_SPECIFIED_FIELD_NUMBER: _builtins.int
+    base_fee_msat: _builtins.int
+    """The base fee charged regardless of the number of milli-satoshis sent."""
+    fee_rate: _builtins.float
+    """The effective fee rate in milli-satoshis. The precision of this value
+    goes up to 6 decimal places, so 1e-6.
+    """
+    time_lock_delta: _builtins.int
+    """The required timelock delta for HTLCs forwarded over the channel."""
+    max_htlc_msat: _builtins.int
+    """If set, the maximum HTLC size in milli-satoshis. If unset, the maximum
+    HTLC will be unchanged.
+    """
+    min_htlc_msat: _builtins.int
+    """The minimum HTLC size in milli-satoshis. Only applied if
+    min_htlc_msat_specified is true.
+    """
+    min_htlc_msat_specified: _builtins.bool
+    """If true, min_htlc_msat is applied."""
+    @_builtins.property
+    def chan_point(self) -> Global___ChannelPoint:
+        """If set, this update will target a specific channel."""
+
+    def __init__(
+        self,
+        *,
+        chan_point: Global___ChannelPoint | None = ...,
+        base_fee_msat: _builtins.int = ...,
+        fee_rate: _builtins.float = ...,
+        time_lock_delta: _builtins.int = ...,
+        max_htlc_msat: _builtins.int = ...,
+        min_htlc_msat: _builtins.int = ...,
+        min_htlc_msat_specified: _builtins.bool = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["chan_point", b"chan_point", "global", b"global", "scope", b"scope"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["base_fee_msat", b"base_fee_msat", "chan_point", b"chan_point", "fee_rate", b"fee_rate", "global", b"global", "max_htlc_msat", b"max_htlc_msat", "min_htlc_msat", b"min_htlc_msat", "min_htlc_msat_specified", b"min_htlc_msat_specified", "scope", b"scope", "time_lock_delta", b"time_lock_delta"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    _WhichOneofReturnType_scope: _TypeAlias = _typing.Literal["global", "chan_point"]  # noqa: Y015
+    _WhichOneofArgType_scope: _TypeAlias = _typing.Literal["scope", b"scope"]  # noqa: Y015
+    def WhichOneof(self, oneof_group: _WhichOneofArgType_scope) -> _WhichOneofReturnType_scope | None: ...
+
+Global___PolicyUpdateRequest: _TypeAlias = PolicyUpdateRequest  # noqa: Y015
+
+@_typing.final
+class FailedUpdate(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    OUTPOINT_FIELD_NUMBER: _builtins.int
+    REASON_FIELD_NUMBER: _builtins.int
+    UPDATE_ERROR_FIELD_NUMBER: _builtins.int
+    reason: Global___UpdateFailure.ValueType
+    """Reason for the policy update failure."""
+    update_error: _builtins.str
+    """A string representation of the policy update error."""
+    @_builtins.property
+    def outpoint(self) -> Global___OutPoint:
+        """The outpoint in format txid:n"""
+
+    def __init__(
+        self,
+        *,
+        outpoint: Global___OutPoint | None = ...,
+        reason: Global___UpdateFailure.ValueType = ...,
+        update_error: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["outpoint", b"outpoint"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["outpoint", b"outpoint", "reason", b"reason", "update_error", b"update_error"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___FailedUpdate: _TypeAlias = FailedUpdate  # noqa: Y015
+
+@_typing.final
+class PolicyUpdateResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    FAILED_UPDATES_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def failed_updates(self) -> _containers.RepeatedCompositeFieldContainer[Global___FailedUpdate]:
+        """List of failed policy updates."""
+
+    def __init__(
+        self,
+        *,
+        failed_updates: _abc.Iterable[Global___FailedUpdate] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["failed_updates", b"failed_updates"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___PolicyUpdateResponse: _TypeAlias = PolicyUpdateResponse  # noqa: Y015
+
+@_typing.final
+class ForwardingHistoryRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    START_TIME_FIELD_NUMBER: _builtins.int
+    END_TIME_FIELD_NUMBER: _builtins.int
+    INDEX_OFFSET_FIELD_NUMBER: _builtins.int
+    NUM_MAX_EVENTS_FIELD_NUMBER: _builtins.int
+    start_time: _builtins.int
+    """Start time is the starting point of the forwarding history request. All
+    records beyond this point will be included, respecting the end time, and
+    the index offset.
+    """
+    end_time: _builtins.int
+    """End time is the end point of the forwarding history request. The
+    response will carry at most 50k records between the start time and the
+    end time. The index offset can be used to implement pagination.
+    """
+    index_offset: _builtins.int
+    """Index offset is the offset in the time series to start at. As each
+    response can only contain 50k records, callers can use this to skip
+    around within a packed time series.
+    """
+    num_max_events: _builtins.int
+    """The max number of events to return in the response to this query."""
+    def __init__(
+        self,
+        *,
+        start_time: _builtins.int = ...,
+        end_time: _builtins.int = ...,
+        index_offset: _builtins.int = ...,
+        num_max_events: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["end_time", b"end_time", "index_offset", b"index_offset", "num_max_events", b"num_max_events", "start_time", b"start_time"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ForwardingHistoryRequest: _TypeAlias = ForwardingHistoryRequest  # noqa: Y015
+
+@_typing.final
+class ForwardingEvent(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    TIMESTAMP_FIELD_NUMBER: _builtins.int
+    CHAN_ID_IN_FIELD_NUMBER: _builtins.int
+    CHAN_ID_OUT_FIELD_NUMBER: _builtins.int
+    AMT_IN_FIELD_NUMBER: _builtins.int
+    AMT_OUT_FIELD_NUMBER: _builtins.int
+    FEE_FIELD_NUMBER: _builtins.int
+    FEE_MSAT_FIELD_NUMBER: _builtins.int
+    AMT_IN_MSAT_FIELD_NUMBER: _builtins.int
+    AMT_OUT_MSAT_FIELD_NUMBER: _builtins.int
+    TIMESTAMP_NS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def timestamp(self) -> _builtins.int:
+        """Timestamp is the time (unix epoch offset) that this circuit was
+        completed. Deprecated by timestamp_ns.
+        """
+
+    @timestamp.setter
+    @_deprecated("""This field has been marked as deprecated using proto field options.""")
+    def timestamp(self, value: _builtins.int) -> None:
+        """Timestamp is the time (unix epoch offset) that this circuit was
+        completed. Deprecated by timestamp_ns.
+        """
+
+    chan_id_in: _builtins.int
+    """The incoming channel ID that carried the HTLC that created the circuit."""
+    chan_id_out: _builtins.int
+    """The outgoing channel ID that carried the preimage that completed the
+    circuit.
+    """
+    amt_in: _builtins.int
+    """The total amount (in satoshis) of the incoming HTLC that created half
+    the circuit.
+    """
+    amt_out: _builtins.int
+    """The total amount (in satoshis) of the outgoing HTLC that created the
+    second half of the circuit.
+    """
+    fee: _builtins.int
+    """The total fee (in satoshis) that this payment circuit carried."""
+    fee_msat: _builtins.int
+    """The total fee (in milli-satoshis) that this payment circuit carried."""
+    amt_in_msat: _builtins.int
+    """The total amount (in milli-satoshis) of the incoming HTLC that created
+    half the circuit.
+    """
+    amt_out_msat: _builtins.int
+    """The total amount (in milli-satoshis) of the outgoing HTLC that created
+    the second half of the circuit.
+    """
+    timestamp_ns: _builtins.int
+    """The number of nanoseconds elapsed since January 1, 1970 UTC when this
+    circuit was completed.
+    """
+    def __init__(
+        self,
+        *,
+        timestamp: _builtins.int = ...,
+        chan_id_in: _builtins.int = ...,
+        chan_id_out: _builtins.int = ...,
+        amt_in: _builtins.int = ...,
+        amt_out: _builtins.int = ...,
+        fee: _builtins.int = ...,
+        fee_msat: _builtins.int = ...,
+        amt_in_msat: _builtins.int = ...,
+        amt_out_msat: _builtins.int = ...,
+        timestamp_ns: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["amt_in", b"amt_in", "amt_in_msat", b"amt_in_msat", "amt_out", b"amt_out", "amt_out_msat", b"amt_out_msat", "chan_id_in", b"chan_id_in", "chan_id_out", b"chan_id_out", "fee", b"fee", "fee_msat", b"fee_msat", "timestamp", b"timestamp", "timestamp_ns", b"timestamp_ns"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ForwardingEvent: _TypeAlias = ForwardingEvent  # noqa: Y015
+
+@_typing.final
+class ForwardingHistoryResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    FORWARDING_EVENTS_FIELD_NUMBER: _builtins.int
+    LAST_OFFSET_INDEX_FIELD_NUMBER: _builtins.int
+    last_offset_index: _builtins.int
+    """The index of the last time in the set of returned forwarding events. Can
+    be used to seek further, pagination style.
+    """
+    @_builtins.property
+    def forwarding_events(self) -> _containers.RepeatedCompositeFieldContainer[Global___ForwardingEvent]:
+        """A list of forwarding events from the time slice of the time series
+        specified in the request.
+        """
+
+    def __init__(
+        self,
+        *,
+        forwarding_events: _abc.Iterable[Global___ForwardingEvent] | None = ...,
+        last_offset_index: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["forwarding_events", b"forwarding_events", "last_offset_index", b"last_offset_index"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ForwardingHistoryResponse: _TypeAlias = ForwardingHistoryResponse  # noqa: Y015
+
+@_typing.final
+class ExportChannelBackupRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    CHAN_POINT_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def chan_point(self) -> Global___ChannelPoint:
+        """The target channel point to obtain a back up for."""
+
+    def __init__(
+        self,
+        *,
+        chan_point: Global___ChannelPoint | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["chan_point", b"chan_point"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["chan_point", b"chan_point"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ExportChannelBackupRequest: _TypeAlias = ExportChannelBackupRequest  # noqa: Y015
+
+@_typing.final
+class ChannelBackup(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    CHAN_POINT_FIELD_NUMBER: _builtins.int
+    CHAN_BACKUP_FIELD_NUMBER: _builtins.int
+    chan_backup: _builtins.bytes
+    """
+    Is an encrypted single-chan backup. this can be passed to
+    RestoreChannelBackups, or the WalletUnlocker Init and Unlock methods in
+    order to trigger the recovery protocol. When using REST, this field must be
+    encoded as base64.
+    """
+    @_builtins.property
+    def chan_point(self) -> Global___ChannelPoint:
+        """
+        Identifies the channel that this backup belongs to.
+        """
+
+    def __init__(
+        self,
+        *,
+        chan_point: Global___ChannelPoint | None = ...,
+        chan_backup: _builtins.bytes = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["chan_point", b"chan_point"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["chan_backup", b"chan_backup", "chan_point", b"chan_point"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ChannelBackup: _TypeAlias = ChannelBackup  # noqa: Y015
+
+@_typing.final
+class MultiChanBackup(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    CHAN_POINTS_FIELD_NUMBER: _builtins.int
+    MULTI_CHAN_BACKUP_FIELD_NUMBER: _builtins.int
+    multi_chan_backup: _builtins.bytes
+    """
+    A single encrypted blob containing all the static channel backups of the
+    channel listed above. This can be stored as a single file or blob, and
+    safely be replaced with any prior/future versions. When using REST, this
+    field must be encoded as base64.
+    """
+    @_builtins.property
+    def chan_points(self) -> _containers.RepeatedCompositeFieldContainer[Global___ChannelPoint]:
+        """
+        Is the set of all channels that are included in this multi-channel backup.
+        """
+
+    def __init__(
+        self,
+        *,
+        chan_points: _abc.Iterable[Global___ChannelPoint] | None = ...,
+        multi_chan_backup: _builtins.bytes = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["chan_points", b"chan_points", "multi_chan_backup", b"multi_chan_backup"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___MultiChanBackup: _TypeAlias = MultiChanBackup  # noqa: Y015
+
+@_typing.final
+class ChanBackupExportRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ChanBackupExportRequest: _TypeAlias = ChanBackupExportRequest  # noqa: Y015
+
+@_typing.final
+class ChanBackupSnapshot(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SINGLE_CHAN_BACKUPS_FIELD_NUMBER: _builtins.int
+    MULTI_CHAN_BACKUP_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def single_chan_backups(self) -> Global___ChannelBackups:
+        """
+        The set of new channels that have been added since the last channel backup
+        snapshot was requested.
+        """
+
+    @_builtins.property
+    def multi_chan_backup(self) -> Global___MultiChanBackup:
+        """
+        A multi-channel backup that covers all open channels currently known to
+        lnd.
+        """
+
+    def __init__(
+        self,
+        *,
+        single_chan_backups: Global___ChannelBackups | None = ...,
+        multi_chan_backup: Global___MultiChanBackup | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["multi_chan_backup", b"multi_chan_backup", "single_chan_backups", b"single_chan_backups"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["multi_chan_backup", b"multi_chan_backup", "single_chan_backups", b"single_chan_backups"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ChanBackupSnapshot: _TypeAlias = ChanBackupSnapshot  # noqa: Y015
+
+@_typing.final
+class ChannelBackups(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    CHAN_BACKUPS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def chan_backups(self) -> _containers.RepeatedCompositeFieldContainer[Global___ChannelBackup]:
+        """
+        A set of single-chan static channel backups.
+        """
+
+    def __init__(
+        self,
+        *,
+        chan_backups: _abc.Iterable[Global___ChannelBackup] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["chan_backups", b"chan_backups"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ChannelBackups: _TypeAlias = ChannelBackups  # noqa: Y015
+
+@_typing.final
+class RestoreChanBackupRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    CHAN_BACKUPS_FIELD_NUMBER: _builtins.int
+    MULTI_CHAN_BACKUP_FIELD_NUMBER: _builtins.int
+    multi_chan_backup: _builtins.bytes
+    """
+    The channels to restore in the packed multi backup format. When using
+    REST, this field must be encoded as base64.
+    """
+    @_builtins.property
+    def chan_backups(self) -> Global___ChannelBackups:
+        """
+        The channels to restore as a list of channel/backup pairs.
+        """
+
+    def __init__(
+        self,
+        *,
+        chan_backups: Global___ChannelBackups | None = ...,
+        multi_chan_backup: _builtins.bytes = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["backup", b"backup", "chan_backups", b"chan_backups", "multi_chan_backup", b"multi_chan_backup"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["backup", b"backup", "chan_backups", b"chan_backups", "multi_chan_backup", b"multi_chan_backup"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    _WhichOneofReturnType_backup: _TypeAlias = _typing.Literal["chan_backups", "multi_chan_backup"]  # noqa: Y015
+    _WhichOneofArgType_backup: _TypeAlias = _typing.Literal["backup", b"backup"]  # noqa: Y015
+    def WhichOneof(self, oneof_group: _WhichOneofArgType_backup) -> _WhichOneofReturnType_backup | None: ...
+
+Global___RestoreChanBackupRequest: _TypeAlias = RestoreChanBackupRequest  # noqa: Y015
+
+@_typing.final
+class RestoreBackupResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___RestoreBackupResponse: _TypeAlias = RestoreBackupResponse  # noqa: Y015
+
+@_typing.final
+class ChannelBackupSubscription(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ChannelBackupSubscription: _TypeAlias = ChannelBackupSubscription  # noqa: Y015
+
+@_typing.final
+class VerifyChanBackupResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___VerifyChanBackupResponse: _TypeAlias = VerifyChanBackupResponse  # noqa: Y015
+
+@_typing.final
+class MacaroonPermission(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ENTITY_FIELD_NUMBER: _builtins.int
+    ACTION_FIELD_NUMBER: _builtins.int
+    entity: _builtins.str
+    """The entity a permission grants access to."""
+    action: _builtins.str
+    """The action that is granted."""
+    def __init__(
+        self,
+        *,
+        entity: _builtins.str = ...,
+        action: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["action", b"action", "entity", b"entity"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___MacaroonPermission: _TypeAlias = MacaroonPermission  # noqa: Y015
+
+@_typing.final
+class BakeMacaroonRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PERMISSIONS_FIELD_NUMBER: _builtins.int
+    ROOT_KEY_ID_FIELD_NUMBER: _builtins.int
+    ALLOW_EXTERNAL_PERMISSIONS_FIELD_NUMBER: _builtins.int
+    root_key_id: _builtins.int
+    """The root key ID used to create the macaroon, must be a positive integer."""
+    allow_external_permissions: _builtins.bool
+    """
+    Informs the RPC on whether to allow external permissions that LND is not
+    aware of.
+    """
+    @_builtins.property
+    def permissions(self) -> _containers.RepeatedCompositeFieldContainer[Global___MacaroonPermission]:
+        """The list of permissions the new macaroon should grant."""
+
+    def __init__(
+        self,
+        *,
+        permissions: _abc.Iterable[Global___MacaroonPermission] | None = ...,
+        root_key_id: _builtins.int = ...,
+        allow_external_permissions: _builtins.bool = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["allow_external_permissions", b"allow_external_permissions", "permissions", b"permissions", "root_key_id", b"root_key_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___BakeMacaroonRequest: _TypeAlias = BakeMacaroonRequest  # noqa: Y015
+
+@_typing.final
+class BakeMacaroonResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    MACAROON_FIELD_NUMBER: _builtins.int
+    macaroon: _builtins.str
+    """The hex encoded macaroon, serialized in binary format."""
+    def __init__(
+        self,
+        *,
+        macaroon: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["macaroon", b"macaroon"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___BakeMacaroonResponse: _TypeAlias = BakeMacaroonResponse  # noqa: Y015
+
+@_typing.final
+class ListMacaroonIDsRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ListMacaroonIDsRequest: _TypeAlias = ListMacaroonIDsRequest  # noqa: Y015
+
+@_typing.final
+class ListMacaroonIDsResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ROOT_KEY_IDS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def root_key_ids(self) -> _containers.RepeatedScalarFieldContainer[_builtins.int]:
+        """The list of root key IDs that are in use."""
+
+    def __init__(
+        self,
+        *,
+        root_key_ids: _abc.Iterable[_builtins.int] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["root_key_ids", b"root_key_ids"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ListMacaroonIDsResponse: _TypeAlias = ListMacaroonIDsResponse  # noqa: Y015
+
+@_typing.final
+class DeleteMacaroonIDRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ROOT_KEY_ID_FIELD_NUMBER: _builtins.int
+    root_key_id: _builtins.int
+    """The root key ID to be removed."""
+    def __init__(
+        self,
+        *,
+        root_key_id: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["root_key_id", b"root_key_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DeleteMacaroonIDRequest: _TypeAlias = DeleteMacaroonIDRequest  # noqa: Y015
+
+@_typing.final
+class DeleteMacaroonIDResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    DELETED_FIELD_NUMBER: _builtins.int
+    deleted: _builtins.bool
+    """A boolean indicates that the deletion is successful."""
+    def __init__(
+        self,
+        *,
+        deleted: _builtins.bool = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["deleted", b"deleted"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DeleteMacaroonIDResponse: _TypeAlias = DeleteMacaroonIDResponse  # noqa: Y015
+
+@_typing.final
+class MacaroonPermissionList(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PERMISSIONS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def permissions(self) -> _containers.RepeatedCompositeFieldContainer[Global___MacaroonPermission]:
+        """A list of macaroon permissions."""
+
+    def __init__(
+        self,
+        *,
+        permissions: _abc.Iterable[Global___MacaroonPermission] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["permissions", b"permissions"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___MacaroonPermissionList: _TypeAlias = MacaroonPermissionList  # noqa: Y015
+
+@_typing.final
+class ListPermissionsRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ListPermissionsRequest: _TypeAlias = ListPermissionsRequest  # noqa: Y015
+
+@_typing.final
+class ListPermissionsResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class MethodPermissionsEntry(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: _builtins.int
+        VALUE_FIELD_NUMBER: _builtins.int
+        key: _builtins.str
+        @_builtins.property
+        def value(self) -> Global___MacaroonPermissionList: ...
+        def __init__(
+            self,
+            *,
+            key: _builtins.str = ...,
+            value: Global___MacaroonPermissionList | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _typing.Literal["value", b"value"]  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["key", b"key", "value", b"value"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    METHOD_PERMISSIONS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def method_permissions(self) -> _containers.MessageMap[_builtins.str, Global___MacaroonPermissionList]:
+        """
+        A map between all RPC method URIs and their required macaroon permissions to
+        access them.
+        """
+
+    def __init__(
+        self,
+        *,
+        method_permissions: _abc.Mapping[_builtins.str, Global___MacaroonPermissionList] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["method_permissions", b"method_permissions"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ListPermissionsResponse: _TypeAlias = ListPermissionsResponse  # noqa: Y015
+
+@_typing.final
+class Failure(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    class _FailureCode:
+        ValueType = _typing.NewType("ValueType", _builtins.int)
+        V: _TypeAlias = ValueType  # noqa: Y015
+
+    class _FailureCodeEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[Failure._FailureCode.ValueType], _builtins.type):
+        DESCRIPTOR: _descriptor.EnumDescriptor
+        RESERVED: Failure._FailureCode.ValueType  # 0
+        """
+        The numbers assigned in this enumeration match the failure codes as
+        defined in BOLT #4. Because protobuf 3 requires enums to start with 0,
+        a RESERVED value is added.
+        """
+        INCORRECT_OR_UNKNOWN_PAYMENT_DETAILS: Failure._FailureCode.ValueType  # 1
+        INCORRECT_PAYMENT_AMOUNT: Failure._FailureCode.ValueType  # 2
+        FINAL_INCORRECT_CLTV_EXPIRY: Failure._FailureCode.ValueType  # 3
+        FINAL_INCORRECT_HTLC_AMOUNT: Failure._FailureCode.ValueType  # 4
+        FINAL_EXPIRY_TOO_SOON: Failure._FailureCode.ValueType  # 5
+        INVALID_REALM: Failure._FailureCode.ValueType  # 6
+        EXPIRY_TOO_SOON: Failure._FailureCode.ValueType  # 7
+        INVALID_ONION_VERSION: Failure._FailureCode.ValueType  # 8
+        INVALID_ONION_HMAC: Failure._FailureCode.ValueType  # 9
+        INVALID_ONION_KEY: Failure._FailureCode.ValueType  # 10
+        AMOUNT_BELOW_MINIMUM: Failure._FailureCode.ValueType  # 11
+        FEE_INSUFFICIENT: Failure._FailureCode.ValueType  # 12
+        INCORRECT_CLTV_EXPIRY: Failure._FailureCode.ValueType  # 13
+        CHANNEL_DISABLED: Failure._FailureCode.ValueType  # 14
+        TEMPORARY_CHANNEL_FAILURE: Failure._FailureCode.ValueType  # 15
+        REQUIRED_NODE_FEATURE_MISSING: Failure._FailureCode.ValueType  # 16
+        REQUIRED_CHANNEL_FEATURE_MISSING: Failure._FailureCode.ValueType  # 17
+        UNKNOWN_NEXT_PEER: Failure._FailureCode.ValueType  # 18
+        TEMPORARY_NODE_FAILURE: Failure._FailureCode.ValueType  # 19
+        PERMANENT_NODE_FAILURE: Failure._FailureCode.ValueType  # 20
+        PERMANENT_CHANNEL_FAILURE: Failure._FailureCode.ValueType  # 21
+        EXPIRY_TOO_FAR: Failure._FailureCode.ValueType  # 22
+        MPP_TIMEOUT: Failure._FailureCode.ValueType  # 23
+        INVALID_ONION_PAYLOAD: Failure._FailureCode.ValueType  # 24
+        INTERNAL_FAILURE: Failure._FailureCode.ValueType  # 997
+        """
+        An internal error occurred.
+        """
+        UNKNOWN_FAILURE: Failure._FailureCode.ValueType  # 998
+        """
+        The error source is known, but the failure itself couldn't be decoded.
+        """
+        UNREADABLE_FAILURE: Failure._FailureCode.ValueType  # 999
+        """
+        An unreadable failure result is returned if the received failure message
+        cannot be decrypted. In that case the error source is unknown.
+        """
+
+    class FailureCode(_FailureCode, metaclass=_FailureCodeEnumTypeWrapper): ...
+    RESERVED: Failure.FailureCode.ValueType  # 0
+    """
+    The numbers assigned in this enumeration match the failure codes as
+    defined in BOLT #4. Because protobuf 3 requires enums to start with 0,
+    a RESERVED value is added.
+    """
+    INCORRECT_OR_UNKNOWN_PAYMENT_DETAILS: Failure.FailureCode.ValueType  # 1
+    INCORRECT_PAYMENT_AMOUNT: Failure.FailureCode.ValueType  # 2
+    FINAL_INCORRECT_CLTV_EXPIRY: Failure.FailureCode.ValueType  # 3
+    FINAL_INCORRECT_HTLC_AMOUNT: Failure.FailureCode.ValueType  # 4
+    FINAL_EXPIRY_TOO_SOON: Failure.FailureCode.ValueType  # 5
+    INVALID_REALM: Failure.FailureCode.ValueType  # 6
+    EXPIRY_TOO_SOON: Failure.FailureCode.ValueType  # 7
+    INVALID_ONION_VERSION: Failure.FailureCode.ValueType  # 8
+    INVALID_ONION_HMAC: Failure.FailureCode.ValueType  # 9
+    INVALID_ONION_KEY: Failure.FailureCode.ValueType  # 10
+    AMOUNT_BELOW_MINIMUM: Failure.FailureCode.ValueType  # 11
+    FEE_INSUFFICIENT: Failure.FailureCode.ValueType  # 12
+    INCORRECT_CLTV_EXPIRY: Failure.FailureCode.ValueType  # 13
+    CHANNEL_DISABLED: Failure.FailureCode.ValueType  # 14
+    TEMPORARY_CHANNEL_FAILURE: Failure.FailureCode.ValueType  # 15
+    REQUIRED_NODE_FEATURE_MISSING: Failure.FailureCode.ValueType  # 16
+    REQUIRED_CHANNEL_FEATURE_MISSING: Failure.FailureCode.ValueType  # 17
+    UNKNOWN_NEXT_PEER: Failure.FailureCode.ValueType  # 18
+    TEMPORARY_NODE_FAILURE: Failure.FailureCode.ValueType  # 19
+    PERMANENT_NODE_FAILURE: Failure.FailureCode.ValueType  # 20
+    PERMANENT_CHANNEL_FAILURE: Failure.FailureCode.ValueType  # 21
+    EXPIRY_TOO_FAR: Failure.FailureCode.ValueType  # 22
+    MPP_TIMEOUT: Failure.FailureCode.ValueType  # 23
+    INVALID_ONION_PAYLOAD: Failure.FailureCode.ValueType  # 24
+    INTERNAL_FAILURE: Failure.FailureCode.ValueType  # 997
+    """
+    An internal error occurred.
+    """
+    UNKNOWN_FAILURE: Failure.FailureCode.ValueType  # 998
+    """
+    The error source is known, but the failure itself couldn't be decoded.
+    """
+    UNREADABLE_FAILURE: Failure.FailureCode.ValueType  # 999
+    """
+    An unreadable failure result is returned if the received failure message
+    cannot be decrypted. In that case the error source is unknown.
+    """
+
+    CODE_FIELD_NUMBER: _builtins.int
+    CHANNEL_UPDATE_FIELD_NUMBER: _builtins.int
+    HTLC_MSAT_FIELD_NUMBER: _builtins.int
+    ONION_SHA_256_FIELD_NUMBER: _builtins.int
+    CLTV_EXPIRY_FIELD_NUMBER: _builtins.int
+    FLAGS_FIELD_NUMBER: _builtins.int
+    FAILURE_SOURCE_INDEX_FIELD_NUMBER: _builtins.int
+    HEIGHT_FIELD_NUMBER: _builtins.int
+    code: Global___Failure.FailureCode.ValueType
+    """Failure code as defined in the Lightning spec"""
+    htlc_msat: _builtins.int
+    """A failure type-dependent htlc value."""
+    onion_sha_256: _builtins.bytes
+    """The sha256 sum of the onion payload."""
+    cltv_expiry: _builtins.int
+    """A failure type-dependent cltv expiry value."""
+    flags: _builtins.int
+    """A failure type-dependent flags value."""
+    failure_source_index: _builtins.int
+    """
+    The position in the path of the intermediate or final node that generated
+    the failure message. Position zero is the sender node.
+    """
+    height: _builtins.int
+    """A failure type-dependent block height."""
+    @_builtins.property
+    def channel_update(self) -> Global___ChannelUpdate:
+        """An optional channel update message."""
+
+    def __init__(
+        self,
+        *,
+        code: Global___Failure.FailureCode.ValueType = ...,
+        channel_update: Global___ChannelUpdate | None = ...,
+        htlc_msat: _builtins.int = ...,
+        onion_sha_256: _builtins.bytes = ...,
+        cltv_expiry: _builtins.int = ...,
+        flags: _builtins.int = ...,
+        failure_source_index: _builtins.int = ...,
+        height: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["channel_update", b"channel_update"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["channel_update", b"channel_update", "cltv_expiry", b"cltv_expiry", "code", b"code", "failure_source_index", b"failure_source_index", "flags", b"flags", "height", b"height", "htlc_msat", b"htlc_msat", "onion_sha_256", b"onion_sha_256"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___Failure: _TypeAlias = Failure  # noqa: Y015
+
+@_typing.final
+class ChannelUpdate(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SIGNATURE_FIELD_NUMBER: _builtins.int
+    CHAIN_HASH_FIELD_NUMBER: _builtins.int
+    CHAN_ID_FIELD_NUMBER: _builtins.int
+    TIMESTAMP_FIELD_NUMBER: _builtins.int
+    MESSAGE_FLAGS_FIELD_NUMBER: _builtins.int
+    CHANNEL_FLAGS_FIELD_NUMBER: _builtins.int
+    TIME_LOCK_DELTA_FIELD_NUMBER: _builtins.int
+    HTLC_MINIMUM_MSAT_FIELD_NUMBER: _builtins.int
+    BASE_FEE_FIELD_NUMBER: _builtins.int
+    FEE_RATE_FIELD_NUMBER: _builtins.int
+    HTLC_MAXIMUM_MSAT_FIELD_NUMBER: _builtins.int
+    EXTRA_OPAQUE_DATA_FIELD_NUMBER: _builtins.int
+    signature: _builtins.bytes
+    """
+    The signature that validates the announced data and proves the ownership
+    of node id.
+    """
+    chain_hash: _builtins.bytes
+    """
+    The target chain that this channel was opened within. This value
+    should be the genesis hash of the target chain. Along with the short
+    channel ID, this uniquely identifies the channel globally in a
+    blockchain.
+    """
+    chan_id: _builtins.int
+    """
+    The unique description of the funding transaction.
+    """
+    timestamp: _builtins.int
+    """
+    A timestamp that allows ordering in the case of multiple announcements.
+    We should ignore the message if timestamp is not greater than the
+    last-received.
+    """
+    message_flags: _builtins.int
+    """
+    The bitfield that describes whether optional fields are present in this
+    update. Currently, the least-significant bit must be set to 1 if the
+    optional field MaxHtlc is present.
+    """
+    channel_flags: _builtins.int
+    """
+    The bitfield that describes additional meta-data concerning how the
+    update is to be interpreted. Currently, the least-significant bit must be
+    set to 0 if the creating node corresponds to the first node in the
+    previously sent channel announcement and 1 otherwise. If the second bit
+    is set, then the channel is set to be disabled.
+    """
+    time_lock_delta: _builtins.int
+    """
+    The minimum number of blocks this node requires to be added to the expiry
+    of HTLCs. This is a security parameter determined by the node operator.
+    This value represents the required gap between the time locks of the
+    incoming and outgoing HTLC's set to this node.
+    """
+    htlc_minimum_msat: _builtins.int
+    """
+    The minimum HTLC value which will be accepted.
+    """
+    base_fee: _builtins.int
+    """
+    The base fee that must be used for incoming HTLC's to this particular
+    channel. This value will be tacked onto the required for a payment
+    independent of the size of the payment.
+    """
+    fee_rate: _builtins.int
+    """
+    The fee rate that will be charged per millionth of a satoshi.
+    """
+    htlc_maximum_msat: _builtins.int
+    """
+    The maximum HTLC value which will be accepted.
+    """
+    extra_opaque_data: _builtins.bytes
+    """
+    The set of data that was appended to this message, some of which we may
+    not actually know how to iterate or parse. By holding onto this data, we
+    ensure that we're able to properly validate the set of signatures that
+    cover these new fields, and ensure we're able to make upgrades to the
+    network in a forwards compatible manner.
+    """
+    def __init__(
+        self,
+        *,
+        signature: _builtins.bytes = ...,
+        chain_hash: _builtins.bytes = ...,
+        chan_id: _builtins.int = ...,
+        timestamp: _builtins.int = ...,
+        message_flags: _builtins.int = ...,
+        channel_flags: _builtins.int = ...,
+        time_lock_delta: _builtins.int = ...,
+        htlc_minimum_msat: _builtins.int = ...,
+        base_fee: _builtins.int = ...,
+        fee_rate: _builtins.int = ...,
+        htlc_maximum_msat: _builtins.int = ...,
+        extra_opaque_data: _builtins.bytes = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["base_fee", b"base_fee", "chain_hash", b"chain_hash", "chan_id", b"chan_id", "channel_flags", b"channel_flags", "extra_opaque_data", b"extra_opaque_data", "fee_rate", b"fee_rate", "htlc_maximum_msat", b"htlc_maximum_msat", "htlc_minimum_msat", b"htlc_minimum_msat", "message_flags", b"message_flags", "signature", b"signature", "time_lock_delta", b"time_lock_delta", "timestamp", b"timestamp"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ChannelUpdate: _TypeAlias = ChannelUpdate  # noqa: Y015
+
+@_typing.final
+class MacaroonId(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    NONCE_FIELD_NUMBER: _builtins.int
+    STORAGEID_FIELD_NUMBER: _builtins.int
+    OPS_FIELD_NUMBER: _builtins.int
+    nonce: _builtins.bytes
+    storageId: _builtins.bytes
+    @_builtins.property
+    def ops(self) -> _containers.RepeatedCompositeFieldContainer[Global___Op]: ...
+    def __init__(
+        self,
+        *,
+        nonce: _builtins.bytes = ...,
+        storageId: _builtins.bytes = ...,
+        ops: _abc.Iterable[Global___Op] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["nonce", b"nonce", "ops", b"ops", "storageId", b"storageId"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___MacaroonId: _TypeAlias = MacaroonId  # noqa: Y015
+
+@_typing.final
+class Op(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ENTITY_FIELD_NUMBER: _builtins.int
+    ACTIONS_FIELD_NUMBER: _builtins.int
+    entity: _builtins.str
+    @_builtins.property
+    def actions(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]: ...
+    def __init__(
+        self,
+        *,
+        entity: _builtins.str = ...,
+        actions: _abc.Iterable[_builtins.str] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["actions", b"actions", "entity", b"entity"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___Op: _TypeAlias = Op  # noqa: Y015
+
+@_typing.final
+class CheckMacPermRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    MACAROON_FIELD_NUMBER: _builtins.int
+    PERMISSIONS_FIELD_NUMBER: _builtins.int
+    FULLMETHOD_FIELD_NUMBER: _builtins.int
+    macaroon: _builtins.bytes
+    fullMethod: _builtins.str
+    @_builtins.property
+    def permissions(self) -> _containers.RepeatedCompositeFieldContainer[Global___MacaroonPermission]: ...
+    def __init__(
+        self,
+        *,
+        macaroon: _builtins.bytes = ...,
+        permissions: _abc.Iterable[Global___MacaroonPermission] | None = ...,
+        fullMethod: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["fullMethod", b"fullMethod", "macaroon", b"macaroon", "permissions", b"permissions"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___CheckMacPermRequest: _TypeAlias = CheckMacPermRequest  # noqa: Y015
+
+@_typing.final
+class CheckMacPermResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    VALID_FIELD_NUMBER: _builtins.int
+    valid: _builtins.bool
+    def __init__(
+        self,
+        *,
+        valid: _builtins.bool = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["valid", b"valid"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___CheckMacPermResponse: _TypeAlias = CheckMacPermResponse  # noqa: Y015
+
+@_typing.final
+class RPCMiddlewareRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    REQUEST_ID_FIELD_NUMBER: _builtins.int
+    RAW_MACAROON_FIELD_NUMBER: _builtins.int
+    CUSTOM_CAVEAT_CONDITION_FIELD_NUMBER: _builtins.int
+    STREAM_AUTH_FIELD_NUMBER: _builtins.int
+    REQUEST_FIELD_NUMBER: _builtins.int
+    RESPONSE_FIELD_NUMBER: _builtins.int
+    request_id: _builtins.int
+    """
+    The unique ID of the intercepted request. Useful for mapping request to
+    response when implementing full duplex message interception.
+    """
+    raw_macaroon: _builtins.bytes
+    """
+    The raw bytes of the complete macaroon as sent by the gRPC client in the
+    original request. This might be empty for a request that doesn't require
+    macaroons such as the wallet unlocker RPCs.
+    """
+    custom_caveat_condition: _builtins.str
+    """
+    The parsed condition of the macaroon's custom caveat for convenient access.
+    This field only contains the value of the custom caveat that the handling
+    middleware has registered itself for. The condition _must_ be validated for
+    messages of intercept_type stream_auth and request!
+    """
+    @_builtins.property
+    def stream_auth(self) -> Global___StreamAuth:
+        """
+        Intercept stream authentication: each new streaming RPC call that is
+        initiated against lnd and contains the middleware's custom macaroon
+        caveat can be approved or denied based upon the macaroon in the stream
+        header. This message will only be sent for streaming RPCs, unary RPCs
+        must handle the macaroon authentication in the request interception to
+        avoid an additional message round trip between lnd and the middleware.
+        """
+
+    @_builtins.property
+    def request(self) -> Global___RPCMessage:
+        """
+        Intercept incoming gRPC client request message: all incoming messages,
+        both on streaming and unary RPCs, are forwarded to the middleware for
+        inspection. For unary RPC messages the middleware is also expected to
+        validate the custom macaroon caveat of the request.
+        """
+
+    @_builtins.property
+    def response(self) -> Global___RPCMessage:
+        """
+        Intercept outgoing gRPC response message: all outgoing messages, both on
+        streaming and unary RPCs, are forwarded to the middleware for inspection
+        and amendment. The response in this message is the original response as
+        it was generated by the main RPC server. It can either be accepted
+        (=forwarded to the client), replaced/overwritten with a new message of
+        the same type, or replaced by an error message.
+        """
+
+    def __init__(
+        self,
+        *,
+        request_id: _builtins.int = ...,
+        raw_macaroon: _builtins.bytes = ...,
+        custom_caveat_condition: _builtins.str = ...,
+        stream_auth: Global___StreamAuth | None = ...,
+        request: Global___RPCMessage | None = ...,
+        response: Global___RPCMessage | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["intercept_type", b"intercept_type", "request", b"request", "response", b"response", "stream_auth", b"stream_auth"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["custom_caveat_condition", b"custom_caveat_condition", "intercept_type", b"intercept_type", "raw_macaroon", b"raw_macaroon", "request", b"request", "request_id", b"request_id", "response", b"response", "stream_auth", b"stream_auth"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    _WhichOneofReturnType_intercept_type: _TypeAlias = _typing.Literal["stream_auth", "request", "response"]  # noqa: Y015
+    _WhichOneofArgType_intercept_type: _TypeAlias = _typing.Literal["intercept_type", b"intercept_type"]  # noqa: Y015
+    def WhichOneof(self, oneof_group: _WhichOneofArgType_intercept_type) -> _WhichOneofReturnType_intercept_type | None: ...
+
+Global___RPCMiddlewareRequest: _TypeAlias = RPCMiddlewareRequest  # noqa: Y015
+
+@_typing.final
+class StreamAuth(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    METHOD_FULL_URI_FIELD_NUMBER: _builtins.int
+    method_full_uri: _builtins.str
+    """
+    The full URI (in the format /<rpcpackage>.<ServiceName>/MethodName, for
+    example /lnrpc.Lightning/GetInfo) of the streaming RPC method that was just
+    established.
+    """
+    def __init__(
+        self,
+        *,
+        method_full_uri: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["method_full_uri", b"method_full_uri"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___StreamAuth: _TypeAlias = StreamAuth  # noqa: Y015
+
+@_typing.final
+class RPCMessage(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    METHOD_FULL_URI_FIELD_NUMBER: _builtins.int
+    STREAM_RPC_FIELD_NUMBER: _builtins.int
+    TYPE_NAME_FIELD_NUMBER: _builtins.int
+    SERIALIZED_FIELD_NUMBER: _builtins.int
+    method_full_uri: _builtins.str
+    """
+    The full URI (in the format /<rpcpackage>.<ServiceName>/MethodName, for
+    example /lnrpc.Lightning/GetInfo) of the RPC method the message was sent
+    to/from.
+    """
+    stream_rpc: _builtins.bool
+    """
+    Indicates whether the message was sent over a streaming RPC method or not.
+    """
+    type_name: _builtins.str
+    """
+    The full canonical gRPC name of the message type (in the format
+    <rpcpackage>.TypeName, for example lnrpc.GetInfoRequest).
+    """
+    serialized: _builtins.bytes
+    """
+    The full content of the gRPC message, serialized in the binary protobuf
+    format.
+    """
+    def __init__(
+        self,
+        *,
+        method_full_uri: _builtins.str = ...,
+        stream_rpc: _builtins.bool = ...,
+        type_name: _builtins.str = ...,
+        serialized: _builtins.bytes = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["method_full_uri", b"method_full_uri", "serialized", b"serialized", "stream_rpc", b"stream_rpc", "type_name", b"type_name"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___RPCMessage: _TypeAlias = RPCMessage  # noqa: Y015
+
+@_typing.final
+class RPCMiddlewareResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    REQUEST_ID_FIELD_NUMBER: _builtins.int
+    REGISTER_FIELD_NUMBER: _builtins.int
+    FEEDBACK_FIELD_NUMBER: _builtins.int
+    request_id: _builtins.int
+    """
+    The unique ID of the intercepted request that this response refers to. Must
+    always be set when giving feedback to an intercept but is ignored for the
+    initial registration message.
+    """
+    @_builtins.property
+    def register(self) -> Global___MiddlewareRegistration:
+        """
+        The registration message identifies the middleware that's being
+        registered in lnd. The registration message must be sent immediately
+        after initiating the RegisterRpcMiddleware stream, otherwise lnd will
+        time out the attempt and terminate the request. NOTE: The middleware
+        will only receive interception messages for requests that contain a
+        macaroon with the custom caveat that the middleware declares it is
+        responsible for handling in the registration message! As a security
+        measure, _no_ middleware can intercept requests made with _unencumbered_
+        macaroons!
+        """
+
+    @_builtins.property
+    def feedback(self) -> Global___InterceptFeedback:
+        """
+        The middleware received an interception request and gives feedback to
+        it. The request_id indicates what message the feedback refers to.
+        """
+
+    def __init__(
+        self,
+        *,
+        request_id: _builtins.int = ...,
+        register: Global___MiddlewareRegistration | None = ...,
+        feedback: Global___InterceptFeedback | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["feedback", b"feedback", "middleware_message", b"middleware_message", "register", b"register"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["feedback", b"feedback", "middleware_message", b"middleware_message", "register", b"register", "request_id", b"request_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    _WhichOneofReturnType_middleware_message: _TypeAlias = _typing.Literal["register", "feedback"]  # noqa: Y015
+    _WhichOneofArgType_middleware_message: _TypeAlias = _typing.Literal["middleware_message", b"middleware_message"]  # noqa: Y015
+    def WhichOneof(self, oneof_group: _WhichOneofArgType_middleware_message) -> _WhichOneofReturnType_middleware_message | None: ...
+
+Global___RPCMiddlewareResponse: _TypeAlias = RPCMiddlewareResponse  # noqa: Y015
+
+@_typing.final
+class MiddlewareRegistration(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    MIDDLEWARE_NAME_FIELD_NUMBER: _builtins.int
+    CUSTOM_MACAROON_CAVEAT_NAME_FIELD_NUMBER: _builtins.int
+    READ_ONLY_MODE_FIELD_NUMBER: _builtins.int
+    middleware_name: _builtins.str
+    """
+    The name of the middleware to register. The name should be as informative
+    as possible and is logged on registration.
+    """
+    custom_macaroon_caveat_name: _builtins.str
+    """
+    The name of the custom macaroon caveat that this middleware is responsible
+    for. Only requests/responses that contain a macaroon with the registered
+    custom caveat are forwarded for interception to the middleware. The
+    exception being the read-only mode: All requests/responses are forwarded to
+    a middleware that requests read-only access but such a middleware won't be
+    allowed to _alter_ responses. As a security measure, _no_ middleware can
+    change responses to requests made with _unencumbered_ macaroons!
+    NOTE: Cannot be used at the same time as read_only_mode.
+    """
+    read_only_mode: _builtins.bool
+    """
+    Instead of defining a custom macaroon caveat name a middleware can register
+    itself for read-only access only. In that mode all requests/responses are
+    forwarded to the middleware but the middleware isn't allowed to alter any of
+    the responses.
+    NOTE: Cannot be used at the same time as custom_macaroon_caveat_name.
+    """
+    def __init__(
+        self,
+        *,
+        middleware_name: _builtins.str = ...,
+        custom_macaroon_caveat_name: _builtins.str = ...,
+        read_only_mode: _builtins.bool = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["custom_macaroon_caveat_name", b"custom_macaroon_caveat_name", "middleware_name", b"middleware_name", "read_only_mode", b"read_only_mode"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___MiddlewareRegistration: _TypeAlias = MiddlewareRegistration  # noqa: Y015
+
+@_typing.final
+class InterceptFeedback(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ERROR_FIELD_NUMBER: _builtins.int
+    REPLACE_RESPONSE_FIELD_NUMBER: _builtins.int
+    REPLACEMENT_SERIALIZED_FIELD_NUMBER: _builtins.int
+    error: _builtins.str
+    """
+    The error to return to the user. If this is non-empty, the incoming gRPC
+    stream/request is aborted and the error is returned to the gRPC client. If
+    this value is empty, it means the middleware accepts the stream/request/
+    response and the processing of it can continue.
+    """
+    replace_response: _builtins.bool
+    """
+    A boolean indicating that the gRPC response should be replaced/overwritten.
+    As its name suggests, this can only be used as a feedback to an intercepted
+    response RPC message and is ignored for feedback on any other message. This
+    boolean is needed because in protobuf an empty message is serialized as a
+    0-length or nil byte slice and we wouldn't be able to distinguish between
+    an empty replacement message and the "don't replace anything" case.
+    """
+    replacement_serialized: _builtins.bytes
+    """
+    If the replace_response field is set to true, this field must contain the
+    binary serialized gRPC response message in the protobuf format.
+    """
+    def __init__(
+        self,
+        *,
+        error: _builtins.str = ...,
+        replace_response: _builtins.bool = ...,
+        replacement_serialized: _builtins.bytes = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["error", b"error", "replace_response", b"replace_response", "replacement_serialized", b"replacement_serialized"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___InterceptFeedback: _TypeAlias = InterceptFeedback  # noqa: Y015
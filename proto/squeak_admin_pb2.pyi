@@ -0,0 +1,3668 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+"""
+
+from collections import abc as _abc
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf.internal import containers as _containers
+import builtins as _builtins
+import sys
+import typing as _typing
+
+if sys.version_info >= (3, 11):
+    from typing import TypeAlias as _TypeAlias, Never as _Never
+else:
+    from typing_extensions import TypeAlias as _TypeAlias, Never as _Never
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+@_typing.final
+class CreateSigningProfileRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PROFILE_NAME_FIELD_NUMBER: _builtins.int
+    profile_name: _builtins.str
+    """/ The name of the new signing profile"""
+    def __init__(
+        self,
+        *,
+        profile_name: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["profile_name", b"profile_name"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___CreateSigningProfileRequest: _TypeAlias = CreateSigningProfileRequest  # noqa: Y015
+
+@_typing.final
+class CreateSigningProfileReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PROFILE_ID_FIELD_NUMBER: _builtins.int
+    profile_id: _builtins.int
+    """/ The profile id"""
+    def __init__(
+        self,
+        *,
+        profile_id: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["profile_id", b"profile_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___CreateSigningProfileReply: _TypeAlias = CreateSigningProfileReply  # noqa: Y015
+
+@_typing.final
+class ImportSigningProfileRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PROFILE_NAME_FIELD_NUMBER: _builtins.int
+    PRIVATE_KEY_FIELD_NUMBER: _builtins.int
+    profile_name: _builtins.str
+    """/ The name of the signing profile"""
+    private_key: _builtins.str
+    """/ The private key of the signing profile"""
+    def __init__(
+        self,
+        *,
+        profile_name: _builtins.str = ...,
+        private_key: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["private_key", b"private_key", "profile_name", b"profile_name"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ImportSigningProfileRequest: _TypeAlias = ImportSigningProfileRequest  # noqa: Y015
+
+@_typing.final
+class ImportSigningProfileReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PROFILE_ID_FIELD_NUMBER: _builtins.int
+    profile_id: _builtins.int
+    """/ The profile id"""
+    def __init__(
+        self,
+        *,
+        profile_id: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["profile_id", b"profile_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ImportSigningProfileReply: _TypeAlias = ImportSigningProfileReply  # noqa: Y015
+
+@_typing.final
+class CreateContactProfileRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PROFILE_NAME_FIELD_NUMBER: _builtins.int
+    PUBKEY_FIELD_NUMBER: _builtins.int
+    profile_name: _builtins.str
+    """/ The name of the new signing profile"""
+    pubkey: _builtins.str
+    """/ The pubkey in hex"""
+    def __init__(
+        self,
+        *,
+        profile_name: _builtins.str = ...,
+        pubkey: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["profile_name", b"profile_name", "pubkey", b"pubkey"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___CreateContactProfileRequest: _TypeAlias = CreateContactProfileRequest  # noqa: Y015
+
+@_typing.final
+class CreateContactProfileReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PROFILE_ID_FIELD_NUMBER: _builtins.int
+    profile_id: _builtins.int
+    """/ The profile id"""
+    def __init__(
+        self,
+        *,
+        profile_id: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["profile_id", b"profile_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___CreateContactProfileReply: _TypeAlias = CreateContactProfileReply  # noqa: Y015
+
+@_typing.final
+class GetProfilesRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetProfilesRequest: _TypeAlias = GetProfilesRequest  # noqa: Y015
+
+@_typing.final
+class GetProfilesReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SQUEAK_PROFILES_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def squeak_profiles(self) -> _containers.RepeatedCompositeFieldContainer[Global___SqueakProfile]:
+        """/ The squeak profiles"""
+
+    def __init__(
+        self,
+        *,
+        squeak_profiles: _abc.Iterable[Global___SqueakProfile] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["squeak_profiles", b"squeak_profiles"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetProfilesReply: _TypeAlias = GetProfilesReply  # noqa: Y015
+
+@_typing.final
+class GetSigningProfilesRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetSigningProfilesRequest: _TypeAlias = GetSigningProfilesRequest  # noqa: Y015
+
+@_typing.final
+class GetSigningProfilesReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SQUEAK_PROFILES_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def squeak_profiles(self) -> _containers.RepeatedCompositeFieldContainer[Global___SqueakProfile]:
+        """/ The squeak profiles"""
+
+    def __init__(
+        self,
+        *,
+        squeak_profiles: _abc.Iterable[Global___SqueakProfile] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["squeak_profiles", b"squeak_profiles"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetSigningProfilesReply: _TypeAlias = GetSigningProfilesReply  # noqa: Y015
+
+@_typing.final
+class GetContactProfilesRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetContactProfilesRequest: _TypeAlias = GetContactProfilesRequest  # noqa: Y015
+
+@_typing.final
+class GetContactProfilesReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SQUEAK_PROFILES_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def squeak_profiles(self) -> _containers.RepeatedCompositeFieldContainer[Global___SqueakProfile]:
+        """/ The squeak profiles"""
+
+    def __init__(
+        self,
+        *,
+        squeak_profiles: _abc.Iterable[Global___SqueakProfile] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["squeak_profiles", b"squeak_profiles"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetContactProfilesReply: _TypeAlias = GetContactProfilesReply  # noqa: Y015
+
+@_typing.final
+class GetSqueakProfileRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PROFILE_ID_FIELD_NUMBER: _builtins.int
+    profile_id: _builtins.int
+    """/ The profile id"""
+    def __init__(
+        self,
+        *,
+        profile_id: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["profile_id", b"profile_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetSqueakProfileRequest: _TypeAlias = GetSqueakProfileRequest  # noqa: Y015
+
+@_typing.final
+class GetSqueakProfileReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SQUEAK_PROFILE_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def squeak_profile(self) -> Global___SqueakProfile:
+        """/ The squeak profile"""
+
+    def __init__(
+        self,
+        *,
+        squeak_profile: Global___SqueakProfile | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["squeak_profile", b"squeak_profile"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["squeak_profile", b"squeak_profile"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetSqueakProfileReply: _TypeAlias = GetSqueakProfileReply  # noqa: Y015
+
+@_typing.final
+class GetSqueakProfileByPubKeyRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PUBKEY_FIELD_NUMBER: _builtins.int
+    pubkey: _builtins.str
+    """/ The pubkey in hex"""
+    def __init__(
+        self,
+        *,
+        pubkey: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["pubkey", b"pubkey"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetSqueakProfileByPubKeyRequest: _TypeAlias = GetSqueakProfileByPubKeyRequest  # noqa: Y015
+
+@_typing.final
+class GetSqueakProfileByPubKeyReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SQUEAK_PROFILE_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def squeak_profile(self) -> Global___SqueakProfile:
+        """/ The squeak profile"""
+
+    def __init__(
+        self,
+        *,
+        squeak_profile: Global___SqueakProfile | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["squeak_profile", b"squeak_profile"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["squeak_profile", b"squeak_profile"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetSqueakProfileByPubKeyReply: _TypeAlias = GetSqueakProfileByPubKeyReply  # noqa: Y015
+
+@_typing.final
+class GetSqueakProfileByNameRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    NAME_FIELD_NUMBER: _builtins.int
+    name: _builtins.str
+    """/ The name"""
+    def __init__(
+        self,
+        *,
+        name: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["name", b"name"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetSqueakProfileByNameRequest: _TypeAlias = GetSqueakProfileByNameRequest  # noqa: Y015
+
+@_typing.final
+class GetSqueakProfileByNameReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SQUEAK_PROFILE_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def squeak_profile(self) -> Global___SqueakProfile:
+        """/ The squeak profile"""
+
+    def __init__(
+        self,
+        *,
+        squeak_profile: Global___SqueakProfile | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["squeak_profile", b"squeak_profile"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["squeak_profile", b"squeak_profile"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetSqueakProfileByNameReply: _TypeAlias = GetSqueakProfileByNameReply  # noqa: Y015
+
+@_typing.final
+class SetSqueakProfileFollowingRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PROFILE_ID_FIELD_NUMBER: _builtins.int
+    FOLLOWING_FIELD_NUMBER: _builtins.int
+    profile_id: _builtins.int
+    """/ The profile id"""
+    following: _builtins.bool
+    """/ Following"""
+    def __init__(
+        self,
+        *,
+        profile_id: _builtins.int = ...,
+        following: _builtins.bool = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["following", b"following", "profile_id", b"profile_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SetSqueakProfileFollowingRequest: _TypeAlias = SetSqueakProfileFollowingRequest  # noqa: Y015
+
+@_typing.final
+class SetSqueakProfileFollowingReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SetSqueakProfileFollowingReply: _TypeAlias = SetSqueakProfileFollowingReply  # noqa: Y015
+
+@_typing.final
+class RenameSqueakProfileRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PROFILE_ID_FIELD_NUMBER: _builtins.int
+    PROFILE_NAME_FIELD_NUMBER: _builtins.int
+    profile_id: _builtins.int
+    """/ The profile id"""
+    profile_name: _builtins.str
+    """/ The new profile name"""
+    def __init__(
+        self,
+        *,
+        profile_id: _builtins.int = ...,
+        profile_name: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["profile_id", b"profile_id", "profile_name", b"profile_name"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___RenameSqueakProfileRequest: _TypeAlias = RenameSqueakProfileRequest  # noqa: Y015
+
+@_typing.final
+class RenameSqueakProfileReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___RenameSqueakProfileReply: _TypeAlias = RenameSqueakProfileReply  # noqa: Y015
+
+@_typing.final
+class GetSqueakProfilePrivateKeyRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PROFILE_ID_FIELD_NUMBER: _builtins.int
+    profile_id: _builtins.int
+    """/ The profile id"""
+    def __init__(
+        self,
+        *,
+        profile_id: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["profile_id", b"profile_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetSqueakProfilePrivateKeyRequest: _TypeAlias = GetSqueakProfilePrivateKeyRequest  # noqa: Y015
+
+@_typing.final
+class GetSqueakProfilePrivateKeyReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PRIVATE_KEY_FIELD_NUMBER: _builtins.int
+    private_key: _builtins.str
+    """/ The private key"""
+    def __init__(
+        self,
+        *,
+        private_key: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["private_key", b"private_key"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetSqueakProfilePrivateKeyReply: _TypeAlias = GetSqueakProfilePrivateKeyReply  # noqa: Y015
+
+@_typing.final
+class DeleteSqueakProfileRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PROFILE_ID_FIELD_NUMBER: _builtins.int
+    profile_id: _builtins.int
+    """/ The profile id"""
+    def __init__(
+        self,
+        *,
+        profile_id: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["profile_id", b"profile_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DeleteSqueakProfileRequest: _TypeAlias = DeleteSqueakProfileRequest  # noqa: Y015
+
+@_typing.final
+class DeleteSqueakProfileReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DeleteSqueakProfileReply: _TypeAlias = DeleteSqueakProfileReply  # noqa: Y015
+
+@_typing.final
+class SetSqueakProfileImageRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PROFILE_ID_FIELD_NUMBER: _builtins.int
+    PROFILE_IMAGE_FIELD_NUMBER: _builtins.int
+    profile_id: _builtins.int
+    """/ The profile id"""
+    profile_image: _builtins.str
+    """/ The profile image"""
+    def __init__(
+        self,
+        *,
+        profile_id: _builtins.int = ...,
+        profile_image: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["profile_id", b"profile_id", "profile_image", b"profile_image"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SetSqueakProfileImageRequest: _TypeAlias = SetSqueakProfileImageRequest  # noqa: Y015
+
+@_typing.final
+class SetSqueakProfileImageReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SetSqueakProfileImageReply: _TypeAlias = SetSqueakProfileImageReply  # noqa: Y015
+
+@_typing.final
+class ClearSqueakProfileImageRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PROFILE_ID_FIELD_NUMBER: _builtins.int
+    profile_id: _builtins.int
+    """/ The profile id"""
+    def __init__(
+        self,
+        *,
+        profile_id: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["profile_id", b"profile_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ClearSqueakProfileImageRequest: _TypeAlias = ClearSqueakProfileImageRequest  # noqa: Y015
+
+@_typing.final
+class ClearSqueakProfileImageReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ClearSqueakProfileImageReply: _TypeAlias = ClearSqueakProfileImageReply  # noqa: Y015
+
+@_typing.final
+class SqueakProfile(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PROFILE_ID_FIELD_NUMBER: _builtins.int
+    PROFILE_NAME_FIELD_NUMBER: _builtins.int
+    HAS_PRIVATE_KEY_FIELD_NUMBER: _builtins.int
+    PUBKEY_FIELD_NUMBER: _builtins.int
+    FOLLOWING_FIELD_NUMBER: _builtins.int
+    PROFILE_IMAGE_FIELD_NUMBER: _builtins.int
+    HAS_CUSTOM_PROFILE_IMAGE_FIELD_NUMBER: _builtins.int
+    PROFILE_IMAGE_HASH_FIELD_NUMBER: _builtins.int
+    profile_id: _builtins.int
+    """/ The profile id"""
+    profile_name: _builtins.str
+    """/ The profile name"""
+    has_private_key: _builtins.bool
+    """/ Has private key"""
+    pubkey: _builtins.str
+    """/ The pubkey in hex"""
+    following: _builtins.bool
+    """/ Following"""
+    profile_image: _builtins.str
+    """/ The profile image"""
+    has_custom_profile_image: _builtins.bool
+    """/ Has custom profile image"""
+    profile_image_hash: _builtins.str
+    """/ The sha256 hash in hex of the profile image"""
+    def __init__(
+        self,
+        *,
+        profile_id: _builtins.int = ...,
+        profile_name: _builtins.str = ...,
+        has_private_key: _builtins.bool = ...,
+        pubkey: _builtins.str = ...,
+        following: _builtins.bool = ...,
+        profile_image: _builtins.str = ...,
+        has_custom_profile_image: _builtins.bool = ...,
+        profile_image_hash: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["following", b"following", "has_custom_profile_image", b"has_custom_profile_image", "has_private_key", b"has_private_key", "profile_id", b"profile_id", "profile_image", b"profile_image", "profile_image_hash", b"profile_image_hash", "profile_name", b"profile_name", "pubkey", b"pubkey"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SqueakProfile: _TypeAlias = SqueakProfile  # noqa: Y015
+
+@_typing.final
+class MakeSqueakRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PROFILE_ID_FIELD_NUMBER: _builtins.int
+    CONTENT_FIELD_NUMBER: _builtins.int
+    REPLYTO_FIELD_NUMBER: _builtins.int
+    HAS_RECIPIENT_FIELD_NUMBER: _builtins.int
+    RECIPIENT_PROFILE_ID_FIELD_NUMBER: _builtins.int
+    profile_id: _builtins.int
+    """/ The profile id"""
+    content: _builtins.str
+    """/ The content"""
+    replyto: _builtins.str
+    """/ The replyto hash"""
+    has_recipient: _builtins.bool
+    """/ Has a recipient"""
+    recipient_profile_id: _builtins.int
+    """/ The profile id of the recipient if squeak is private"""
+    def __init__(
+        self,
+        *,
+        profile_id: _builtins.int = ...,
+        content: _builtins.str = ...,
+        replyto: _builtins.str = ...,
+        has_recipient: _builtins.bool = ...,
+        recipient_profile_id: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["content", b"content", "has_recipient", b"has_recipient", "profile_id", b"profile_id", "recipient_profile_id", b"recipient_profile_id", "replyto", b"replyto"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___MakeSqueakRequest: _TypeAlias = MakeSqueakRequest  # noqa: Y015
+
+@_typing.final
+class MakeSqueakReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SQUEAK_HASH_FIELD_NUMBER: _builtins.int
+    squeak_hash: _builtins.str
+    """/ Hash of the created squeak."""
+    def __init__(
+        self,
+        *,
+        squeak_hash: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["squeak_hash", b"squeak_hash"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___MakeSqueakReply: _TypeAlias = MakeSqueakReply  # noqa: Y015
+
+@_typing.final
+class GetSqueakDisplayRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SQUEAK_HASH_FIELD_NUMBER: _builtins.int
+    squeak_hash: _builtins.str
+    """/ Hash of the squeak."""
+    def __init__(
+        self,
+        *,
+        squeak_hash: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["squeak_hash", b"squeak_hash"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetSqueakDisplayRequest: _TypeAlias = GetSqueakDisplayRequest  # noqa: Y015
+
+@_typing.final
+class GetSqueakDisplayReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SQUEAK_DISPLAY_ENTRY_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def squeak_display_entry(self) -> Global___SqueakDisplayEntry:
+        """/ The squeak display entry"""
+
+    def __init__(
+        self,
+        *,
+        squeak_display_entry: Global___SqueakDisplayEntry | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["squeak_display_entry", b"squeak_display_entry"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["squeak_display_entry", b"squeak_display_entry"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetSqueakDisplayReply: _TypeAlias = GetSqueakDisplayReply  # noqa: Y015
+
+@_typing.final
+class SqueakDisplayEntry(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SQUEAK_HASH_FIELD_NUMBER: _builtins.int
+    IS_UNLOCKED_FIELD_NUMBER: _builtins.int
+    CONTENT_STR_FIELD_NUMBER: _builtins.int
+    IS_REPLY_FIELD_NUMBER: _builtins.int
+    REPLY_TO_FIELD_NUMBER: _builtins.int
+    BLOCK_HEIGHT_FIELD_NUMBER: _builtins.int
+    BLOCK_HASH_FIELD_NUMBER: _builtins.int
+    BLOCK_TIME_FIELD_NUMBER: _builtins.int
+    SQUEAK_TIME_FIELD_NUMBER: _builtins.int
+    AUTHOR_PUBKEY_FIELD_NUMBER: _builtins.int
+    IS_AUTHOR_KNOWN_FIELD_NUMBER: _builtins.int
+    AUTHOR_FIELD_NUMBER: _builtins.int
+    LIKED_TIME_MS_FIELD_NUMBER: _builtins.int
+    SERIALIZED_SQUEAK_HEX_FIELD_NUMBER: _builtins.int
+    SECRET_KEY_HEX_FIELD_NUMBER: _builtins.int
+    IS_PRIVATE_FIELD_NUMBER: _builtins.int
+    RECIPIENT_PUBKEY_FIELD_NUMBER: _builtins.int
+    IS_RECIPIENT_KNOWN_FIELD_NUMBER: _builtins.int
+    RECIPIENT_FIELD_NUMBER: _builtins.int
+    squeak_hash: _builtins.str
+    """/ The squeak hash."""
+    is_unlocked: _builtins.bool
+    """/ Is unlocked"""
+    content_str: _builtins.str
+    """/ The decrypted content"""
+    is_reply: _builtins.bool
+    """/ Is reply"""
+    reply_to: _builtins.str
+    """/ Reply to hash"""
+    block_height: _builtins.int
+    """/ Block height"""
+    block_hash: _builtins.str
+    """/ Block hash"""
+    block_time: _builtins.int
+    """/ Block time"""
+    squeak_time: _builtins.int
+    """/ Squeak time"""
+    author_pubkey: _builtins.str
+    """/ The author pubkey in hex"""
+    is_author_known: _builtins.bool
+    """/ Is author address known"""
+    liked_time_ms: _builtins.int
+    """/ Liked time"""
+    serialized_squeak_hex: _builtins.str
+    """/ The serialized squeak in hex."""
+    secret_key_hex: _builtins.str
+    """/ The secret key in hex."""
+    is_private: _builtins.bool
+    """/ Is private"""
+    recipient_pubkey: _builtins.str
+    """/ The recipient pubkey in hex"""
+    is_recipient_known: _builtins.bool
+    """/ Is recipient address known"""
+    @_builtins.property
+    def author(self) -> Global___SqueakProfile:
+        """/ The author name"""
+
+    @_builtins.property
+    def recipient(self) -> Global___SqueakProfile:
+        """/ The recipient name"""
+
+    def __init__(
+        self,
+        *,
+        squeak_hash: _builtins.str = ...,
+        is_unlocked: _builtins.bool = ...,
+        content_str: _builtins.str = ...,
+        is_reply: _builtins.bool = ...,
+        reply_to: _builtins.str = ...,
+        block_height: _builtins.int = ...,
+        block_hash: _builtins.str = ...,
+        block_time: _builtins.int = ...,
+        squeak_time: _builtins.int = ...,
+        author_pubkey: _builtins.str = ...,
+        is_author_known: _builtins.bool = ...,
+        author: Global___SqueakProfile | None = ...,
+        liked_time_ms: _builtins.int = ...,
+        serialized_squeak_hex: _builtins.str = ...,
+        secret_key_hex: _builtins.str = ...,
+        is_private: _builtins.bool = ...,
+        recipient_pubkey: _builtins.str = ...,
+        is_recipient_known: _builtins.bool = ...,
+        recipient: Global___SqueakProfile | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["author", b"author", "recipient", b"recipient"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["author", b"author", "author_pubkey", b"author_pubkey", "block_hash", b"block_hash", "block_height", b"block_height", "block_time", b"block_time", "content_str", b"content_str", "is_author_known", b"is_author_known", "is_private", b"is_private", "is_recipient_known", b"is_recipient_known", "is_reply", b"is_reply", "is_unlocked", b"is_unlocked", "liked_time_ms", b"liked_time_ms", "recipient", b"recipient", "recipient_pubkey", b"recipient_pubkey", "reply_to", b"reply_to", "secret_key_hex", b"secret_key_hex", "serialized_squeak_hex", b"serialized_squeak_hex", "squeak_hash", b"squeak_hash", "squeak_time", b"squeak_time"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SqueakDisplayEntry: _TypeAlias = SqueakDisplayEntry  # noqa: Y015
+
+@_typing.final
+class GetTimelineSqueakDisplaysRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    LIMIT_FIELD_NUMBER: _builtins.int
+    LAST_ENTRY_FIELD_NUMBER: _builtins.int
+    limit: _builtins.int
+    """/ Limit number of results"""
+    @_builtins.property
+    def last_entry(self) -> Global___SqueakDisplayEntry:
+        """/ Last entry"""
+
+    def __init__(
+        self,
+        *,
+        limit: _builtins.int = ...,
+        last_entry: Global___SqueakDisplayEntry | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["last_entry", b"last_entry"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["last_entry", b"last_entry", "limit", b"limit"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetTimelineSqueakDisplaysRequest: _TypeAlias = GetTimelineSqueakDisplaysRequest  # noqa: Y015
+
+@_typing.final
+class GetTimelineSqueakDisplaysReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SQUEAK_DISPLAY_ENTRIES_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def squeak_display_entries(self) -> _containers.RepeatedCompositeFieldContainer[Global___SqueakDisplayEntry]:
+        """/ Multiple squeak display entries"""
+
+    def __init__(
+        self,
+        *,
+        squeak_display_entries: _abc.Iterable[Global___SqueakDisplayEntry] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["squeak_display_entries", b"squeak_display_entries"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetTimelineSqueakDisplaysReply: _TypeAlias = GetTimelineSqueakDisplaysReply  # noqa: Y015
+
+@_typing.final
+class GetPubKeySqueakDisplaysRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PUBKEY_FIELD_NUMBER: _builtins.int
+    LIMIT_FIELD_NUMBER: _builtins.int
+    LAST_ENTRY_FIELD_NUMBER: _builtins.int
+    pubkey: _builtins.str
+    """/ The pubkey in hex"""
+    limit: _builtins.int
+    """/// The address
+    string address = 1;
+
+    / Limit number of results
+    """
+    @_builtins.property
+    def last_entry(self) -> Global___SqueakDisplayEntry:
+        """/ Last entry"""
+
+    def __init__(
+        self,
+        *,
+        pubkey: _builtins.str = ...,
+        limit: _builtins.int = ...,
+        last_entry: Global___SqueakDisplayEntry | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["last_entry", b"last_entry"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["last_entry", b"last_entry", "limit", b"limit", "pubkey", b"pubkey"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetPubKeySqueakDisplaysRequest: _TypeAlias = GetPubKeySqueakDisplaysRequest  # noqa: Y015
+
+@_typing.final
+class GetPubKeySqueakDisplaysReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SQUEAK_DISPLAY_ENTRIES_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def squeak_display_entries(self) -> _containers.RepeatedCompositeFieldContainer[Global___SqueakDisplayEntry]:
+        """/ Multiple squeak display entries"""
+
+    def __init__(
+        self,
+        *,
+        squeak_display_entries: _abc.Iterable[Global___SqueakDisplayEntry] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["squeak_display_entries", b"squeak_display_entries"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetPubKeySqueakDisplaysReply: _TypeAlias = GetPubKeySqueakDisplaysReply  # noqa: Y015
+
+@_typing.final
+class GetSearchSqueakDisplaysRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SEARCH_TEXT_FIELD_NUMBER: _builtins.int
+    LIMIT_FIELD_NUMBER: _builtins.int
+    LAST_ENTRY_FIELD_NUMBER: _builtins.int
+    search_text: _builtins.str
+    """/ The search text"""
+    limit: _builtins.int
+    """/ Limit number of results"""
+    @_builtins.property
+    def last_entry(self) -> Global___SqueakDisplayEntry:
+        """/ Last entry"""
+
+    def __init__(
+        self,
+        *,
+        search_text: _builtins.str = ...,
+        limit: _builtins.int = ...,
+        last_entry: Global___SqueakDisplayEntry | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["last_entry", b"last_entry"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["last_entry", b"last_entry", "limit", b"limit", "search_text", b"search_text"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetSearchSqueakDisplaysRequest: _TypeAlias = GetSearchSqueakDisplaysRequest  # noqa: Y015
+
+@_typing.final
+class GetSearchSqueakDisplaysReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SQUEAK_DISPLAY_ENTRIES_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def squeak_display_entries(self) -> _containers.RepeatedCompositeFieldContainer[Global___SqueakDisplayEntry]:
+        """/ Multiple squeak display entries"""
+
+    def __init__(
+        self,
+        *,
+        squeak_display_entries: _abc.Iterable[Global___SqueakDisplayEntry] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["squeak_display_entries", b"squeak_display_entries"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetSearchSqueakDisplaysReply: _TypeAlias = GetSearchSqueakDisplaysReply  # noqa: Y015
+
+@_typing.final
+class GetAncestorSqueakDisplaysRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SQUEAK_HASH_FIELD_NUMBER: _builtins.int
+    squeak_hash: _builtins.str
+    """/ Hash of the squeak."""
+    def __init__(
+        self,
+        *,
+        squeak_hash: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["squeak_hash", b"squeak_hash"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetAncestorSqueakDisplaysRequest: _TypeAlias = GetAncestorSqueakDisplaysRequest  # noqa: Y015
+
+@_typing.final
+class GetAncestorSqueakDisplaysReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SQUEAK_DISPLAY_ENTRIES_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def squeak_display_entries(self) -> _containers.RepeatedCompositeFieldContainer[Global___SqueakDisplayEntry]:
+        """/ Multiple squeak display entries"""
+
+    def __init__(
+        self,
+        *,
+        squeak_display_entries: _abc.Iterable[Global___SqueakDisplayEntry] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["squeak_display_entries", b"squeak_display_entries"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetAncestorSqueakDisplaysReply: _TypeAlias = GetAncestorSqueakDisplaysReply  # noqa: Y015
+
+@_typing.final
+class GetReplySqueakDisplaysRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SQUEAK_HASH_FIELD_NUMBER: _builtins.int
+    LIMIT_FIELD_NUMBER: _builtins.int
+    LAST_ENTRY_FIELD_NUMBER: _builtins.int
+    squeak_hash: _builtins.str
+    """/ Hash of the squeak."""
+    limit: _builtins.int
+    """/ Limit number of results"""
+    @_builtins.property
+    def last_entry(self) -> Global___SqueakDisplayEntry:
+        """/ Last entry"""
+
+    def __init__(
+        self,
+        *,
+        squeak_hash: _builtins.str = ...,
+        limit: _builtins.int = ...,
+        last_entry: Global___SqueakDisplayEntry | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["last_entry", b"last_entry"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["last_entry", b"last_entry", "limit", b"limit", "squeak_hash", b"squeak_hash"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetReplySqueakDisplaysRequest: _TypeAlias = GetReplySqueakDisplaysRequest  # noqa: Y015
+
+@_typing.final
+class GetReplySqueakDisplaysReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SQUEAK_DISPLAY_ENTRIES_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def squeak_display_entries(self) -> _containers.RepeatedCompositeFieldContainer[Global___SqueakDisplayEntry]:
+        """/ Multiple squeak display entries"""
+
+    def __init__(
+        self,
+        *,
+        squeak_display_entries: _abc.Iterable[Global___SqueakDisplayEntry] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["squeak_display_entries", b"squeak_display_entries"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetReplySqueakDisplaysReply: _TypeAlias = GetReplySqueakDisplaysReply  # noqa: Y015
+
+@_typing.final
+class DeleteSqueakRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SQUEAK_HASH_FIELD_NUMBER: _builtins.int
+    squeak_hash: _builtins.str
+    """/ Hash of the created squeak."""
+    def __init__(
+        self,
+        *,
+        squeak_hash: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["squeak_hash", b"squeak_hash"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DeleteSqueakRequest: _TypeAlias = DeleteSqueakRequest  # noqa: Y015
+
+@_typing.final
+class DeleteSqueakReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DeleteSqueakReply: _TypeAlias = DeleteSqueakReply  # noqa: Y015
+
+@_typing.final
+class CreatePeerRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PEER_NAME_FIELD_NUMBER: _builtins.int
+    PEER_ADDRESS_FIELD_NUMBER: _builtins.int
+    peer_name: _builtins.str
+    """/ Name of the peer"""
+    @_builtins.property
+    def peer_address(self) -> Global___PeerAddress:
+        """/ Peer address"""
+
+    def __init__(
+        self,
+        *,
+        peer_name: _builtins.str = ...,
+        peer_address: Global___PeerAddress | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["peer_address", b"peer_address"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["peer_address", b"peer_address", "peer_name", b"peer_name"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___CreatePeerRequest: _TypeAlias = CreatePeerRequest  # noqa: Y015
+
+@_typing.final
+class CreatePeerReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PEER_ID_FIELD_NUMBER: _builtins.int
+    peer_id: _builtins.int
+    """/ The peer id"""
+    def __init__(
+        self,
+        *,
+        peer_id: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["peer_id", b"peer_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___CreatePeerReply: _TypeAlias = CreatePeerReply  # noqa: Y015
+
+@_typing.final
+class GetPeerRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PEER_ID_FIELD_NUMBER: _builtins.int
+    peer_id: _builtins.int
+    """/ The peer id"""
+    def __init__(
+        self,
+        *,
+        peer_id: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["peer_id", b"peer_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetPeerRequest: _TypeAlias = GetPeerRequest  # noqa: Y015
+
+@_typing.final
+class GetPeerReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SQUEAK_PEER_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def squeak_peer(self) -> Global___SqueakPeer:
+        """/ The peer"""
+
+    def __init__(
+        self,
+        *,
+        squeak_peer: Global___SqueakPeer | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["squeak_peer", b"squeak_peer"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["squeak_peer", b"squeak_peer"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetPeerReply: _TypeAlias = GetPeerReply  # noqa: Y015
+
+@_typing.final
+class GetPeerByAddressRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PEER_ADDRESS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def peer_address(self) -> Global___PeerAddress:
+        """/ Peer address"""
+
+    def __init__(
+        self,
+        *,
+        peer_address: Global___PeerAddress | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["peer_address", b"peer_address"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["peer_address", b"peer_address"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetPeerByAddressRequest: _TypeAlias = GetPeerByAddressRequest  # noqa: Y015
+
+@_typing.final
+class GetPeerByAddressReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SQUEAK_PEER_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def squeak_peer(self) -> Global___SqueakPeer:
+        """/ The peer"""
+
+    def __init__(
+        self,
+        *,
+        squeak_peer: Global___SqueakPeer | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["squeak_peer", b"squeak_peer"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["squeak_peer", b"squeak_peer"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetPeerByAddressReply: _TypeAlias = GetPeerByAddressReply  # noqa: Y015
+
+@_typing.final
+class GetPeersRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetPeersRequest: _TypeAlias = GetPeersRequest  # noqa: Y015
+
+@_typing.final
+class GetPeersReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SQUEAK_PEERS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def squeak_peers(self) -> _containers.RepeatedCompositeFieldContainer[Global___SqueakPeer]:
+        """/ The peers"""
+
+    def __init__(
+        self,
+        *,
+        squeak_peers: _abc.Iterable[Global___SqueakPeer] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["squeak_peers", b"squeak_peers"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetPeersReply: _TypeAlias = GetPeersReply  # noqa: Y015
+
+@_typing.final
+class SqueakPeer(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PEER_ID_FIELD_NUMBER: _builtins.int
+    PEER_NAME_FIELD_NUMBER: _builtins.int
+    PEER_ADDRESS_FIELD_NUMBER: _builtins.int
+    AUTOCONNECT_FIELD_NUMBER: _builtins.int
+    SHARE_FOR_FREE_FIELD_NUMBER: _builtins.int
+    HEALTH_FIELD_NUMBER: _builtins.int
+    peer_id: _builtins.int
+    """/ The peer id"""
+    peer_name: _builtins.str
+    """/ The peer name"""
+    autoconnect: _builtins.bool
+    """/ Autoconnect"""
+    share_for_free: _builtins.bool
+    """/ Share for free"""
+    @_builtins.property
+    def peer_address(self) -> Global___PeerAddress:
+        """/ Peer address"""
+
+    @_builtins.property
+    def health(self) -> Global___PeerHealth:
+        """/ Download health of the peer"""
+
+    def __init__(
+        self,
+        *,
+        peer_id: _builtins.int = ...,
+        peer_name: _builtins.str = ...,
+        peer_address: Global___PeerAddress | None = ...,
+        autoconnect: _builtins.bool = ...,
+        share_for_free: _builtins.bool = ...,
+        health: Global___PeerHealth | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["health", b"health", "peer_address", b"peer_address"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["autoconnect", b"autoconnect", "health", b"health", "peer_address", b"peer_address", "peer_id", b"peer_id", "peer_name", b"peer_name", "share_for_free", b"share_for_free"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SqueakPeer: _TypeAlias = SqueakPeer  # noqa: Y015
+
+@_typing.final
+class PeerHealth(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SCORE_FIELD_NUMBER: _builtins.int
+    AVG_LATENCY_MS_FIELD_NUMBER: _builtins.int
+    ERROR_RATE_FIELD_NUMBER: _builtins.int
+    YIELD_PER_REQUEST_FIELD_NUMBER: _builtins.int
+    CONSECUTIVE_FAILURES_FIELD_NUMBER: _builtins.int
+    BACKOFF_UNTIL_TIME_MS_FIELD_NUMBER: _builtins.int
+    score: _builtins.float
+    """/ Score used to order downloads, higher is better"""
+    avg_latency_ms: _builtins.float
+    """/ Average request latency in milliseconds"""
+    error_rate: _builtins.float
+    """/ Fraction of requests that failed"""
+    yield_per_request: _builtins.float
+    """/ Average number of items downloaded per request"""
+    consecutive_failures: _builtins.int
+    """/ Number of download rounds failed in a row"""
+    backoff_until_time_ms: _builtins.int
+    """/ Time until which the peer is skipped, in milliseconds"""
+    def __init__(
+        self,
+        *,
+        score: _builtins.float = ...,
+        avg_latency_ms: _builtins.float = ...,
+        error_rate: _builtins.float = ...,
+        yield_per_request: _builtins.float = ...,
+        consecutive_failures: _builtins.int = ...,
+        backoff_until_time_ms: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["avg_latency_ms", b"avg_latency_ms", "backoff_until_time_ms", b"backoff_until_time_ms", "consecutive_failures", b"consecutive_failures", "error_rate", b"error_rate", "score", b"score", "yield_per_request", b"yield_per_request"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___PeerHealth: _TypeAlias = PeerHealth  # noqa: Y015
+
+@_typing.final
+class SetPeerAutoconnectRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PEER_ID_FIELD_NUMBER: _builtins.int
+    AUTOCONNECT_FIELD_NUMBER: _builtins.int
+    peer_id: _builtins.int
+    """/ The peer id"""
+    autoconnect: _builtins.bool
+    """/ Autoconnect"""
+    def __init__(
+        self,
+        *,
+        peer_id: _builtins.int = ...,
+        autoconnect: _builtins.bool = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["autoconnect", b"autoconnect", "peer_id", b"peer_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SetPeerAutoconnectRequest: _TypeAlias = SetPeerAutoconnectRequest  # noqa: Y015
+
+@_typing.final
+class SetPeerAutoconnectReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SetPeerAutoconnectReply: _TypeAlias = SetPeerAutoconnectReply  # noqa: Y015
+
+@_typing.final
+class SetPeerShareForFreeRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PEER_ID_FIELD_NUMBER: _builtins.int
+    SHARE_FOR_FREE_FIELD_NUMBER: _builtins.int
+    peer_id: _builtins.int
+    """/ The peer id"""
+    share_for_free: _builtins.bool
+    """/ share_for_free"""
+    def __init__(
+        self,
+        *,
+        peer_id: _builtins.int = ...,
+        share_for_free: _builtins.bool = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["peer_id", b"peer_id", "share_for_free", b"share_for_free"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SetPeerShareForFreeRequest: _TypeAlias = SetPeerShareForFreeRequest  # noqa: Y015
+
+@_typing.final
+class SetPeerShareForFreeReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SetPeerShareForFreeReply: _TypeAlias = SetPeerShareForFreeReply  # noqa: Y015
+
+@_typing.final
+class RenamePeerRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PEER_ID_FIELD_NUMBER: _builtins.int
+    PEER_NAME_FIELD_NUMBER: _builtins.int
+    peer_id: _builtins.int
+    """/ The peer id"""
+    peer_name: _builtins.str
+    """/ Name of the peer"""
+    def __init__(
+        self,
+        *,
+        peer_id: _builtins.int = ...,
+        peer_name: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["peer_id", b"peer_id", "peer_name", b"peer_name"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___RenamePeerRequest: _TypeAlias = RenamePeerRequest  # noqa: Y015
+
+@_typing.final
+class RenamePeerReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___RenamePeerReply: _TypeAlias = RenamePeerReply  # noqa: Y015
+
+@_typing.final
+class DeletePeerRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PEER_ID_FIELD_NUMBER: _builtins.int
+    peer_id: _builtins.int
+    """/ The peer id"""
+    def __init__(
+        self,
+        *,
+        peer_id: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["peer_id", b"peer_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DeletePeerRequest: _TypeAlias = DeletePeerRequest  # noqa: Y015
+
+@_typing.final
+class DeletePeerReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DeletePeerReply: _TypeAlias = DeletePeerReply  # noqa: Y015
+
+@_typing.final
+class LoadBuyOffersRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SQUEAK_HASH_FIELD_NUMBER: _builtins.int
+    squeak_hash: _builtins.str
+    """/ Hash of the created squeak."""
+    def __init__(
+        self,
+        *,
+        squeak_hash: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["squeak_hash", b"squeak_hash"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___LoadBuyOffersRequest: _TypeAlias = LoadBuyOffersRequest  # noqa: Y015
+
+@_typing.final
+class LoadBuyOffersReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___LoadBuyOffersReply: _TypeAlias = LoadBuyOffersReply  # noqa: Y015
+
+@_typing.final
+class GetBuyOffersRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SQUEAK_HASH_FIELD_NUMBER: _builtins.int
+    squeak_hash: _builtins.str
+    """/ Hash of the created squeak."""
+    def __init__(
+        self,
+        *,
+        squeak_hash: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["squeak_hash", b"squeak_hash"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetBuyOffersRequest: _TypeAlias = GetBuyOffersRequest  # noqa: Y015
+
+@_typing.final
+class GetBuyOffersReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    OFFERS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def offers(self) -> _containers.RepeatedCompositeFieldContainer[Global___OfferDisplayEntry]:
+        """/ The offers"""
+
+    def __init__(
+        self,
+        *,
+        offers: _abc.Iterable[Global___OfferDisplayEntry] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["offers", b"offers"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetBuyOffersReply: _TypeAlias = GetBuyOffersReply  # noqa: Y015
+
+@_typing.final
+class GetBuyOfferRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    OFFER_ID_FIELD_NUMBER: _builtins.int
+    offer_id: _builtins.int
+    """/ Offer id"""
+    def __init__(
+        self,
+        *,
+        offer_id: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["offer_id", b"offer_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetBuyOfferRequest: _TypeAlias = GetBuyOfferRequest  # noqa: Y015
+
+@_typing.final
+class GetBuyOfferReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    OFFER_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def offer(self) -> Global___OfferDisplayEntry:
+        """/ The offer"""
+
+    def __init__(
+        self,
+        *,
+        offer: Global___OfferDisplayEntry | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["offer", b"offer"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["offer", b"offer"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetBuyOfferReply: _TypeAlias = GetBuyOfferReply  # noqa: Y015
+
+@_typing.final
+class OfferDisplayEntry(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    OFFER_ID_FIELD_NUMBER: _builtins.int
+    SQUEAK_HASH_FIELD_NUMBER: _builtins.int
+    PRICE_MSAT_FIELD_NUMBER: _builtins.int
+    NODE_PUBKEY_FIELD_NUMBER: _builtins.int
+    NODE_HOST_FIELD_NUMBER: _builtins.int
+    NODE_PORT_FIELD_NUMBER: _builtins.int
+    INVOICE_TIMESTAMP_FIELD_NUMBER: _builtins.int
+    INVOICE_EXPIRY_FIELD_NUMBER: _builtins.int
+    PEER_ADDRESS_FIELD_NUMBER: _builtins.int
+    offer_id: _builtins.int
+    """/ The offer id"""
+    squeak_hash: _builtins.str
+    """/ The squeak hash."""
+    price_msat: _builtins.int
+    """/ The price in msats"""
+    node_pubkey: _builtins.str
+    """/ The seller node pubkey"""
+    node_host: _builtins.str
+    """TODO: replace with LightningAddress from lnd.proto
+    / The host of the seller lightning node
+    """
+    node_port: _builtins.int
+    """/ The port of the seller lightning node"""
+    invoice_timestamp: _builtins.int
+    """/ The invoice timestamp"""
+    invoice_expiry: _builtins.int
+    """/ The invoice expiry"""
+    @_builtins.property
+    def peer_address(self) -> Global___PeerAddress:
+        """/ The address of the squeak peer"""
+
+    def __init__(
+        self,
+        *,
+        offer_id: _builtins.int = ...,
+        squeak_hash: _builtins.str = ...,
+        price_msat: _builtins.int = ...,
+        node_pubkey: _builtins.str = ...,
+        node_host: _builtins.str = ...,
+        node_port: _builtins.int = ...,
+        invoice_timestamp: _builtins.int = ...,
+        invoice_expiry: _builtins.int = ...,
+        peer_address: Global___PeerAddress | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["peer_address", b"peer_address"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["invoice_expiry", b"invoice_expiry", "invoice_timestamp", b"invoice_timestamp", "node_host", b"node_host", "node_port", b"node_port", "node_pubkey", b"node_pubkey", "offer_id", b"offer_id", "peer_address", b"peer_address", "price_msat", b"price_msat", "squeak_hash", b"squeak_hash"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___OfferDisplayEntry: _TypeAlias = OfferDisplayEntry  # noqa: Y015
+
+@_typing.final
+class DownloadSqueaksRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PUBKEYS_FIELD_NUMBER: _builtins.int
+    MIN_BLOCK_HEIGHT_FIELD_NUMBER: _builtins.int
+    MAX_BLOCK_HEIGHT_FIELD_NUMBER: _builtins.int
+    REPLYTO_SQUEAK_HASH_FIELD_NUMBER: _builtins.int
+    min_block_height: _builtins.int
+    """/// The interested addresses
+        repeated string addreses = 1;
+
+    / Minimum block height
+    """
+    max_block_height: _builtins.int
+    """/ Maximum block height"""
+    replyto_squeak_hash: _builtins.str
+    """/ The hash replied to"""
+    @_builtins.property
+    def pubkeys(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]:
+        """/ The interested pubkeys in hex"""
+
+    def __init__(
+        self,
+        *,
+        pubkeys: _abc.Iterable[_builtins.str] | None = ...,
+        min_block_height: _builtins.int = ...,
+        max_block_height: _builtins.int = ...,
+        replyto_squeak_hash: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["max_block_height", b"max_block_height", "min_block_height", b"min_block_height", "pubkeys", b"pubkeys", "replyto_squeak_hash", b"replyto_squeak_hash"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DownloadSqueaksRequest: _TypeAlias = DownloadSqueaksRequest  # noqa: Y015
+
+@_typing.final
+class DownloadResult(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    NUMBER_DOWNLOADED_FIELD_NUMBER: _builtins.int
+    NUMBER_REQUESTED_FIELD_NUMBER: _builtins.int
+    NUMBER_PEERS_FIELD_NUMBER: _builtins.int
+    ELAPSED_TIME_MS_FIELD_NUMBER: _builtins.int
+    number_downloaded: _builtins.int
+    """/ Number of squeaks downloaded"""
+    number_requested: _builtins.int
+    """/ Number of squeaks requested"""
+    number_peers: _builtins.int
+    """/ Number of peers downloaded from"""
+    elapsed_time_ms: _builtins.int
+    """/ Download time in milliseconds."""
+    def __init__(
+        self,
+        *,
+        number_downloaded: _builtins.int = ...,
+        number_requested: _builtins.int = ...,
+        number_peers: _builtins.int = ...,
+        elapsed_time_ms: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["elapsed_time_ms", b"elapsed_time_ms", "number_downloaded", b"number_downloaded", "number_peers", b"number_peers", "number_requested", b"number_requested"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DownloadResult: _TypeAlias = DownloadResult  # noqa: Y015
+
+@_typing.final
+class DownloadSqueaksReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    DOWNLOAD_RESULT_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def download_result(self) -> Global___DownloadResult:
+        """The download result"""
+
+    def __init__(
+        self,
+        *,
+        download_result: Global___DownloadResult | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["download_result", b"download_result"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["download_result", b"download_result"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DownloadSqueaksReply: _TypeAlias = DownloadSqueaksReply  # noqa: Y015
+
+@_typing.final
+class PayOfferRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    OFFER_ID_FIELD_NUMBER: _builtins.int
+    offer_id: _builtins.int
+    """/ Offer id"""
+    def __init__(
+        self,
+        *,
+        offer_id: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["offer_id", b"offer_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___PayOfferRequest: _TypeAlias = PayOfferRequest  # noqa: Y015
+
+@_typing.final
+class PayOfferReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SENT_PAYMENT_ID_FIELD_NUMBER: _builtins.int
+    sent_payment_id: _builtins.int
+    """/ Sent payment id"""
+    def __init__(
+        self,
+        *,
+        sent_payment_id: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["sent_payment_id", b"sent_payment_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___PayOfferReply: _TypeAlias = PayOfferReply  # noqa: Y015
+
+@_typing.final
+class DecryptSqueakRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SQUEAK_HASH_FIELD_NUMBER: _builtins.int
+    HAS_RECIPIENT_FIELD_NUMBER: _builtins.int
+    RECIPIENT_PROFILE_ID_FIELD_NUMBER: _builtins.int
+    HAS_AUTHOR_FIELD_NUMBER: _builtins.int
+    AUTHOR_PROFILE_ID_FIELD_NUMBER: _builtins.int
+    squeak_hash: _builtins.str
+    """/ Hash of the squeak."""
+    has_recipient: _builtins.bool
+    """/ Has a recipient"""
+    recipient_profile_id: _builtins.int
+    """/ The profile id of the recipient to decrypt the content"""
+    has_author: _builtins.bool
+    """/ Has a author"""
+    author_profile_id: _builtins.int
+    """/ The profile id of the author to decrypt the content"""
+    def __init__(
+        self,
+        *,
+        squeak_hash: _builtins.str = ...,
+        has_recipient: _builtins.bool = ...,
+        recipient_profile_id: _builtins.int = ...,
+        has_author: _builtins.bool = ...,
+        author_profile_id: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["author_profile_id", b"author_profile_id", "has_author", b"has_author", "has_recipient", b"has_recipient", "recipient_profile_id", b"recipient_profile_id", "squeak_hash", b"squeak_hash"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DecryptSqueakRequest: _TypeAlias = DecryptSqueakRequest  # noqa: Y015
+
+@_typing.final
+class DecryptSqueakReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DecryptSqueakReply: _TypeAlias = DecryptSqueakReply  # noqa: Y015
+
+@_typing.final
+class GetSentPaymentsRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    LIMIT_FIELD_NUMBER: _builtins.int
+    LAST_SENT_PAYMENT_FIELD_NUMBER: _builtins.int
+    limit: _builtins.int
+    """/ Limit number of results"""
+    @_builtins.property
+    def last_sent_payment(self) -> Global___SentPayment:
+        """/ Last entry"""
+
+    def __init__(
+        self,
+        *,
+        limit: _builtins.int = ...,
+        last_sent_payment: Global___SentPayment | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["last_sent_payment", b"last_sent_payment"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["last_sent_payment", b"last_sent_payment", "limit", b"limit"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetSentPaymentsRequest: _TypeAlias = GetSentPaymentsRequest  # noqa: Y015
+
+@_typing.final
+class GetSentPaymentsReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SENT_PAYMENTS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def sent_payments(self) -> _containers.RepeatedCompositeFieldContainer[Global___SentPayment]:
+        """/ The sent payments"""
+
+    def __init__(
+        self,
+        *,
+        sent_payments: _abc.Iterable[Global___SentPayment] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["sent_payments", b"sent_payments"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetSentPaymentsReply: _TypeAlias = GetSentPaymentsReply  # noqa: Y015
+
+@_typing.final
+class GetSentPaymentsForSqueakRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SQUEAK_HASH_FIELD_NUMBER: _builtins.int
+    LIMIT_FIELD_NUMBER: _builtins.int
+    LAST_SENT_PAYMENT_FIELD_NUMBER: _builtins.int
+    squeak_hash: _builtins.str
+    """/ Hash of the squeak."""
+    limit: _builtins.int
+    """/ Limit number of results"""
+    @_builtins.property
+    def last_sent_payment(self) -> Global___SentPayment:
+        """/ Last entry"""
+
+    def __init__(
+        self,
+        *,
+        squeak_hash: _builtins.str = ...,
+        limit: _builtins.int = ...,
+        last_sent_payment: Global___SentPayment | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["last_sent_payment", b"last_sent_payment"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["last_sent_payment", b"last_sent_payment", "limit", b"limit", "squeak_hash", b"squeak_hash"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetSentPaymentsForSqueakRequest: _TypeAlias = GetSentPaymentsForSqueakRequest  # noqa: Y015
+
+@_typing.final
+class GetSentPaymentsForSqueakReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SENT_PAYMENTS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def sent_payments(self) -> _containers.RepeatedCompositeFieldContainer[Global___SentPayment]:
+        """/ The sent payments"""
+
+    def __init__(
+        self,
+        *,
+        sent_payments: _abc.Iterable[Global___SentPayment] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["sent_payments", b"sent_payments"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetSentPaymentsForSqueakReply: _TypeAlias = GetSentPaymentsForSqueakReply  # noqa: Y015
+
+@_typing.final
+class GetSentPaymentsForPubkeyRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PUBKEY_FIELD_NUMBER: _builtins.int
+    LIMIT_FIELD_NUMBER: _builtins.int
+    LAST_SENT_PAYMENT_FIELD_NUMBER: _builtins.int
+    pubkey: _builtins.str
+    """/ The pubkey in hex"""
+    limit: _builtins.int
+    """/ Limit number of results"""
+    @_builtins.property
+    def last_sent_payment(self) -> Global___SentPayment:
+        """/ Last entry"""
+
+    def __init__(
+        self,
+        *,
+        pubkey: _builtins.str = ...,
+        limit: _builtins.int = ...,
+        last_sent_payment: Global___SentPayment | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["last_sent_payment", b"last_sent_payment"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["last_sent_payment", b"last_sent_payment", "limit", b"limit", "pubkey", b"pubkey"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetSentPaymentsForPubkeyRequest: _TypeAlias = GetSentPaymentsForPubkeyRequest  # noqa: Y015
+
+@_typing.final
+class GetSentPaymentsForPubkeyReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SENT_PAYMENTS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def sent_payments(self) -> _containers.RepeatedCompositeFieldContainer[Global___SentPayment]:
+        """/ The sent payments"""
+
+    def __init__(
+        self,
+        *,
+        sent_payments: _abc.Iterable[Global___SentPayment] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["sent_payments", b"sent_payments"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetSentPaymentsForPubkeyReply: _TypeAlias = GetSentPaymentsForPubkeyReply  # noqa: Y015
+
+@_typing.final
+class GetSentPaymentRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SENT_PAYMENT_ID_FIELD_NUMBER: _builtins.int
+    sent_payment_id: _builtins.int
+    """/ Sent payment id"""
+    def __init__(
+        self,
+        *,
+        sent_payment_id: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["sent_payment_id", b"sent_payment_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetSentPaymentRequest: _TypeAlias = GetSentPaymentRequest  # noqa: Y015
+
+@_typing.final
+class GetSentPaymentReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SENT_PAYMENT_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def sent_payment(self) -> Global___SentPayment:
+        """/ The sent payment"""
+
+    def __init__(
+        self,
+        *,
+        sent_payment: Global___SentPayment | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["sent_payment", b"sent_payment"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["sent_payment", b"sent_payment"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetSentPaymentReply: _TypeAlias = GetSentPaymentReply  # noqa: Y015
+
+@_typing.final
+class SentPayment(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SENT_PAYMENT_ID_FIELD_NUMBER: _builtins.int
+    SQUEAK_HASH_FIELD_NUMBER: _builtins.int
+    PAYMENT_HASH_FIELD_NUMBER: _builtins.int
+    PRICE_MSAT_FIELD_NUMBER: _builtins.int
+    NODE_PUBKEY_FIELD_NUMBER: _builtins.int
+    VALID_FIELD_NUMBER: _builtins.int
+    TIME_MS_FIELD_NUMBER: _builtins.int
+    PEER_ADDRESS_FIELD_NUMBER: _builtins.int
+    sent_payment_id: _builtins.int
+    """/ The sent payment id"""
+    squeak_hash: _builtins.str
+    """/ The squeak hash"""
+    payment_hash: _builtins.str
+    """/ The payment hash"""
+    price_msat: _builtins.int
+    """/ The price_msat"""
+    node_pubkey: _builtins.str
+    """/ The seller node pubkey"""
+    valid: _builtins.bool
+    """/ Does the payment unlock a valid key"""
+    time_ms: _builtins.int
+    """/ Time of payment"""
+    @_builtins.property
+    def peer_address(self) -> Global___PeerAddress:
+        """/ The address of the squeak peer"""
+
+    def __init__(
+        self,
+        *,
+        sent_payment_id: _builtins.int = ...,
+        squeak_hash: _builtins.str = ...,
+        payment_hash: _builtins.str = ...,
+        price_msat: _builtins.int = ...,
+        node_pubkey: _builtins.str = ...,
+        valid: _builtins.bool = ...,
+        time_ms: _builtins.int = ...,
+        peer_address: Global___PeerAddress | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["peer_address", b"peer_address"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["node_pubkey", b"node_pubkey", "payment_hash", b"payment_hash", "peer_address", b"peer_address", "price_msat", b"price_msat", "sent_payment_id", b"sent_payment_id", "squeak_hash", b"squeak_hash", "time_ms", b"time_ms", "valid", b"valid"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SentPayment: _TypeAlias = SentPayment  # noqa: Y015
+
+@_typing.final
+class DownloadSqueakRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SQUEAK_HASH_FIELD_NUMBER: _builtins.int
+    squeak_hash: _builtins.str
+    """/ The squeak hash."""
+    def __init__(
+        self,
+        *,
+        squeak_hash: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["squeak_hash", b"squeak_hash"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DownloadSqueakRequest: _TypeAlias = DownloadSqueakRequest  # noqa: Y015
+
+@_typing.final
+class DownloadSqueakReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    DOWNLOAD_RESULT_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def download_result(self) -> Global___DownloadResult:
+        """The download result"""
+
+    def __init__(
+        self,
+        *,
+        download_result: Global___DownloadResult | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["download_result", b"download_result"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["download_result", b"download_result"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DownloadSqueakReply: _TypeAlias = DownloadSqueakReply  # noqa: Y015
+
+@_typing.final
+class DownloadOffersRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SQUEAK_HASH_FIELD_NUMBER: _builtins.int
+    squeak_hash: _builtins.str
+    """/ The squeak hash."""
+    def __init__(
+        self,
+        *,
+        squeak_hash: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["squeak_hash", b"squeak_hash"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DownloadOffersRequest: _TypeAlias = DownloadOffersRequest  # noqa: Y015
+
+@_typing.final
+class DownloadOffersReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    DOWNLOAD_RESULT_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def download_result(self) -> Global___DownloadResult:
+        """The download result"""
+
+    def __init__(
+        self,
+        *,
+        download_result: Global___DownloadResult | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["download_result", b"download_result"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["download_result", b"download_result"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DownloadOffersReply: _TypeAlias = DownloadOffersReply  # noqa: Y015
+
+@_typing.final
+class DownloadRepliesRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SQUEAK_HASH_FIELD_NUMBER: _builtins.int
+    squeak_hash: _builtins.str
+    """/ The squeak hash."""
+    def __init__(
+        self,
+        *,
+        squeak_hash: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["squeak_hash", b"squeak_hash"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DownloadRepliesRequest: _TypeAlias = DownloadRepliesRequest  # noqa: Y015
+
+@_typing.final
+class DownloadRepliesReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    DOWNLOAD_RESULT_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def download_result(self) -> Global___DownloadResult:
+        """The download result"""
+
+    def __init__(
+        self,
+        *,
+        download_result: Global___DownloadResult | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["download_result", b"download_result"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["download_result", b"download_result"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DownloadRepliesReply: _TypeAlias = DownloadRepliesReply  # noqa: Y015
+
+@_typing.final
+class DownloadPubKeySqueaksRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PUBKEY_FIELD_NUMBER: _builtins.int
+    pubkey: _builtins.str
+    """/ The pubkey in hex"""
+    def __init__(
+        self,
+        *,
+        pubkey: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["pubkey", b"pubkey"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DownloadPubKeySqueaksRequest: _TypeAlias = DownloadPubKeySqueaksRequest  # noqa: Y015
+
+@_typing.final
+class DownloadPubKeySqueaksReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    DOWNLOAD_RESULT_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def download_result(self) -> Global___DownloadResult:
+        """The download result"""
+
+    def __init__(
+        self,
+        *,
+        download_result: Global___DownloadResult | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["download_result", b"download_result"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["download_result", b"download_result"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DownloadPubKeySqueaksReply: _TypeAlias = DownloadPubKeySqueaksReply  # noqa: Y015
+
+@_typing.final
+class GetSentOffersRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetSentOffersRequest: _TypeAlias = GetSentOffersRequest  # noqa: Y015
+
+@_typing.final
+class GetSentOffersReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SENT_OFFERS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def sent_offers(self) -> _containers.RepeatedCompositeFieldContainer[Global___SentOffer]:
+        """/ The received payments"""
+
+    def __init__(
+        self,
+        *,
+        sent_offers: _abc.Iterable[Global___SentOffer] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["sent_offers", b"sent_offers"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetSentOffersReply: _TypeAlias = GetSentOffersReply  # noqa: Y015
+
+@_typing.final
+class SentOffer(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SENT_OFFER_ID_FIELD_NUMBER: _builtins.int
+    SQUEAK_HASH_FIELD_NUMBER: _builtins.int
+    PAYMENT_HASH_FIELD_NUMBER: _builtins.int
+    PRICE_MSAT_FIELD_NUMBER: _builtins.int
+    sent_offer_id: _builtins.int
+    """/ The received payment id"""
+    squeak_hash: _builtins.str
+    """/ The squeak hash"""
+    payment_hash: _builtins.str
+    """/ The payment hash"""
+    price_msat: _builtins.int
+    """/ The price_msat"""
+    def __init__(
+        self,
+        *,
+        sent_offer_id: _builtins.int = ...,
+        squeak_hash: _builtins.str = ...,
+        payment_hash: _builtins.str = ...,
+        price_msat: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["payment_hash", b"payment_hash", "price_msat", b"price_msat", "sent_offer_id", b"sent_offer_id", "squeak_hash", b"squeak_hash"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SentOffer: _TypeAlias = SentOffer  # noqa: Y015
+
+@_typing.final
+class GetReceivedPaymentsRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    LIMIT_FIELD_NUMBER: _builtins.int
+    LAST_RECEIVED_PAYMENT_FIELD_NUMBER: _builtins.int
+    limit: _builtins.int
+    """/ Limit number of results"""
+    @_builtins.property
+    def last_received_payment(self) -> Global___ReceivedPayment:
+        """/ Last entry"""
+
+    def __init__(
+        self,
+        *,
+        limit: _builtins.int = ...,
+        last_received_payment: Global___ReceivedPayment | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["last_received_payment", b"last_received_payment"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["last_received_payment", b"last_received_payment", "limit", b"limit"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetReceivedPaymentsRequest: _TypeAlias = GetReceivedPaymentsRequest  # noqa: Y015
+
+@_typing.final
+class GetReceivedPaymentsReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    RECEIVED_PAYMENTS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def received_payments(self) -> _containers.RepeatedCompositeFieldContainer[Global___ReceivedPayment]:
+        """/ The received payments"""
+
+    def __init__(
+        self,
+        *,
+        received_payments: _abc.Iterable[Global___ReceivedPayment] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["received_payments", b"received_payments"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetReceivedPaymentsReply: _TypeAlias = GetReceivedPaymentsReply  # noqa: Y015
+
+@_typing.final
+class GetReceivedPaymentsForSqueakRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SQUEAK_HASH_FIELD_NUMBER: _builtins.int
+    LIMIT_FIELD_NUMBER: _builtins.int
+    LAST_RECEIVED_PAYMENT_FIELD_NUMBER: _builtins.int
+    squeak_hash: _builtins.str
+    """/ Hash of the squeak."""
+    limit: _builtins.int
+    """/ Limit number of results"""
+    @_builtins.property
+    def last_received_payment(self) -> Global___ReceivedPayment:
+        """/ Last entry"""
+
+    def __init__(
+        self,
+        *,
+        squeak_hash: _builtins.str = ...,
+        limit: _builtins.int = ...,
+        last_received_payment: Global___ReceivedPayment | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["last_received_payment", b"last_received_payment"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["last_received_payment", b"last_received_payment", "limit", b"limit", "squeak_hash", b"squeak_hash"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetReceivedPaymentsForSqueakRequest: _TypeAlias = GetReceivedPaymentsForSqueakRequest  # noqa: Y015
+
+@_typing.final
+class GetReceivedPaymentsForSqueakReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    RECEIVED_PAYMENTS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def received_payments(self) -> _containers.RepeatedCompositeFieldContainer[Global___ReceivedPayment]:
+        """/ The received payments"""
+
+    def __init__(
+        self,
+        *,
+        received_payments: _abc.Iterable[Global___ReceivedPayment] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["received_payments", b"received_payments"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetReceivedPaymentsForSqueakReply: _TypeAlias = GetReceivedPaymentsForSqueakReply  # noqa: Y015
+
+@_typing.final
+class GetReceivedPaymentsForPubkeyRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PUBKEY_FIELD_NUMBER: _builtins.int
+    LIMIT_FIELD_NUMBER: _builtins.int
+    LAST_RECEIVED_PAYMENT_FIELD_NUMBER: _builtins.int
+    pubkey: _builtins.str
+    """/ The pubkey in hex"""
+    limit: _builtins.int
+    """/ Limit number of results"""
+    @_builtins.property
+    def last_received_payment(self) -> Global___ReceivedPayment:
+        """/ Last entry"""
+
+    def __init__(
+        self,
+        *,
+        pubkey: _builtins.str = ...,
+        limit: _builtins.int = ...,
+        last_received_payment: Global___ReceivedPayment | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["last_received_payment", b"last_received_payment"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["last_received_payment", b"last_received_payment", "limit", b"limit", "pubkey", b"pubkey"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetReceivedPaymentsForPubkeyRequest: _TypeAlias = GetReceivedPaymentsForPubkeyRequest  # noqa: Y015
+
+@_typing.final
+class GetReceivedPaymentsForPubkeyReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    RECEIVED_PAYMENTS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def received_payments(self) -> _containers.RepeatedCompositeFieldContainer[Global___ReceivedPayment]:
+        """/ The received payments"""
+
+    def __init__(
+        self,
+        *,
+        received_payments: _abc.Iterable[Global___ReceivedPayment] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["received_payments", b"received_payments"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetReceivedPaymentsForPubkeyReply: _TypeAlias = GetReceivedPaymentsForPubkeyReply  # noqa: Y015
+
+@_typing.final
+class ReceivedPayment(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    RECEIVED_PAYMENT_ID_FIELD_NUMBER: _builtins.int
+    SQUEAK_HASH_FIELD_NUMBER: _builtins.int
+    PAYMENT_HASH_FIELD_NUMBER: _builtins.int
+    PRICE_MSAT_FIELD_NUMBER: _builtins.int
+    TIME_MS_FIELD_NUMBER: _builtins.int
+    PEER_ADDRESS_FIELD_NUMBER: _builtins.int
+    received_payment_id: _builtins.int
+    """/ The received payment id"""
+    squeak_hash: _builtins.str
+    """/ The squeak hash"""
+    payment_hash: _builtins.str
+    """/ The payment hash"""
+    price_msat: _builtins.int
+    """/ The price_msat"""
+    time_ms: _builtins.int
+    """/ Time of payment"""
+    @_builtins.property
+    def peer_address(self) -> Global___PeerAddress:
+        """/ The address of the squeak peer"""
+
+    def __init__(
+        self,
+        *,
+        received_payment_id: _builtins.int = ...,
+        squeak_hash: _builtins.str = ...,
+        payment_hash: _builtins.str = ...,
+        price_msat: _builtins.int = ...,
+        time_ms: _builtins.int = ...,
+        peer_address: Global___PeerAddress | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["peer_address", b"peer_address"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["payment_hash", b"payment_hash", "peer_address", b"peer_address", "price_msat", b"price_msat", "received_payment_id", b"received_payment_id", "squeak_hash", b"squeak_hash", "time_ms", b"time_ms"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ReceivedPayment: _TypeAlias = ReceivedPayment  # noqa: Y015
+
+@_typing.final
+class SubscribeReceivedPaymentsRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PAYMENT_INDEX_FIELD_NUMBER: _builtins.int
+    payment_index: _builtins.int
+    """/ Payment index to start consuming from"""
+    def __init__(
+        self,
+        *,
+        payment_index: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["payment_index", b"payment_index"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SubscribeReceivedPaymentsRequest: _TypeAlias = SubscribeReceivedPaymentsRequest  # noqa: Y015
+
+@_typing.final
+class GetNetworkRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetNetworkRequest: _TypeAlias = GetNetworkRequest  # noqa: Y015
+
+@_typing.final
+class GetNetworkReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    NETWORK_FIELD_NUMBER: _builtins.int
+    network: _builtins.str
+    """/ The network (e.g. mainnet or testnet)"""
+    def __init__(
+        self,
+        *,
+        network: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["network", b"network"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetNetworkReply: _TypeAlias = GetNetworkReply  # noqa: Y015
+
+@_typing.final
+class GetPaymentSummaryRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetPaymentSummaryRequest: _TypeAlias = GetPaymentSummaryRequest  # noqa: Y015
+
+@_typing.final
+class GetPaymentSummaryReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PAYMENT_SUMMARY_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def payment_summary(self) -> Global___PaymentSummary:
+        """Payment summary of the node"""
+
+    def __init__(
+        self,
+        *,
+        payment_summary: Global___PaymentSummary | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["payment_summary", b"payment_summary"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["payment_summary", b"payment_summary"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetPaymentSummaryReply: _TypeAlias = GetPaymentSummaryReply  # noqa: Y015
+
+@_typing.final
+class GetPaymentSummaryForSqueakRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SQUEAK_HASH_FIELD_NUMBER: _builtins.int
+    squeak_hash: _builtins.str
+    """/ Hash of the squeak."""
+    def __init__(
+        self,
+        *,
+        squeak_hash: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["squeak_hash", b"squeak_hash"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetPaymentSummaryForSqueakRequest: _TypeAlias = GetPaymentSummaryForSqueakRequest  # noqa: Y015
+
+@_typing.final
+class GetPaymentSummaryForSqueakReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PAYMENT_SUMMARY_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def payment_summary(self) -> Global___PaymentSummary:
+        """Payment summary of the node"""
+
+    def __init__(
+        self,
+        *,
+        payment_summary: Global___PaymentSummary | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["payment_summary", b"payment_summary"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["payment_summary", b"payment_summary"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetPaymentSummaryForSqueakReply: _TypeAlias = GetPaymentSummaryForSqueakReply  # noqa: Y015
+
+@_typing.final
+class GetPaymentSummaryForPubkeyRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PUBKEY_FIELD_NUMBER: _builtins.int
+    pubkey: _builtins.str
+    """/ The pubkey in hex"""
+    def __init__(
+        self,
+        *,
+        pubkey: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["pubkey", b"pubkey"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetPaymentSummaryForPubkeyRequest: _TypeAlias = GetPaymentSummaryForPubkeyRequest  # noqa: Y015
+
+@_typing.final
+class GetPaymentSummaryForPubkeyReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PAYMENT_SUMMARY_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def payment_summary(self) -> Global___PaymentSummary:
+        """Payment summary of the node"""
+
+    def __init__(
+        self,
+        *,
+        payment_summary: Global___PaymentSummary | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["payment_summary", b"payment_summary"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["payment_summary", b"payment_summary"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetPaymentSummaryForPubkeyReply: _TypeAlias = GetPaymentSummaryForPubkeyReply  # noqa: Y015
+
+@_typing.final
+class PaymentSummary(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    NUM_RECEIVED_PAYMENTS_FIELD_NUMBER: _builtins.int
+    NUM_SENT_PAYMENTS_FIELD_NUMBER: _builtins.int
+    AMOUNT_EARNED_MSAT_FIELD_NUMBER: _builtins.int
+    AMOUNT_SPENT_MSAT_FIELD_NUMBER: _builtins.int
+    num_received_payments: _builtins.int
+    """Number of received payments"""
+    num_sent_payments: _builtins.int
+    """Number of sent payments"""
+    amount_earned_msat: _builtins.int
+    """/ Amount earned in msats"""
+    amount_spent_msat: _builtins.int
+    """/ Amount spent in msats"""
+    def __init__(
+        self,
+        *,
+        num_received_payments: _builtins.int = ...,
+        num_sent_payments: _builtins.int = ...,
+        amount_earned_msat: _builtins.int = ...,
+        amount_spent_msat: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["amount_earned_msat", b"amount_earned_msat", "amount_spent_msat", b"amount_spent_msat", "num_received_payments", b"num_received_payments", "num_sent_payments", b"num_sent_payments"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___PaymentSummary: _TypeAlias = PaymentSummary  # noqa: Y015
+
+@_typing.final
+class ReprocessReceivedPaymentsRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ReprocessReceivedPaymentsRequest: _TypeAlias = ReprocessReceivedPaymentsRequest  # noqa: Y015
+
+@_typing.final
+class ReprocessReceivedPaymentsReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ReprocessReceivedPaymentsReply: _TypeAlias = ReprocessReceivedPaymentsReply  # noqa: Y015
+
+@_typing.final
+class LikeSqueakRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SQUEAK_HASH_FIELD_NUMBER: _builtins.int
+    squeak_hash: _builtins.str
+    """/ Hash of the squeak."""
+    def __init__(
+        self,
+        *,
+        squeak_hash: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["squeak_hash", b"squeak_hash"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___LikeSqueakRequest: _TypeAlias = LikeSqueakRequest  # noqa: Y015
+
+@_typing.final
+class LikeSqueakReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___LikeSqueakReply: _TypeAlias = LikeSqueakReply  # noqa: Y015
+
+@_typing.final
+class UnlikeSqueakRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SQUEAK_HASH_FIELD_NUMBER: _builtins.int
+    squeak_hash: _builtins.str
+    """/ Hash of the squeak."""
+    def __init__(
+        self,
+        *,
+        squeak_hash: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["squeak_hash", b"squeak_hash"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___UnlikeSqueakRequest: _TypeAlias = UnlikeSqueakRequest  # noqa: Y015
+
+@_typing.final
+class UnlikeSqueakReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___UnlikeSqueakReply: _TypeAlias = UnlikeSqueakReply  # noqa: Y015
+
+@_typing.final
+class GetLikedSqueakDisplaysRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    LIMIT_FIELD_NUMBER: _builtins.int
+    LAST_ENTRY_FIELD_NUMBER: _builtins.int
+    limit: _builtins.int
+    """/ Limit number of results"""
+    @_builtins.property
+    def last_entry(self) -> Global___SqueakDisplayEntry:
+        """/ Last entry"""
+
+    def __init__(
+        self,
+        *,
+        limit: _builtins.int = ...,
+        last_entry: Global___SqueakDisplayEntry | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["last_entry", b"last_entry"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["last_entry", b"last_entry", "limit", b"limit"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetLikedSqueakDisplaysRequest: _TypeAlias = GetLikedSqueakDisplaysRequest  # noqa: Y015
+
+@_typing.final
+class GetLikedSqueakDisplaysReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SQUEAK_DISPLAY_ENTRIES_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def squeak_display_entries(self) -> _containers.RepeatedCompositeFieldContainer[Global___SqueakDisplayEntry]:
+        """/ Multiple squeak display entries"""
+
+    def __init__(
+        self,
+        *,
+        squeak_display_entries: _abc.Iterable[Global___SqueakDisplayEntry] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["squeak_display_entries", b"squeak_display_entries"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetLikedSqueakDisplaysReply: _TypeAlias = GetLikedSqueakDisplaysReply  # noqa: Y015
+
+@_typing.final
+class ConnectPeerRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PEER_ADDRESS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def peer_address(self) -> Global___PeerAddress:
+        """/ Peer address"""
+
+    def __init__(
+        self,
+        *,
+        peer_address: Global___PeerAddress | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["peer_address", b"peer_address"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["peer_address", b"peer_address"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ConnectPeerRequest: _TypeAlias = ConnectPeerRequest  # noqa: Y015
+
+@_typing.final
+class ConnectPeerReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ConnectPeerReply: _TypeAlias = ConnectPeerReply  # noqa: Y015
+
+@_typing.final
+class ConnectedPeer(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PEER_ADDRESS_FIELD_NUMBER: _builtins.int
+    CONNECT_TIME_S_FIELD_NUMBER: _builtins.int
+    LAST_MESSAGE_RECEIVED_TIME_S_FIELD_NUMBER: _builtins.int
+    NUMBER_MESSAGES_RECEIVED_FIELD_NUMBER: _builtins.int
+    NUMBER_BYTES_RECEIVED_FIELD_NUMBER: _builtins.int
+    NUMBER_MESSAGES_SENT_FIELD_NUMBER: _builtins.int
+    NUMBER_BYTES_SENT_FIELD_NUMBER: _builtins.int
+    IS_PEER_SAVED_FIELD_NUMBER: _builtins.int
+    SAVED_PEER_FIELD_NUMBER: _builtins.int
+    connect_time_s: _builtins.int
+    """/ Connection time"""
+    last_message_received_time_s: _builtins.int
+    """/ Last message received time"""
+    number_messages_received: _builtins.int
+    """/ Number of messages received"""
+    number_bytes_received: _builtins.int
+    """/ Number of bytes received"""
+    number_messages_sent: _builtins.int
+    """/ Number of messages sent"""
+    number_bytes_sent: _builtins.int
+    """/ Number of bytes sent"""
+    is_peer_saved: _builtins.bool
+    """/ Is peer saved"""
+    @_builtins.property
+    def peer_address(self) -> Global___PeerAddress:
+        """/ Peer address"""
+
+    @_builtins.property
+    def saved_peer(self) -> Global___SqueakPeer:
+        """/ The saved peer"""
+
+    def __init__(
+        self,
+        *,
+        peer_address: Global___PeerAddress | None = ...,
+        connect_time_s: _builtins.int = ...,
+        last_message_received_time_s: _builtins.int = ...,
+        number_messages_received: _builtins.int = ...,
+        number_bytes_received: _builtins.int = ...,
+        number_messages_sent: _builtins.int = ...,
+        number_bytes_sent: _builtins.int = ...,
+        is_peer_saved: _builtins.bool = ...,
+        saved_peer: Global___SqueakPeer | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["peer_address", b"peer_address", "saved_peer", b"saved_peer"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["connect_time_s", b"connect_time_s", "is_peer_saved", b"is_peer_saved", "last_message_received_time_s", b"last_message_received_time_s", "number_bytes_received", b"number_bytes_received", "number_bytes_sent", b"number_bytes_sent", "number_messages_received", b"number_messages_received", "number_messages_sent", b"number_messages_sent", "peer_address", b"peer_address", "saved_peer", b"saved_peer"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ConnectedPeer: _TypeAlias = ConnectedPeer  # noqa: Y015
+
+@_typing.final
+class GetConnectedPeersRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetConnectedPeersRequest: _TypeAlias = GetConnectedPeersRequest  # noqa: Y015
+
+@_typing.final
+class GetConnectedPeersReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    CONNECTED_PEERS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def connected_peers(self) -> _containers.RepeatedCompositeFieldContainer[Global___ConnectedPeer]: ...
+    def __init__(
+        self,
+        *,
+        connected_peers: _abc.Iterable[Global___ConnectedPeer] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["connected_peers", b"connected_peers"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetConnectedPeersReply: _TypeAlias = GetConnectedPeersReply  # noqa: Y015
+
+@_typing.final
+class GetConnectedPeerRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PEER_ADDRESS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def peer_address(self) -> Global___PeerAddress:
+        """/ Peer address"""
+
+    def __init__(
+        self,
+        *,
+        peer_address: Global___PeerAddress | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["peer_address", b"peer_address"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["peer_address", b"peer_address"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetConnectedPeerRequest: _TypeAlias = GetConnectedPeerRequest  # noqa: Y015
+
+@_typing.final
+class GetConnectedPeerReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    CONNECTED_PEER_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def connected_peer(self) -> Global___ConnectedPeer: ...
+    def __init__(
+        self,
+        *,
+        connected_peer: Global___ConnectedPeer | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["connected_peer", b"connected_peer"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["connected_peer", b"connected_peer"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetConnectedPeerReply: _TypeAlias = GetConnectedPeerReply  # noqa: Y015
+
+@_typing.final
+class DisconnectPeerRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PEER_ADDRESS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def peer_address(self) -> Global___PeerAddress:
+        """/ Peer address"""
+
+    def __init__(
+        self,
+        *,
+        peer_address: Global___PeerAddress | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["peer_address", b"peer_address"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["peer_address", b"peer_address"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DisconnectPeerRequest: _TypeAlias = DisconnectPeerRequest  # noqa: Y015
+
+@_typing.final
+class DisconnectPeerReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DisconnectPeerReply: _TypeAlias = DisconnectPeerReply  # noqa: Y015
+
+@_typing.final
+class SubscribeConnectedPeersRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SubscribeConnectedPeersRequest: _TypeAlias = SubscribeConnectedPeersRequest  # noqa: Y015
+
+@_typing.final
+class SubscribeConnectedPeerRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PEER_ADDRESS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def peer_address(self) -> Global___PeerAddress:
+        """/ Peer address"""
+
+    def __init__(
+        self,
+        *,
+        peer_address: Global___PeerAddress | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["peer_address", b"peer_address"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["peer_address", b"peer_address"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SubscribeConnectedPeerRequest: _TypeAlias = SubscribeConnectedPeerRequest  # noqa: Y015
+
+@_typing.final
+class PeerAddress(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    NETWORK_FIELD_NUMBER: _builtins.int
+    HOST_FIELD_NUMBER: _builtins.int
+    PORT_FIELD_NUMBER: _builtins.int
+    network: _builtins.str
+    """/ The network to use for the connection (e.g. ipv4 or torv3)"""
+    host: _builtins.str
+    """/ The host of the peer"""
+    port: _builtins.int
+    """/ The port of the peer"""
+    def __init__(
+        self,
+        *,
+        network: _builtins.str = ...,
+        host: _builtins.str = ...,
+        port: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["host", b"host", "network", b"network", "port", b"port"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___PeerAddress: _TypeAlias = PeerAddress  # noqa: Y015
+
+@_typing.final
+class SubscribeBuyOffersRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SQUEAK_HASH_FIELD_NUMBER: _builtins.int
+    squeak_hash: _builtins.str
+    """/ Hash of the squeak."""
+    def __init__(
+        self,
+        *,
+        squeak_hash: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["squeak_hash", b"squeak_hash"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SubscribeBuyOffersRequest: _TypeAlias = SubscribeBuyOffersRequest  # noqa: Y015
+
+@_typing.final
+class SubscribeSqueakDisplayRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SQUEAK_HASH_FIELD_NUMBER: _builtins.int
+    squeak_hash: _builtins.str
+    """/ Hash of the squeak."""
+    def __init__(
+        self,
+        *,
+        squeak_hash: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["squeak_hash", b"squeak_hash"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SubscribeSqueakDisplayRequest: _TypeAlias = SubscribeSqueakDisplayRequest  # noqa: Y015
+
+@_typing.final
+class SubscribeReplySqueakDisplaysRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SQUEAK_HASH_FIELD_NUMBER: _builtins.int
+    squeak_hash: _builtins.str
+    """/ Hash of the squeak."""
+    def __init__(
+        self,
+        *,
+        squeak_hash: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["squeak_hash", b"squeak_hash"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SubscribeReplySqueakDisplaysRequest: _TypeAlias = SubscribeReplySqueakDisplaysRequest  # noqa: Y015
+
+@_typing.final
+class SubscribePubKeySqueakDisplaysRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PUBKEY_FIELD_NUMBER: _builtins.int
+    pubkey: _builtins.str
+    """/ The pubkey in hex"""
+    def __init__(
+        self,
+        *,
+        pubkey: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["pubkey", b"pubkey"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SubscribePubKeySqueakDisplaysRequest: _TypeAlias = SubscribePubKeySqueakDisplaysRequest  # noqa: Y015
+
+@_typing.final
+class SubscribeAncestorSqueakDisplaysRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SQUEAK_HASH_FIELD_NUMBER: _builtins.int
+    squeak_hash: _builtins.str
+    """/ Hash of the squeak."""
+    def __init__(
+        self,
+        *,
+        squeak_hash: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["squeak_hash", b"squeak_hash"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SubscribeAncestorSqueakDisplaysRequest: _TypeAlias = SubscribeAncestorSqueakDisplaysRequest  # noqa: Y015
+
+@_typing.final
+class SubscribeSqueakDisplaysRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SubscribeSqueakDisplaysRequest: _TypeAlias = SubscribeSqueakDisplaysRequest  # noqa: Y015
+
+@_typing.final
+class SubscribeTimelineSqueakDisplaysRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SubscribeTimelineSqueakDisplaysRequest: _TypeAlias = SubscribeTimelineSqueakDisplaysRequest  # noqa: Y015
+
+@_typing.final
+class GetExternalAddressRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetExternalAddressRequest: _TypeAlias = GetExternalAddressRequest  # noqa: Y015
+
+@_typing.final
+class GetExternalAddressReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PEER_ADDRESS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def peer_address(self) -> Global___PeerAddress:
+        """/ Peer address"""
+
+    def __init__(
+        self,
+        *,
+        peer_address: Global___PeerAddress | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["peer_address", b"peer_address"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["peer_address", b"peer_address"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetExternalAddressReply: _TypeAlias = GetExternalAddressReply  # noqa: Y015
+
+@_typing.final
+class GetDefaultPeerPortRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetDefaultPeerPortRequest: _TypeAlias = GetDefaultPeerPortRequest  # noqa: Y015
+
+@_typing.final
+class GetDefaultPeerPortReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PORT_FIELD_NUMBER: _builtins.int
+    port: _builtins.int
+    """/ The port."""
+    def __init__(
+        self,
+        *,
+        port: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["port", b"port"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetDefaultPeerPortReply: _TypeAlias = GetDefaultPeerPortReply  # noqa: Y015
+
+@_typing.final
+class SetSellPriceRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PRICE_MSAT_FIELD_NUMBER: _builtins.int
+    price_msat: _builtins.int
+    """/ The price in msats"""
+    def __init__(
+        self,
+        *,
+        price_msat: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["price_msat", b"price_msat"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SetSellPriceRequest: _TypeAlias = SetSellPriceRequest  # noqa: Y015
+
+@_typing.final
+class SetSellPriceReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SetSellPriceReply: _TypeAlias = SetSellPriceReply  # noqa: Y015
+
+@_typing.final
+class ClearSellPriceRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ClearSellPriceRequest: _TypeAlias = ClearSellPriceRequest  # noqa: Y015
+
+@_typing.final
+class ClearSellPriceReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ClearSellPriceReply: _TypeAlias = ClearSellPriceReply  # noqa: Y015
+
+@_typing.final
+class GetSellPriceRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetSellPriceRequest: _TypeAlias = GetSellPriceRequest  # noqa: Y015
+
+@_typing.final
+class GetSellPriceReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PRICE_MSAT_FIELD_NUMBER: _builtins.int
+    price_msat: _builtins.int
+    """/ The price in msats"""
+    def __init__(
+        self,
+        *,
+        price_msat: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["price_msat", b"price_msat"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetSellPriceReply: _TypeAlias = GetSellPriceReply  # noqa: Y015
+
+@_typing.final
+class TwitterAccount(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    TWITTER_ACCOUNT_ID_FIELD_NUMBER: _builtins.int
+    HANDLE_FIELD_NUMBER: _builtins.int
+    PROFILE_ID_FIELD_NUMBER: _builtins.int
+    IS_PROFILE_KNOWN_FIELD_NUMBER: _builtins.int
+    PROFILE_FIELD_NUMBER: _builtins.int
+    IS_FORWARDING_FIELD_NUMBER: _builtins.int
+    twitter_account_id: _builtins.int
+    """/ The twitter account id"""
+    handle: _builtins.str
+    """/ The twitter account handle."""
+    profile_id: _builtins.int
+    """/ The profile id"""
+    is_profile_known: _builtins.bool
+    """/ Is profile_id known"""
+    is_forwarding: _builtins.bool
+    """/ Is twitter stream forwarding successfully."""
+    @_builtins.property
+    def profile(self) -> Global___SqueakProfile:
+        """/ The profile"""
+
+    def __init__(
+        self,
+        *,
+        twitter_account_id: _builtins.int = ...,
+        handle: _builtins.str = ...,
+        profile_id: _builtins.int = ...,
+        is_profile_known: _builtins.bool = ...,
+        profile: Global___SqueakProfile | None = ...,
+        is_forwarding: _builtins.bool = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["profile", b"profile"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["handle", b"handle", "is_forwarding", b"is_forwarding", "is_profile_known", b"is_profile_known", "profile", b"profile", "profile_id", b"profile_id", "twitter_account_id", b"twitter_account_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___TwitterAccount: _TypeAlias = TwitterAccount  # noqa: Y015
+
+@_typing.final
+class AddTwitterAccountRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    HANDLE_FIELD_NUMBER: _builtins.int
+    PROFILE_ID_FIELD_NUMBER: _builtins.int
+    BEARER_TOKEN_FIELD_NUMBER: _builtins.int
+    handle: _builtins.str
+    """/ The twitter account handle."""
+    profile_id: _builtins.int
+    """/ The profile id"""
+    bearer_token: _builtins.str
+    """/ The bearer token string."""
+    def __init__(
+        self,
+        *,
+        handle: _builtins.str = ...,
+        profile_id: _builtins.int = ...,
+        bearer_token: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["bearer_token", b"bearer_token", "handle", b"handle", "profile_id", b"profile_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___AddTwitterAccountRequest: _TypeAlias = AddTwitterAccountRequest  # noqa: Y015
+
+@_typing.final
+class AddTwitterAccountReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    TWITTER_ACCOUNT_ID_FIELD_NUMBER: _builtins.int
+    twitter_account_id: _builtins.int
+    """/ The twitter account id"""
+    def __init__(
+        self,
+        *,
+        twitter_account_id: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["twitter_account_id", b"twitter_account_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___AddTwitterAccountReply: _TypeAlias = AddTwitterAccountReply  # noqa: Y015
+
+@_typing.final
+class GetTwitterAccountsRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetTwitterAccountsRequest: _TypeAlias = GetTwitterAccountsRequest  # noqa: Y015
+
+@_typing.final
+class GetTwitterAccountsReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    TWITTER_ACCOUNTS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def twitter_accounts(self) -> _containers.RepeatedCompositeFieldContainer[Global___TwitterAccount]:
+        """/ The twitter accounts"""
+
+    def __init__(
+        self,
+        *,
+        twitter_accounts: _abc.Iterable[Global___TwitterAccount] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["twitter_accounts", b"twitter_accounts"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetTwitterAccountsReply: _TypeAlias = GetTwitterAccountsReply  # noqa: Y015
+
+@_typing.final
+class DeleteTwitterAccountRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    TWITTER_ACCOUNT_ID_FIELD_NUMBER: _builtins.int
+    twitter_account_id: _builtins.int
+    """/ The twitter account id"""
+    def __init__(
+        self,
+        *,
+        twitter_account_id: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["twitter_account_id", b"twitter_account_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DeleteTwitterAccountRequest: _TypeAlias = DeleteTwitterAccountRequest  # noqa: Y015
+
+@_typing.final
+class DeleteTwitterAccountReply(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DeleteTwitterAccountReply: _TypeAlias = DeleteTwitterAccountReply  # noqa: Y015
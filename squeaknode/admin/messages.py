@@ -20,13 +20,17 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 import logging
+from typing import Callable
 from typing import Optional
 
 from squeak.core.keys import SqueakPublicKey
 
 from proto import squeak_admin_pb2
-from squeaknode.admin.profile_image_util import bytes_to_base64_string
+from squeaknode.admin.profile_image_util import encode_profile_image
+from squeaknode.admin.profile_image_util import EncodedProfileImage
+from squeaknode.admin.profile_image_util import get_profile_image_hash
 from squeaknode.admin.profile_image_util import load_default_profile_image
+from squeaknode.client.peer_health import PeerHealth
 from squeaknode.core.download_result import DownloadResult
 from squeaknode.core.peer_address import Network
 from squeaknode.core.peer_address import PeerAddress
@@ -45,9 +49,17 @@ logger = logging.getLogger(__name__)
 
 
 DEFAULT_PROFILE_IMAGE = load_default_profile_image()
+DEFAULT_PROFILE_IMAGE_HASH = get_profile_image_hash(DEFAULT_PROFILE_IMAGE)
 
 
-def squeak_entry_to_message(squeak_entry: SqueakEntry) -> squeak_admin_pb2.SqueakDisplayEntry:
+ProfileImageLoader = Callable[[bytes], Optional[EncodedProfileImage]]
+
+
+def squeak_entry_to_message(
+        squeak_entry: SqueakEntry,
+        inline_profile_images: bool = True,
+        load_profile_image: Optional[ProfileImageLoader] = None,
+) -> squeak_admin_pb2.SqueakDisplayEntry:
     return squeak_admin_pb2.SqueakDisplayEntry(
         squeak_hash=squeak_entry.squeak_hash.hex(),
         serialized_squeak_hex=squeak_entry.serialized_squeak.hex(),
@@ -64,39 +76,73 @@ def squeak_entry_to_message(squeak_entry: SqueakEntry) -> squeak_admin_pb2.Squea
                   if squeak_entry.reply_to else None),  # type: ignore
         author_pubkey=squeak_entry.public_key.to_bytes().hex(),
         is_author_known=(squeak_entry.squeak_profile is not None),
-        author=(squeak_profile_to_message(squeak_entry.squeak_profile)
+        author=(squeak_profile_to_message(squeak_entry.squeak_profile, inline_profile_images, load_profile_image)
                 if squeak_entry.squeak_profile else None),
         liked_time_ms=squeak_entry.liked_time_ms,  # type: ignore
         is_private=(squeak_entry.recipient_public_key is not None),
         recipient_pubkey=(squeak_entry.recipient_public_key.to_bytes(
-        ).hex() if squeak_entry.recipient_public_key else None),
+        ).hex() if squeak_entry.recipient_public_key else None),  # type: ignore
         is_recipient_known=(squeak_entry.recipient_squeak_profile is not None),
-        recipient=(squeak_profile_to_message(squeak_entry.recipient_squeak_profile)
+        recipient=(squeak_profile_to_message(squeak_entry.recipient_squeak_profile, inline_profile_images, load_profile_image)
                    if squeak_entry.recipient_squeak_profile else None),
     )
 
 
-def squeak_profile_to_message(squeak_profile: SqueakProfile) -> squeak_admin_pb2.SqueakProfile:
-    profile_image = squeak_profile.profile_image or DEFAULT_PROFILE_IMAGE
-    image_base64_str = bytes_to_base64_string(profile_image)
+def squeak_profile_to_message(
+        squeak_profile: SqueakProfile,
+        inline_profile_image: bool = True,
+        load_profile_image: Optional[ProfileImageLoader] = None,
+) -> squeak_admin_pb2.SqueakProfile:
+    """Custom profile images are only inlined if they can be loaded by
+    hash with `load_profile_image`.
+    """
+    image_hash = squeak_profile.profile_image_hash or DEFAULT_PROFILE_IMAGE_HASH
+    encoded_image = None
+    if inline_profile_image:
+        if squeak_profile.profile_image_hash is None:
+            encoded_image = encode_profile_image(
+                DEFAULT_PROFILE_IMAGE_HASH,
+                DEFAULT_PROFILE_IMAGE,
+            )
+        elif load_profile_image is not None:
+            encoded_image = load_profile_image(image_hash)
     return squeak_admin_pb2.SqueakProfile(
         profile_id=squeak_profile.profile_id or 0,
         profile_name=squeak_profile.profile_name,
         has_private_key=(squeak_profile.private_key is not None),
         pubkey=squeak_profile.public_key.to_bytes().hex(),
         following=squeak_profile.following,
-        profile_image=image_base64_str,
-        has_custom_profile_image=(squeak_profile.profile_image is not None),
+        profile_image=(encoded_image.base64_str
+                       if encoded_image is not None else None),  # type: ignore
+        has_custom_profile_image=(
+            squeak_profile.profile_image_hash is not None),
+        profile_image_hash=image_hash.hex(),
     )
 
 
-def squeak_peer_to_message(squeak_peer: SqueakPeer) -> squeak_admin_pb2.SqueakPeer:
+def squeak_peer_to_message(
+        squeak_peer: SqueakPeer,
+        peer_health: Optional[PeerHealth] = None,
+) -> squeak_admin_pb2.SqueakPeer:
     return squeak_admin_pb2.SqueakPeer(
         peer_id=(squeak_peer.peer_id or 0),
         peer_name=squeak_peer.peer_name,
         peer_address=peer_address_to_message(squeak_peer.address),
         autoconnect=squeak_peer.autoconnect,
         share_for_free=squeak_peer.share_for_free,
+        health=(peer_health_to_message(peer_health)
+                if peer_health else None),
+    )
+
+
+def peer_health_to_message(peer_health: PeerHealth) -> squeak_admin_pb2.PeerHealth:
+    return squeak_admin_pb2.PeerHealth(
+        score=peer_health.score,
+        avg_latency_ms=peer_health.avg_latency_ms,
+        error_rate=peer_health.error_rate,
+        yield_per_request=peer_health.yield_per_request,
+        consecutive_failures=peer_health.consecutive_failures,
+        backoff_until_time_ms=peer_health.backoff_until_ms,
     )
 
 
@@ -235,23 +281,33 @@ def download_result_to_message(download_result: DownloadResult) -> squeak_admin_
     )
 
 
-def twitter_account_to_message(twitter_account_entry: TwitterAccountEntry) -> squeak_admin_pb2.TwitterAccount:
+def twitter_account_to_message(
+        twitter_account_entry: TwitterAccountEntry,
+        load_profile_image: Optional[ProfileImageLoader] = None,
+) -> squeak_admin_pb2.TwitterAccount:
     return squeak_admin_pb2.TwitterAccount(
         twitter_account_id=(twitter_account_entry.twitter_account_id or 0),
         handle=twitter_account_entry.handle,
         profile_id=twitter_account_entry.profile_id,
         profile=(
-            squeak_profile_to_message(twitter_account_entry.profile)
+            squeak_profile_to_message(
+                twitter_account_entry.profile,
+                load_profile_image=load_profile_image,
+            )
             if twitter_account_entry.profile else None
         ),
         is_forwarding=twitter_account_entry.is_forwarding,
     )
 
 
-def optional_squeak_profile_to_message(squeak_profile: Optional[SqueakProfile]) -> Optional[squeak_admin_pb2.SqueakProfile]:
+def optional_squeak_profile_to_message(
+        squeak_profile: Optional[SqueakProfile],
+        inline_profile_image: bool = True,
+        load_profile_image: Optional[ProfileImageLoader] = None,
+) -> Optional[squeak_admin_pb2.SqueakProfile]:
     if squeak_profile is None:
         return None
-    return squeak_profile_to_message(squeak_profile)
+    return squeak_profile_to_message(squeak_profile, inline_profile_image, load_profile_image)
 
 
 def optional_squeak_hash_to_hex(squeak_hash: Optional[bytes]) -> Optional[str]:
@@ -260,10 +316,14 @@ def optional_squeak_hash_to_hex(squeak_hash: Optional[bytes]) -> Optional[str]:
     return squeak_hash.hex()
 
 
-def optional_squeak_entry_to_message(squeak_entry: Optional[SqueakEntry]) -> Optional[squeak_admin_pb2.SqueakDisplayEntry]:
+def optional_squeak_entry_to_message(
+        squeak_entry: Optional[SqueakEntry],
+        inline_profile_images: bool = True,
+        load_profile_image: Optional[ProfileImageLoader] = None,
+) -> Optional[squeak_admin_pb2.SqueakDisplayEntry]:
     if squeak_entry is None:
         return None
-    return squeak_entry_to_message(squeak_entry)
+    return squeak_entry_to_message(squeak_entry, inline_profile_images, load_profile_image)
 
 
 def optional_squeak_peer_to_message(squeak_peer: Optional[SqueakPeer]) -> Optional[squeak_admin_pb2.SqueakPeer]:
@@ -20,10 +20,59 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 import base64
+import threading
+from collections import OrderedDict
+from typing import NamedTuple
+from typing import Optional
 
 from pkg_resources import resource_stream
 
+from squeaknode.core.profile_images import get_profile_image_hash
+
 IMAGE_PATH = "icon.png"
+PROFILE_IMAGE_CACHE_SIZE = 256
+
+
+class EncodedProfileImage(NamedTuple):
+    image_hash: bytes
+    profile_image: bytes
+    base64_str: str
+
+
+class ProfileImageCache:
+    """Keeps recently used profile images and their base64 encoding, by
+    profile image hash.
+    """
+
+    def __init__(self, max_size: int = PROFILE_IMAGE_CACHE_SIZE):
+        self.max_size = max_size
+        self.encoded: 'OrderedDict[bytes, EncodedProfileImage]' = OrderedDict()
+        self.lock = threading.Lock()
+
+    def encode(self, image_hash: bytes, profile_image: bytes) -> EncodedProfileImage:
+        encoded_image = self.get(image_hash)
+        if encoded_image is not None:
+            return encoded_image
+        encoded_image = EncodedProfileImage(
+            image_hash=image_hash,
+            profile_image=profile_image,
+            base64_str=bytes_to_base64_string(profile_image),
+        )
+        with self.lock:
+            self.encoded[image_hash] = encoded_image
+            while len(self.encoded) > self.max_size:
+                self.encoded.popitem(last=False)
+        return encoded_image
+
+    def get(self, image_hash: bytes) -> Optional[EncodedProfileImage]:
+        with self.lock:
+            encoded_image = self.encoded.get(image_hash)
+            if encoded_image is not None:
+                self.encoded.move_to_end(image_hash)
+            return encoded_image
+
+
+PROFILE_IMAGE_CACHE = ProfileImageCache()
 
 
 def load_default_profile_image():
@@ -38,3 +87,24 @@ def bytes_to_base64_string(data: bytes) -> str:
 def base64_string_to_bytes(data: str) -> bytes:
     base64_bytes = data.encode('utf-8')
     return base64.decodebytes(base64_bytes)
+
+
+def encode_profile_image(image_hash: bytes, profile_image: bytes) -> EncodedProfileImage:
+    """Get the base64 string of a profile image, encoding each image
+    only once.
+    """
+    return PROFILE_IMAGE_CACHE.encode(image_hash, profile_image)
+
+
+def get_cached_profile_image(image_hash: bytes) -> Optional[EncodedProfileImage]:
+    return PROFILE_IMAGE_CACHE.get(image_hash)
+
+
+def get_image_mimetype(data: bytes) -> str:
+    if data.startswith(b'\x89PNG'):
+        return 'image/png'
+    if data.startswith(b'\xff\xd8'):
+        return 'image/jpeg'
+    if data.startswith(b'GIF8'):
+        return 'image/gif'
+    return 'application/octet-stream'
@@ -20,11 +20,14 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 import logging
+from typing import Optional
 
 from squeak.core.keys import SqueakPrivateKey
 from squeak.core.keys import SqueakPublicKey
 
 from proto import squeak_admin_pb2
+from squeaknode.admin.messages import DEFAULT_PROFILE_IMAGE
+from squeaknode.admin.messages import DEFAULT_PROFILE_IMAGE_HASH
 from squeaknode.admin.messages import download_result_to_message
 from squeaknode.admin.messages import message_to_peer_address
 from squeaknode.admin.messages import message_to_received_payment
@@ -47,12 +50,22 @@ from squeaknode.admin.messages import squeak_peer_to_message
 from squeaknode.admin.messages import squeak_profile_to_message
 from squeaknode.admin.messages import twitter_account_to_message
 from squeaknode.admin.profile_image_util import base64_string_to_bytes
+from squeaknode.admin.profile_image_util import encode_profile_image
+from squeaknode.admin.profile_image_util import EncodedProfileImage
+from squeaknode.admin.profile_image_util import get_cached_profile_image
+from squeaknode.admin.profile_image_util import get_profile_image_hash
+from squeaknode.core.squeak_entry import SqueakEntry
 from squeaknode.lightning.lnd_lightning_client import LNDLightningClient
 from squeaknode.node.squeak_controller import SqueakController
+from squeaknode.node.ttl_cache import TtlCache
 
 logger = logging.getLogger(__name__)
 
 
+SQUEAK_DISPLAY_CACHE_SIZE = 1000
+SQUEAK_DISPLAY_CACHE_TTL_S = 10
+
+
 class SqueakAdminServerHandler(object):
     """Handles admin server commands."""
 
@@ -60,9 +73,36 @@ class SqueakAdminServerHandler(object):
         self,
         lightning_client: LNDLightningClient,
         squeak_controller: SqueakController,
+        inline_profile_images: bool = True,
     ):
         self.lightning_client = lightning_client
         self.squeak_controller = squeak_controller
+        self.inline_profile_images = inline_profile_images
+        self.squeak_display_cache = TtlCache(
+            SQUEAK_DISPLAY_CACHE_SIZE,
+            SQUEAK_DISPLAY_CACHE_TTL_S,
+        )
+
+    def get_squeak_display_message(
+            self,
+            squeak_entry: SqueakEntry,
+    ) -> squeak_admin_pb2.SqueakDisplayEntry:
+        """Convert a squeak entry to a message once, and reuse the message
+        for the other streams that get the same entry object.
+        """
+        cached = self.squeak_display_cache.get(squeak_entry.squeak_hash)
+        if cached is not None and cached[0] is squeak_entry:
+            return cached[1]
+        display_message = squeak_entry_to_message(
+            squeak_entry,
+            self.inline_profile_images,
+            self.get_profile_image,
+        )
+        self.squeak_display_cache.put(
+            squeak_entry.squeak_hash,
+            (squeak_entry, display_message),
+        )
+        return display_message
 
     def handle_lnd_get_info(self, request):
         logger.info("Handle lnd get info")
@@ -165,7 +205,7 @@ class SqueakAdminServerHandler(object):
         profiles = self.squeak_controller.get_profiles()
         logger.info("Got number of profiles: {}".format(len(profiles)))
         profile_msgs = [squeak_profile_to_message(
-            profile) for profile in profiles]
+            profile, load_profile_image=self.get_profile_image) for profile in profiles]
         return squeak_admin_pb2.GetProfilesReply(squeak_profiles=profile_msgs)
 
     def handle_get_signing_profiles(self, request):
@@ -173,7 +213,7 @@ class SqueakAdminServerHandler(object):
         profiles = self.squeak_controller.get_signing_profiles()
         logger.info("Got number of signing profiles: {}".format(len(profiles)))
         profile_msgs = [squeak_profile_to_message(
-            profile) for profile in profiles]
+            profile, load_profile_image=self.get_profile_image) for profile in profiles]
         return squeak_admin_pb2.GetSigningProfilesReply(squeak_profiles=profile_msgs)
 
     def handle_get_contact_profiles(self, request):
@@ -181,14 +221,17 @@ class SqueakAdminServerHandler(object):
         profiles = self.squeak_controller.get_contact_profiles()
         logger.info("Got number of contact profiles: {}".format(len(profiles)))
         profile_msgs = [squeak_profile_to_message(
-            profile) for profile in profiles]
+            profile, load_profile_image=self.get_profile_image) for profile in profiles]
         return squeak_admin_pb2.GetContactProfilesReply(squeak_profiles=profile_msgs)
 
     def handle_get_squeak_profile(self, request):
         profile_id = request.profile_id
         logger.info("Handle get squeak profile with id: {}".format(profile_id))
         squeak_profile = self.squeak_controller.get_squeak_profile(profile_id)
-        squeak_profile_msg = optional_squeak_profile_to_message(squeak_profile)
+        squeak_profile_msg = optional_squeak_profile_to_message(
+            squeak_profile,
+            load_profile_image=self.get_profile_image,
+        )
         return squeak_admin_pb2.GetSqueakProfileReply(
             squeak_profile=squeak_profile_msg,
         )
@@ -201,7 +244,10 @@ class SqueakAdminServerHandler(object):
         squeak_profile = self.squeak_controller.get_squeak_profile_by_public_key(
             public_key,
         )
-        squeak_profile_msg = optional_squeak_profile_to_message(squeak_profile)
+        squeak_profile_msg = optional_squeak_profile_to_message(
+            squeak_profile,
+            load_profile_image=self.get_profile_image,
+        )
         return squeak_admin_pb2.GetSqueakProfileByPubKeyReply(
             squeak_profile=squeak_profile_msg
         )
@@ -211,7 +257,10 @@ class SqueakAdminServerHandler(object):
         logger.info("Handle get squeak profile with name: {}".format(name))
         squeak_profile = self.squeak_controller.get_squeak_profile_by_name(
             name)
-        squeak_profile_msg = optional_squeak_profile_to_message(squeak_profile)
+        squeak_profile_msg = optional_squeak_profile_to_message(
+            squeak_profile,
+            load_profile_image=self.get_profile_image,
+        )
         return squeak_admin_pb2.GetSqueakProfileByNameReply(
             squeak_profile=squeak_profile_msg
         )
@@ -257,10 +306,36 @@ class SqueakAdminServerHandler(object):
             )
         )
         profile_image_bytes = base64_string_to_bytes(profile_image)
-        self.squeak_controller.set_squeak_profile_image(
+        saved_image = self.squeak_controller.set_squeak_profile_image(
             profile_id, profile_image_bytes)
+        # Encode the new image now instead of on the next read.
+        encode_profile_image(get_profile_image_hash(saved_image), saved_image)
         return squeak_admin_pb2.SetSqueakProfileImageReply()
 
+    def handle_get_profile_image(self, image_hash_str: str) -> Optional[bytes]:
+        image_hash = bytes.fromhex(image_hash_str)
+        logger.info("Handle get profile image: {}".format(image_hash_str))
+        encoded_image = self.get_profile_image(image_hash)
+        if encoded_image is None:
+            return None
+        return encoded_image.profile_image
+
+    def get_profile_image(self, image_hash: bytes) -> Optional[EncodedProfileImage]:
+        """Get an encoded profile image by hash, from the cache of encoded
+        images if possible.
+        """
+        encoded_image = get_cached_profile_image(image_hash)
+        if encoded_image is not None:
+            return encoded_image
+        if image_hash == DEFAULT_PROFILE_IMAGE_HASH:
+            profile_image = DEFAULT_PROFILE_IMAGE
+        else:
+            profile_image = self.squeak_controller.get_profile_image(
+                image_hash)
+        if profile_image is None:
+            return None
+        return encode_profile_image(image_hash, profile_image)
+
     def handle_clear_squeak_profile_image(self, request):
         profile_id = request.profile_id
         logger.info(
@@ -320,7 +395,10 @@ class SqueakAdminServerHandler(object):
             )
         )
         display_message = optional_squeak_entry_to_message(
-            squeak_entry)
+            squeak_entry,
+            self.inline_profile_images,
+            self.get_profile_image,
+        )
         return squeak_admin_pb2.GetSqueakDisplayReply(
             squeak_display_entry=display_message
         )
@@ -348,7 +426,7 @@ class SqueakAdminServerHandler(object):
             )
         )
         squeak_display_msgs = [
-            squeak_entry_to_message(entry) for entry in squeak_entries
+            squeak_entry_to_message(entry, self.inline_profile_images, self.get_profile_image) for entry in squeak_entries
         ]
         return squeak_admin_pb2.GetTimelineSqueakDisplaysReply(
             squeak_display_entries=squeak_display_msgs
@@ -381,7 +459,7 @@ class SqueakAdminServerHandler(object):
             )
         )
         squeak_display_msgs = [
-            squeak_entry_to_message(entry) for entry in squeak_entries
+            squeak_entry_to_message(entry, self.inline_profile_images, self.get_profile_image) for entry in squeak_entries
         ]
         return squeak_admin_pb2.GetPubKeySqueakDisplaysReply(
             squeak_display_entries=squeak_display_msgs
@@ -413,7 +491,7 @@ class SqueakAdminServerHandler(object):
             )
         )
         squeak_display_msgs = [
-            squeak_entry_to_message(entry) for entry in squeak_entries
+            squeak_entry_to_message(entry, self.inline_profile_images, self.get_profile_image) for entry in squeak_entries
         ]
         return squeak_admin_pb2.GetSearchSqueakDisplaysReply(
             squeak_display_entries=squeak_display_msgs
@@ -438,7 +516,7 @@ class SqueakAdminServerHandler(object):
             )
         )
         squeak_display_msgs = [
-            squeak_entry_to_message(entry) for entry in squeak_entries
+            squeak_entry_to_message(entry, self.inline_profile_images, self.get_profile_image) for entry in squeak_entries
         ]
         return squeak_admin_pb2.GetAncestorSqueakDisplaysReply(
             squeak_display_entries=squeak_display_msgs
@@ -471,7 +549,7 @@ class SqueakAdminServerHandler(object):
             )
         )
         squeak_display_msgs = [
-            squeak_entry_to_message(entry) for entry in squeak_entries
+            squeak_entry_to_message(entry, self.inline_profile_images, self.get_profile_image) for entry in squeak_entries
         ]
         return squeak_admin_pb2.GetReplySqueakDisplaysReply(
             squeak_display_entries=squeak_display_msgs
@@ -527,8 +605,12 @@ class SqueakAdminServerHandler(object):
     def handle_get_squeak_peers(self, request):
         logger.info("Handle get squeak peers")
         squeak_peers = self.squeak_controller.get_peers()
+        peer_health = self.squeak_controller.get_peer_health()
         squeak_peer_msgs = [
-            squeak_peer_to_message(squeak_peer)
+            squeak_peer_to_message(
+                squeak_peer,
+                peer_health.get(squeak_peer.address),
+            )
             for squeak_peer in squeak_peers
         ]
         return squeak_admin_pb2.GetPeersReply(
@@ -618,11 +700,12 @@ class SqueakAdminServerHandler(object):
             SqueakPublicKey.from_bytes(bytes.fromhex(pubkey_hex))
             for pubkey_hex in pubkeys_in_hex
         ]
+        # A block height of zero means that the range is not limited.
         download_result = self.squeak_controller.download_squeaks(
             public_keys,
-            min_block,
-            max_block,
-            replyto_hash,
+            min_block or None,
+            max_block or None,
+            bytes.fromhex(replyto_hash) if replyto_hash else None,
         )
         logger.info("Download result: {}".format(download_result))
         download_result_msg = download_result_to_message(download_result)
@@ -1036,7 +1119,7 @@ class SqueakAdminServerHandler(object):
             )
         )
         squeak_display_msgs = [
-            squeak_entry_to_message(entry) for entry in squeak_entries
+            squeak_entry_to_message(entry, self.inline_profile_images, self.get_profile_image) for entry in squeak_entries
         ]
         return squeak_admin_pb2.GetLikedSqueakDisplaysReply(
             squeak_display_entries=squeak_display_msgs
@@ -1068,7 +1151,7 @@ class SqueakAdminServerHandler(object):
             stopped,
         )
         for squeak_display in squeak_display_stream:
-            display_message = optional_squeak_entry_to_message(
+            display_message = self.get_squeak_display_message(
                 squeak_display)
             yield squeak_admin_pb2.GetSqueakDisplayReply(
                 squeak_display_entry=display_message
@@ -1084,7 +1167,7 @@ class SqueakAdminServerHandler(object):
             stopped,
         )
         for squeak_display in squeak_display_stream:
-            display_message = optional_squeak_entry_to_message(
+            display_message = self.get_squeak_display_message(
                 squeak_display)
             yield squeak_admin_pb2.GetSqueakDisplayReply(
                 squeak_display_entry=display_message
@@ -1100,7 +1183,7 @@ class SqueakAdminServerHandler(object):
             stopped,
         )
         for squeak_display in squeak_display_stream:
-            display_message = optional_squeak_entry_to_message(
+            display_message = self.get_squeak_display_message(
                 squeak_display)
             yield squeak_admin_pb2.GetSqueakDisplayReply(
                 squeak_display_entry=display_message
@@ -1122,7 +1205,7 @@ class SqueakAdminServerHandler(object):
                 )
             )
             squeak_display_msgs = [
-                squeak_entry_to_message(entry) for entry in squeak_entries
+                squeak_entry_to_message(entry, self.inline_profile_images, self.get_profile_image) for entry in squeak_entries
             ]
             yield squeak_admin_pb2.GetAncestorSqueakDisplaysReply(
                 squeak_display_entries=squeak_display_msgs
@@ -1134,7 +1217,7 @@ class SqueakAdminServerHandler(object):
             stopped,
         )
         for squeak_display in squeak_display_stream:
-            display_message = optional_squeak_entry_to_message(
+            display_message = self.get_squeak_display_message(
                 squeak_display)
             yield squeak_admin_pb2.GetSqueakDisplayReply(
                 squeak_display_entry=display_message
@@ -1146,7 +1229,7 @@ class SqueakAdminServerHandler(object):
             stopped,
         )
         for squeak_display in squeak_display_stream:
-            display_message = optional_squeak_entry_to_message(
+            display_message = self.get_squeak_display_message(
                 squeak_display)
             yield squeak_admin_pb2.GetSqueakDisplayReply(
                 squeak_display_entry=display_message
@@ -1212,7 +1295,10 @@ class SqueakAdminServerHandler(object):
         logger.info("Got number of twitter accounts: {}".format(
             len(twitter_accounts)))
         twitter_account_msgs = [
-            twitter_account_to_message(twitter_account)
+            twitter_account_to_message(
+                twitter_account,
+                load_profile_image=self.get_profile_image,
+            )
             for twitter_account in twitter_accounts
         ]
         return squeak_admin_pb2.GetTwitterAccountsReply(
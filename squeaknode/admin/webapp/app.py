@@ -29,6 +29,7 @@ from flask import Flask
 from flask import redirect
 from flask import render_template
 from flask import request
+from flask import Response
 from flask import url_for
 from flask_cors import CORS
 from flask_login import current_user
@@ -40,6 +41,7 @@ from werkzeug.serving import make_server
 
 from proto import lnd_pb2
 from proto import squeak_admin_pb2
+from squeaknode.admin.profile_image_util import get_image_mimetype
 from squeaknode.admin.webapp.forms import LoginForm
 from squeaknode.admin.webapp.user import User
 
@@ -229,6 +231,24 @@ def create_app(handler, username, password):
     def clearsqueakprofileimage(msg):
         return handler.handle_clear_squeak_profile_image(msg)
 
+    @app.route("/profileimage/<image_hash>")
+    @login_required
+    def profileimage(image_hash):
+        try:
+            profile_image = handler.handle_get_profile_image(image_hash)
+        except ValueError:
+            return "Bad request", 400
+        if profile_image is None:
+            return "Not found", 404
+        # The url changes with the image, so it can be cached forever.
+        return Response(
+            profile_image,
+            mimetype=get_image_mimetype(profile_image),
+            headers={
+                'Cache-Control': 'private, max-age=31536000, immutable',
+            },
+        )
+
     @app.route("/getpeers", methods=["POST"])
     @login_required
     @protobuf_serialized(squeak_admin_pb2.GetPeersRequest())
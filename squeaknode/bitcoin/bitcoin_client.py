@@ -22,6 +22,8 @@
 import logging
 from abc import ABC
 from abc import abstractmethod
+from typing import Dict
+from typing import List
 
 from squeaknode.bitcoin.block_info import BlockInfo
 
@@ -54,3 +56,18 @@ class BitcoinClient(ABC):
         Raises:
             BitcoinRequestError: If the request fails.
         """
+
+    @abstractmethod
+    def get_block_infos_by_heights(self, block_heights: List[int]) -> Dict[int, BlockInfo]:
+        """Get block info for the Bitcoin blocks at the given heights.
+
+        Args:
+            block_heights: The heights of the blocks.
+
+        Returns:
+            Dict[int, BlockInfo]: the block info for each height. Heights
+        that do not have a block are not included.
+
+        Raises:
+            BitcoinRequestError: If the request fails.
+        """
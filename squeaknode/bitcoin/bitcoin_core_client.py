@@ -22,17 +22,31 @@
 import json
 import logging
 import os
+import threading
+import time
+from typing import Dict
+from typing import List
 
 import requests
 from bitcoin.core import CBlockHeader
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from squeaknode.bitcoin.bitcoin_client import BitcoinClient
 from squeaknode.bitcoin.block_info import BlockInfo
 from squeaknode.bitcoin.exception import BitcoinRequestError
+from squeaknode.bitcoin.rpc_method_stats import RpcMethodStats
 
 logger = logging.getLogger(__name__)
 
 
+DEFAULT_POOL_SIZE = 50
+DEFAULT_TIMEOUT_S = 10
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+RETRY_STATUS_CODES = (502, 503, 504)
+
+
 class BitcoinCoreClient(BitcoinClient):
     """Access a bitcoin daemon using RPC."""
 
@@ -44,15 +58,38 @@ class BitcoinCoreClient(BitcoinClient):
         rpc_password: str,
         use_ssl: bool,
         ssl_cert: str,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout_s: float = DEFAULT_TIMEOUT_S,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
     ) -> None:
         protocol = "https" if use_ssl else "http"
         self.url = f"{protocol}://{rpc_user}:{rpc_password}@{host}:{port}"
         self.headers = {"content-type": "application/json"}
-        s = requests.Session()
+        self.timeout_s = timeout_s
+        self.session = requests.Session()
+        # Keep up to `pool_size` connections alive, and block instead of
+        # opening extra connections when all of them are in use.
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=pool_size,
+            pool_block=True,
+            max_retries=Retry(
+                total=max_retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=RETRY_STATUS_CODES,
+                allowed_methods=frozenset(["POST"]),
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         if ssl_cert:
             os.environ["SSL_CERT_FILE"] = ssl_cert
             os.environ["REQUESTS_CA_BUNDLE"] = ssl_cert
-            s.cert = ssl_cert
+            self.session.verify = ssl_cert
+        self.method_stats: Dict[str, RpcMethodStats] = {}
+        self.method_stats_lock = threading.Lock()
 
     def get_best_block_info(self) -> BlockInfo:
         block_height = self.get_block_count()
@@ -64,6 +101,39 @@ class BitcoinCoreClient(BitcoinClient):
         block_header = self.get_block_header(block_hash)
         return BlockInfo(block_height, block_hash, block_header)
 
+    def get_block_infos_by_heights(self, block_heights: List[int]) -> Dict[int, BlockInfo]:
+        block_heights = sorted(set(block_heights))
+        hash_responses = self.make_batch_request([
+            {
+                "method": "getblockhash",
+                "params": [block_height],
+                "jsonrpc": "2.0",
+            }
+            for block_height in block_heights
+        ])
+        block_hashes = {
+            block_height: bytes.fromhex(response["result"])
+            for block_height, response in zip(block_heights, hash_responses)
+            if response.get("error") is None
+        }
+        header_responses = self.make_batch_request([
+            {
+                "method": "getblockheader",
+                "params": [block_hash.hex(), False],
+                "jsonrpc": "2.0",
+            }
+            for block_hash in block_hashes.values()
+        ])
+        ret = {}
+        for (block_height, block_hash), response in zip(block_hashes.items(), header_responses):
+            if response.get("error") is not None:
+                continue
+            header_bytes = bytes.fromhex(response["result"])
+            block_header = CBlockHeader.deserialize(header_bytes)
+            ret[block_height] = BlockInfo(
+                block_height, block_hash, block_header)
+        return ret
+
     def get_block_count(self) -> int:
         payload = {
             "method": "getblockcount",
@@ -99,20 +169,66 @@ class BitcoinCoreClient(BitcoinClient):
         return CBlockHeader.deserialize(header_bytes)
 
     def make_request(self, payload: dict) -> dict:
+        return self.post(payload, payload.get("method", ""))
+
+    def make_batch_request(self, payloads: List[dict]) -> List[dict]:
+        """Send multiple requests in a single JSON-RPC batch.
+
+        Returns the responses in the same order as the given payloads.
+        """
+        if not payloads:
+            return []
+        payloads = [
+            dict(payload, id=i)
+            for i, payload in enumerate(payloads)
+        ]
+        methods = sorted(set(payload.get("method", "")
+                         for payload in payloads))
+        json_response = self.post(
+            payloads, "batch:{}".format(",".join(methods)))
+        responses = {
+            response["id"]: response
+            for response in json_response
+        }
+        return [
+            responses.get(payload["id"], {"error": "Missing response."})
+            for payload in payloads
+        ]
+
+    def get_method_stats(self) -> Dict[str, RpcMethodStats]:
+        """Get the number of requests, errors, and total latency for each
+        RPC method (or batch of methods).
+        """
+        with self.method_stats_lock:
+            return dict(self.method_stats)
+
+    def post(self, data, method: str):
+        start_time = time.perf_counter()
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.url,
-                data=json.dumps(payload),
+                data=json.dumps(data),
                 headers=self.headers,
+                timeout=self.timeout_s,
             )
             response.raise_for_status()
-        except requests.exceptions.HTTPError as errh:
-            raise BitcoinRequestError(errh)
-        except requests.exceptions.ConnectionError as errc:
-            raise BitcoinRequestError(errc)
-        except requests.exceptions.Timeout as errt:
-            raise BitcoinRequestError(errt)
         except requests.exceptions.RequestException as err:
+            self.record_request(method, start_time, True)
             raise BitcoinRequestError(err)
 
+        self.record_request(method, start_time, False)
         return response.json()
+
+    def record_request(self, method: str, start_time: float, is_error: bool) -> None:
+        elapsed_time_ms = int((time.perf_counter() - start_time) * 1000)
+        with self.method_stats_lock:
+            stats = self.method_stats.get(method, RpcMethodStats())
+            self.method_stats[method] = RpcMethodStats(
+                num_requests=stats.num_requests + 1,
+                num_errors=stats.num_errors + (1 if is_error else 0),
+                total_time_ms=stats.total_time_ms + elapsed_time_ms,
+            )
+        logger.debug("Bitcoin RPC {} took {} ms.".format(
+            method,
+            elapsed_time_ms,
+        ))
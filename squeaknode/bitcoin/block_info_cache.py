@@ -0,0 +1,113 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from squeaknode.bitcoin.block_info import BlockInfo
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_SIZE = 10000
+DEFAULT_MIN_DEPTH = 6
+
+
+class BlockInfoCache:
+    """LRU cache of block info by block height.
+
+    Only blocks that are buried at least `min_depth` blocks below the best
+    block are stored, so that a short reorg never invalidates an entry. The
+    cache is cleared whenever the best block changes in a way that could be
+    a deeper reorg.
+    """
+
+    def __init__(
+            self,
+            max_size: int = DEFAULT_MAX_SIZE,
+            min_depth: int = DEFAULT_MIN_DEPTH,
+    ):
+        self.max_size = max_size
+        self.min_depth = min_depth
+        self.best_block_height: Optional[int] = None
+        self.best_block_hash: Optional[bytes] = None
+        self.block_infos: OrderedDict = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, block_height: int) -> Optional[BlockInfo]:
+        with self.lock:
+            block_info = self.block_infos.get(block_height)
+            if block_info is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.block_infos.move_to_end(block_height)
+            return block_info
+
+    def put(self, block_info: BlockInfo) -> None:
+        with self.lock:
+            if not self._is_deep_enough(block_info.block_height):
+                return
+            self.block_infos[block_info.block_height] = block_info
+            self.block_infos.move_to_end(block_info.block_height)
+            while len(self.block_infos) > self.max_size:
+                self.block_infos.popitem(last=False)
+
+    def set_best_block(self, best_block_info: BlockInfo) -> None:
+        """Update the best block and check for a reorg.
+
+        The cache is cleared unless the new best block is the same as the
+        previous best block or directly extends it, because otherwise the
+        depth of a possible reorg is not known.
+        """
+        with self.lock:
+            if self.best_block_hash is not None and not self._is_same_chain(best_block_info):
+                logger.info("Best block changed from {} to {}. Clearing block cache.".format(
+                    self.best_block_hash.hex(),
+                    best_block_info.block_hash.hex(),
+                ))
+                self.block_infos.clear()
+            self.best_block_height = best_block_info.block_height
+            self.best_block_hash = best_block_info.block_hash
+
+    def clear(self) -> None:
+        with self.lock:
+            self.block_infos.clear()
+
+    def _is_same_chain(self, best_block_info: BlockInfo) -> bool:
+        if best_block_info.block_hash == self.best_block_hash:
+            return True
+        if self.best_block_hash is None or self.best_block_height is None:
+            return False
+        return (
+            best_block_info.block_height == self.best_block_height + 1
+            and best_block_info.block_header.hashPrevBlock
+            == self.best_block_hash[::-1]
+        )
+
+    def _is_deep_enough(self, block_height: int) -> bool:
+        if self.best_block_height is None:
+            return False
+        depth = self.best_block_height - block_height + 1
+        return depth >= self.min_depth
@@ -0,0 +1,177 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import logging
+import threading
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import zmq
+
+from squeaknode.bitcoin.bitcoin_client import BitcoinClient
+from squeaknode.bitcoin.block_info import BlockInfo
+from squeaknode.node.event_bus import EventBus
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_POLL_INTERVAL_S = 30
+ZMQ_POLL_TIMEOUT_MS = 1000
+DEFAULT_ZMQ_RETRY_S = 1
+DEFAULT_MAX_ZMQ_RETRY_S = 60
+HASHBLOCK_TOPIC = b"hashblock"
+
+
+class BlockTipTracker(BitcoinClient):
+    """Bitcoin client that keeps the best block in memory.
+
+    The best block is refreshed when bitcoind publishes a new block hash
+    over ZMQ, and also every `poll_interval_s` seconds in case the ZMQ
+    notifications are not available. If the ZMQ subscription fails, it is
+    opened again after `zmq_retry_s` seconds, doubling after each
+    consecutive failure up to `max_zmq_retry_s`. Listeners of
+    `new_block_listener` are called with the new block info whenever the
+    best block changes.
+    """
+
+    def __init__(
+            self,
+            bitcoin_client: BitcoinClient,
+            zmq_host: str,
+            zmq_port: Optional[int],
+            poll_interval_s: float = DEFAULT_POLL_INTERVAL_S,
+            zmq_retry_s: float = DEFAULT_ZMQ_RETRY_S,
+            max_zmq_retry_s: float = DEFAULT_MAX_ZMQ_RETRY_S,
+    ) -> None:
+        self.bitcoin_client = bitcoin_client
+        self.zmq_host = zmq_host
+        self.zmq_port = zmq_port
+        self.poll_interval_s = poll_interval_s
+        self.zmq_retry_s = zmq_retry_s
+        self.max_zmq_retry_s = max_zmq_retry_s
+        self.num_hashblocks_received = 0
+        self.best_block_info: Optional[BlockInfo] = None
+        self.lock = threading.Lock()
+        self.refresh_requested = threading.Event()
+        self.stopped = threading.Event()
+        self.new_block_listener = EventBus()
+
+    def start(self) -> None:
+        logger.info("Starting block tip tracker.")
+        threading.Thread(
+            target=self.poll_best_block,
+            name="block_tip_tracker_poll_thread",
+            daemon=True,
+        ).start()
+        if self.zmq_port:
+            threading.Thread(
+                target=self.subscribe_hashblock,
+                name="block_tip_tracker_zmq_thread",
+                daemon=True,
+            ).start()
+
+    def stop(self) -> None:
+        logger.info("Stopping block tip tracker.")
+        self.stopped.set()
+        self.refresh_requested.set()
+
+    def get_best_block_info(self) -> BlockInfo:
+        with self.lock:
+            best_block_info = self.best_block_info
+        if best_block_info is None:
+            best_block_info = self.refresh_best_block()
+        return best_block_info
+
+    def get_block_info_by_height(self, block_height: int) -> BlockInfo:
+        return self.bitcoin_client.get_block_info_by_height(block_height)
+
+    def get_block_infos_by_heights(self, block_heights: List[int]) -> Dict[int, BlockInfo]:
+        return self.bitcoin_client.get_block_infos_by_heights(block_heights)
+
+    def refresh_best_block(self) -> BlockInfo:
+        """Get the best block from the bitcoin node and notify listeners if
+        it changed.
+        """
+        block_info = self.bitcoin_client.get_best_block_info()
+        with self.lock:
+            is_new_block = (
+                self.best_block_info is None
+                or self.best_block_info.block_hash != block_info.block_hash
+            )
+            self.best_block_info = block_info
+        if is_new_block:
+            logger.info("New best block: {} at height {}".format(
+                block_info.block_hash.hex(),
+                block_info.block_height,
+            ))
+            self.new_block_listener.publish(block_info)
+        return block_info
+
+    def poll_best_block(self) -> None:
+        while not self.stopped.is_set():
+            self.refresh_requested.clear()
+            try:
+                self.refresh_best_block()
+            except Exception:
+                logger.exception("Failed to get best block.")
+            self.refresh_requested.wait(self.poll_interval_s)
+
+    def subscribe_hashblock(self) -> None:
+        address = "tcp://{}:{}".format(self.zmq_host, self.zmq_port)
+        retry_s = self.zmq_retry_s
+        while not self.stopped.is_set():
+            num_hashblocks_received = self.num_hashblocks_received
+            try:
+                self.receive_hashblocks(address)
+                continue
+            except Exception:
+                # Only back off after consecutive failures.
+                if self.num_hashblocks_received > num_hashblocks_received:
+                    retry_s = self.zmq_retry_s
+                logger.exception(
+                    "Hashblock subscription failed, retrying in {} seconds.".format(
+                        retry_s,
+                    ))
+            # Refresh in case a block was missed while not subscribed.
+            self.refresh_requested.set()
+            self.stopped.wait(retry_s)
+            retry_s = min(retry_s * 2, self.max_zmq_retry_s)
+
+    def receive_hashblocks(self, address: str) -> None:
+        """Receive hashblock notifications until the tracker is stopped."""
+        logger.info("Subscribing to hashblock at {}".format(address))
+        context = zmq.Context()
+        socket = context.socket(zmq.SUB)
+        try:
+            socket.setsockopt(zmq.SUBSCRIBE, HASHBLOCK_TOPIC)
+            socket.connect(address)
+            while not self.stopped.is_set():
+                if not socket.poll(ZMQ_POLL_TIMEOUT_MS):
+                    continue
+                topic, body, *_ = socket.recv_multipart()
+                if topic == HASHBLOCK_TOPIC:
+                    logger.debug("Got hashblock: {}".format(body.hex()))
+                    self.num_hashblocks_received += 1
+                    self.refresh_requested.set()
+        finally:
+            socket.close(linger=0)
+            context.term()
@@ -0,0 +1,82 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import logging
+from typing import Dict
+from typing import List
+
+from squeaknode.bitcoin.bitcoin_client import BitcoinClient
+from squeaknode.bitcoin.block_info import BlockInfo
+from squeaknode.bitcoin.block_info_cache import BlockInfoCache
+
+logger = logging.getLogger(__name__)
+
+
+class CachedBitcoinClient(BitcoinClient):
+    """Bitcoin client that caches block info of buried blocks."""
+
+    def __init__(
+            self,
+            bitcoin_client: BitcoinClient,
+            block_info_cache: BlockInfoCache,
+    ) -> None:
+        self.bitcoin_client = bitcoin_client
+        self.block_info_cache = block_info_cache
+
+    def get_best_block_info(self) -> BlockInfo:
+        block_info = self.bitcoin_client.get_best_block_info()
+        self.block_info_cache.set_best_block(block_info)
+        return block_info
+
+    def get_block_info_by_height(self, block_height: int) -> BlockInfo:
+        block_info = self.block_info_cache.get(block_height)
+        if block_info is not None:
+            return block_info
+        self._init_best_block()
+        block_info = self.bitcoin_client.get_block_info_by_height(
+            block_height)
+        self.block_info_cache.put(block_info)
+        return block_info
+
+    def get_block_infos_by_heights(self, block_heights: List[int]) -> Dict[int, BlockInfo]:
+        ret = {}
+        missing_block_heights = []
+        for block_height in set(block_heights):
+            block_info = self.block_info_cache.get(block_height)
+            if block_info is not None:
+                ret[block_height] = block_info
+            else:
+                missing_block_heights.append(block_height)
+        if missing_block_heights:
+            self._init_best_block()
+            block_infos = self.bitcoin_client.get_block_infos_by_heights(
+                missing_block_heights,
+            )
+            for block_height, block_info in block_infos.items():
+                self.block_info_cache.put(block_info)
+                ret[block_height] = block_info
+        return ret
+
+    def _init_best_block(self) -> None:
+        # The cache needs the best block height to know which blocks are
+        # deep enough to store.
+        if self.block_info_cache.best_block_height is None:
+            self.get_best_block_info()
@@ -0,0 +1,286 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import asyncio
+import functools
+import logging
+import time
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import TypeVar
+
+from squeak.core.keys import SqueakPublicKey
+
+from squeaknode.client.async_peer_downloader import AsyncPeerDownloader
+from squeaknode.client.async_peer_downloader import run_blocking
+from squeaknode.client.base_download_scheduler import BaseDownloadScheduler
+from squeaknode.client.in_flight_hashes import ClaimedHashes
+from squeaknode.core.download_result import DownloadResult
+
+logger = logging.getLogger(__name__)
+
+
+T = TypeVar('T')
+AsyncFetchFn = Callable[[AsyncPeerDownloader,
+                         List[bytes]], Awaitable[Set[bytes]]]
+
+
+class AsyncDownloadScheduler(BaseDownloadScheduler[AsyncPeerDownloader]):
+    """Runs the requests of `BaseDownloadScheduler` as tasks on the event
+    loop, and its database calls in the default executor.
+
+    The number of connections to each peer is limited by the aiohttp
+    session. Timeouts and cancellation are handled by cancelling the
+    task that runs the download, and a peer whose tasks take more than
+    `max_peer_time_s` in total has its running task cancelled.
+    """
+
+    async def lookup(
+            self,
+            downloaders: List[AsyncPeerDownloader],
+            lookup_fn: Callable[[AsyncPeerDownloader], Awaitable[List[bytes]]],
+    ) -> Dict[AsyncPeerDownloader, List[bytes]]:
+        """Lookup squeak hashes on each peer.
+
+        Returns the hashes advertised by each peer that answered.
+        """
+        results = await self.run_on_peers({
+            downloader: functools.partial(lookup_fn, downloader)
+            for downloader in downloaders
+        })
+        return {
+            downloader: squeak_hashes
+            for downloader, squeak_hashes in results.items()
+            if squeak_hashes is not None
+        }
+
+    async def download(
+            self,
+            advertised: Dict[AsyncPeerDownloader, List[bytes]],
+            min_block: Optional[int] = None,
+            max_block: Optional[int] = None,
+            pubkeys: Optional[List[SqueakPublicKey]] = None,
+    ) -> DownloadResult:
+        """Download the squeaks and secret keys advertised by each peer.
+
+        The squeak hashes that no peer returned are added to
+        `failed_hashes`.
+        """
+        candidates = self.get_candidates(advertised)
+        await self.download_squeaks(candidates, min_block, max_block, pubkeys)
+        await self.download_secret_keys(candidates)
+        return self.get_download_result()
+
+    async def download_squeaks(
+            self,
+            candidates: Dict[bytes, List[AsyncPeerDownloader]],
+            min_block: Optional[int],
+            max_block: Optional[int],
+            pubkeys: Optional[List[SqueakPublicKey]],
+    ) -> None:
+        claimed_hashes = await run_blocking(
+            self.claim_missing_squeaks,
+            candidates,
+        )
+        if not claimed_hashes:
+            return
+
+        async def fetch_squeaks(downloader: AsyncPeerDownloader, squeak_hashes: List[bytes]) -> Set[bytes]:
+            return await run_blocking(
+                self.save_squeaks,
+                downloader,
+                await downloader.fetch_squeaks(squeak_hashes),
+                min_block,
+                max_block,
+                pubkeys,
+            )
+
+        received_hashes: Set[bytes] = set()
+        try:
+            received_hashes = await self.fetch_from_peers(
+                self.get_claimed_candidates(candidates, claimed_hashes),
+                claimed_hashes,
+                fetch_squeaks,
+            )
+        finally:
+            self.finish_squeaks(claimed_hashes, received_hashes)
+
+    async def download_secret_keys(
+            self,
+            candidates: Dict[bytes, List[AsyncPeerDownloader]],
+    ) -> None:
+        squeaks, claimed_hashes = await run_blocking(
+            self.claim_missing_secret_keys,
+            candidates,
+        )
+        if not claimed_hashes:
+            return
+
+        async def fetch_secret_keys(downloader: AsyncPeerDownloader, squeak_hashes: List[bytes]) -> Set[bytes]:
+            received_hashes = await run_blocking(
+                self.save_secret_keys,
+                downloader,
+                squeaks,
+                await downloader.fetch_secret_keys(squeak_hashes),
+            )
+            # Download offers for the secret keys that are not free.
+            for squeak_hash in squeak_hashes:
+                if squeak_hash not in received_hashes:
+                    await downloader.fetch_offer(squeak_hash, squeaks[squeak_hash])
+            return received_hashes
+
+        try:
+            await self.fetch_from_peers(
+                self.get_claimed_candidates(candidates, claimed_hashes),
+                claimed_hashes,
+                fetch_secret_keys,
+            )
+        finally:
+            claimed_hashes.finish()
+
+    async def download_offers(
+            self,
+            downloaders: List[AsyncPeerDownloader],
+            squeak_hash: bytes,
+    ) -> DownloadResult:
+        """Download an offer for the squeak from each peer."""
+        squeak = await run_blocking(self.squeak_store.get_squeak, squeak_hash)
+        if squeak is None:
+            return self.get_download_result()
+        self.add_requested(len(downloaders))
+
+        async def fetch_offer(downloader: AsyncPeerDownloader) -> bool:
+            received = await downloader.fetch_offer(squeak_hash, squeak)
+            if received:
+                self.add_downloaded(downloader.peer.address, 1)
+            return received
+
+        await self.run_on_peers({
+            downloader: functools.partial(fetch_offer, downloader)
+            for downloader in downloaders
+        })
+        return self.get_download_result()
+
+    async def fetch_from_peers(
+            self,
+            remaining_peers: Dict[bytes, List[AsyncPeerDownloader]],
+            claimed_hashes: ClaimedHashes,
+            fetch_fn: AsyncFetchFn,
+    ) -> Set[bytes]:
+        """Fetch each hash from its remaining peers in order, until one of
+        them returns it.
+
+        Returns the hashes that were received.
+        """
+        received_hashes: Set[bytes] = set()
+        pending_hashes = list(remaining_peers)
+        while pending_hashes and not self.is_cancelled():
+            assignments = self.assign_hashes(pending_hashes, remaining_peers)
+            if not assignments:
+                break
+            results = await self.run_on_peers({
+                downloader: functools.partial(
+                    self.fetch_claimed,
+                    claimed_hashes,
+                    fetch_fn,
+                    downloader,
+                    hashes,
+                )
+                for downloader, hashes in assignments.items()
+            })
+            pending_hashes = self.get_pending_hashes(
+                assignments,
+                results,
+                received_hashes,
+            )
+        return received_hashes
+
+    async def fetch_claimed(
+            self,
+            claimed_hashes: ClaimedHashes,
+            fetch_fn: AsyncFetchFn,
+            downloader: AsyncPeerDownloader,
+            squeak_hashes: List[bytes],
+    ) -> Set[bytes]:
+        """Fetch the claimed hashes from the peer, and release them when
+        the fetch is finished.
+        """
+        if not claimed_hashes.start_fetch(squeak_hashes):
+            return set()
+        received_hashes: Set[bytes] = set()
+        try:
+            received_hashes = await fetch_fn(downloader, squeak_hashes)
+            return received_hashes
+        finally:
+            claimed_hashes.finish_fetch(squeak_hashes, received_hashes)
+
+    async def run_on_peers(
+            self,
+            tasks: Dict[AsyncPeerDownloader, Callable[[], Awaitable[T]]],
+    ) -> Dict[AsyncPeerDownloader, Optional[T]]:
+        """Run one task for each peer, concurrently.
+
+        Returns the result of each task, or None if the task failed.
+        """
+        downloaders = list(tasks)
+        results = await asyncio.gather(*(
+            self.run_task(downloader, tasks[downloader])
+            for downloader in downloaders
+        ))
+        return dict(zip(downloaders, results))
+
+    async def run_task(
+            self,
+            downloader: AsyncPeerDownloader,
+            task: Callable[[], Awaitable[T]],
+    ) -> Optional[T]:
+        peer_address = downloader.peer.address
+        if not self.start_peer_task(peer_address):
+            return None
+        remaining_time_s = self.get_remaining_time_s(peer_address)
+        start_time = time.perf_counter()
+        try:
+            return await asyncio.wait_for(task(), remaining_time_s)
+        except asyncio.CancelledError:
+            self.add_unfinished_peer(peer_address)
+            raise
+        except asyncio.TimeoutError:
+            # Request timeouts also raise TimeoutError, and are failures.
+            elapsed_time_s = time.perf_counter() - start_time
+            if remaining_time_s is not None and elapsed_time_s >= remaining_time_s:
+                logger.info("Time limit reached for peer: {}".format(
+                    peer_address,
+                ))
+                return None
+            self.add_failed_peer(peer_address)
+            return None
+        except Exception:
+            self.add_failed_peer(peer_address)
+            return None
+        finally:
+            self.add_peer_time(
+                peer_address,
+                time.perf_counter() - start_time,
+            )
@@ -0,0 +1,381 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from typing import Awaitable
+from typing import Coroutine
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import TypeVar
+
+from squeak.core.keys import SqueakPublicKey
+
+from squeaknode.client.async_download_scheduler import AsyncDownloadScheduler
+from squeaknode.client.async_peer_client import AsyncPeerClient
+from squeaknode.client.async_peer_client import AsyncPeerSessions
+from squeaknode.client.async_peer_client import DEFAULT_MAX_CONNECTIONS
+from squeaknode.client.async_peer_client import DEFAULT_MAX_CONNECTIONS_PER_PEER
+from squeaknode.client.async_peer_downloader import AsyncPeerDownloader
+from squeaknode.client.async_peer_downloader import run_blocking
+from squeaknode.client.in_flight_hashes import InFlightHashes
+from squeaknode.client.peer_filter_tracker import PeerFilterTracker
+from squeaknode.client.peer_filter_tracker import TimelineLookup
+from squeaknode.client.peer_health import PeerHealth
+from squeaknode.client.peer_health_tracker import PeerHealthTracker
+from squeaknode.client.peer_session_registry import PeerSessionRegistry
+from squeaknode.client.peer_session_stats import PeerSessionStats
+from squeaknode.client.timeline_sync import add_locked_squeaks
+from squeaknode.client.timeline_sync import get_available_downloaders
+from squeaknode.client.timeline_sync import get_peer_scores
+from squeaknode.client.timeline_sync import get_timeline_range
+from squeaknode.client.timeline_sync import record_round_health
+from squeaknode.client.timeline_sync import start_timeline_lookup
+from squeaknode.client.timeline_sync import update_sync_watermarks
+from squeaknode.core.download_result import DownloadResult
+from squeaknode.core.peer_address import PeerAddress
+from squeaknode.core.squeak_peer import SqueakPeer
+from squeaknode.node.squeak_store import SqueakStore
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_BLOCKING_WORKERS = 4
+
+T = TypeVar('T')
+
+
+class AsyncNetworkController:
+    """Same downloads as `NetworkController`, as coroutines that all run
+    on one event loop.
+
+    The requests to all peers share a few aiohttp connection pools
+    instead of using one thread for each request. The database calls run
+    in the default executor of the event loop.
+    """
+
+    def __init__(
+            self,
+            squeak_store: SqueakStore,
+            proxy_host: Optional[str],
+            proxy_port: Optional[int],
+            peer_session_registry: Optional[PeerSessionRegistry] = None,
+            max_connections_per_peer: int = DEFAULT_MAX_CONNECTIONS_PER_PEER,
+            max_connections: int = DEFAULT_MAX_CONNECTIONS,
+            download_timeout_s: Optional[float] = None,
+            peer_health_tracker: Optional[PeerHealthTracker] = None,
+            max_peer_time_s: Optional[float] = None,
+            peer_filter_tracker: Optional[PeerFilterTracker] = None,
+    ):
+        self.squeak_store = squeak_store
+        self.sessions = AsyncPeerSessions(
+            proxy_host,
+            proxy_port,
+            max_connections_per_peer=max_connections_per_peer,
+            max_connections=max_connections,
+        )
+        # Only used to keep the request stats of each peer.
+        self.peer_session_registry = peer_session_registry or PeerSessionRegistry()
+        self.download_timeout_s = download_timeout_s
+        self.peer_health_tracker = peer_health_tracker or PeerHealthTracker(
+            self.peer_session_registry,
+        )
+        self.max_peer_time_s = max_peer_time_s
+        self.peer_filter_tracker = peer_filter_tracker or PeerFilterTracker()
+        self.in_flight_squeaks = InFlightHashes()
+        self.in_flight_secret_keys = InFlightHashes()
+        self.download_tasks: Set[asyncio.Future] = set()
+
+    def get_downloader(self, peer: SqueakPeer) -> AsyncPeerDownloader:
+        return AsyncPeerDownloader(
+            peer,
+            self.squeak_store,
+            AsyncPeerClient(peer, self.sessions, self.peer_session_registry),
+            self.peer_filter_tracker,
+        )
+
+    async def get_autoconnect_downloaders(self) -> List[AsyncPeerDownloader]:
+        peers = await run_blocking(self.squeak_store.get_autoconnect_peers)
+        return [self.get_downloader(peer) for peer in peers]
+
+    def get_peer_session_stats(self) -> Dict[PeerAddress, PeerSessionStats]:
+        return self.peer_session_registry.get_stats()
+
+    def get_peer_health(self) -> Dict[PeerAddress, PeerHealth]:
+        return self.peer_health_tracker.get_all_health()
+
+    def cancel_downloads(self) -> None:
+        for task in self.download_tasks:
+            task.cancel()
+
+    async def close(self) -> None:
+        self.cancel_downloads()
+        await self.sessions.close()
+
+    def create_scheduler(self) -> AsyncDownloadScheduler:
+        return AsyncDownloadScheduler(
+            self.squeak_store,
+            self.in_flight_squeaks,
+            self.in_flight_secret_keys,
+            get_peer_scores(self.peer_health_tracker),
+            max_peer_time_s=self.max_peer_time_s,
+        )
+
+    async def run_download(
+            self,
+            scheduler: AsyncDownloadScheduler,
+            download: Awaitable[Any],
+    ) -> DownloadResult:
+        """Run a download until it finishes, times out, or is cancelled
+        with `cancel_downloads`.
+
+        Returns the result of everything downloaded before it stopped.
+        """
+        task = asyncio.ensure_future(download)
+        self.download_tasks.add(task)
+        try:
+            await asyncio.wait([task], timeout=self.download_timeout_s)
+        finally:
+            self.download_tasks.discard(task)
+            if not task.done():
+                scheduler.cancel()
+                task.cancel()
+                # Wait for the in flight hashes to be released.
+                await asyncio.wait([task])
+        if not task.cancelled() and task.exception() is not None:
+            raise task.exception()  # type: ignore
+        return scheduler.get_download_result()
+
+    async def download_timeline(
+            self,
+            interest_block_interval: int,
+    ) -> DownloadResult:
+        timeline_range = await run_blocking(
+            get_timeline_range,
+            self.squeak_store,
+            interest_block_interval,
+        )
+        downloaders = get_available_downloaders(
+            self.peer_health_tracker,
+            await self.get_autoconnect_downloaders(),
+        )
+        scheduler = self.create_scheduler()
+
+        timeline_lookups: Dict[PeerAddress, TimelineLookup] = {}
+
+        async def lookup_peer_timeline(downloader: AsyncPeerDownloader) -> List[bytes]:
+            timeline_lookup = await run_blocking(
+                start_timeline_lookup,
+                self.squeak_store,
+                self.peer_filter_tracker,
+                timeline_range,
+                downloader.peer.address,
+            )
+            timeline_lookups[downloader.peer.address] = timeline_lookup
+            return await downloader.lookup(
+                timeline_lookup.min_block,
+                timeline_range.max_block,
+                timeline_range.followed_public_keys,
+                allow_filter=timeline_lookup.allow_filter,
+            )
+
+        async def download() -> None:
+            try:
+                advertised = await scheduler.lookup(
+                    downloaders,
+                    lookup_peer_timeline,
+                )
+                # Download each advertised squeak once, from the best peer.
+                await scheduler.download(
+                    await run_blocking(
+                        add_locked_squeaks,
+                        self.squeak_store,
+                        timeline_range,
+                        advertised,
+                        timeline_lookups,
+                    ),
+                    timeline_range.min_block,
+                    timeline_range.max_block,
+                    timeline_range.followed_public_keys,
+                )
+            finally:
+                # Also runs when the download is cancelled or times out.
+                record_round_health(
+                    self.peer_health_tracker,
+                    downloaders,
+                    scheduler,
+                )
+            await run_blocking(
+                update_sync_watermarks,
+                self.squeak_store,
+                self.peer_filter_tracker,
+                timeline_range,
+                advertised,
+                timeline_lookups,
+                scheduler,
+            )
+
+        return await self.run_download(scheduler, download())
+
+    async def download_squeaks(
+            self,
+            public_keys: List[SqueakPublicKey],
+            min_block: Optional[int],
+            max_block: Optional[int],
+            reply_to_hash: Optional[bytes],
+    ) -> DownloadResult:
+        downloaders = await self.get_autoconnect_downloaders()
+        scheduler = self.create_scheduler()
+
+        async def download() -> None:
+            advertised = await scheduler.lookup(
+                downloaders,
+                lambda downloader: downloader.lookup(
+                    min_block,
+                    max_block,
+                    public_keys,
+                    reply_to_hash,
+                ),
+            )
+            await scheduler.download(
+                advertised,
+                min_block,
+                max_block,
+                public_keys,
+            )
+
+        return await self.run_download(scheduler, download())
+
+    async def download_single_squeak(self, squeak_hash: bytes) -> DownloadResult:
+        downloaders = await self.get_autoconnect_downloaders()
+        scheduler = self.create_scheduler()
+        advertised = {
+            downloader: [squeak_hash]
+            for downloader in downloaders
+        }
+        return await self.run_download(
+            scheduler,
+            scheduler.download(advertised),
+        )
+
+    async def download_offers(self, squeak_hash: bytes) -> DownloadResult:
+        downloaders = await self.get_autoconnect_downloaders()
+        scheduler = self.create_scheduler()
+        return await self.run_download(
+            scheduler,
+            scheduler.download_offers(downloaders, squeak_hash),
+        )
+
+
+class AsyncNetworkControllerFacade:
+    """Runs an `AsyncNetworkController` on an event loop in a background
+    thread, with the same blocking methods as `NetworkController`.
+
+    Calls from any number of threads all run on the same event loop.
+    """
+
+    def __init__(
+            self,
+            squeak_store: SqueakStore,
+            proxy_host: Optional[str],
+            proxy_port: Optional[int],
+            peer_session_registry: Optional[PeerSessionRegistry] = None,
+            max_connections_per_peer: int = DEFAULT_MAX_CONNECTIONS_PER_PEER,
+            max_connections: int = DEFAULT_MAX_CONNECTIONS,
+            download_timeout_s: Optional[float] = None,
+            peer_health_tracker: Optional[PeerHealthTracker] = None,
+            max_peer_time_s: Optional[float] = None,
+            blocking_workers: int = DEFAULT_BLOCKING_WORKERS,
+    ):
+        self.controller = AsyncNetworkController(
+            squeak_store,
+            proxy_host,
+            proxy_port,
+            peer_session_registry=peer_session_registry,
+            max_connections_per_peer=max_connections_per_peer,
+            max_connections=max_connections,
+            download_timeout_s=download_timeout_s,
+            peer_health_tracker=peer_health_tracker,
+            max_peer_time_s=max_peer_time_s,
+        )
+        self.loop = asyncio.new_event_loop()
+        self.loop.set_default_executor(ThreadPoolExecutor(blocking_workers))
+        self.thread = threading.Thread(
+            target=self.loop.run_forever,
+            name="network-controller-loop",
+            daemon=True,
+        )
+        self.thread.start()
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    def get_peer_session_stats(self) -> Dict[PeerAddress, PeerSessionStats]:
+        return self.controller.get_peer_session_stats()
+
+    def get_peer_health(self) -> Dict[PeerAddress, PeerHealth]:
+        return self.controller.get_peer_health()
+
+    def cancel_downloads(self) -> None:
+        self.loop.call_soon_threadsafe(self.controller.cancel_downloads)
+
+    def close(self) -> None:
+        if self.loop.is_closed():
+            return
+        self.run(self.controller.close())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+    def download_timeline(
+            self,
+            interest_block_interval: int,
+    ) -> DownloadResult:
+        return self.run(
+            self.controller.download_timeline(interest_block_interval),
+        )
+
+    def download_squeaks(
+            self,
+            public_keys: List[SqueakPublicKey],
+            min_block: Optional[int],
+            max_block: Optional[int],
+            reply_to_hash: Optional[bytes],
+    ) -> DownloadResult:
+        return self.run(
+            self.controller.download_squeaks(
+                public_keys,
+                min_block,
+                max_block,
+                reply_to_hash,
+            ),
+        )
+
+    def download_single_squeak(self, squeak_hash: bytes) -> DownloadResult:
+        return self.run(self.controller.download_single_squeak(squeak_hash))
+
+    def download_offers(self, squeak_hash: bytes) -> DownloadResult:
+        return self.run(self.controller.download_offers(squeak_hash))
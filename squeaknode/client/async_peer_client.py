@@ -0,0 +1,305 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import json
+import logging
+import time
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import aiohttp
+from aiohttp_socks import ProxyConnector
+from squeak.core import CSqueak
+from squeak.core import HASH_LENGTH
+from squeak.core.keys import SqueakPublicKey
+
+from squeaknode.client.peer_client import LOOKUP_PAGE_SIZE
+from squeaknode.client.peer_client import REQUEST_TIMEOUT_S
+from squeaknode.client.peer_session_registry import PeerSessionRegistry
+from squeaknode.core.bloom_filter import BloomFilter
+from squeaknode.core.length_prefixed import decode_records
+from squeaknode.core.offer import Offer
+from squeaknode.core.peer_address import Network
+from squeaknode.core.peer_address import PeerAddress
+from squeaknode.core.squeak_peer import SqueakPeer
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_MAX_CONNECTIONS_PER_PEER = 2
+DEFAULT_MAX_CONNECTIONS = 1000
+UNSUPPORTED_STATUS_CODES = (404, 405)
+
+Params = List[Tuple[str, str]]
+
+
+class AsyncPeerSessions:
+    """Keeps the aiohttp sessions used to connect to peers.
+
+    Clearnet peers share one session, and Tor peers share another session
+    that connects through the SOCKS proxy. Each session holds at most
+    `max_connections_per_peer` connections to each peer, and at most
+    `max_connections` connections in total.
+
+    The sessions are created on first use, so they must be used from the
+    event loop that they will run on.
+    """
+
+    def __init__(
+            self,
+            proxy_host: Optional[str],
+            proxy_port: Optional[int],
+            max_connections_per_peer: int = DEFAULT_MAX_CONNECTIONS_PER_PEER,
+            max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    ):
+        self.proxy_host = proxy_host
+        self.proxy_port = proxy_port
+        self.max_connections_per_peer = max_connections_per_peer
+        self.max_connections = max_connections
+        self.sessions: Dict[bool, aiohttp.ClientSession] = {}
+
+    def get_session(self, peer_address: PeerAddress) -> aiohttp.ClientSession:
+        use_proxy = peer_address.network == Network.TORV3 and \
+            self.proxy_host is not None and \
+            self.proxy_port is not None
+        session = self.sessions.get(use_proxy)
+        if session is None:
+            session = self._create_session(use_proxy)
+            self.sessions[use_proxy] = session
+        return session
+
+    async def close(self) -> None:
+        for session in self.sessions.values():
+            await session.close()
+        self.sessions.clear()
+
+    def _create_session(self, use_proxy: bool) -> aiohttp.ClientSession:
+        connector: aiohttp.TCPConnector
+        if use_proxy:
+            # Resolve the onion host names on the proxy.
+            connector = ProxyConnector.from_url(
+                f'socks5://{self.proxy_host}:{self.proxy_port}',
+                rdns=True,
+                limit=self.max_connections,
+                limit_per_host=self.max_connections_per_peer,
+            )
+        else:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_connections_per_peer,
+            )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_S),
+        )
+
+
+class AsyncPeerClient:
+    """Same requests as `PeerClient`, made with aiohttp on an event loop."""
+
+    def __init__(
+            self,
+            peer: SqueakPeer,
+            sessions: AsyncPeerSessions,
+            session_registry: PeerSessionRegistry,
+    ):
+        self.peer = peer
+        self.sessions = sessions
+        self.session_registry = session_registry
+        self.base_url = f"http://{peer.address.host}:{peer.address.port}"
+
+    async def lookup(
+            self,
+            min_block: Optional[int],
+            max_block: Optional[int],
+            pubkeys: List[SqueakPublicKey],
+            reply_to_hash: Optional[bytes] = None,
+    ) -> List[bytes]:
+        """Get the hashes of the squeaks in the range, requesting them
+        one page at a time.
+        """
+        url = f"{self.base_url}/lookup"
+        params = get_lookup_params(
+            min_block, max_block, pubkeys, reply_to_hash)
+        ret: List[bytes] = []
+        cursor = None
+        while True:
+            page_params = params + [('limit', str(LOOKUP_PAGE_SIZE))]
+            if cursor:
+                page_params.append(('cursor', cursor))
+            status, body = await self.request(
+                "GET", url, raise_for_status=True, params=page_params)
+            if status in UNSUPPORTED_STATUS_CODES:
+                raise aiohttp.ClientError("Lookup not supported by peer.")
+            page = json.loads(body)
+            # Peers without pagination return all of the hashes in a list.
+            if isinstance(page, list):
+                ret.extend(bytes.fromhex(h) for h in page)
+                return ret
+            ret.extend(bytes.fromhex(h) for h in page['hashes'])
+            cursor = page['next']
+            if not cursor:
+                return ret
+
+    async def lookup_missing(
+            self,
+            min_block: Optional[int],
+            max_block: Optional[int],
+            pubkeys: List[SqueakPublicKey],
+            known_filter: BloomFilter,
+            reply_to_hash: Optional[bytes] = None,
+    ) -> Optional[List[bytes]]:
+        """Get the hashes of the squeaks in the range that are not in the
+        filter of already known hashes.
+
+        Returns None if the peer does not support filtered lookups.
+        """
+        url = f"{self.base_url}/lookup"
+        status, body = await self.request(
+            "POST",
+            url,
+            raise_for_status=True,
+            params=get_lookup_params(
+                min_block, max_block, pubkeys, reply_to_hash),
+            data=known_filter.serialize(),
+            headers={'Content-Type': 'application/octet-stream'},
+        )
+        if status in UNSUPPORTED_STATUS_CODES:
+            return None
+        return [bytes.fromhex(h) for h in json.loads(body)]
+
+    async def get_squeak(self, squeak_hash: bytes) -> Optional[CSqueak]:
+        url = f"{self.base_url}/squeak/{squeak_hash.hex()}"
+        status, body = await self.request("GET", url)
+        if status != 200:
+            return None
+        return CSqueak.deserialize(body)
+
+    async def get_squeaks(self, squeak_hashes: List[bytes]) -> Optional[List[CSqueak]]:
+        """Download multiple squeaks in one request.
+
+        Returns None if the peer does not support batch requests.
+        """
+        url = f"{self.base_url}/squeaks"
+        status, body = await self.request(
+            "POST",
+            url,
+            json=[squeak_hash.hex() for squeak_hash in squeak_hashes],
+        )
+        if status in UNSUPPORTED_STATUS_CODES:
+            return None
+        if status != 200:
+            return []
+        return [
+            CSqueak.deserialize(squeak_bytes)
+            for squeak_bytes in decode_records([body])
+        ]
+
+    async def get_secret_key(self, squeak_hash: bytes) -> Optional[bytes]:
+        url = f"{self.base_url}/secretkey/{squeak_hash.hex()}"
+        status, body = await self.request("GET", url)
+        if status != 200:
+            return None
+        return body
+
+    async def get_secret_keys(self, squeak_hashes: List[bytes]) -> Optional[Dict[bytes, bytes]]:
+        """Download the secret keys of multiple squeaks in one request.
+
+        Returns None if the peer does not support batch requests.
+        """
+        url = f"{self.base_url}/secretkeys"
+        status, body = await self.request(
+            "POST",
+            url,
+            json=[squeak_hash.hex() for squeak_hash in squeak_hashes],
+        )
+        if status in UNSUPPORTED_STATUS_CODES:
+            return None
+        if status != 200:
+            return {}
+        return {
+            record[:HASH_LENGTH]: record[HASH_LENGTH:]
+            for record in decode_records([body])
+        }
+
+    async def get_offer(self, squeak_hash: bytes) -> Optional[Offer]:
+        url = f"{self.base_url}/offer/{squeak_hash.hex()}"
+        status, body = await self.request("GET", url)
+        if status != 200:
+            return None
+        offer_json = json.loads(body)
+        return Offer(
+            squeak_hash=bytes.fromhex(offer_json['squeak_hash']),
+            nonce=bytes.fromhex(offer_json['nonce']),
+            payment_request=offer_json['payment_request'],
+            host=offer_json['host'],
+            port=int(offer_json['port']),
+        )
+
+    async def request(
+            self,
+            method: str,
+            url: str,
+            raise_for_status: bool = False,
+            **kwargs,
+    ) -> Tuple[int, bytes]:
+        """Make a request to the peer and read the whole response body.
+
+        If `raise_for_status` is set, error statuses raise an exception,
+        except for the statuses of unsupported requests.
+        """
+        session = self.sessions.get_session(self.peer.address)
+        start_time = time.perf_counter()
+        is_error = True
+        try:
+            async with session.request(method, url, **kwargs) as r:
+                is_error = r.status >= 500
+                if raise_for_status and r.status not in UNSUPPORTED_STATUS_CODES:
+                    r.raise_for_status()
+                return r.status, await r.read()
+        finally:
+            elapsed_time_ms = int((time.perf_counter() - start_time) * 1000)
+            self.session_registry.record_request(
+                self.peer.address,
+                elapsed_time_ms,
+                is_error,
+            )
+
+
+def get_lookup_params(
+        min_block: Optional[int],
+        max_block: Optional[int],
+        pubkeys: List[SqueakPublicKey],
+        reply_to_hash: Optional[bytes],
+) -> Params:
+    params = [
+        ('pubkeys', pubkey.to_bytes().hex())
+        for pubkey in pubkeys
+    ]
+    if min_block is not None:
+        params.append(('minblock', str(min_block)))
+    if max_block is not None:
+        params.append(('maxblock', str(max_block)))
+    if reply_to_hash is not None:
+        params.append(('replyto', reply_to_hash.hex()))
+    return params
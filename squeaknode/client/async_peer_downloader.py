@@ -0,0 +1,185 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import asyncio
+import functools
+import logging
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import TypeVar
+
+from squeak.core import CSqueak
+from squeak.core.keys import SqueakPublicKey
+
+from squeaknode.client.async_peer_client import AsyncPeerClient
+from squeaknode.client.base_peer_downloader import BasePeerDownloader
+from squeaknode.client.base_peer_downloader import BATCH_SIZE
+from squeaknode.client.peer_filter_tracker import PeerFilterTracker
+from squeaknode.core.bloom_filter import BloomFilter
+from squeaknode.core.squeak_peer import SqueakPeer
+from squeaknode.core.squeaks import get_hash
+from squeaknode.db.squeak_db import chunks
+from squeaknode.node.squeak_store import SqueakStore
+
+logger = logging.getLogger(__name__)
+
+
+T = TypeVar('T')
+
+
+async def run_blocking(fn: Callable[..., T], *args) -> T:
+    """Run a blocking call, such as a database query, in the default
+    executor of the event loop.
+    """
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(None, functools.partial(fn, *args))
+
+
+class AsyncPeerDownloader(BasePeerDownloader):
+    """Downloads squeaks, secret keys and offers from a single peer, on an
+    event loop.
+    """
+
+    def __init__(
+            self,
+            peer: SqueakPeer,
+            squeak_store: SqueakStore,
+            client: AsyncPeerClient,
+            filter_tracker: PeerFilterTracker,
+    ):
+        super().__init__(peer, squeak_store, filter_tracker)
+        self.client = client
+
+    async def lookup(
+            self,
+            min_block: Optional[int],
+            max_block: Optional[int],
+            pubkeys: List[SqueakPublicKey],
+            reply_to_hash: Optional[bytes] = None,
+            allow_filter: bool = True,
+    ) -> List[bytes]:
+        """Lookup the squeaks in the range on the peer.
+
+        If some squeaks in the range are already owned with their secret
+        keys, a filter of their hashes is sent so that the peer only
+        returns the hashes that are likely to be missing. A lookup with
+        `allow_filter` set to False is always sent without a filter.
+        """
+        self.used_filter = False
+        if self.use_filter(pubkeys, reply_to_hash, allow_filter):
+            known_hashes = await run_blocking(
+                self.squeak_store.lookup_secret_keys,
+                pubkeys,
+                min_block,
+                max_block,
+                reply_to_hash,
+            )
+            if known_hashes:
+                missing_hashes = await self.client.lookup_missing(
+                    min_block,
+                    max_block,
+                    pubkeys,
+                    BloomFilter.for_items(known_hashes),
+                    reply_to_hash,
+                )
+                self.filter_tracker.record_filter_result(
+                    self.peer.address,
+                    missing_hashes is not None,
+                )
+                if missing_hashes is not None:
+                    self.used_filter = True
+                    return missing_hashes
+        return await self.client.lookup(
+            min_block,
+            max_block,
+            pubkeys,
+            reply_to_hash,
+        )
+
+    async def fetch_squeaks(self, squeak_hashes: List[bytes]) -> List[CSqueak]:
+        """Fetch squeaks from the peer, with batch requests if the peer
+        supports them.
+        """
+        ret: List[CSqueak] = []
+        requested_hashes = set(squeak_hashes)
+        for hashes_chunk in chunks(squeak_hashes, BATCH_SIZE):
+            squeaks = None
+            if self.client.session_registry.is_batch_supported(self.peer.address):
+                squeaks = await self.client.get_squeaks(hashes_chunk)
+            if squeaks is None:
+                self.client.session_registry.record_batch_unsupported(
+                    self.peer.address)
+                squeaks = []
+                for squeak_hash in hashes_chunk:
+                    squeak = await self.client.get_squeak(squeak_hash)
+                    if squeak is not None:
+                        squeaks.append(squeak)
+            ret.extend(
+                squeak for squeak in squeaks
+                if get_hash(squeak) in requested_hashes
+            )
+        return ret
+
+    async def fetch_secret_keys(self, squeak_hashes: List[bytes]) -> Dict[bytes, bytes]:
+        """Fetch secret keys from the peer, with batch requests if the peer
+        supports them.
+        """
+        ret = {}
+        for hashes_chunk in chunks(squeak_hashes, BATCH_SIZE):
+            secret_keys = None
+            if self.client.session_registry.is_batch_supported(self.peer.address):
+                secret_keys = await self.client.get_secret_keys(hashes_chunk)
+            if secret_keys is None:
+                self.client.session_registry.record_batch_unsupported(
+                    self.peer.address)
+                secret_keys = {}
+                for squeak_hash in hashes_chunk:
+                    secret_key = await self.client.get_secret_key(squeak_hash)
+                    if secret_key:
+                        secret_keys[squeak_hash] = secret_key
+            ret.update(secret_keys)
+        return ret
+
+    async def fetch_offer(self, squeak_hash: bytes, squeak: CSqueak) -> bool:
+        """Fetch an offer for the squeak from the peer.
+
+        Returns True if a new offer was received.
+        """
+        received_offers = await run_blocking(
+            self.squeak_store.get_received_offers,
+            squeak_hash,
+        )
+        for received_offer in received_offers:
+            if received_offer.peer_address == self.peer.address:
+                return False
+
+        offer = await self.client.get_offer(squeak_hash)
+        if not offer:
+            return False
+        await run_blocking(
+            self.squeak_store.handle_offer,
+            squeak,
+            offer,
+            self.peer.address,
+        )
+        return True
@@ -0,0 +1,329 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import logging
+import threading
+import time
+from collections import defaultdict
+from typing import Dict
+from typing import Generic
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import TypeVar
+
+from squeak.core import CSqueak
+from squeak.core.keys import SqueakPublicKey
+
+from squeaknode.client.base_peer_downloader import BasePeerDownloader
+from squeaknode.client.base_peer_downloader import is_valid_squeak
+from squeaknode.client.in_flight_hashes import ClaimedHashes
+from squeaknode.client.in_flight_hashes import InFlightHashes
+from squeaknode.core.download_result import DownloadResult
+from squeaknode.core.peer_address import PeerAddress
+from squeaknode.core.squeaks import get_hash
+from squeaknode.node.squeak_store import SqueakStore
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_PEER_SCORE = 1.0
+
+D = TypeVar('D', bound=BasePeerDownloader)
+
+
+class BaseDownloadScheduler(Generic[D]):
+    """Downloads the squeaks, secret keys and offers advertised by a set
+    of peers.
+
+    Each missing squeak and secret key is requested from one peer at a
+    time, starting with the peer with the highest score. If that peer
+    does not return it, the next peer that advertised it is tried.
+    Hashes that are already being downloaded by another scheduler are
+    skipped. No new tasks are started for a peer after one of its tasks
+    failed, or after its tasks took more than `max_peer_time_s` in total,
+    or after the scheduler is cancelled or `timeout_s` has passed since
+    it was created.
+
+    Subclasses only run the requests to the peers. The methods of this
+    class may block on the database.
+    """
+
+    def __init__(
+            self,
+            squeak_store: SqueakStore,
+            in_flight_squeaks: InFlightHashes,
+            in_flight_secret_keys: InFlightHashes,
+            peer_scores: Dict[PeerAddress, float],
+            timeout_s: Optional[float] = None,
+            max_peer_time_s: Optional[float] = None,
+    ):
+        self.squeak_store = squeak_store
+        self.in_flight_squeaks = in_flight_squeaks
+        self.in_flight_secret_keys = in_flight_secret_keys
+        self.peer_scores = peer_scores
+        self.max_peer_time_s = max_peer_time_s
+        self.start_time = time.perf_counter()
+        self.deadline = self.start_time + timeout_s if timeout_s is not None else None
+        self.cancelled = threading.Event()
+        self.lock = threading.Lock()
+        self.contacted_peers: Set[PeerAddress] = set()
+        self.failed_hashes: Set[bytes] = set()
+        self.failed_peers: Set[PeerAddress] = set()
+        self.unfinished_peers: Set[PeerAddress] = set()
+        self.peer_time_s: Dict[PeerAddress, float] = defaultdict(float)
+        self.peer_num_downloaded: Dict[PeerAddress, int] = defaultdict(int)
+        self.num_requested = 0
+        self.num_downloaded = 0
+
+    def cancel(self) -> None:
+        self.cancelled.set()
+
+    def is_cancelled(self) -> bool:
+        if self.cancelled.is_set():
+            return True
+        return self.deadline is not None and time.perf_counter() >= self.deadline
+
+    def get_download_result(self) -> DownloadResult:
+        """Get the totals of everything downloaded by the scheduler so far."""
+        with self.lock:
+            return DownloadResult(
+                number_downloaded=self.num_downloaded,
+                number_requested=self.num_requested,
+                elapsed_time_ms=int(
+                    (time.perf_counter() - self.start_time) * 1000),
+                number_peers=len(self.contacted_peers),
+            )
+
+    def add_requested(self, num_requested: int) -> None:
+        with self.lock:
+            self.num_requested += num_requested
+
+    def add_downloaded(self, peer_address: PeerAddress, num_downloaded: int) -> None:
+        with self.lock:
+            self.num_downloaded += num_downloaded
+            self.peer_num_downloaded[peer_address] += num_downloaded
+
+    def get_candidates(
+            self,
+            advertised: Dict[D, List[bytes]],
+    ) -> Dict[bytes, List[D]]:
+        """Get the peers that advertised each hash."""
+        candidates: Dict[bytes, List[D]] = defaultdict(list)
+        for downloader, squeak_hashes in advertised.items():
+            for squeak_hash in squeak_hashes:
+                candidates[squeak_hash].append(downloader)
+        return candidates
+
+    def claim_missing_squeaks(self, candidates: Dict[bytes, List[D]]) -> ClaimedHashes:
+        """Claim the hashes of the squeaks that are not owned yet."""
+        existing_hashes = set(
+            self.squeak_store.get_existing_squeak_hashes(list(candidates)),
+        )
+        missing_hashes = [
+            squeak_hash for squeak_hash in candidates
+            if squeak_hash not in existing_hashes
+        ]
+        claimed_hashes = ClaimedHashes(
+            self.in_flight_squeaks,
+            self.in_flight_squeaks.claim(missing_hashes),
+        )
+        self.add_requested(len(claimed_hashes))
+        return claimed_hashes
+
+    def finish_squeaks(
+            self,
+            claimed_hashes: ClaimedHashes,
+            received_hashes: Set[bytes],
+    ) -> None:
+        """Release the claimed squeak hashes that are not being fetched, and
+        add the ones that were not received to `failed_hashes`.
+        """
+        with self.lock:
+            self.failed_hashes.update(
+                squeak_hash for squeak_hash in claimed_hashes.hashes
+                if squeak_hash not in received_hashes
+            )
+        claimed_hashes.finish()
+
+    def save_squeaks(
+            self,
+            downloader: D,
+            squeaks: List[CSqueak],
+            min_block: Optional[int],
+            max_block: Optional[int],
+            pubkeys: Optional[List[SqueakPublicKey]],
+    ) -> Set[bytes]:
+        """Save the squeaks received from the peer that are in the range.
+
+        Returns the hashes of all the received squeaks.
+        """
+        valid_squeaks = [
+            squeak for squeak in squeaks
+            if is_valid_squeak(squeak, min_block, max_block, pubkeys)
+        ]
+        if valid_squeaks:
+            saved_hashes = self.squeak_store.save_squeaks(valid_squeaks)
+            self.add_downloaded(downloader.peer.address, len(saved_hashes))
+        # Invalid squeaks are not requested again from other peers.
+        return {get_hash(squeak) for squeak in squeaks}
+
+    def claim_missing_secret_keys(
+            self,
+            candidates: Dict[bytes, List[D]],
+    ) -> Tuple[Dict[bytes, CSqueak], ClaimedHashes]:
+        """Claim the hashes of the owned squeaks without a secret key.
+
+        Returns the owned squeaks and the claimed hashes.
+        """
+        squeaks = self.squeak_store.get_squeaks(list(candidates))
+        secret_keys = self.squeak_store.get_squeak_secret_keys(list(squeaks))
+        missing_hashes = [
+            squeak_hash for squeak_hash in squeaks
+            if squeak_hash not in secret_keys
+        ]
+        claimed_hashes = ClaimedHashes(
+            self.in_flight_secret_keys,
+            self.in_flight_secret_keys.claim(missing_hashes),
+        )
+        self.add_requested(len(claimed_hashes))
+        return squeaks, claimed_hashes
+
+    def save_secret_keys(
+            self,
+            downloader: D,
+            squeaks: Dict[bytes, CSqueak],
+            secret_keys: Dict[bytes, bytes],
+    ) -> Set[bytes]:
+        """Save the secret keys received from the peer.
+
+        Returns the hashes of the saved secret keys.
+        """
+        received_hashes = set()
+        for squeak_hash, secret_key in secret_keys.items():
+            if squeak_hash not in squeaks:
+                continue
+            try:
+                self.squeak_store.save_secret_key(squeak_hash, secret_key)
+            except Exception:
+                logger.exception("Failed to save secret key from peer: {}".format(
+                    downloader.peer.address,
+                ))
+                continue
+            received_hashes.add(squeak_hash)
+            self.add_downloaded(downloader.peer.address, 1)
+        return received_hashes
+
+    def get_claimed_candidates(
+            self,
+            candidates: Dict[bytes, List[D]],
+            claimed_hashes: ClaimedHashes,
+    ) -> Dict[bytes, List[D]]:
+        """Get the peers that advertised each claimed hash, in order of
+        score.
+        """
+        return {
+            squeak_hash: sorted(
+                candidates[squeak_hash],
+                key=self.get_score,
+                reverse=True,
+            )
+            for squeak_hash in claimed_hashes.hashes
+        }
+
+    def assign_hashes(
+            self,
+            pending_hashes: List[bytes],
+            remaining_peers: Dict[bytes, List[D]],
+    ) -> Dict[D, List[bytes]]:
+        """Assign each pending hash to the next peer that advertised it."""
+        assignments: Dict[D, List[bytes]] = defaultdict(list)
+        for h in pending_hashes:
+            if remaining_peers[h]:
+                assignments[remaining_peers[h].pop(0)].append(h)
+        return assignments
+
+    def get_pending_hashes(
+            self,
+            assignments: Dict[D, List[bytes]],
+            results: Dict[D, Optional[Set[bytes]]],
+            received_hashes: Set[bytes],
+    ) -> List[bytes]:
+        """Add the fetched hashes to `received_hashes`, and get the
+        assigned hashes that were not fetched.
+        """
+        pending_hashes: List[bytes] = []
+        for downloader, hashes in assignments.items():
+            fetched_hashes = results[downloader] or set()
+            received_hashes.update(fetched_hashes)
+            pending_hashes.extend(
+                h for h in hashes
+                if h not in fetched_hashes
+            )
+        return pending_hashes
+
+    def start_peer_task(self, peer_address: PeerAddress) -> bool:
+        """Check if a new task can be started for the peer, and count the
+        peer as contacted if so.
+        """
+        if self.is_cancelled():
+            return False
+        with self.lock:
+            if peer_address in self.failed_peers:
+                return False
+            if self.max_peer_time_s is not None and \
+                    self.peer_time_s[peer_address] >= self.max_peer_time_s:
+                return False
+            self.contacted_peers.add(peer_address)
+            return True
+
+    def add_failed_peer(self, peer_address: PeerAddress) -> None:
+        logger.exception("Failed to download from peer: {}".format(
+            peer_address,
+        ))
+        with self.lock:
+            self.failed_peers.add(peer_address)
+
+    def add_unfinished_peer(self, peer_address: PeerAddress) -> None:
+        with self.lock:
+            self.unfinished_peers.add(peer_address)
+
+    def is_peer_failed(self, peer_address: PeerAddress) -> bool:
+        """Check if a task of the peer failed, or was still running when
+        the scheduler was cancelled or timed out.
+        """
+        with self.lock:
+            return peer_address in self.failed_peers or \
+                peer_address in self.unfinished_peers
+
+    def add_peer_time(self, peer_address: PeerAddress, elapsed_time_s: float) -> None:
+        with self.lock:
+            self.peer_time_s[peer_address] += elapsed_time_s
+
+    def get_remaining_time_s(self, peer_address: PeerAddress) -> Optional[float]:
+        if self.max_peer_time_s is None:
+            return None
+        with self.lock:
+            return self.max_peer_time_s - self.peer_time_s[peer_address]
+
+    def get_score(self, downloader: D) -> float:
+        return self.peer_scores.get(downloader.peer.address, DEFAULT_PEER_SCORE)
@@ -0,0 +1,78 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from typing import List
+from typing import Optional
+
+from squeak.core import CSqueak
+from squeak.core.keys import SqueakPublicKey
+
+from squeaknode.client.peer_filter_tracker import PeerFilterTracker
+from squeaknode.core.squeak_peer import SqueakPeer
+from squeaknode.node.squeak_store import SqueakStore
+
+
+BATCH_SIZE = 100
+
+
+class BasePeerDownloader:
+    """State shared by the blocking and the async downloaders of a
+    single peer.
+    """
+
+    def __init__(
+            self,
+            peer: SqueakPeer,
+            squeak_store: SqueakStore,
+            filter_tracker: PeerFilterTracker,
+    ):
+        self.peer = peer
+        self.squeak_store = squeak_store
+        self.filter_tracker = filter_tracker
+        # Set by each lookup, if the peer answered with a filter.
+        self.used_filter = False
+
+    def use_filter(
+            self,
+            pubkeys: List[SqueakPublicKey],
+            reply_to_hash: Optional[bytes],
+            allow_filter: bool,
+    ) -> bool:
+        """Check if the lookup should send a filter of the owned squeaks."""
+        if not allow_filter or not (pubkeys or reply_to_hash):
+            return False
+        return self.filter_tracker.is_filter_supported(self.peer.address)
+
+
+def is_valid_squeak(
+        squeak: CSqueak,
+        min_block: Optional[int] = None,
+        max_block: Optional[int] = None,
+        pubkeys: Optional[List[SqueakPublicKey]] = None,
+) -> bool:
+    """Check if a downloaded squeak is in the requested range."""
+    if min_block and squeak.nBlockHeight < min_block:
+        return False
+    if max_block and squeak.nBlockHeight > max_block:
+        return False
+    if pubkeys and squeak.GetPubKey() not in pubkeys:
+        return False
+    return True
@@ -0,0 +1,312 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import TypeVar
+
+from squeak.core.keys import SqueakPublicKey
+
+from squeaknode.client.base_download_scheduler import BaseDownloadScheduler
+from squeaknode.client.in_flight_hashes import ClaimedHashes
+from squeaknode.client.in_flight_hashes import InFlightHashes
+from squeaknode.client.peer_concurrency_limiter import PeerConcurrencyLimiter
+from squeaknode.client.peer_downloader import PeerDownloader
+from squeaknode.core.download_result import DownloadResult
+from squeaknode.core.peer_address import PeerAddress
+from squeaknode.node.squeak_store import SqueakStore
+
+
+T = TypeVar('T')
+FetchFn = Callable[[PeerDownloader, List[bytes]], Set[bytes]]
+
+
+class DownloadScheduler(BaseDownloadScheduler[PeerDownloader]):
+    """Runs the requests of `BaseDownloadScheduler` in the thread pool
+    shared by the schedulers of the network controller.
+
+    The number of concurrent tasks for each peer is limited by the shared
+    `peer_limiter`. The scheduler stops waiting for running tasks when it
+    is cancelled or when `timeout_s` has passed since it was created.
+    """
+
+    def __init__(
+            self,
+            squeak_store: SqueakStore,
+            in_flight_squeaks: InFlightHashes,
+            in_flight_secret_keys: InFlightHashes,
+            peer_scores: Dict[PeerAddress, float],
+            executor: ThreadPoolExecutor,
+            peer_limiter: Optional[PeerConcurrencyLimiter] = None,
+            timeout_s: Optional[float] = None,
+            max_peer_time_s: Optional[float] = None,
+    ):
+        super().__init__(
+            squeak_store,
+            in_flight_squeaks,
+            in_flight_secret_keys,
+            peer_scores,
+            timeout_s=timeout_s,
+            max_peer_time_s=max_peer_time_s,
+        )
+        self.executor = executor
+        self.peer_limiter = peer_limiter or PeerConcurrencyLimiter()
+
+    def lookup(
+            self,
+            downloaders: List[PeerDownloader],
+            lookup_fn: Callable[[PeerDownloader], List[bytes]],
+    ) -> Dict[PeerDownloader, List[bytes]]:
+        """Lookup squeak hashes on each peer.
+
+        Returns the hashes advertised by each peer that answered.
+        """
+        results = self.run_on_peers({
+            downloader: functools.partial(lookup_fn, downloader)
+            for downloader in downloaders
+        })
+        return {
+            downloader: squeak_hashes
+            for downloader, squeak_hashes in results.items()
+            if squeak_hashes is not None
+        }
+
+    def download(
+            self,
+            advertised: Dict[PeerDownloader, List[bytes]],
+            min_block: Optional[int] = None,
+            max_block: Optional[int] = None,
+            pubkeys: Optional[List[SqueakPublicKey]] = None,
+    ) -> DownloadResult:
+        """Download the squeaks and secret keys advertised by each peer.
+
+        The squeak hashes that no peer returned are added to
+        `failed_hashes`.
+        """
+        candidates = self.get_candidates(advertised)
+        self.download_squeaks(candidates, min_block, max_block, pubkeys)
+        self.download_secret_keys(candidates)
+        return self.get_download_result()
+
+    def download_squeaks(
+            self,
+            candidates: Dict[bytes, List[PeerDownloader]],
+            min_block: Optional[int],
+            max_block: Optional[int],
+            pubkeys: Optional[List[SqueakPublicKey]],
+    ) -> None:
+        claimed_hashes = self.claim_missing_squeaks(candidates)
+        if not claimed_hashes:
+            return
+
+        def fetch_squeaks(downloader: PeerDownloader, squeak_hashes: List[bytes]) -> Set[bytes]:
+            return self.save_squeaks(
+                downloader,
+                downloader.fetch_squeaks(squeak_hashes),
+                min_block,
+                max_block,
+                pubkeys,
+            )
+
+        received_hashes: Set[bytes] = set()
+        try:
+            received_hashes = self.fetch_from_peers(
+                self.get_claimed_candidates(candidates, claimed_hashes),
+                claimed_hashes,
+                fetch_squeaks,
+            )
+        finally:
+            self.finish_squeaks(claimed_hashes, received_hashes)
+
+    def download_secret_keys(
+            self,
+            candidates: Dict[bytes, List[PeerDownloader]],
+    ) -> None:
+        squeaks, claimed_hashes = self.claim_missing_secret_keys(candidates)
+        if not claimed_hashes:
+            return
+
+        def fetch_secret_keys(downloader: PeerDownloader, squeak_hashes: List[bytes]) -> Set[bytes]:
+            received_hashes = self.save_secret_keys(
+                downloader,
+                squeaks,
+                downloader.fetch_secret_keys(squeak_hashes),
+            )
+            # Download offers for the secret keys that are not free.
+            for squeak_hash in squeak_hashes:
+                if squeak_hash not in received_hashes:
+                    downloader.fetch_offer(squeak_hash, squeaks[squeak_hash])
+            return received_hashes
+
+        try:
+            self.fetch_from_peers(
+                self.get_claimed_candidates(candidates, claimed_hashes),
+                claimed_hashes,
+                fetch_secret_keys,
+            )
+        finally:
+            claimed_hashes.finish()
+
+    def download_offers(
+            self,
+            downloaders: List[PeerDownloader],
+            squeak_hash: bytes,
+    ) -> DownloadResult:
+        """Download an offer for the squeak from each peer."""
+        squeak = self.squeak_store.get_squeak(squeak_hash)
+        if squeak is None:
+            return self.get_download_result()
+        self.add_requested(len(downloaders))
+
+        def fetch_offer(downloader: PeerDownloader) -> bool:
+            received = downloader.fetch_offer(squeak_hash, squeak)
+            if received:
+                self.add_downloaded(downloader.peer.address, 1)
+            return received
+
+        self.run_on_peers({
+            downloader: functools.partial(fetch_offer, downloader)
+            for downloader in downloaders
+        })
+        return self.get_download_result()
+
+    def fetch_from_peers(
+            self,
+            remaining_peers: Dict[bytes, List[PeerDownloader]],
+            claimed_hashes: ClaimedHashes,
+            fetch_fn: FetchFn,
+    ) -> Set[bytes]:
+        """Fetch each hash from its remaining peers in order, until one of
+        them returns it.
+
+        Returns the hashes that were received.
+        """
+        received_hashes: Set[bytes] = set()
+        pending_hashes = list(remaining_peers)
+        while pending_hashes and not self.is_cancelled():
+            assignments = self.assign_hashes(pending_hashes, remaining_peers)
+            if not assignments:
+                break
+            results = self.run_on_peers({
+                downloader: functools.partial(
+                    self.fetch_claimed,
+                    claimed_hashes,
+                    fetch_fn,
+                    downloader,
+                    hashes,
+                )
+                for downloader, hashes in assignments.items()
+            })
+            pending_hashes = self.get_pending_hashes(
+                assignments,
+                results,
+                received_hashes,
+            )
+        return received_hashes
+
+    def fetch_claimed(
+            self,
+            claimed_hashes: ClaimedHashes,
+            fetch_fn: FetchFn,
+            downloader: PeerDownloader,
+            squeak_hashes: List[bytes],
+    ) -> Set[bytes]:
+        """Fetch the claimed hashes from the peer, and release them when
+        the fetch is finished.
+        """
+        if not claimed_hashes.start_fetch(squeak_hashes):
+            return set()
+        received_hashes: Set[bytes] = set()
+        try:
+            received_hashes = fetch_fn(downloader, squeak_hashes)
+            return received_hashes
+        finally:
+            claimed_hashes.finish_fetch(squeak_hashes, received_hashes)
+
+    def run_on_peers(
+            self,
+            tasks: Dict[PeerDownloader, Callable[[], T]],
+    ) -> Dict[PeerDownloader, Optional[T]]:
+        """Run one task for each peer, in parallel.
+
+        Returns the result of each task, or None if the task failed, or
+        did not finish before the scheduler was cancelled or timed out.
+        The peers of the tasks that were still running are added to
+        `unfinished_peers`.
+        """
+        results: Dict[PeerDownloader, Optional[T]] = {
+            downloader: None for downloader in tasks
+        }
+        if self.is_cancelled():
+            return results
+        futures = {
+            self.executor.submit(self.run_task, downloader, task): downloader
+            for downloader, task in tasks.items()
+        }
+        try:
+            pending = set(futures)
+            while pending and not self.is_cancelled():
+                done, pending = wait(
+                    pending,
+                    timeout=self.get_wait_timeout_s(),
+                )
+                for future in done:
+                    results[futures[future]] = future.result()
+        finally:
+            # Do not wait for the tasks that are still running.
+            for future, downloader in futures.items():
+                if not future.cancel() and not future.done():
+                    self.add_unfinished_peer(downloader.peer.address)
+        return results
+
+    def run_task(self, downloader: PeerDownloader, task: Callable[[], T]) -> Optional[T]:
+        peer_address = downloader.peer.address
+        with self.peer_limiter.limit(peer_address):
+            if not self.start_peer_task(peer_address):
+                return None
+            start_time = time.perf_counter()
+            try:
+                return task()
+            except Exception:
+                self.add_failed_peer(peer_address)
+                return None
+            finally:
+                self.add_peer_time(
+                    peer_address,
+                    time.perf_counter() - start_time,
+                )
+
+    def get_wait_timeout_s(self) -> float:
+        # Wake up periodically to check for cancellation.
+        wait_timeout_s = 1.0
+        if self.deadline is not None:
+            wait_timeout_s = min(
+                wait_timeout_s,
+                max(0.0, self.deadline - time.perf_counter()),
+            )
+        return wait_timeout_s
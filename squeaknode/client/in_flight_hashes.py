@@ -0,0 +1,110 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import threading
+from typing import Iterable
+from typing import List
+from typing import Set
+
+
+class InFlightHashes:
+    """Keeps track of the hashes that are currently being downloaded, so
+    that concurrent downloads do not fetch the same item twice.
+    """
+
+    def __init__(self):
+        self.hashes: Set[bytes] = set()
+        self.lock = threading.Lock()
+
+    def claim(self, hashes: Iterable[bytes]) -> List[bytes]:
+        """Mark the hashes as in flight.
+
+        Returns the hashes that were not already in flight.
+        """
+        with self.lock:
+            claimed = []
+            for h in hashes:
+                if h not in self.hashes:
+                    self.hashes.add(h)
+                    claimed.append(h)
+            return claimed
+
+    def release(self, hashes: Iterable[bytes]) -> None:
+        with self.lock:
+            self.hashes.difference_update(hashes)
+
+    def __len__(self) -> int:
+        with self.lock:
+            return len(self.hashes)
+
+
+class ClaimedHashes:
+    """The in flight hashes claimed by one download.
+
+    A hash is released when it is received, or when the download is
+    finished and no task is fetching it. A task that is still running
+    when the download finishes releases its hashes when it returns, so
+    that another download does not fetch them at the same time.
+    """
+
+    def __init__(self, in_flight_hashes: InFlightHashes, hashes: List[bytes]):
+        self.in_flight_hashes = in_flight_hashes
+        self.hashes = hashes
+        self.unreleased = set(hashes)
+        self.fetching: Set[bytes] = set()
+        self.finished = False
+        self.lock = threading.Lock()
+
+    def start_fetch(self, hashes: List[bytes]) -> bool:
+        """Mark the hashes as being fetched by a task.
+
+        Returns False if the download is already finished.
+        """
+        with self.lock:
+            if self.finished:
+                return False
+            self.fetching.update(hashes)
+            return True
+
+    def finish_fetch(self, hashes: List[bytes], received_hashes: Set[bytes]) -> None:
+        with self.lock:
+            self.fetching.difference_update(hashes)
+            self._release([
+                h for h in hashes
+                if self.finished or h in received_hashes
+            ])
+
+    def finish(self) -> None:
+        """Release the hashes that no task is fetching."""
+        with self.lock:
+            self.finished = True
+            self._release([
+                h for h in self.unreleased
+                if h not in self.fetching
+            ])
+
+    def _release(self, hashes: List[bytes]) -> None:
+        released_hashes = [h for h in hashes if h in self.unreleased]
+        self.unreleased.difference_update(released_hashes)
+        self.in_flight_hashes.release(released_hashes)
+
+    def __len__(self) -> int:
+        return len(self.hashes)
@@ -20,18 +20,42 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 import logging
+import threading
 from concurrent.futures import ThreadPoolExecutor
-from concurrent.futures import wait
+from contextlib import contextmanager
+from typing import Dict
+from typing import List
 from typing import Optional
+from typing import Set
 
+from squeak.core.keys import SqueakPublicKey
+
+from squeaknode.client.download_scheduler import DownloadScheduler
+from squeaknode.client.in_flight_hashes import InFlightHashes
+from squeaknode.client.peer_concurrency_limiter import PeerConcurrencyLimiter
 from squeaknode.client.peer_downloader import PeerDownloader
+from squeaknode.client.peer_filter_tracker import PeerFilterTracker
+from squeaknode.client.peer_filter_tracker import TimelineLookup
+from squeaknode.client.peer_health import PeerHealth
+from squeaknode.client.peer_health_tracker import PeerHealthTracker
+from squeaknode.client.peer_session_registry import PeerSessionRegistry
+from squeaknode.client.peer_session_stats import PeerSessionStats
+from squeaknode.client.timeline_sync import add_locked_squeaks
+from squeaknode.client.timeline_sync import get_available_downloaders
+from squeaknode.client.timeline_sync import get_peer_scores
+from squeaknode.client.timeline_sync import get_timeline_range
+from squeaknode.client.timeline_sync import record_round_health
+from squeaknode.client.timeline_sync import start_timeline_lookup
+from squeaknode.client.timeline_sync import update_sync_watermarks
+from squeaknode.core.download_result import DownloadResult
+from squeaknode.core.peer_address import PeerAddress
 from squeaknode.core.squeak_peer import SqueakPeer
 from squeaknode.node.squeak_store import SqueakStore
 
 logger = logging.getLogger(__name__)
 
 
-DOWNLOAD_TIMEOUT_S = 10
+DEFAULT_MAX_WORKERS = 50
 
 
 class NetworkController:
@@ -41,10 +65,30 @@ class NetworkController:
             squeak_store: SqueakStore,
             proxy_host: Optional[str],
             proxy_port: Optional[int],
+            peer_session_registry: Optional[PeerSessionRegistry] = None,
+            peer_limiter: Optional[PeerConcurrencyLimiter] = None,
+            download_timeout_s: Optional[float] = None,
+            peer_health_tracker: Optional[PeerHealthTracker] = None,
+            max_peer_time_s: Optional[float] = None,
+            peer_filter_tracker: Optional[PeerFilterTracker] = None,
+            max_workers: int = DEFAULT_MAX_WORKERS,
     ):
         self.squeak_store = squeak_store
         self.proxy_host = proxy_host
         self.proxy_port = proxy_port
+        self.peer_session_registry = peer_session_registry or PeerSessionRegistry()
+        self.peer_limiter = peer_limiter or PeerConcurrencyLimiter()
+        self.download_timeout_s = download_timeout_s
+        self.peer_health_tracker = peer_health_tracker or PeerHealthTracker(
+            self.peer_session_registry,
+        )
+        self.max_peer_time_s = max_peer_time_s
+        self.peer_filter_tracker = peer_filter_tracker or PeerFilterTracker()
+        self.executor = ThreadPoolExecutor(max_workers)
+        self.in_flight_squeaks = InFlightHashes()
+        self.in_flight_secret_keys = InFlightHashes()
+        self.active_schedulers: Set[DownloadScheduler] = set()
+        self.lock = threading.Lock()
 
     def get_downloader(self, peer: SqueakPeer):
         return PeerDownloader(
@@ -52,47 +96,157 @@ class NetworkController:
             self.squeak_store,
             self.proxy_host,
             self.proxy_port,
+            self.peer_session_registry,
+            self.peer_filter_tracker,
         )
 
+    def get_autoconnect_downloaders(self) -> List[PeerDownloader]:
+        return [
+            self.get_downloader(peer)
+            for peer in self.squeak_store.get_autoconnect_peers()
+        ]
+
+    def get_peer_session_stats(self) -> Dict[PeerAddress, PeerSessionStats]:
+        return self.peer_session_registry.get_stats()
+
+    def get_peer_health(self) -> Dict[PeerAddress, PeerHealth]:
+        return self.peer_health_tracker.get_all_health()
+
+    def cancel_downloads(self) -> None:
+        with self.lock:
+            for scheduler in self.active_schedulers:
+                scheduler.cancel()
+
+    def close(self) -> None:
+        self.cancel_downloads()
+        # Do not wait for the tasks of the cancelled downloads.
+        self.executor.shutdown(wait=False)
+        self.peer_session_registry.close()
+
+    @contextmanager
+    def download_scheduler(self):
+        """Create a scheduler that can be cancelled with
+        `cancel_downloads` while it is running.
+        """
+        scheduler = DownloadScheduler(
+            self.squeak_store,
+            self.in_flight_squeaks,
+            self.in_flight_secret_keys,
+            get_peer_scores(self.peer_health_tracker),
+            self.executor,
+            peer_limiter=self.peer_limiter,
+            timeout_s=self.download_timeout_s,
+            max_peer_time_s=self.max_peer_time_s,
+        )
+        with self.lock:
+            self.active_schedulers.add(scheduler)
+        try:
+            yield scheduler
+        finally:
+            with self.lock:
+                self.active_schedulers.discard(scheduler)
+
     def download_timeline(
             self,
             interest_block_interval: int,
-    ) -> None:
-        max_block = self.squeak_store.get_latest_block()
-        min_block = max(0, max_block - interest_block_interval)
-        followed_public_keys = self.squeak_store.get_followed_public_keys()
-        peers = self.squeak_store.get_autoconnect_peers()
-        downloaders = [
-            self.get_downloader(peer)
-            for peer in peers
-        ]
-        with ThreadPoolExecutor(50) as executor:
-            # submit tasks and collect futures
-            futures = [
-                executor.submit(
-                    downloader.download_interest_range,
-                    min_block,
-                    max_block,
-                    followed_public_keys,
+    ) -> DownloadResult:
+        timeline_range = get_timeline_range(
+            self.squeak_store,
+            interest_block_interval,
+        )
+        downloaders = get_available_downloaders(
+            self.peer_health_tracker,
+            self.get_autoconnect_downloaders(),
+        )
+
+        timeline_lookups: Dict[PeerAddress, TimelineLookup] = {}
+
+        def lookup_peer_timeline(downloader: PeerDownloader) -> List[bytes]:
+            timeline_lookup = start_timeline_lookup(
+                self.squeak_store,
+                self.peer_filter_tracker,
+                timeline_range,
+                downloader.peer.address,
+            )
+            timeline_lookups[downloader.peer.address] = timeline_lookup
+            return downloader.lookup(
+                timeline_lookup.min_block,
+                timeline_range.max_block,
+                timeline_range.followed_public_keys,
+                allow_filter=timeline_lookup.allow_filter,
+            )
+
+        with self.download_scheduler() as scheduler:
+            try:
+                advertised = scheduler.lookup(
+                    downloaders,
+                    lookup_peer_timeline,
                 )
-                for downloader in downloaders
-            ]
-            # wait for all tasks to complete
-            wait(futures)
-
-    def download_single_squeak(self, squeak_hash: bytes) -> None:
-        peers = self.squeak_store.get_autoconnect_peers()
-        downloaders = [
-            self.get_downloader(peer)
-            for peer in peers
-        ]
-        with ThreadPoolExecutor(50) as executor:
-            # submit tasks and collect futures
-            futures = [
-                executor.submit(
-                    downloader.download_single_squeak,
-                    squeak_hash
+                # Download each advertised squeak once, from the best peer.
+                download_result = scheduler.download(
+                    add_locked_squeaks(
+                        self.squeak_store,
+                        timeline_range,
+                        advertised,
+                        timeline_lookups,
+                    ),
+                    timeline_range.min_block,
+                    timeline_range.max_block,
+                    timeline_range.followed_public_keys,
                 )
-                for downloader in downloaders]
-            # wait for all tasks to complete
-            wait(futures)
+            finally:
+                record_round_health(
+                    self.peer_health_tracker,
+                    downloaders,
+                    scheduler,
+                )
+            if scheduler.is_cancelled():
+                return download_result
+
+        update_sync_watermarks(
+            self.squeak_store,
+            self.peer_filter_tracker,
+            timeline_range,
+            advertised,
+            timeline_lookups,
+            scheduler,
+        )
+        return download_result
+
+    def download_squeaks(
+            self,
+            public_keys: List[SqueakPublicKey],
+            min_block: Optional[int],
+            max_block: Optional[int],
+            reply_to_hash: Optional[bytes],
+    ) -> DownloadResult:
+        downloaders = self.get_autoconnect_downloaders()
+        with self.download_scheduler() as scheduler:
+            advertised = scheduler.lookup(
+                downloaders,
+                lambda downloader: downloader.lookup(
+                    min_block,
+                    max_block,
+                    public_keys,
+                    reply_to_hash,
+                ),
+            )
+            return scheduler.download(
+                advertised,
+                min_block,
+                max_block,
+                public_keys,
+            )
+
+    def download_single_squeak(self, squeak_hash: bytes) -> DownloadResult:
+        advertised = {
+            downloader: [squeak_hash]
+            for downloader in self.get_autoconnect_downloaders()
+        }
+        with self.download_scheduler() as scheduler:
+            return scheduler.download(advertised)
+
+    def download_offers(self, squeak_hash: bytes) -> DownloadResult:
+        downloaders = self.get_autoconnect_downloaders()
+        with self.download_scheduler() as scheduler:
+            return scheduler.download_offers(downloaders, squeak_hash)
@@ -20,13 +20,20 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 import logging
+import time
+from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
 
 import requests
 from squeak.core import CSqueak
+from squeak.core import HASH_LENGTH
 from squeak.core.keys import SqueakPublicKey
 
+from squeaknode.client.peer_session_registry import PeerSessionRegistry
+from squeaknode.core.bloom_filter import BloomFilter
+from squeaknode.core.length_prefixed import decode_records
 from squeaknode.core.offer import Offer
 from squeaknode.core.peer_address import Network
 from squeaknode.core.squeak_peer import SqueakPeer
@@ -35,6 +42,12 @@ logger = logging.getLogger(__name__)
 
 
 REQUEST_TIMEOUT_S = 10
+LOOKUP_PAGE_SIZE = 1000
+BATCH_CHUNK_SIZE = 1024 * 64
+UNSUPPORTED_STATUS_CODES = (
+    requests.codes.not_found,
+    requests.codes.method_not_allowed,
+)
 
 
 class PeerClient:
@@ -44,10 +57,12 @@ class PeerClient:
             peer: SqueakPeer,
             proxy_host: Optional[str],
             proxy_port: Optional[int],
+            session_registry: PeerSessionRegistry,
     ):
         self.peer = peer
         self.proxy_host = proxy_host
         self.proxy_port = proxy_port
+        self.session_registry = session_registry
         self.base_url = f"http://{peer.address.host}:{peer.address.port}"
         self.proxies = {}
         if peer.address.network == Network.TORV3 and \
@@ -61,53 +76,142 @@ class PeerClient:
 
     def lookup(
             self,
-            min_block: int,
-            max_block: int,
+            min_block: Optional[int],
+            max_block: Optional[int],
             pubkeys: List[SqueakPublicKey],
-    ) -> List[bytes]:
+            reply_to_hash: Optional[bytes] = None,
+    ) -> Iterator[bytes]:
+        """Yield the hashes of the squeaks in the range, requesting them
+        one page at a time.
+        """
         pubkeys_str = [
             pubkey.to_bytes().hex()
             for pubkey in pubkeys
         ]
+        url = f"{self.base_url}/lookup"
+        cursor = None
+        while True:
+            payload = {
+                'minblock': min_block,
+                'maxblock': max_block,
+                'pubkeys': pubkeys_str,
+                'replyto': reply_to_hash.hex() if reply_to_hash else None,
+                'limit': LOOKUP_PAGE_SIZE,
+            }
+            if cursor:
+                payload['cursor'] = cursor
+            r = self.get(
+                url,
+                params=payload,
+            )
+            page = r.json()
+            # Peers without pagination return all of the hashes in a list.
+            if isinstance(page, list):
+                for squeak_hash_str in page:
+                    yield bytes.fromhex(squeak_hash_str)
+                return
+            for squeak_hash_str in page['hashes']:
+                yield bytes.fromhex(squeak_hash_str)
+            cursor = page['next']
+            if not cursor:
+                return
+
+    def lookup_missing(
+            self,
+            min_block: Optional[int],
+            max_block: Optional[int],
+            pubkeys: List[SqueakPublicKey],
+            known_filter: BloomFilter,
+            reply_to_hash: Optional[bytes] = None,
+    ) -> Optional[List[bytes]]:
+        """Get the hashes of the squeaks in the range that are not in the
+        filter of already known hashes.
+
+        Returns None if the peer does not support filtered lookups.
+        """
         payload = {
             'minblock': min_block,
             'maxblock': max_block,
-            'pubkeys': pubkeys_str,
+            'pubkeys': [
+                pubkey.to_bytes().hex()
+                for pubkey in pubkeys
+            ],
+            'replyto': reply_to_hash.hex() if reply_to_hash else None,
         }
         url = f"{self.base_url}/lookup"
-        r = requests.get(  # type: ignore
+        r = self.post(
             url,
-            params=payload,  # type: ignore
-            proxies=self.proxies,
-            timeout=REQUEST_TIMEOUT_S,
+            params=payload,
+            data=known_filter.serialize(),
+            headers={'Content-Type': 'application/octet-stream'},
         )
-        squeak_hashes_str = r.json()
+        if r.status_code in UNSUPPORTED_STATUS_CODES:
+            return None
+        r.raise_for_status()
         return [
             bytes.fromhex(squeak_hash_str)
-            for squeak_hash_str in squeak_hashes_str
+            for squeak_hash_str in r.json()
         ]
 
     def get_squeak(self, squeak_hash: bytes) -> Optional[CSqueak]:
         squeak_hash_str = squeak_hash.hex()
         url = f"{self.base_url}/squeak/{squeak_hash_str}"
-        r = requests.get(
-            url,
-            proxies=self.proxies,
-            timeout=REQUEST_TIMEOUT_S,
-        )
+        r = self.get(url)
         if r.status_code != requests.codes.ok:
             return None
         squeak_bytes = r.content
         return CSqueak.deserialize(squeak_bytes)
 
+    def get_squeaks(self, squeak_hashes: List[bytes]) -> Optional[List[CSqueak]]:
+        """Download multiple squeaks in one request.
+
+        Returns None if the peer does not support batch requests.
+        """
+        url = f"{self.base_url}/squeaks"
+        r = self.post(
+            url,
+            json=[squeak_hash.hex() for squeak_hash in squeak_hashes],
+            stream=True,
+        )
+        with r:
+            if r.status_code in UNSUPPORTED_STATUS_CODES:
+                return None
+            if r.status_code != requests.codes.ok:
+                return []
+            return [
+                CSqueak.deserialize(squeak_bytes)
+                for squeak_bytes in decode_records(
+                    r.iter_content(chunk_size=BATCH_CHUNK_SIZE),
+                )
+            ]
+
+    def get_secret_keys(self, squeak_hashes: List[bytes]) -> Optional[Dict[bytes, bytes]]:
+        """Download the secret keys of multiple squeaks in one request.
+
+        Returns None if the peer does not support batch requests.
+        """
+        url = f"{self.base_url}/secretkeys"
+        r = self.post(
+            url,
+            json=[squeak_hash.hex() for squeak_hash in squeak_hashes],
+            stream=True,
+        )
+        with r:
+            if r.status_code in UNSUPPORTED_STATUS_CODES:
+                return None
+            if r.status_code != requests.codes.ok:
+                return {}
+            return {
+                record[:HASH_LENGTH]: record[HASH_LENGTH:]
+                for record in decode_records(
+                    r.iter_content(chunk_size=BATCH_CHUNK_SIZE),
+                )
+            }
+
     def get_secret_key(self, squeak_hash: bytes) -> Optional[bytes]:
         squeak_hash_str = squeak_hash.hex()
         url = f"{self.base_url}/secretkey/{squeak_hash_str}"
-        r = requests.get(
-            url,
-            proxies=self.proxies,
-            timeout=REQUEST_TIMEOUT_S,
-        )
+        r = self.get(url)
         if r.status_code != requests.codes.ok:
             return None
         secret_key = r.content
@@ -116,11 +220,7 @@ class PeerClient:
     def get_offer(self, squeak_hash: bytes) -> Optional[Offer]:
         squeak_hash_str = squeak_hash.hex()
         url = f"{self.base_url}/offer/{squeak_hash_str}"
-        r = requests.get(
-            url,
-            proxies=self.proxies,
-            timeout=REQUEST_TIMEOUT_S,
-        )
+        r = self.get(url)
         if r.status_code != requests.codes.ok:
             return None
         offer_json = r.json()
@@ -132,3 +232,33 @@ class PeerClient:
             port=int(offer_json['port']),
         )
         return offer
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        session = self.session_registry.get_session(
+            self.peer.address,
+            self.proxies,
+        )
+        start_time = time.perf_counter()
+        is_error = True
+        try:
+            r = session.request(  # type: ignore
+                method,
+                url,
+                timeout=REQUEST_TIMEOUT_S,
+                **kwargs,
+            )
+            is_error = r.status_code >= 500
+            return r
+        finally:
+            elapsed_time_ms = int((time.perf_counter() - start_time) * 1000)
+            self.session_registry.record_request(
+                self.peer.address,
+                elapsed_time_ms,
+                is_error,
+            )
@@ -0,0 +1,55 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import threading
+from contextlib import contextmanager
+from typing import Dict
+
+from squeaknode.core.peer_address import PeerAddress
+
+
+DEFAULT_MAX_REQUESTS_PER_PEER = 2
+
+
+class PeerConcurrencyLimiter:
+    """Limits the number of concurrent download tasks for each peer,
+    across all of the downloads that are running.
+    """
+
+    def __init__(self, max_requests_per_peer: int = DEFAULT_MAX_REQUESTS_PER_PEER):
+        self.max_requests_per_peer = max_requests_per_peer
+        self.semaphores: Dict[PeerAddress, threading.BoundedSemaphore] = {}
+        self.lock = threading.Lock()
+
+    def get_semaphore(self, peer_address: PeerAddress) -> threading.BoundedSemaphore:
+        with self.lock:
+            semaphore = self.semaphores.get(peer_address)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(
+                    self.max_requests_per_peer,
+                )
+                self.semaphores[peer_address] = semaphore
+            return semaphore
+
+    @contextmanager
+    def limit(self, peer_address: PeerAddress):
+        with self.get_semaphore(peer_address):
+            yield
@@ -20,24 +20,29 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 import logging
-from abc import ABC
+from typing import Dict
 from typing import List
 from typing import Optional
 
+from squeak.core import CSqueak
 from squeak.core.keys import SqueakPublicKey
 
+from squeaknode.client.base_peer_downloader import BasePeerDownloader
+from squeaknode.client.base_peer_downloader import BATCH_SIZE
 from squeaknode.client.peer_client import PeerClient
+from squeaknode.client.peer_filter_tracker import PeerFilterTracker
+from squeaknode.client.peer_session_registry import PeerSessionRegistry
+from squeaknode.core.bloom_filter import BloomFilter
 from squeaknode.core.squeak_peer import SqueakPeer
 from squeaknode.core.squeaks import get_hash
+from squeaknode.db.squeak_db import chunks
 from squeaknode.node.squeak_store import SqueakStore
 
 logger = logging.getLogger(__name__)
 
 
-DOWNLOAD_TIMEOUT_S = 10
-
-
-class PeerDownloader(ABC):
+class PeerDownloader(BasePeerDownloader):
+    """Downloads squeaks, secret keys and offers from a single peer."""
 
     def __init__(
             self,
@@ -45,95 +50,127 @@ class PeerDownloader(ABC):
             squeak_store: SqueakStore,
             proxy_host: Optional[str],
             proxy_port: Optional[int],
+            session_registry: PeerSessionRegistry,
+            filter_tracker: PeerFilterTracker,
     ):
-        self.peer = peer
+        super().__init__(peer, squeak_store, filter_tracker)
         self.proxy_host = proxy_host
         self.proxy_port = proxy_port
-        self.client = PeerClient(peer, proxy_host, proxy_port)
-        self.squeak_store = squeak_store
+        self.client = PeerClient(
+            peer,
+            proxy_host,
+            proxy_port,
+            session_registry,
+        )
 
-    def download_interest_range(
+    def lookup(
             self,
-            min_block: int,
-            max_block: int,
+            min_block: Optional[int],
+            max_block: Optional[int],
             pubkeys: List[SqueakPublicKey],
-    ) -> None:
-        squeak_hashes = self.client.lookup(
+            reply_to_hash: Optional[bytes] = None,
+            allow_filter: bool = True,
+    ) -> List[bytes]:
+        """Lookup the squeaks in the range on the peer.
+
+        All of the pages of the lookup are read before this returns,
+        because the scheduler needs every hash advertised by each peer to
+        pick one peer for each hash. If some squeaks in the range are already owned with their secret
+        keys, a filter of their hashes is sent so that the peer only
+        returns the hashes that are likely to be missing. A lookup with
+        `allow_filter` set to False is always sent without a filter.
+        """
+        self.used_filter = False
+        if self.use_filter(pubkeys, reply_to_hash, allow_filter):
+            known_hashes = self.squeak_store.lookup_secret_keys(
+                pubkeys,
+                min_block,
+                max_block,
+                reply_to_hash,
+            )
+            if known_hashes:
+                missing_hashes = self.client.lookup_missing(
+                    min_block,
+                    max_block,
+                    pubkeys,
+                    BloomFilter.for_items(known_hashes),
+                    reply_to_hash,
+                )
+                self.filter_tracker.record_filter_result(
+                    self.peer.address,
+                    missing_hashes is not None,
+                )
+                if missing_hashes is not None:
+                    self.used_filter = True
+                    return missing_hashes
+        return list(self.client.lookup(
             min_block,
             max_block,
             pubkeys,
-        )
-        for squeak_hash in squeak_hashes:
-            self.download_squeak(
-                squeak_hash,
-                min_block,
-                max_block,
-                pubkeys,
+            reply_to_hash,
+        ))
+
+    def fetch_squeaks(self, squeak_hashes: List[bytes]) -> List[CSqueak]:
+        """Fetch squeaks from the peer, with batch requests if the peer
+        supports them.
+        """
+        ret: List[CSqueak] = []
+        requested_hashes = set(squeak_hashes)
+        for hashes_chunk in chunks(squeak_hashes, BATCH_SIZE):
+            squeaks = None
+            if self.client.session_registry.is_batch_supported(self.peer.address):
+                squeaks = self.client.get_squeaks(hashes_chunk)
+            if squeaks is None:
+                self.client.session_registry.record_batch_unsupported(
+                    self.peer.address)
+                squeaks = [
+                    squeak for squeak in
+                    (self.client.get_squeak(squeak_hash)
+                     for squeak_hash in hashes_chunk)
+                    if squeak is not None
+                ]
+            ret.extend(
+                squeak for squeak in squeaks
+                if get_hash(squeak) in requested_hashes
             )
-        for squeak_hash in squeak_hashes:
-            self.download_secret_key(squeak_hash)
-
-    def download_single_squeak(
-            self,
-            squeak_hash: bytes,
-    ) -> None:
-        self.download_squeak(squeak_hash)
-        self.download_secret_key(squeak_hash)
-
-    def download_squeak(
-            self,
-            squeak_hash: bytes,
-            min_block: Optional[int] = None,
-            max_block: Optional[int] = None,
-            pubkeys: Optional[List[SqueakPublicKey]] = None,
-    ) -> None:
-        # Download the squeak if not already owned.
-        if self.squeak_store.get_squeak(squeak_hash):
-            return
-
-        # Download the squeak if not already owned.
-        squeak = self.client.get_squeak(squeak_hash)
-
-        # Check if the squeak is valid.
-        if not squeak:
-            return
-        if get_hash(squeak) != squeak_hash:
-            return
-        if min_block and squeak.nBlockHeight < min_block:
-            return
-        if max_block and squeak.nBlockHeight > max_block:
-            return
-        if pubkeys and squeak.GetPubKey() not in pubkeys:
-            return
-
-        # Save the squeak.
-        self.squeak_store.save_squeak(squeak)
-
-    def download_secret_key(self, squeak_hash: bytes) -> None:
-        squeak = self.squeak_store.get_squeak(squeak_hash)
-
-        # Check if squeak is already owned.
-        if not squeak:
-            return
-
-        if self.squeak_store.get_squeak_secret_key(squeak_hash):
-            return
-
-        # Download the secret key if not already owned.
-        secret_key = self.client.get_secret_key(squeak_hash)
-        if secret_key:
-            self.squeak_store.save_secret_key(squeak_hash, secret_key)
-            return
-
+        return ret
+
+    def fetch_secret_keys(self, squeak_hashes: List[bytes]) -> Dict[bytes, bytes]:
+        """Fetch secret keys from the peer, with batch requests if the peer
+        supports them.
+        """
+        ret = {}
+        for hashes_chunk in chunks(squeak_hashes, BATCH_SIZE):
+            secret_keys = None
+            if self.client.session_registry.is_batch_supported(self.peer.address):
+                secret_keys = self.client.get_secret_keys(hashes_chunk)
+            if secret_keys is None:
+                self.client.session_registry.record_batch_unsupported(
+                    self.peer.address)
+                secret_keys = {}
+                for squeak_hash in hashes_chunk:
+                    secret_key = self.client.get_secret_key(squeak_hash)
+                    if secret_key:
+                        secret_keys[squeak_hash] = secret_key
+            ret.update(secret_keys)
+        return ret
+
+    def fetch_offer(self, squeak_hash: bytes, squeak: CSqueak) -> bool:
+        """Fetch an offer for the squeak from the peer.
+
+        Returns True if a new offer was received.
+        """
         for received_offer in self.squeak_store.get_received_offers(squeak_hash):
             if received_offer.peer_address == self.peer.address:
-                return
+                return False
 
         # Download the offer if secret key not already owned.
         offer = self.client.get_offer(squeak_hash)
-        if offer:
-            self.squeak_store.handle_offer(
-                squeak,
-                offer,
-                self.peer.address,
-            )
+        if not offer:
+            return False
+        self.squeak_store.handle_offer(
+            squeak,
+            offer,
+            self.peer.address,
+        )
+        return True
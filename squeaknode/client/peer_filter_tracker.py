@@ -0,0 +1,159 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import logging
+import threading
+import time
+from typing import Dict
+from typing import NamedTuple
+from typing import Optional
+
+from squeaknode.core.peer_address import PeerAddress
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_FULL_LOOKUP_INTERVAL = 10
+DEFAULT_BASE_BACKOFF_S = 60
+DEFAULT_MAX_BACKOFF_S = 3600
+
+
+class PeerFilterStats(NamedTuple):
+    """Class for keeping track of the filtered lookups of a peer."""
+    num_timeline_lookups: int = 0
+    consecutive_failures: int = 0
+    backoff_until_s: float = 0.0
+    unverified_min_block: Optional[int] = None
+
+
+class TimelineLookup(NamedTuple):
+    """Class for representing a timeline lookup sent to a peer."""
+    min_block: int
+    allow_filter: bool
+
+
+class PeerFilterTracker:
+    """Decides when the lookups sent to each peer include a filter of the
+    owned squeaks.
+
+    A filter can hide a missing squeak with a false positive, so every
+    `full_lookup_interval` timeline lookups of a peer are sent without a
+    filter. The blocks synced by filtered lookups since the last full
+    lookup are unverified, and the full lookup starts from the first of
+    them instead of from the sync watermark. A peer that does not answer
+    a filtered lookup is sent lookups without a filter for
+    `base_backoff_s` seconds, doubling after each consecutive failure up
+    to `max_backoff_s`.
+    """
+
+    def __init__(
+            self,
+            full_lookup_interval: int = DEFAULT_FULL_LOOKUP_INTERVAL,
+            base_backoff_s: float = DEFAULT_BASE_BACKOFF_S,
+            max_backoff_s: float = DEFAULT_MAX_BACKOFF_S,
+    ):
+        self.full_lookup_interval = full_lookup_interval
+        self.base_backoff_s = base_backoff_s
+        self.max_backoff_s = max_backoff_s
+        self.filter_stats: Dict[PeerAddress, PeerFilterStats] = {}
+        self.lock = threading.Lock()
+
+    def start_timeline_lookup(
+            self,
+            peer_address: PeerAddress,
+            min_block: int,
+            interest_min_block: int,
+    ) -> TimelineLookup:
+        """Count a timeline lookup of the peer that starts at `min_block`.
+
+        Returns the first block of the lookup, and whether it can be sent
+        with a filter.
+        """
+        with self.lock:
+            filter_stats = self.filter_stats.get(
+                peer_address, PeerFilterStats())
+            self.filter_stats[peer_address] = filter_stats._replace(
+                num_timeline_lookups=filter_stats.num_timeline_lookups + 1,
+            )
+        if filter_stats.num_timeline_lookups % self.full_lookup_interval != 0:
+            return TimelineLookup(min_block, True)
+        if filter_stats.unverified_min_block is not None:
+            min_block = min(
+                min_block,
+                max(filter_stats.unverified_min_block, interest_min_block),
+            )
+        return TimelineLookup(min_block, False)
+
+    def record_timeline_synced(
+            self,
+            peer_address: PeerAddress,
+            timeline_lookup: TimelineLookup,
+            used_filter: bool,
+    ) -> None:
+        """Record that the peer was synced up to the tip by the lookup."""
+        with self.lock:
+            filter_stats = self.filter_stats.get(
+                peer_address, PeerFilterStats())
+            unverified_min_block = filter_stats.unverified_min_block
+            if used_filter:
+                if unverified_min_block is None or \
+                        timeline_lookup.min_block < unverified_min_block:
+                    unverified_min_block = timeline_lookup.min_block
+            elif unverified_min_block is not None and \
+                    timeline_lookup.min_block <= unverified_min_block:
+                unverified_min_block = None
+            self.filter_stats[peer_address] = filter_stats._replace(
+                unverified_min_block=unverified_min_block,
+            )
+
+    def is_filter_supported(self, peer_address: PeerAddress) -> bool:
+        with self.lock:
+            filter_stats = self.filter_stats.get(
+                peer_address, PeerFilterStats())
+        return time.time() >= filter_stats.backoff_until_s
+
+    def record_filter_result(
+            self,
+            peer_address: PeerAddress,
+            supported: bool,
+    ) -> None:
+        with self.lock:
+            filter_stats = self.filter_stats.get(
+                peer_address, PeerFilterStats())
+            if supported:
+                self.filter_stats[peer_address] = filter_stats._replace(
+                    consecutive_failures=0,
+                    backoff_until_s=0.0,
+                )
+                return
+            consecutive_failures = filter_stats.consecutive_failures + 1
+            backoff_s = min(
+                self.base_backoff_s * 2 ** (consecutive_failures - 1),
+                self.max_backoff_s,
+            )
+            logger.info("Sending lookups without a filter to peer {} for {} seconds.".format(
+                peer_address,
+                backoff_s,
+            ))
+            self.filter_stats[peer_address] = filter_stats._replace(
+                consecutive_failures=consecutive_failures,
+                backoff_until_s=time.time() + backoff_s,
+            )
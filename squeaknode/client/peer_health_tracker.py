@@ -0,0 +1,146 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import logging
+import threading
+import time
+from typing import Dict
+from typing import NamedTuple
+
+from squeaknode.client.peer_health import PeerHealth
+from squeaknode.client.peer_session_registry import PeerSessionRegistry
+from squeaknode.client.peer_session_stats import PeerSessionStats
+from squeaknode.core.peer_address import PeerAddress
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_BASE_BACKOFF_S = 30
+DEFAULT_MAX_BACKOFF_S = 3600
+
+
+class PeerRoundStats(NamedTuple):
+    """Class for keeping track of the download rounds of a peer."""
+    num_rounds: int = 0
+    consecutive_failures: int = 0
+    num_downloaded: int = 0
+    backoff_until_s: float = 0.0
+
+
+class PeerHealthTracker:
+    """Keeps the health of each peer in memory.
+
+    The health combines the request stats of the peer session registry
+    with the outcome of each download round. A peer that fails a round
+    is skipped for `base_backoff_s` seconds, doubling after each
+    consecutive failure up to `max_backoff_s`.
+    """
+
+    def __init__(
+            self,
+            session_registry: PeerSessionRegistry,
+            base_backoff_s: float = DEFAULT_BASE_BACKOFF_S,
+            max_backoff_s: float = DEFAULT_MAX_BACKOFF_S,
+    ):
+        self.session_registry = session_registry
+        self.base_backoff_s = base_backoff_s
+        self.max_backoff_s = max_backoff_s
+        self.round_stats: Dict[PeerAddress, PeerRoundStats] = {}
+        self.lock = threading.Lock()
+
+    def record_round(
+            self,
+            peer_address: PeerAddress,
+            failed: bool,
+            num_downloaded: int,
+    ) -> None:
+        with self.lock:
+            round_stats = self.round_stats.get(peer_address, PeerRoundStats())
+            consecutive_failures = round_stats.consecutive_failures + 1 if failed else 0
+            backoff_until_s = 0.0
+            if failed:
+                backoff_s = min(
+                    self.base_backoff_s * 2 ** (consecutive_failures - 1),
+                    self.max_backoff_s,
+                )
+                backoff_until_s = time.time() + backoff_s
+                logger.info("Backing off peer {} for {} seconds.".format(
+                    peer_address,
+                    backoff_s,
+                ))
+            self.round_stats[peer_address] = PeerRoundStats(
+                num_rounds=round_stats.num_rounds + 1,
+                consecutive_failures=consecutive_failures,
+                num_downloaded=round_stats.num_downloaded + num_downloaded,
+                backoff_until_s=backoff_until_s,
+            )
+
+    def is_backed_off(self, peer_address: PeerAddress) -> bool:
+        with self.lock:
+            round_stats = self.round_stats.get(peer_address, PeerRoundStats())
+        return time.time() < round_stats.backoff_until_s
+
+    def get_health(self, peer_address: PeerAddress) -> PeerHealth:
+        with self.lock:
+            round_stats = self.round_stats.get(peer_address, PeerRoundStats())
+        session_stats = self.session_registry.get_stats().get(
+            peer_address,
+            PeerSessionStats(),
+        )
+        return get_peer_health(round_stats, session_stats)
+
+    def get_all_health(self) -> Dict[PeerAddress, PeerHealth]:
+        with self.lock:
+            all_round_stats = dict(self.round_stats)
+        all_session_stats = self.session_registry.get_stats()
+        return {
+            peer_address: get_peer_health(
+                all_round_stats.get(peer_address, PeerRoundStats()),
+                all_session_stats.get(peer_address, PeerSessionStats()),
+            )
+            for peer_address in set(all_round_stats) | set(all_session_stats)
+        }
+
+
+def get_peer_health(
+        round_stats: PeerRoundStats,
+        session_stats: PeerSessionStats,
+) -> PeerHealth:
+    """Score a peer higher for more new items per request, and lower for
+    errors and latency. A peer without any requests yet gets the score
+    of a fast peer that never fails, so that it is tried early.
+    """
+    error_rate = 0.0
+    yield_per_request = 0.0
+    if session_stats.num_requests > 0:
+        error_rate = session_stats.num_errors / session_stats.num_requests
+        yield_per_request = round_stats.num_downloaded / session_stats.num_requests
+    avg_latency_ms = session_stats.avg_time_ms
+    score = (1 - error_rate) * (1 + yield_per_request) / \
+        (1 + avg_latency_ms / 1000)
+    return PeerHealth(
+        score=score,
+        avg_latency_ms=avg_latency_ms,
+        error_rate=error_rate,
+        yield_per_request=yield_per_request,
+        consecutive_failures=round_stats.consecutive_failures,
+        backoff_until_ms=int(round_stats.backoff_until_s * 1000),
+    )
@@ -0,0 +1,153 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import logging
+import threading
+import time
+from typing import Dict
+from typing import NamedTuple
+from typing import Set
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from squeaknode.client.peer_session_stats import PeerSessionStats
+from squeaknode.core.peer_address import PeerAddress
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_POOL_SIZE = 4
+DEFAULT_IDLE_TIMEOUT_S = 300
+
+
+class PeerSession(NamedTuple):
+    session: requests.Session
+    last_used_time_s: float
+
+
+class PeerSessionRegistry:
+    """Keeps a pooled, keep-alive HTTP session for each peer.
+
+    Each session holds at most `pool_size` connections to its peer.
+    Sessions that have not been used for `idle_timeout_s` seconds are
+    closed. The registry also remembers which peers do not support batch
+    requests, because the downloaders are created again for each
+    download.
+    """
+
+    def __init__(
+            self,
+            pool_size: int = DEFAULT_POOL_SIZE,
+            idle_timeout_s: float = DEFAULT_IDLE_TIMEOUT_S,
+    ):
+        self.pool_size = pool_size
+        self.idle_timeout_s = idle_timeout_s
+        self.sessions: Dict[PeerAddress, PeerSession] = {}
+        self.stats: Dict[PeerAddress, PeerSessionStats] = {}
+        self.batch_unsupported_peers: Set[PeerAddress] = set()
+        self.lock = threading.Lock()
+
+    def get_session(
+            self,
+            peer_address: PeerAddress,
+            proxies: Dict[str, str],
+    ) -> requests.Session:
+        now = time.monotonic()
+        with self.lock:
+            self._evict_idle_sessions(now)
+            peer_session = self.sessions.get(peer_address)
+            if peer_session is None:
+                session = self._create_session(proxies)
+                stats = self.stats.get(peer_address, PeerSessionStats())
+                self.stats[peer_address] = stats._replace(
+                    num_sessions_created=stats.num_sessions_created + 1,
+                )
+                logger.debug("Created session for peer: {}".format(
+                    peer_address,
+                ))
+            else:
+                session = peer_session.session
+            self.sessions[peer_address] = PeerSession(session, now)
+            return session
+
+    def record_request(
+            self,
+            peer_address: PeerAddress,
+            elapsed_time_ms: int,
+            is_error: bool,
+    ) -> None:
+        with self.lock:
+            stats = self.stats.get(peer_address, PeerSessionStats())
+            self.stats[peer_address] = stats._replace(
+                num_requests=stats.num_requests + 1,
+                num_errors=stats.num_errors + (1 if is_error else 0),
+                total_time_ms=stats.total_time_ms + elapsed_time_ms,
+            )
+
+    def is_batch_supported(self, peer_address: PeerAddress) -> bool:
+        with self.lock:
+            return peer_address not in self.batch_unsupported_peers
+
+    def record_batch_unsupported(self, peer_address: PeerAddress) -> None:
+        with self.lock:
+            self.batch_unsupported_peers.add(peer_address)
+
+    def get_stats(self) -> Dict[PeerAddress, PeerSessionStats]:
+        with self.lock:
+            return dict(self.stats)
+
+    def get_num_sessions(self) -> int:
+        with self.lock:
+            return len(self.sessions)
+
+    def evict_idle_sessions(self) -> None:
+        with self.lock:
+            self._evict_idle_sessions(time.monotonic())
+
+    def close(self) -> None:
+        with self.lock:
+            for peer_session in self.sessions.values():
+                peer_session.session.close()
+            self.sessions.clear()
+
+    def _evict_idle_sessions(self, now: float) -> None:
+        idle_peer_addresses = [
+            peer_address
+            for peer_address, peer_session in self.sessions.items()
+            if now - peer_session.last_used_time_s >= self.idle_timeout_s
+        ]
+        for peer_address in idle_peer_addresses:
+            logger.debug("Closing idle session for peer: {}".format(
+                peer_address,
+            ))
+            self.sessions.pop(peer_address).session.close()
+
+    def _create_session(self, proxies: Dict[str, str]) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.pool_size,
+            pool_block=True,
+        )
+        session.mount("http://", adapter)
+        session.proxies.update(proxies)
+        return session
@@ -0,0 +1,248 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import logging
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Sequence
+
+from squeak.core.keys import SqueakPublicKey
+
+from squeaknode.bitcoin.block_info import BlockInfo
+from squeaknode.client.base_download_scheduler import BaseDownloadScheduler
+from squeaknode.client.base_download_scheduler import D
+from squeaknode.client.peer_filter_tracker import PeerFilterTracker
+from squeaknode.client.peer_filter_tracker import TimelineLookup
+from squeaknode.client.peer_health_tracker import PeerHealthTracker
+from squeaknode.core.peer_address import PeerAddress
+from squeaknode.core.sync_watermark import get_public_keys_digest
+from squeaknode.core.sync_watermark import SyncWatermark
+from squeaknode.node.squeak_store import SqueakStore
+
+logger = logging.getLogger(__name__)
+
+
+class TimelineRange(NamedTuple):
+    """Class for representing the part of the timeline to download."""
+    block_info: BlockInfo
+    min_block: int
+    followed_public_keys: List[SqueakPublicKey]
+    public_keys_digest: bytes
+
+    @property
+    def max_block(self) -> int:
+        return self.block_info.block_height
+
+
+def get_timeline_range(
+        squeak_store: SqueakStore,
+        interest_block_interval: int,
+) -> TimelineRange:
+    block_info = squeak_store.get_latest_block_info()
+    followed_public_keys = squeak_store.get_followed_public_keys()
+    return TimelineRange(
+        block_info=block_info,
+        min_block=max(0, block_info.block_height - interest_block_interval),
+        followed_public_keys=followed_public_keys,
+        public_keys_digest=get_public_keys_digest(followed_public_keys),
+    )
+
+
+def get_available_downloaders(
+        peer_health_tracker: PeerHealthTracker,
+        downloaders: Sequence[D],
+) -> List[D]:
+    """Skip the peers that failed recently."""
+    return [
+        downloader for downloader in downloaders
+        if not peer_health_tracker.is_backed_off(downloader.peer.address)
+    ]
+
+
+def get_peer_scores(
+        peer_health_tracker: PeerHealthTracker,
+) -> Dict[PeerAddress, float]:
+    return {
+        peer_address: peer_health.score
+        for peer_address, peer_health in peer_health_tracker.get_all_health().items()
+    }
+
+
+def get_peer_min_block(
+        squeak_store: SqueakStore,
+        timeline_range: TimelineRange,
+        peer_address: PeerAddress,
+) -> int:
+    """Get the first block to lookup on a peer, so that only the part of
+    the timeline not already synced is downloaded.
+    """
+    return get_sync_min_block(
+        squeak_store,
+        squeak_store.get_sync_watermark(peer_address),
+        timeline_range.min_block,
+        timeline_range.max_block,
+        timeline_range.public_keys_digest,
+    )
+
+
+def start_timeline_lookup(
+        squeak_store: SqueakStore,
+        peer_filter_tracker: PeerFilterTracker,
+        timeline_range: TimelineRange,
+        peer_address: PeerAddress,
+) -> TimelineLookup:
+    """Get the range and the filter policy of the timeline lookup sent to
+    a peer.
+    """
+    return peer_filter_tracker.start_timeline_lookup(
+        peer_address,
+        get_peer_min_block(squeak_store, timeline_range, peer_address),
+        timeline_range.min_block,
+    )
+
+
+def get_sync_min_block(
+        squeak_store: SqueakStore,
+        sync_watermark: Optional[SyncWatermark],
+        interest_min_block: int,
+        max_block: int,
+        public_keys_digest: bytes,
+) -> int:
+    """Get the first block to download from a peer.
+
+    The whole interest range is downloaded if the peer was never
+    synced, if the followed public keys changed, or if the last synced
+    block is no longer in the best chain. Otherwise only the blocks
+    starting from the last synced block are downloaded. The last synced
+    block is downloaded again because new squeaks may have been made
+    on it after the last sync.
+    """
+    if sync_watermark is None:
+        return interest_min_block
+    if sync_watermark.public_keys_digest != public_keys_digest:
+        logger.info("Followed public keys changed, resyncing peer: {}".format(
+            sync_watermark.peer_address,
+        ))
+        return interest_min_block
+    if sync_watermark.block_height > max_block or \
+            sync_watermark.block_height < interest_min_block:
+        return interest_min_block
+    block_hash = squeak_store.get_block_hash(
+        sync_watermark.block_height,
+    )
+    if block_hash != sync_watermark.block_hash:
+        logger.info("Reorg detected, resyncing peer: {}".format(
+            sync_watermark.peer_address,
+        ))
+        return interest_min_block
+    return sync_watermark.block_height
+
+
+def record_round_health(
+        peer_health_tracker: PeerHealthTracker,
+        downloaders: Sequence[D],
+        scheduler: BaseDownloadScheduler[D],
+) -> None:
+    """Record the outcome of the download round for each contacted peer.
+
+    A peer that was still running a task when the round was cancelled or
+    timed out is recorded as failed.
+    """
+    for downloader in downloaders:
+        peer_address = downloader.peer.address
+        if peer_address not in scheduler.contacted_peers:
+            continue
+        peer_health_tracker.record_round(
+            peer_address,
+            scheduler.is_peer_failed(peer_address),
+            scheduler.peer_num_downloaded[peer_address],
+        )
+
+
+def add_locked_squeaks(
+        squeak_store: SqueakStore,
+        timeline_range: TimelineRange,
+        advertised: Dict[D, List[bytes]],
+        timeline_lookups: Dict[PeerAddress, TimelineLookup],
+) -> Dict[D, List[bytes]]:
+    """Add the owned squeaks in the range that are still locked to the
+    hashes advertised by the peers that had a full lookup, so that they
+    are asked for the secret keys again.
+
+    The watermarks do not wait for these squeaks, so they are looked up
+    in the database instead. A squeak with a received offer is skipped,
+    because it is waiting to be bought.
+    """
+    full_lookup_downloaders = [
+        downloader for downloader in advertised
+        if not timeline_lookups[downloader.peer.address].allow_filter
+    ]
+    if not full_lookup_downloaders:
+        return advertised
+    locked_hashes = squeak_store.lookup_locked_squeaks(
+        timeline_range.followed_public_keys,
+        timeline_range.min_block,
+        timeline_range.max_block,
+    )
+    if not locked_hashes:
+        return advertised
+    ret = dict(advertised)
+    for downloader in full_lookup_downloaders:
+        ret[downloader] = list(dict.fromkeys(
+            advertised[downloader] + locked_hashes,
+        ))
+    return ret
+
+
+def update_sync_watermarks(
+        squeak_store: SqueakStore,
+        peer_filter_tracker: PeerFilterTracker,
+        timeline_range: TimelineRange,
+        advertised: Dict[D, List[bytes]],
+        timeline_lookups: Dict[PeerAddress, TimelineLookup],
+        scheduler: BaseDownloadScheduler[D],
+) -> None:
+    """Advance the watermarks of the peers that were fully synced to the
+    tip.
+
+    The squeaks that are still locked do not hold the watermarks back,
+    because they are asked for again by `add_locked_squeaks`. A filtered
+    lookup also advances the watermark, and the blocks that it synced are
+    verified by the next full lookup of the peer.
+    """
+    for downloader, squeak_hashes in advertised.items():
+        if not scheduler.failed_hashes.isdisjoint(squeak_hashes):
+            continue
+        squeak_store.set_sync_watermark(
+            SyncWatermark(
+                peer_address=downloader.peer.address,
+                public_keys_digest=timeline_range.public_keys_digest,
+                block_height=timeline_range.block_info.block_height,
+                block_hash=timeline_range.block_info.block_hash,
+            )
+        )
+        peer_filter_tracker.record_timeline_synced(
+            downloader.peer.address,
+            timeline_lookups[downloader.peer.address],
+            downloader.used_filter,
+        )
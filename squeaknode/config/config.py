@@ -49,6 +49,13 @@ DEFAULT_WEBADMIN_PORT = 12994
 DEFAULT_BITCOIN_RPC_HOST = "localhost"
 DEFAULT_BITCOIN_RPC_PORT = 18334
 DEFAULT_BITCOIN_ZEROMQ_HASHBLOCK_PORT = 28334
+DEFAULT_BITCOIN_BLOCK_POLL_INTERVAL_S = 30
+DEFAULT_BITCOIN_BLOCK_CACHE_SIZE = 10000
+DEFAULT_BITCOIN_BLOCK_CACHE_MIN_DEPTH = 6
+DEFAULT_BITCOIN_RPC_POOL_SIZE = 50
+DEFAULT_BITCOIN_RPC_TIMEOUT_S = 10
+DEFAULT_BITCOIN_RPC_MAX_RETRIES = 3
+DEFAULT_BITCOIN_RPC_BACKOFF_FACTOR = 0.5
 BITCOIN_RPC_PORT = {
     "mainnet": 8332,
     "testnet": 18332,
@@ -64,6 +71,16 @@ DEFAULT_SENT_OFFER_RETENTION_S = 86400
 DEFAULT_RECEIVED_OFFER_RETENTION_S = 86400
 DEFAULT_OFFER_DELETION_INTERVAL_S = 10
 DEFAULT_PEER_DOWNLOAD_INTERVAL_S = 30
+DEFAULT_PEER_CONNECTION_POOL_SIZE = 4
+DEFAULT_PEER_CONNECTION_IDLE_TIMEOUT_S = 300
+DEFAULT_PEER_MAX_CONCURRENT_REQUESTS = 2
+DEFAULT_DOWNLOAD_TIMEOUT_S = 30
+DEFAULT_PEER_ROUND_TIME_LIMIT_S = 20
+DEFAULT_PEER_MAX_BACKOFF_S = 3600
+DEFAULT_SUBSCRIPTION_QUEUE_SIZE = 1000
+DEFAULT_SUBSCRIPTION_OVERFLOW_POLICY = "drop_oldest"
+DEFAULT_PROFILE_IMAGE_SIZE_PX = 256
+DEFAULT_MAX_PROFILE_IMAGE_UPLOAD_BYTES = 5242880
 DEFAULT_SUBSCRIBE_INVOICES_RETRY_S = 10
 DEFAULT_SQUEAK_RETENTION_S = 604800
 DEFAULT_SQUEAK_DELETION_INTERVAL_S = 10
@@ -78,8 +95,22 @@ class BitcoinConfig(Config):
     rpc_pass = key(cast=str, required=False, default="")
     rpc_use_ssl = key(cast=bool, required=False, default=False)
     rpc_ssl_cert = key(cast=str, required=False, default="")
+    rpc_pool_size = key(cast=int, required=False,
+                        default=DEFAULT_BITCOIN_RPC_POOL_SIZE)
+    rpc_timeout_s = key(cast=float, required=False,
+                        default=DEFAULT_BITCOIN_RPC_TIMEOUT_S)
+    rpc_max_retries = key(cast=int, required=False,
+                          default=DEFAULT_BITCOIN_RPC_MAX_RETRIES)
+    rpc_backoff_factor = key(cast=float, required=False,
+                             default=DEFAULT_BITCOIN_RPC_BACKOFF_FACTOR)
     zeromq_hashblock_port = key(cast=int, required=False,
                                 default=DEFAULT_BITCOIN_ZEROMQ_HASHBLOCK_PORT)
+    block_poll_interval_s = key(cast=int, required=False,
+                                default=DEFAULT_BITCOIN_BLOCK_POLL_INTERVAL_S)
+    block_cache_size = key(cast=int, required=False,
+                           default=DEFAULT_BITCOIN_BLOCK_CACHE_SIZE)
+    block_cache_min_depth = key(cast=int, required=False,
+                                default=DEFAULT_BITCOIN_BLOCK_CACHE_MIN_DEPTH)
 
 
 @section('lnd')
@@ -125,6 +156,7 @@ class WebadminConfig(Config):
     use_ssl = key(cast=bool, required=False, default=False)
     login_disabled = key(cast=bool, required=False, default=False)
     allow_cors = key(cast=bool, required=False, default=False)
+    inline_profile_images = key(cast=bool, required=False, default=False)
 
 
 @section('node')
@@ -137,6 +169,8 @@ class NodeConfig(Config):
         cast=int, required=False, default=DEFAULT_MAX_SQUEAKS)
     max_squeaks_per_public_key_per_block = key(
         cast=int, required=False, default=DEFAULT_MAX_SQUEAKS_PER_PUBLIC_KEY_PER_BLOCK)
+    check_squeak_counts = key(
+        cast=bool, required=False, default=False)
     sqk_dir_path = key(
         cast=str, required=False, default=DEFAULT_SQK_DIR_PATH)
     log_level = key(
@@ -157,6 +191,28 @@ class NodeConfig(Config):
         cast=int, required=False, default=DEFAULT_INTEREST_BLOCK_INTERVAL)
     peer_download_interval_s = key(
         cast=int, required=False, default=DEFAULT_PEER_DOWNLOAD_INTERVAL_S)
+    peer_connection_pool_size = key(
+        cast=int, required=False, default=DEFAULT_PEER_CONNECTION_POOL_SIZE)
+    peer_connection_idle_timeout_s = key(
+        cast=int, required=False, default=DEFAULT_PEER_CONNECTION_IDLE_TIMEOUT_S)
+    peer_max_concurrent_requests = key(
+        cast=int, required=False, default=DEFAULT_PEER_MAX_CONCURRENT_REQUESTS)
+    download_timeout_s = key(
+        cast=int, required=False, default=DEFAULT_DOWNLOAD_TIMEOUT_S)
+    peer_async_networking = key(
+        cast=bool, required=False, default=False)
+    peer_round_time_limit_s = key(
+        cast=int, required=False, default=DEFAULT_PEER_ROUND_TIME_LIMIT_S)
+    peer_max_backoff_s = key(
+        cast=int, required=False, default=DEFAULT_PEER_MAX_BACKOFF_S)
+    subscription_queue_size = key(
+        cast=int, required=False, default=DEFAULT_SUBSCRIPTION_QUEUE_SIZE)
+    subscription_overflow_policy = key(
+        cast=str, required=False, default=DEFAULT_SUBSCRIPTION_OVERFLOW_POLICY)
+    profile_image_size_px = key(
+        cast=int, required=False, default=DEFAULT_PROFILE_IMAGE_SIZE_PX)
+    max_profile_image_upload_bytes = key(
+        cast=int, required=False, default=DEFAULT_MAX_PROFILE_IMAGE_UPLOAD_BYTES)
 
 
 @section('db')
@@ -0,0 +1,112 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import hashlib
+import math
+import os
+from typing import Iterable
+from typing import Optional
+
+
+TWEAK_SIZE = 4
+HEADER_SIZE = TWEAK_SIZE + 1
+MAX_NUM_HASHES = 32
+DEFAULT_FALSE_POSITIVE_RATE = 0.001
+
+
+class BloomFilter:
+    """A Bloom filter of squeak hashes.
+
+    Each item is hashed together with a random tweak, so that a false
+    positive in one filter is unlikely to repeat in the next filter.
+
+    The serialized format is the 4-byte tweak, the number of hash
+    functions as 1 byte, and then the bit array.
+    """
+
+    def __init__(self, num_bits: int, num_hashes: int, tweak: Optional[bytes] = None):
+        if num_bits <= 0 or num_bits % 8 != 0:
+            raise ValueError("Invalid number of bits: {}".format(num_bits))
+        if not 0 < num_hashes <= MAX_NUM_HASHES:
+            raise ValueError("Invalid number of hashes: {}".format(num_hashes))
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.tweak = tweak if tweak is not None else os.urandom(TWEAK_SIZE)
+        self.bits = bytearray(num_bits // 8)
+
+    @classmethod
+    def for_items(
+            cls,
+            items: Iterable[bytes],
+            false_positive_rate: float = DEFAULT_FALSE_POSITIVE_RATE,
+    ) -> 'BloomFilter':
+        """Create a filter that holds the given items, sized for the
+        given false positive rate.
+        """
+        items = list(items)
+        num_items = max(1, len(items))
+        num_bits = math.ceil(
+            -num_items * math.log(false_positive_rate) / (math.log(2) ** 2)
+        )
+        num_bits = max(8, num_bits + (-num_bits % 8))
+        num_hashes = round(num_bits / num_items * math.log(2))
+        num_hashes = min(MAX_NUM_HASHES, max(1, num_hashes))
+        bloom_filter = cls(num_bits, num_hashes)
+        for item in items:
+            bloom_filter.add(item)
+        return bloom_filter
+
+    def _get_bit_indexes(self, item: bytes):
+        # Derive all of the indexes from one digest with double hashing.
+        digest = hashlib.sha256(self.tweak + item).digest()
+        h1 = int.from_bytes(digest[:8], 'big')
+        h2 = int.from_bytes(digest[8:16], 'big') | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, item: bytes) -> None:
+        for index in self._get_bit_indexes(item):
+            self.bits[index >> 3] |= 1 << (index & 7)
+
+    def __contains__(self, item: bytes) -> bool:
+        return all(
+            self.bits[index >> 3] & (1 << (index & 7))
+            for index in self._get_bit_indexes(item)
+        )
+
+    def serialize(self) -> bytes:
+        return self.tweak + bytes([self.num_hashes]) + bytes(self.bits)
+
+    @classmethod
+    def deserialize(cls, data: bytes) -> 'BloomFilter':
+        """Parse a serialized filter.
+
+        Raises:
+            ValueError: If the data is not a valid filter.
+        """
+        if len(data) <= HEADER_SIZE:
+            raise ValueError("Bloom filter data is too short.")
+        tweak = data[:TWEAK_SIZE]
+        num_hashes = data[TWEAK_SIZE]
+        bits = data[HEADER_SIZE:]
+        bloom_filter = cls(len(bits) * 8, num_hashes, tweak)
+        bloom_filter.bits = bytearray(bits)
+        return bloom_filter
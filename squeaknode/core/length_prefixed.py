@@ -0,0 +1,62 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from typing import Iterable
+from typing import Iterator
+
+
+RECORD_LENGTH_SIZE = 4
+MAX_RECORD_LENGTH = 1024 * 1024
+
+
+def encode_record(data: bytes) -> bytes:
+    """Prefix the data with its length as a 4-byte big-endian integer."""
+    return len(data).to_bytes(RECORD_LENGTH_SIZE, 'big') + data
+
+
+def decode_records(
+        chunks: Iterable[bytes],
+        max_record_length: int = MAX_RECORD_LENGTH,
+) -> Iterator[bytes]:
+    """Yield the length-prefixed records from a stream of byte chunks.
+
+    Raises:
+        ValueError: If a record is too long or the stream ends in the
+    middle of a record.
+    """
+    buffer = bytearray()
+    for chunk in chunks:
+        buffer.extend(chunk)
+        while len(buffer) >= RECORD_LENGTH_SIZE:
+            record_length = int.from_bytes(buffer[:RECORD_LENGTH_SIZE], 'big')
+            if record_length > max_record_length:
+                raise ValueError(
+                    "Record length {} exceeds max length {}.".format(
+                        record_length,
+                        max_record_length,
+                    ))
+            record_end = RECORD_LENGTH_SIZE + record_length
+            if len(buffer) < record_end:
+                break
+            yield bytes(buffer[RECORD_LENGTH_SIZE:record_end])
+            del buffer[:record_end]
+    if buffer:
+        raise ValueError("Stream ended in the middle of a record.")
@@ -0,0 +1,55 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from typing import NamedTuple
+
+
+class LookupCursor(NamedTuple):
+    """Position of a squeak in the lookup order."""
+    block_height: int
+    time_s: int
+    squeak_hash: bytes
+
+
+def cursor_to_str(cursor: LookupCursor) -> str:
+    """Encode the cursor as a `<block_height>:<time_s>:<hash>` string."""
+    return "{}:{}:{}".format(
+        cursor.block_height,
+        cursor.time_s,
+        cursor.squeak_hash.hex(),
+    )
+
+
+def cursor_from_str(cursor_str: str) -> LookupCursor:
+    """Decode a cursor string.
+
+    Raises:
+        ValueError: If the string is not a valid cursor.
+    """
+    block_height_str, time_s_str, squeak_hash_str = cursor_str.split(':')
+    squeak_hash = bytes.fromhex(squeak_hash_str)
+    if len(squeak_hash) != 32:
+        raise ValueError("Invalid squeak hash length.")
+    return LookupCursor(
+        block_height=int(block_height_str),
+        time_s=int(time_s_str),
+        squeak_hash=squeak_hash,
+    )
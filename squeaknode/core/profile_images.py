@@ -0,0 +1,83 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import hashlib
+from io import BytesIO
+
+from PIL import Image
+from PIL import ImageOps
+
+
+PROFILE_IMAGE_SIZE_PX = 256
+MAX_PROFILE_IMAGE_UPLOAD_BYTES = 5 * 1024 * 1024
+MAX_PROFILE_IMAGE_PIXELS = 40 * 1000 * 1000
+JPEG_QUALITY = 85
+# The resampling filters moved to an enum in newer Pillow versions.
+LANCZOS = getattr(Image, "Resampling", Image).LANCZOS
+
+
+def get_profile_image_hash(data: bytes) -> bytes:
+    return hashlib.sha256(data).digest()
+
+
+def process_profile_image(
+        data: bytes,
+        size_px: int = PROFILE_IMAGE_SIZE_PX,
+        max_upload_bytes: int = MAX_PROFILE_IMAGE_UPLOAD_BYTES,
+) -> bytes:
+    """Decode an uploaded profile image, crop it to a square no larger
+    than `size_px`, and re-encode it.
+
+    Images with transparency are encoded as PNG, other images as JPEG.
+    """
+    if len(data) > max_upload_bytes:
+        raise Exception("Profile image is larger than {} bytes.".format(
+            max_upload_bytes,
+        ))
+    try:
+        image: Image.Image = Image.open(BytesIO(data))
+        # Check the size from the header before decoding the pixels.
+        if image.width * image.height > MAX_PROFILE_IMAGE_PIXELS:
+            raise Exception("Profile image has too many pixels.")
+        # Decode the pixels here, because decoding is lazy.
+        image.load()
+        image = ImageOps.exif_transpose(image)
+    except (OSError, ValueError, Image.DecompressionBombError):
+        raise Exception("Invalid profile image.")
+    side_px = min(size_px, image.width, image.height)
+    image = ImageOps.fit(image, (side_px, side_px), LANCZOS)
+    output = BytesIO()
+    if has_transparency(image):
+        image.convert("RGBA").save(output, format="PNG", optimize=True)
+    else:
+        image.convert("RGB").save(
+            output,
+            format="JPEG",
+            quality=JPEG_QUALITY,
+            optimize=True,
+        )
+    return output.getvalue()
+
+
+def has_transparency(image: Image.Image) -> bool:
+    if image.mode in ("RGBA", "LA", "PA"):
+        return True
+    return "transparency" in image.info
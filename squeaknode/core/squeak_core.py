@@ -21,6 +21,7 @@
 # SOFTWARE.
 import logging
 from typing import Callable
+from typing import List
 from typing import Optional
 from typing import Tuple
 
@@ -29,6 +30,7 @@ from bitcoin.core import CBlockHeader
 from squeak.core import CSqueak
 
 from squeaknode.bitcoin.bitcoin_client import BitcoinClient
+from squeaknode.bitcoin.block_info import BlockInfo
 from squeaknode.core.exception import InvoiceSubscriptionError
 from squeaknode.core.lightning_address import LightningAddressHostPort
 from squeaknode.core.offer import Offer
@@ -133,6 +135,32 @@ class SqueakCore:
             raise Exception("Block hash incorrect.")
         return block_info.block_header
 
+    def get_block_headers(self, squeaks: List[CSqueak]) -> List[Optional[CBlockHeader]]:
+        """Checks if the embedded block hashes in the squeaks are valid for
+        their block heights and return the associated block headers.
+
+        Args:
+            squeaks: The squeaks to be validated.
+
+        Returns:
+            List[Optional[CBlockHeader]]: the block header associated with
+        each of the given squeaks, or None if the block hash is not valid.
+
+        Raises:
+            BitcoinRequestError: If the request to the bitcoin node fails.
+        """
+        block_infos = self.bitcoin_client.get_block_infos_by_heights([
+            squeak.nBlockHeight for squeak in squeaks
+        ])
+        ret: List[Optional[CBlockHeader]] = []
+        for squeak in squeaks:
+            block_info = block_infos.get(squeak.nBlockHeight)
+            if block_info is None or squeak.hashBlock != block_info.block_hash:
+                ret.append(None)
+            else:
+                ret.append(block_info.block_header)
+        return ret
+
     def get_decrypted_content(
             self,
             squeak: CSqueak,
@@ -175,6 +203,26 @@ class SqueakCore:
         block_info = self.bitcoin_client.get_best_block_info()
         return block_info.block_height
 
+    def get_best_block_info(self) -> BlockInfo:
+        """Get the block info of the latest block in the blockchain.
+
+        Returns:
+            BlockInfo: the latest block info.
+        """
+        return self.bitcoin_client.get_best_block_info()
+
+    def get_block_hash(self, block_height: int) -> bytes:
+        """Get the hash of the block at the given height.
+
+        Args:
+            block_height: The height of the block.
+
+        Returns:
+            bytes: the block hash.
+        """
+        block_info = self.bitcoin_client.get_block_info_by_height(block_height)
+        return block_info.block_hash
+
     def create_offer(
             self,
             squeak: CSqueak,
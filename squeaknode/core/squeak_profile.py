@@ -33,4 +33,4 @@ class SqueakProfile(NamedTuple):
     profile_id: Optional[int] = None
     private_key: Optional[SqueakPrivateKey] = None
     following: bool = True
-    profile_image: Optional[bytes] = None
+    profile_image_hash: Optional[bytes] = None
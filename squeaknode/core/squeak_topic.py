@@ -0,0 +1,75 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from enum import Enum
+from typing import Any
+from typing import Collection
+from typing import List
+from typing import NamedTuple
+
+from squeak.core.keys import SqueakPublicKey
+
+from squeaknode.core.squeak_entry import SqueakEntry
+
+
+class SqueakTopicType(Enum):
+    SQUEAK_HASH = 1
+    REPLY_TO = 2
+    PUBLIC_KEY = 3
+    TIMELINE = 4
+
+
+class SqueakTopic(NamedTuple):
+    """Represents a stream of new squeaks that can be subscribed to."""
+    topic_type: SqueakTopicType
+    key: Any = None
+
+    @classmethod
+    def squeak_hash(cls, squeak_hash: bytes) -> 'SqueakTopic':
+        return cls(SqueakTopicType.SQUEAK_HASH, squeak_hash)
+
+    @classmethod
+    def reply_to(cls, squeak_hash: bytes) -> 'SqueakTopic':
+        return cls(SqueakTopicType.REPLY_TO, squeak_hash)
+
+    @classmethod
+    def public_key(cls, public_key: SqueakPublicKey) -> 'SqueakTopic':
+        return cls(SqueakTopicType.PUBLIC_KEY, public_key)
+
+    @classmethod
+    def timeline(cls) -> 'SqueakTopic':
+        return cls(SqueakTopicType.TIMELINE)
+
+
+def get_squeak_entry_topics(
+        squeak_entry: SqueakEntry,
+        followed_public_keys: Collection[SqueakPublicKey],
+) -> List[SqueakTopic]:
+    """Get the topics that a new squeak entry is published to."""
+    topics = [
+        SqueakTopic.squeak_hash(squeak_entry.squeak_hash),
+        SqueakTopic.public_key(squeak_entry.public_key),
+    ]
+    if squeak_entry.reply_to is not None:
+        topics.append(SqueakTopic.reply_to(squeak_entry.reply_to))
+    if squeak_entry.public_key in followed_public_keys:
+        topics.append(SqueakTopic.timeline())
+    return topics
@@ -0,0 +1,48 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import hashlib
+from typing import List
+from typing import NamedTuple
+
+from squeak.core.keys import SqueakPublicKey
+
+from squeaknode.core.peer_address import PeerAddress
+
+
+class SyncWatermark(NamedTuple):
+    """Class for representing the last block fully synced from a peer."""
+    peer_address: PeerAddress
+    public_keys_digest: bytes
+    block_height: int
+    block_hash: bytes
+
+
+def get_public_keys_digest(public_keys: List[SqueakPublicKey]) -> bytes:
+    """Get a digest that identifies a set of public keys, independent of
+    their order.
+    """
+    h = hashlib.sha256()
+    for public_key_bytes in sorted(
+            public_key.to_bytes() for public_key in public_keys
+    ):
+        h.update(public_key_bytes)
+    return h.digest()
@@ -26,6 +26,8 @@ from sqlalchemy import engine_from_config
 from sqlalchemy import pool
 
 from squeaknode.db.models import Models
+from squeaknode.db.text_search import SQUEAK_FTS_TABLE
+from squeaknode.db.text_search import SQUEAK_TSVECTOR_COLUMN
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -42,6 +44,18 @@ if config.attributes.get('configure_logger', True):
 # target_metadata = mymodel.Base.metadata
 target_metadata = Models().metadata
 
+
+def include_object(object, name, type_, reflected, compare_to):
+    """Ignore the full text search objects, which are not in the models."""
+    if type_ == "table" and name.startswith(SQUEAK_FTS_TABLE):
+        return False
+    if type_ == "column" and name == SQUEAK_TSVECTOR_COLUMN:
+        return False
+    if type_ == "index" and name == "ix_squeak_content_tsv":
+        return False
+    return True
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -67,6 +81,7 @@ def run_migrations_offline():
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
         compare_type=True,
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -99,6 +114,7 @@ def run_migrations_online():
             target_metadata=target_metadata,
             render_as_batch=True,
             compare_type=True,
+            include_object=include_object,
         )
 
         with context.begin_transaction():
@@ -0,0 +1,87 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Add squeak full text search
+
+Revision ID: b7d41c2e8f60
+Revises: 5c3e1f0a9d27
+Create Date: 2022-03-22 09:47:12.604118
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+from squeaknode.db.text_search import get_search_rowid
+from squeaknode.db.text_search import SQUEAK_FTS_TABLE
+from squeaknode.db.text_search import SQUEAK_TSVECTOR_COLUMN
+from squeaknode.db.text_search import TEXT_SEARCH_CONFIG
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7d41c2e8f60'
+down_revision = '5c3e1f0a9d27'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_bind()
+    if bind.dialect.name == 'sqlite':
+        op.execute(
+            "CREATE VIRTUAL TABLE {} USING fts5(content, hash UNINDEXED)".format(
+                SQUEAK_FTS_TABLE,
+            )
+        )
+        rows = bind.execute(sa.text(
+            "SELECT hash, content FROM squeak WHERE content IS NOT NULL"
+        )).fetchall()
+        for row in rows:
+            bind.execute(
+                sa.text(
+                    "INSERT INTO {}(rowid, content, hash) VALUES (:rowid, :content, :hash)".format(
+                        SQUEAK_FTS_TABLE,
+                    )
+                ),
+                {
+                    'rowid': get_search_rowid(row[0]),
+                    'content': row[1],
+                    'hash': row[0],
+                },
+            )
+    elif bind.dialect.name == 'postgresql':
+        op.execute(
+            "ALTER TABLE squeak ADD COLUMN {} tsvector GENERATED ALWAYS AS "
+            "(to_tsvector('{}', coalesce(content, ''))) STORED".format(
+                SQUEAK_TSVECTOR_COLUMN,
+                TEXT_SEARCH_CONFIG,
+            )
+        )
+        op.create_index('ix_squeak_content_tsv', 'squeak', [
+                        SQUEAK_TSVECTOR_COLUMN], unique=False, postgresql_using='gin')
+
+
+def downgrade():
+    bind = op.get_bind()
+    if bind.dialect.name == 'sqlite':
+        op.execute("DROP TABLE {}".format(SQUEAK_FTS_TABLE))
+    elif bind.dialect.name == 'postgresql':
+        op.drop_index('ix_squeak_content_tsv', table_name='squeak')
+        op.drop_column('squeak', SQUEAK_TSVECTOR_COLUMN)
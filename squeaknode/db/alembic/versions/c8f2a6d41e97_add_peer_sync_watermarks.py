@@ -0,0 +1,61 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Add peer sync watermarks
+
+Revision ID: c8f2a6d41e97
+Revises: e41a6c9b2d53
+Create Date: 2022-03-27 10:14:52.603118
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+import squeaknode.db.models
+
+
+# revision identifiers, used by Alembic.
+revision = 'c8f2a6d41e97'
+down_revision = 'e41a6c9b2d53'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('peer_sync_watermark',
+                    sa.Column('network', sa.String(
+                        length=10), nullable=False),
+                    sa.Column('host', sa.String(), nullable=False),
+                    sa.Column('port', sa.Integer(), nullable=False),
+                    sa.Column('public_keys_digest', sa.LargeBinary(
+                        length=32), nullable=False),
+                    sa.Column('block_height', sa.Integer(), nullable=False),
+                    sa.Column('block_hash', sa.LargeBinary(
+                        length=32), nullable=False),
+                    sa.Column(
+                        'updated_time_ms', squeaknode.db.models.SLBigInteger(), nullable=False),
+                    sa.PrimaryKeyConstraint(
+                        'network', 'host', 'port', name=op.f('pk_peer_sync_watermark'))
+                    )
+
+
+def downgrade():
+    op.drop_table('peer_sync_watermark')
@@ -0,0 +1,71 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Add squeak counts
+
+Revision ID: e41a6c9b2d53
+Revises: b7d41c2e8f60
+Create Date: 2022-03-24 18:21:05.930417
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+from squeaknode.db.models import SQUEAK_COUNT_ID
+
+
+# revision identifiers, used by Alembic.
+revision = 'e41a6c9b2d53'
+down_revision = 'b7d41c2e8f60'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('squeak_count',
+                    sa.Column('count_id', sa.Integer(), nullable=False),
+                    sa.Column('num_squeaks', sa.Integer(), nullable=False),
+                    sa.PrimaryKeyConstraint(
+                        'count_id', name=op.f('pk_squeak_count'))
+                    )
+    op.create_table('squeak_block_count',
+                    sa.Column('author_public_key', sa.LargeBinary(
+                        length=32), nullable=False),
+                    sa.Column('block_height', sa.Integer(), nullable=False),
+                    sa.Column('num_squeaks', sa.Integer(), nullable=False),
+                    sa.PrimaryKeyConstraint(
+                        'author_public_key', 'block_height', name=op.f('pk_squeak_block_count'))
+                    )
+    # Populate the counts from the existing squeaks.
+    op.execute(
+        "INSERT INTO squeak_count (count_id, num_squeaks) "
+        "SELECT {}, count(*) FROM squeak".format(SQUEAK_COUNT_ID)
+    )
+    op.execute(
+        "INSERT INTO squeak_block_count (author_public_key, block_height, num_squeaks) "
+        "SELECT author_public_key, block_height, count(*) FROM squeak "
+        "GROUP BY author_public_key, block_height"
+    )
+
+
+def downgrade():
+    op.drop_table('squeak_block_count')
+    op.drop_table('squeak_count')
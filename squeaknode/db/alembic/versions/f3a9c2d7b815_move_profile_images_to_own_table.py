@@ -0,0 +1,140 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Move profile images to their own table
+
+Revision ID: f3a9c2d7b815
+Revises: c8f2a6d41e97
+Create Date: 2022-04-02 11:08:44.217305
+
+"""
+import logging
+import time
+
+import sqlalchemy as sa
+from alembic import op
+
+import squeaknode.db.models
+from squeaknode.core.profile_images import get_profile_image_hash
+from squeaknode.core.profile_images import process_profile_image
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3a9c2d7b815'
+down_revision = 'c8f2a6d41e97'
+branch_labels = None
+depends_on = None
+
+logger = logging.getLogger(__name__)
+
+
+profile = sa.table(
+    'profile',
+    sa.column('profile_id', sa.Integer()),
+    sa.column('profile_image', sa.LargeBinary()),
+    sa.column('profile_image_hash', sa.LargeBinary(length=32)),
+)
+
+profile_image = sa.table(
+    'profile_image',
+    sa.column('image_hash', sa.LargeBinary(length=32)),
+    sa.column('created_time_ms', squeaknode.db.models.SLBigInteger()),
+    sa.column('image', sa.LargeBinary()),
+)
+
+
+def upgrade():
+    op.create_table('profile_image',
+                    sa.Column('image_hash', sa.LargeBinary(
+                        length=32), nullable=False),
+                    sa.Column(
+                        'created_time_ms', squeaknode.db.models.SLBigInteger(), nullable=False),
+                    sa.Column('image', sa.LargeBinary(), nullable=False),
+                    sa.PrimaryKeyConstraint(
+                        'image_hash', name=op.f('pk_profile_image'))
+                    )
+    with op.batch_alter_table('profile', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('profile_image_hash', sa.LargeBinary(
+            length=32), nullable=True))
+
+    # Copy the existing images resized like new uploads, keyed by content
+    # hash.
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.select([profile.c.profile_id, profile.c.profile_image])
+        .where(profile.c.profile_image != None)  # noqa: E711
+    ).fetchall()
+    images = {}
+    for profile_id, image in rows:
+        image = resize_profile_image(profile_id, image)
+        image_hash = get_profile_image_hash(image)
+        images[image_hash] = image
+        connection.execute(
+            profile.update()
+            .where(profile.c.profile_id == profile_id)
+            .values(profile_image_hash=image_hash)
+        )
+    now_ms = int(time.time() * 1000)
+    for image_hash, image in images.items():
+        connection.execute(
+            profile_image.insert().values(
+                image_hash=image_hash,
+                created_time_ms=now_ms,
+                image=image,
+            )
+        )
+
+    with op.batch_alter_table('profile', schema=None) as batch_op:
+        batch_op.drop_column('profile_image')
+
+
+def resize_profile_image(profile_id, image):
+    """Resize an existing image, or keep it if it cannot be decoded."""
+    try:
+        # Existing images are not limited to the upload size.
+        return process_profile_image(image, max_upload_bytes=len(image))
+    except Exception:
+        logger.warning(
+            "Keeping profile image of profile {} that could not be resized.".format(
+                profile_id,
+            ))
+        return image
+
+
+def downgrade():
+    with op.batch_alter_table('profile', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('profile_image', sa.LargeBinary(),
+                                      nullable=True))
+
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.select([profile_image.c.image_hash, profile_image.c.image])
+    ).fetchall()
+    for image_hash, image in rows:
+        connection.execute(
+            profile.update()
+            .where(profile.c.profile_image_hash == image_hash)
+            .values(profile_image=image)
+        )
+
+    with op.batch_alter_table('profile', schema=None) as batch_op:
+        batch_op.drop_column('profile_image_hash')
+    op.drop_table('profile_image')
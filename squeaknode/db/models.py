@@ -24,11 +24,13 @@ import logging
 from sqlalchemy import BigInteger
 from sqlalchemy import Boolean
 from sqlalchemy import Column
+from sqlalchemy import Index
 from sqlalchemy import Integer
 from sqlalchemy import LargeBinary
 from sqlalchemy import MetaData
 from sqlalchemy import String
 from sqlalchemy import Table
+from sqlalchemy import text
 from sqlalchemy import UniqueConstraint
 from sqlalchemy.ext.compiler import compiles
 
@@ -36,6 +38,10 @@ from sqlalchemy.ext.compiler import compiles
 logger = logging.getLogger(__name__)
 
 
+# Id of the single row in the squeak_count table.
+SQUEAK_COUNT_ID = 0
+
+
 convention = {
     "ix": "ix_%(column_0_label)s",
     "uq": "uq_%(table_name)s_%(column_0_name)s",
@@ -75,13 +81,55 @@ class Models:
             Column("block_height", Integer, nullable=False),
             Column("time_s", Integer, nullable=False),
             Column("author_public_key", LargeBinary(
-                32), index=True, nullable=False),
+                32), nullable=False),
             Column("recipient_public_key", LargeBinary(
                 32), index=True, nullable=True),
             Column("secret_key", LargeBinary(32), nullable=True),
             Column("block_time_s", Integer, nullable=False),
             Column("liked_time_ms", SLBigInteger, default=None, nullable=True),
             Column("content", String(280), nullable=True),
+            Index(
+                "ix_squeak_block_height_time_s_hash",
+                "block_height",
+                "time_s",
+                "hash",
+            ),
+            Index(
+                "ix_squeak_author_public_key_block_height_time_s_hash",
+                "author_public_key",
+                "block_height",
+                "time_s",
+                "hash",
+            ),
+            Index(
+                "ix_squeak_reply_hash_block_height_time_s_hash",
+                "reply_hash",
+                "block_height",
+                "time_s",
+                "hash",
+            ),
+            Index(
+                "ix_squeak_liked_time_ms_hash",
+                "liked_time_ms",
+                "hash",
+                sqlite_where=text("liked_time_ms IS NOT NULL"),
+                postgresql_where=text("liked_time_ms IS NOT NULL"),
+            ),
+        )
+
+        self.squeak_counts = Table(
+            "squeak_count",
+            self.metadata,
+            Column("count_id", Integer, primary_key=True),
+            Column("num_squeaks", Integer, nullable=False),
+        )
+
+        self.squeak_block_counts = Table(
+            "squeak_block_count",
+            self.metadata,
+            Column("author_public_key", LargeBinary(32), primary_key=True),
+            Column("block_height", Integer, primary_key=True),
+            Column("num_squeaks", Integer, nullable=False),
         )
 
         self.profiles = Table(
@@ -93,10 +141,18 @@ class Models:
             Column("private_key", LargeBinary, nullable=True),
             Column("public_key", LargeBinary(32), unique=True, nullable=False),
             Column("following", Boolean, nullable=False),
-            Column("profile_image", LargeBinary, nullable=True),
+            Column("profile_image_hash", LargeBinary(32), nullable=True),
             sqlite_autoincrement=True,
         )
 
+        self.profile_images = Table(
+            "profile_image",
+            self.metadata,
+            Column("image_hash", LargeBinary(32), primary_key=True),
+            Column("created_time_ms", SLBigInteger, nullable=False),
+            Column("image", LargeBinary, nullable=False),
+        )
+
         self.peers = Table(
             "peer",
             self.metadata,
@@ -113,6 +169,18 @@ class Models:
             sqlite_autoincrement=True,
         )
 
+        self.peer_sync_watermarks = Table(
+            "peer_sync_watermark",
+            self.metadata,
+            Column("network", String(10), primary_key=True),
+            Column("host", String, primary_key=True),
+            Column("port", Integer, primary_key=True),
+            Column("public_keys_digest", LargeBinary(32), nullable=False),
+            Column("block_height", Integer, nullable=False),
+            Column("block_hash", LargeBinary(32), nullable=False),
+            Column("updated_time_ms", SLBigInteger, nullable=False),
+        )
+
         self.received_offers = Table(
             "received_offer",
             self.metadata,
@@ -0,0 +1,75 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import threading
+from collections import OrderedDict
+from typing import Callable
+from typing import Generic
+from typing import Hashable
+from typing import Optional
+from typing import TypeVar
+
+
+T = TypeVar('T')
+
+
+class ParseCache(Generic[T]):
+    """LRU cache of objects parsed from database values.
+
+    The parsed objects are shared between callers, so they must not be
+    mutated.
+    """
+
+    def __init__(self, parse: Callable[[bytes], T], max_size: int):
+        self.parse_fn = parse
+        self.max_size = max_size
+        self.items: 'OrderedDict[Hashable, T]' = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def parse(self, data: bytes, key: Optional[Hashable] = None) -> T:
+        """Parse the data, or get the object already parsed for the key.
+
+        The data is used as the key if no key is given.
+        """
+        key = key if key is not None else data
+        with self.lock:
+            item = self.items.get(key)
+            if item is not None:
+                self.hits += 1
+                self.items.move_to_end(key)
+                return item
+            self.misses += 1
+        item = self.parse_fn(data)
+        with self.lock:
+            self.items[key] = item
+            while len(self.items) > self.max_size:
+                self.items.popitem(last=False)
+        return item
+
+    def clear(self) -> None:
+        with self.lock:
+            self.items.clear()
+
+    def __len__(self) -> int:
+        with self.lock:
+            return len(self.items)
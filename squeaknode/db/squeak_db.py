@@ -21,26 +21,40 @@
 # SOFTWARE.
 import logging
 import time
+from collections import Counter
 from contextlib import contextmanager
+from itertools import islice
+from typing import Callable
+from typing import Dict
+from typing import Iterable
 from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 import sqlalchemy
 from bitcoin.core import CBlockHeader
+from sqlalchemy import exists
 from sqlalchemy import func
 from sqlalchemy import literal
+from sqlalchemy import literal_column
 from sqlalchemy import not_
 from sqlalchemy import or_
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.sql import column
 from sqlalchemy.sql import select
+from sqlalchemy.sql import table
 from sqlalchemy.sql import tuple_
 from squeak.core import CSqueak
 from squeak.core.keys import SqueakPrivateKey
 from squeak.core.keys import SqueakPublicKey
 
 from squeaknode.core.lightning_address import LightningAddressHostPort
+from squeaknode.core.lookup_cursor import LookupCursor
 from squeaknode.core.peer_address import Network
 from squeaknode.core.peer_address import PeerAddress
+from squeaknode.core.profile_images import get_profile_image_hash
 from squeaknode.core.received_offer import ReceivedOffer
 from squeaknode.core.received_payment import ReceivedPayment
 from squeaknode.core.received_payment_summary import ReceivedPaymentSummary
@@ -51,34 +65,91 @@ from squeaknode.core.squeak_entry import SqueakEntry
 from squeaknode.core.squeak_peer import SqueakPeer
 from squeaknode.core.squeak_profile import SqueakProfile
 from squeaknode.core.squeaks import get_hash
+from squeaknode.core.sync_watermark import SyncWatermark
 from squeaknode.core.twitter_account import TwitterAccount
 from squeaknode.core.twitter_account_entry import TwitterAccountEntry
 from squeaknode.core.user_config import UserConfig
 from squeaknode.db.exception import SqueakDatabaseError
 from squeaknode.db.migrations import run_migrations
 from squeaknode.db.models import Models
+from squeaknode.db.models import SQUEAK_COUNT_ID
+from squeaknode.db.parse_cache import ParseCache
+from squeaknode.db.text_search import get_fts5_match_query
+from squeaknode.db.text_search import get_search_rowid
+from squeaknode.db.text_search import get_search_tokens
+from squeaknode.db.text_search import get_tsquery
+from squeaknode.db.text_search import SQUEAK_FTS_TABLE
+from squeaknode.db.text_search import SQUEAK_TSVECTOR_COLUMN
+from squeaknode.db.text_search import TEXT_SEARCH_CONFIG
 
 
 MAX_INT = 999999999999
 MAX_HASH = b'\xff' * 32
 INIT_NUM_RETRIES = 10
 INIT_RETRY_INTERVAL_S = 1
+IN_CLAUSE_CHUNK_SIZE = 500
+PUBLIC_KEY_CACHE_SIZE = 10000
+SQUEAK_CACHE_SIZE = 1000
+
+
+ProfileLookup = Callable[[bytes], Optional[SqueakProfile]]
 
 
 logger = logging.getLogger(__name__)
 
 
+def chunks(items: Iterable, chunk_size: int) -> Iterator[List]:
+    """ Split an iterable into lists of at most `chunk_size` items. """
+    iterator = iter(items)
+    chunk = list(islice(iterator, chunk_size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, chunk_size))
+
+
 class SqueakDb:
     def __init__(self, engine, schema=None):
         self.engine = engine
         self.schema = schema
         self.models = Models(schema=schema)
+        self.profile_lookup: Optional[ProfileLookup] = None
+        # Parsing public keys and squeaks is slow, so the parsed objects
+        # are reused across rows.
+        self.public_key_cache = ParseCache(
+            SqueakPublicKey.from_bytes,
+            PUBLIC_KEY_CACHE_SIZE,
+        )
+        self.squeak_cache = ParseCache(
+            CSqueak.deserialize,
+            SQUEAK_CACHE_SIZE,
+        )
+        self.squeak_fts = table(
+            SQUEAK_FTS_TABLE,
+            column("rowid"),
+            column("content"),
+            column("hash"),
+        )
 
     @contextmanager
     def get_connection(self):
         with self.engine.connect() as connection:
             yield connection
 
+    @contextmanager
+    def get_transaction(self):
+        with self.engine.begin() as connection:
+            yield connection
+
+    def set_profile_lookup(self, profile_lookup: Optional[ProfileLookup]) -> None:
+        """ Attach the profiles to squeak entries with a lookup by public
+        key, instead of joining the profiles table.
+        """
+        self.profile_lookup = profile_lookup
+
+    @property
+    def dialect_name(self) -> str:
+        return self.engine.dialect.name
+
     def init(self):
         """ Create the tables and indices in the database. """
         logger.debug("SqlAlchemy version: {}".format(sqlalchemy.__version__))
@@ -113,14 +184,30 @@ class SqueakDb:
     def squeaks(self):
         return self.models.squeaks
 
+    @property
+    def squeak_counts(self):
+        return self.models.squeak_counts
+
+    @property
+    def squeak_block_counts(self):
+        return self.models.squeak_block_counts
+
     @property
     def profiles(self):
         return self.models.profiles
 
+    @property
+    def profile_images(self):
+        return self.models.profile_images
+
     @property
     def peers(self):
         return self.models.peers
 
+    @property
+    def peer_sync_watermarks(self):
+        return self.models.peer_sync_watermarks
+
     @property
     def received_offers(self):
         return self.models.received_offers
@@ -157,6 +244,14 @@ class SqueakDb:
         return self.timestamp_now_ms > \
             self.squeaks.c.created_time_ms + interval_s * 1000
 
+    @property
+    def squeak_author_is_followed(self):
+        return exists(
+            select([self.profiles.c.profile_id])
+            .where(self.profiles.c.public_key == self.squeaks.c.author_public_key)
+            .where(self.profile_is_following(self.profiles))
+        )
+
     def profile_has_private_key(self, profiles_table):
         return profiles_table.c.private_key != None  # noqa: E711
 
@@ -212,7 +307,103 @@ class SqueakDb:
         Return the hash (bytes) of the inserted squeak.
         Return None if squeak already exists.
         """
-        ins = self.squeaks.insert().values(
+        row = self._get_squeak_row_values(squeak, block_header)
+        ins = self.squeaks.insert().values(**row)
+        try:
+            with self.get_transaction() as connection:
+                res = connection.execute(ins)
+                squeak_hash = res.inserted_primary_key[0]
+                self._increment_squeak_counts(connection, [row])
+                return squeak_hash
+        except sqlalchemy.exc.IntegrityError:
+            logger.debug("Failed to insert squeak.", exc_info=True)
+            return None
+
+    def insert_squeaks(
+            self,
+            squeaks_with_headers: List[Tuple[CSqueak, CBlockHeader]],
+            decrypted_squeaks: Optional[Dict[bytes, Tuple[bytes, str]]] = None,
+    ) -> List[bytes]:
+        """ Insert a batch of new squeaks in a single transaction.
+
+        Squeaks that already exist are skipped. `decrypted_squeaks` has
+        the secret key and decrypted content of the squeaks that are
+        already unlocked, by squeak hash.
+
+        Return the hashes (bytes) of the inserted squeaks.
+        """
+        decrypted_squeaks = decrypted_squeaks or {}
+        rows = {}
+        for squeak, block_header in squeaks_with_headers:
+            row = self._get_squeak_row_values(squeak, block_header)
+            if row["hash"] in decrypted_squeaks:
+                row["secret_key"], row["content"] = decrypted_squeaks[row["hash"]]
+            rows[row["hash"]] = row
+        if not rows:
+            return []
+        with self.get_transaction() as connection:
+            inserted_hashes = self._insert_new_squeak_rows(
+                connection,
+                list(rows.values()),
+            )
+            inserted_rows = [rows[squeak_hash]
+                             for squeak_hash in inserted_hashes]
+            if inserted_rows:
+                self._increment_squeak_counts(connection, inserted_rows)
+            if self.dialect_name == "sqlite":
+                for row in inserted_rows:
+                    if row["content"] is not None:
+                        self._insert_squeak_search_row(
+                            connection, row["hash"], row["content"])
+            return inserted_hashes
+
+    def _insert_new_squeak_rows(self, connection, rows: List[dict]) -> List[bytes]:
+        """ Insert the squeak rows that do not already exist.
+
+        Only the rows inserted by this statement are returned, so that a
+        row inserted by a concurrent transaction is not counted twice.
+        SQLite does not return the inserted rows, so the write lock is
+        taken before the existing hashes are read, and the new rows are
+        inserted in one statement.
+        """
+        inserted_hashes: List[bytes] = []
+        if self.dialect_name == "postgresql":
+            for rows_chunk in chunks(rows, IN_CLAUSE_CHUNK_SIZE):
+                ins = (
+                    postgresql.insert(self.squeaks)
+                    .values(rows_chunk)
+                    .on_conflict_do_nothing()
+                    .returning(self.squeaks.c.hash)
+                )
+                result = connection.execute(ins)
+                inserted_hashes.extend(row["hash"] for row in result)
+            return inserted_hashes
+        if self.dialect_name == "sqlite" and \
+                not connection.connection.in_transaction:
+            # The driver only begins a transaction before the first write.
+            connection.exec_driver_sql("BEGIN IMMEDIATE")
+        existing_hashes = set(self._get_existing_squeak_hashes(
+            connection,
+            [row["hash"] for row in rows],
+        ))
+        new_rows = [row for row in rows if row["hash"] not in existing_hashes]
+        if new_rows:
+            connection.execute(
+                self._insert_ignore_conflicts(self.squeaks),
+                new_rows,
+            )
+        return [row["hash"] for row in new_rows]
+
+    def _insert_ignore_conflicts(self, table):
+        """ Get an insert statement that skips rows that already exist. """
+        if self.dialect_name == "sqlite":
+            return sqlite.insert(table).on_conflict_do_nothing()
+        if self.dialect_name == "postgresql":
+            return postgresql.insert(table).on_conflict_do_nothing()
+        return table.insert()
+
+    def _get_squeak_row_values(self, squeak: CSqueak, block_header: CBlockHeader) -> dict:
+        return dict(
             created_time_ms=self.timestamp_now_ms,
             hash=get_hash(squeak),
             squeak=squeak.serialize(),
@@ -228,19 +419,12 @@ class SqueakDb:
                                   else None),
             secret_key=None,
             block_time_s=block_header.nTime,
+            content=None,
         )
-        with self.get_connection() as connection:
-            try:
-                res = connection.execute(ins)
-                squeak_hash = res.inserted_primary_key[0]
-                return squeak_hash
-            except sqlalchemy.exc.IntegrityError:
-                logger.debug("Failed to insert squeak.", exc_info=True)
-                return None
 
     def get_squeak(self, squeak_hash: bytes) -> Optional[CSqueak]:
         """ Get a squeak. """
-        s = select([self.squeaks]).where(
+        s = select([self.squeaks.c.hash, self.squeaks.c.squeak]).where(
             self.squeaks.c.hash == squeak_hash)
         with self.get_connection() as connection:
             result = connection.execute(s)
@@ -249,6 +433,17 @@ class SqueakDb:
                 return None
             return self._parse_squeak(row)
 
+    def get_squeak_bytes(self, squeak_hash: bytes) -> Optional[bytes]:
+        """ Get a serialized squeak, without parsing it. """
+        s = select([self.squeaks.c.squeak]).where(
+            self.squeaks.c.hash == squeak_hash)
+        with self.get_connection() as connection:
+            result = connection.execute(s)
+            row = result.fetchone()
+            if row is None:
+                return None
+            return row["squeak"]
+
     def get_squeak_secret_key(self, squeak_hash: bytes) -> Optional[bytes]:
         """ Get a squeak secret key. """
         s = select([self.squeaks]).where(
@@ -260,24 +455,83 @@ class SqueakDb:
                 return None
             return row["secret_key"]
 
+    def get_squeaks(self, squeak_hashes: List[bytes]) -> Dict[bytes, CSqueak]:
+        """ Get the squeaks with the given hashes, keyed by hash.
+
+        Hashes of squeaks that do not exist are not included.
+        """
+        ret = {}
+        with self.get_connection() as connection:
+            for hashes_chunk in chunks(squeak_hashes, IN_CLAUSE_CHUNK_SIZE):
+                s = (
+                    select([self.squeaks.c.hash, self.squeaks.c.squeak])
+                    .where(self.squeaks.c.hash.in_(hashes_chunk))
+                )
+                result = connection.execute(s)
+                for row in result:
+                    ret[row["hash"]] = self._parse_squeak(row)
+        return ret
+
+    def get_squeaks_bytes(self, squeak_hashes: List[bytes]) -> Dict[bytes, bytes]:
+        """ Get the serialized squeaks with the given hashes, keyed by
+        hash, without parsing them.
+
+        Hashes of squeaks that do not exist are not included.
+        """
+        ret = {}
+        with self.get_connection() as connection:
+            for hashes_chunk in chunks(squeak_hashes, IN_CLAUSE_CHUNK_SIZE):
+                s = (
+                    select([self.squeaks.c.hash, self.squeaks.c.squeak])
+                    .where(self.squeaks.c.hash.in_(hashes_chunk))
+                )
+                result = connection.execute(s)
+                for row in result:
+                    ret[row["hash"]] = row["squeak"]
+        return ret
+
+    def get_existing_squeak_hashes(self, squeak_hashes: List[bytes]) -> List[bytes]:
+        """ Get the hashes of the given squeaks that already exist. """
+        with self.get_connection() as connection:
+            return self._get_existing_squeak_hashes(connection, squeak_hashes)
+
+    def _get_existing_squeak_hashes(self, connection, squeak_hashes: List[bytes]) -> List[bytes]:
+        ret: List[bytes] = []
+        for hashes_chunk in chunks(squeak_hashes, IN_CLAUSE_CHUNK_SIZE):
+            s = (
+                select([self.squeaks.c.hash])
+                .where(self.squeaks.c.hash.in_(hashes_chunk))
+            )
+            result = connection.execute(s)
+            ret.extend(row["hash"] for row in result)
+        return ret
+
+    def get_squeak_secret_keys(self, squeak_hashes: List[bytes]) -> Dict[bytes, bytes]:
+        """ Get the secret keys of the given squeaks, keyed by hash.
+
+        Hashes of squeaks that do not exist or do not have a secret key
+        are not included.
+        """
+        ret = {}
+        with self.get_connection() as connection:
+            for hashes_chunk in chunks(squeak_hashes, IN_CLAUSE_CHUNK_SIZE):
+                s = (
+                    select([self.squeaks.c.hash, self.squeaks.c.secret_key])
+                    .where(self.squeaks.c.hash.in_(hashes_chunk))
+                    .where(self.squeak_has_secret_key)
+                )
+                result = connection.execute(s)
+                for row in result:
+                    ret[row["hash"]] = row["secret_key"]
+        return ret
+
     def get_squeak_entry(self, squeak_hash: bytes) -> Optional[SqueakEntry]:
         """ Get a squeak with the author profile. """
         # author_profiles = self.profiles.alias()
         # recipient_profiles = self.profiles.alias()
 
         s = (
-            select([self.squeaks, self.author_profiles, self.recipient_profiles])
-            .select_from(
-                self.squeaks
-                .outerjoin(
-                    self.author_profiles,
-                    self.author_profiles.c.public_key == self.squeaks.c.author_public_key,
-                )
-                .outerjoin(
-                    self.recipient_profiles,
-                    self.recipient_profiles.c.public_key == self.squeaks.c.recipient_public_key,
-                )
-            )
+            self._squeak_entry_select()
             .where(self.squeaks.c.hash == squeak_hash)
         )
         with self.get_connection() as connection:
@@ -312,24 +566,8 @@ class SqueakDb:
             last_squeak_hash.hex(),
         ))
         s = (
-            # select([self.squeaks, self.profiles])
-            select([self.squeaks, self.author_profiles, self.recipient_profiles])
-            .select_from(
-                # self.squeaks.outerjoin(
-                #     self.profiles,
-                #     self.profiles.c.public_key == self.squeaks.c.author_public_key,
-                # )
-                self.squeaks
-                .outerjoin(
-                    self.author_profiles,
-                    self.author_profiles.c.public_key == self.squeaks.c.author_public_key,
-                )
-                .outerjoin(
-                    self.recipient_profiles,
-                    self.recipient_profiles.c.public_key == self.squeaks.c.recipient_public_key,
-                )
-            )
-            .where(self.profile_is_following(self.author_profiles))
+            self._squeak_entry_select()
+            .where(self.squeak_author_is_followed)
             .where(
                 tuple_(
                     self.squeaks.c.block_height,
@@ -371,23 +609,7 @@ class SqueakDb:
             last_squeak_hash.hex(),
         ))
         s = (
-            # select([self.squeaks, self.profiles])
-            select([self.squeaks, self.author_profiles, self.recipient_profiles])
-            .select_from(
-                # self.squeaks.outerjoin(
-                #     self.profiles,
-                #     self.profiles.c.public_key == self.squeaks.c.author_public_key,
-                # )
-                self.squeaks
-                .outerjoin(
-                    self.author_profiles,
-                    self.author_profiles.c.public_key == self.squeaks.c.author_public_key,
-                )
-                .outerjoin(
-                    self.recipient_profiles,
-                    self.recipient_profiles.c.public_key == self.squeaks.c.recipient_public_key,
-                )
-            )
+            self._squeak_entry_select()
             .where(
                 self.squeak_is_liked,
             )
@@ -435,23 +657,7 @@ class SqueakDb:
             last_squeak_hash.hex(),
         ))
         s = (
-            # select([self.squeaks, self.profiles])
-            select([self.squeaks, self.author_profiles, self.recipient_profiles])
-            .select_from(
-                # self.squeaks.outerjoin(
-                #     self.profiles,
-                #     self.profiles.c.public_key == self.squeaks.c.author_public_key,
-                # )
-                self.squeaks
-                .outerjoin(
-                    self.author_profiles,
-                    self.author_profiles.c.public_key == self.squeaks.c.author_public_key,
-                )
-                .outerjoin(
-                    self.recipient_profiles,
-                    self.recipient_profiles.c.public_key == self.squeaks.c.recipient_public_key,
-                )
-            )
+            self._squeak_entry_select()
             .where(self.squeaks.c.author_public_key == public_key.to_bytes())
             .where(
                 tuple_(
@@ -482,7 +688,7 @@ class SqueakDb:
             limit: int,
             last_entry: Optional[SqueakEntry],
     ) -> List[SqueakEntry]:
-        """ Get a squeak. """
+        """ Get squeaks with content matching the search text. """
         last_block_height = last_entry.block_height if last_entry else MAX_INT
         last_squeak_time = last_entry.squeak_time if last_entry else MAX_INT
         last_squeak_hash = last_entry.squeak_hash if last_entry else MAX_HASH
@@ -499,25 +705,28 @@ class SqueakDb:
             last_squeak_time,
             last_squeak_hash.hex(),
         ))
-        s = (
-            # select([self.squeaks, self.profiles])
-            select([self.squeaks, self.author_profiles, self.recipient_profiles])
-            .select_from(
-                # self.squeaks.outerjoin(
-                #     self.profiles,
-                #     self.profiles.c.public_key == self.squeaks.c.author_public_key,
-                # )
-                self.squeaks
-                .outerjoin(
-                    self.author_profiles,
-                    self.author_profiles.c.public_key == self.squeaks.c.author_public_key,
-                )
-                .outerjoin(
-                    self.recipient_profiles,
-                    self.recipient_profiles.c.public_key == self.squeaks.c.recipient_public_key,
-                )
+        if not get_search_tokens(search_text):
+            return []
+        squeaks_from = self.squeaks
+        if self.dialect_name == "sqlite":
+            squeaks_from = squeaks_from.join(
+                self.squeak_fts,
+                self.squeak_fts.c.hash == self.squeaks.c.hash,
+            )
+            search_clause = literal_column(SQUEAK_FTS_TABLE).match(
+                get_fts5_match_query(search_text),
+            )
+        elif self.dialect_name == "postgresql":
+            search_clause = literal_column(
+                "{}.{}".format(self.squeaks.name, SQUEAK_TSVECTOR_COLUMN),
+            ).op("@@")(
+                func.to_tsquery(TEXT_SEARCH_CONFIG, get_tsquery(search_text)),
             )
-            .where(self.squeaks.c.content.ilike(f'%{search_text}%'))
+        else:
+            search_clause = self.squeaks.c.content.ilike(f'%{search_text}%')
+        s = (
+            self._squeak_entry_select(squeaks_from)
+            .where(search_clause)
             .where(
                 tuple_(
                     self.squeaks.c.block_height,
@@ -567,23 +776,10 @@ class SqueakDb:
         )
 
         s = (
-            # select([self.squeaks, self.profiles])
-            select([self.squeaks, self.author_profiles, self.recipient_profiles])
-            .select_from(
+            self._squeak_entry_select(
                 self.squeaks.join(
                     ancestors,
                     ancestors.c.hash == self.squeaks.c.hash,
-                    # ).outerjoin(
-                    #     self.profiles,
-                    #     self.profiles.c.public_key == self.squeaks.c.author_public_key,
-                )
-                .outerjoin(
-                    self.author_profiles,
-                    self.author_profiles.c.public_key == self.squeaks.c.author_public_key,
-                )
-                .outerjoin(
-                    self.recipient_profiles,
-                    self.recipient_profiles.c.public_key == self.squeaks.c.recipient_public_key,
                 )
             )
             .order_by(
@@ -638,23 +834,7 @@ class SqueakDb:
             last_squeak_hash.hex(),
         ))
         s = (
-            # select([self.squeaks, self.profiles])
-            select([self.squeaks, self.author_profiles, self.recipient_profiles])
-            .select_from(
-                # self.squeaks.outerjoin(
-                #     self.profiles,
-                #     self.profiles.c.public_key == self.squeaks.c.author_public_key,
-                # )
-                self.squeaks
-                .outerjoin(
-                    self.author_profiles,
-                    self.author_profiles.c.public_key == self.squeaks.c.author_public_key,
-                )
-                .outerjoin(
-                    self.recipient_profiles,
-                    self.recipient_profiles.c.public_key == self.squeaks.c.recipient_public_key,
-                )
-            )
+            self._squeak_entry_select()
             .where(self.squeaks.c.reply_hash == squeak_hash)
             .where(
                 tuple_(
@@ -688,20 +868,52 @@ class SqueakDb:
         include_locked: bool = False,
     ) -> List[bytes]:
         """ Lookup squeaks. """
+        return [
+            cursor.squeak_hash
+            for cursor in self.lookup_squeak_cursors(
+                public_keys,
+                min_block,
+                max_block,
+                reply_to_hash,
+                include_locked=include_locked,
+            )
+        ]
+
+    def lookup_squeak_cursors(
+        self,
+        public_keys: List[SqueakPublicKey],
+        min_block: Optional[int],
+        max_block: Optional[int],
+        reply_to_hash: Optional[bytes],
+        include_locked: bool = False,
+        limit: Optional[int] = None,
+        last_cursor: Optional[LookupCursor] = None,
+    ) -> List[LookupCursor]:
+        """ Lookup a page of squeaks, ordered by descending
+        (block_height, time_s, hash) and starting after `last_cursor`.
+        """
         logger.debug("""Running lookup query with
         public_keys: {},
         min_block: {}
         max_block: {}
         reply_to_hash: {!r}
-        include_locked: {}""".format(
+        include_locked: {}
+        limit: {}
+        last_cursor: {}""".format(
             public_keys,
             min_block,
             max_block,
             reply_to_hash,
             include_locked,
+            limit,
+            last_cursor,
         ))
 
-        s = select([self.squeaks.c.hash])
+        s = select([
+            self.squeaks.c.block_height,
+            self.squeaks.c.time_s,
+            self.squeaks.c.hash,
+        ])
         if public_keys:
             public_key_bytes = [pubkey.to_bytes() for pubkey in public_keys]
             s = s.where(self.squeaks.c.author_public_key.in_(public_key_bytes))
@@ -713,34 +925,78 @@ class SqueakDb:
             s = s.where(self.squeaks.c.reply_hash == reply_to_hash)
         if not include_locked:
             s = s.where(self.squeak_has_secret_key)
+        if last_cursor:
+            s = s.where(
+                tuple_(
+                    self.squeaks.c.block_height,
+                    self.squeaks.c.time_s,
+                    self.squeaks.c.hash,
+                ) < tuple_(
+                    last_cursor.block_height,
+                    last_cursor.time_s,
+                    last_cursor.squeak_hash,
+                )
+            )
         s = s.order_by(
             self.squeaks.c.block_height.desc(),
             self.squeaks.c.time_s.desc(),
             self.squeaks.c.hash.desc(),
         )
+        if limit is not None:
+            s = s.limit(limit)
 
         logger.debug("Query s: {}".format(s))
 
         with self.get_connection() as connection:
-            # logger.debug("Mogrify lookup_squeaks: {}.".format(
-            #     connection.connection.cursor().mogrify(s),
-            # ))
             result = connection.execute(s)
-            rows = result.fetchall()
-            hashes = [(row["hash"]) for row in rows]
-            return hashes
+            return [
+                LookupCursor(
+                    block_height=row["block_height"],
+                    time_s=row["time_s"],
+                    squeak_hash=row["hash"],
+                )
+                for row in result
+            ]
+
+    def lookup_locked_squeaks(
+        self,
+        public_keys: List[SqueakPublicKey],
+        min_block: Optional[int],
+        max_block: Optional[int],
+    ) -> List[bytes]:
+        """ Lookup squeaks without a secret key and without a received
+        offer that can still be paid. """
+        s = (
+            select([self.squeaks.c.hash])
+            .where(not_(self.squeak_has_secret_key))
+            .where(not_(exists(
+                select([self.received_offers.c.received_offer_id])
+                .where(self.received_offers.c.squeak_hash == self.squeaks.c.hash)
+                .where(not_(self.received_offer_invoice_is_expired))
+            )))
+        )
+        if public_keys:
+            public_key_bytes = [pubkey.to_bytes() for pubkey in public_keys]
+            s = s.where(self.squeaks.c.author_public_key.in_(public_key_bytes))
+        if min_block:
+            s = s.where(self.squeaks.c.block_height >= min_block)
+        if max_block:
+            s = s.where(self.squeaks.c.block_height <= max_block)
+        with self.get_connection() as connection:
+            result = connection.execute(s)
+            return [row["hash"] for row in result]
 
     def get_number_of_squeaks(self) -> int:
         """ Get total number of squeaks. """
         s = (
-            select([
-                func.count().label("num_squeaks"),
-            ])
-            .select_from(self.squeaks)
+            select([self.squeak_counts.c.num_squeaks])
+            .where(self.squeak_counts.c.count_id == SQUEAK_COUNT_ID)
         )
         with self.get_connection() as connection:
             result = connection.execute(s)
             row = result.fetchone()
+            if row is None:
+                return 0
             num_squeaks = row["num_squeaks"]
             return num_squeaks
 
@@ -751,19 +1007,201 @@ class SqueakDb:
     ) -> int:
         """ Get number of squeaks with public key with block height. """
         s = (
-            select([
-                func.count().label("num_squeaks"),
-            ])
-            .select_from(self.squeaks)
-            .where(self.squeaks.c.author_public_key == public_key.to_bytes())
-            .where(self.squeaks.c.block_height == block_height)
+            select([self.squeak_block_counts.c.num_squeaks])
+            .where(self.squeak_block_counts.c.author_public_key == public_key.to_bytes())
+            .where(self.squeak_block_counts.c.block_height == block_height)
         )
         with self.get_connection() as connection:
             result = connection.execute(s)
             row = result.fetchone()
+            if row is None:
+                return 0
             num_squeaks = row["num_squeaks"]
             return num_squeaks
 
+    def get_number_of_squeaks_by_public_key_and_block_height(
+        self,
+        public_key_block_heights: List[Tuple[SqueakPublicKey, int]],
+    ) -> Dict[Tuple[SqueakPublicKey, int], int]:
+        """ Get number of squeaks for each pair of public key and block height.
+
+        Pairs that have no squeaks are not included.
+        """
+        keys = {
+            (public_key.to_bytes(), block_height): (public_key, block_height)
+            for public_key, block_height in public_key_block_heights
+        }
+        ret = {}
+        with self.get_connection() as connection:
+            for keys_chunk in chunks(list(keys.keys()), IN_CLAUSE_CHUNK_SIZE):
+                s = (
+                    select([
+                        self.squeak_block_counts.c.author_public_key,
+                        self.squeak_block_counts.c.block_height,
+                        self.squeak_block_counts.c.num_squeaks,
+                    ])
+                    .where(
+                        tuple_(
+                            self.squeak_block_counts.c.author_public_key,
+                            self.squeak_block_counts.c.block_height,
+                        ).in_(keys_chunk)
+                    )
+                    .where(self.squeak_block_counts.c.num_squeaks > 0)
+                )
+                result = connection.execute(s)
+                for row in result:
+                    key = keys[(row["author_public_key"], row["block_height"])]
+                    ret[key] = row["num_squeaks"]
+        return ret
+
+    def check_squeak_counts(self) -> bool:
+        """ Check if the maintained squeak counts match the squeaks table.
+
+        Return True if the counts are consistent.
+        """
+        with self.get_connection() as connection:
+            expected_counts = self._count_squeaks(connection)
+            s = select([
+                self.squeak_block_counts.c.author_public_key,
+                self.squeak_block_counts.c.block_height,
+                self.squeak_block_counts.c.num_squeaks,
+            ]).where(self.squeak_block_counts.c.num_squeaks > 0)
+            result = connection.execute(s)
+            actual_counts = {
+                (row["author_public_key"], row["block_height"]): row["num_squeaks"]
+                for row in result
+            }
+        return (
+            actual_counts == expected_counts
+            and self.get_number_of_squeaks() == sum(expected_counts.values())
+        )
+
+    def rebuild_squeak_counts(self) -> None:
+        """ Recompute the maintained squeak counts from the squeaks table. """
+        with self.get_transaction() as connection:
+            block_counts = self._count_squeaks(connection)
+            connection.execute(self.squeak_block_counts.delete())
+            connection.execute(self.squeak_counts.delete())
+            connection.execute(
+                self.squeak_counts.insert().values(
+                    count_id=SQUEAK_COUNT_ID,
+                    num_squeaks=sum(block_counts.values()),
+                )
+            )
+            if block_counts:
+                connection.execute(
+                    self.squeak_block_counts.insert(),
+                    [
+                        dict(
+                            author_public_key=author_public_key,
+                            block_height=block_height,
+                            num_squeaks=num_squeaks,
+                        )
+                        for (author_public_key, block_height), num_squeaks
+                        in block_counts.items()
+                    ],
+                )
+
+    def _count_squeaks(self, connection) -> Dict[Tuple[bytes, int], int]:
+        """ Count the squeaks for each author public key and block height. """
+        s = (
+            select([
+                self.squeaks.c.author_public_key,
+                self.squeaks.c.block_height,
+                func.count().label("num_squeaks"),
+            ])
+            .group_by(
+                self.squeaks.c.author_public_key,
+                self.squeaks.c.block_height,
+            )
+        )
+        result = connection.execute(s)
+        return {
+            (row["author_public_key"], row["block_height"]): row["num_squeaks"]
+            for row in result
+        }
+
+    def _increment_squeak_counts(self, connection, rows: List[dict]) -> None:
+        """ Add the given squeak rows to the maintained squeak counts. """
+        block_counts = Counter(
+            (row["author_public_key"], row["block_height"])
+            for row in rows
+        )
+        self._update_squeak_counts(connection, block_counts)
+
+    def _decrement_squeak_counts(self, connection, rows: List[dict]) -> None:
+        """ Remove the given squeak rows from the maintained squeak counts. """
+        block_counts: Counter = Counter()
+        for row in rows:
+            block_counts[(row["author_public_key"], row["block_height"])] -= 1
+        self._update_squeak_counts(connection, block_counts)
+        for author_public_key, block_height in block_counts.keys():
+            connection.execute(
+                self.squeak_block_counts.delete()
+                .where(self.squeak_block_counts.c.author_public_key == author_public_key)
+                .where(self.squeak_block_counts.c.block_height == block_height)
+                .where(self.squeak_block_counts.c.num_squeaks <= 0)
+            )
+
+    def _update_squeak_counts(self, connection, block_counts: Counter) -> None:
+        """ Add the given deltas to the maintained squeak counts. """
+        if not block_counts:
+            return
+        connection.execute(
+            self.squeak_counts.update()
+            .where(self.squeak_counts.c.count_id == SQUEAK_COUNT_ID)
+            .values(
+                num_squeaks=(
+                    self.squeak_counts.c.num_squeaks
+                    + sum(block_counts.values())
+                ),
+            )
+        )
+        delta_rows = [
+            dict(
+                author_public_key=author_public_key,
+                block_height=block_height,
+                num_squeaks=delta,
+            )
+            for (author_public_key, block_height), delta in block_counts.items()
+        ]
+        if self.dialect_name in ("sqlite", "postgresql"):
+            insert = (
+                sqlite.insert if self.dialect_name == "sqlite"
+                else postgresql.insert
+            )
+            ins = insert(self.squeak_block_counts)
+            upsert = ins.on_conflict_do_update(
+                index_elements=[
+                    self.squeak_block_counts.c.author_public_key,
+                    self.squeak_block_counts.c.block_height,
+                ],
+                set_=dict(
+                    num_squeaks=(
+                        self.squeak_block_counts.c.num_squeaks
+                        + ins.excluded.num_squeaks
+                    ),
+                ),
+            )
+            connection.execute(upsert, delta_rows)
+            return
+        for delta_row in delta_rows:
+            res = connection.execute(
+                self.squeak_block_counts.update()
+                .where(self.squeak_block_counts.c.author_public_key == delta_row["author_public_key"])
+                .where(self.squeak_block_counts.c.block_height == delta_row["block_height"])
+                .values(
+                    num_squeaks=(
+                        self.squeak_block_counts.c.num_squeaks
+                        + delta_row["num_squeaks"]
+                    ),
+                )
+            )
+            if res.rowcount == 0:
+                connection.execute(
+                    self.squeak_block_counts.insert().values(**delta_row),
+                )
+
     def get_old_squeaks_to_delete(
             self,
             interval_s: int,
@@ -772,22 +1210,12 @@ class SqueakDb:
         criteria for deletion.
         """
         s = (
-            # select([self.squeaks, self.profiles])
-            select([self.squeaks, self.author_profiles, self.recipient_profiles])
+            select([self.squeaks.c.hash])
             .select_from(
-                # self.squeaks.outerjoin(
-                #     self.profiles,
-                #     self.profiles.c.public_key == self.squeaks.c.author_public_key,
-                # )
-                self.squeaks
-                .outerjoin(
+                self.squeaks.outerjoin(
                     self.author_profiles,
                     self.author_profiles.c.public_key == self.squeaks.c.author_public_key,
                 )
-                .outerjoin(
-                    self.recipient_profiles,
-                    self.recipient_profiles.c.public_key == self.squeaks.c.recipient_public_key,
-                )
             )
             .where(self.squeak_is_older_than_retention(interval_s))
             .where(not_(self.profile_has_private_key(self.author_profiles)))
@@ -913,18 +1341,58 @@ class SqueakDb:
         delete_profile_stmt = self.profiles.delete().where(
             self.profiles.c.profile_id == profile_id
         )
-        with self.get_connection() as connection:
+        with self.get_transaction() as connection:
             connection.execute(delete_profile_stmt)
+            self._delete_unused_profile_images(connection)
 
     def set_profile_image(self, profile_id: int, profile_image: Optional[bytes]) -> None:
-        """ Set a profile image. """
+        """ Set a profile image.
+
+        The image is stored once by content hash, and the profile only
+        keeps a reference to it.
+        """
+        profile_image_hash = None
+        if profile_image is not None:
+            profile_image_hash = get_profile_image_hash(profile_image)
         stmt = (
             self.profiles.update()
             .where(self.profiles.c.profile_id == profile_id)
-            .values(profile_image=profile_image)
-        )
-        with self.get_connection() as connection:
+            .values(profile_image_hash=profile_image_hash)
+        )
+        with self.get_transaction() as connection:
+            if profile_image is not None:
+                connection.execute(
+                    self._insert_ignore_conflicts(self.profile_images),
+                    dict(
+                        image_hash=profile_image_hash,
+                        created_time_ms=self.timestamp_now_ms,
+                        image=profile_image,
+                    ),
+                )
             connection.execute(stmt)
+            self._delete_unused_profile_images(connection)
+
+    def get_profile_image(self, image_hash: bytes) -> Optional[bytes]:
+        """ Get a profile image by content hash. """
+        s = select([self.profile_images.c.image]).where(
+            self.profile_images.c.image_hash == image_hash)
+        with self.get_connection() as connection:
+            result = connection.execute(s)
+            row = result.fetchone()
+            if row is None:
+                return None
+            return row["image"]
+
+    def _delete_unused_profile_images(self, connection) -> None:
+        used_hashes = (
+            select([self.profiles.c.profile_image_hash])
+            .where(self.profiles.c.profile_image_hash != None)  # noqa: E711
+        )
+        connection.execute(
+            self.profile_images.delete().where(
+                self.profile_images.c.image_hash.notin_(used_hashes)
+            )
+        )
 
     def set_squeak_secret_key(self, squeak_hash: bytes, secret_key: bytes) -> None:
         """ Set the secret key of a squeak. """
@@ -943,8 +1411,12 @@ class SqueakDb:
             .where(self.squeaks.c.hash == squeak_hash)
             .values(content=content)
         )
-        with self.get_connection() as connection:
+        with self.get_transaction() as connection:
             connection.execute(stmt)
+            if self.dialect_name == "sqlite":
+                self._delete_squeak_search_row(connection, squeak_hash)
+                self._insert_squeak_search_row(
+                    connection, squeak_hash, content)
 
     def set_squeak_liked(self, squeak_hash: bytes) -> None:
         """ Set the squeak to be liked. """
@@ -968,11 +1440,36 @@ class SqueakDb:
 
     def delete_squeak(self, squeak_hash: bytes) -> None:
         """ Delete a squeak. """
+        s = select([
+            self.squeaks.c.author_public_key,
+            self.squeaks.c.block_height,
+        ]).where(self.squeaks.c.hash == squeak_hash)
         delete_squeak_stmt = self.squeaks.delete().where(
             self.squeaks.c.hash == squeak_hash
         )
-        with self.get_connection() as connection:
-            connection.execute(delete_squeak_stmt)
+        with self.get_transaction() as connection:
+            rows = connection.execute(s).fetchall()
+            res = connection.execute(delete_squeak_stmt)
+            if res.rowcount > 0:
+                self._decrement_squeak_counts(connection, rows)
+            if self.dialect_name == "sqlite":
+                self._delete_squeak_search_row(connection, squeak_hash)
+
+    def _insert_squeak_search_row(self, connection, squeak_hash: bytes, content: str) -> None:
+        """ Add the squeak content to the full text search index. """
+        ins = self.squeak_fts.insert().values(
+            rowid=get_search_rowid(squeak_hash),
+            content=content,
+            hash=squeak_hash,
+        )
+        connection.execute(ins)
+
+    def _delete_squeak_search_row(self, connection, squeak_hash: bytes) -> None:
+        """ Remove the squeak content from the full text search index. """
+        delete_stmt = self.squeak_fts.delete().where(
+            self.squeak_fts.c.rowid == get_search_rowid(squeak_hash)
+        )
+        connection.execute(delete_stmt)
 
     def insert_peer(self, squeak_peer: SqueakPeer) -> int:
         """ Insert a new squeak peer. """
@@ -1068,6 +1565,69 @@ class SqueakDb:
         with self.get_connection() as connection:
             connection.execute(delete_peer_stmt)
 
+    def get_sync_watermark(self, peer_address: PeerAddress) -> Optional[SyncWatermark]:
+        """ Get the sync watermark of a peer. """
+        s = (
+            select([self.peer_sync_watermarks])
+            .where(self.peer_sync_watermarks.c.network == peer_address.network.name)
+            .where(self.peer_sync_watermarks.c.host == peer_address.host)
+            .where(self.peer_sync_watermarks.c.port == peer_address.port)
+        )
+        with self.get_connection() as connection:
+            result = connection.execute(s)
+            row = result.fetchone()
+            if row is None:
+                return None
+            return self._parse_sync_watermark(row)
+
+    def set_sync_watermark(self, sync_watermark: SyncWatermark) -> None:
+        """ Insert or replace the sync watermark of a peer. """
+        peer_address = sync_watermark.peer_address
+        values = dict(
+            public_keys_digest=sync_watermark.public_keys_digest,
+            block_height=sync_watermark.block_height,
+            block_hash=sync_watermark.block_hash,
+            updated_time_ms=self.timestamp_now_ms,
+        )
+        with self.get_transaction() as connection:
+            if self.dialect_name in ("sqlite", "postgresql"):
+                insert = (
+                    sqlite.insert if self.dialect_name == "sqlite"
+                    else postgresql.insert
+                )
+                ins = insert(self.peer_sync_watermarks).values(
+                    network=peer_address.network.name,
+                    host=peer_address.host,
+                    port=peer_address.port,
+                    **values,
+                )
+                upsert = ins.on_conflict_do_update(
+                    index_elements=[
+                        self.peer_sync_watermarks.c.network,
+                        self.peer_sync_watermarks.c.host,
+                        self.peer_sync_watermarks.c.port,
+                    ],
+                    set_=values,
+                )
+                connection.execute(upsert)
+                return
+            res = connection.execute(
+                self.peer_sync_watermarks.update()
+                .where(self.peer_sync_watermarks.c.network == peer_address.network.name)
+                .where(self.peer_sync_watermarks.c.host == peer_address.host)
+                .where(self.peer_sync_watermarks.c.port == peer_address.port)
+                .values(**values)
+            )
+            if res.rowcount == 0:
+                connection.execute(
+                    self.peer_sync_watermarks.insert().values(
+                        network=peer_address.network.name,
+                        host=peer_address.host,
+                        port=peer_address.port,
+                        **values,
+                    )
+                )
+
     def insert_received_offer(self, received_offer: ReceivedOffer) -> Optional[int]:
         """ Insert a new received offer.
 
@@ -1808,8 +2368,67 @@ class SqueakDb:
         with self.get_connection() as connection:
             connection.execute(delete_twitter_account_stmt)
 
+    def _squeak_entry_select(self, squeaks_from=None):
+        """ Select only the columns that are needed to parse a squeak
+        entry, with the author and recipient profiles joined.
+        """
+        squeaks_from = squeaks_from if (
+            squeaks_from is not None) else self.squeaks
+        if self.profile_lookup is not None:
+            return (
+                select(self._squeak_entry_columns())
+                .select_from(squeaks_from)
+            )
+        return (
+            select(
+                self._squeak_entry_columns()
+                + self._squeak_entry_profile_columns(self.author_profiles)
+                + self._squeak_entry_profile_columns(self.recipient_profiles)
+            )
+            .select_from(
+                squeaks_from
+                .outerjoin(
+                    self.author_profiles,
+                    self.author_profiles.c.public_key == self.squeaks.c.author_public_key,
+                )
+                .outerjoin(
+                    self.recipient_profiles,
+                    self.recipient_profiles.c.public_key == self.squeaks.c.recipient_public_key,
+                )
+            )
+        )
+
+    def _squeak_entry_columns(self):
+        return [
+            self.squeaks.c.hash,
+            self.squeaks.c.squeak,
+            self.squeaks.c.reply_hash,
+            self.squeaks.c.block_hash,
+            self.squeaks.c.block_height,
+            self.squeaks.c.time_s,
+            self.squeaks.c.author_public_key,
+            self.squeaks.c.recipient_public_key,
+            self.squeaks.c.secret_key,
+            self.squeaks.c.block_time_s,
+            self.squeaks.c.liked_time_ms,
+            self.squeaks.c.content,
+        ]
+
+    def _squeak_entry_profile_columns(self, profiles_table):
+        return [
+            profiles_table.c.profile_id,
+            profiles_table.c.profile_name,
+            profiles_table.c.private_key,
+            profiles_table.c.public_key,
+            profiles_table.c.following,
+            profiles_table.c.profile_image_hash,
+        ]
+
     def _parse_squeak(self, row) -> CSqueak:
-        return CSqueak.deserialize(row["squeak"])
+        return self.squeak_cache.parse(row["squeak"], key=row["hash"])
+
+    def _parse_public_key(self, public_key_bytes: bytes) -> SqueakPublicKey:
+        return self.public_key_cache.parse(public_key_bytes)
 
     # def _parse_squeak_entry(self, row, author_profiles_table=None, recipient_profiles_table=None) -> SqueakEntry:
     def _parse_squeak_entry(self, row) -> SqueakEntry:
@@ -1820,15 +2439,20 @@ class SqueakDb:
         reply_to = (
             row["reply_hash"]) if row["reply_hash"] else None
         liked_time_ms = row["liked_time_ms"]
-        profile = self._try_parse_squeak_profile(
-            row, profiles_table=self.author_profiles)
-        recipient_profile = self._try_parse_squeak_profile(
-            row, profiles_table=self.recipient_profiles)
+        if self.profile_lookup is not None:
+            profile = self.profile_lookup(public_key_bytes)
+            recipient_profile = self.profile_lookup(
+                recipient_public_key_bytes) if recipient_public_key_bytes else None
+        else:
+            profile = self._try_parse_squeak_profile(
+                row, profiles_table=self.author_profiles)
+            recipient_profile = self._try_parse_squeak_profile(
+                row, profiles_table=self.recipient_profiles)
         return SqueakEntry(
             squeak_hash=(row["hash"]),
             serialized_squeak=(row["squeak"]),
-            public_key=SqueakPublicKey.from_bytes(public_key_bytes),
-            recipient_public_key=SqueakPublicKey.from_bytes(
+            public_key=self._parse_public_key(public_key_bytes),
+            recipient_public_key=self._parse_public_key(
                 recipient_public_key_bytes) if recipient_public_key_bytes else None,
             block_height=row["block_height"],
             block_hash=(row["block_hash"]),
@@ -1854,10 +2478,10 @@ class SqueakDb:
             profile_id=row[profiles_table.c.profile_id],
             profile_name=row[profiles_table.c.profile_name],
             private_key=private_key,
-            public_key=SqueakPublicKey.from_bytes(
+            public_key=self._parse_public_key(
                 row[profiles_table.c.public_key]),
             following=row[profiles_table.c.following],
-            profile_image=row[profiles_table.c.profile_image],
+            profile_image_hash=row[profiles_table.c.profile_image_hash],
         )
 
     def _try_parse_squeak_profile(self, row, profiles_table=None) -> Optional[SqueakProfile]:
@@ -1881,6 +2505,18 @@ class SqueakDb:
             share_for_free=row["share_for_free"],
         )
 
+    def _parse_sync_watermark(self, row) -> SyncWatermark:
+        return SyncWatermark(
+            peer_address=PeerAddress(
+                network=Network[row["network"]],
+                host=row["host"],
+                port=row["port"],
+            ),
+            public_keys_digest=row["public_keys_digest"],
+            block_height=row["block_height"],
+            block_hash=row["block_hash"],
+        )
+
     def _parse_received_offer(self, row) -> ReceivedOffer:
         return ReceivedOffer(
             received_offer_id=row["received_offer_id"],
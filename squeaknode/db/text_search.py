@@ -0,0 +1,88 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import re
+from typing import List
+
+
+SQUEAK_FTS_TABLE = "squeak_fts"
+SQUEAK_TSVECTOR_COLUMN = "content_tsv"
+TEXT_SEARCH_CONFIG = "simple"
+
+SEARCH_TOKEN_RE = re.compile(r"\w+")
+
+
+def get_search_tokens(search_text: str) -> List[str]:
+    """Split the search text into lowercase word tokens.
+
+    Args:
+        search_text: The text entered by the user.
+
+    Returns:
+        List[str]: the word tokens, without any punctuation.
+    """
+    return SEARCH_TOKEN_RE.findall(search_text.lower())
+
+
+def get_fts5_match_query(search_text: str) -> str:
+    """Get an FTS5 MATCH expression that matches every token as a prefix.
+
+    Args:
+        search_text: The text entered by the user.
+
+    Returns:
+        str: the FTS5 query string.
+    """
+    return " ".join(
+        '"{}"*'.format(token)
+        for token in get_search_tokens(search_text)
+    )
+
+
+def get_tsquery(search_text: str) -> str:
+    """Get a Postgres tsquery that matches every token as a prefix.
+
+    Args:
+        search_text: The text entered by the user.
+
+    Returns:
+        str: the query string to be passed to `to_tsquery`.
+    """
+    return " & ".join(
+        "{}:*".format(token)
+        for token in get_search_tokens(search_text)
+    )
+
+
+def get_search_rowid(squeak_hash: bytes) -> int:
+    """Get the rowid of the FTS5 row that indexes a squeak.
+
+    The squeak table has no stable integer key, so the FTS5 rowid is
+    derived from the first 8 bytes of the squeak hash. This allows the
+    index row to be replaced or deleted without scanning the index.
+
+    Args:
+        squeak_hash: The hash of the squeak.
+
+    Returns:
+        int: a signed 64-bit integer.
+    """
+    return int.from_bytes(squeak_hash[:8], "big", signed=True)
@@ -0,0 +1,269 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import logging
+import threading
+from collections import deque
+from contextlib import contextmanager
+from enum import Enum
+from typing import Any
+from typing import Callable
+from typing import Deque
+from typing import Dict
+from typing import Hashable
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+from typing import Tuple
+
+from squeaknode.node.event_bus_stats import EventBusStats
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_MAX_QUEUE_SIZE = 1000
+DEFAULT_POLL_INTERVAL_S = 1
+
+
+class OverflowPolicy(Enum):
+    """What to do with a new item when a subscriber's buffer is full."""
+    # Drop the oldest buffered item.
+    DROP_OLDEST = "drop_oldest"
+    # Drop the subscriber.
+    DISCONNECT = "disconnect"
+    # Replace a buffered item that has the same key, or else drop the
+    # oldest buffered item.
+    COALESCE = "coalesce"
+
+
+class SubscriptionOverflowError(Exception):
+    pass
+
+
+def identity(item: Any) -> Hashable:
+    return item
+
+
+def no_topics(item: Any) -> Iterable[Hashable]:
+    return ()
+
+
+class EventSubscription:
+    """Ring buffer of the items published to a single subscriber.
+
+    Adding an item never blocks the publisher. The subscriber waits on a
+    condition instead of a separate thread, and checks `stopped` every
+    `poll_interval_s` seconds.
+    """
+
+    def __init__(
+            self,
+            max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+            overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+            coalesce_key: Callable[[Any], Hashable] = identity,
+    ):
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = overflow_policy
+        self.coalesce_key = coalesce_key
+        self.items: Deque[Any] = deque()
+        self.condition = threading.Condition()
+        self.disconnected = False
+        self.num_delivered = 0
+        self.num_dropped = 0
+
+    def put(self, item: Any) -> None:
+        with self.condition:
+            if self.disconnected:
+                self.num_dropped += 1
+                return
+            if len(self.items) >= self.max_queue_size:
+                self.handle_overflow(item)
+            else:
+                self.items.append(item)
+            self.condition.notify()
+
+    def handle_overflow(self, item: Any) -> None:
+        if self.overflow_policy is OverflowPolicy.DISCONNECT:
+            logger.warning("Disconnecting slow subscriber.")
+            self.num_dropped += len(self.items) + 1
+            self.items.clear()
+            self.disconnected = True
+            return
+        if self.overflow_policy is OverflowPolicy.COALESCE:
+            key = self.coalesce_key(item)
+            for i in reversed(range(len(self.items))):
+                if self.coalesce_key(self.items[i]) == key:
+                    self.items[i] = item
+                    self.num_dropped += 1
+                    return
+        self.items.popleft()
+        self.items.append(item)
+        self.num_dropped += 1
+
+    def get_lag(self) -> int:
+        with self.condition:
+            return len(self.items)
+
+    def get_items(
+            self,
+            stopped: threading.Event,
+            poll_interval_s: float = DEFAULT_POLL_INTERVAL_S,
+    ) -> Iterator[Any]:
+        """Yield the buffered items until `stopped` is set.
+
+        Raises:
+            SubscriptionOverflowError: If the subscriber was disconnected
+                because its buffer was full.
+        """
+        while True:
+            with self.condition:
+                while not self.items and not self.disconnected \
+                        and not stopped.is_set():
+                    self.condition.wait(poll_interval_s)
+                if self.disconnected:
+                    raise SubscriptionOverflowError()
+                if stopped.is_set():
+                    return
+                item = self.items.popleft()
+                self.num_delivered += 1
+            yield item
+
+
+class EventBus:
+    """Publishes items to many subscribers without blocking.
+
+    Each subscriber gets its own ring buffer, so a slow subscriber only
+    affects itself. Callbacks are called on the publishing thread, so
+    they must not block.
+
+    A subscriber can subscribe to a single topic instead of all items.
+    Subscriptions are indexed by topic, and each item is only delivered
+    to the subscribers of the topics returned by `get_topics`.
+    """
+
+    def __init__(
+            self,
+            max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+            overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+            coalesce_key: Callable[[Any], Hashable] = identity,
+            poll_interval_s: float = DEFAULT_POLL_INTERVAL_S,
+            get_topics: Callable[[Any], Iterable[Hashable]] = no_topics,
+    ):
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = overflow_policy
+        self.coalesce_key = coalesce_key
+        self.poll_interval_s = poll_interval_s
+        self.get_topics = get_topics
+        # Subscriptions by topic, with the `None` topic for all items.
+        # Replaced on each change, so that publish can iterate
+        # without holding the lock.
+        self.subscriptions: Dict[Optional[Hashable],
+                                 Tuple[EventSubscription, ...]] = {}
+        self.callbacks: Dict[str, Callable[[Any], None]] = {}
+        self.lock = threading.Lock()
+        self.num_published = 0
+        self.num_delivered = 0
+        self.num_dropped = 0
+        self.num_disconnected = 0
+
+    def publish(self, item: Any) -> None:
+        with self.lock:
+            self.num_published += 1
+            callbacks = list(self.callbacks.values())
+        subscriptions = self.subscriptions
+        for subscription in subscriptions.get(None, ()):
+            subscription.put(item)
+        # Only get the topics of the item if some subscriber needs them.
+        if len(subscriptions) > int(None in subscriptions):
+            for topic in self.get_topics(item):
+                for subscription in subscriptions.get(topic, ()):
+                    subscription.put(item)
+        for callback in callbacks:
+            callback(item)
+
+    def has_subscribers(self) -> bool:
+        return bool(self.subscriptions) or bool(self.callbacks)
+
+    def add_callback(self, name: str, callback: Callable[[Any], None]) -> None:
+        with self.lock:
+            self.callbacks[name] = callback
+
+    def remove_callback(self, name: str) -> None:
+        with self.lock:
+            del self.callbacks[name]
+
+    @contextmanager
+    def get_subscription(
+            self,
+            topic: Optional[Hashable] = None,
+    ) -> Iterator[EventSubscription]:
+        subscription = EventSubscription(
+            max_queue_size=self.max_queue_size,
+            overflow_policy=self.overflow_policy,
+            coalesce_key=self.coalesce_key,
+        )
+        with self.lock:
+            subscriptions = dict(self.subscriptions)
+            subscriptions[topic] = subscriptions.get(
+                topic, ()) + (subscription,)
+            self.subscriptions = subscriptions
+        try:
+            yield subscription
+        finally:
+            with self.lock:
+                subscriptions = dict(self.subscriptions)
+                subscriptions[topic] = tuple(
+                    s for s in subscriptions[topic] if s is not subscription
+                )
+                if not subscriptions[topic]:
+                    del subscriptions[topic]
+                self.subscriptions = subscriptions
+                self.num_delivered += subscription.num_delivered
+                self.num_dropped += subscription.num_dropped
+                self.num_disconnected += int(subscription.disconnected)
+
+    def yield_items(
+            self,
+            stopped: threading.Event,
+            topic: Optional[Hashable] = None,
+    ) -> Iterator[Any]:
+        with self.get_subscription(topic) as subscription:
+            yield from subscription.get_items(stopped, self.poll_interval_s)
+
+    def get_stats(self) -> EventBusStats:
+        with self.lock:
+            subscriptions = [
+                subscription
+                for topic_subscriptions in self.subscriptions.values()
+                for subscription in topic_subscriptions
+            ]
+            return EventBusStats(
+                num_subscribers=len(subscriptions),
+                num_published=self.num_published,
+                num_delivered=self.num_delivered + sum(
+                    s.num_delivered for s in subscriptions),
+                num_dropped=self.num_dropped + sum(
+                    s.num_dropped for s in subscriptions),
+                num_disconnected=self.num_disconnected + sum(
+                    int(s.disconnected) for s in subscriptions),
+                max_lag=max(
+                    (s.get_lag() for s in subscriptions), default=0),
+            )
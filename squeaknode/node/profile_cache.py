@@ -0,0 +1,144 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import threading
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from squeak.core.keys import SqueakPublicKey
+
+from squeaknode.core.squeak_profile import SqueakProfile
+from squeaknode.db.squeak_db import SqueakDb
+from squeaknode.node.profile_cache_stats import ProfileCacheStats
+
+
+class ProfileCache:
+    """Keeps all of the profiles in memory, indexed by id and by public key.
+
+    The profiles are loaded from the database on the first lookup. Every
+    write to the profiles table must be followed by a call to `put` or
+    `remove`, so that the cache stays the same as the table.
+    """
+
+    def __init__(self, squeak_db: SqueakDb):
+        self.squeak_db = squeak_db
+        self.profiles: Optional[Dict[int, SqueakProfile]] = None
+        self.profiles_by_public_key: Dict[bytes, SqueakProfile] = {}
+        self.num_hits = 0
+        self.num_misses = 0
+        self.lock = threading.Lock()
+
+    def _get_profiles(self) -> Dict[int, SqueakProfile]:
+        # Must be called with the lock held.
+        if self.profiles is None:
+            self.num_misses += 1
+            self.profiles = {}
+            self.profiles_by_public_key = {}
+            for profile in self.squeak_db.get_profiles():
+                self._index(profile)
+        else:
+            self.num_hits += 1
+        return self.profiles
+
+    def _index(self, profile: SqueakProfile) -> None:
+        assert self.profiles is not None
+        assert profile.profile_id is not None
+        self.profiles[profile.profile_id] = profile
+        self.profiles_by_public_key[profile.public_key.to_bytes()] = profile
+
+    def _select(self, predicate: Callable[[SqueakProfile], bool]) -> List[SqueakProfile]:
+        with self.lock:
+            profiles = self._get_profiles()
+            return [
+                profile for profile_id, profile in sorted(profiles.items())
+                if predicate(profile)
+            ]
+
+    def get_profiles(self) -> List[SqueakProfile]:
+        return self._select(lambda profile: True)
+
+    def get_signing_profiles(self) -> List[SqueakProfile]:
+        return self._select(lambda profile: profile.private_key is not None)
+
+    def get_contact_profiles(self) -> List[SqueakProfile]:
+        return self._select(lambda profile: profile.private_key is None)
+
+    def get_following_profiles(self) -> List[SqueakProfile]:
+        return self._select(lambda profile: profile.following)
+
+    def get_profile(self, profile_id: int) -> Optional[SqueakProfile]:
+        with self.lock:
+            return self._get_profiles().get(profile_id)
+
+    def get_profile_by_public_key(self, public_key: SqueakPublicKey) -> Optional[SqueakProfile]:
+        return self.get_profile_by_public_key_bytes(public_key.to_bytes())
+
+    def get_profile_by_public_key_bytes(self, public_key_bytes: bytes) -> Optional[SqueakProfile]:
+        with self.lock:
+            self._get_profiles()
+            return self.profiles_by_public_key.get(public_key_bytes)
+
+    def get_profile_by_name(self, name: str) -> Optional[SqueakProfile]:
+        for profile in self._select(lambda profile: profile.profile_name == name):
+            return profile
+        return None
+
+    def put(self, profile: SqueakProfile) -> None:
+        with self.lock:
+            # The profile is read from the database on the first lookup.
+            if self.profiles is None:
+                return
+            self._index(profile)
+
+    def update(self, profile_id: int, **values) -> None:
+        """Replace the given fields of a cached profile."""
+        with self.lock:
+            if self.profiles is None:
+                return
+            profile = self.profiles.get(profile_id)
+            if profile is None:
+                return
+            self._index(profile._replace(**values))
+
+    def remove(self, profile_id: int) -> None:
+        with self.lock:
+            if self.profiles is None:
+                return
+            profile = self.profiles.pop(profile_id, None)
+            if profile is None:
+                return
+            self.profiles_by_public_key.pop(
+                profile.public_key.to_bytes(), None)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.profiles = None
+            self.profiles_by_public_key = {}
+
+    def get_stats(self) -> ProfileCacheStats:
+        with self.lock:
+            return ProfileCacheStats(
+                num_profiles=len(self.profiles or {}),
+                num_hits=self.num_hits,
+                num_misses=self.num_misses,
+            )
@@ -21,6 +21,7 @@
 # SOFTWARE.
 import logging
 import threading
+from typing import Dict
 from typing import List
 from typing import Optional
 
@@ -28,8 +29,10 @@ from squeak.core import CSqueak
 from squeak.core.keys import SqueakPrivateKey
 from squeak.core.keys import SqueakPublicKey
 
+from squeaknode.client.peer_health import PeerHealth
 from squeaknode.core.download_result import DownloadResult
 from squeaknode.core.lightning_address import LightningAddressHostPort
+from squeaknode.core.lookup_cursor import LookupCursor
 from squeaknode.core.offer import Offer
 from squeaknode.core.peer_address import Network
 from squeaknode.core.peer_address import PeerAddress
@@ -41,8 +44,9 @@ from squeaknode.core.sent_payment_summary import SentPaymentSummary
 from squeaknode.core.squeak_entry import SqueakEntry
 from squeaknode.core.squeak_peer import SqueakPeer
 from squeaknode.core.squeak_profile import SqueakProfile
-from squeaknode.core.squeaks import get_hash
+from squeaknode.core.squeak_topic import SqueakTopic
 from squeaknode.core.twitter_account_entry import TwitterAccountEntry
+from squeaknode.node.profile_cache_stats import ProfileCacheStats
 from squeaknode.node.received_payments_subscription_client import ReceivedPaymentsSubscriptionClient
 from squeaknode.node.squeak_store import SqueakStore
 
@@ -124,9 +128,21 @@ class SqueakController:
     def get_squeak(self, squeak_hash: bytes) -> Optional[CSqueak]:
         return self.squeak_store.get_squeak(squeak_hash)
 
+    def get_squeak_bytes(self, squeak_hash: bytes) -> Optional[bytes]:
+        return self.squeak_store.get_squeak_bytes(squeak_hash)
+
     def get_squeak_secret_key(self, squeak_hash: bytes) -> Optional[bytes]:
         return self.squeak_store.get_squeak_secret_key(squeak_hash)
 
+    def get_squeaks(self, squeak_hashes: List[bytes]) -> Dict[bytes, CSqueak]:
+        return self.squeak_store.get_squeaks(squeak_hashes)
+
+    def get_squeaks_bytes(self, squeak_hashes: List[bytes]) -> Dict[bytes, bytes]:
+        return self.squeak_store.get_squeaks_bytes(squeak_hashes)
+
+    def get_squeak_secret_keys(self, squeak_hashes: List[bytes]) -> Dict[bytes, bytes]:
+        return self.squeak_store.get_squeak_secret_keys(squeak_hashes)
+
     def delete_squeak(self, squeak_hash: bytes) -> None:
         self.squeak_store.delete_squeak(squeak_hash)
 
@@ -166,12 +182,18 @@ class SqueakController:
     def delete_squeak_profile(self, profile_id: int) -> None:
         return self.squeak_store.delete_squeak_profile(profile_id)
 
-    def set_squeak_profile_image(self, profile_id: int, profile_image: bytes) -> None:
+    def set_squeak_profile_image(self, profile_id: int, profile_image: bytes) -> bytes:
         return self.squeak_store.set_squeak_profile_image(profile_id, profile_image)
 
     def clear_squeak_profile_image(self, profile_id: int) -> None:
         return self.squeak_store.clear_squeak_profile_image(profile_id)
 
+    def get_profile_image(self, image_hash: bytes) -> Optional[bytes]:
+        return self.squeak_store.get_profile_image(image_hash)
+
+    def get_profile_cache_stats(self) -> ProfileCacheStats:
+        return self.squeak_store.get_profile_cache_stats()
+
     def get_squeak_profile_private_key(self, profile_id: int) -> bytes:
         return self.squeak_store.get_squeak_profile_private_key(profile_id)
 
@@ -190,6 +212,9 @@ class SqueakController:
     def get_autoconnect_peers(self) -> List[SqueakPeer]:
         return self.squeak_store.get_autoconnect_peers()
 
+    def get_peer_health(self) -> Dict[PeerAddress, PeerHealth]:
+        return self.network_controller.get_peer_health()
+
     def set_peer_autoconnect(self, peer_id: int, autoconnect: bool):
         return self.squeak_store.set_peer_autoconnect(peer_id, autoconnect)
 
@@ -300,8 +325,43 @@ class SqueakController:
         return self.squeak_store.get_squeak_entry(squeak_hash)
 
     def download_single_squeak(self, squeak_hash: bytes) -> DownloadResult:
-        self.network_controller.download_single_squeak(squeak_hash)
-        return DownloadResult(1, 1, 0, 9999)
+        return self.network_controller.download_single_squeak(squeak_hash)
+
+    def download_squeaks(
+            self,
+            public_keys: List[SqueakPublicKey],
+            min_block: Optional[int],
+            max_block: Optional[int],
+            replyto_hash: Optional[bytes],
+    ) -> DownloadResult:
+        return self.network_controller.download_squeaks(
+            public_keys,
+            min_block,
+            max_block,
+            replyto_hash,
+        )
+
+    def download_offers(self, squeak_hash: bytes) -> DownloadResult:
+        return self.network_controller.download_offers(squeak_hash)
+
+    def download_replies(self, squeak_hash: bytes) -> DownloadResult:
+        return self.network_controller.download_squeaks(
+            [],
+            None,
+            None,
+            squeak_hash,
+        )
+
+    def download_public_key_squeaks(self, public_key: SqueakPublicKey) -> DownloadResult:
+        max_block = self.squeak_store.get_latest_block()
+        min_block = max(
+            0, max_block - self.config.node.interest_block_interval)
+        return self.network_controller.download_squeaks(
+            [public_key],
+            min_block,
+            max_block,
+            None,
+        )
 
     def get_timeline_squeak_entries(
             self,
@@ -331,6 +391,24 @@ class SqueakController:
             reply_to_hash,
         )
 
+    def lookup_squeak_cursors(
+            self,
+            public_keys: List[SqueakPublicKey],
+            min_block: Optional[int],
+            max_block: Optional[int],
+            reply_to_hash: Optional[bytes],
+            limit: int,
+            last_cursor: Optional[LookupCursor],
+    ) -> List[LookupCursor]:
+        return self.squeak_store.lookup_squeak_cursors(
+            public_keys,
+            min_block,
+            max_block,
+            reply_to_hash,
+            limit,
+            last_cursor,
+        )
+
     def get_squeak_entries_for_public_key(
             self,
             public_key: SqueakPublicKey,
@@ -417,38 +495,38 @@ class SqueakController:
         )
 
     def subscribe_squeak_entry(self, squeak_hash: bytes, stopped: threading.Event):
-        for item in self.squeak_store.subscribe_new_squeaks(stopped):
-            if squeak_hash == get_hash(item):
-                yield self.get_squeak_entry(squeak_hash)
+        yield from self.squeak_store.subscribe_new_squeak_entries(
+            stopped,
+            SqueakTopic.squeak_hash(squeak_hash),
+        )
 
     def subscribe_squeak_reply_entries(self, squeak_hash: bytes, stopped: threading.Event):
-        for item in self.squeak_store.subscribe_new_squeaks(stopped):
-            if squeak_hash == item.hashReplySqk:
-                reply_hash = get_hash(item)
-                yield self.get_squeak_entry(reply_hash)
+        yield from self.squeak_store.subscribe_new_squeak_entries(
+            stopped,
+            SqueakTopic.reply_to(squeak_hash),
+        )
 
     def subscribe_squeak_public_key_entries(self, public_key: SqueakPublicKey, stopped: threading.Event):
-        for item in self.squeak_store.subscribe_new_squeaks(stopped):
-            if public_key == item.GetPubKey():
-                squeak_hash = get_hash(item)
-                yield self.get_squeak_entry(squeak_hash)
+        yield from self.squeak_store.subscribe_new_squeak_entries(
+            stopped,
+            SqueakTopic.public_key(public_key),
+        )
 
     def subscribe_squeak_ancestor_entries(self, squeak_hash: bytes, stopped: threading.Event):
-        for item in self.squeak_store.subscribe_new_squeaks(stopped):
-            if squeak_hash == get_hash(item):
-                yield self.get_ancestor_squeak_entries(squeak_hash)
+        for _ in self.squeak_store.subscribe_new_squeak_entries(
+                stopped,
+                SqueakTopic.squeak_hash(squeak_hash),
+        ):
+            yield self.get_ancestor_squeak_entries(squeak_hash)
 
     def subscribe_squeak_entries(self, stopped: threading.Event):
-        for item in self.squeak_store.subscribe_new_squeaks(stopped):
-            squeak_hash = get_hash(item)
-            yield self.get_squeak_entry(squeak_hash)
+        yield from self.squeak_store.subscribe_new_squeak_entries(stopped)
 
     def subscribe_timeline_squeak_entries(self, stopped: threading.Event):
-        for item in self.squeak_store.subscribe_new_squeaks(stopped):
-            followed_public_keys = self.squeak_store.get_followed_public_keys()
-            if item.GetPubKey() in set(followed_public_keys):
-                squeak_hash = get_hash(item)
-                yield self.get_squeak_entry(squeak_hash)
+        yield from self.squeak_store.subscribe_new_squeak_entries(
+            stopped,
+            SqueakTopic.timeline(),
+        )
 
     def get_external_address(self) -> PeerAddress:
         return PeerAddress(
@@ -20,7 +20,11 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 import logging
+import threading
+from typing import Optional
 
+from squeaknode.bitcoin.block_info import BlockInfo
+from squeaknode.bitcoin.block_tip_tracker import BlockTipTracker
 from squeaknode.client.network_controller import NetworkController
 from squeaknode.node.periodic_worker import PeriodicWorker
 from squeaknode.node.squeak_store import SqueakStore
@@ -35,16 +39,42 @@ class SqueakDownloadWorker(PeriodicWorker):
         network_controller: NetworkController,
         download_timeline_interval_s: int,
         interest_block_interval: int,
+        block_tip_tracker: Optional[BlockTipTracker] = None,
     ):
         self.squeak_store = squeak_store
         self.download_timeline_interval_s = download_timeline_interval_s
         self.interest_block_interval = interest_block_interval
         self.network_controller = network_controller
+        self.block_tip_tracker = block_tip_tracker
+        self.download_lock = threading.Lock()
+
+    def start(self) -> None:
+        if self.block_tip_tracker is not None:
+            self.block_tip_tracker.new_block_listener.add_callback(
+                self.get_name(),
+                self.handle_new_block,
+            )
+        super().start()
+
+    def handle_new_block(self, block_info: BlockInfo) -> None:
+        # Download the new block range without blocking the tracker.
+        threading.Thread(
+            target=self.work_fn,
+            name="{}_new_block_thread".format(self.get_name()),
+            daemon=True,
+        ).start()
 
     def work_fn(self):
-        self.network_controller.download_timeline(
-            self.interest_block_interval,
-        )
+        # Skip if a download is already in progress.
+        if not self.download_lock.acquire(blocking=False):
+            logger.debug("Download already in progress.")
+            return
+        try:
+            self.network_controller.download_timeline(
+                self.interest_block_interval,
+            )
+        finally:
+            self.download_lock.release()
 
     def get_interval_s(self):
         return self.download_timeline_interval_s
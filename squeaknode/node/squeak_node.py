@@ -28,13 +28,21 @@ from squeaknode.admin.squeak_admin_server_handler import SqueakAdminServerHandle
 from squeaknode.admin.squeak_admin_server_servicer import SqueakAdminServerServicer
 from squeaknode.admin.webapp.app import SqueakAdminWebServer
 from squeaknode.bitcoin.bitcoin_core_client import BitcoinCoreClient
+from squeaknode.bitcoin.block_info_cache import BlockInfoCache
+from squeaknode.bitcoin.block_tip_tracker import BlockTipTracker
+from squeaknode.bitcoin.cached_bitcoin_client import CachedBitcoinClient
+from squeaknode.client.async_network_controller import AsyncNetworkControllerFacade
 from squeaknode.client.network_controller import NetworkController
+from squeaknode.client.peer_concurrency_limiter import PeerConcurrencyLimiter
+from squeaknode.client.peer_health_tracker import PeerHealthTracker
+from squeaknode.client.peer_session_registry import PeerSessionRegistry
 from squeaknode.config.config import SqueaknodeConfig
 from squeaknode.core.squeak_core import SqueakCore
 from squeaknode.db.db_engine import get_connection_string
 from squeaknode.db.db_engine import get_engine
 from squeaknode.db.squeak_db import SqueakDb
 from squeaknode.lightning.lnd_lightning_client import LNDLightningClient
+from squeaknode.node.event_bus import OverflowPolicy
 from squeaknode.node.node_settings import NodeSettings
 from squeaknode.node.payment_processor import PaymentProcessor
 from squeaknode.node.process_forward_tweets_worker import ProcessForwardTweetsWorker
@@ -81,7 +89,10 @@ class SqueakNode:
 
     def start_running(self):
         self.squeak_db.init_with_retries()
+        if self.config.node.check_squeak_counts:
+            self.squeak_store.check_squeak_counts()
         self.lightning_client.init()
+        self.block_tip_tracker.start()
 
         if self.config.rpc.enabled:
             self.admin_rpc_server.start()
@@ -100,6 +111,8 @@ class SqueakNode:
         self.peer_web_server.stop()
         self.received_payment_processor_worker.stop_running()
         self.forward_tweets_processor_worker.stop_running()
+        self.block_tip_tracker.stop()
+        self.network_controller.close()
 
     def set_network_params(self):
         SelectParams(self.config.node.network)
@@ -126,14 +139,32 @@ class SqueakNode:
         )
 
     def create_bitcoin_client(self):
-        self.bitcoin_client = BitcoinCoreClient(
+        bitcoin_core_client = BitcoinCoreClient(
             self.config.bitcoin.rpc_host,
             self.config.bitcoin.rpc_port,
             self.config.bitcoin.rpc_user,
             self.config.bitcoin.rpc_pass,
             self.config.bitcoin.rpc_use_ssl,
             self.config.bitcoin.rpc_ssl_cert,
+            pool_size=self.config.bitcoin.rpc_pool_size,
+            timeout_s=self.config.bitcoin.rpc_timeout_s,
+            max_retries=self.config.bitcoin.rpc_max_retries,
+            backoff_factor=self.config.bitcoin.rpc_backoff_factor,
         )
+        cached_bitcoin_client = CachedBitcoinClient(
+            bitcoin_core_client,
+            BlockInfoCache(
+                max_size=self.config.bitcoin.block_cache_size,
+                min_depth=self.config.bitcoin.block_cache_min_depth,
+            ),
+        )
+        self.block_tip_tracker = BlockTipTracker(
+            cached_bitcoin_client,
+            self.config.bitcoin.rpc_host,
+            self.config.bitcoin.zeromq_hashblock_port,
+            poll_interval_s=self.config.bitcoin.block_poll_interval_s,
+        )
+        self.bitcoin_client = self.block_tip_tracker
 
     def create_squeak_core(self):
         self.squeak_core = SqueakCore(
@@ -150,6 +181,12 @@ class SqueakNode:
             self.config.node.squeak_retention_s,
             self.config.node.received_offer_retention_s,
             self.config.node.sent_offer_retention_s,
+            max_subscription_queue_size=self.config.node.subscription_queue_size,
+            subscription_overflow_policy=OverflowPolicy(
+                self.config.node.subscription_overflow_policy,
+            ),
+            profile_image_size_px=self.config.node.profile_image_size_px,
+            max_profile_image_upload_bytes=self.config.node.max_profile_image_upload_bytes,
         )
 
     def create_payment_processor(self):
@@ -166,10 +203,37 @@ class SqueakNode:
         )
 
     def create_network_controller(self):
+        peer_session_registry = PeerSessionRegistry(
+            pool_size=self.config.node.peer_connection_pool_size,
+            idle_timeout_s=self.config.node.peer_connection_idle_timeout_s,
+        )
+        peer_health_tracker = PeerHealthTracker(
+            peer_session_registry,
+            max_backoff_s=self.config.node.peer_max_backoff_s,
+        )
+        if self.config.node.peer_async_networking:
+            self.network_controller = AsyncNetworkControllerFacade(
+                self.squeak_store,
+                self.config.tor.proxy_ip,
+                self.config.tor.proxy_port,
+                peer_session_registry=peer_session_registry,
+                max_connections_per_peer=self.config.node.peer_max_concurrent_requests,
+                download_timeout_s=self.config.node.download_timeout_s,
+                peer_health_tracker=peer_health_tracker,
+                max_peer_time_s=self.config.node.peer_round_time_limit_s,
+            )
+            return
         self.network_controller = NetworkController(
             self.squeak_store,
             self.config.tor.proxy_ip,
             self.config.tor.proxy_port,
+            peer_session_registry=peer_session_registry,
+            peer_limiter=PeerConcurrencyLimiter(
+                max_requests_per_peer=self.config.node.peer_max_concurrent_requests,
+            ),
+            download_timeout_s=self.config.node.download_timeout_s,
+            peer_health_tracker=peer_health_tracker,
+            max_peer_time_s=self.config.node.peer_round_time_limit_s,
         )
 
     def create_squeak_controller(self):
@@ -186,6 +250,7 @@ class SqueakNode:
         self.admin_handler = SqueakAdminServerHandler(
             self.lightning_client,
             self.squeak_controller,
+            inline_profile_images=self.config.webadmin.inline_profile_images,
         )
 
     def create_peer_handler(self):
@@ -238,6 +303,7 @@ class SqueakNode:
             self.network_controller,
             self.config.node.peer_download_interval_s,
             self.config.node.interest_block_interval,
+            block_tip_tracker=self.block_tip_tracker,
         )
 
     def create_offer_expiry_worker(self):
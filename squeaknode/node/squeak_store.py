@@ -21,20 +21,30 @@
 # SOFTWARE.
 import logging
 import threading
+from typing import Dict
+from typing import FrozenSet
 from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Tuple
 
+from bitcoin.core import CBlockHeader
 from squeak.core import CheckSqueak
 from squeak.core import CheckSqueakSecretKey
 from squeak.core import CSqueak
 from squeak.core.keys import SqueakPrivateKey
 from squeak.core.keys import SqueakPublicKey
 
+from squeaknode.bitcoin.block_info import BlockInfo
 from squeaknode.core.lightning_address import LightningAddressHostPort
+from squeaknode.core.lookup_cursor import LookupCursor
 from squeaknode.core.offer import Offer
 from squeaknode.core.peer_address import PeerAddress
 from squeaknode.core.peers import create_saved_peer
+from squeaknode.core.profile_images import get_profile_image_hash
+from squeaknode.core.profile_images import MAX_PROFILE_IMAGE_UPLOAD_BYTES
+from squeaknode.core.profile_images import process_profile_image
+from squeaknode.core.profile_images import PROFILE_IMAGE_SIZE_PX
 from squeaknode.core.profiles import create_contact_profile
 from squeaknode.core.profiles import create_signing_profile
 from squeaknode.core.profiles import get_profile_private_key
@@ -48,16 +58,30 @@ from squeaknode.core.squeak_core import SqueakCore
 from squeaknode.core.squeak_entry import SqueakEntry
 from squeaknode.core.squeak_peer import SqueakPeer
 from squeaknode.core.squeak_profile import SqueakProfile
+from squeaknode.core.squeak_topic import get_squeak_entry_topics
+from squeaknode.core.squeak_topic import SqueakTopic
+from squeaknode.core.squeaks import get_hash
+from squeaknode.core.sync_watermark import SyncWatermark
 from squeaknode.core.twitter_account import TwitterAccount
 from squeaknode.core.twitter_account_entry import TwitterAccountEntry
 from squeaknode.core.update_subscriptions_event import UpdateSubscriptionsEvent
 from squeaknode.db.squeak_db import SqueakDb
-from squeaknode.node.listener_subscription_client import EventListener
+from squeaknode.node.event_bus import DEFAULT_MAX_QUEUE_SIZE
+from squeaknode.node.event_bus import EventBus
+from squeaknode.node.event_bus import OverflowPolicy
+from squeaknode.node.event_bus_stats import EventBusStats
+from squeaknode.node.profile_cache import ProfileCache
+from squeaknode.node.profile_cache_stats import ProfileCacheStats
+from squeaknode.node.ttl_cache import TtlCache
 
 
 logger = logging.getLogger(__name__)
 
 
+DEFAULT_SQUEAK_ENTRY_CACHE_SIZE = 1000
+DEFAULT_SQUEAK_ENTRY_CACHE_TTL_S = 10
+
+
 class SqueakStore:
 
     def __init__(
@@ -69,6 +93,12 @@ class SqueakStore:
         squeak_retention_s,
         received_offer_retention_s,
         sent_offer_retention_s,
+        max_subscription_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        subscription_overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        squeak_entry_cache_size: int = DEFAULT_SQUEAK_ENTRY_CACHE_SIZE,
+        squeak_entry_cache_ttl_s: float = DEFAULT_SQUEAK_ENTRY_CACHE_TTL_S,
+        profile_image_size_px: int = PROFILE_IMAGE_SIZE_PX,
+        max_profile_image_upload_bytes: int = MAX_PROFILE_IMAGE_UPLOAD_BYTES,
     ):
         self.squeak_db = squeak_db
         self.squeak_core = squeak_core
@@ -77,11 +107,47 @@ class SqueakStore:
         self.squeak_retention_s = squeak_retention_s
         self.received_offer_retention_s = received_offer_retention_s
         self.sent_offer_retention_s = sent_offer_retention_s
-        self.new_squeak_listener = EventListener()
-        self.new_received_offer_listener = EventListener()
-        self.new_secret_key_listener = EventListener()
-        self.new_follow_listener = EventListener()
-        self.twitter_stream_change_listener = EventListener()
+        self.profile_image_size_px = profile_image_size_px
+        self.max_profile_image_upload_bytes = max_profile_image_upload_bytes
+        self.profile_cache = ProfileCache(squeak_db)
+        # Attach the cached profiles to squeak entries instead of joining.
+        self.squeak_db.set_profile_lookup(
+            self.profile_cache.get_profile_by_public_key_bytes,
+        )
+        self.followed_public_keys: Optional[FrozenSet[SqueakPublicKey]] = None
+        self.followed_public_keys_lock = threading.Lock()
+        self.new_squeak_listener = EventBus(
+            max_subscription_queue_size,
+            subscription_overflow_policy,
+        )
+        self.new_squeak_entry_listener = EventBus(
+            max_subscription_queue_size,
+            subscription_overflow_policy,
+            get_topics=self.get_squeak_entry_topics,
+        )
+        self.squeak_entry_cache = TtlCache(
+            squeak_entry_cache_size,
+            squeak_entry_cache_ttl_s,
+        )
+        self.new_received_offer_listener = EventBus(
+            max_subscription_queue_size,
+            subscription_overflow_policy,
+            get_topics=lambda received_offer: (received_offer.squeak_hash,),
+        )
+        self.new_secret_key_listener = EventBus(
+            max_subscription_queue_size,
+            subscription_overflow_policy,
+        )
+        # Pending update events are all the same.
+        self.new_follow_listener = EventBus(
+            max_subscription_queue_size,
+            OverflowPolicy.COALESCE,
+            coalesce_key=type,
+        )
+        self.twitter_stream_change_listener = EventBus(
+            max_subscription_queue_size,
+            subscription_overflow_policy,
+        )
 
     def make_squeak(
             self,
@@ -144,9 +210,100 @@ class SqueakStore:
         logger.info("Saved squeak: {}".format(
             inserted_squeak_hash.hex(),
         ))
-        self.new_squeak_listener.handle_new_item(squeak)
+        self.new_squeak_listener.publish(squeak)
+        self.publish_squeak_entry(inserted_squeak_hash)
         return inserted_squeak_hash
 
+    def save_squeaks(self, squeaks: List[CSqueak]) -> List[bytes]:
+        """Save a batch of squeaks.
+
+        Invalid squeaks and squeaks that would exceed the limits are
+        skipped. The squeaks are inserted in a single transaction.
+
+        Returns:
+            List[bytes]: the hashes of the squeaks that were inserted.
+        """
+        # Check if the squeaks are valid.
+        checked_squeaks = [
+            squeak for squeak in squeaks
+            if self._is_valid_squeak(squeak)
+        ]
+        # Get the block headers for all squeaks in one batch.
+        block_headers = self.squeak_core.get_block_headers(checked_squeaks)
+        valid_squeaks = []
+        for squeak, block_header in zip(checked_squeaks, block_headers):
+            if block_header is None:
+                logger.warning("Skipping squeak with invalid block hash: {}".format(
+                    get_hash(squeak).hex(),
+                ))
+                continue
+            valid_squeaks.append((squeak, block_header))
+        # Check if limits exceeded.
+        accepted_squeaks = self._get_squeaks_within_limits(valid_squeaks)
+        # Insert the squeaks in db.
+        inserted_squeak_hashes = self.squeak_db.insert_squeaks(
+            accepted_squeaks,
+        )
+        inserted_squeak_hashes_set = set(inserted_squeak_hashes)
+        logger.info("Saved {} squeaks out of batch of {}.".format(
+            len(inserted_squeak_hashes),
+            len(squeaks),
+        ))
+        for squeak, _ in accepted_squeaks:
+            if get_hash(squeak) in inserted_squeak_hashes_set:
+                self.new_squeak_listener.publish(squeak)
+        for squeak_hash in inserted_squeak_hashes:
+            self.publish_squeak_entry(squeak_hash)
+        return inserted_squeak_hashes
+
+    def publish_squeak_entry(self, squeak_hash: bytes) -> None:
+        """Get the entry of a new squeak once and share it with all of
+        the entry subscribers.
+        """
+        if not self.new_squeak_entry_listener.has_subscribers():
+            return
+        squeak_entry = self.get_squeak_entry(squeak_hash)
+        if squeak_entry is not None:
+            self.new_squeak_entry_listener.publish(squeak_entry)
+
+    def _is_valid_squeak(self, squeak: CSqueak) -> bool:
+        try:
+            CheckSqueak(squeak)
+            return True
+        except Exception:
+            logger.warning("Skipping invalid squeak: {}".format(
+                get_hash(squeak).hex(),
+            ), exc_info=True)
+            return False
+
+    def _get_squeaks_within_limits(
+            self,
+            squeaks_with_headers: List[Tuple[CSqueak, CBlockHeader]],
+    ) -> List[Tuple[CSqueak, CBlockHeader]]:
+        if not squeaks_with_headers:
+            return []
+        num_squeaks = self.squeak_db.get_number_of_squeaks()
+        public_key_block_heights = [
+            (squeak.GetPubKey(), squeak.nBlockHeight)
+            for squeak, _ in squeaks_with_headers
+        ]
+        block_counts = self.squeak_db.get_number_of_squeaks_by_public_key_and_block_height(
+            public_key_block_heights,
+        )
+        ret = []
+        for (squeak, block_header), key in zip(squeaks_with_headers, public_key_block_heights):
+            if num_squeaks >= self.max_squeaks:
+                logger.warning("Exceeded max number of squeaks.")
+                break
+            if block_counts.get(key, 0) >= self.max_squeaks_per_public_key_per_block:
+                logger.warning(
+                    "Exceeded max number of squeaks per public key per block.")
+                continue
+            num_squeaks += 1
+            block_counts[key] = block_counts.get(key, 0) + 1
+            ret.append((squeak, block_header))
+        return ret
+
     def save_secret_key(self, squeak_hash: bytes, secret_key: bytes):
         squeak = self.squeak_db.get_squeak(squeak_hash)
         if squeak is None:
@@ -156,10 +313,11 @@ class SqueakStore:
             squeak_hash,
             secret_key,
         )
+        self.squeak_entry_cache.pop(squeak_hash)
         logger.info("Saved squeak secret key: {}".format(
             squeak_hash.hex(),
         ))
-        self.new_secret_key_listener.handle_new_item(squeak)
+        self.new_secret_key_listener.publish(squeak)
         # Unlock the squeak if it is not private.
         if not squeak.is_private_message:
             self.unlock_squeak(squeak_hash)
@@ -177,7 +335,7 @@ class SqueakStore:
         if secret_key is None:
             raise Exception("Secret key does not exist.")
         if recipient_profile_id:
-            recipient_profile = self.squeak_db.get_profile(
+            recipient_profile = self.get_squeak_profile(
                 recipient_profile_id)
             if recipient_profile is None:
                 raise Exception("Recipient profile does not exist.")
@@ -187,7 +345,7 @@ class SqueakStore:
                 recipient_profile=recipient_profile,
             )
         elif author_profile_id:
-            author_profile = self.squeak_db.get_profile(
+            author_profile = self.get_squeak_profile(
                 author_profile_id)
             if author_profile is None:
                 raise Exception("Author profile does not exist.")
@@ -205,6 +363,7 @@ class SqueakStore:
             squeak_hash,
             decrypted_content,
         )
+        self.squeak_entry_cache.pop(squeak_hash)
         logger.info("Unlocked squeak content: {}".format(
             squeak_hash.hex(),
         ))
@@ -232,11 +391,33 @@ class SqueakStore:
     def get_squeak(self, squeak_hash: bytes) -> Optional[CSqueak]:
         return self.squeak_db.get_squeak(squeak_hash)
 
+    def get_squeak_bytes(self, squeak_hash: bytes) -> Optional[bytes]:
+        return self.squeak_db.get_squeak_bytes(squeak_hash)
+
     def get_squeak_secret_key(self, squeak_hash: bytes) -> Optional[bytes]:
         return self.squeak_db.get_squeak_secret_key(squeak_hash)
 
+    def get_squeaks(self, squeak_hashes: List[bytes]) -> Dict[bytes, CSqueak]:
+        return self.squeak_db.get_squeaks(squeak_hashes)
+
+    def get_squeaks_bytes(self, squeak_hashes: List[bytes]) -> Dict[bytes, bytes]:
+        return self.squeak_db.get_squeaks_bytes(squeak_hashes)
+
+    def get_existing_squeak_hashes(self, squeak_hashes: List[bytes]) -> List[bytes]:
+        return self.squeak_db.get_existing_squeak_hashes(squeak_hashes)
+
+    def get_squeak_secret_keys(self, squeak_hashes: List[bytes]) -> Dict[bytes, bytes]:
+        return self.squeak_db.get_squeak_secret_keys(squeak_hashes)
+
     def delete_squeak(self, squeak_hash: bytes) -> None:
         self.squeak_db.delete_squeak(squeak_hash)
+        self.squeak_entry_cache.pop(squeak_hash)
+
+    def check_squeak_counts(self) -> None:
+        """Rebuild the squeak counts if they do not match the squeaks."""
+        if not self.squeak_db.check_squeak_counts():
+            logger.warning("Squeak counts are inconsistent. Rebuilding.")
+            self.squeak_db.rebuild_squeak_counts()
 
     def save_sent_offer(self, sent_offer: SentOffer) -> int:
         return self.squeak_db.insert_sent_offer(sent_offer)
@@ -288,7 +469,7 @@ class SqueakStore:
         squeak_profile = create_signing_profile(
             profile_name,
         )
-        profile_id = self.squeak_db.insert_profile(squeak_profile)
+        profile_id = self.insert_profile(squeak_profile)
         self.create_update_subscriptions_event()
         return profile_id
 
@@ -297,7 +478,7 @@ class SqueakStore:
             profile_name,
             private_key,
         )
-        profile_id = self.squeak_db.insert_profile(squeak_profile)
+        profile_id = self.insert_profile(squeak_profile)
         self.create_update_subscriptions_event()
         return profile_id
 
@@ -306,44 +487,79 @@ class SqueakStore:
             profile_name,
             public_key,
         )
-        profile_id = self.squeak_db.insert_profile(squeak_profile)
+        profile_id = self.insert_profile(squeak_profile)
         self.create_update_subscriptions_event()
         return profile_id
 
+    def insert_profile(self, squeak_profile: SqueakProfile) -> int:
+        profile_id = self.squeak_db.insert_profile(squeak_profile)
+        self.profile_cache.put(squeak_profile._replace(profile_id=profile_id))
+        self.squeak_entry_cache.clear()
+        return profile_id
+
     def get_profiles(self) -> List[SqueakProfile]:
-        return self.squeak_db.get_profiles()
+        return self.profile_cache.get_profiles()
 
     def get_signing_profiles(self) -> List[SqueakProfile]:
-        return self.squeak_db.get_signing_profiles()
+        return self.profile_cache.get_signing_profiles()
 
     def get_contact_profiles(self) -> List[SqueakProfile]:
-        return self.squeak_db.get_contact_profiles()
+        return self.profile_cache.get_contact_profiles()
 
     def get_squeak_profile(self, profile_id: int) -> Optional[SqueakProfile]:
-        return self.squeak_db.get_profile(profile_id)
+        return self.profile_cache.get_profile(profile_id)
 
     def get_squeak_profile_by_public_key(self, public_key: SqueakPublicKey) -> Optional[SqueakProfile]:
-        return self.squeak_db.get_profile_by_public_key(public_key)
+        return self.profile_cache.get_profile_by_public_key(public_key)
 
     def get_squeak_profile_by_name(self, name: str) -> Optional[SqueakProfile]:
-        return self.squeak_db.get_profile_by_name(name)
+        return self.profile_cache.get_profile_by_name(name)
+
+    def get_profile_cache_stats(self) -> ProfileCacheStats:
+        return self.profile_cache.get_stats()
 
     def set_squeak_profile_following(self, profile_id: int, following: bool) -> None:
         self.squeak_db.set_profile_following(profile_id, following)
+        self.profile_cache.update(profile_id, following=following)
+        self.squeak_entry_cache.clear()
         self.create_update_subscriptions_event()
 
     def rename_squeak_profile(self, profile_id: int, profile_name: str) -> None:
         self.squeak_db.set_profile_name(profile_id, profile_name)
+        self.profile_cache.update(profile_id, profile_name=profile_name)
+        self.squeak_entry_cache.clear()
 
     def delete_squeak_profile(self, profile_id: int) -> None:
         self.squeak_db.delete_profile(profile_id)
+        self.profile_cache.remove(profile_id)
+        self.squeak_entry_cache.clear()
         self.create_update_subscriptions_event()
 
-    def set_squeak_profile_image(self, profile_id: int, profile_image: bytes) -> None:
-        self.squeak_db.set_profile_image(profile_id, profile_image)
+    def set_squeak_profile_image(self, profile_id: int, profile_image: bytes) -> bytes:
+        """Downscale and re-encode the uploaded image before saving it.
+
+        Returns the saved image.
+        """
+        processed_image = process_profile_image(
+            profile_image,
+            self.profile_image_size_px,
+            self.max_profile_image_upload_bytes,
+        )
+        self.squeak_db.set_profile_image(profile_id, processed_image)
+        self.profile_cache.update(
+            profile_id,
+            profile_image_hash=get_profile_image_hash(processed_image),
+        )
+        self.squeak_entry_cache.clear()
+        return processed_image
 
     def clear_squeak_profile_image(self, profile_id: int) -> None:
         self.squeak_db.set_profile_image(profile_id, None)
+        self.profile_cache.update(profile_id, profile_image_hash=None)
+        self.squeak_entry_cache.clear()
+
+    def get_profile_image(self, image_hash: bytes) -> Optional[bytes]:
+        return self.squeak_db.get_profile_image(image_hash)
 
     def yield_received_payments_from_index(self, start_index: int = 0) -> Iterator[ReceivedPayment]:
         yield from self.squeak_db.yield_received_payments_from_index(start_index=start_index)
@@ -496,7 +712,12 @@ class SqueakStore:
             )
 
     def get_squeak_entry(self, squeak_hash: bytes) -> Optional[SqueakEntry]:
-        return self.squeak_db.get_squeak_entry(squeak_hash)
+        squeak_entry = self.squeak_entry_cache.get(squeak_hash)
+        if squeak_entry is None:
+            squeak_entry = self.squeak_db.get_squeak_entry(squeak_hash)
+            if squeak_entry is not None:
+                self.squeak_entry_cache.put(squeak_hash, squeak_entry)
+        return squeak_entry
 
     def get_timeline_squeak_entries(
             self,
@@ -567,7 +788,7 @@ class SqueakStore:
         logger.info("Saved received offer: {}".format(received_offer))
         received_offer = received_offer._replace(
             received_offer_id=received_offer_id)
-        self.new_received_offer_listener.handle_new_item(received_offer)
+        self.new_received_offer_listener.publish(received_offer)
         return received_offer_id
 
     def handle_offer(self, squeak: CSqueak, offer: Offer, peer_address: PeerAddress):
@@ -579,9 +800,26 @@ class SqueakStore:
         self.save_received_offer(received_offer)
 
     def get_followed_public_keys(self) -> List[SqueakPublicKey]:
-        followed_profiles = self.squeak_db.get_following_profiles()
+        followed_profiles = self.profile_cache.get_following_profiles()
         return [profile.public_key for profile in followed_profiles]
 
+    def get_followed_public_key_set(self) -> FrozenSet[SqueakPublicKey]:
+        """Get the followed public keys, kept in memory until the
+        followed profiles change.
+        """
+        with self.followed_public_keys_lock:
+            if self.followed_public_keys is None:
+                self.followed_public_keys = frozenset(
+                    self.get_followed_public_keys(),
+                )
+            return self.followed_public_keys
+
+    def get_squeak_entry_topics(self, squeak_entry: SqueakEntry) -> List[SqueakTopic]:
+        return get_squeak_entry_topics(
+            squeak_entry,
+            self.get_followed_public_key_set(),
+        )
+
     def get_received_payment_summary(self) -> ReceivedPaymentSummary:
         return self.squeak_db.get_received_payment_summary()
 
@@ -611,6 +849,7 @@ class SqueakStore:
             self.squeak_db.delete_squeak(
                 squeak_hash,
             )
+            self.squeak_entry_cache.pop(squeak_hash)
             logger.info("Deleted squeak: {}".format(
                 squeak_hash.hex(),
             ))
@@ -622,6 +861,7 @@ class SqueakStore:
         self.squeak_db.set_squeak_liked(
             squeak_hash,
         )
+        self.squeak_entry_cache.pop(squeak_hash)
 
     def unlike_squeak(self, squeak_hash: bytes):
         logger.info("Unliking squeak: {}".format(
@@ -630,6 +870,7 @@ class SqueakStore:
         self.squeak_db.set_squeak_unliked(
             squeak_hash,
         )
+        self.squeak_entry_cache.pop(squeak_hash)
 
     def lookup_squeaks(
             self,
@@ -646,6 +887,25 @@ class SqueakStore:
             include_locked=True,
         )
 
+    def lookup_squeak_cursors(
+            self,
+            public_keys: List[SqueakPublicKey],
+            min_block: Optional[int],
+            max_block: Optional[int],
+            reply_to_hash: Optional[bytes],
+            limit: int,
+            last_cursor: Optional[LookupCursor],
+    ) -> List[LookupCursor]:
+        return self.squeak_db.lookup_squeak_cursors(
+            public_keys,
+            min_block,
+            max_block,
+            reply_to_hash,
+            include_locked=True,
+            limit=limit,
+            last_cursor=last_cursor,
+        )
+
     def lookup_secret_keys(
             self,
             public_keys: List[SqueakPublicKey],
@@ -660,9 +920,28 @@ class SqueakStore:
             reply_to_hash,
         )
 
+    def lookup_locked_squeaks(
+            self,
+            public_keys: List[SqueakPublicKey],
+            min_block: Optional[int],
+            max_block: Optional[int],
+    ) -> List[bytes]:
+        return self.squeak_db.lookup_locked_squeaks(
+            public_keys,
+            min_block,
+            max_block,
+        )
+
     def subscribe_new_squeaks(self, stopped: threading.Event):
         yield from self.new_squeak_listener.yield_items(stopped)
 
+    def subscribe_new_squeak_entries(
+            self,
+            stopped: threading.Event,
+            topic: Optional[SqueakTopic] = None,
+    ) -> Iterator[SqueakEntry]:
+        yield from self.new_squeak_entry_listener.yield_items(stopped, topic)
+
     def subscribe_new_secret_keys(self, stopped: threading.Event):
         yield from self.new_secret_key_listener.yield_items(stopped)
 
@@ -670,12 +949,25 @@ class SqueakStore:
         yield from self.new_follow_listener.yield_items(stopped)
 
     def create_update_subscriptions_event(self):
-        self.new_follow_listener.handle_new_item(UpdateSubscriptionsEvent())
+        with self.followed_public_keys_lock:
+            self.followed_public_keys = None
+        self.squeak_entry_cache.clear()
+        self.new_follow_listener.publish(UpdateSubscriptionsEvent())
 
     def subscribe_received_offers_for_squeak(self, squeak_hash: bytes, stopped: threading.Event):
-        for received_offer in self.new_received_offer_listener.yield_items(stopped):
-            if received_offer.squeak_hash == squeak_hash:
-                yield received_offer
+        yield from self.new_received_offer_listener.yield_items(
+            stopped,
+            squeak_hash,
+        )
+
+    def get_event_bus_stats(self) -> Dict[str, EventBusStats]:
+        return {
+            'new_squeak': self.new_squeak_listener.get_stats(),
+            'new_squeak_entry': self.new_squeak_entry_listener.get_stats(),
+            'new_received_offer': self.new_received_offer_listener.get_stats(),
+            'new_secret_key': self.new_secret_key_listener.get_stats(),
+            'new_follow': self.new_follow_listener.get_stats(),
+        }
 
     def add_twitter_account(self, handle: str, profile_id: int, bearer_token: str) -> Optional[int]:
         twitter_account = TwitterAccount(
@@ -694,3 +986,15 @@ class SqueakStore:
 
     def get_latest_block(self) -> int:
         return self.squeak_core.get_best_block_height()
+
+    def get_latest_block_info(self) -> BlockInfo:
+        return self.squeak_core.get_best_block_info()
+
+    def get_block_hash(self, block_height: int) -> bytes:
+        return self.squeak_core.get_block_hash(block_height)
+
+    def get_sync_watermark(self, peer_address: PeerAddress) -> Optional[SyncWatermark]:
+        return self.squeak_db.get_sync_watermark(peer_address)
+
+    def set_sync_watermark(self, sync_watermark: SyncWatermark) -> None:
+        self.squeak_db.set_sync_watermark(sync_watermark)
@@ -26,14 +26,78 @@ import threading
 from flask import Flask
 from flask import jsonify
 from flask import request
+from flask import Response
 from werkzeug.serving import make_server
 
+from squeaknode.core.bloom_filter import BloomFilter
+from squeaknode.core.length_prefixed import encode_record
+from squeaknode.core.lookup_cursor import cursor_from_str
+from squeaknode.core.lookup_cursor import cursor_to_str
 from squeaknode.server.squeak_peer_server_handler import NotFoundError
 from squeaknode.server.squeak_peer_server_handler import PaymentRequiredError
 
 logger = logging.getLogger(__name__)
 
 
+MAX_BATCH_SIZE = 1000
+MAX_LOOKUP_LIMIT = 1000
+MAX_FILTER_SIZE = 1024 * 1024
+
+
+def get_batch_squeak_hashes():
+    """ Get the list of hex squeak hashes from the request body.
+
+    Returns None if the body is not a valid list of hashes.
+    """
+    squeak_hash_strs = request.get_json(silent=True)
+    if not isinstance(squeak_hash_strs, list):
+        return None
+    if len(squeak_hash_strs) > MAX_BATCH_SIZE:
+        return None
+    for squeak_hash_str in squeak_hash_strs:
+        if not isinstance(squeak_hash_str, str) or len(squeak_hash_str) != 64:
+            return None
+        try:
+            bytes.fromhex(squeak_hash_str)
+        except ValueError:
+            return None
+    return squeak_hash_strs
+
+
+def get_reply_to_hash_str():
+    """ Get the optional hex hash of the squeak to lookup replies to.
+
+    Raises:
+        ValueError: If the hash is not valid.
+    """
+    reply_to_hash_str = request.args.get('replyto')
+    if not reply_to_hash_str:
+        return None
+    if len(reply_to_hash_str) != 64:
+        raise ValueError("Invalid reply to hash.")
+    bytes.fromhex(reply_to_hash_str)
+    return reply_to_hash_str
+
+
+def stream_json_hashes(squeak_hashes):
+    """ Yield a JSON list of hex squeak hashes in chunks. """
+    yield '['
+    for i, squeak_hash in enumerate(squeak_hashes):
+        if i > 0:
+            yield ','
+        yield '"{}"'.format(squeak_hash.hex())
+    yield ']'
+
+
+def stream_json_lookup_page(squeak_hashes, next_cursor):
+    """ Yield a JSON lookup page object in chunks. """
+    yield '{"hashes":'
+    yield from stream_json_hashes(squeak_hashes)
+    yield ',"next":{}}}'.format(
+        '"{}"'.format(cursor_to_str(next_cursor)) if next_cursor else 'null',
+    )
+
+
 def create_app(handler):
     # create and configure the app
     logger.debug("Starting flask app from directory: {}".format(os.getcwd()))
@@ -74,6 +138,34 @@ def create_app(handler):
             return "Payment required", 402
         return secret_key_bytes
 
+    @app.route('/squeaks', methods=['POST'])
+    def squeaks():
+        squeak_hash_strs = get_batch_squeak_hashes()
+        if squeak_hash_strs is None:
+            return "Bad request", 400
+        squeaks_bytes = handler.handle_get_squeaks_bytes(squeak_hash_strs)
+        return Response(
+            (encode_record(squeak_bytes) for squeak_bytes in squeaks_bytes),
+            mimetype='application/octet-stream',
+        )
+
+    @app.route('/secretkeys', methods=['POST'])
+    def secret_keys():
+        squeak_hash_strs = get_batch_squeak_hashes()
+        if squeak_hash_strs is None:
+            return "Bad request", 400
+        try:
+            secret_keys = handler.handle_get_secret_keys(squeak_hash_strs)
+        except PaymentRequiredError:
+            return "Payment required", 402
+        return Response(
+            (
+                encode_record(squeak_hash + secret_key)
+                for squeak_hash, secret_key in secret_keys.items()
+            ),
+            mimetype='application/octet-stream',
+        )
+
     @app.route('/offer/<hash>')
     def offer(hash):
         client_host = request.remote_addr
@@ -91,22 +183,97 @@ def create_app(handler):
 
     @app.route("/lookup")
     def lookup():
-        min_block = request.args.get('minblock')
-        max_block = request.args.get('maxblock')
+        min_block = request.args.get('minblock', type=int)
+        max_block = request.args.get('maxblock', type=int)
         pubkeys = request.args.getlist('pubkeys')
-        if len(pubkeys) == 0:
-            squeak_hashes = []
-        else:
-            squeak_hashes = handler.handle_lookup_squeaks(
-                pubkeys,
-                min_block,
-                max_block,
+        limit = request.args.get('limit', type=int)
+        cursor_str = request.args.get('cursor')
+        try:
+            last_cursor = cursor_from_str(cursor_str) if cursor_str else None
+            reply_to_hash_str = get_reply_to_hash_str()
+        except ValueError:
+            return "Bad request", 400
+
+        # Without a limit, stream all of the hashes in a single list.
+        if limit is None:
+            if len(pubkeys) == 0 and not reply_to_hash_str:
+                squeak_hashes = iter([])
+            else:
+                # Errors are raised here, before the status is sent.
+                try:
+                    squeak_hashes = handler.handle_lookup_squeaks(
+                        pubkeys,
+                        min_block,
+                        max_block,
+                        reply_to_hash_str,
+                    )
+                except ValueError:
+                    return "Bad request", 400
+            return Response(
+                stream_json_hashes(squeak_hashes),
+                mimetype='application/json',
             )
-        squeak_hashes_str = [
-            squeak_hash.hex()
-            for squeak_hash in squeak_hashes
-        ]
-        return jsonify(squeak_hashes_str)
+
+        if limit <= 0:
+            return "Bad request", 400
+        limit = min(limit, MAX_LOOKUP_LIMIT)
+        if len(pubkeys) == 0 and not reply_to_hash_str:
+            cursors = []
+        else:
+            try:
+                cursors = handler.handle_lookup_squeak_cursors(
+                    pubkeys,
+                    min_block,
+                    max_block,
+                    limit,
+                    last_cursor,
+                    reply_to_hash_str,
+                )
+            except ValueError:
+                return "Bad request", 400
+        next_cursor = cursors[-1] if len(cursors) == limit else None
+        return Response(
+            stream_json_lookup_page(
+                (cursor.squeak_hash for cursor in cursors),
+                next_cursor,
+            ),
+            mimetype='application/json',
+        )
+
+    @app.route("/lookup", methods=['POST'])
+    def lookup_missing():
+        min_block = request.args.get('minblock', type=int)
+        max_block = request.args.get('maxblock', type=int)
+        pubkeys = request.args.getlist('pubkeys')
+        content_length = request.content_length
+        if content_length is None or content_length > MAX_FILTER_SIZE:
+            return "Bad request", 400
+        try:
+            known_filter = BloomFilter.deserialize(request.get_data())
+            reply_to_hash_str = get_reply_to_hash_str()
+        except ValueError:
+            return "Bad request", 400
+
+        # Only return the hashes that are not in the client's filter.
+        if len(pubkeys) == 0 and not reply_to_hash_str:
+            squeak_hashes = iter([])
+        else:
+            try:
+                squeak_hashes = handler.handle_lookup_squeaks(
+                    pubkeys,
+                    min_block,
+                    max_block,
+                    reply_to_hash_str,
+                )
+            except ValueError:
+                return "Bad request", 400
+        return Response(
+            stream_json_hashes(
+                squeak_hash for squeak_hash in squeak_hashes
+                if squeak_hash not in known_filter
+            ),
+            mimetype='application/json',
+        )
 
     # @sock.route('/echo')
     # def echo(ws):
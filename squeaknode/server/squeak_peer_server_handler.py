@@ -20,11 +20,16 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 import logging
+from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Tuple
 
+from squeak.core.keys import InvalidPublicKeyError
 from squeak.core.keys import SqueakPublicKey
 
+from squeaknode.core.lookup_cursor import LookupCursor
 from squeaknode.core.offer import Offer
 from squeaknode.core.peer_address import Network
 from squeaknode.core.peer_address import PeerAddress
@@ -33,6 +38,9 @@ from squeaknode.node.squeak_controller import SqueakController
 logger = logging.getLogger(__name__)
 
 
+LOOKUP_PAGE_SIZE = 1000
+
+
 class PaymentRequiredError(Exception):
     pass
 
@@ -56,10 +64,23 @@ class SqueakPeerServerHandler(object):
 
     def handle_get_squeak_bytes(self, squeak_hash_str) -> bytes:
         squeak_hash = bytes.fromhex(squeak_hash_str)
-        squeak = self.squeak_controller.get_squeak(squeak_hash)
-        if not squeak:
+        squeak_bytes = self.squeak_controller.get_squeak_bytes(squeak_hash)
+        if not squeak_bytes:
             raise NotFoundError()
-        return squeak.serialize()
+        return squeak_bytes
+
+    def handle_get_squeaks_bytes(self, squeak_hash_strs: List[str]) -> List[bytes]:
+        squeak_hashes = [
+            bytes.fromhex(squeak_hash_str)
+            for squeak_hash_str in squeak_hash_strs
+        ]
+        squeaks_bytes = self.squeak_controller.get_squeaks_bytes(
+            squeak_hashes)
+        return [
+            squeaks_bytes[squeak_hash]
+            for squeak_hash in squeak_hashes
+            if squeak_hash in squeaks_bytes
+        ]
 
     def handle_get_secret_key(self, squeak_hash_str) -> bytes:
         squeak_hash = bytes.fromhex(squeak_hash_str)
@@ -71,6 +92,16 @@ class SqueakPeerServerHandler(object):
             raise NotFoundError()
         return secret_key
 
+    def handle_get_secret_keys(self, squeak_hash_strs: List[str]) -> Dict[bytes, bytes]:
+        squeak_hashes = [
+            bytes.fromhex(squeak_hash_str)
+            for squeak_hash_str in squeak_hash_strs
+        ]
+        price_msat = self.squeak_controller.get_sell_price_msat()
+        if price_msat > 0:
+            raise PaymentRequiredError()
+        return self.squeak_controller.get_squeak_secret_keys(squeak_hashes)
+
     def handle_get_offer(self, squeak_hash_str, client_host) -> Offer:
         squeak_hash = bytes.fromhex(squeak_hash_str)
         client_addr = PeerAddress(
@@ -91,16 +122,99 @@ class SqueakPeerServerHandler(object):
             pubkey_strs: List[str],
             min_block: Optional[int],
             max_block: Optional[int],
-    ) -> List[bytes]:
-        pubkeys = [
-            SqueakPublicKey.from_bytes(bytes.fromhex(pubkey_str))
-            for pubkey_str in pubkey_strs
-        ]
-        # Add separate endpoint for replies.
-        # reply_to_hash = interest.hashReplySqk if interest.hashReplySqk != EMPTY_HASH else None
-        return self.squeak_controller.lookup_squeaks(
+            reply_to_hash_str: Optional[str] = None,
+    ) -> Iterator[bytes]:
+        """Get all matching squeak hashes, reading them from the database
+        one page at a time.
+
+        The first page is read before this returns, so that invalid
+        arguments and database errors are raised here instead of while
+        the hashes are sent.
+
+        Raises:
+            ValueError: If a public key or the reply to hash is not valid.
+        """
+        pubkeys, reply_to_hash = parse_lookup_args(
+            pubkey_strs,
+            reply_to_hash_str,
+        )
+        cursors = self.squeak_controller.lookup_squeak_cursors(
             pubkeys,
             min_block,
             max_block,
+            reply_to_hash,
+            LOOKUP_PAGE_SIZE,
             None,
         )
+        return self.iter_lookup_squeaks(
+            pubkeys,
+            min_block,
+            max_block,
+            reply_to_hash,
+            cursors,
+        )
+
+    def iter_lookup_squeaks(
+            self,
+            pubkeys: List[SqueakPublicKey],
+            min_block: Optional[int],
+            max_block: Optional[int],
+            reply_to_hash: Optional[bytes],
+            cursors: List[LookupCursor],
+    ) -> Iterator[bytes]:
+        while True:
+            for cursor in cursors:
+                yield cursor.squeak_hash
+            if len(cursors) < LOOKUP_PAGE_SIZE:
+                return
+            cursors = self.squeak_controller.lookup_squeak_cursors(
+                pubkeys,
+                min_block,
+                max_block,
+                reply_to_hash,
+                LOOKUP_PAGE_SIZE,
+                cursors[-1],
+            )
+
+    def handle_lookup_squeak_cursors(
+            self,
+            pubkey_strs: List[str],
+            min_block: Optional[int],
+            max_block: Optional[int],
+            limit: int,
+            last_cursor: Optional[LookupCursor],
+            reply_to_hash_str: Optional[str] = None,
+    ) -> List[LookupCursor]:
+        """Get one page of matching squeak cursors.
+
+        Raises:
+            ValueError: If a public key or the reply to hash is not valid.
+        """
+        pubkeys, reply_to_hash = parse_lookup_args(
+            pubkey_strs,
+            reply_to_hash_str,
+        )
+        return self.squeak_controller.lookup_squeak_cursors(
+            pubkeys,
+            min_block,
+            max_block,
+            reply_to_hash,
+            limit,
+            last_cursor,
+        )
+
+
+def parse_lookup_args(
+        pubkey_strs: List[str],
+        reply_to_hash_str: Optional[str],
+) -> Tuple[List[SqueakPublicKey], Optional[bytes]]:
+    try:
+        pubkeys = [
+            SqueakPublicKey.from_bytes(bytes.fromhex(pubkey_str))
+            for pubkey_str in pubkey_strs
+        ]
+    except InvalidPublicKeyError:
+        raise ValueError("Invalid public key.")
+    reply_to_hash = bytes.fromhex(
+        reply_to_hash_str) if reply_to_hash_str else None
+    return pubkeys, reply_to_hash
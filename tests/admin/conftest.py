@@ -24,6 +24,7 @@ import pytest
 from proto import squeak_admin_pb2
 from squeaknode.admin.messages import DEFAULT_PROFILE_IMAGE
 from squeaknode.admin.profile_image_util import bytes_to_base64_string
+from squeaknode.admin.profile_image_util import get_profile_image_hash
 
 
 @pytest.fixture
@@ -55,6 +56,8 @@ def signing_profile_msg(
         following=True,
         profile_image=img_base64_str,
         has_custom_profile_image=False,
+        profile_image_hash=get_profile_image_hash(
+            default_profile_image).hex(),
     )
 
 
@@ -73,6 +76,8 @@ def recipient_profile_msg(
         following=True,
         profile_image=img_base64_str,
         has_custom_profile_image=False,
+        profile_image_hash=get_profile_image_hash(
+            default_profile_image).hex(),
     )
 
 
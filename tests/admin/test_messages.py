@@ -19,6 +19,8 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+from unittest import mock
+
 from squeaknode.admin.messages import download_result_to_message
 from squeaknode.admin.messages import message_to_peer_address
 from squeaknode.admin.messages import message_to_received_payment
@@ -39,6 +41,10 @@ from squeaknode.admin.messages import sent_payment_to_message
 from squeaknode.admin.messages import squeak_entry_to_message
 from squeaknode.admin.messages import squeak_peer_to_message
 from squeaknode.admin.messages import squeak_profile_to_message
+from squeaknode.admin.profile_image_util import bytes_to_base64_string
+from squeaknode.admin.profile_image_util import encode_profile_image
+from squeaknode.admin.profile_image_util import get_profile_image_hash
+from squeaknode.client.peer_health import PeerHealth
 
 
 def test_peer_address_to_message(peer_address, peer_address_message):
@@ -82,6 +88,20 @@ def test_peer_to_message(peer, peer_msg):
     assert msg == peer_msg
 
 
+def test_peer_with_health_to_message(peer, peer_msg):
+    peer_health = PeerHealth(
+        score=0.5,
+        error_rate=0.25,
+        consecutive_failures=2,
+    )
+    msg = squeak_peer_to_message(peer, peer_health)
+
+    assert msg.health.score == 0.5
+    assert msg.health.error_rate == 0.25
+    assert msg.health.consecutive_failures == 2
+    assert msg.peer_name == peer_msg.peer_name
+
+
 def test_sent_offer_to_message(sent_offer, sent_offer_msg):
     msg = sent_offer_to_message(sent_offer)
 
@@ -213,3 +233,25 @@ def test_optional_sent_payment_to_message(sent_payment, sent_payment_msg):
     msg = optional_sent_payment_to_message(sent_payment)
 
     assert msg == sent_payment_msg
+
+
+def test_profile_to_message_without_image(signing_profile, signing_profile_msg):
+    msg = squeak_profile_to_message(signing_profile, False)
+
+    assert msg.profile_image == ""
+    assert msg.profile_image_hash == signing_profile_msg.profile_image_hash
+
+
+def test_profile_with_custom_image_to_message(signing_profile):
+    profile_image = b'custom image'
+    image_hash = get_profile_image_hash(profile_image)
+    profile = signing_profile._replace(profile_image_hash=image_hash)
+    load_profile_image = mock.Mock(
+        return_value=encode_profile_image(image_hash, profile_image))
+    msg = squeak_profile_to_message(
+        profile, load_profile_image=load_profile_image)
+
+    load_profile_image.assert_called_once_with(image_hash)
+    assert msg.profile_image == bytes_to_base64_string(profile_image)
+    assert msg.has_custom_profile_image
+    assert msg.profile_image_hash == image_hash.hex()
@@ -0,0 +1,65 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from squeaknode.admin.profile_image_util import bytes_to_base64_string
+from squeaknode.admin.profile_image_util import get_image_mimetype
+from squeaknode.admin.profile_image_util import get_profile_image_hash
+from squeaknode.admin.profile_image_util import load_default_profile_image
+from squeaknode.admin.profile_image_util import ProfileImageCache
+
+
+def test_encode():
+    cache = ProfileImageCache()
+    image_hash = get_profile_image_hash(b'image')
+    encoded_image = cache.encode(image_hash, b'image')
+
+    assert encoded_image.image_hash == image_hash
+    assert encoded_image.profile_image == b'image'
+    assert encoded_image.base64_str == bytes_to_base64_string(b'image')
+    assert cache.encode(image_hash, b'image') is encoded_image
+
+
+def test_get():
+    cache = ProfileImageCache()
+    image_hash = get_profile_image_hash(b'image')
+    encoded_image = cache.encode(image_hash, b'image')
+
+    assert cache.get(image_hash) is encoded_image
+    assert cache.get(get_profile_image_hash(b'other')) is None
+
+
+def test_evict_least_recently_used():
+    cache = ProfileImageCache(max_size=2)
+    image_hash1 = get_profile_image_hash(b'image1')
+    image_hash2 = get_profile_image_hash(b'image2')
+    cache.encode(image_hash1, b'image1')
+    cache.encode(image_hash2, b'image2')
+    cache.get(image_hash1)
+    cache.encode(get_profile_image_hash(b'image3'), b'image3')
+
+    assert cache.get(image_hash1).profile_image == b'image1'
+    assert cache.get(image_hash2) is None
+
+
+def test_get_image_mimetype():
+    assert get_image_mimetype(load_default_profile_image()) == 'image/png'
+    assert get_image_mimetype(b'\xff\xd8\xff') == 'image/jpeg'
+    assert get_image_mimetype(b'data') == 'application/octet-stream'
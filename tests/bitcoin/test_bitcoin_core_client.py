@@ -20,6 +20,9 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 import json
+import threading
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
 
 import mock
 import pytest
@@ -65,6 +68,54 @@ def bitcoin_core_client(bitcoin_host, bitcoin_port, bitcoin_user, bitcoin_pass):
     )
 
 
+class FakeBitcoinRpcHandler(BaseHTTPRequestHandler):
+    """Returns 503 for the first `num_unavailable` requests."""
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        server = self.server
+        server.num_requests += 1
+        server.client_ports.add(self.client_address[1])
+        self.rfile.read(int(self.headers['Content-Length']))
+        if server.num_requests <= server.num_unavailable:
+            status, body = 503, b''
+        else:
+            status, body = 200, b'{"result": "555", "error": null, "id": 0}'
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def fake_bitcoin_rpc_server():
+    server = ThreadingHTTPServer(('localhost', 0), FakeBitcoinRpcHandler)
+    server.num_requests = 0
+    server.num_unavailable = 0
+    server.client_ports = set()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def local_bitcoin_core_client(fake_bitcoin_rpc_server, bitcoin_user, bitcoin_pass):
+    yield BitcoinCoreClient(
+        host='localhost',
+        port=fake_bitcoin_rpc_server.server_address[1],
+        rpc_user=bitcoin_user,
+        rpc_password=bitcoin_pass,
+        use_ssl=False,
+        ssl_cert="",
+        backoff_factor=0,
+    )
+
+
 class MockResponse:
 
     def json(self):
@@ -142,7 +193,7 @@ def mock_invalid_status_response():
 
 
 def test_make_request(bitcoin_host, bitcoin_port, bitcoin_user, bitcoin_pass, bitcoin_core_client, mock_empty_response):
-    with mock.patch('squeaknode.bitcoin.bitcoin_core_client.requests.post', autospec=True) as mock_post:
+    with mock.patch.object(bitcoin_core_client.session, 'post', autospec=True) as mock_post:
         mock_post.return_value = mock_empty_response
         retrieved_json_response = bitcoin_core_client.make_request({})
         (bitcoin_address,) = mock_post.call_args.args
@@ -156,8 +207,42 @@ def test_make_request(bitcoin_host, bitcoin_port, bitcoin_user, bitcoin_pass, bi
         assert retrieved_json_response == {}
 
 
+def test_make_request_uses_session(bitcoin_core_client, mock_empty_response):
+    with mock.patch.object(bitcoin_core_client.session, 'post', autospec=True) as mock_post:
+        mock_post.return_value = mock_empty_response
+        bitcoin_core_client.make_request({})
+        bitcoin_core_client.make_request({})
+
+        assert mock_post.call_count == 2
+        assert mock_post.call_args.kwargs['timeout'] == bitcoin_core_client.timeout_s
+
+
+def test_session_pool_config(bitcoin_core_client):
+    adapter = bitcoin_core_client.session.get_adapter(bitcoin_core_client.url)
+
+    assert adapter._pool_maxsize == 50
+    assert adapter._pool_block
+    assert adapter.max_retries.total == 3
+    assert 503 in adapter.max_retries.status_forcelist
+
+
+def test_get_method_stats(bitcoin_core_client, mock_get_count_response, mock_invalid_status_response):
+    with mock.patch.object(bitcoin_core_client.session, 'post', autospec=True) as mock_post:
+        mock_post.return_value = mock_get_count_response
+        bitcoin_core_client.get_block_count()
+        bitcoin_core_client.get_block_count()
+        mock_post.return_value = mock_invalid_status_response
+        with pytest.raises(BitcoinRequestError):
+            bitcoin_core_client.get_block_count()
+        method_stats = bitcoin_core_client.get_method_stats()
+
+        assert method_stats['getblockcount'].num_requests == 3
+        assert method_stats['getblockcount'].num_errors == 1
+        assert method_stats['getblockcount'].total_time_ms >= 0
+
+
 def test_make_request_invalid_status(bitcoin_core_client, mock_invalid_status_response):
-    with mock.patch('squeaknode.bitcoin.bitcoin_core_client.requests.post', autospec=True) as mock_post:
+    with mock.patch.object(bitcoin_core_client.session, 'post', autospec=True) as mock_post:
         mock_post.return_value = mock_invalid_status_response
 
         with pytest.raises(BitcoinRequestError):
@@ -165,7 +250,7 @@ def test_make_request_invalid_status(bitcoin_core_client, mock_invalid_status_re
 
 
 def test_make_request_connection_error(bitcoin_core_client, mock_invalid_status_response):
-    with mock.patch('squeaknode.bitcoin.bitcoin_core_client.requests.post', autospec=True) as mock_post:
+    with mock.patch.object(bitcoin_core_client.session, 'post', autospec=True) as mock_post:
         mock_post.side_effect = ConnectionError()
 
         with pytest.raises(BitcoinRequestError):
@@ -173,7 +258,7 @@ def test_make_request_connection_error(bitcoin_core_client, mock_invalid_status_
 
 
 def test_make_request_timeout_error(bitcoin_core_client, mock_invalid_status_response):
-    with mock.patch('squeaknode.bitcoin.bitcoin_core_client.requests.post', autospec=True) as mock_post:
+    with mock.patch.object(bitcoin_core_client.session, 'post', autospec=True) as mock_post:
         mock_post.side_effect = Timeout()
 
         with pytest.raises(BitcoinRequestError):
@@ -181,7 +266,7 @@ def test_make_request_timeout_error(bitcoin_core_client, mock_invalid_status_res
 
 
 def test_make_request_request_exception(bitcoin_core_client, mock_invalid_status_response):
-    with mock.patch('squeaknode.bitcoin.bitcoin_core_client.requests.post', autospec=True) as mock_post:
+    with mock.patch.object(bitcoin_core_client.session, 'post', autospec=True) as mock_post:
         mock_post.side_effect = RequestException()
 
         with pytest.raises(BitcoinRequestError):
@@ -251,3 +336,82 @@ def test_get_best_block_info(bitcoin_core_client, block_count, block_info):
         assert mock_get_block_info_by_height.call_args == mock.call(
             block_count)
         assert retrieved_block_info == block_info
+
+
+def test_make_batch_request(bitcoin_core_client):
+    with mock.patch.object(bitcoin_core_client.session, 'post', autospec=True) as mock_post:
+        mock_post.return_value.json.return_value = [
+            {'id': 1, 'result': 'b', 'error': None},
+            {'id': 0, 'result': 'a', 'error': None},
+        ]
+        retrieved_responses = bitcoin_core_client.make_batch_request([
+            {'method': 'foo'},
+            {'method': 'bar'},
+        ])
+        request_json = mock_post.call_args.kwargs['data']
+
+        assert mock_post.call_count == 1
+        assert 'batch:bar,foo' in bitcoin_core_client.get_method_stats()
+        assert json.loads(request_json) == [
+            {'method': 'foo', 'id': 0},
+            {'method': 'bar', 'id': 1},
+        ]
+        assert [response['result'] for response in retrieved_responses] == [
+            'a', 'b']
+
+
+def test_make_batch_request_empty(bitcoin_core_client):
+    with mock.patch.object(bitcoin_core_client.session, 'post', autospec=True) as mock_post:
+        retrieved_responses = bitcoin_core_client.make_batch_request([])
+
+        assert mock_post.call_count == 0
+        assert retrieved_responses == []
+
+
+def test_get_block_infos_by_heights(bitcoin_core_client, block_count, block_hash_str, block_header_str, block_info):
+    with mock.patch.object(bitcoin_core_client, 'make_batch_request', autospec=True) as mock_make_batch_request:
+        mock_make_batch_request.side_effect = [
+            [
+                {'result': block_hash_str, 'error': None},
+                {'result': None, 'error': {
+                    'code': -8, 'message': 'Block height out of range'}},
+            ],
+            [
+                {'result': block_header_str, 'error': None},
+            ],
+        ]
+        retrieved_block_infos = bitcoin_core_client.get_block_infos_by_heights(
+            [block_count, block_count + 1, block_count])
+        (hash_payloads,) = mock_make_batch_request.call_args_list[0].args
+        (header_payloads,) = mock_make_batch_request.call_args_list[1].args
+
+        assert mock_make_batch_request.call_count == 2
+        assert [payload['params'] for payload in hash_payloads] == [
+            [block_count], [block_count + 1]]
+        assert [payload['params'] for payload in header_payloads] == [
+            [block_hash_str, False]]
+        assert retrieved_block_infos == {block_count: block_info}
+
+
+def test_make_request_reuses_connection(local_bitcoin_core_client, fake_bitcoin_rpc_server):
+    for _ in range(5):
+        assert local_bitcoin_core_client.get_block_count() == 555
+
+    assert fake_bitcoin_rpc_server.num_requests == 5
+    assert len(fake_bitcoin_rpc_server.client_ports) == 1
+
+
+def test_make_request_retries_unavailable(local_bitcoin_core_client, fake_bitcoin_rpc_server):
+    fake_bitcoin_rpc_server.num_unavailable = 2
+    block_count = local_bitcoin_core_client.get_block_count()
+
+    assert block_count == 555
+    assert fake_bitcoin_rpc_server.num_requests == 3
+
+
+def test_make_request_retries_exhausted(local_bitcoin_core_client, fake_bitcoin_rpc_server):
+    fake_bitcoin_rpc_server.num_unavailable = 10
+
+    with pytest.raises(BitcoinRequestError):
+        local_bitcoin_core_client.get_block_count()
+    assert fake_bitcoin_rpc_server.num_requests == 4
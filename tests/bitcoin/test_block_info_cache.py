@@ -0,0 +1,127 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import pytest
+from bitcoin.core import CBlockHeader
+
+from squeaknode.bitcoin.block_info import BlockInfo
+from squeaknode.bitcoin.block_info_cache import BlockInfoCache
+
+
+def gen_chain(start_height, length, prev_block_hash=b'\x00' * 32, nonce=0):
+    ret = []
+    for block_height in range(start_height, start_height + length):
+        block_header = CBlockHeader(
+            hashPrevBlock=prev_block_hash[::-1],
+            nNonce=nonce,
+        )
+        block_hash = block_header.GetHash()[::-1]
+        ret.append(BlockInfo(block_height, block_hash, block_header))
+        prev_block_hash = block_hash
+    return ret
+
+
+@pytest.fixture
+def chain():
+    yield gen_chain(0, 20)
+
+
+@pytest.fixture
+def block_info_cache():
+    yield BlockInfoCache(max_size=5, min_depth=6)
+
+
+@pytest.fixture
+def block_info_cache_with_tip(block_info_cache, chain):
+    block_info_cache.set_best_block(chain[-1])
+    yield block_info_cache
+
+
+def test_get_missing(block_info_cache_with_tip):
+    assert block_info_cache_with_tip.get(3) is None
+    assert block_info_cache_with_tip.misses == 1
+
+
+def test_put_and_get(block_info_cache_with_tip, chain):
+    block_info_cache_with_tip.put(chain[3])
+
+    assert block_info_cache_with_tip.get(3) == chain[3]
+    assert block_info_cache_with_tip.hits == 1
+
+
+def test_put_without_best_block(block_info_cache, chain):
+    block_info_cache.put(chain[3])
+
+    assert block_info_cache.get(3) is None
+
+
+def test_put_not_deep_enough(block_info_cache_with_tip, chain):
+    block_info_cache_with_tip.put(chain[14])
+    block_info_cache_with_tip.put(chain[15])
+
+    assert block_info_cache_with_tip.get(14) == chain[14]
+    assert block_info_cache_with_tip.get(15) is None
+
+
+def test_put_evicts_least_recently_used(block_info_cache_with_tip, chain):
+    for block_info in chain[:5]:
+        block_info_cache_with_tip.put(block_info)
+    block_info_cache_with_tip.get(0)
+    block_info_cache_with_tip.put(chain[5])
+
+    assert block_info_cache_with_tip.get(0) == chain[0]
+    assert block_info_cache_with_tip.get(1) is None
+    assert block_info_cache_with_tip.get(5) == chain[5]
+
+
+def test_set_best_block_same_block(block_info_cache_with_tip, chain):
+    block_info_cache_with_tip.put(chain[10])
+    block_info_cache_with_tip.set_best_block(chain[-1])
+
+    assert block_info_cache_with_tip.get(10) == chain[10]
+
+
+def test_set_best_block_next_block(block_info_cache, chain):
+    block_info_cache.set_best_block(chain[15])
+    block_info_cache.put(chain[10])
+    block_info_cache.set_best_block(chain[16])
+
+    assert block_info_cache.get(10) == chain[10]
+    assert block_info_cache.best_block_height == 16
+
+
+def test_set_best_block_skipped_blocks(block_info_cache, chain):
+    block_info_cache.set_best_block(chain[15])
+    block_info_cache.put(chain[10])
+    block_info_cache.set_best_block(chain[17])
+
+    assert block_info_cache.get(10) is None
+    assert block_info_cache.best_block_height == 17
+
+
+def test_set_best_block_reorg(block_info_cache, chain):
+    block_info_cache.set_best_block(chain[15])
+    block_info_cache.put(chain[10])
+    other_chain = gen_chain(10, 7, chain[9].block_hash, nonce=1)
+    block_info_cache.set_best_block(other_chain[-1])
+
+    assert block_info_cache.get(10) is None
+    assert block_info_cache.best_block_height == 16
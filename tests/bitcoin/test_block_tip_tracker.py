@@ -0,0 +1,200 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import threading
+
+import mock
+import pytest
+import zmq
+
+from squeaknode.bitcoin.bitcoin_client import BitcoinClient
+from squeaknode.bitcoin.block_info import BlockInfo
+from squeaknode.bitcoin.block_tip_tracker import BlockTipTracker
+from squeaknode.bitcoin.block_tip_tracker import HASHBLOCK_TOPIC
+from tests.utils import gen_random_hash
+
+
+EVENT_TIMEOUT_S = 10
+
+
+@pytest.fixture
+def next_block_info(block_info):
+    yield BlockInfo(
+        block_height=block_info.block_height + 1,
+        block_hash=gen_random_hash(),
+        block_header=block_info.block_header,
+    )
+
+
+@pytest.fixture
+def bitcoin_client(block_info):
+    bitcoin_client = mock.Mock(spec=BitcoinClient)
+    bitcoin_client.get_best_block_info.return_value = block_info
+    yield bitcoin_client
+
+
+@pytest.fixture
+def zmq_publisher():
+    """Local stand-in for the bitcoind ZMQ publisher."""
+    context = zmq.Context()
+    socket = context.socket(zmq.PUB)
+    port = socket.bind_to_random_port("tcp://127.0.0.1")
+    yield socket, port
+    socket.close(linger=0)
+    context.term()
+
+
+@pytest.fixture
+def new_blocks():
+    yield []
+
+
+@pytest.fixture
+def new_block_received():
+    yield threading.Event()
+
+
+def start_tracker(tracker, new_blocks, new_block_received):
+    def handle_new_block(block_info):
+        new_blocks.append(block_info)
+        new_block_received.set()
+
+    tracker.new_block_listener.add_callback("test", handle_new_block)
+    tracker.start()
+
+
+def test_get_best_block_info_before_start(bitcoin_client, block_info):
+    tracker = BlockTipTracker(bitcoin_client, "127.0.0.1", None)
+    retrieved_block_info = tracker.get_best_block_info()
+    tracker.get_best_block_info()
+
+    assert retrieved_block_info == block_info
+    assert bitcoin_client.get_best_block_info.call_count == 1
+
+
+def test_get_block_info_by_height(bitcoin_client, block_info):
+    tracker = BlockTipTracker(bitcoin_client, "127.0.0.1", None)
+    bitcoin_client.get_block_info_by_height.return_value = block_info
+    bitcoin_client.get_block_infos_by_heights.return_value = {
+        block_info.block_height: block_info,
+    }
+
+    assert tracker.get_block_info_by_height(
+        block_info.block_height) == block_info
+    assert tracker.get_block_infos_by_heights([block_info.block_height]) == {
+        block_info.block_height: block_info,
+    }
+
+
+def test_refresh_best_block_same_block(bitcoin_client, block_info, new_blocks):
+    tracker = BlockTipTracker(bitcoin_client, "127.0.0.1", None)
+    tracker.new_block_listener.add_callback("test", new_blocks.append)
+    tracker.refresh_best_block()
+    tracker.refresh_best_block()
+
+    assert new_blocks == [block_info]
+
+
+def test_poll_new_block(bitcoin_client, block_info, next_block_info, new_blocks, new_block_received):
+    tracker = BlockTipTracker(
+        bitcoin_client, "127.0.0.1", None, poll_interval_s=0.01)
+    start_tracker(tracker, new_blocks, new_block_received)
+    try:
+        assert new_block_received.wait(EVENT_TIMEOUT_S)
+        new_block_received.clear()
+        bitcoin_client.get_best_block_info.return_value = next_block_info
+
+        assert new_block_received.wait(EVENT_TIMEOUT_S)
+        assert new_blocks == [block_info, next_block_info]
+        assert tracker.get_best_block_info() == next_block_info
+    finally:
+        tracker.stop()
+
+
+def test_zmq_hashblock_new_block(bitcoin_client, block_info, next_block_info, zmq_publisher, new_blocks, new_block_received):
+    socket, port = zmq_publisher
+    # Long poll interval, so that only the hashblock message can trigger
+    # the refresh.
+    tracker = BlockTipTracker(
+        bitcoin_client, "127.0.0.1", port, poll_interval_s=3600)
+    start_tracker(tracker, new_blocks, new_block_received)
+    try:
+        assert new_block_received.wait(EVENT_TIMEOUT_S)
+        new_block_received.clear()
+        bitcoin_client.get_best_block_info.return_value = next_block_info
+
+        # Publish until the subscriber has connected.
+        for _ in range(EVENT_TIMEOUT_S * 10):
+            socket.send_multipart([
+                HASHBLOCK_TOPIC,
+                next_block_info.block_hash,
+                (1).to_bytes(4, 'little'),
+            ])
+            if new_block_received.wait(0.1):
+                break
+
+        assert new_blocks == [block_info, next_block_info]
+        assert tracker.get_best_block_info() == next_block_info
+    finally:
+        tracker.stop()
+
+
+def test_poll_failure_keeps_running(bitcoin_client, block_info, new_blocks, new_block_received):
+    bitcoin_client.get_best_block_info.side_effect = [
+        Exception("Connection failed."),
+        block_info,
+    ]
+    tracker = BlockTipTracker(
+        bitcoin_client, "127.0.0.1", None, poll_interval_s=0.01)
+    start_tracker(tracker, new_blocks, new_block_received)
+    try:
+        assert new_block_received.wait(EVENT_TIMEOUT_S)
+        assert new_blocks == [block_info]
+    finally:
+        tracker.stop()
+
+
+def test_zmq_subscription_failure_reconnects(bitcoin_client):
+    tracker = BlockTipTracker(
+        bitcoin_client,
+        "127.0.0.1",
+        1,
+        poll_interval_s=3600,
+        zmq_retry_s=0.01,
+    )
+    subscribed_again = threading.Event()
+    addresses = []
+
+    def receive_hashblocks(address):
+        addresses.append(address)
+        if len(addresses) < 3:
+            raise zmq.ZMQError()
+        subscribed_again.set()
+        tracker.stopped.wait()
+
+    with mock.patch.object(tracker, 'receive_hashblocks', side_effect=receive_hashblocks):
+        tracker.start()
+        try:
+            assert subscribed_again.wait(EVENT_TIMEOUT_S)
+        finally:
+            tracker.stop()
+
+    assert addresses == ["tcp://127.0.0.1:1"] * 3
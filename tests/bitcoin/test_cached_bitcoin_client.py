@@ -0,0 +1,117 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import mock
+import pytest
+
+from squeaknode.bitcoin.bitcoin_client import BitcoinClient
+from squeaknode.bitcoin.block_info import BlockInfo
+from squeaknode.bitcoin.block_info_cache import BlockInfoCache
+from squeaknode.bitcoin.cached_bitcoin_client import CachedBitcoinClient
+from tests.utils import gen_random_hash
+
+
+@pytest.fixture
+def best_block_info(block_header):
+    yield BlockInfo(
+        block_height=1000,
+        block_hash=gen_random_hash(),
+        block_header=block_header,
+    )
+
+
+@pytest.fixture
+def bitcoin_client(best_block_info):
+    bitcoin_client = mock.Mock(spec=BitcoinClient)
+    bitcoin_client.get_best_block_info.return_value = best_block_info
+    yield bitcoin_client
+
+
+@pytest.fixture
+def cached_bitcoin_client(bitcoin_client):
+    yield CachedBitcoinClient(
+        bitcoin_client,
+        BlockInfoCache(max_size=100, min_depth=6),
+    )
+
+
+def test_get_block_info_by_height(cached_bitcoin_client, bitcoin_client, block_info):
+    bitcoin_client.get_block_info_by_height.return_value = block_info
+    first_block_info = cached_bitcoin_client.get_block_info_by_height(
+        block_info.block_height)
+    second_block_info = cached_bitcoin_client.get_block_info_by_height(
+        block_info.block_height)
+
+    assert first_block_info == block_info
+    assert second_block_info == block_info
+    assert bitcoin_client.get_best_block_info.call_count == 1
+    assert bitcoin_client.get_block_info_by_height.call_count == 1
+
+
+def test_get_block_info_by_height_not_deep_enough(cached_bitcoin_client, bitcoin_client, best_block_info):
+    bitcoin_client.get_block_info_by_height.return_value = best_block_info
+    cached_bitcoin_client.get_block_info_by_height(
+        best_block_info.block_height)
+    cached_bitcoin_client.get_block_info_by_height(
+        best_block_info.block_height)
+
+    assert bitcoin_client.get_block_info_by_height.call_count == 2
+
+
+def test_get_block_infos_by_heights(cached_bitcoin_client, bitcoin_client, block_info, best_block_info):
+    bitcoin_client.get_block_info_by_height.return_value = block_info
+    cached_bitcoin_client.get_block_info_by_height(block_info.block_height)
+    bitcoin_client.get_block_infos_by_heights.return_value = {
+        best_block_info.block_height: best_block_info,
+    }
+    block_infos = cached_bitcoin_client.get_block_infos_by_heights([
+        block_info.block_height,
+        best_block_info.block_height,
+        best_block_info.block_height + 1,
+    ])
+
+    assert block_infos == {
+        block_info.block_height: block_info,
+        best_block_info.block_height: best_block_info,
+    }
+    (missing_block_heights,) = bitcoin_client.get_block_infos_by_heights.call_args.args
+    assert sorted(missing_block_heights) == [
+        best_block_info.block_height,
+        best_block_info.block_height + 1,
+    ]
+
+
+def test_get_block_infos_by_heights_all_cached(cached_bitcoin_client, bitcoin_client, block_info):
+    bitcoin_client.get_block_info_by_height.return_value = block_info
+    cached_bitcoin_client.get_block_info_by_height(block_info.block_height)
+    block_infos = cached_bitcoin_client.get_block_infos_by_heights([
+        block_info.block_height,
+    ])
+
+    assert block_infos == {block_info.block_height: block_info}
+    assert bitcoin_client.get_block_infos_by_heights.call_count == 0
+
+
+def test_get_best_block_info(cached_bitcoin_client, bitcoin_client, best_block_info):
+    retrieved_block_info = cached_bitcoin_client.get_best_block_info()
+
+    assert retrieved_block_info == best_block_info
+    assert cached_bitcoin_client.block_info_cache.best_block_height == best_block_info.block_height
@@ -0,0 +1,216 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import json
+import threading
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from urllib.parse import parse_qs
+from urllib.parse import urlparse
+
+import mock
+import pytest
+
+from squeaknode.client.peer_session_registry import PeerSessionRegistry
+from squeaknode.core.bloom_filter import BloomFilter
+from squeaknode.core.length_prefixed import encode_record
+from squeaknode.core.peer_address import Network
+from squeaknode.core.peer_address import PeerAddress
+from squeaknode.core.squeak_peer import SqueakPeer
+from squeaknode.core.squeaks import get_hash
+from squeaknode.node.squeak_store import SqueakStore
+
+
+class FakePeerHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        server.client_ports.add(self.client_address[1])
+        if self.path.startswith('/lookup'):
+            return self.do_lookup()
+        squeak_hash_str = self.path.split('/')[-1]
+        if self.path.startswith('/secretkey/'):
+            body = server.secret_keys.get(squeak_hash_str)
+        else:
+            squeak = server.squeaks.get(squeak_hash_str)
+            body = squeak.serialize() if squeak is not None else None
+        if body is None:
+            status, body = 404, b''
+        else:
+            status = 200
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_lookup(self):
+        server = self.server
+        query = parse_qs(urlparse(self.path).query)
+        squeak_hash_strs = list(server.squeaks.keys())
+        if 'limit' in query and server.supports_pagination:
+            limit = int(query['limit'][0])
+            start = int(query.get('cursor', ['0'])[0])
+            end = start + limit
+            page = {
+                'hashes': squeak_hash_strs[start:end],
+                'next': str(end) if end < len(squeak_hash_strs) else None,
+            }
+            server.lookup_pages.append(page)
+            body = json.dumps(page).encode()
+        else:
+            body = json.dumps(squeak_hash_strs).encode()
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_lookup_missing(self):
+        server = self.server
+        content_length = int(self.headers['Content-Length'])
+        known_filter = BloomFilter.deserialize(self.rfile.read(content_length))
+        if not server.supports_filter:
+            status, body = 404, b''
+        else:
+            status, body = 200, json.dumps([
+                squeak_hash_str for squeak_hash_str in server.squeaks
+                if bytes.fromhex(squeak_hash_str) not in known_filter
+            ]).encode()
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        server = self.server
+        if self.path.startswith('/lookup'):
+            return self.do_lookup_missing()
+        content_length = int(self.headers['Content-Length'])
+        squeak_hash_strs = json.loads(self.rfile.read(content_length))
+        server.num_batch_requests += 1
+        if not server.supports_batch:
+            status, body = 404, b''
+        elif self.path == '/secretkeys':
+            status, body = 200, b''.join(
+                encode_record(bytes.fromhex(squeak_hash_str)
+                              + server.secret_keys[squeak_hash_str])
+                for squeak_hash_str in squeak_hash_strs
+                if squeak_hash_str in server.secret_keys
+            )
+        else:
+            status, body = 200, b''.join(
+                encode_record(server.squeaks[squeak_hash_str].serialize())
+                for squeak_hash_str in squeak_hash_strs
+                if squeak_hash_str in server.squeaks
+            )
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def fake_peer_server(squeak):
+    server = ThreadingHTTPServer(('localhost', 0), FakePeerHandler)
+    server.client_ports = set()
+    server.squeaks = {get_hash(squeak).hex(): squeak}
+    server.secret_keys = {}
+    server.supports_batch = True
+    server.num_batch_requests = 0
+    server.supports_pagination = True
+    server.supports_filter = True
+    server.lookup_pages = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def local_peer(fake_peer_server):
+    yield SqueakPeer(
+        peer_id=None,
+        peer_name="fake_peer",
+        address=PeerAddress(
+            network=Network.IPV4,
+            host='localhost',
+            port=fake_peer_server.server_address[1],
+        ),
+        autoconnect=True,
+        share_for_free=False,
+    )
+
+
+@pytest.fixture
+def session_registry():
+    registry = PeerSessionRegistry(pool_size=2, idle_timeout_s=60)
+    yield registry
+    registry.close()
+
+
+class FakeSqueakStore:
+    """Keeps the saved squeaks and secret keys in memory."""
+
+    def __init__(self):
+        self.squeaks = {}
+        self.secret_keys = {}
+
+    def save_squeaks(self, squeaks):
+        for squeak in squeaks:
+            self.squeaks[get_hash(squeak)] = squeak
+        return [get_hash(squeak) for squeak in squeaks]
+
+    def save_secret_key(self, squeak_hash, secret_key):
+        self.secret_keys[squeak_hash] = secret_key
+
+    def get_existing_squeak_hashes(self, squeak_hashes):
+        return [h for h in squeak_hashes if h in self.squeaks]
+
+    def get_squeaks(self, squeak_hashes):
+        return {h: self.squeaks[h] for h in squeak_hashes if h in self.squeaks}
+
+    def get_squeak(self, squeak_hash):
+        return self.squeaks.get(squeak_hash)
+
+    def get_squeak_secret_keys(self, squeak_hashes):
+        return {h: self.secret_keys[h] for h in squeak_hashes if h in self.secret_keys}
+
+
+@pytest.fixture
+def squeak_store():
+    fake_squeak_store = FakeSqueakStore()
+    squeak_store = mock.Mock(spec=SqueakStore)
+    for name in [
+            'save_squeaks',
+            'save_secret_key',
+            'get_existing_squeak_hashes',
+            'get_squeaks',
+            'get_squeak',
+            'get_squeak_secret_keys',
+    ]:
+        getattr(squeak_store, name).side_effect = getattr(
+            fake_squeak_store, name)
+    squeak_store.fake = fake_squeak_store
+    return squeak_store
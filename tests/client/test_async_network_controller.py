@@ -0,0 +1,225 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import asyncio
+import threading
+
+import mock
+import pytest
+
+from squeaknode.client.async_download_scheduler import AsyncDownloadScheduler
+from squeaknode.client.async_network_controller import AsyncNetworkControllerFacade
+from squeaknode.client.async_peer_downloader import AsyncPeerDownloader
+from squeaknode.client.in_flight_hashes import InFlightHashes
+from squeaknode.core.sync_watermark import get_public_keys_digest
+from squeaknode.core.sync_watermark import SyncWatermark
+
+
+@pytest.fixture
+def timeline_squeak_store(squeak_store, local_peer, block_info, public_key):
+    squeak_store.get_autoconnect_peers.return_value = [local_peer]
+    squeak_store.get_latest_block_info.return_value = block_info
+    squeak_store.get_block_hash.return_value = block_info.block_hash
+    squeak_store.get_followed_public_keys.return_value = [public_key]
+    squeak_store.get_sync_watermark.return_value = None
+    squeak_store.lookup_secret_keys.return_value = []
+    squeak_store.lookup_locked_squeaks.return_value = []
+    squeak_store.get_received_offers.return_value = []
+    return squeak_store
+
+
+@pytest.fixture
+def network_controller(timeline_squeak_store, session_registry):
+    network_controller = AsyncNetworkControllerFacade(
+        timeline_squeak_store,
+        None,
+        None,
+        peer_session_registry=session_registry,
+    )
+    yield network_controller
+    network_controller.close()
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def make_downloader(peer, port):
+    downloader = mock.Mock(spec=AsyncPeerDownloader)
+    downloader.peer = peer._replace(address=peer.address._replace(port=port))
+    downloader.fetch_squeaks = mock.AsyncMock(return_value=[])
+    downloader.fetch_secret_keys = mock.AsyncMock(return_value={})
+    downloader.fetch_offer = mock.AsyncMock(return_value=False)
+    downloader.used_filter = False
+    return downloader
+
+
+def test_download_timeline(network_controller, timeline_squeak_store, fake_peer_server, local_peer, block_info, public_key, squeak, squeak_hash, secret_key):
+    fake_peer_server.secret_keys = {squeak_hash.hex(): secret_key}
+    download_result = network_controller.download_timeline(100)
+
+    timeline_squeak_store.save_squeaks.assert_called_once_with([squeak])
+    timeline_squeak_store.save_secret_key.assert_called_once_with(
+        squeak_hash, secret_key)
+    timeline_squeak_store.set_sync_watermark.assert_called_once_with(
+        SyncWatermark(
+            peer_address=local_peer.address,
+            public_keys_digest=get_public_keys_digest([public_key]),
+            block_height=block_info.block_height,
+            block_hash=block_info.block_hash,
+        )
+    )
+    assert download_result.number_requested == 2
+    assert download_result.number_downloaded == 2
+    assert download_result.number_peers == 1
+    assert network_controller.get_peer_session_stats()[
+        local_peer.address].num_requests == 3
+
+
+def test_download_single_squeak_not_batched(network_controller, timeline_squeak_store, fake_peer_server, squeak, squeak_hash):
+    fake_peer_server.supports_batch = False
+    download_result = network_controller.download_single_squeak(squeak_hash)
+
+    timeline_squeak_store.save_squeaks.assert_called_once_with([squeak])
+    assert download_result.number_downloaded == 1
+
+
+def test_download_single_squeak_not_batched_remembered(network_controller, fake_peer_server, squeak_hash):
+    fake_peer_server.supports_batch = False
+    network_controller.download_single_squeak(squeak_hash)
+    network_controller.download_single_squeak(squeak_hash)
+
+    # The second download does not send a batch request again.
+    assert fake_peer_server.num_batch_requests == 1
+
+
+def test_download_timeline_peer_down(network_controller, timeline_squeak_store, fake_peer_server):
+    fake_peer_server.shutdown()
+    fake_peer_server.server_close()
+    download_result = network_controller.download_timeline(100)
+
+    timeline_squeak_store.save_squeaks.assert_not_called()
+    timeline_squeak_store.set_sync_watermark.assert_not_called()
+    assert download_result.number_requested == 0
+    assert download_result.number_peers == 1
+
+
+def test_download_timeout(timeline_squeak_store, session_registry, fake_peer_server, squeak_hash):
+    network_controller = AsyncNetworkControllerFacade(
+        timeline_squeak_store,
+        None,
+        None,
+        peer_session_registry=session_registry,
+        download_timeout_s=0.1,
+    )
+    unblocked = threading.Event()
+    timeline_squeak_store.get_existing_squeak_hashes.side_effect = lambda squeak_hashes: unblocked.wait()
+    try:
+        download_result = network_controller.download_single_squeak(
+            squeak_hash)
+    finally:
+        unblocked.set()
+        network_controller.close()
+
+    timeline_squeak_store.save_squeaks.assert_not_called()
+    assert download_result.number_requested == 0
+
+
+def test_download_timeline_timeout_backs_off_peer(timeline_squeak_store, session_registry, local_peer):
+    network_controller = AsyncNetworkControllerFacade(
+        timeline_squeak_store,
+        None,
+        None,
+        peer_session_registry=session_registry,
+        download_timeout_s=0.1,
+    )
+    downloader = make_downloader(local_peer, local_peer.address.port)
+
+    async def lookup(*args):
+        await asyncio.sleep(10)
+
+    downloader.lookup = mock.AsyncMock(side_effect=lookup)
+    try:
+        with mock.patch.object(network_controller.controller, 'get_downloader', return_value=downloader):
+            network_controller.download_timeline(100)
+    finally:
+        network_controller.close()
+
+    timeline_squeak_store.set_sync_watermark.assert_not_called()
+    assert network_controller.get_peer_health()[
+        local_peer.address].consecutive_failures == 1
+
+
+def test_scheduler_falls_back_to_other_peer(squeak_store, peer, squeak, squeak_hash):
+    fast_downloader = make_downloader(peer, 1001)
+    slow_downloader = make_downloader(peer, 1002)
+    fast_downloader.fetch_squeaks.side_effect = Exception("Connection failed.")
+    slow_downloader.fetch_squeaks.return_value = [squeak]
+    scheduler = AsyncDownloadScheduler(
+        squeak_store,
+        InFlightHashes(),
+        InFlightHashes(),
+        {
+            fast_downloader.peer.address: 2.0,
+            slow_downloader.peer.address: 0.5,
+        },
+    )
+    download_result = run(scheduler.download({
+        slow_downloader: [squeak_hash],
+        fast_downloader: [squeak_hash],
+    }))
+
+    slow_downloader.fetch_squeaks.assert_called_once_with([squeak_hash])
+    assert download_result.number_downloaded == 1
+    assert download_result.number_peers == 2
+    assert scheduler.failed_hashes == set()
+
+
+def test_scheduler_cancelled_releases_in_flight_hashes(squeak_store, peer, squeak_hash):
+    downloader = make_downloader(peer, 1001)
+    in_flight_squeaks = InFlightHashes()
+    scheduler = AsyncDownloadScheduler(
+        squeak_store,
+        in_flight_squeaks,
+        InFlightHashes(),
+        {},
+    )
+
+    async def fetch_squeaks(squeak_hashes):
+        await asyncio.sleep(10)
+
+    async def download_and_cancel():
+        downloader.fetch_squeaks.side_effect = fetch_squeaks
+        task = asyncio.ensure_future(
+            scheduler.download({downloader: [squeak_hash]}))
+        await asyncio.sleep(0.1)
+        task.cancel()
+        await asyncio.wait([task])
+
+    run(download_and_cancel())
+
+    assert len(in_flight_squeaks) == 0
+    assert scheduler.failed_hashes == {squeak_hash}
+    assert scheduler.get_download_result().number_requested == 1
@@ -0,0 +1,281 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import mock
+import pytest
+
+from squeaknode.client.download_scheduler import DownloadScheduler
+from squeaknode.client.in_flight_hashes import InFlightHashes
+from squeaknode.client.peer_concurrency_limiter import PeerConcurrencyLimiter
+from squeaknode.client.peer_downloader import PeerDownloader
+from squeaknode.core.squeaks import get_hash
+
+
+def make_downloader(peer, port, squeaks, secret_keys):
+    downloader = mock.Mock(spec=PeerDownloader)
+    downloader.peer = peer._replace(address=peer.address._replace(port=port))
+    downloader.fetch_squeaks.side_effect = lambda squeak_hashes: [
+        squeak for squeak in squeaks if get_hash(squeak) in squeak_hashes
+    ]
+    downloader.fetch_secret_keys.side_effect = lambda squeak_hashes: {
+        h: secret_key for h, secret_key in secret_keys.items()
+        if h in squeak_hashes
+    }
+    return downloader
+
+
+@pytest.fixture
+def fast_downloader(peer, squeak, squeak_hash, secret_key):
+    return make_downloader(peer, 1001, [squeak], {squeak_hash: secret_key})
+
+
+@pytest.fixture
+def slow_downloader(peer, squeak, squeak_hash, secret_key):
+    return make_downloader(peer, 1002, [squeak], {squeak_hash: secret_key})
+
+
+@pytest.fixture
+def in_flight_squeaks():
+    return InFlightHashes()
+
+
+@pytest.fixture
+def executor():
+    executor = ThreadPoolExecutor(10)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.fixture
+def scheduler(squeak_store, in_flight_squeaks, executor, fast_downloader, slow_downloader):
+    return DownloadScheduler(
+        squeak_store,
+        in_flight_squeaks,
+        InFlightHashes(),
+        {
+            fast_downloader.peer.address: 2.0,
+            slow_downloader.peer.address: 0.5,
+        },
+        executor,
+    )
+
+
+def test_download_from_fastest_peer(scheduler, squeak_store, fast_downloader, slow_downloader, squeak_hash, secret_key):
+    download_result = scheduler.download({
+        slow_downloader: [squeak_hash],
+        fast_downloader: [squeak_hash],
+    })
+
+    fast_downloader.fetch_squeaks.assert_called_once_with([squeak_hash])
+    fast_downloader.fetch_secret_keys.assert_called_once_with([squeak_hash])
+    slow_downloader.fetch_squeaks.assert_not_called()
+    slow_downloader.fetch_secret_keys.assert_not_called()
+    squeak_store.save_secret_key.assert_called_once_with(
+        squeak_hash, secret_key)
+    assert download_result.number_requested == 2
+    assert download_result.number_downloaded == 2
+    assert download_result.number_peers == 1
+    assert scheduler.failed_hashes == set()
+
+
+def test_download_fall_back_to_other_peer(scheduler, fast_downloader, slow_downloader, squeak_hash):
+    fast_downloader.fetch_squeaks.side_effect = Exception("Connection failed.")
+    fast_downloader.fetch_secret_keys.side_effect = lambda squeak_hashes: {}
+    download_result = scheduler.download({
+        slow_downloader: [squeak_hash],
+        fast_downloader: [squeak_hash],
+    })
+
+    slow_downloader.fetch_squeaks.assert_called_once_with([squeak_hash])
+    # The failed peer is not used again in the same round.
+    fast_downloader.fetch_secret_keys.assert_not_called()
+    fast_downloader.fetch_offer.assert_not_called()
+    assert download_result.number_downloaded == 2
+    assert scheduler.failed_hashes == set()
+    assert scheduler.failed_peers == {fast_downloader.peer.address}
+
+
+def test_download_all_peers_failed(scheduler, fast_downloader, slow_downloader, squeak_hash):
+    fast_downloader.fetch_squeaks.side_effect = lambda squeak_hashes: []
+    slow_downloader.fetch_squeaks.side_effect = lambda squeak_hashes: []
+    download_result = scheduler.download({
+        slow_downloader: [squeak_hash],
+        fast_downloader: [squeak_hash],
+    })
+
+    assert download_result.number_requested == 1
+    assert download_result.number_downloaded == 0
+    assert scheduler.failed_hashes == {squeak_hash}
+
+
+def test_download_skips_in_flight_hashes(scheduler, in_flight_squeaks, fast_downloader, squeak_hash):
+    in_flight_squeaks.claim([squeak_hash])
+    download_result = scheduler.download({
+        fast_downloader: [squeak_hash],
+    })
+
+    fast_downloader.fetch_squeaks.assert_not_called()
+    assert download_result.number_requested == 0
+    assert len(in_flight_squeaks) == 1
+
+
+def test_download_releases_in_flight_hashes(scheduler, in_flight_squeaks, fast_downloader, squeak_hash):
+    scheduler.download({
+        fast_downloader: [squeak_hash],
+    })
+
+    assert len(in_flight_squeaks) == 0
+
+
+def test_lookup(scheduler, fast_downloader, slow_downloader, squeak_hash):
+    slow_downloader.lookup.side_effect = Exception("Connection failed.")
+    fast_downloader.lookup.return_value = [squeak_hash]
+    advertised = scheduler.lookup(
+        [fast_downloader, slow_downloader],
+        lambda downloader: downloader.lookup(0, 100, []),
+    )
+
+    assert advertised == {fast_downloader: [squeak_hash]}
+    assert scheduler.get_download_result().number_peers == 2
+
+
+def test_download_offers(scheduler, squeak_store, fast_downloader, slow_downloader, squeak, squeak_hash):
+    squeak_store.fake.squeaks[squeak_hash] = squeak
+    fast_downloader.fetch_offer.return_value = True
+    slow_downloader.fetch_offer.return_value = False
+    download_result = scheduler.download_offers(
+        [fast_downloader, slow_downloader],
+        squeak_hash,
+    )
+
+    fast_downloader.fetch_offer.assert_called_once_with(squeak_hash, squeak)
+    slow_downloader.fetch_offer.assert_called_once_with(squeak_hash, squeak)
+    assert download_result.number_requested == 2
+    assert download_result.number_downloaded == 1
+    assert download_result.number_peers == 2
+
+
+def test_download_offers_missing_squeak(scheduler, fast_downloader, squeak_hash):
+    download_result = scheduler.download_offers([fast_downloader], squeak_hash)
+
+    fast_downloader.fetch_offer.assert_not_called()
+    assert download_result.number_requested == 0
+
+
+def test_download_cancelled(scheduler, in_flight_squeaks, fast_downloader, squeak_hash):
+    scheduler.cancel()
+    download_result = scheduler.download({
+        fast_downloader: [squeak_hash],
+    })
+
+    fast_downloader.fetch_squeaks.assert_not_called()
+    assert download_result.number_downloaded == 0
+    assert scheduler.failed_hashes == {squeak_hash}
+    assert len(in_flight_squeaks) == 0
+
+
+def test_download_timeout(squeak_store, in_flight_squeaks, executor, fast_downloader, slow_downloader, squeak_hash):
+    unblocked = threading.Event()
+
+    def fetch_squeaks(squeak_hashes):
+        unblocked.wait()
+        return []
+
+    fast_downloader.fetch_squeaks.side_effect = fetch_squeaks
+    scheduler = DownloadScheduler(
+        squeak_store,
+        in_flight_squeaks,
+        InFlightHashes(),
+        {},
+        executor,
+        timeout_s=0.1,
+    )
+    try:
+        download_result = scheduler.download({
+            fast_downloader: [squeak_hash],
+        })
+
+        # The hash stays claimed while the abandoned task is fetching it.
+        assert len(in_flight_squeaks) == 1
+        other_scheduler = DownloadScheduler(
+            squeak_store,
+            in_flight_squeaks,
+            InFlightHashes(),
+            {},
+            executor,
+        )
+        other_scheduler.download({
+            slow_downloader: [squeak_hash],
+        })
+        slow_downloader.fetch_squeaks.assert_not_called()
+    finally:
+        unblocked.set()
+
+    assert scheduler.is_cancelled()
+    assert download_result.number_requested == 1
+    assert download_result.number_downloaded == 0
+    assert scheduler.failed_hashes == {squeak_hash}
+    for _ in range(100):
+        if len(in_flight_squeaks) == 0:
+            break
+        time.sleep(0.01)
+    assert len(in_flight_squeaks) == 0
+
+
+def test_peer_concurrency_limit(squeak_store, executor, peer):
+    lock = threading.Lock()
+    num_running = 0
+    max_running = 0
+
+    def fetch_offer(squeak_hash, squeak):
+        nonlocal num_running, max_running
+        with lock:
+            num_running += 1
+            max_running = max(max_running, num_running)
+        threading.Event().wait(0.01)
+        with lock:
+            num_running -= 1
+        return False
+
+    scheduler = DownloadScheduler(
+        squeak_store,
+        InFlightHashes(),
+        InFlightHashes(),
+        {},
+        executor,
+        peer_limiter=PeerConcurrencyLimiter(max_requests_per_peer=2),
+    )
+    downloaders = []
+    for _ in range(10):
+        downloader = make_downloader(peer, 1001, [], {})
+        downloader.fetch_offer.side_effect = fetch_offer
+        downloaders.append(downloader)
+    scheduler.run_on_peers({
+        downloader: (
+            lambda downloader=downloader: downloader.fetch_offer(None, None))
+        for downloader in downloaders
+    })
+
+    assert max_running == 2
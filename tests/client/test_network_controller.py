@@ -0,0 +1,360 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import threading
+
+import mock
+import pytest
+
+from squeaknode.client.network_controller import NetworkController
+from squeaknode.client.peer_downloader import PeerDownloader
+from squeaknode.client.peer_filter_tracker import PeerFilterTracker
+from squeaknode.core.sync_watermark import get_public_keys_digest
+from squeaknode.core.sync_watermark import SyncWatermark
+from squeaknode.node.squeak_store import SqueakStore
+
+
+@pytest.fixture
+def squeak_store(block_info, public_key, peer, squeak_hash):
+    squeak_store = mock.Mock(spec=SqueakStore)
+    squeak_store.get_latest_block_info.return_value = block_info
+    squeak_store.get_block_hash.return_value = block_info.block_hash
+    squeak_store.get_followed_public_keys.return_value = [public_key]
+    squeak_store.get_autoconnect_peers.return_value = [peer]
+    squeak_store.get_sync_watermark.return_value = None
+    squeak_store.get_existing_squeak_hashes.return_value = []
+    squeak_store.get_squeaks.return_value = {}
+    squeak_store.get_squeak_secret_keys.return_value = {}
+    squeak_store.lookup_locked_squeaks.return_value = []
+    squeak_store.save_squeaks.return_value = [squeak_hash]
+    return squeak_store
+
+
+@pytest.fixture
+def downloader(peer, squeak, squeak_hash):
+    downloader = mock.Mock(spec=PeerDownloader)
+    downloader.peer = peer
+    downloader.lookup.return_value = [squeak_hash]
+    downloader.fetch_squeaks.return_value = [squeak]
+    downloader.fetch_secret_keys.return_value = {}
+    downloader.used_filter = False
+    return downloader
+
+
+@pytest.fixture
+def network_controller(squeak_store, downloader):
+    network_controller = NetworkController(squeak_store, None, None)
+    with mock.patch.object(network_controller, 'get_downloader', autospec=True) as mock_get_downloader:
+        mock_get_downloader.return_value = downloader
+        yield network_controller
+    network_controller.close()
+
+
+@pytest.fixture
+def sync_watermark(peer, public_key, block_info):
+    return SyncWatermark(
+        peer_address=peer.address,
+        public_keys_digest=get_public_keys_digest([public_key]),
+        block_height=block_info.block_height - 3,
+        block_hash=block_info.block_hash,
+    )
+
+
+def test_download_timeline_first_sync(network_controller, squeak_store, downloader, block_info, public_key, peer):
+    network_controller.download_timeline(100)
+
+    downloader.lookup.assert_called_once_with(
+        block_info.block_height - 100,
+        block_info.block_height,
+        [public_key],
+        allow_filter=False,
+    )
+    squeak_store.set_sync_watermark.assert_called_once_with(
+        SyncWatermark(
+            peer_address=peer.address,
+            public_keys_digest=get_public_keys_digest([public_key]),
+            block_height=block_info.block_height,
+            block_hash=block_info.block_hash,
+        )
+    )
+
+
+def test_download_timeline_incremental(network_controller, squeak_store, downloader, block_info, public_key, sync_watermark):
+    squeak_store.get_sync_watermark.return_value = sync_watermark
+    network_controller.download_timeline(100)
+
+    downloader.lookup.assert_called_once_with(
+        sync_watermark.block_height,
+        block_info.block_height,
+        [public_key],
+        allow_filter=False,
+    )
+
+
+def test_download_timeline_followed_changed(network_controller, squeak_store, downloader, block_info, public_key, sync_watermark):
+    squeak_store.get_sync_watermark.return_value = sync_watermark._replace(
+        public_keys_digest=get_public_keys_digest([]),
+    )
+    network_controller.download_timeline(100)
+
+    downloader.lookup.assert_called_once_with(
+        block_info.block_height - 100,
+        block_info.block_height,
+        [public_key],
+        allow_filter=False,
+    )
+
+
+def test_download_timeline_reorg(network_controller, squeak_store, downloader, block_info, public_key, sync_watermark):
+    squeak_store.get_sync_watermark.return_value = sync_watermark
+    squeak_store.get_block_hash.return_value = b'\x00' * 32
+    network_controller.download_timeline(100)
+
+    downloader.lookup.assert_called_once_with(
+        block_info.block_height - 100,
+        block_info.block_height,
+        [public_key],
+        allow_filter=False,
+    )
+
+
+def test_download_timeline_filtered_lookup(network_controller, squeak_store, downloader, block_info):
+    network_controller.peer_filter_tracker = PeerFilterTracker(
+        full_lookup_interval=3,
+    )
+    sync_watermarks = {}
+    squeak_store.set_sync_watermark.side_effect = lambda sync_watermark: sync_watermarks.update(
+        {sync_watermark.peer_address: sync_watermark})
+    squeak_store.get_sync_watermark.side_effect = sync_watermarks.get
+
+    def lookup(min_block, max_block, pubkeys, allow_filter):
+        downloader.used_filter = allow_filter
+        return []
+
+    downloader.lookup.side_effect = lookup
+    for i in range(4):
+        squeak_store.get_latest_block_info.return_value = block_info._replace(
+            block_height=block_info.block_height + i,
+        )
+        network_controller.download_timeline(100)
+
+    # The filtered lookups advance the watermark, and the full lookup
+    # starts from the first block synced by a filtered lookup.
+    assert [
+        (call[0][0], call[1]['allow_filter'])
+        for call in downloader.lookup.call_args_list
+    ] == [
+        (block_info.block_height - 100, False),
+        (block_info.block_height, True),
+        (block_info.block_height + 1, True),
+        (block_info.block_height, False),
+    ]
+    assert squeak_store.set_sync_watermark.call_count == 4
+
+
+def test_download_timeline_full_lookup_interval(network_controller, downloader):
+    for _ in range(11):
+        network_controller.download_timeline(100)
+
+    assert [
+        call[1]['allow_filter']
+        for call in downloader.lookup.call_args_list
+    ] == [False] + [True] * 9 + [False]
+
+
+def test_download_timeline_lookup_failed(network_controller, squeak_store, downloader):
+    downloader.lookup.side_effect = Exception("Connection failed.")
+    network_controller.download_timeline(100)
+
+    downloader.fetch_squeaks.assert_not_called()
+    squeak_store.set_sync_watermark.assert_not_called()
+
+
+def test_download_timeline_fetch_failed(network_controller, squeak_store, downloader):
+    downloader.fetch_squeaks.side_effect = Exception("Connection failed.")
+    download_result = network_controller.download_timeline(100)
+
+    assert download_result.number_requested == 1
+    assert download_result.number_downloaded == 0
+    squeak_store.set_sync_watermark.assert_not_called()
+
+
+def test_download_timeline_failed_peer_backed_off(network_controller, downloader, peer):
+    downloader.lookup.side_effect = Exception("Connection failed.")
+    network_controller.download_timeline(100)
+    network_controller.download_timeline(100)
+
+    downloader.lookup.assert_called_once()
+    assert network_controller.peer_health_tracker.is_backed_off(peer.address)
+    assert network_controller.get_peer_health()[
+        peer.address].consecutive_failures == 1
+
+
+def test_download_timeline_timeout_backs_off_peer(squeak_store, downloader, peer):
+    network_controller = NetworkController(
+        squeak_store,
+        None,
+        None,
+        download_timeout_s=0.1,
+    )
+    unblocked = threading.Event()
+    downloader.lookup.side_effect = lambda *args, **kwargs: unblocked.wait() and []
+    with mock.patch.object(network_controller, 'get_downloader', return_value=downloader):
+        try:
+            network_controller.download_timeline(100)
+        finally:
+            unblocked.set()
+            network_controller.close()
+
+    squeak_store.set_sync_watermark.assert_not_called()
+    assert network_controller.peer_health_tracker.is_backed_off(peer.address)
+
+
+def test_download_timeline_shared_executor(squeak_store, downloader):
+    network_controller = NetworkController(squeak_store, None, None)
+    executor = network_controller.executor
+    with mock.patch.object(network_controller, 'get_downloader', return_value=downloader):
+        network_controller.download_timeline(100)
+        network_controller.download_timeline(100)
+    network_controller.close()
+
+    assert downloader.lookup.call_count == 2
+    with pytest.raises(RuntimeError):
+        executor.submit(lambda: None)
+
+
+def test_download_timeline_records_yield(network_controller, peer):
+    network_controller.download_timeline(100)
+
+    assert not network_controller.peer_health_tracker.is_backed_off(
+        peer.address)
+    assert network_controller.peer_health_tracker.round_stats[
+        peer.address].num_downloaded == 1
+
+
+def test_download_timeline_secret_key_released(network_controller, squeak_store, downloader, block_info, public_key, peer, squeak, squeak_hash, secret_key):
+    network_controller.peer_filter_tracker = PeerFilterTracker(
+        full_lookup_interval=2,
+    )
+    tip_block_info = block_info._replace(
+        block_height=block_info.block_height + 10,
+        block_hash=b'\x01' * 32,
+    )
+    tip_sync_watermark = SyncWatermark(
+        peer_address=peer.address,
+        public_keys_digest=get_public_keys_digest([public_key]),
+        block_height=tip_block_info.block_height,
+        block_hash=tip_block_info.block_hash,
+    )
+    squeak_store.get_latest_block_info.return_value = tip_block_info
+    squeak_store.get_existing_squeak_hashes.return_value = [squeak_hash]
+    squeak_store.get_squeaks.return_value = {squeak_hash: squeak}
+    squeak_store.lookup_locked_squeaks.return_value = [squeak_hash]
+    downloader.fetch_secret_keys.return_value = {}
+    network_controller.download_timeline(100)
+
+    # The watermark advances to the tip, even if the squeak is locked.
+    downloader.fetch_secret_keys.assert_called_once_with([squeak_hash])
+    squeak_store.set_sync_watermark.assert_called_once_with(
+        tip_sync_watermark,
+    )
+
+    # The secret key is released after the first sync, but the peer is
+    # not asked for it again in a filtered round.
+    squeak_store.get_sync_watermark.return_value = tip_sync_watermark
+    squeak_store.get_block_hash.return_value = tip_block_info.block_hash
+    downloader.lookup.return_value = []
+    downloader.fetch_secret_keys.return_value = {squeak_hash: secret_key}
+    network_controller.download_timeline(100)
+
+    downloader.lookup.assert_called_with(
+        tip_block_info.block_height,
+        tip_block_info.block_height,
+        [public_key],
+        allow_filter=True,
+    )
+    downloader.fetch_secret_keys.assert_called_once()
+    squeak_store.save_secret_key.assert_not_called()
+
+    # The locked squeak is asked for again in the next full round.
+    network_controller.download_timeline(100)
+
+    squeak_store.lookup_locked_squeaks.assert_called_with(
+        [public_key],
+        block_info.block_height + 10 - 100,
+        tip_block_info.block_height,
+    )
+    squeak_store.save_secret_key.assert_called_once_with(
+        squeak_hash, secret_key)
+
+
+def test_download_single_squeak(network_controller, squeak_store, downloader, squeak, squeak_hash):
+    squeak_store.get_existing_squeak_hashes.side_effect = [[], [squeak_hash]]
+    download_result = network_controller.download_single_squeak(squeak_hash)
+
+    downloader.fetch_squeaks.assert_called_once_with([squeak_hash])
+    squeak_store.save_squeaks.assert_called_once_with([squeak])
+    assert download_result.number_requested == 1
+    assert download_result.number_downloaded == 1
+    assert download_result.number_peers == 1
+
+
+def test_download_squeaks(network_controller, squeak_store, downloader, squeak, squeak_hash, public_key):
+    squeak_store.get_existing_squeak_hashes.side_effect = [[], [squeak_hash]]
+    download_result = network_controller.download_squeaks(
+        [public_key], 550, 560, None)
+
+    downloader.lookup.assert_called_once_with(550, 560, [public_key], None)
+    downloader.fetch_squeaks.assert_called_once_with([squeak_hash])
+    squeak_store.save_squeaks.assert_called_once_with([squeak])
+    squeak_store.set_sync_watermark.assert_not_called()
+    assert download_result.number_requested == 1
+    assert download_result.number_downloaded == 1
+
+
+def test_download_squeaks_replies(network_controller, downloader, squeak_hash):
+    network_controller.download_squeaks([], None, None, squeak_hash)
+
+    downloader.lookup.assert_called_once_with(None, None, [], squeak_hash)
+
+
+def test_download_offers(network_controller, squeak_store, downloader, squeak, squeak_hash):
+    squeak_store.get_squeak.return_value = squeak
+    downloader.fetch_offer.return_value = True
+    download_result = network_controller.download_offers(squeak_hash)
+
+    downloader.fetch_offer.assert_called_once_with(squeak_hash, squeak)
+    assert download_result.number_requested == 1
+    assert download_result.number_downloaded == 1
+    assert download_result.number_peers == 1
+
+
+def test_cancel_downloads(network_controller, downloader, squeak_hash):
+    def lookup(*args):
+        network_controller.cancel_downloads()
+        return [squeak_hash]
+
+    downloader.lookup.side_effect = lookup
+    download_result = network_controller.download_timeline(100)
+
+    downloader.fetch_squeaks.assert_not_called()
+    assert download_result.number_downloaded == 0
+    assert len(network_controller.active_schedulers) == 0
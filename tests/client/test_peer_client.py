@@ -0,0 +1,133 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import mock
+import pytest
+
+from squeaknode.client.peer_client import PeerClient
+from squeaknode.core.bloom_filter import BloomFilter
+
+
+@pytest.fixture
+def peer_client(local_peer, session_registry):
+    yield PeerClient(local_peer, None, None, session_registry)
+
+
+def test_get_squeak_reuses_connection(peer_client, fake_peer_server, session_registry, local_peer, squeak, squeak_hash):
+    for _ in range(20):
+        assert peer_client.get_squeak(squeak_hash) == squeak
+    stats = session_registry.get_stats()[local_peer.address]
+
+    assert len(fake_peer_server.client_ports) == 1
+    assert stats.num_requests == 20
+    assert stats.num_errors == 0
+    assert stats.num_sessions_created == 1
+
+
+def test_get_squeak_missing(peer_client, session_registry, local_peer, reply_squeak_hash):
+    assert peer_client.get_squeak(reply_squeak_hash) is None
+    assert session_registry.get_stats()[local_peer.address].num_errors == 0
+
+
+def test_get_squeak_connection_error(session_registry, local_peer, fake_peer_server, squeak_hash):
+    fake_peer_server.shutdown()
+    fake_peer_server.server_close()
+    peer_client = PeerClient(local_peer, None, None, session_registry)
+
+    with pytest.raises(Exception):
+        peer_client.get_squeak(squeak_hash)
+    assert session_registry.get_stats()[local_peer.address].num_errors == 1
+
+
+def test_evict_idle_sessions(peer_client, session_registry, local_peer, squeak_hash):
+    peer_client.get_squeak(squeak_hash)
+    with mock.patch('squeaknode.client.peer_session_registry.time.monotonic', autospec=True) as mock_monotonic:
+        mock_monotonic.return_value = 10 ** 9
+        session_registry.evict_idle_sessions()
+
+    assert session_registry.get_num_sessions() == 0
+
+    peer_client.get_squeak(squeak_hash)
+    stats = session_registry.get_stats()[local_peer.address]
+
+    assert session_registry.get_num_sessions() == 1
+    assert stats.num_sessions_created == 2
+
+
+def test_session_proxies(session_registry, local_peer):
+    proxies = {'http': 'socks5h://localhost:9050'}
+    session = session_registry.get_session(local_peer.address, proxies)
+
+    assert session.proxies == proxies
+    assert session.get_adapter('http://localhost')._pool_maxsize == 2
+
+
+def test_get_squeaks(peer_client, squeak, squeak_hash, reply_squeak_hash):
+    squeaks = peer_client.get_squeaks([squeak_hash, reply_squeak_hash])
+
+    assert squeaks == [squeak]
+
+
+def test_get_squeaks_not_supported(peer_client, fake_peer_server, squeak_hash):
+    fake_peer_server.supports_batch = False
+
+    assert peer_client.get_squeaks([squeak_hash]) is None
+
+
+def test_lookup_paginated(peer_client, fake_peer_server, public_key):
+    squeak_hash_strs = ['{:064x}'.format(i) for i in range(2500)]
+    fake_peer_server.squeaks = {
+        squeak_hash_str: None for squeak_hash_str in squeak_hash_strs
+    }
+    squeak_hashes = peer_client.lookup(0, 100, [public_key])
+
+    assert [squeak_hash.hex()
+            for squeak_hash in squeak_hashes] == squeak_hash_strs
+    assert len(fake_peer_server.lookup_pages) == 3
+
+
+def test_lookup_not_paginated(peer_client, fake_peer_server, public_key, squeak_hash):
+    fake_peer_server.supports_pagination = False
+    squeak_hashes = peer_client.lookup(0, 100, [public_key])
+
+    assert list(squeak_hashes) == [squeak_hash]
+    assert len(fake_peer_server.lookup_pages) == 0
+
+
+def test_lookup_missing(peer_client, fake_peer_server, public_key):
+    squeak_hashes = [bytes([i]) * 32 for i in range(100)]
+    fake_peer_server.squeaks = {
+        squeak_hash.hex(): None for squeak_hash in squeak_hashes
+    }
+    known_filter = BloomFilter.for_items(squeak_hashes[:90])
+    missing_hashes = peer_client.lookup_missing(
+        0, 100, [public_key], known_filter)
+
+    assert set(squeak_hashes[90:]).issubset(missing_hashes)
+    assert len(missing_hashes) < 20
+
+
+def test_lookup_missing_not_supported(peer_client, fake_peer_server, public_key, squeak_hash):
+    fake_peer_server.supports_filter = False
+    known_filter = BloomFilter.for_items([squeak_hash])
+
+    assert peer_client.lookup_missing(
+        0, 100, [public_key], known_filter) is None
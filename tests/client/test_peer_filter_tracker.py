@@ -0,0 +1,118 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import mock
+import pytest
+
+from squeaknode.client.peer_filter_tracker import PeerFilterTracker
+from squeaknode.client.peer_filter_tracker import TimelineLookup
+
+
+@pytest.fixture
+def tracker():
+    return PeerFilterTracker(
+        full_lookup_interval=3,
+        base_backoff_s=60,
+        max_backoff_s=100,
+    )
+
+
+@pytest.fixture
+def current_time():
+    with mock.patch('squeaknode.client.peer_filter_tracker.time.time', autospec=True) as mock_time:
+        mock_time.return_value = 1000.0
+        yield mock_time
+
+
+def test_full_lookup_interval(tracker, peer_address):
+    allowed = [
+        tracker.start_timeline_lookup(peer_address, 100, 0).allow_filter
+        for _ in range(7)
+    ]
+
+    assert allowed == [False, True, True, False, True, True, False]
+
+
+def test_full_lookup_from_unverified_block(tracker, peer_address):
+    timeline_lookup = tracker.start_timeline_lookup(peer_address, 100, 0)
+    tracker.record_timeline_synced(peer_address, timeline_lookup, False)
+    timeline_lookup = tracker.start_timeline_lookup(peer_address, 110, 0)
+    tracker.record_timeline_synced(peer_address, timeline_lookup, True)
+    timeline_lookup = tracker.start_timeline_lookup(peer_address, 120, 0)
+    tracker.record_timeline_synced(peer_address, timeline_lookup, True)
+
+    timeline_lookup = tracker.start_timeline_lookup(peer_address, 130, 0)
+    assert timeline_lookup == TimelineLookup(110, False)
+
+    tracker.record_timeline_synced(peer_address, timeline_lookup, False)
+    assert tracker.filter_stats[peer_address].unverified_min_block is None
+
+
+def test_full_lookup_in_interest_range(tracker, peer_address):
+    tracker.start_timeline_lookup(peer_address, 100, 0)
+    timeline_lookup = tracker.start_timeline_lookup(peer_address, 110, 0)
+    tracker.record_timeline_synced(peer_address, timeline_lookup, True)
+    tracker.start_timeline_lookup(peer_address, 120, 0)
+
+    timeline_lookup = tracker.start_timeline_lookup(peer_address, 130, 115)
+    assert timeline_lookup == TimelineLookup(115, False)
+
+
+def test_unfiltered_lookup_after_later_block(tracker, peer_address):
+    tracker.start_timeline_lookup(peer_address, 100, 0)
+    timeline_lookup = tracker.start_timeline_lookup(peer_address, 110, 0)
+    tracker.record_timeline_synced(peer_address, timeline_lookup, True)
+
+    # A lookup sent without a filter because the filter was not
+    # supported does not verify the blocks before it.
+    timeline_lookup = tracker.start_timeline_lookup(peer_address, 120, 0)
+    tracker.record_timeline_synced(peer_address, timeline_lookup, False)
+    assert tracker.filter_stats[peer_address].unverified_min_block == 110
+
+
+def test_filter_supported_by_default(tracker, peer_address):
+    assert tracker.is_filter_supported(peer_address)
+
+
+def test_filter_retried_after_backoff(tracker, peer_address, current_time):
+    tracker.record_filter_result(peer_address, False)
+    assert not tracker.is_filter_supported(peer_address)
+
+    current_time.return_value = 1060.0
+    assert tracker.is_filter_supported(peer_address)
+
+
+def test_filter_backoff_capped(tracker, peer_address, current_time):
+    tracker.record_filter_result(peer_address, False)
+    tracker.record_filter_result(peer_address, False)
+
+    current_time.return_value = 1099.0
+    assert not tracker.is_filter_supported(peer_address)
+    current_time.return_value = 1100.0
+    assert tracker.is_filter_supported(peer_address)
+
+
+def test_filter_backoff_reset_after_success(tracker, peer_address, current_time):
+    tracker.record_filter_result(peer_address, False)
+    tracker.record_filter_result(peer_address, True)
+
+    assert tracker.is_filter_supported(peer_address)
+    assert tracker.filter_stats[peer_address].consecutive_failures == 0
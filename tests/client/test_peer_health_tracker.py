@@ -0,0 +1,114 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import mock
+import pytest
+
+from squeaknode.client.peer_health_tracker import PeerHealthTracker
+from squeaknode.client.peer_session_registry import PeerSessionRegistry
+from squeaknode.client.peer_session_stats import PeerSessionStats
+
+
+@pytest.fixture
+def mock_session_registry():
+    return mock.Mock(spec=PeerSessionRegistry)
+
+
+@pytest.fixture
+def tracker(mock_session_registry):
+    mock_session_registry.get_stats.return_value = {}
+    return PeerHealthTracker(
+        mock_session_registry,
+        base_backoff_s=30,
+        max_backoff_s=100,
+    )
+
+
+@pytest.fixture
+def current_time():
+    with mock.patch('squeaknode.client.peer_health_tracker.time.time', autospec=True) as mock_time:
+        mock_time.return_value = 1000.0
+        yield mock_time
+
+
+def test_new_peer_health(tracker, peer_address):
+    peer_health = tracker.get_health(peer_address)
+
+    assert peer_health.score == 1.0
+    assert peer_health.consecutive_failures == 0
+    assert not tracker.is_backed_off(peer_address)
+
+
+def test_backoff_doubles(tracker, peer_address, current_time):
+    tracker.record_round(peer_address, True, 0)
+    assert tracker.get_health(peer_address).backoff_until_ms == 1030000
+
+    tracker.record_round(peer_address, True, 0)
+    assert tracker.get_health(peer_address).backoff_until_ms == 1060000
+    assert tracker.get_health(peer_address).consecutive_failures == 2
+
+
+def test_backoff_capped(tracker, peer_address, current_time):
+    for _ in range(5):
+        tracker.record_round(peer_address, True, 0)
+
+    assert tracker.get_health(peer_address).backoff_until_ms == 1100000
+
+
+def test_backoff_expires(tracker, peer_address, current_time):
+    tracker.record_round(peer_address, True, 0)
+    assert tracker.is_backed_off(peer_address)
+
+    current_time.return_value = 1031.0
+    assert not tracker.is_backed_off(peer_address)
+
+
+def test_backoff_reset_after_success(tracker, peer_address, current_time):
+    tracker.record_round(peer_address, True, 0)
+    tracker.record_round(peer_address, False, 3)
+
+    assert not tracker.is_backed_off(peer_address)
+    assert tracker.get_health(peer_address).consecutive_failures == 0
+
+
+def test_score(tracker, mock_session_registry, peer_address):
+    mock_session_registry.get_stats.return_value = {
+        peer_address: PeerSessionStats(
+            num_requests=4,
+            num_errors=1,
+            total_time_ms=4000,
+        ),
+    }
+    tracker.record_round(peer_address, False, 8)
+    peer_health = tracker.get_health(peer_address)
+
+    assert peer_health.error_rate == 0.25
+    assert peer_health.yield_per_request == 2.0
+    assert peer_health.avg_latency_ms == 1000.0
+    assert peer_health.score == 0.75 * 3 / 2
+
+
+def test_get_all_health(tracker, mock_session_registry, peer_address):
+    mock_session_registry.get_stats.return_value = {
+        peer_address: PeerSessionStats(num_requests=1),
+    }
+
+    assert set(tracker.get_all_health()) == {peer_address}
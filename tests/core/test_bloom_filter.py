@@ -0,0 +1,65 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import os
+
+import pytest
+
+from squeaknode.core.bloom_filter import BloomFilter
+
+
+@pytest.fixture
+def items():
+    yield [os.urandom(32) for _ in range(1000)]
+
+
+def test_bloom_filter_contains_items(items):
+    bloom_filter = BloomFilter.for_items(items)
+
+    assert all(item in bloom_filter for item in items)
+
+
+def test_bloom_filter_false_positive_rate(items):
+    bloom_filter = BloomFilter.for_items(items, false_positive_rate=0.01)
+    other_items = [os.urandom(32) for _ in range(10000)]
+    num_false_positives = sum(item in bloom_filter for item in other_items)
+
+    assert num_false_positives < 300
+
+
+def test_bloom_filter_serialize_deserialize(items):
+    bloom_filter = BloomFilter.for_items(items)
+    deserialized_filter = BloomFilter.deserialize(bloom_filter.serialize())
+
+    assert deserialized_filter.num_bits == bloom_filter.num_bits
+    assert deserialized_filter.num_hashes == bloom_filter.num_hashes
+    assert all(item in deserialized_filter for item in items)
+
+
+@pytest.mark.parametrize("data", [
+    b'',
+    b'\x00' * 5,
+    b'\x00' * 4 + b'\x00' + b'\xff',
+    b'\x00' * 4 + b'\xff' + b'\xff',
+])
+def test_bloom_filter_deserialize_invalid(data):
+    with pytest.raises(ValueError):
+        BloomFilter.deserialize(data)
@@ -0,0 +1,55 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import pytest
+
+from squeaknode.core.length_prefixed import decode_records
+from squeaknode.core.length_prefixed import encode_record
+
+
+def split_into_chunks(data, chunk_size):
+    return [
+        data[i:i + chunk_size]
+        for i in range(0, len(data), chunk_size)
+    ]
+
+
+def test_encode_decode_records():
+    records = [b'', b'hello', b'x' * 1000]
+    data = b''.join(encode_record(record) for record in records)
+
+    for chunk_size in [1, 3, 7, len(data)]:
+        chunks = split_into_chunks(data, chunk_size)
+        assert list(decode_records(chunks)) == records
+
+
+def test_decode_record_too_long():
+    data = encode_record(b'x' * 100)
+
+    with pytest.raises(ValueError):
+        list(decode_records([data], max_record_length=99))
+
+
+def test_decode_truncated_record():
+    data = encode_record(b'hello')
+
+    with pytest.raises(ValueError):
+        list(decode_records([data[:-1]]))
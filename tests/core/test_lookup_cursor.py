@@ -0,0 +1,48 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import pytest
+
+from squeaknode.core.lookup_cursor import cursor_from_str
+from squeaknode.core.lookup_cursor import cursor_to_str
+from squeaknode.core.lookup_cursor import LookupCursor
+
+
+def test_cursor_to_str_and_from_str(squeak_hash):
+    cursor = LookupCursor(
+        block_height=123,
+        time_s=456789,
+        squeak_hash=squeak_hash,
+    )
+
+    assert cursor_from_str(cursor_to_str(cursor)) == cursor
+
+
+@pytest.mark.parametrize("cursor_str", [
+    "",
+    "123:456",
+    "abc:456:" + "00" * 32,
+    "123:456:" + "00" * 31,
+    "123:456:xyz",
+])
+def test_cursor_from_str_invalid(cursor_str):
+    with pytest.raises(ValueError):
+        cursor_from_str(cursor_str)
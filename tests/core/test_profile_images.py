@@ -0,0 +1,80 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+from squeaknode.core.profile_images import process_profile_image
+
+
+def make_image(mode, size, image_format):
+    output = BytesIO()
+    Image.new(mode, size).save(output, format=image_format)
+    return output.getvalue()
+
+
+def open_image(data):
+    return Image.open(BytesIO(data))
+
+
+def test_process_profile_image_downscales():
+    data = make_image("RGB", (1200, 800), "PNG")
+    image = open_image(process_profile_image(data, size_px=256))
+
+    assert image.format == "JPEG"
+    assert image.size == (256, 256)
+
+
+def test_process_profile_image_does_not_upscale():
+    data = make_image("RGB", (100, 120), "JPEG")
+    image = open_image(process_profile_image(data, size_px=256))
+
+    assert image.size == (100, 100)
+
+
+def test_process_profile_image_keeps_transparency():
+    data = make_image("RGBA", (512, 512), "PNG")
+    image = open_image(process_profile_image(data, size_px=256))
+
+    assert image.format == "PNG"
+    assert image.mode == "RGBA"
+    assert image.size == (256, 256)
+
+
+def test_process_profile_image_too_large():
+    data = make_image("RGB", (512, 512), "PNG")
+
+    with pytest.raises(Exception):
+        process_profile_image(data, max_upload_bytes=len(data) - 1)
+
+
+def test_process_profile_image_invalid():
+    with pytest.raises(Exception):
+        process_profile_image(b'not an image')
+
+
+def test_process_profile_image_corrupt():
+    data = make_image("RGB", (512, 512), "PNG")
+
+    with pytest.raises(Exception, match="Invalid profile image"):
+        process_profile_image(data[:len(data) // 2])
@@ -19,6 +19,9 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+from typing import Dict
+from typing import List
+
 import pytest
 
 from squeaknode.bitcoin.bitcoin_client import BitcoinClient
@@ -172,6 +175,13 @@ class MockBitcoinClient(BitcoinClient):
     def get_block_info_by_height(self, block_height: int) -> BlockInfo:
         return self.best_block_info
 
+    def get_block_infos_by_heights(self, block_heights: List[int]) -> Dict[int, BlockInfo]:
+        return {
+            block_height: self.best_block_info
+            for block_height in block_heights
+            if block_height == self.best_block_info.block_height
+        }
+
     def get_block_hash(self, block_height: int) -> bytes:
         return self.best_block_info.block_hash
 
@@ -363,6 +373,17 @@ def test_get_block_header_invalid_block_hash(
     assert "Block hash incorrect." in str(excinfo.value)
 
 
+def test_get_block_headers(
+        squeak_core,
+        squeak,
+        other_squeak,
+        block_info,
+):
+    block_headers = squeak_core.get_block_headers([squeak, other_squeak])
+
+    assert block_headers == [block_info.block_header, None]
+
+
 def test_check_squeak(squeak_core, squeak):
     squeak_core.check_squeak(squeak)
 
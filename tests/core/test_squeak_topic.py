@@ -0,0 +1,50 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from squeaknode.core.squeak_topic import get_squeak_entry_topics
+from squeaknode.core.squeak_topic import SqueakTopic
+
+
+def test_squeak_entry_topics(squeak_entry_locked, squeak_hash, public_key):
+    topics = get_squeak_entry_topics(squeak_entry_locked, frozenset())
+
+    assert set(topics) == {
+        SqueakTopic.squeak_hash(squeak_hash),
+        SqueakTopic.public_key(public_key),
+    }
+
+
+def test_reply_squeak_entry_topics(squeak_entry_locked, reply_squeak_hash):
+    topics = get_squeak_entry_topics(
+        squeak_entry_locked._replace(reply_to=reply_squeak_hash),
+        frozenset(),
+    )
+
+    assert SqueakTopic.reply_to(reply_squeak_hash) in topics
+
+
+def test_followed_squeak_entry_topics(squeak_entry_locked, public_key):
+    topics = get_squeak_entry_topics(
+        squeak_entry_locked,
+        frozenset([public_key]),
+    )
+
+    assert SqueakTopic.timeline() in topics
@@ -0,0 +1,71 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import mock
+import pytest
+
+from squeaknode.db.parse_cache import ParseCache
+
+
+@pytest.fixture
+def parse_fn():
+    yield mock.Mock(side_effect=lambda data: data.decode())
+
+
+@pytest.fixture
+def parse_cache(parse_fn):
+    yield ParseCache(parse_fn, 2)
+
+
+def test_parse(parse_cache, parse_fn):
+    assert parse_cache.parse(b'a') == 'a'
+    assert parse_cache.parse(b'a') == 'a'
+
+    parse_fn.assert_called_once_with(b'a')
+    assert parse_cache.hits == 1
+    assert parse_cache.misses == 1
+
+
+def test_parse_with_key(parse_cache, parse_fn):
+    assert parse_cache.parse(b'a', key=b'key') == 'a'
+    assert parse_cache.parse(b'b', key=b'key') == 'a'
+
+    parse_fn.assert_called_once_with(b'a')
+
+
+def test_parse_evicts_least_recently_used(parse_cache, parse_fn):
+    parse_cache.parse(b'a')
+    parse_cache.parse(b'b')
+    parse_cache.parse(b'a')
+    parse_cache.parse(b'c')
+    parse_cache.parse(b'a')
+    parse_cache.parse(b'b')
+
+    assert len(parse_cache) == 2
+    assert parse_fn.call_count == 4
+
+
+def test_clear(parse_cache, parse_fn):
+    parse_cache.parse(b'a')
+    parse_cache.clear()
+    parse_cache.parse(b'a')
+
+    assert parse_fn.call_count == 2
@@ -24,7 +24,11 @@ import time
 import mock
 import pytest
 from sqlalchemy import create_engine
+from sqlalchemy import event
 
+from squeaknode.core.squeaks import get_hash
+from squeaknode.core.sync_watermark import get_public_keys_digest
+from squeaknode.core.sync_watermark import SyncWatermark
 from squeaknode.core.twitter_account import TwitterAccount
 from squeaknode.db.exception import SqueakDatabaseError
 from squeaknode.db.squeak_db import SqueakDb
@@ -37,6 +41,7 @@ from tests.utils import gen_sent_payment
 from tests.utils import gen_signing_profile
 from tests.utils import gen_squeak_peer
 from tests.utils import gen_squeak_with_block_header
+from tests.utils import sha256
 
 
 @pytest.fixture
@@ -470,6 +475,26 @@ def test_get_squeak(squeak_db, squeak, inserted_squeak_hash):
     assert retrieved_squeak == squeak
 
 
+def test_get_squeak_cached(squeak_db, squeak, inserted_squeak_hash):
+    first_squeak = squeak_db.get_squeak(inserted_squeak_hash)
+    second_squeak = squeak_db.get_squeak(inserted_squeak_hash)
+
+    assert second_squeak is first_squeak
+    assert squeak_db.squeak_cache.hits == 1
+
+
+def test_get_squeak_bytes(squeak_db, squeak, inserted_squeak_hash):
+    retrieved_squeak_bytes = squeak_db.get_squeak_bytes(inserted_squeak_hash)
+
+    assert retrieved_squeak_bytes == squeak.serialize()
+
+
+def test_get_squeak_bytes_missing(squeak_db):
+    retrieved_squeak_bytes = squeak_db.get_squeak_bytes(gen_random_hash())
+
+    assert retrieved_squeak_bytes is None
+
+
 def test_get_deleted_squeak(squeak_db, deleted_squeak_hash):
     retrieved_squeak = squeak_db.get_squeak(deleted_squeak_hash)
 
@@ -507,6 +532,35 @@ def test_get_squeak_entry(
         profile_id=None) == signing_profile
 
 
+def test_get_squeak_entry_with_profile_image(
+        squeak_db,
+        inserted_squeak_hash,
+        inserted_signing_profile_id,
+        profile_image_bytes,
+):
+    squeak_db.set_profile_image(
+        inserted_signing_profile_id, profile_image_bytes)
+    retrieved_squeak_entry = squeak_db.get_squeak_entry(inserted_squeak_hash)
+
+    assert retrieved_squeak_entry.squeak_profile.profile_image_hash == sha256(
+        profile_image_bytes)
+
+
+def test_get_squeak_entry_with_profile_lookup(
+        squeak_db,
+        public_key,
+        signing_profile,
+        inserted_squeak_hash,
+):
+    profile_lookup = mock.Mock(return_value=signing_profile)
+    squeak_db.set_profile_lookup(profile_lookup)
+    retrieved_squeak_entry = squeak_db.get_squeak_entry(inserted_squeak_hash)
+
+    profile_lookup.assert_called_once_with(public_key.to_bytes())
+    assert retrieved_squeak_entry.squeak_profile == signing_profile
+    assert retrieved_squeak_entry.recipient_squeak_profile is None
+
+
 def test_get_private_squeak_entry(
         squeak_db,
         private_squeak,
@@ -584,6 +638,124 @@ def test_get_secret_key_missing_squeak(squeak_db, squeak, squeak_hash):
     assert retrieved_secret_key is None
 
 
+def test_get_squeaks(squeak_db, inserted_squeak_hashes):
+    missing_hash = gen_random_hash()
+    with mock.patch('squeaknode.db.squeak_db.IN_CLAUSE_CHUNK_SIZE', 7):
+        retrieved_squeaks = squeak_db.get_squeaks(
+            inserted_squeak_hashes + [missing_hash],
+        )
+
+    assert set(retrieved_squeaks.keys()) == set(inserted_squeak_hashes)
+    for squeak_hash, squeak in retrieved_squeaks.items():
+        assert get_hash(squeak) == squeak_hash
+
+
+def test_get_squeaks_bytes(squeak_db, inserted_squeak_hashes):
+    missing_hash = gen_random_hash()
+    with mock.patch('squeaknode.db.squeak_db.IN_CLAUSE_CHUNK_SIZE', 7):
+        retrieved_squeaks_bytes = squeak_db.get_squeaks_bytes(
+            inserted_squeak_hashes + [missing_hash],
+        )
+    retrieved_squeaks = squeak_db.get_squeaks(inserted_squeak_hashes)
+
+    assert set(retrieved_squeaks_bytes.keys()) == set(inserted_squeak_hashes)
+    for squeak_hash, squeak_bytes in retrieved_squeaks_bytes.items():
+        assert squeak_bytes == retrieved_squeaks[squeak_hash].serialize()
+
+
+def test_get_squeaks_empty(squeak_db, inserted_squeak_hashes):
+    retrieved_squeaks = squeak_db.get_squeaks([])
+
+    assert retrieved_squeaks == {}
+
+
+def test_get_existing_squeak_hashes(squeak_db, inserted_squeak_hashes):
+    missing_hashes = [gen_random_hash() for _ in range(10)]
+    with mock.patch('squeaknode.db.squeak_db.IN_CLAUSE_CHUNK_SIZE', 7):
+        existing_hashes = squeak_db.get_existing_squeak_hashes(
+            missing_hashes + inserted_squeak_hashes,
+        )
+
+    assert set(existing_hashes) == set(inserted_squeak_hashes)
+
+
+def test_get_squeak_secret_keys(
+        squeak_db,
+        inserted_squeak_hash,
+        inserted_reply_squeak_hash,
+        secret_key,
+):
+    squeak_db.set_squeak_secret_key(inserted_squeak_hash, secret_key)
+    secret_keys = squeak_db.get_squeak_secret_keys([
+        inserted_squeak_hash,
+        inserted_reply_squeak_hash,
+        gen_random_hash(),
+    ])
+
+    assert secret_keys == {inserted_squeak_hash: secret_key}
+
+
+def test_insert_squeaks(squeak_db, private_key):
+    squeaks_with_headers = [
+        gen_squeak_with_block_header(private_key, i)
+        for i in range(20)
+    ]
+    with mock.patch('squeaknode.db.squeak_db.IN_CLAUSE_CHUNK_SIZE', 7):
+        inserted_hashes = squeak_db.insert_squeaks(squeaks_with_headers)
+
+    expected_hashes = [get_hash(squeak) for squeak, _ in squeaks_with_headers]
+    assert inserted_hashes == expected_hashes
+    assert squeak_db.get_number_of_squeaks() == 20
+
+
+def test_insert_squeaks_skip_existing(squeak_db, private_key, squeak, block_header, inserted_squeak_hash):
+    new_squeak_with_header = gen_squeak_with_block_header(private_key, 5)
+    inserted_hashes = squeak_db.insert_squeaks([
+        (squeak, block_header),
+        new_squeak_with_header,
+        new_squeak_with_header,
+    ])
+
+    assert inserted_hashes == [get_hash(new_squeak_with_header[0])]
+    assert squeak_db.get_number_of_squeaks() == 2
+
+
+def test_insert_squeaks_counts_only_inserted(squeak_db, private_key, squeak, block_header, inserted_squeak_hash):
+    new_squeak_with_header = gen_squeak_with_block_header(
+        private_key, squeak.nBlockHeight)
+    squeak_db.insert_squeaks([
+        (squeak, block_header),
+        new_squeak_with_header,
+    ])
+
+    assert squeak_db.number_of_squeaks_with_public_key_with_block_height(
+        squeak.GetPubKey(),
+        squeak.nBlockHeight,
+    ) == 2
+    assert squeak_db.check_squeak_counts()
+
+
+def test_insert_squeaks_decrypted_searchable(squeak_db, squeak, block_header, squeak_hash, secret_key, squeak_content):
+    squeak_db.insert_squeaks(
+        [(squeak, block_header)],
+        {squeak_hash: (secret_key, squeak_content)},
+    )
+    squeak_entries = squeak_db.get_squeak_entries_for_text_search(
+        search_text="hello",
+        limit=200,
+        last_entry=None,
+    )
+
+    assert [entry.squeak_hash for entry in squeak_entries] == [squeak_hash]
+    assert squeak_entries[0].content == squeak_content
+
+
+def test_insert_squeaks_empty(squeak_db):
+    inserted_hashes = squeak_db.insert_squeaks([])
+
+    assert inserted_hashes == []
+
+
 def test_get_timeline_squeak_entries(squeak_db, followed_squeak_hashes):
     timeline_squeak_entries = squeak_db.get_timeline_squeak_entries(
         limit=2,
@@ -602,6 +774,63 @@ def test_get_timeline_squeak_entries_all_unfollowed(squeak_db, unfollowed_squeak
     assert len(timeline_squeak_entries) == 0
 
 
+@pytest.fixture
+def captured_select_statements(db_engine):
+    """ Record the select statements executed on the engine. """
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("SELECT"):
+            captured.append((
+                statement,
+                tuple(
+                    bytes(p) if isinstance(p, memoryview) else p
+                    for p in parameters
+                ),
+            ))
+
+    event.listen(db_engine, "before_cursor_execute", capture)
+    yield captured
+    event.remove(db_engine, "before_cursor_execute", capture)
+
+
+def get_query_plan(db_engine, statement, parameters):
+    with db_engine.connect() as connection:
+        result = connection.exec_driver_sql(
+            "EXPLAIN QUERY PLAN " + statement,
+            parameters,
+        )
+        return [row[-1] for row in result]
+
+
+@pytest.mark.parametrize("run_query", [
+    lambda db, public_key, squeak_hash: db.get_timeline_squeak_entries(
+        limit=10, last_entry=None),
+    lambda db, public_key, squeak_hash: db.get_liked_squeak_entries(
+        limit=10, last_entry=None),
+    lambda db, public_key, squeak_hash: db.get_squeak_entries_for_public_key(
+        public_key, limit=10, last_entry=None),
+    lambda db, public_key, squeak_hash: db.get_thread_reply_squeak_entries(
+        squeak_hash, limit=10, last_entry=None),
+])
+def test_paginated_squeak_queries_use_index(
+        squeak_db,
+        db_engine,
+        followed_squeak_hashes,
+        public_key,
+        squeak_hash,
+        captured_select_statements,
+        run_query,
+):
+    run_query(squeak_db, public_key, squeak_hash)
+    (statement, parameters), = captured_select_statements
+    query_plan = get_query_plan(db_engine, statement, parameters)
+
+    assert query_plan[0].startswith("SEARCH squeak USING")
+    assert "INDEX ix_squeak_" in query_plan[0]
+    assert not any("TEMP B-TREE" in step for step in query_plan)
+
+
 def test_set_profile_following(squeak_db, followed_contact_profile_id):
     profile = squeak_db.get_profile(followed_contact_profile_id)
 
@@ -623,7 +852,37 @@ def test_set_profile_name(squeak_db, profile_with_new_name_id, new_profile_name)
 def test_set_profile_image(squeak_db, profile_with_image_id, profile_image_bytes):
     profile = squeak_db.get_profile(profile_with_image_id)
 
-    assert profile.profile_image == profile_image_bytes
+    assert profile.profile_image_hash == sha256(profile_image_bytes)
+    assert squeak_db.get_profile_image(
+        profile.profile_image_hash) == profile_image_bytes
+
+
+def test_clear_profile_image(squeak_db, profile_with_image_id, profile_image_bytes):
+    squeak_db.set_profile_image(profile_with_image_id, None)
+    profile = squeak_db.get_profile(profile_with_image_id)
+
+    assert profile.profile_image_hash is None
+    assert squeak_db.get_profile_image(sha256(profile_image_bytes)) is None
+
+
+def test_shared_profile_image(
+        squeak_db,
+        profile_with_image_id,
+        inserted_contact_profile_ids,
+        profile_image_bytes,
+):
+    squeak_db.set_profile_image(
+        inserted_contact_profile_ids[0], profile_image_bytes)
+    squeak_db.delete_profile(profile_with_image_id)
+
+    assert squeak_db.get_profile_image(
+        sha256(profile_image_bytes)) == profile_image_bytes
+
+
+def test_delete_profile_with_image(squeak_db, profile_with_image_id, profile_image_bytes):
+    squeak_db.delete_profile(profile_with_image_id)
+
+    assert squeak_db.get_profile_image(sha256(profile_image_bytes)) is None
 
 
 def test_deleted_profile(squeak_db, deleted_profile_id):
@@ -753,6 +1012,97 @@ def test_get_search_squeak_entries_other_text(
     assert len(squeak_entries) == 0
 
 
+def test_get_search_squeak_entries_prefix(
+        squeak_db,
+        unlocked_squeak_hash,
+):
+    # Get the search squeak entries with a prefix of a word.
+    squeak_entries = squeak_db.get_squeak_entries_for_text_search(
+        search_text="HEL",
+        limit=200,
+        last_entry=None,
+    )
+
+    assert len(squeak_entries) == 1
+
+
+def test_get_search_squeak_entries_no_words(
+        squeak_db,
+        unlocked_squeak_hash,
+):
+    # Get the search squeak entries with only punctuation.
+    squeak_entries = squeak_db.get_squeak_entries_for_text_search(
+        search_text="!?",
+        limit=200,
+        last_entry=None,
+    )
+
+    assert len(squeak_entries) == 0
+
+
+def test_get_search_squeak_entries_deleted(
+        squeak_db,
+        unlocked_squeak_hash,
+):
+    squeak_db.delete_squeak(unlocked_squeak_hash)
+    # Get the search squeak entries after the squeak is deleted.
+    squeak_entries = squeak_db.get_squeak_entries_for_text_search(
+        search_text="hello",
+        limit=200,
+        last_entry=None,
+    )
+
+    assert len(squeak_entries) == 0
+
+
+def test_get_search_squeak_entries_content_changed(
+        squeak_db,
+        unlocked_squeak_hash,
+):
+    squeak_db.set_squeak_decrypted_content(unlocked_squeak_hash, "goodbye")
+    # Get the search squeak entries for the old and new content.
+    old_squeak_entries = squeak_db.get_squeak_entries_for_text_search(
+        search_text="hello",
+        limit=200,
+        last_entry=None,
+    )
+    new_squeak_entries = squeak_db.get_squeak_entries_for_text_search(
+        search_text="goodbye",
+        limit=200,
+        last_entry=None,
+    )
+
+    assert len(old_squeak_entries) == 0
+    assert len(new_squeak_entries) == 1
+
+
+def test_get_search_squeak_entries_pages(
+        squeak_db,
+        inserted_squeak_hashes,
+):
+    for i, squeak_hash in enumerate(inserted_squeak_hashes):
+        squeak_db.set_squeak_decrypted_content(
+            squeak_hash,
+            "hello number {}".format(i),
+        )
+    # Get the search squeak entries one page at a time.
+    retrieved_hashes = []
+    last_entry = None
+    while True:
+        squeak_entries = squeak_db.get_squeak_entries_for_text_search(
+            search_text="hello num",
+            limit=30,
+            last_entry=last_entry,
+        )
+        if not squeak_entries:
+            break
+        retrieved_hashes.extend(
+            entry.squeak_hash for entry in squeak_entries)
+        last_entry = squeak_entries[-1]
+
+    assert retrieved_hashes == inserted_squeak_hashes[::-1]
+
+
 def test_get_ancestor_squeak_entries(
         squeak_db,
         inserted_squeak_hash,
@@ -960,6 +1310,94 @@ def test_lookup_squeaks_unlocked_all_none(
     assert len(squeak_hashes) == 0
 
 
+def test_lookup_locked_squeaks(
+        squeak_db,
+        inserted_squeak_hash,
+):
+    squeak_hashes = squeak_db.lookup_locked_squeaks(
+        public_keys=None,
+        min_block=None,
+        max_block=None,
+    )
+
+    assert squeak_hashes == [inserted_squeak_hash]
+
+
+def test_lookup_locked_squeaks_unlocked(
+        squeak_db,
+        unlocked_squeak_hash,
+):
+    squeak_hashes = squeak_db.lookup_locked_squeaks(
+        public_keys=None,
+        min_block=None,
+        max_block=None,
+    )
+
+    assert squeak_hashes == []
+
+
+def test_lookup_locked_squeaks_with_offer(
+        squeak_db,
+        inserted_squeak_hash,
+        inserted_received_offer_id,
+        creation_date,
+        expiry,
+):
+    current_time_s = creation_date + expiry - 10
+    with mock.patch.object(SqueakDb, 'timestamp_now_ms', new_callable=mock.PropertyMock) as mock_timestamp_ms:
+        mock_timestamp_ms.return_value = current_time_s * 1000
+        squeak_hashes = squeak_db.lookup_locked_squeaks(
+            public_keys=None,
+            min_block=None,
+            max_block=None,
+        )
+
+    assert squeak_hashes == []
+
+
+def test_lookup_locked_squeaks_with_expired_offer(
+        squeak_db,
+        inserted_squeak_hash,
+        inserted_received_offer_id,
+        creation_date,
+        expiry,
+):
+    current_time_s = creation_date + expiry + 10
+    with mock.patch.object(SqueakDb, 'timestamp_now_ms', new_callable=mock.PropertyMock) as mock_timestamp_ms:
+        mock_timestamp_ms.return_value = current_time_s * 1000
+        squeak_hashes = squeak_db.lookup_locked_squeaks(
+            public_keys=None,
+            min_block=None,
+            max_block=None,
+        )
+
+    assert squeak_hashes == [inserted_squeak_hash]
+
+
+def test_lookup_squeak_cursors_paginated(
+        squeak_db,
+        inserted_squeak_hashes,
+):
+    squeak_hashes = []
+    last_cursor = None
+    while True:
+        cursors = squeak_db.lookup_squeak_cursors(
+            public_keys=None,
+            min_block=None,
+            max_block=None,
+            reply_to_hash=None,
+            include_locked=True,
+            limit=30,
+            last_cursor=last_cursor,
+        )
+        squeak_hashes.extend(cursor.squeak_hash for cursor in cursors)
+        if len(cursors) < 30:
+            break
+        last_cursor = cursors[-1]
+
+    assert squeak_hashes == list(reversed(inserted_squeak_hashes))
+
+
 def test_get_number_of_squeaks(
         squeak_db,
         inserted_squeak_hashes,
@@ -983,6 +1421,80 @@ def test_number_of_squeaks_with_public_key_with_block_height(
     assert num_squeaks == 1
 
 
+def test_get_number_of_squeaks_by_public_key_and_block_height(
+        squeak_db,
+        public_key,
+        inserted_squeak_hashes,
+):
+    other_public_key = gen_pubkey()
+    with mock.patch('squeaknode.db.squeak_db.IN_CLAUSE_CHUNK_SIZE', 2):
+        counts = squeak_db.get_number_of_squeaks_by_public_key_and_block_height([
+            (public_key, 43),
+            (public_key, 44),
+            (public_key, 1000),
+            (other_public_key, 43),
+        ])
+
+    assert counts == {
+        (public_key, 43): 1,
+        (public_key, 44): 1,
+    }
+
+
+def test_get_number_of_squeaks_after_delete(
+        squeak_db,
+        public_key,
+        inserted_squeak_hashes,
+):
+    squeak_db.delete_squeak(inserted_squeak_hashes[43])
+    squeak_db.delete_squeak(gen_random_hash())
+    num_squeaks = squeak_db.get_number_of_squeaks()
+    num_squeaks_for_block = squeak_db.number_of_squeaks_with_public_key_with_block_height(
+        public_key=public_key,
+        block_height=43,
+    )
+
+    assert num_squeaks == len(inserted_squeak_hashes) - 1
+    assert num_squeaks_for_block == 0
+
+
+def test_get_number_of_squeaks_after_insert_existing(
+        squeak_db,
+        squeak,
+        block_header,
+        inserted_squeak_hash,
+):
+    squeak_db.insert_squeak(squeak, block_header)
+    squeak_db.insert_squeaks([(squeak, block_header)])
+    num_squeaks = squeak_db.get_number_of_squeaks()
+
+    assert num_squeaks == 1
+
+
+def test_check_squeak_counts(squeak_db, inserted_squeak_hashes):
+    squeak_db.delete_squeak(inserted_squeak_hashes[0])
+
+    assert squeak_db.check_squeak_counts()
+
+
+def test_rebuild_squeak_counts(squeak_db, public_key, inserted_squeak_hashes):
+    with squeak_db.get_transaction() as connection:
+        connection.execute(squeak_db.squeak_counts.delete())
+        connection.execute(squeak_db.squeak_block_counts.delete())
+
+    assert not squeak_db.check_squeak_counts()
+
+    squeak_db.rebuild_squeak_counts()
+    num_squeaks_for_block = squeak_db.number_of_squeaks_with_public_key_with_block_height(
+        public_key=public_key,
+        block_height=43,
+    )
+
+    assert squeak_db.check_squeak_counts()
+    assert squeak_db.get_number_of_squeaks() == len(inserted_squeak_hashes)
+    assert num_squeaks_for_block == 1
+
+
 def test_get_old_squeaks_to_delete(
         squeak_db,
         followed_squeak_hashes,
@@ -1217,6 +1729,27 @@ def test_set_peer_name(squeak_db, peer_with_new_name_id, new_peer_name):
     assert peer.peer_name == new_peer_name
 
 
+def test_get_sync_watermark_missing(squeak_db, peer_address):
+    assert squeak_db.get_sync_watermark(peer_address) is None
+
+
+def test_set_sync_watermark(squeak_db, peer_address, public_key):
+    sync_watermark = SyncWatermark(
+        peer_address=peer_address,
+        public_keys_digest=get_public_keys_digest([public_key]),
+        block_height=100,
+        block_hash=b'\x01' * 32,
+    )
+    squeak_db.set_sync_watermark(sync_watermark)
+    updated_sync_watermark = sync_watermark._replace(
+        block_height=101,
+        block_hash=b'\x02' * 32,
+    )
+    squeak_db.set_sync_watermark(updated_sync_watermark)
+
+    assert squeak_db.get_sync_watermark(peer_address) == updated_sync_watermark
+
+
 def test_get_deleted_peer(squeak_db, deleted_peer_id):
     retrieved_peer = squeak_db.get_peer(deleted_peer_id)
 
@@ -0,0 +1,51 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from squeaknode.db.text_search import get_fts5_match_query
+from squeaknode.db.text_search import get_search_rowid
+from squeaknode.db.text_search import get_tsquery
+
+
+def test_get_fts5_match_query():
+    assert get_fts5_match_query("Hello, World!") == '"hello"* "world"*'
+
+
+def test_get_fts5_match_query_quotes():
+    assert get_fts5_match_query('say "hi" OR') == '"say"* "hi"* "or"*'
+
+
+def test_get_fts5_match_query_empty():
+    assert get_fts5_match_query("  !? ") == ""
+
+
+def test_get_tsquery():
+    assert get_tsquery("Hello, World!") == "hello:* & world:*"
+
+
+def test_get_tsquery_operators():
+    assert get_tsquery("a & !b | c:*") == "a:* & b:* & c:*"
+
+
+def test_get_search_rowid(squeak_hash):
+    rowid = get_search_rowid(squeak_hash)
+
+    assert -2**63 <= rowid < 2**63
+    assert rowid == get_search_rowid(squeak_hash)
@@ -0,0 +1,171 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import threading
+
+import mock
+import pytest
+
+from squeaknode.node.event_bus import EventBus
+from squeaknode.node.event_bus import OverflowPolicy
+from squeaknode.node.event_bus import SubscriptionOverflowError
+
+
+@pytest.fixture
+def stopped():
+    return threading.Event()
+
+
+def get_buffered_items(subscription, stopped):
+    items = []
+    for item in subscription.get_items(stopped, poll_interval_s=0.01):
+        items.append(item)
+        if subscription.get_lag() == 0:
+            break
+    return items
+
+
+def test_publish_to_subscribers(stopped):
+    event_bus = EventBus()
+    with event_bus.get_subscription() as subscription1, \
+            event_bus.get_subscription() as subscription2:
+        event_bus.publish(1)
+        event_bus.publish(2)
+
+        assert get_buffered_items(subscription1, stopped) == [1, 2]
+        assert get_buffered_items(subscription2, stopped) == [1, 2]
+
+
+def test_publish_without_subscribers():
+    event_bus = EventBus()
+    event_bus.publish(1)
+
+    assert event_bus.get_stats().num_published == 1
+
+
+def test_drop_oldest(stopped):
+    event_bus = EventBus(max_queue_size=2)
+    with event_bus.get_subscription() as subscription:
+        for item in range(5):
+            event_bus.publish(item)
+
+        assert get_buffered_items(subscription, stopped) == [3, 4]
+        assert event_bus.get_stats().num_dropped == 3
+
+
+def test_disconnect(stopped):
+    event_bus = EventBus(
+        max_queue_size=2,
+        overflow_policy=OverflowPolicy.DISCONNECT,
+    )
+    with event_bus.get_subscription() as subscription:
+        for item in range(3):
+            event_bus.publish(item)
+
+        with pytest.raises(SubscriptionOverflowError):
+            next(subscription.get_items(stopped))
+
+    stats = event_bus.get_stats()
+    assert stats.num_subscribers == 0
+    assert stats.num_disconnected == 1
+    assert stats.num_dropped == 3
+
+
+def test_coalesce(stopped):
+    event_bus = EventBus(
+        max_queue_size=2,
+        overflow_policy=OverflowPolicy.COALESCE,
+        coalesce_key=lambda item: item[0],
+    )
+    with event_bus.get_subscription() as subscription:
+        event_bus.publish(('a', 1))
+        event_bus.publish(('b', 1))
+        event_bus.publish(('a', 2))
+        event_bus.publish(('c', 1))
+
+        assert get_buffered_items(subscription, stopped) == [
+            ('b', 1), ('c', 1)]
+
+
+def test_yield_items_until_stopped(stopped):
+    event_bus = EventBus(poll_interval_s=0.01)
+    received = []
+
+    def consume():
+        for item in event_bus.yield_items(stopped):
+            received.append(item)
+            stopped.set()
+
+    thread = threading.Thread(target=consume)
+    thread.start()
+    while event_bus.get_stats().num_subscribers == 0:
+        pass
+    event_bus.publish(1)
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    assert received == [1]
+    assert event_bus.get_stats().num_subscribers == 0
+
+
+def test_stats_lag(stopped):
+    event_bus = EventBus()
+    with event_bus.get_subscription() as subscription:
+        event_bus.publish(1)
+        event_bus.publish(2)
+        assert event_bus.get_stats().max_lag == 2
+
+        next(subscription.get_items(stopped))
+        stats = event_bus.get_stats()
+        assert stats.max_lag == 1
+        assert stats.num_delivered == 1
+
+
+def test_callback():
+    event_bus = EventBus()
+    received = []
+    event_bus.add_callback('test', received.append)
+    event_bus.publish(1)
+    event_bus.remove_callback('test')
+    event_bus.publish(2)
+
+    assert received == [1]
+
+
+def test_publish_to_topic(stopped):
+    event_bus = EventBus(get_topics=lambda item: [item % 2])
+    with event_bus.get_subscription(0) as even_subscription, \
+            event_bus.get_subscription() as all_subscription:
+        for item in range(4):
+            event_bus.publish(item)
+
+        assert get_buffered_items(even_subscription, stopped) == [0, 2]
+        assert get_buffered_items(all_subscription, stopped) == [0, 1, 2, 3]
+    assert event_bus.subscriptions == {}
+
+
+def test_topics_not_computed_without_topic_subscribers():
+    get_topics = mock.Mock(return_value=[])
+    event_bus = EventBus(get_topics=get_topics)
+    with event_bus.get_subscription():
+        event_bus.publish(1)
+
+    get_topics.assert_not_called()
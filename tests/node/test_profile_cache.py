@@ -0,0 +1,119 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import mock
+import pytest
+
+from squeaknode.db.squeak_db import SqueakDb
+from squeaknode.node.profile_cache import ProfileCache
+
+
+@pytest.fixture
+def cached_signing_profile(signing_profile):
+    yield signing_profile._replace(profile_id=1)
+
+
+@pytest.fixture
+def cached_contact_profile(recipient_contact_profile):
+    yield recipient_contact_profile._replace(profile_id=2, following=False)
+
+
+@pytest.fixture
+def squeak_db(cached_signing_profile, cached_contact_profile):
+    squeak_db = mock.Mock(spec=SqueakDb)
+    squeak_db.get_profiles.return_value = [
+        cached_signing_profile,
+        cached_contact_profile,
+    ]
+    yield squeak_db
+
+
+@pytest.fixture
+def profile_cache(squeak_db):
+    yield ProfileCache(squeak_db)
+
+
+def test_get_profiles(profile_cache, squeak_db, cached_signing_profile, cached_contact_profile):
+    assert profile_cache.get_profiles() == [
+        cached_signing_profile, cached_contact_profile]
+    assert profile_cache.get_signing_profiles() == [cached_signing_profile]
+    assert profile_cache.get_contact_profiles() == [cached_contact_profile]
+    assert profile_cache.get_following_profiles() == [cached_signing_profile]
+    squeak_db.get_profiles.assert_called_once()
+
+
+def test_get_profile(profile_cache, cached_signing_profile, cached_contact_profile, recipient_public_key):
+    assert profile_cache.get_profile(1) == cached_signing_profile
+    assert profile_cache.get_profile(3) is None
+    assert profile_cache.get_profile_by_public_key(
+        recipient_public_key) == cached_contact_profile
+    assert profile_cache.get_profile_by_public_key_bytes(
+        recipient_public_key.to_bytes()) == cached_contact_profile
+    assert profile_cache.get_profile_by_name(
+        cached_signing_profile.profile_name) == cached_signing_profile
+    assert profile_cache.get_profile_by_name("missing_name") is None
+
+
+def test_put(profile_cache, contact_profile):
+    profile_cache.get_profiles()
+    new_profile = contact_profile._replace(
+        profile_id=3, profile_name="new_profile_name")
+    profile_cache.put(new_profile)
+
+    assert profile_cache.get_profile(3) == new_profile
+
+
+def test_put_before_load(profile_cache, squeak_db, contact_profile):
+    profile_cache.put(contact_profile._replace(profile_id=3))
+
+    assert profile_cache.get_profile(3) is None
+    squeak_db.get_profiles.assert_called_once()
+
+
+def test_update(profile_cache, cached_contact_profile):
+    profile_cache.get_profiles()
+    profile_cache.update(2, following=True, profile_name="new_name")
+
+    assert profile_cache.get_profile(2) == cached_contact_profile._replace(
+        following=True, profile_name="new_name")
+
+
+def test_remove(profile_cache, recipient_public_key):
+    profile_cache.get_profiles()
+    profile_cache.remove(2)
+
+    assert profile_cache.get_profile(2) is None
+    assert profile_cache.get_profile_by_public_key(
+        recipient_public_key) is None
+
+
+def test_stats(profile_cache):
+    profile_cache.get_profile(1)
+    profile_cache.get_profile(2)
+    profile_cache.get_profile(3)
+    profile_cache.clear()
+    profile_cache.get_profile(1)
+    stats = profile_cache.get_stats()
+
+    assert stats.num_profiles == 2
+    assert stats.num_hits == 2
+    assert stats.num_misses == 2
+    assert stats.hit_rate == 0.5
@@ -168,3 +168,32 @@ def test_create_peer(squeak_store, squeak_controller, peer_address):
         "fake_peer_name",
         peer_address,
     )
+
+
+def test_download_replies(network_controller, squeak_controller, squeak_hash):
+    squeak_controller.download_replies(squeak_hash)
+
+    network_controller.download_squeaks.assert_called_once_with(
+        [],
+        None,
+        None,
+        squeak_hash,
+    )
+
+
+def test_download_public_key_squeaks(squeak_store, network_controller, squeak_controller, public_key):
+    squeak_store.get_latest_block.return_value = 5000
+    squeak_controller.download_public_key_squeaks(public_key)
+
+    network_controller.download_squeaks.assert_called_once_with(
+        [public_key],
+        5000 - 2016,
+        5000,
+        None,
+    )
+
+
+def test_download_offers(network_controller, squeak_controller, squeak_hash):
+    squeak_controller.download_offers(squeak_hash)
+
+    network_controller.download_offers.assert_called_once_with(squeak_hash)
@@ -19,11 +19,14 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+import threading
+
 import mock
 import pytest
 
 from squeaknode.core.lightning_address import LightningAddressHostPort
 from squeaknode.core.squeak_core import SqueakCore
+from squeaknode.core.squeak_topic import SqueakTopic
 from squeaknode.db.squeak_db import SqueakDb
 from squeaknode.node.squeak_store import SqueakStore
 
@@ -103,7 +106,7 @@ def test_save_squeak(squeak_store, squeak_db, squeak_core, block_header, squeak,
     with mock.patch.object(squeak_db, 'get_number_of_squeaks', autospec=True) as mock_get_number_of_squeaks, \
             mock.patch.object(squeak_db, 'number_of_squeaks_with_public_key_with_block_height', autospec=True) as mock_number_of_squeaks_with_public_key_with_block_height, \
             mock.patch.object(squeak_db, 'insert_squeak', autospec=True) as mock_insert_squeak, \
-            mock.patch.object(squeak_store.new_squeak_listener, 'handle_new_item', autospec=True) as mock_handle_new_squeak, \
+            mock.patch.object(squeak_store.new_squeak_listener, 'publish', autospec=True) as mock_handle_new_squeak, \
             mock.patch.object(squeak_core, 'get_block_header', autospec=True) as mock_get_block_header:
         mock_get_number_of_squeaks.return_value = 0
         mock_number_of_squeaks_with_public_key_with_block_height.return_value = 0
@@ -119,7 +122,7 @@ def test_save_squeak_above_max(squeak_store, squeak_db, squeak_core, block_heade
     with mock.patch.object(squeak_db, 'get_number_of_squeaks', autospec=True) as mock_get_number_of_squeaks, \
             mock.patch.object(squeak_db, 'number_of_squeaks_with_public_key_with_block_height', autospec=True) as mock_number_of_squeaks_with_public_key_with_block_height, \
             mock.patch.object(squeak_db, 'insert_squeak', autospec=True) as mock_insert_squeak, \
-            mock.patch.object(squeak_store.new_squeak_listener, 'handle_new_item', autospec=True) as mock_handle_new_squeak, \
+            mock.patch.object(squeak_store.new_squeak_listener, 'publish', autospec=True) as mock_handle_new_squeak, \
             mock.patch.object(squeak_core, 'get_block_header', autospec=True) as mock_get_block_header:
         mock_get_number_of_squeaks.return_value = max_squeaks + 1
         mock_number_of_squeaks_with_public_key_with_block_height.return_value = 0
@@ -137,7 +140,7 @@ def test_save_squeak_above_max_per_pubkey(squeak_store, squeak_db, squeak_core,
     with mock.patch.object(squeak_db, 'get_number_of_squeaks', autospec=True) as mock_get_number_of_squeaks, \
             mock.patch.object(squeak_db, 'number_of_squeaks_with_public_key_with_block_height', autospec=True) as mock_number_of_squeaks_with_public_key_with_block_height, \
             mock.patch.object(squeak_db, 'insert_squeak', autospec=True) as mock_insert_squeak, \
-            mock.patch.object(squeak_store.new_squeak_listener, 'handle_new_item', autospec=True) as mock_handle_new_squeak, \
+            mock.patch.object(squeak_store.new_squeak_listener, 'publish', autospec=True) as mock_handle_new_squeak, \
             mock.patch.object(squeak_core, 'get_block_header', autospec=True) as mock_get_block_header:
         mock_get_number_of_squeaks.return_value = 0
         mock_number_of_squeaks_with_public_key_with_block_height.return_value = max_squeaks_per_public_key_per_block + 1
@@ -151,11 +154,99 @@ def test_save_squeak_above_max_per_pubkey(squeak_store, squeak_db, squeak_core,
         assert mock_handle_new_squeak.call_count == 0
 
 
+def test_save_squeaks(squeak_store, squeak_db, squeak_core, block_header, squeak, squeak_hash, reply_squeak, reply_squeak_hash):
+    with mock.patch.object(squeak_db, 'get_number_of_squeaks', autospec=True) as mock_get_number_of_squeaks, \
+            mock.patch.object(squeak_db, 'get_number_of_squeaks_by_public_key_and_block_height', autospec=True) as mock_get_number_of_squeaks_by_public_key_and_block_height, \
+            mock.patch.object(squeak_db, 'insert_squeaks', autospec=True) as mock_insert_squeaks, \
+            mock.patch.object(squeak_store.new_squeak_listener, 'publish', autospec=True) as mock_handle_new_squeak, \
+            mock.patch.object(squeak_core, 'get_block_headers', autospec=True) as mock_get_block_headers:
+        mock_get_number_of_squeaks.return_value = 0
+        mock_get_number_of_squeaks_by_public_key_and_block_height.return_value = {}
+        mock_get_block_headers.return_value = [block_header, block_header]
+        mock_insert_squeaks.return_value = [reply_squeak_hash]
+        inserted_hashes = squeak_store.save_squeaks([squeak, reply_squeak])
+
+        assert inserted_hashes == [reply_squeak_hash]
+        mock_get_block_headers.assert_called_once_with([squeak, reply_squeak])
+        mock_insert_squeaks.assert_called_once_with(
+            [(squeak, block_header), (reply_squeak, block_header)],
+        )
+        mock_handle_new_squeak.assert_called_once_with(reply_squeak)
+
+
+def test_save_squeaks_invalid_block_hash(squeak_store, squeak_db, squeak_core, block_header, squeak, squeak_hash, reply_squeak, reply_squeak_hash):
+    with mock.patch.object(squeak_db, 'get_number_of_squeaks', autospec=True) as mock_get_number_of_squeaks, \
+            mock.patch.object(squeak_db, 'get_number_of_squeaks_by_public_key_and_block_height', autospec=True) as mock_get_number_of_squeaks_by_public_key_and_block_height, \
+            mock.patch.object(squeak_db, 'insert_squeaks', autospec=True) as mock_insert_squeaks, \
+            mock.patch.object(squeak_store.new_squeak_listener, 'publish', autospec=True) as mock_handle_new_squeak, \
+            mock.patch.object(squeak_core, 'get_block_headers', autospec=True) as mock_get_block_headers:
+        mock_get_number_of_squeaks.return_value = 0
+        mock_get_number_of_squeaks_by_public_key_and_block_height.return_value = {}
+        mock_get_block_headers.return_value = [None, block_header]
+        mock_insert_squeaks.return_value = [reply_squeak_hash]
+        squeak_store.save_squeaks([squeak, reply_squeak])
+
+        mock_insert_squeaks.assert_called_once_with(
+            [(reply_squeak, block_header)],
+        )
+        mock_handle_new_squeak.assert_called_once_with(reply_squeak)
+
+
+def test_save_squeaks_above_max(squeak_store, squeak_db, squeak_core, block_header, squeak, reply_squeak, max_squeaks):
+    with mock.patch.object(squeak_db, 'get_number_of_squeaks', autospec=True) as mock_get_number_of_squeaks, \
+            mock.patch.object(squeak_db, 'get_number_of_squeaks_by_public_key_and_block_height', autospec=True) as mock_get_number_of_squeaks_by_public_key_and_block_height, \
+            mock.patch.object(squeak_db, 'insert_squeaks', autospec=True) as mock_insert_squeaks, \
+            mock.patch.object(squeak_core, 'get_block_headers', autospec=True) as mock_get_block_headers:
+        mock_get_number_of_squeaks.return_value = max_squeaks - 1
+        mock_get_number_of_squeaks_by_public_key_and_block_height.return_value = {}
+        mock_get_block_headers.return_value = [block_header, block_header]
+        mock_insert_squeaks.return_value = []
+        squeak_store.save_squeaks([squeak, reply_squeak])
+
+        mock_insert_squeaks.assert_called_once_with(
+            [(squeak, block_header)],
+        )
+
+
+def test_save_squeaks_above_max_per_pubkey(squeak_store, squeak_db, squeak_core, block_header, squeak, max_squeaks_per_public_key_per_block):
+    with mock.patch.object(squeak_db, 'get_number_of_squeaks', autospec=True) as mock_get_number_of_squeaks, \
+            mock.patch.object(squeak_db, 'get_number_of_squeaks_by_public_key_and_block_height', autospec=True) as mock_get_number_of_squeaks_by_public_key_and_block_height, \
+            mock.patch.object(squeak_db, 'insert_squeaks', autospec=True) as mock_insert_squeaks, \
+            mock.patch.object(squeak_core, 'get_block_headers', autospec=True) as mock_get_block_headers:
+        mock_get_number_of_squeaks.return_value = 0
+        mock_get_number_of_squeaks_by_public_key_and_block_height.return_value = {
+            (squeak.GetPubKey(), squeak.nBlockHeight): max_squeaks_per_public_key_per_block,
+        }
+        mock_get_block_headers.return_value = [block_header]
+        mock_insert_squeaks.return_value = []
+        squeak_store.save_squeaks([squeak])
+
+        mock_insert_squeaks.assert_called_once_with([])
+
+
+def test_check_squeak_counts(squeak_store, squeak_db):
+    with mock.patch.object(squeak_db, 'check_squeak_counts', autospec=True) as mock_check_squeak_counts, \
+            mock.patch.object(squeak_db, 'rebuild_squeak_counts', autospec=True) as mock_rebuild_squeak_counts:
+        mock_check_squeak_counts.return_value = True
+        squeak_store.check_squeak_counts()
+
+        assert mock_rebuild_squeak_counts.call_count == 0
+
+
+def test_check_squeak_counts_inconsistent(squeak_store, squeak_db):
+    with mock.patch.object(squeak_db, 'check_squeak_counts', autospec=True) as mock_check_squeak_counts, \
+            mock.patch.object(squeak_db, 'rebuild_squeak_counts', autospec=True) as mock_rebuild_squeak_counts:
+        mock_check_squeak_counts.return_value = False
+        squeak_store.check_squeak_counts()
+
+        mock_rebuild_squeak_counts.assert_called_once_with()
+
+
 def test_save_secret_key(squeak_store, squeak_db, squeak_core, squeak, squeak_hash, secret_key):
     with mock.patch.object(squeak_db, 'get_squeak', autospec=True) as mock_get_squeak, \
             mock.patch.object(squeak_db, 'set_squeak_secret_key', autospec=True) as mock_set_squeak_secret_key, \
             mock.patch.object(squeak_store, 'unlock_squeak', autospec=True) as mock_unlock_squeak, \
-            mock.patch.object(squeak_store.new_secret_key_listener, 'handle_new_item', autospec=True) as mock_handle_new_secret_key:
+            mock.patch.object(squeak_store.new_secret_key_listener, 'publish', autospec=True) as mock_handle_new_secret_key:
         mock_get_squeak.return_value = squeak
         squeak_store.save_secret_key(squeak_hash, secret_key)
 
@@ -321,3 +412,98 @@ def test_get_received_offer(squeak_store, squeak_db, received_offer):
 #     assert retrieved_received_offer == received_offer._replace(
 #         received_offer_id=received_offer_id,
 #     )
+
+
+def test_followed_public_key_set_cached(squeak_store, squeak_db, contact_profile, public_key):
+    squeak_db.get_profiles.return_value = [
+        contact_profile._replace(profile_id=1)]
+
+    assert squeak_store.get_followed_public_key_set() == {public_key}
+    assert squeak_store.get_followed_public_key_set() == {public_key}
+    squeak_db.get_profiles.assert_called_once()
+
+
+def test_followed_public_key_set_invalidated(squeak_store, squeak_db, contact_profile, public_key):
+    squeak_db.get_profiles.return_value = [
+        contact_profile._replace(profile_id=1, following=False)]
+    assert squeak_store.get_followed_public_key_set() == frozenset()
+
+    squeak_store.set_squeak_profile_following(1, True)
+
+    assert squeak_store.get_followed_public_key_set() == {public_key}
+    squeak_db.get_profiles.assert_called_once()
+
+
+def test_squeak_entry_topics_timeline(squeak_store, squeak_db, squeak_entry_locked, contact_profile):
+    squeak_db.get_profiles.return_value = [
+        contact_profile._replace(profile_id=1)]
+
+    assert SqueakTopic.timeline() in squeak_store.get_squeak_entry_topics(
+        squeak_entry_locked)
+
+
+def test_get_squeak_entry_cached(squeak_store, squeak_db, squeak_hash, squeak_entry_locked):
+    squeak_db.get_squeak_entry.return_value = squeak_entry_locked
+
+    assert squeak_store.get_squeak_entry(squeak_hash) == squeak_entry_locked
+    assert squeak_store.get_squeak_entry(squeak_hash) == squeak_entry_locked
+    squeak_db.get_squeak_entry.assert_called_once_with(squeak_hash)
+
+
+def test_get_squeak_entry_invalidated(squeak_store, squeak_db, squeak_hash, squeak_entry_locked):
+    squeak_db.get_squeak_entry.return_value = squeak_entry_locked
+    squeak_store.get_squeak_entry(squeak_hash)
+    squeak_store.like_squeak(squeak_hash)
+    squeak_store.get_squeak_entry(squeak_hash)
+
+    assert squeak_db.get_squeak_entry.call_count == 2
+
+
+def test_get_squeak_entry_invalidated_by_profile_change(squeak_store, squeak_db, squeak_hash, squeak_entry_locked, contact_profile):
+    squeak_db.get_squeak_entry.return_value = squeak_entry_locked
+    squeak_db.get_profiles.return_value = []
+    squeak_db.insert_profile.return_value = 1
+    squeak_store.get_squeak_entry(squeak_hash)
+    squeak_store.insert_profile(contact_profile)
+    squeak_store.get_squeak_entry(squeak_hash)
+    squeak_store.set_squeak_profile_following(1, True)
+    squeak_store.get_squeak_entry(squeak_hash)
+    squeak_store.delete_squeak_profile(1)
+    squeak_store.get_squeak_entry(squeak_hash)
+
+    assert squeak_db.get_squeak_entry.call_count == 4
+
+
+def test_publish_squeak_entry(squeak_store, squeak_db, squeak_hash, squeak_entry_locked):
+    squeak_db.get_squeak_entry.return_value = squeak_entry_locked
+    squeak_db.get_profiles.return_value = []
+    stopped = threading.Event()
+    with squeak_store.new_squeak_entry_listener.get_subscription(
+            SqueakTopic.squeak_hash(squeak_hash),
+    ) as subscription:
+        squeak_store.publish_squeak_entry(squeak_hash)
+
+        assert next(subscription.get_items(stopped)) is squeak_entry_locked
+
+
+def test_publish_squeak_entry_without_subscribers(squeak_store, squeak_db, squeak_hash):
+    squeak_store.publish_squeak_entry(squeak_hash)
+
+    squeak_db.get_squeak_entry.assert_not_called()
+
+
+def test_set_squeak_profile_image(squeak_store, squeak_db):
+    with mock.patch(
+            'squeaknode.node.squeak_store.process_profile_image',
+            autospec=True,
+    ) as mock_process_profile_image:
+        mock_process_profile_image.return_value = b'processed'
+        saved_image = squeak_store.set_squeak_profile_image(123, b'uploaded')
+
+        mock_process_profile_image.assert_called_once_with(
+            b'uploaded',
+            squeak_store.profile_image_size_px,
+            squeak_store.max_profile_image_upload_bytes,
+        )
+    squeak_db.set_profile_image.assert_called_once_with(123, b'processed')
+    assert saved_image == b'processed'
@@ -0,0 +1,72 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import mock
+import pytest
+
+from squeaknode.node.ttl_cache import TtlCache
+
+
+@pytest.fixture
+def current_time():
+    with mock.patch('squeaknode.node.ttl_cache.time.monotonic', autospec=True) as mock_time:
+        mock_time.return_value = 100.0
+        yield mock_time
+
+
+def test_get(current_time):
+    cache = TtlCache(max_size=10, ttl_s=5)
+    cache.put('a', 1)
+
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+
+
+def test_expired(current_time):
+    cache = TtlCache(max_size=10, ttl_s=5)
+    cache.put('a', 1)
+    current_time.return_value = 105.0
+
+    assert cache.get('a') is None
+    assert len(cache) == 0
+
+
+def test_evict_least_recently_used(current_time):
+    cache = TtlCache(max_size=2, ttl_s=5)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.get('a')
+    cache.put('c', 3)
+
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+
+
+def test_pop_and_clear(current_time):
+    cache = TtlCache(max_size=10, ttl_s=5)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.pop('a')
+
+    assert cache.get('a') is None
+    cache.clear()
+    assert len(cache) == 0
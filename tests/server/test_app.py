@@ -0,0 +1,74 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import mock
+import pytest
+
+from squeaknode.server.app import create_app
+from squeaknode.server.squeak_peer_server_handler import SqueakPeerServerHandler
+
+
+@pytest.fixture
+def handler():
+    return mock.Mock(spec=SqueakPeerServerHandler)
+
+
+@pytest.fixture
+def client(handler):
+    return create_app(handler).test_client()
+
+
+def test_lookup_stream(client, handler, squeak_hash, public_key):
+    handler.handle_lookup_squeaks.return_value = iter([squeak_hash])
+    r = client.get('/lookup', query_string={
+        'pubkeys': public_key.to_bytes().hex(),
+    })
+
+    assert r.status_code == 200
+    assert r.get_json() == [squeak_hash.hex()]
+
+
+def test_lookup_stream_invalid_pubkey(client, handler):
+    handler.handle_lookup_squeaks.side_effect = ValueError(
+        "Invalid public key.")
+    r = client.get('/lookup', query_string={'pubkeys': '00' * 33})
+
+    assert r.status_code == 400
+
+
+def test_lookup_stream_database_error(client, handler, public_key):
+    handler.handle_lookup_squeaks.side_effect = Exception("Database error.")
+    r = client.get('/lookup', query_string={
+        'pubkeys': public_key.to_bytes().hex(),
+    })
+
+    assert r.status_code == 500
+
+
+def test_lookup_page_invalid_pubkey(client, handler):
+    handler.handle_lookup_squeak_cursors.side_effect = ValueError(
+        "Invalid public key.")
+    r = client.get('/lookup', query_string={
+        'pubkeys': '00' * 33,
+        'limit': 10,
+    })
+
+    assert r.status_code == 400
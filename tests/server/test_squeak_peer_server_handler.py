@@ -0,0 +1,82 @@
+# MIT License
+#
+# Copyright (c) 2020 Jonathan Zernik
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import mock
+import pytest
+
+from squeaknode.core.lookup_cursor import LookupCursor
+from squeaknode.node.squeak_controller import SqueakController
+from squeaknode.server.squeak_peer_server_handler import LOOKUP_PAGE_SIZE
+from squeaknode.server.squeak_peer_server_handler import SqueakPeerServerHandler
+
+
+@pytest.fixture
+def squeak_controller():
+    return mock.Mock(spec=SqueakController)
+
+
+@pytest.fixture
+def handler(squeak_controller):
+    return SqueakPeerServerHandler(squeak_controller, None, None)
+
+
+def make_cursors(start, count):
+    return [
+        LookupCursor(
+            block_height=i,
+            time_s=i,
+            squeak_hash=i.to_bytes(32, 'big'),
+        )
+        for i in range(start, start + count)
+    ]
+
+
+def test_lookup_squeaks_pages(handler, squeak_controller, public_key):
+    first_page = make_cursors(0, LOOKUP_PAGE_SIZE)
+    second_page = make_cursors(LOOKUP_PAGE_SIZE, 3)
+    squeak_controller.lookup_squeak_cursors.side_effect = [
+        first_page,
+        second_page,
+    ]
+    squeak_hashes = handler.handle_lookup_squeaks(
+        [public_key.to_bytes().hex()], 0, 100)
+
+    assert list(squeak_hashes) == [
+        cursor.squeak_hash for cursor in first_page + second_page
+    ]
+    assert squeak_controller.lookup_squeak_cursors.call_args_list[1][0][5] == \
+        first_page[-1]
+
+
+def test_lookup_squeaks_invalid_pubkey(handler, squeak_controller):
+    with pytest.raises(ValueError):
+        handler.handle_lookup_squeaks(['00' * 33], 0, 100)
+
+    squeak_controller.lookup_squeak_cursors.assert_not_called()
+
+
+def test_lookup_squeaks_error_before_iteration(handler, squeak_controller, public_key):
+    squeak_controller.lookup_squeak_cursors.side_effect = Exception(
+        "Database error.")
+
+    # The error is raised by the call, not when the hashes are read.
+    with pytest.raises(Exception):
+        handler.handle_lookup_squeaks([public_key.to_bytes().hex()], 0, 100)